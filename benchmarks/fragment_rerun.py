@@ -0,0 +1,83 @@
+"""
+Benchmark the rerun a button click costs on a slow dashboard, with the button
+in the main script against the same button inside an ``st.fragment``.
+
+    streamlit run benchmarks/fragment_rerun.py
+
+from a checkout with the package installed (``pip install -e .``), or
+without installing it:
+
+    PYTHONPATH=. streamlit run benchmarks/fragment_rerun.py
+
+Click each button a few times. Every run records how long the script (or the
+fragment) took from its first line to its last, and the table at the bottom
+compares the two. The table is outside the fragment, so fragment timings show
+up there after the next full-page run.
+"""
+
+import time
+
+import pandas as pd
+import streamlit as st
+
+from streamlit_carbon_button import carbon_button
+
+st.set_page_config(page_title="Fragment rerun benchmark", layout="wide")
+
+# Stands in for the queries and charts a real dashboard recomputes each run
+DASHBOARD_SECONDS = st.sidebar.slider("Dashboard work per run (s)", 0.0, 3.0, 1.0)
+
+timings = st.session_state.setdefault("timings", {"app": [], "fragment": []})
+app_started = time.perf_counter()
+
+st.title("Fragment rerun benchmark")
+with st.spinner("Loading dashboard..."):
+    time.sleep(DASHBOARD_SECONDS)
+    st.line_chart(pd.DataFrame({"value": range(100)}))
+
+left, right = st.columns(2)
+
+with left:
+    st.subheader("Full-page rerun")
+    if carbon_button("Click me", key="app_button"):
+        st.session_state.app_clicks = st.session_state.get("app_clicks", 0) + 1
+    st.write(f"Clicks: {st.session_state.get('app_clicks', 0)}")
+
+
+@st.fragment
+def fragment_panel():
+    fragment_started = time.perf_counter()
+    st.subheader("Fragment rerun")
+    clicked = carbon_button("Click me", key="fragment_button", scope="fragment")
+    if clicked:
+        st.session_state.fragment_clicks = (
+            st.session_state.get("fragment_clicks", 0) + 1
+        )
+    st.write(f"Clicks: {st.session_state.get('fragment_clicks', 0)}")
+    if clicked:
+        timings["fragment"].append(time.perf_counter() - fragment_started)
+
+
+with right:
+    fragment_panel()
+
+# Only full runs get here; fragment reruns stop at the end of the fragment
+if st.session_state.get("app_clicks", 0) > len(timings["app"]):
+    timings["app"].append(time.perf_counter() - app_started)
+
+st.divider()
+st.subheader("Rerun time per click")
+rows = [
+    {
+        "scope": scope,
+        "runs": len(samples),
+        "median ms": round(sorted(samples)[len(samples) // 2] * 1000, 1),
+        "max ms": round(max(samples) * 1000, 1),
+    }
+    for scope, samples in timings.items()
+    if samples
+]
+if rows:
+    st.table(pd.DataFrame(rows))
+else:
+    st.info("Click the buttons above to collect timings")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark enumerating icons through the CarbonIcons registry against the
+``inspect.getmembers`` reflection that apps used before.
+
+    python benchmarks/icon_registry.py
+
+from a checkout with the package installed (``pip install -e .``), or
+without installing it:
+
+    PYTHONPATH=. python benchmarks/icon_registry.py
+"""
+
+import inspect
+import timeit
+
+from streamlit_carbon_button import CarbonIcons
+
+RUNS = 200
+
+
+def by_reflection():
+    return [
+        (name, value)
+        for name, value in inspect.getmembers(CarbonIcons)
+        if not name.startswith("_")
+        and isinstance(value, str)
+        and value.startswith("<svg")
+    ]
+
+
+def by_registry():
+    return list(CarbonIcons.all().items())
+
+
+def names_by_registry():
+    return CarbonIcons.names()
+
+
+if __name__ == "__main__":
+    # Load every SVG first so both approaches compare warm lookups. The
+    # startswith("<svg") filter also misses icons that begin with <?xml
+    reflected = by_reflection()
+    print(f"reflection finds {len(reflected)} icons, the registry {len(by_registry())}")
+
+    for label, func in [
+        ("inspect.getmembers", by_reflection),
+        ("CarbonIcons.all().items()", by_registry),
+        ("CarbonIcons.names()", names_by_registry),
+    ]:
+        seconds = min(timeit.repeat(func, number=RUNS, repeat=5)) / RUNS
+        print(f"{label:28} {seconds * 1e6:10.1f} µs per call")
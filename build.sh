@@ -12,11 +12,11 @@ npm run build
 
 # Copy build files to Python package
 echo "Copying build files..."
-rm -rf ../briquette/frontend
-mkdir -p ../briquette/frontend
+rm -rf ../streamlit_carbon_button/frontend
+mkdir -p ../streamlit_carbon_button/frontend
 
 # Copy the built static files
-cp -r build/* ../briquette/frontend/
+cp -r build/* ../streamlit_carbon_button/frontend/
 
 echo "Build complete!"
 echo ""
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Check built distributions before publishing.
+
+Fails if any wheel or sdist contains source maps. The frontend source map is
+several times larger than the bundle itself and is only useful for debugging;
+release builds write it to frontend/sourcemaps/ instead.
+
+Also fails if a packaged frontend bundle contains debug logging. Production
+builds compile it out (see frontend/src/debug.ts); the log prefix surviving
+means a debug build was packaged.
+
+Usage: python check_dist.py dist/*
+"""
+
+import sys
+import tarfile
+import zipfile
+
+FORBIDDEN_SUFFIXES = (".map",)
+
+# Prefix of every message logged by frontend/src/debug.ts
+DEBUG_LOG_MARKER = b"[carbon-button]"
+
+
+def archive_members(path):
+    """Yield the name and a reader for each file inside a wheel or sdist."""
+    if path.endswith((".whl", ".zip")):
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                yield name, lambda name=name: archive.read(name)
+    elif path.endswith((".tar.gz", ".tgz")):
+        with tarfile.open(path) as archive:
+            for member in archive.getmembers():
+                if member.isfile():
+                    yield member.name, lambda member=member: archive.extractfile(
+                        member
+                    ).read()
+    else:
+        raise ValueError(f"Unsupported distribution format: {path}")
+
+
+def problems(path):
+    """List the packaged files that must not be published, with the reason."""
+    found = []
+    for name, read in archive_members(path):
+        if name.endswith(FORBIDDEN_SUFFIXES):
+            found.append(f"{name} (source map)")
+        elif name.endswith(".js") and DEBUG_LOG_MARKER in read():
+            found.append(f"{name} (debug logging)")
+    return found
+
+
+def main(paths):
+    if not paths:
+        print("Usage: python check_dist.py dist/*")
+        return 2
+
+    failed = False
+    for path in paths:
+        forbidden = problems(path)
+        if forbidden:
+            failed = True
+            print(f"❌ {path} contains files that must not be published:")
+            for name in forbidden:
+                print(f"   {name}")
+        else:
+            print(f"✅ {path}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,80 @@
+import { readdirSync, readFileSync } from "fs"
+import { resolve } from "path"
+import type { Plugin } from "vite"
+
+// Icon files live in the Python package; the build compiles them into a
+// single <symbol> sprite so buttons can reference icons by name.
+const ICONS_DIR = resolve(__dirname, "../../streamlit_carbon_button/icons")
+const SPRITE_FILE = "static/icons/sprite.svg"
+
+// Must match the ids the frontend uses in <use href="#...">
+export const SYMBOL_PREFIX = "carbon-icon-"
+
+/**
+ * Turn one standalone icon SVG into a <symbol>.
+ *
+ * The icons come from several exporters, so this strips editor metadata and
+ * ids, and prefixes class names with the symbol id: every icon defines its own
+ * `.cls-1`, and once the sprite is inlined they all share one document.
+ */
+export function iconToSymbol(name: string, svg: string): string {
+  const id = `${SYMBOL_PREFIX}${name}`
+  const open = svg.match(/<svg\b[^>]*>/)
+  const close = svg.lastIndexOf("</svg>")
+  if (!open || open.index === undefined || close === -1) {
+    throw new Error(`Icon ${name} is not an SVG document`)
+  }
+  const viewBox = open[0].match(/\bviewBox="([^"]*)"/)?.[1] ?? "0 0 32 32"
+
+  const body = svg
+    .slice(open.index + open[0].length, close)
+    .replace(/<!--[\s\S]*?-->/g, "")
+    .replace(/<title>[\s\S]*?<\/title>/g, "")
+    .replace(/<foreignObject\b[\s\S]*?<\/foreignObject>/g, "")
+    .replace(/<(\w+):(\w+)\b[\s\S]*?<\/\1:\2>/g, "")
+    .replace(/\s(?:id|data-name|\w+:\w+)="[^"]*"/g, "")
+    .replace(/\sclass="([^"]*)"/g, (_, classes: string) =>
+      ` class="${classes.trim().split(/\s+/).map(c => `${id}-${c}`).join(" ")}"`
+    )
+    .replace(/<style\b([^>]*)>([\s\S]*?)<\/style>/g, (_, attrs: string, css: string) =>
+      `<style${attrs}>${css.replace(/\.(?=[A-Za-z_])/g, `.${id}-`)}</style>`
+    )
+    .replace(/>\s+</g, "><")
+    .trim()
+
+  return `<symbol id="${id}" viewBox="${viewBox}">${body}</symbol>`
+}
+
+export function buildSprite(): string {
+  const symbols = readdirSync(ICONS_DIR)
+    .filter(file => file.endsWith(".svg"))
+    .sort()
+    .map(file => {
+      const name = file.slice(0, -".svg".length)
+      return iconToSymbol(name, readFileSync(resolve(ICONS_DIR, file), "utf-8"))
+    })
+  return `<svg xmlns="http://www.w3.org/2000/svg">${symbols.join("")}</svg>\n`
+}
+
+export default function carbonIcons(): Plugin {
+  return {
+    name: "carbon-icons",
+
+    // Compile the sprite on request while using the dev server
+    configureServer(server) {
+      server.middlewares.use(`/${SPRITE_FILE}`, (_req, res) => {
+        res.setHeader("Content-Type", "image/svg+xml")
+        res.end(buildSprite())
+      })
+    },
+
+    // Emit the sprite next to the JS and CSS bundles
+    generateBundle() {
+      this.emitFile({
+        type: "asset",
+        fileName: SPRITE_FILE,
+        source: buildSprite(),
+      })
+    },
+  }
+}
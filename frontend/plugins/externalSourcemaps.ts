@@ -0,0 +1,35 @@
+import { mkdirSync, writeFileSync } from "fs"
+import { dirname, resolve } from "path"
+import type { Plugin } from "vite"
+
+// Release builds keep source maps out of the build directory, which is what
+// gets packaged into the wheel. Maps go to frontend/sourcemaps/ instead, to
+// be published as a separate artifact.
+const SOURCEMAP_DIR = resolve(__dirname, "../sourcemaps")
+
+export default function externalSourcemaps(): Plugin {
+  let maps: { fileName: string; source: string }[] = []
+
+  return {
+    name: "external-sourcemaps",
+    apply: "build",
+
+    generateBundle(_options, bundle) {
+      maps = []
+      for (const [fileName, output] of Object.entries(bundle)) {
+        if (fileName.endsWith(".map") && output.type === "asset") {
+          maps.push({ fileName, source: String(output.source) })
+          delete bundle[fileName]
+        }
+      }
+    },
+
+    writeBundle() {
+      for (const { fileName, source } of maps) {
+        const target = resolve(SOURCEMAP_DIR, fileName)
+        mkdirSync(dirname(target), { recursive: true })
+        writeFileSync(target, source)
+      }
+    },
+  }
+}
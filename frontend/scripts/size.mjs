@@ -0,0 +1,28 @@
+// Reports the size of the last build (build/static): raw and gzipped bytes
+// of each JavaScript and CSS file, which is what every button iframe fetches
+// and parses. Run after `npm run build`.
+import { readdirSync, readFileSync } from "fs"
+import { dirname, join, relative, resolve } from "path"
+import { fileURLToPath } from "url"
+import { gzipSync } from "zlib"
+
+const root = resolve(dirname(fileURLToPath(import.meta.url)), "..")
+const staticDir = join(root, "build", "static")
+
+const files = ["js", "css"].flatMap(kind =>
+  readdirSync(join(staticDir, kind))
+    .filter(name => name.endsWith(`.${kind}`))
+    .map(name => join(staticDir, kind, name))
+)
+
+const kB = bytes => `${(bytes / 1024).toFixed(1)} kB`
+let raw = 0
+let gzipped = 0
+for (const file of files) {
+  const contents = readFileSync(file)
+  const size = gzipSync(contents, { level: 9 }).length
+  raw += contents.length
+  gzipped += size
+  console.log(`${relative(root, file)}  ${kB(contents.length)}  (gzip ${kB(size)})`)
+}
+console.log(`total  ${kB(raw)}  (gzip ${kB(gzipped)})`)
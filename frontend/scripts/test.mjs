@@ -0,0 +1,53 @@
+// Runs the frontend unit tests with no extra dependencies: esbuild (installed
+// with Vite) bundles each src/**/*.test.ts(x) file for Node, and Node's
+// built-in test runner executes the bundles.
+import { build } from "esbuild"
+import { spawnSync } from "child_process"
+import { readdirSync, rmSync } from "fs"
+import { dirname, join, relative, resolve } from "path"
+import { fileURLToPath } from "url"
+
+const root = resolve(dirname(fileURLToPath(import.meta.url)), "..")
+const srcDir = join(root, "src")
+const outDir = join(root, ".test-build")
+
+function findTests(dir) {
+  return readdirSync(dir, { withFileTypes: true }).flatMap(entry => {
+    const path = join(dir, entry.name)
+    if (entry.isDirectory()) {
+      return findTests(path)
+    }
+    return /\.test\.tsx?$/.test(entry.name) ? [path] : []
+  })
+}
+
+const entryPoints = findTests(srcDir)
+if (entryPoints.length === 0) {
+  console.log("No frontend tests found")
+  process.exit(0)
+}
+
+rmSync(outDir, { recursive: true, force: true })
+await build({
+  entryPoints,
+  outdir: outDir,
+  outbase: srcDir,
+  outExtension: { ".js": ".mjs" },
+  bundle: true,
+  platform: "node",
+  format: "esm",
+  jsx: "automatic",
+  logLevel: "warning",
+  loader: { ".css": "empty" },
+  define: { __CARBON_DEBUG__: "false" },
+  // Bundled CommonJS packages (React) may still call require()
+  banner: {
+    js: "import { createRequire } from 'module'; const require = createRequire(import.meta.url);",
+  },
+})
+
+const bundles = entryPoints.map(entry =>
+  join(outDir, relative(srcDir, entry).replace(/\.tsx?$/, ".mjs"))
+)
+const result = spawnSync(process.execPath, ["--test", ...bundles], { stdio: "inherit" })
+process.exit(result.status ?? 1)
@@ -0,0 +1,39 @@
+import assert from "node:assert/strict"
+import { test } from "node:test"
+import ButtonView, { sameSpec } from "./ButtonView"
+
+const spec = () => ({ label: "Save", iconName: "save", buttonType: "secondary", colors: { rest_bg: "#fff" } })
+
+test("specs from different reruns compare equal by content", () => {
+  assert.ok(sameSpec(spec(), spec()))
+  assert.ok(!sameSpec(spec(), { ...spec(), colors: { rest_bg: "#000" } }))
+  assert.ok(!sameSpec(spec(), { ...spec(), iconName: "add" }))
+  assert.ok(!sameSpec(spec(), { ...spec(), disabled: true }))
+})
+
+test("unchanged args skip the render", () => {
+  const onClick = () => undefined
+  const props = { spec: spec(), isDarkMode: false, onClick }
+  const view = new ButtonView(props)
+
+  assert.equal(view.shouldComponentUpdate({ ...props, spec: spec() }), false)
+  assert.equal(view.shouldComponentUpdate({ ...props, isDarkMode: true }), true)
+  assert.equal(view.shouldComponentUpdate({ ...props, spec: { ...spec(), label: "Saved" } }), true)
+})
+
+test("a locked button renders disabled and busy", () => {
+  const props = { spec: spec(), isDarkMode: false, onClick: () => undefined }
+  const view = new ButtonView(props)
+  assert.equal(view.shouldComponentUpdate({ ...props, locked: true }), true)
+
+  const locked = new ButtonView({ ...props, locked: true }).render() as any
+  assert.equal(locked.props.disabled, true)
+  assert.equal(locked.props["aria-busy"], true)
+  assert.match(locked.props.className, /carbon-button-locked/)
+})
+
+test("a null icon renders a label-only button", () => {
+  const view = new ButtonView({ spec: { label: "Save", icon: null }, isDarkMode: false, onClick: () => undefined })
+  const button = view.render() as any
+  assert.doesNotMatch(button.props.className, /carbon-button-(icon-only|with-icon)/)
+})
@@ -0,0 +1,155 @@
+import React from "react"
+import { DEBUG, debugLog } from "./debug"
+import { ensureSprite, iconHref } from "./icons"
+import { paletteVariables, resolvePalette } from "./palette"
+
+export interface ButtonSpec {
+  label: string
+  icon?: string | null
+  iconName?: string | null
+  buttonType?: string
+  disabled?: boolean
+  useContainerWidth?: boolean
+  colors?: { [key: string]: string } | null
+  isDefault?: boolean
+  ariaLabel?: string | null
+  debounceMs?: number
+  disableOnClick?: boolean
+}
+
+interface Props {
+  spec: ButtonSpec
+  isDarkMode: boolean
+  // Disabled while a click waits for its rerun (`disableOnClick`)
+  locked?: boolean
+  // Position in a group; passed back to onClick so the handler can be shared
+  index?: number
+  onClick: (index?: number) => void
+}
+
+function sameColors(a: ButtonSpec["colors"], b: ButtonSpec["colors"]): boolean {
+  if (a === b) {
+    return true
+  }
+  if (!a || !b) {
+    return false
+  }
+  const left = a
+  const right = b
+  const keys = Object.keys(right)
+  return Object.keys(left).length === keys.length && keys.every(key => left[key] === right[key])
+}
+
+/**
+ * Shallow comparison of two button specs, comparing `colors` by content.
+ * Every rerun delivers freshly parsed args, so identity never matches.
+ */
+export function sameSpec(a: ButtonSpec, b: ButtonSpec): boolean {
+  if (a === b) {
+    return true
+  }
+  const keys = Object.keys(b) as (keyof ButtonSpec)[]
+  if (Object.keys(a).length !== keys.length) {
+    return false
+  }
+  return keys.every(key => (key === "colors" ? sameColors(a.colors, b.colors) : a[key] === b[key]))
+}
+
+let skippedRenders = 0
+
+/**
+ * A single Carbon button. Holds no Streamlit state of its own so that one
+ * component instance can render either a lone button or a whole group.
+ */
+class ButtonView extends React.Component<Props> {
+  public shouldComponentUpdate(nextProps: Props): boolean {
+    const { spec, isDarkMode, locked, index, onClick } = this.props
+    const changed =
+      isDarkMode !== nextProps.isDarkMode ||
+      locked !== nextProps.locked ||
+      index !== nextProps.index ||
+      onClick !== nextProps.onClick ||
+      !sameSpec(spec, nextProps.spec)
+    if (!changed && DEBUG) {
+      debugLog("skipped render", { label: nextProps.spec.label, skippedRenders: ++skippedRenders })
+    }
+    return changed
+  }
+
+  public componentDidMount() {
+    if (this.props.spec.iconName) {
+      ensureSprite()
+    }
+  }
+
+  public componentDidUpdate() {
+    if (this.props.spec.iconName) {
+      ensureSprite()
+    }
+  }
+
+  public render = (): React.ReactNode => {
+    const { label = "", icon = "", iconName, buttonType = "primary", useContainerWidth, isDefault, ariaLabel } = this.props.spec
+    const { locked } = this.props
+    const disabled = this.props.spec.disabled || locked
+
+    const hasIcon = !!iconName || (!!icon && icon.trim() !== '')
+    const hasLabel = label && label.trim() !== ''
+    const isIconOnly = hasIcon && !hasLabel
+
+    const palette = resolvePalette(buttonType, this.props.isDarkMode, this.props.spec.colors)
+
+    const classNames = ["carbon-button", `carbon-button-${buttonType}`]
+    if (isIconOnly) {
+      classNames.push("carbon-button-icon-only")
+    } else if (hasIcon && hasLabel) {
+      classNames.push("carbon-button-with-icon")
+    }
+    if (useContainerWidth) {
+      classNames.push("carbon-button-full")
+    }
+    if (isDefault && !disabled) {
+      classNames.push("carbon-button-default")
+    }
+    if (locked) {
+      classNames.push("carbon-button-locked")
+    }
+
+    // Generate aria-label
+    const computedAriaLabel = ariaLabel || (isIconOnly ? label || "Icon button" : undefined)
+
+    return (
+      <button
+        style={paletteVariables(palette) as React.CSSProperties}
+        className={classNames.join(" ")}
+        onClick={this.handleClick}
+        disabled={disabled}
+        aria-busy={locked || undefined}
+        aria-label={computedAriaLabel}
+      >
+        <div className="carbon-button-content">
+          {iconName ? (
+            // <use> resolves once the sprite is in the document
+            <span className="carbon-button-icon">
+              <svg aria-hidden="true" focusable="false">
+                <use href={iconHref(iconName)} />
+              </svg>
+            </span>
+          ) : hasIcon && (
+            <span
+              className="carbon-button-icon"
+              dangerouslySetInnerHTML={{ __html: icon }}
+            />
+          )}
+          {hasLabel && <span>{label}</span>}
+        </div>
+      </button>
+    )
+  }
+
+  private handleClick = (): void => {
+    this.props.onClick(this.props.index)
+  }
+}
+
+export default ButtonView
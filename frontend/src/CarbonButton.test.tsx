@@ -0,0 +1,298 @@
+import assert from "node:assert/strict"
+import { test } from "node:test"
+import { CarbonButton } from "./CarbonButton"
+import { installFakeDom } from "./testing/fakeDom"
+
+const props = { args: { label: "Save", default: 0 }, width: 200, disabled: false }
+
+// Apply state updates synchronously, as React would after a commit
+function applyStateSynchronously(button: CarbonButton): void {
+  button.setState = (update: any, callback?: () => void) => {
+    const changes = typeof update === "function" ? update(button.state) : update
+    button.state = { ...button.state, ...changes }
+    callback?.()
+  }
+}
+
+function sentValues(dom: ReturnType<typeof installFakeDom>): unknown[] {
+  return dom.postedMessages
+    .filter((message: any) => message.type === "streamlit:setComponentValue")
+    .map((message: any) => message.value)
+}
+
+// The args carbon_button("Save", key="save", ...) sends, where `seen` is the
+// newest click count Python has received (sent as `default`)
+function pythonArgs(seen: number, options: object = {}): object {
+  return {
+    label: "Save",
+    icon: "",
+    iconName: null,
+    buttonType: "primary",
+    disabled: false,
+    useContainerWidth: false,
+    colors: null,
+    isDefault: false,
+    ariaLabel: null,
+    debounceMs: 0,
+    disableOnClick: false,
+    ...options,
+    default: seen,
+    key: "save",
+  }
+}
+
+// Simulate a rerun reaching a mounted button. Like Streamlit's
+// ComponentInstance, only post a render when the JSON args changed.
+function rerun(button: CarbonButton, args: object): void {
+  const prevProps = button.props
+  if (JSON.stringify(args) === JSON.stringify(prevProps.args)) {
+    return
+  }
+  ;(button as any).props = { ...prevProps, args }
+  button.componentDidUpdate(prevProps)
+}
+
+test("repeated mounts add no <style> elements", () => {
+  const dom = installFakeDom()
+
+  for (let i = 0; i < 100; i++) {
+    const button = new CarbonButton(props)
+    button.componentDidMount()
+    button.componentWillUnmount()
+  }
+
+  // Component styles ship in the built index.css, linked once per document
+  assert.equal(dom.styleNodes(), 0)
+})
+
+test("buttons share one color-scheme listener and remove it on unmount", () => {
+  const dom = installFakeDom()
+  const buttons = Array.from({ length: 1000 }, () => new CarbonButton(props))
+
+  buttons.forEach(button => button.componentDidMount())
+  assert.equal(dom.colorSchemeListeners(), 1)
+
+  buttons.forEach(button => button.componentWillUnmount())
+  assert.equal(dom.colorSchemeListeners(), 0)
+})
+
+test("unmounted buttons no longer receive theme changes", () => {
+  const dom = installFakeDom()
+  const button = new CarbonButton(props)
+  const updates: unknown[] = []
+  button.setState = (update: unknown) => {
+    updates.push(update)
+  }
+
+  button.componentDidMount()
+  updates.length = 0
+  dom.setDarkMode(true)
+  assert.deepEqual(updates, [{ isDarkMode: true }])
+
+  button.componentWillUnmount()
+  dom.setDarkMode(false)
+  assert.equal(updates.length, 1)
+})
+
+test("frame height is posted once per frame and only when it changes", () => {
+  const dom = installFakeDom()
+  dom.resizeBody(120)
+  const buttons = Array.from({ length: 10 }, () => new CarbonButton(props))
+
+  buttons.forEach(button => button.componentDidMount())
+  dom.runAnimationFrames()
+  assert.deepEqual(dom.frameHeights(), [120])
+
+  // Reruns that don't change the layout post nothing
+  buttons.forEach(button => button.componentDidUpdate(button.props))
+  dom.resizeBody(120)
+  dom.runAnimationFrames()
+  assert.deepEqual(dom.frameHeights(), [120])
+
+  // Several resizes within one frame post the final height once
+  dom.resizeBody(150)
+  dom.resizeBody(160)
+  dom.runAnimationFrames()
+  assert.deepEqual(dom.frameHeights(), [120, 160])
+})
+
+test("mounting sends nothing to Streamlit", () => {
+  const dom = installFakeDom()
+  const button = new CarbonButton({ ...props, args: { label: "Save", default: 3 } })
+  button.setState = (update: any) => {
+    button.state = { ...button.state, ...update }
+  }
+
+  button.componentDidMount()
+
+  assert.equal(button.state.numClicks, 3)
+  assert.deepEqual(dom.postedMessages, [])
+})
+
+test("a remounted button sends nothing when its args change", () => {
+  const dom = installFakeDom()
+  const button = new CarbonButton({ ...props, args: pythonArgs(3) })
+  applyStateSynchronously(button)
+
+  button.componentDidMount()
+  rerun(button, pythonArgs(3, { label: "Save all" }))
+  assert.deepEqual(sentValues(dom), [])
+
+  // The next click continues from the count Python already has
+  ;(button as any).onClicked()
+  assert.deepEqual(sentValues(dom), [4])
+  rerun(button, pythonArgs(4))
+  button.componentWillUnmount()
+})
+
+test("clicks during an in-flight rerun are sent as one message", () => {
+  const dom = installFakeDom()
+  const button = new CarbonButton({ ...props, args: pythonArgs(0) })
+  applyStateSynchronously(button)
+  const onClicked = (button as any).onClicked
+
+  button.componentDidMount()
+  onClicked()
+  onClicked()
+  onClicked()
+  assert.deepEqual(sentValues(dom), [1])
+
+  // A rerun that started before the click arrived is not the acknowledgement
+  rerun(button, pythonArgs(0))
+  rerun(button, pythonArgs(0, { label: "Save all" }))
+  assert.deepEqual(sentValues(dom), [1])
+
+  // The rerun the click started: the two waiting clicks go out together
+  rerun(button, pythonArgs(1))
+  assert.deepEqual(sentValues(dom), [1, 3])
+
+  // Once that is handled, the next click is sent straight away
+  rerun(button, pythonArgs(3))
+  onClicked()
+  assert.deepEqual(sentValues(dom), [1, 3, 4])
+  rerun(button, pythonArgs(4))
+  button.componentWillUnmount()
+})
+
+test("group clicks during an in-flight rerun are all reported", () => {
+  const dom = installFakeDom()
+  const groupArgs = (seen: number) => ({
+    buttons: [{ label: "Back" }, { label: "Next" }],
+    useContainerWidth: false,
+    default: seen,
+    key: "nav",
+  })
+  const button = new CarbonButton({ ...props, args: groupArgs(0) })
+  applyStateSynchronously(button)
+  const onClicked = (button as any).onClicked
+
+  button.componentDidMount()
+  onClicked(0)
+  onClicked(1)
+  onClicked(1)
+  assert.deepEqual(sentValues(dom), [{ clicks: 1, index: 0, batch: [0] }])
+
+  rerun(button, groupArgs(1))
+  assert.deepEqual(sentValues(dom), [
+    { clicks: 1, index: 0, batch: [0] },
+    { clicks: 3, index: 1, batch: [1, 1] },
+  ])
+  rerun(button, groupArgs(3))
+  button.componentWillUnmount()
+})
+
+test("disableOnClick locks the button until the rerun the click started", () => {
+  const dom = installFakeDom()
+  const options = { disableOnClick: true }
+  const button = new CarbonButton({ ...props, args: pythonArgs(0, options) })
+  applyStateSynchronously(button)
+  const onClicked = (button as any).onClicked
+
+  button.componentDidMount()
+  onClicked()
+  assert.equal(button.state.locked, true)
+  assert.deepEqual(sentValues(dom), [1])
+
+  // Reruns that repeat the args, or started before the click, keep the lock
+  rerun(button, pythonArgs(0, options))
+  rerun(button, pythonArgs(0, { ...options, label: "Loading" }))
+  assert.equal(button.state.locked, true)
+
+  rerun(button, pythonArgs(1, options))
+  assert.equal(button.state.locked, false)
+
+  // The next click locks it again
+  onClicked()
+  assert.equal(button.state.locked, true)
+  assert.deepEqual(sentValues(dom), [1, 2])
+  rerun(button, pythonArgs(2, options))
+  assert.equal(button.state.locked, false)
+  button.componentWillUnmount()
+})
+
+test("debounceMs drops clicks that follow too closely", () => {
+  const dom = installFakeDom()
+  const args = { label: "Submit", default: 0, debounceMs: 300 }
+  const button = new CarbonButton({ ...props, args })
+  applyStateSynchronously(button)
+  const realNow = Date.now
+  let now = 1000
+  Date.now = () => now
+
+  try {
+    button.componentDidMount()
+    for (const time of [1000, 1100, 1350, 1700]) {
+      now = time
+      ;(button as any).onClicked()
+      rerun(button, { ...args, default: button.state.numClicks })
+    }
+  } finally {
+    Date.now = realNow
+    button.componentWillUnmount()
+  }
+
+  // 1100 and 1350 each fall within 300 ms of the click before them
+  assert.equal(button.state.numClicks, 2)
+  assert.deepEqual(sentValues(dom), [1, 2])
+})
+
+test("debounceMs applies to each button of a group separately", () => {
+  const dom = installFakeDom()
+  const groupArgs = (seen: number) => ({
+    buttons: [
+      { label: "Back", debounceMs: 300 },
+      { label: "Next", debounceMs: 300 },
+    ],
+    useContainerWidth: false,
+    default: seen,
+    key: "nav",
+  })
+  const button = new CarbonButton({ ...props, args: groupArgs(0) })
+  applyStateSynchronously(button)
+  const onClicked = (button as any).onClicked
+  const realNow = Date.now
+  let now = 1000
+  Date.now = () => now
+
+  try {
+    button.componentDidMount()
+    onClicked(0)
+    // A different button within Back's window still counts
+    now = 1100
+    onClicked(1)
+    // Back again within its own window does not
+    now = 1200
+    onClicked(0)
+  } finally {
+    Date.now = realNow
+  }
+
+  assert.equal(button.state.numClicks, 2)
+  rerun(button, groupArgs(1))
+  assert.deepEqual(sentValues(dom), [
+    { clicks: 1, index: 0, batch: [0] },
+    { clicks: 2, index: 1, batch: [1] },
+  ])
+  rerun(button, groupArgs(2))
+  button.componentWillUnmount()
+})
@@ -1,89 +1,85 @@
-import React, { useEffect } from "react"
+import React from "react"
 import {
+  ComponentProps,
   Streamlit,
   StreamlitComponentBase,
   withStreamlitConnection,
 } from "streamlit-component-lib"
+import ButtonView, { ButtonSpec } from "./ButtonView"
+import { prefersDark, subscribeColorScheme } from "./colorScheme"
+import IconGrid, { IconGridSpec } from "./IconGrid"
+import { updateFrameHeight, watchFrameHeight } from "./frameHeight"
+import { DEBUG, debugLog } from "./debug"
+
+// If a rerun never reaches this button (for example the script raised
+// before rendering it), stop waiting for fresh args after this long. Slow
+// scripts can take seconds to get to the button, so this is generous.
+const RERUN_TIMEOUT_MS = 10000
 
 interface State {
   numClicks: number
   isDarkMode: boolean
+  // Set by a click on a `disableOnClick` button until the next rerun
+  locked: boolean
 }
 
-class CarbonButton extends StreamlitComponentBase<State> {
-  public state = { numClicks: 0, isDarkMode: false }
+export class CarbonButton extends StreamlitComponentBase<State> {
+  public state = { numClicks: 0, isDarkMode: false, locked: false }
 
-  public componentDidMount() {
-    console.log("CarbonButton mounted with props:", this.props)
-    console.log("Args from Streamlit:", this.props.args)
+  private unsubscribeColorScheme?: () => void
 
-    // CRITICAL: Set initial value from default prop
-    const initialValue = this.props.args?.default || 0
-    this.setState({ numClicks: initialValue }, () => {
-      // Send initial value to Streamlit
-      Streamlit.setComponentValue(this.state.numClicks)
-      // IMPORTANT: Set frame height after component mounts
-      Streamlit.setFrameHeight()
-    })
+  // Set between sending a click count and the rerun that handles it; clicks
+  // in between are sent together once Python acknowledges the count
+  private awaitingRerun = false
 
-    // Add global styles for SVG icons
-    const style = document.createElement('style')
-    style.textContent = `
-      .carbon-button-icon {
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        width: 20px;
-        height: 20px;
-        flex-shrink: 0;
-      }
-      .carbon-button-icon svg {
-        width: 100%;
-        height: 100%;
-        fill: currentColor;
-      }
-      .carbon-button-content {
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        gap: 0.5rem;
-        width: 100%;
-      }
-      .carbon-button-icon-only {
-        padding: 0.75rem !important;
-      }
-    `
-    document.head.appendChild(style)
+  private sentClicks = 0
 
-    // Check for dark mode
-    const checkDarkMode = () => {
-      const isDark = window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches
-      this.setState({ isDarkMode: isDark })
-    }
+  // Group and grid clicks not yet sent, in click order
+  private unsentIndices: number[] = []
+
+  private rerunTimeout?: ReturnType<typeof setTimeout>
 
-    // Initial check
-    checkDarkMode()
+  // When each button was last clicked, by group or grid index; a single
+  // button is stored under -1. Debounce windows are per button.
+  private lastClickTimes = new Map<number, number>()
 
-    // Listen for changes
-    if (window.matchMedia) {
-      window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', checkDarkMode)
+  public componentDidMount() {
+    if (DEBUG) {
+      debugLog("CarbonButton mounted with props:", this.props)
     }
+
+    // Continue counting from the click count Python last saw. The value is
+    // not sent back: until the first click Streamlit returns `default`
+    // itself, and sending it would only cost a round trip and a rerun.
+    const initialValue = this.props.args?.default || 0
+    this.sentClicks = initialValue
+    this.setState({ numClicks: initialValue })
+
+    // Height changes are reported by a shared ResizeObserver
+    watchFrameHeight()
+
+    // Check for dark mode and follow OS theme changes
+    this.setState({ isDarkMode: prefersDark() })
+    this.unsubscribeColorScheme = subscribeColorScheme(isDark => {
+      this.setState({ isDarkMode: isDark })
+    })
   }
 
   public componentWillUnmount() {
-    // Clean up listener
-    if (window.matchMedia) {
-      const checkDarkMode = () => {
-        const isDark = window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches
-        this.setState({ isDarkMode: isDark })
-      }
-      window.matchMedia('(prefers-color-scheme: dark)').removeEventListener('change', checkDarkMode)
-    }
+    this.unsubscribeColorScheme?.()
+    clearTimeout(this.rerunTimeout)
   }
 
-  public componentDidUpdate() {
-    // Update frame height whenever component updates
-    Streamlit.setFrameHeight()
+  public componentDidUpdate(prevProps: ComponentProps) {
+    // Only needed in browsers without ResizeObserver
+    updateFrameHeight()
+
+    // Python sends the newest count it has seen as `default`, so args
+    // carrying the sent count come from the rerun that handled it
+    const { args } = this.props
+    if (args !== prevProps.args && (args?.default ?? 0) >= this.sentClicks) {
+      this.onRerunDone()
+    }
   }
 
   public render = (): React.ReactNode => {
@@ -92,319 +88,118 @@ class CarbonButton extends StreamlitComponentBase<State> {
       return <div style={{ padding: "10px", border: "1px solid #ccc" }}>Loading Carbon Button...</div>
     }
 
-    const { label, icon, buttonType, disabled, useContainerWidth, colors, isDefault, ariaLabel } = this.props.args
-
-    // Debug: Log what we're receiving
-    console.log("Carbon Button Debug:", {
-      label,
-      hasIcon: !!icon,
-      iconLength: icon?.length,
-      iconPreview: icon?.substring(0, 100),
-      buttonType,
-      allArgs: this.props.args
-    })
-
-    // Extra debug - check if icon contains SVG
-    if (icon) {
-      console.log("Icon contains <svg>:", icon.includes('<svg'))
-      console.log("Icon contains viewBox:", icon.includes('viewBox'))
-    }
-
-    const hasIcon = icon && icon.trim() !== ''
-    const hasLabel = label && label.trim() !== ''
-    const isIconOnly = hasIcon && !hasLabel
-
-    // Adjust padding for visual balance
-    // When icon + text: more padding on right to balance the visual weight
-    // When icon only: equal padding
-    let padding = "0.75rem 1rem"
-    if (isIconOnly) {
-      padding = "0.75rem"
-    } else if (hasIcon && hasLabel) {
-      // Asymmetric padding: less on left (icon side), more on right
-      padding = "0.75rem 1.25rem 0.75rem 0.875rem"
-    }
-
-    // Apply teal shadow for default buttons
-    let boxShadow = buttonType === "secondary" ? "0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.05)" : "none"
-    let transform = "translateY(0)"
-
-    if (isDefault && !disabled) {
-      boxShadow = "0 4px 12px rgba(80, 228, 224, 0.4)"
-      transform = "translateY(-2px)"
+    // The icon grid reports the index of the clicked icon, like a group
+    const iconGrid: IconGridSpec | undefined = this.props.args.iconGrid
+    if (iconGrid) {
+      return <IconGrid grid={iconGrid} isDarkMode={this.state.isDarkMode} onClick={this.onClicked} />
+    }
+
+    // A group renders every button in this one iframe
+    const buttons: ButtonSpec[] | undefined = this.props.args.buttons
+    if (Array.isArray(buttons)) {
+      const className = this.props.args.useContainerWidth
+        ? "carbon-button-group carbon-button-group-full"
+        : "carbon-button-group"
+      return (
+        <div className={className}>
+          {buttons.map((spec, index) => (
+            <ButtonView
+              key={index}
+              spec={spec}
+              isDarkMode={this.state.isDarkMode}
+              locked={this.state.locked}
+              index={index}
+              onClick={this.onClicked}
+            />
+          ))}
+        </div>
+      )
     }
 
-    const buttonStyle: React.CSSProperties = {
-      backgroundColor: this.getBackgroundColor(buttonType),
-      color: this.getTextColor(buttonType),
-      border: buttonType === "ghost" ? `1px solid ${this.getBorderColor(buttonType)}` : buttonType === "secondary" ? `1px solid ${this.getBorderColor(buttonType)}` : "none",
-      padding: padding,
-      fontSize: "14px",
-      fontWeight: 400,
-      borderRadius: 0,
-      cursor: disabled ? "not-allowed" : "pointer",
-      display: "inline-flex",
-      alignItems: "center",
-      justifyContent: "center",
-      width: useContainerWidth ? "100%" : "auto",
-      transition: "all 70ms cubic-bezier(0.2, 0, 0.38, 0.9)",
-      fontFamily: '"IBM Plex Sans", system-ui, -apple-system, sans-serif',
-      lineHeight: 1,
-      opacity: disabled ? 0.5 : 1,
-      boxShadow: boxShadow,
-      transform: transform,
-      outline: "none",
+    if (DEBUG) {
+      const { label, icon, iconName, buttonType } = this.props.args
+      debugLog("render", {
+        label,
+        iconName,
+        iconLength: icon?.length,
+        hasSvg: !!icon && icon.includes("<svg"),
+        hasViewBox: !!icon && icon.includes("viewBox"),
+        buttonType,
+        allArgs: this.props.args,
+      })
     }
 
-    // Generate aria-label
-    const computedAriaLabel = ariaLabel || (isIconOnly ? label || "Icon button" : undefined)
-
     return (
-      <button
-        style={buttonStyle}
-        className={isIconOnly ? "carbon-button-icon-only" : ""}
+      <ButtonView
+        spec={this.props.args}
+        isDarkMode={this.state.isDarkMode}
+        locked={this.state.locked}
         onClick={this.onClicked}
-        disabled={disabled}
-        onMouseEnter={(e) => this.handleHover(e, true)}
-        onMouseLeave={(e) => this.handleHover(e, false)}
-        onMouseDown={this.handleMouseDown}
-        onMouseUp={this.handleMouseUp}
-        aria-label={computedAriaLabel}
-      >
-        <div className="carbon-button-content">
-          {hasIcon && (
-            <span
-              className="carbon-button-icon"
-              dangerouslySetInnerHTML={{ __html: icon }}
-            />
-          )}
-          {hasLabel && <span>{label}</span>}
-        </div>
-      </button>
+      />
     )
   }
 
-  private getBackgroundColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.rest_bg && type === "secondary") {
-      return this.props.args.colors.rest_bg
-    }
+  private onClicked = (index?: number): void => {
+    // Icon grid cells are indexed too but carry no click options
+    const spec: ButtonSpec | undefined = this.props.args.iconGrid
+      ? undefined
+      : index === undefined
+        ? this.props.args
+        : this.props.args.buttons[index]
 
-    // Different colors for light/dark mode - subtle palette
-    const lightColors: { [key: string]: string } = {
-      primary: "#e6e2e2",      // Changed primary to your subtle grey
-      secondary: "#e6e2e2",    // Your custom light mode color
-      danger: "#f4e3e3",       // Softer danger color
-      ghost: "transparent",
+    // Drop clicks that follow the same button's previous click too closely.
+    // Every click restarts the window, so a burst counts once however long
+    // it lasts.
+    const now = Date.now()
+    const button = index ?? -1
+    const sinceLastClick = now - (this.lastClickTimes.get(button) ?? -Infinity)
+    this.lastClickTimes.set(button, now)
+    if (spec?.debounceMs && sinceLastClick < spec.debounceMs) {
+      return
     }
 
-    const darkColors: { [key: string]: string } = {
-      primary: "#ecdcdc",      // Your pink-grey for dark mode
-      secondary: "#ecdcdc",    // Your custom dark mode color
-      danger: "#f0d0d0",       // Lighter pink for danger in dark mode
-      ghost: "transparent",
-    }
-
-    const colors = this.state.isDarkMode ? darkColors : lightColors
-    return colors[type] || colors.primary
-  }
-
-  private getTextColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.rest_text && type === "secondary") {
-      return this.props.args.colors.rest_text
-    }
-
-    // Different text colors for light/dark mode
-    if (this.state.isDarkMode) {
-      const darkModeColors: { [key: string]: string } = {
-        primary: "#1a1a1a",      // Dark text on pink-grey
-        secondary: "#1a1a1a",    // Dark text for contrast
-        danger: "#4a1414",       // Dark red text
-        ghost: "#262626",
+    // Lock optimistically, before Streamlit has even seen the click
+    const lock = !!spec?.disableOnClick
+    this.setState(
+      prevState => ({ numClicks: prevState.numClicks + 1, locked: prevState.locked || lock }),
+      () => {
+        if (index !== undefined) {
+          this.unsentIndices.push(index)
+        }
+        if (!this.awaitingRerun) {
+          this.sendClicks()
+        }
       }
-      return darkModeColors[type] || darkModeColors.primary
-    }
-
-    const colors: { [key: string]: string } = {
-      primary: "#1a1a1a",      // Dark text on light grey
-      secondary: "#1a1a1a",    // Almost black for maximum contrast
-      danger: "#4a1414",       // Dark red text
-      ghost: "#262626",
-    }
-    return colors[type] || colors.primary
-  }
-
-  private getBorderColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.rest_border && type === "secondary") {
-      return this.props.args.colors.rest_border
-    }
-
-    const lightColors: { [key: string]: string } = {
-      primary: "#cccccc",      // Subtle grey border
-      secondary: "#cccccc",
-      danger: "#e0c0c0",       // Soft pink border
-      ghost: "#e0e0e0",        // Light grey for ghost
-    }
-
-    const darkColors: { [key: string]: string } = {
-      primary: "#404040",      // Dark grey border
-      secondary: "#404040",    // Your dark mode border
-      danger: "#5a4040",       // Muted red border
-      ghost: "#404040",        // Dark grey for ghost
-    }
-
-    const colors = this.state.isDarkMode ? darkColors : lightColors
-    return colors[type] || colors.primary
-  }
-
-  private getHoverBackgroundColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.hover_bg && type === "secondary") {
-      return this.props.args.colors.hover_bg
-    }
-
-    const lightColors: { [key: string]: string } = {
-      primary: "#f5f5f5",      // Light grey hover
-      secondary: "#f5f5f5",    // Light mode hover
-      danger: "#faf0f0",       // Light pink hover
-      ghost: "#fafafa",        // Very light grey
-    }
-
-    const darkColors: { [key: string]: string } = {
-      primary: "#4a4a4a",      // Medium grey hover
-      secondary: "#f6f4f4",    // Dark mode hover
-      danger: "#5a4343",       // Muted red hover
-      ghost: "#2a2a2a",        // Dark grey hover
-    }
-
-    const colors = this.state.isDarkMode ? darkColors : lightColors
-    return colors[type] || colors.primary
-  }
-
-  private getHoverTextColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.hover_text && type === "secondary") {
-      return this.props.args.colors.hover_text
-    }
-
-    return this.getTextColor(type)
-  }
-
-  private getHoverBorderColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.hover_border && type === "secondary") {
-      return this.props.args.colors.hover_border
-    }
-
-    return this.getBorderColor(type)
-  }
-
-  private getActiveBackgroundColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.active_bg && type === "secondary") {
-      return this.props.args.colors.active_bg
-    }
-
-    const lightColors: { [key: string]: string } = {
-      primary: "#50e4e0",      // Teal accent for all buttons
-      secondary: "#50e4e0",    // Light mode teal
-      danger: "#e4807a",       // Soft coral for danger
-      ghost: "#50e4e0",        // Teal for ghost too
-    }
-
-    const darkColors: { [key: string]: string } = {
-      primary: "#67cccc",      // Darker teal for dark mode
-      secondary: "#67cccc",    // Dark mode teal
-      danger: "#cc6666",       // Muted red
-      ghost: "#67cccc",        // Teal for ghost
-    }
-
-    const colors = this.state.isDarkMode ? darkColors : lightColors
-    return colors[type] || colors.primary
+    )
   }
 
-  private getActiveTextColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.active_text && type === "secondary") {
-      return this.props.args.colors.active_text
+  private onRerunDone = (): void => {
+    clearTimeout(this.rerunTimeout)
+    this.awaitingRerun = false
+    if (this.state.locked) {
+      this.setState({ locked: false })
     }
-
-    // Dark mode uses black text on teal (as per your design)
-    if (this.state.isDarkMode) {
-      return "#000000"
+    if (this.state.numClicks > this.sentClicks) {
+      this.sendClicks()
     }
-
-    // Light mode uses white text on teal
-    return "#ffffff"
   }
 
-  private getActiveBorderColor = (type: string): string => {
-    // Use custom colors if provided
-    if (this.props.args.colors?.active_border && type === "secondary") {
-      return this.props.args.colors.active_border
-    }
-
-    return this.getBorderColor(type)
-  }
+  private sendClicks(): void {
+    // The count is cumulative, so one message covers every click so far
+    this.awaitingRerun = true
+    this.sentClicks = this.state.numClicks
+    this.rerunTimeout = setTimeout(this.onRerunDone, RERUN_TIMEOUT_MS)
 
-  private handleHover = (e: React.MouseEvent<HTMLButtonElement>, isHover: boolean) => {
-    const button = e.currentTarget
-    const type = this.props.args.buttonType || "primary"
-    const isDefault = this.props.args.isDefault
-
-    if (isHover) {
-      button.style.backgroundColor = this.getHoverBackgroundColor(type)
-      button.style.color = this.getHoverTextColor(type)
-      button.style.borderColor = this.getHoverBorderColor(type)
-
-      if (isDefault) {
-        // Enhanced hover for default buttons
-        button.style.transform = "translateY(-3px)"
-        button.style.boxShadow = "0 6px 16px rgba(80, 228, 224, 0.5)"
-      } else {
-        button.style.transform = "translateY(-1px)"
-        button.style.boxShadow = "0 2px 6px rgba(0, 0, 0, 0.15)"
-      }
+    // Groups report the last button pressed and, as `batch`, every button
+    // pressed since the previous message, so coalesced clicks are not lost
+    const batch = this.unsentIndices
+    if (batch.length === 0) {
+      Streamlit.setComponentValue(this.state.numClicks)
     } else {
-      button.style.backgroundColor = this.getBackgroundColor(type)
-      button.style.color = this.getTextColor(type)
-      button.style.borderColor = this.getBorderColor(type)
-
-      if (isDefault) {
-        // Return to default button state
-        button.style.transform = "translateY(-2px)"
-        button.style.boxShadow = "0 4px 12px rgba(80, 228, 224, 0.4)"
-      } else {
-        button.style.transform = "translateY(0)"
-        button.style.boxShadow = type === "secondary" ? "0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.05)" : "none"
-      }
+      this.unsentIndices = []
+      Streamlit.setComponentValue({ clicks: this.state.numClicks, index: batch[batch.length - 1], batch })
     }
   }
-
-  private handleMouseDown = (e: React.MouseEvent<HTMLButtonElement>) => {
-    const button = e.currentTarget
-    const type = this.props.args.buttonType || "primary"
-
-    button.style.backgroundColor = this.getActiveBackgroundColor(type)
-    button.style.color = this.getActiveTextColor(type)
-    button.style.borderColor = this.getActiveBorderColor(type)
-    button.style.transform = "translateY(0)"
-    button.style.boxShadow = "inset 0 1px 2px rgba(0, 0, 0, 0.2)"
-  }
-
-  private handleMouseUp = (e: React.MouseEvent<HTMLButtonElement>) => {
-    // Return to hover state since mouse is still over the button
-    this.handleHover(e, true)
-  }
-
-  private onClicked = (): void => {
-    this.setState(
-      prevState => ({ numClicks: prevState.numClicks + 1 }),
-      () => Streamlit.setComponentValue(this.state.numClicks)
-    )
-  }
 }
 
 export default withStreamlitConnection(CarbonButton)
@@ -0,0 +1,33 @@
+import assert from "node:assert/strict"
+import { test } from "node:test"
+import React from "react"
+import IconGrid, { OVERSCAN_ROWS } from "./IconGrid"
+import { installFakeDom } from "./testing/fakeDom"
+
+const icons = Array.from({ length: 5000 }, (_, index) => `icon_${index}`)
+
+function renderedCells(grid: IconGrid): React.ReactElement[] {
+  const container = grid.render() as React.ReactElement
+  const canvas = container.props.children as React.ReactElement
+  return canvas.props.children
+}
+
+test("only the rows in view are rendered", () => {
+  installFakeDom()
+  const grid = new IconGrid({
+    grid: { icons, height: 400, cellSize: 100 },
+    isDarkMode: false,
+    onClick: () => undefined,
+  })
+
+  // 800px wide gives 8 columns; 400px tall shows up to 5 rows at a time
+  const visibleRows = 5 + OVERSCAN_ROWS
+  let cells = renderedCells(grid)
+  assert.equal(cells.length, visibleRows * 8)
+  assert.equal(cells[0].props.title, "icon_0")
+
+  grid.state = { ...grid.state, firstVisibleRow: 300 }
+  cells = renderedCells(grid)
+  assert.equal(cells.length, (visibleRows + OVERSCAN_ROWS) * 8)
+  assert.equal(cells[0].props.title, `icon_${(300 - OVERSCAN_ROWS) * 8}`)
+})
@@ -0,0 +1,112 @@
+import React from "react"
+import { ensureSprite, iconHref } from "./icons"
+import { paletteVariables, resolvePalette } from "./palette"
+
+export interface IconGridSpec {
+  icons: string[]
+  height: number
+  cellSize: number
+  buttonType?: string
+  showLabels?: boolean
+}
+
+interface Props {
+  grid: IconGridSpec
+  isDarkMode: boolean
+  onClick: (index?: number) => void
+}
+
+interface State {
+  width: number
+  firstVisibleRow: number
+}
+
+// Rows rendered above and below the visible window
+export const OVERSCAN_ROWS = 2
+
+/**
+ * A scrollable grid of icon buttons in one iframe. Only the rows in view,
+ * plus a few rows of overscan, are rendered, so the cost of the grid does not
+ * grow with the number of icons.
+ */
+class IconGrid extends React.PureComponent<Props, State> {
+  public state: State = { width: window.innerWidth, firstVisibleRow: 0 }
+
+  public componentDidMount() {
+    ensureSprite()
+    window.addEventListener("resize", this.handleResize)
+  }
+
+  public componentWillUnmount() {
+    window.removeEventListener("resize", this.handleResize)
+  }
+
+  public render = (): React.ReactNode => {
+    const { icons, height, cellSize, buttonType = "ghost", showLabels = true } = this.props.grid
+    const columns = Math.max(1, Math.floor(this.state.width / cellSize))
+    const rows = Math.ceil(icons.length / columns)
+
+    const firstRow = Math.max(0, this.state.firstVisibleRow - OVERSCAN_ROWS)
+    const lastRow = Math.min(rows, this.state.firstVisibleRow + Math.ceil(height / cellSize) + 1 + OVERSCAN_ROWS)
+    const cellWidth = `${100 / columns}%`
+
+    const cells: React.ReactNode[] = []
+    for (let index = firstRow * columns; index < Math.min(icons.length, lastRow * columns); index++) {
+      const name = icons[index]
+      cells.push(
+        <button
+          key={name}
+          className="carbon-icon-grid-cell"
+          style={{
+            top: Math.floor(index / columns) * cellSize,
+            left: `${((index % columns) * 100) / columns}%`,
+            width: cellWidth,
+            height: cellSize,
+          }}
+          title={name}
+          aria-label={name}
+          data-index={index}
+          onClick={this.handleClick}
+        >
+          <span className="carbon-button-icon">
+            <svg aria-hidden="true" focusable="false">
+              <use href={iconHref(name)} />
+            </svg>
+          </span>
+          {showLabels && <span className="carbon-icon-grid-label">{name}</span>}
+        </button>
+      )
+    }
+
+    const palette = resolvePalette(buttonType, this.props.isDarkMode)
+    return (
+      <div
+        className="carbon-icon-grid"
+        style={{ ...paletteVariables(palette), height } as React.CSSProperties}
+        onScroll={this.handleScroll}
+      >
+        <div className="carbon-icon-grid-canvas" style={{ height: rows * cellSize }}>
+          {cells}
+        </div>
+      </div>
+    )
+  }
+
+  private handleScroll = (e: React.UIEvent<HTMLDivElement>) => {
+    // Only re-render when scrolling crosses into another row
+    const firstVisibleRow = Math.floor(e.currentTarget.scrollTop / this.props.grid.cellSize)
+    if (firstVisibleRow !== this.state.firstVisibleRow) {
+      this.setState({ firstVisibleRow })
+    }
+  }
+
+  private handleResize = () => {
+    this.setState({ width: window.innerWidth })
+  }
+
+  private handleClick = (e: React.MouseEvent<HTMLButtonElement>) => {
+    this.props.onClick(Number(e.currentTarget.dataset.index))
+  }
+}
+
+export default IconGrid
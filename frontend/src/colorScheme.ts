@@ -0,0 +1,35 @@
+// One prefers-color-scheme watcher per document. Every button subscribes
+// here instead of adding its own MediaQueryList listener, and the listener
+// is removed again once the last button unsubscribes.
+
+type Listener = (isDark: boolean) => void
+
+const DARK_QUERY = "(prefers-color-scheme: dark)"
+
+const listeners = new Set<Listener>()
+let media: MediaQueryList | null = null
+
+function onChange(event: MediaQueryListEvent): void {
+  listeners.forEach(listener => listener(event.matches))
+}
+
+export function prefersDark(): boolean {
+  return !!window.matchMedia && window.matchMedia(DARK_QUERY).matches
+}
+
+/** Call `listener` whenever the OS theme flips; returns the unsubscribe function. */
+export function subscribeColorScheme(listener: Listener): () => void {
+  listeners.add(listener)
+  if (!media && window.matchMedia) {
+    media = window.matchMedia(DARK_QUERY)
+    media.addEventListener("change", onChange)
+  }
+
+  return () => {
+    listeners.delete(listener)
+    if (listeners.size === 0 && media) {
+      media.removeEventListener("change", onChange)
+      media = null
+    }
+  }
+}
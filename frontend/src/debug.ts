@@ -0,0 +1,32 @@
+// Debug logging is compiled in only when __CARBON_DEBUG__ is true: under the
+// dev server, or for `CARBON_BUTTON_DEBUG=true npm run build`. Production
+// builds replace the flag with `false` and drop every `if (DEBUG)` block.
+//
+// Builds that include it still stay quiet until opted in at runtime from the
+// browser console:
+//
+//   localStorage.setItem("carbon-button-debug", "true")
+declare global {
+  const __CARBON_DEBUG__: boolean
+}
+
+const OPT_IN_KEY = "carbon-button-debug"
+
+function optedIn(): boolean {
+  try {
+    return window.localStorage.getItem(OPT_IN_KEY) === "true"
+  } catch {
+    // Storage can be unavailable in sandboxed iframes
+    return false
+  }
+}
+
+export const DEBUG: boolean = __CARBON_DEBUG__ && optedIn()
+
+export function debugLog(...args: unknown[]): void {
+  // Guarded here too, so production builds drop the call and its prefix even
+  // if a caller forgets `if (DEBUG)`; check_dist.py looks for the prefix
+  if (__CARBON_DEBUG__) {
+    console.log("[carbon-button]", ...args)
+  }
+}
@@ -0,0 +1,57 @@
+import { Streamlit } from "streamlit-component-lib"
+
+// Reports the iframe height to Streamlit. A ResizeObserver on <body> notices
+// size changes, reports are coalesced to one per animation frame, and a
+// height is only posted when it differs from the last one sent. Every post
+// makes the host page resize the iframe and relayout.
+
+interface Reporter {
+  body: HTMLElement
+  observer: ResizeObserver | null
+  frame: number | null
+  lastHeight?: number
+}
+
+// One reporter per document
+let reporter: Reporter | null = null
+
+function currentReporter(): Reporter {
+  if (!reporter || reporter.body !== document.body) {
+    reporter = { body: document.body, observer: null, frame: null }
+  }
+  return reporter
+}
+
+function flush(): void {
+  const current = currentReporter()
+  current.frame = null
+  const height = current.body.scrollHeight
+  if (height !== current.lastHeight) {
+    current.lastHeight = height
+    Streamlit.setFrameHeight(height)
+  }
+}
+
+function schedule(): void {
+  const current = currentReporter()
+  if (current.frame === null) {
+    current.frame = window.requestAnimationFrame(flush)
+  }
+}
+
+/** Start reporting the document height; safe to call from every mount. */
+export function watchFrameHeight(): void {
+  const current = currentReporter()
+  if (!current.observer && window.ResizeObserver) {
+    current.observer = new window.ResizeObserver(schedule)
+    current.observer.observe(current.body)
+  }
+  schedule()
+}
+
+/** Report the height after a render where no ResizeObserver is available. */
+export function updateFrameHeight(): void {
+  if (!currentReporter().observer) {
+    schedule()
+  }
+}
@@ -0,0 +1,30 @@
+// Named icons are rendered from a single <symbol> sprite compiled at build
+// time (see plugins/carbonIcons.ts). The sprite is fetched once per document
+// and inlined, so each icon's path data is parsed once no matter how many
+// buttons use it.
+const SPRITE_URL = "./static/icons/sprite.svg"
+
+// Must match SYMBOL_PREFIX in plugins/carbonIcons.ts
+const SYMBOL_PREFIX = "carbon-icon-"
+
+let sprite: Promise<void> | null = null
+
+export function ensureSprite(): Promise<void> {
+  if (!sprite) {
+    sprite = fetch(SPRITE_URL)
+      .then(response => (response.ok ? response.text() : ""))
+      .then(markup => {
+        const container = document.createElement("div")
+        container.setAttribute("aria-hidden", "true")
+        container.style.cssText = "position:absolute;width:0;height:0;overflow:hidden"
+        container.innerHTML = markup
+        document.body.insertBefore(container, document.body.firstChild)
+      })
+      .catch(() => undefined)
+  }
+  return sprite
+}
+
+export function iconHref(name: string): string {
+  return `#${SYMBOL_PREFIX}${name}`
+}
@@ -1,28 +1,20 @@
-import React from "react"
 import { createRoot } from "react-dom/client"
 import CarbonButton from "./CarbonButton"
+import { DEBUG, debugLog } from "./debug"
 import "./index.css"
 
-// Component loaded
-console.log("Carbon Button Component: Script loaded!")
-
-// Debug logging
-console.log("Carbon Button Component: Initializing...")
-window.addEventListener('DOMContentLoaded', () => {
-  console.log("DOM Content Loaded")
-})
+if (DEBUG) {
+  debugLog("Script loaded")
+}
 
 const rootElement = document.getElementById("root")
-console.log("Root element:", rootElement)
 
 if (rootElement) {
   const root = createRoot(rootElement)
-  root.render(
-    <React.StrictMode>
-      <CarbonButton />
-    </React.StrictMode>
-  )
-  console.log("Carbon Button Component: Rendered")
+  root.render(<CarbonButton />)
+  if (DEBUG) {
+    debugLog("Rendered into", rootElement)
+  }
 } else {
   console.error("Carbon Button Component: Root element not found!")
   // Try to create a fallback
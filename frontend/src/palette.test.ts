@@ -0,0 +1,36 @@
+import assert from "node:assert/strict"
+import { test } from "node:test"
+import { paletteVariables, resolvePalette } from "./palette"
+
+test("palettes are memoized per type and theme", () => {
+  const light = resolvePalette("danger", false)
+  assert.equal(resolvePalette("danger", false), light)
+  assert.notEqual(resolvePalette("danger", true), light)
+  assert.ok(Object.isFrozen(light))
+  assert.ok(Object.isFrozen(light.hover))
+})
+
+test("unknown button types use the primary colors", () => {
+  assert.deepEqual(resolvePalette("unknown", true), resolvePalette("primary", true))
+})
+
+test("custom colors apply to secondary buttons only", () => {
+  const colors = { rest_bg: "#123456", hover_text: "#abcdef" }
+
+  const secondary = resolvePalette("secondary", false, colors)
+  assert.equal(secondary.rest.background, "#123456")
+  assert.equal(secondary.hover.text, "#abcdef")
+  assert.equal(secondary.active.text, "#ffffff")
+  assert.equal(resolvePalette("secondary", false, colors), secondary)
+
+  assert.equal(resolvePalette("primary", false, colors), resolvePalette("primary", false))
+})
+
+test("palette variables are built once per palette", () => {
+  const palette = resolvePalette("ghost", true)
+  const style = paletteVariables(palette)
+
+  assert.equal(paletteVariables(palette), style)
+  assert.equal(style["--cb-hover-bg"], palette.hover.background)
+  assert.equal(style["--cb-active-text"], "#000000")
+})
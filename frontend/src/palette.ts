@@ -0,0 +1,179 @@
+// Carbon button colors, resolved once per (buttonType, theme, colors) into a
+// frozen palette. Buttons expose the palette as CSS custom properties and the
+// stylesheet switches between rest, hover and active colors.
+
+export interface StateColors {
+  readonly background: string
+  readonly text: string
+  readonly border: string
+}
+
+export interface Palette {
+  readonly rest: StateColors
+  readonly hover: StateColors
+  readonly active: StateColors
+}
+
+export type CustomColors = { readonly [key: string]: string }
+
+type Theme = "light" | "dark"
+type ByType = { readonly [type: string]: string }
+
+const BACKGROUND: Record<Theme, ByType> = {
+  light: {
+    primary: "#e6e2e2",      // Changed primary to your subtle grey
+    secondary: "#e6e2e2",    // Your custom light mode color
+    danger: "#f4e3e3",       // Softer danger color
+    ghost: "transparent",
+  },
+  dark: {
+    primary: "#ecdcdc",      // Your pink-grey for dark mode
+    secondary: "#ecdcdc",    // Your custom dark mode color
+    danger: "#f0d0d0",       // Lighter pink for danger in dark mode
+    ghost: "transparent",
+  },
+}
+
+const TEXT: Record<Theme, ByType> = {
+  light: {
+    primary: "#1a1a1a",      // Dark text on light grey
+    secondary: "#1a1a1a",    // Almost black for maximum contrast
+    danger: "#4a1414",       // Dark red text
+    ghost: "#262626",
+  },
+  dark: {
+    primary: "#1a1a1a",      // Dark text on pink-grey
+    secondary: "#1a1a1a",    // Dark text for contrast
+    danger: "#4a1414",       // Dark red text
+    ghost: "#262626",
+  },
+}
+
+const BORDER: Record<Theme, ByType> = {
+  light: {
+    primary: "#cccccc",      // Subtle grey border
+    secondary: "#cccccc",
+    danger: "#e0c0c0",       // Soft pink border
+    ghost: "#e0e0e0",        // Light grey for ghost
+  },
+  dark: {
+    primary: "#404040",      // Dark grey border
+    secondary: "#404040",    // Your dark mode border
+    danger: "#5a4040",       // Muted red border
+    ghost: "#404040",        // Dark grey for ghost
+  },
+}
+
+const HOVER_BACKGROUND: Record<Theme, ByType> = {
+  light: {
+    primary: "#f5f5f5",      // Light grey hover
+    secondary: "#f5f5f5",    // Light mode hover
+    danger: "#faf0f0",       // Light pink hover
+    ghost: "#fafafa",        // Very light grey
+  },
+  dark: {
+    primary: "#4a4a4a",      // Medium grey hover
+    secondary: "#f6f4f4",    // Dark mode hover
+    danger: "#5a4343",       // Muted red hover
+    ghost: "#2a2a2a",        // Dark grey hover
+  },
+}
+
+const ACTIVE_BACKGROUND: Record<Theme, ByType> = {
+  light: {
+    primary: "#50e4e0",      // Teal accent for all buttons
+    secondary: "#50e4e0",    // Light mode teal
+    danger: "#e4807a",       // Soft coral for danger
+    ghost: "#50e4e0",        // Teal for ghost too
+  },
+  dark: {
+    primary: "#67cccc",      // Darker teal for dark mode
+    secondary: "#67cccc",    // Dark mode teal
+    danger: "#cc6666",       // Muted red
+    ghost: "#67cccc",        // Teal for ghost
+  },
+}
+
+// Dark mode uses black text on teal, light mode white text
+const ACTIVE_TEXT: Record<Theme, string> = { light: "#ffffff", dark: "#000000" }
+
+const NO_CUSTOM_COLORS: CustomColors = {}
+
+function buildPalette(type: string, theme: Theme, custom: CustomColors): Palette {
+  const pick = (table: Record<Theme, ByType>): string => table[theme][type] || table[theme].primary
+
+  const rest = Object.freeze({
+    background: custom.rest_bg || pick(BACKGROUND),
+    text: custom.rest_text || pick(TEXT),
+    border: custom.rest_border || pick(BORDER),
+  })
+  const hover = Object.freeze({
+    background: custom.hover_bg || pick(HOVER_BACKGROUND),
+    text: custom.hover_text || rest.text,
+    border: custom.hover_border || rest.border,
+  })
+  const active = Object.freeze({
+    background: custom.active_bg || pick(ACTIVE_BACKGROUND),
+    text: custom.active_text || ACTIVE_TEXT[theme],
+    border: custom.active_border || rest.border,
+  })
+  return Object.freeze({ rest, hover, active })
+}
+
+const builtInPalettes: Record<Theme, Map<string, Palette>> = {
+  light: new Map(),
+  dark: new Map(),
+}
+
+// Keyed on the args' colors object, so entries go away with the args
+const customPalettes = new WeakMap<CustomColors, Partial<Record<Theme, Palette>>>()
+
+/**
+ * Return the frozen palette for a button. Custom colors only apply to
+ * secondary buttons; unknown types fall back to the primary colors.
+ */
+export function resolvePalette(
+  type: string,
+  isDarkMode: boolean,
+  colors?: CustomColors | null
+): Palette {
+  const theme: Theme = isDarkMode ? "dark" : "light"
+
+  if (colors && type === "secondary") {
+    let byTheme = customPalettes.get(colors)
+    if (!byTheme) {
+      byTheme = {}
+      customPalettes.set(colors, byTheme)
+    }
+    return (byTheme[theme] ??= buildPalette(type, theme, colors))
+  }
+
+  let palette = builtInPalettes[theme].get(type)
+  if (!palette) {
+    palette = buildPalette(type, theme, NO_CUSTOM_COLORS)
+    builtInPalettes[theme].set(type, palette)
+  }
+  return palette
+}
+
+const paletteStyles = new WeakMap<Palette, { readonly [property: string]: string }>()
+
+/** The palette as the `--cb-*` custom properties read by `.carbon-button`. */
+export function paletteVariables(palette: Palette): { readonly [property: string]: string } {
+  let style = paletteStyles.get(palette)
+  if (!style) {
+    style = Object.freeze({
+      "--cb-bg": palette.rest.background,
+      "--cb-text": palette.rest.text,
+      "--cb-border": palette.rest.border,
+      "--cb-hover-bg": palette.hover.background,
+      "--cb-hover-text": palette.hover.text,
+      "--cb-hover-border": palette.hover.border,
+      "--cb-active-bg": palette.active.background,
+      "--cb-active-text": palette.active.text,
+      "--cb-active-border": palette.active.border,
+    })
+    paletteStyles.set(palette, style)
+  }
+  return style
+}
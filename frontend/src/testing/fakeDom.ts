@@ -0,0 +1,114 @@
+// Just enough of the browser globals for unit tests to drive component
+// lifecycle methods under Node, without pulling in a DOM library.
+
+interface FakeElement {
+  tagName: string
+  style: { [key: string]: string }
+  textContent: string
+  innerHTML: string
+  setAttribute: (name: string, value: string) => void
+}
+
+export interface FakeDom {
+  // Number of <style> elements appended to document.head
+  styleNodes: () => number
+  // Messages posted to the parent frame (i.e. to Streamlit)
+  postedMessages: unknown[]
+  // Number of listeners registered on prefers-color-scheme media queries
+  colorSchemeListeners: () => number
+  // Flip the OS theme and notify media query listeners
+  setDarkMode: (isDark: boolean) => void
+  // Heights posted with streamlit:setFrameHeight
+  frameHeights: () => number[]
+  // Change the body height and notify resize observers
+  resizeBody: (height: number) => void
+  // Run the callbacks queued with requestAnimationFrame
+  runAnimationFrames: () => void
+}
+
+export function installFakeDom(): FakeDom {
+  const head: FakeElement[] = []
+  const postedMessages: unknown[] = []
+  // Listeners are shared across MediaQueryList objects, so a listener added
+  // through one matchMedia() call must be removed through the same function
+  const mediaListeners = new Set<(event: { matches: boolean }) => void>()
+  let darkMode = false
+  let animationFrames: (() => void)[] = []
+  const resizeCallbacks: (() => void)[] = []
+
+  class FakeResizeObserver {
+    constructor(private callback: () => void) {}
+
+    observe(): void {
+      resizeCallbacks.push(this.callback)
+    }
+
+    disconnect(): void {
+      resizeCallbacks.splice(resizeCallbacks.indexOf(this.callback), 1)
+    }
+  }
+
+  const createElement = (tagName: string): FakeElement => ({
+    tagName: tagName.toUpperCase(),
+    style: {},
+    textContent: "",
+    innerHTML: "",
+    setAttribute: () => undefined,
+  })
+
+  const globals = globalThis as any
+  globals.document = {
+    createElement,
+    head: {
+      appendChild: (node: FakeElement) => {
+        head.push(node)
+        return node
+      },
+    },
+    body: {
+      scrollHeight: 48,
+      firstChild: null,
+      appendChild: (node: FakeElement) => node,
+      insertBefore: (node: FakeElement) => node,
+    },
+  }
+  globals.window = {
+    innerWidth: 800,
+    parent: { postMessage: (message: unknown) => postedMessages.push(message) },
+    matchMedia: (media: string) => ({
+      matches: darkMode,
+      media,
+      addEventListener: (_type: string, listener: (event: { matches: boolean }) => void) =>
+        mediaListeners.add(listener),
+      removeEventListener: (_type: string, listener: (event: { matches: boolean }) => void) =>
+        mediaListeners.delete(listener),
+    }),
+    requestAnimationFrame: (callback: () => void) => animationFrames.push(callback),
+    ResizeObserver: FakeResizeObserver,
+    addEventListener: () => undefined,
+    removeEventListener: () => undefined,
+  }
+
+  return {
+    styleNodes: () => head.filter(node => node.tagName === "STYLE").length,
+    postedMessages,
+    colorSchemeListeners: () => mediaListeners.size,
+    setDarkMode: (isDark: boolean) => {
+      darkMode = isDark
+      mediaListeners.forEach(listener => listener({ matches: isDark }))
+    },
+    frameHeights: () =>
+      postedMessages
+        .filter((message: any) => message.type === "streamlit:setFrameHeight")
+        .map((message: any) => message.height),
+    resizeBody: (height: number) => {
+      globals.document.body.scrollHeight = height
+      resizeCallbacks.forEach(callback => callback())
+    },
+    runAnimationFrames: () => {
+      const callbacks = animationFrames
+      animationFrames = []
+      callbacks.forEach(callback => callback())
+    },
+  }
+}
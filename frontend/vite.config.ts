@@ -1,10 +1,28 @@
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 import { resolve } from 'path'
+import carbonIcons from './plugins/carbonIcons'
+import externalSourcemaps from './plugins/externalSourcemaps'
+
+// Debug builds (dev server, CARBON_BUTTON_DEBUG=true) keep source maps next to
+// the bundle. Release builds write hidden maps to frontend/sourcemaps/ so they
+// never end up in the Python package.
+const isDebugBuild = (mode: string) =>
+  mode === 'development' || process.env.CARBON_BUTTON_DEBUG === 'true'
 
 // https://vitejs.dev/config/
-export default defineConfig({
-  plugins: [react()],
+export default defineConfig(({ mode }) => ({
+  plugins: [
+    react(),
+    carbonIcons(),
+    ...(isDebugBuild(mode) ? [] : [externalSourcemaps()]),
+  ],
+
+  // Debug logging (src/debug.ts) is compiled in for the dev server and for
+  // builds run with CARBON_BUTTON_DEBUG=true; production builds strip it.
+  define: {
+    __CARBON_DEBUG__: JSON.stringify(isDebugBuild(mode)),
+  },
 
   // Important: Set base to './' for Streamlit components
   base: './',
@@ -16,8 +34,8 @@ export default defineConfig({
     // Asset directory structure to match CRA output
     assetsDir: 'static',
 
-    // Generate sourcemaps for debugging
-    sourcemap: true,
+    // Release maps are 'hidden': no sourceMappingURL comment in the bundle
+    sourcemap: isDebugBuild(mode) ? true : 'hidden',
 
     // Minify for production
     minify: 'terser',
@@ -56,4 +74,4 @@ export default defineConfig({
       host: 'localhost'
     }
   }
-})
+}))
@@ -5,8 +5,7 @@ Interactive gallery to browse all available Carbon Design System icons
 """
 
 import streamlit as st
-from streamlit_carbon_button import carbon_button, CarbonIcons
-import inspect
+from streamlit_carbon_button import carbon_button, carbon_icon_grid, CarbonIcons
 
 # Page config
 st.set_page_config(
@@ -16,37 +15,60 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS for better layout
-st.markdown(
-    """
-<style>
-    .icon-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
-        gap: 1rem;
-        padding: 1rem 0;
-    }
-    .stButton > button {
-        width: 100%;
-    }
-</style>
-""",
-    unsafe_allow_html=True,
-)
-
 st.title("🎨 Carbon Button Icon Showroom")
 st.markdown(
     "Browse all available Carbon Design System icons for `streamlit-carbon-button`"
 )
 
-# Get all icon names and their SVG content
-all_icons = []
-for name, value in inspect.getmembers(CarbonIcons):
-    if not name.startswith("_") and isinstance(value, str) and value.startswith("<svg"):
-        all_icons.append((name, value))
+# The registry lists icon names without loading any SVG
+all_icons = CarbonIcons.names()
+
+# Category detection based on icon names
+categories = {
+    "Special Icons": ["INVISIBLE"],  # Special utility icons
+    "File Types": [
+        "PDF",
+        "ZIP",
+        "DOC",
+        "XLS",
+        "PPT",
+        "CSV",
+        "TXT",
+        "SQL",
+        "JSON",
+        "XML",
+    ],
+    "Actions": [
+        "ADD",
+        "DELETE",
+        "EDIT",
+        "SAVE",
+        "DOWNLOAD",
+        "UPLOAD",
+        "COPY",
+        "CUT",
+        "PASTE",
+    ],
+    "Navigation": ["HOME", "BACK", "FORWARD", "MENU", "ARROW", "CHEVRON", "CARET"],
+    "View/Display": ["VIEW", "EXPAND", "COLLAPSE", "ZOOM", "SCREEN", "PANEL"],
+    "Media": ["PLAY", "PAUSE", "STOP", "SKIP", "MICROPHONE", "VOLUME"],
+    "Status": ["CHECKMARK", "WARNING", "ERROR", "INFO", "HELP"],
+    "Communication": ["EMAIL", "CHAT", "SEND", "NOTIFICATION"],
+    "Data": ["CHART", "ANALYTICS", "DATA", "TABLE", "FILTER", "SORT"],
+    "User": ["USER", "LOGIN", "LOGOUT", "ACCOUNT", "AVATAR"],
+    "Settings": ["SETTINGS", "CONFIGURE", "TOOLS", "BUILD"],
+}
+
+
+def in_category(name, category):
+    if category == "All":
+        return True
+    if category == "Other":
+        return not any(
+            keyword in name for keywords in categories.values() for keyword in keywords
+        )
+    return any(keyword in name for keyword in categories[category])
 
-# Sort alphabetically
-all_icons.sort(key=lambda x: x[0])
 
 # Sidebar controls
 with st.sidebar:
@@ -54,131 +76,60 @@ with st.sidebar:
 
     # Search box
     search_term = st.text_input("Search icons", placeholder="Type to search...")
+    category = st.selectbox("Category", ["All", *categories, "Other"])
 
     # Button type selector
     button_style = st.selectbox(
-        "Button Style", ["primary", "secondary", "tertiary", "danger", "ghost"]
+        "Button Style", ["ghost", "primary", "secondary", "danger"]
     )
 
     # Layout options
-    cols_per_row = st.slider("Icons per row", 3, 8, 5)
+    cell_size = st.slider("Cell size", 64, 160, 96, step=16)
     show_labels = st.checkbox("Show icon names", value=True)
-    show_code = st.checkbox("Show code snippets", value=False)
 
     st.divider()
 
+# Filter icons based on search (best matches first) and category
+matches = CarbonIcons.search(search_term, limit=None) if search_term else all_icons
+display_icons = [name for name in matches if in_category(name, category)]
+
+with st.sidebar:
     # Stats
     st.metric("Total Icons", len(all_icons))
-
-    if search_term:
-        filtered = [
-            icon for icon in all_icons if search_term.lower() in icon[0].lower()
-        ]
-        st.metric("Filtered Icons", len(filtered))
-
-# Filter icons based on search
-if search_term:
-    display_icons = [
-        (name, svg) for name, svg in all_icons if search_term.lower() in name.lower()
-    ]
-else:
-    display_icons = all_icons
+    st.metric("Shown Icons", len(display_icons))
 
 # Main content
 if not display_icons:
     st.warning(f"No icons found matching '{search_term}'")
 else:
-    # Category detection based on icon names
-    categories = {
-        "Special Icons": ["INVISIBLE"],  # Special utility icons
-        "File Types": [
-            "PDF",
-            "ZIP",
-            "DOC",
-            "XLS",
-            "PPT",
-            "CSV",
-            "TXT",
-            "SQL",
-            "JSON",
-            "XML",
-        ],
-        "Actions": [
-            "ADD",
-            "DELETE",
-            "EDIT",
-            "SAVE",
-            "DOWNLOAD",
-            "UPLOAD",
-            "COPY",
-            "CUT",
-            "PASTE",
-        ],
-        "Navigation": ["HOME", "BACK", "FORWARD", "MENU", "ARROW", "CHEVRON", "CARET"],
-        "View/Display": ["VIEW", "EXPAND", "COLLAPSE", "ZOOM", "SCREEN", "PANEL"],
-        "Media": ["PLAY", "PAUSE", "STOP", "SKIP", "MICROPHONE", "VOLUME"],
-        "Status": ["CHECKMARK", "WARNING", "ERROR", "INFO", "HELP"],
-        "Communication": ["EMAIL", "CHAT", "SEND", "NOTIFICATION"],
-        "Data": ["CHART", "ANALYTICS", "DATA", "TABLE", "FILTER", "SORT"],
-        "User": ["USER", "LOGIN", "LOGOUT", "ACCOUNT", "AVATAR"],
-        "Settings": ["SETTINGS", "CONFIGURE", "TOOLS", "BUILD"],
-        "Other": [],
-    }
-
-    # Categorize icons
-    categorized = {cat: [] for cat in categories}
-    for name, svg in display_icons:
-        placed = False
-        for category, keywords in categories.items():
-            if category != "Other" and any(keyword in name for keyword in keywords):
-                categorized[category].append((name, svg))
-                placed = True
-                break
-        if not placed:
-            categorized["Other"].append((name, svg))
-
-    # Display icons by category
-    for category, icons in categorized.items():
-        if icons:  # Only show categories with icons
-            with st.expander(f"{category} ({len(icons)} icons)", expanded=True):
-                # Create grid layout
-                cols = st.columns(cols_per_row)
-                for idx, (name, svg) in enumerate(icons):
-                    col_idx = idx % cols_per_row
-                    with cols[col_idx]:
-                        # Special handling for INVISIBLE icon
-                        if name == "INVISIBLE":
-                            st.info("🔧 **Utility Icon**")
-                            st.caption("Use for height alignment")
-                            # Show demo with border to make it visible
-                            st.markdown(
-                                """<div style='border: 2px dashed #ccc; padding: 4px; border-radius: 4px;'>""",
-                                unsafe_allow_html=True,
-                            )
-
-                        # Display button
-                        clicked = carbon_button(
-                            name.replace("_", " ").title() if show_labels else "",
-                            icon=getattr(CarbonIcons, name),
-                            button_type=button_style,
-                            key=f"btn_{category}_{name}",
-                        )
-
-                        if name == "INVISIBLE":
-                            st.markdown("""</div>""", unsafe_allow_html=True)
-
-                        if show_code:
-                            st.code(f"CarbonIcons.{name}", language="python")
-
-                        if clicked:
-                            st.success(f"Clicked: {name}")
-
-                            # Show full code example in a modal-like container
-                            with st.container():
-                                st.markdown("### 📋 Copy this code:")
-                                if name == "INVISIBLE":
-                                    st.code(
-                                        """
+    # One virtualized grid renders every icon in a single iframe
+    clicked = carbon_icon_grid(
+        display_icons,
+        key="showroom_grid",
+        height=560,
+        cell_size=cell_size,
+        button_type=button_style,
+        show_labels=show_labels,
+    )
+    if clicked:
+        st.session_state["selected_icon"] = clicked.upper()
+
+selected = st.session_state.get("selected_icon")
+if selected:
+    st.subheader(f"CarbonIcons.{selected}")
+    preview, code = st.columns([1, 3])
+    with preview:
+        carbon_button(
+            selected.replace("_", " ").title(),
+            icon=selected.lower(),
+            button_type=button_style,
+            key="showroom_preview",
+        )
+    with code:
+        if selected == "INVISIBLE":
+            st.caption("An empty icon for aligning text-only buttons with icon buttons")
+            st.code(
+                """
 from streamlit_carbon_button import carbon_button, CarbonIcons
 
 # Use INVISIBLE icon to make text-only buttons same height as icon buttons
@@ -190,18 +141,18 @@ with col1:
 with col2:
     carbon_button("Text Only", icon=CarbonIcons.INVISIBLE)  # Same height!
 """,
-                                        language="python",
-                                    )
-                                else:
-                                    st.code(
-                                        f"""
+                language="python",
+            )
+        else:
+            st.code(
+                f"""
 from streamlit_carbon_button import carbon_button, CarbonIcons
 
-if carbon_button("Click me!", icon=CarbonIcons.{name}):
+if carbon_button("Click me!", icon=CarbonIcons.{selected}):
     st.write("Button clicked!")
 """,
-                                        language="python",
-                                    )
+                language="python",
+            )
 
 # Footer
 st.divider()
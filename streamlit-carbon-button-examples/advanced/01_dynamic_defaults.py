@@ -11,10 +11,17 @@ st.write("Change which button is marked as default based on your app's state.")
 # Example 1: Form validation
 st.header("1. Form Validation Example")
 
+
+def clear_form():
+    # Callbacks run before the script, so the cleared fields render empty
+    for field in ("form_name", "form_email", "form_message"):
+        st.session_state[field] = ""
+
+
 # Form inputs
-name = st.text_input("Name *")
-email = st.text_input("Email *")
-message = st.text_area("Message *")
+name = st.text_input("Name *", key="form_name")
+email = st.text_input("Email *", key="form_email")
+message = st.text_area("Message *", key="form_message")
 
 # Validation
 is_valid = all([name, email, message])
@@ -36,8 +43,9 @@ with col1:
 
 with col2:
     # Clear is default when form is invalid
-    if carbon_button("Clear", button_type="ghost", is_default=not is_valid):
-        st.rerun()
+    carbon_button(
+        "Clear", button_type="ghost", is_default=not is_valid, on_click=clear_form
+    )
 
 if not is_valid:
     st.warning("Please fill in all required fields")
@@ -50,6 +58,12 @@ st.header("2. Multi-Step Wizard")
 if "wizard_step" not in st.session_state:
     st.session_state.wizard_step = 1
 
+
+def go_to_step(step):
+    # Runs before the script, so the progress bar below already shows the new step
+    st.session_state.wizard_step = step
+
+
 # Progress bar
 progress = st.session_state.wizard_step / 3
 st.progress(progress)
@@ -74,16 +88,23 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     if st.session_state.wizard_step > 1:
-        if carbon_button("← Previous", button_type="ghost"):
-            st.session_state.wizard_step -= 1
-            st.rerun()
+        carbon_button(
+            "← Previous",
+            button_type="ghost",
+            on_click=go_to_step,
+            args=(st.session_state.wizard_step - 1,),
+        )
 
 with col2:
     if st.session_state.wizard_step < 3:
         # Next is default for steps 1-2
-        if carbon_button("Next →", button_type="primary", is_default=True):
-            st.session_state.wizard_step += 1
-            st.rerun()
+        carbon_button(
+            "Next →",
+            button_type="primary",
+            is_default=True,
+            on_click=go_to_step,
+            args=(st.session_state.wizard_step + 1,),
+        )
     else:
         # Complete is default for final step
         if carbon_button(
@@ -96,10 +117,8 @@ with col2:
             st.session_state.wizard_step = 1
 
 with col3:
-    if carbon_button("Cancel", button_type="ghost"):
-        st.session_state.wizard_step = 1
+    if carbon_button("Cancel", button_type="ghost", on_click=go_to_step, args=(1,)):
         st.info("Wizard cancelled")
-        st.rerun()
 
 # Example 3: Save state indicator
 st.divider()
@@ -110,9 +129,19 @@ if "doc_saved" not in st.session_state:
     st.session_state.doc_saved = True
 if "doc_content" not in st.session_state:
     st.session_state.doc_content = "Initial content..."
+    st.session_state.doc_editor = st.session_state.doc_content
+
+
+def save_document():
+    st.session_state.doc_content = st.session_state.doc_editor
+
+
+def revert_document():
+    st.session_state.doc_editor = st.session_state.doc_content
+
 
 # Document editor
-new_content = st.text_area("Document", value=st.session_state.doc_content, height=150)
+new_content = st.text_area("Document", key="doc_editor", height=150)
 
 # Detect changes
 has_changes = new_content != st.session_state.doc_content
@@ -134,10 +163,9 @@ with col1:
         button_type="primary",
         is_default=has_changes,
         disabled=not has_changes,
+        on_click=save_document,
     ):
-        st.session_state.doc_content = new_content
         st.success("Document saved!")
-        st.rerun()
 
 with col2:
     # Publish is default when saved
@@ -151,8 +179,12 @@ with col2:
         st.info("Document published!")
 
 with col3:
-    if carbon_button("Revert", button_type="ghost", disabled=not has_changes):
-        st.rerun()
+    carbon_button(
+        "Revert",
+        button_type="ghost",
+        disabled=not has_changes,
+        on_click=revert_document,
+    )
 
 # Tips
 st.divider()
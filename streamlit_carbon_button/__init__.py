@@ -8,11 +8,126 @@ https://carbondesignsystem.com/
 """
 
 import streamlit.components.v1 as components
+import functools
+import hashlib
 import os
+import re
+import sys
+from types import MappingProxyType
 
 # Check if we're in development mode
 _DEVELOP_MODE = os.getenv("STREAMLIT_CARBON_BUTTON_DEV_MODE", "").lower() == "true"
 
+# Session state bookkeeping for click detection
+_PREV_CLICKS_PREFIX = "__carbon_button_prev_"
+_TRACKED_KEYS = "__carbon_button_tracked_keys"
+_EVICTED_COUNT = "__carbon_button_evicted"
+
+# Attribute on the script run context marking the run that last evicted
+_EVICTED_RUN_ATTR = "_carbon_button_evicted_run"
+
+# Number of distinct button configurations whose frontend args are cached
+_ARGS_CACHE_SIZE = 1024
+
+# What a click reruns: Streamlit's default (the enclosing st.fragment if
+# there is one, else the app), only the enclosing fragment, or the whole app
+_SCOPES = ("auto", "fragment", "app")
+
+# First Streamlit releases with component on_change callbacks (on_click) and
+# with st.fragment and st.rerun(scope="app") (scope="fragment" / "app")
+_CALLBACKS_VERSION = (1, 36)
+_FRAGMENTS_VERSION = (1, 37)
+
+
+# Options of carbon_button that describe a button, in ButtonSpec order
+_SPEC_FIELDS = (
+    "label",
+    "icon",
+    "button_type",
+    "disabled",
+    "use_container_width",
+    "colors",
+    "is_default",
+    "aria_label",
+    "debounce_ms",
+    "disable_on_click",
+)
+
+
+class ButtonSpec:
+    """
+    An immutable, hashable description of one button.
+
+    Takes the same options as ``carbon_button``. Build specs once, for example
+    at module import, and render them on every rerun with ``render_buttons``
+    or ``carbon_button_group``; the args sent to the browser are encoded once
+    per distinct spec. ``colors`` is stored as sorted ``(name, color)`` pairs.
+    """
+
+    __slots__ = _SPEC_FIELDS + ("_hash",)
+
+    def __init__(
+        self,
+        label: str,
+        icon: str = "",
+        button_type: str = "primary",
+        disabled: bool = False,
+        use_container_width: bool = False,
+        colors: dict = None,
+        is_default: bool = False,
+        aria_label: str = None,
+        debounce_ms: int = 0,
+        disable_on_click: bool = False,
+    ):
+        if isinstance(colors, dict):
+            colors = tuple(sorted(colors.items()))
+        values = (
+            label,
+            icon,
+            button_type,
+            disabled,
+            use_container_width,
+            colors,
+            is_default,
+            aria_label,
+            debounce_ms,
+            disable_on_click,
+        )
+        for name, value in zip(_SPEC_FIELDS, values):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_hash", hash(values))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ButtonSpec is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ButtonSpec is immutable")
+
+    def __reduce__(self):
+        return (ButtonSpec, self._values())
+
+    def __eq__(self, other):
+        if not isinstance(other, ButtonSpec):
+            return NotImplemented
+        return self._hash == other._hash and self._values() == other._values()
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        options = ", ".join(f"{name}={getattr(self, name)!r}" for name in _SPEC_FIELDS)
+        return f"ButtonSpec({options})"
+
+    def replace(self, **changes) -> "ButtonSpec":
+        """Return a copy of this spec with the given options changed."""
+        options = dict(zip(_SPEC_FIELDS, self._values()))
+        options.update(changes)
+        return ButtonSpec(**options)
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in _SPEC_FIELDS)
+
+
 # Declare the component
 if _DEVELOP_MODE:
     # In development, connect to the React dev server
@@ -37,7 +152,14 @@ def carbon_button(
     colors: dict = None,
     is_default: bool = False,
     aria_label: str = None,
-) -> bool:
+    count_clicks: bool = False,
+    debounce_ms: int = 0,
+    disable_on_click: bool = False,
+    on_click=None,
+    args: tuple = None,
+    kwargs: dict = None,
+    scope: str = "auto",
+):
     """
     Create a Carbon Design System button.
 
@@ -46,9 +168,13 @@ def carbon_button(
     label : str
         The text to display on the button
     icon : str
-        SVG string for the icon (optional)
+        SVG string for the icon, or the name of a Carbon icon such as "save"
+        or "chart_bar" (optional). Named icons send only the name to the
+        browser, which fetches the SVG once and caches it.
     key : str
-        An optional key that uniquely identifies this component
+        An optional key that uniquely identifies this component. Defaults to a
+        key derived from the calling line, label and icon, which is stable
+        across reruns
     button_type : str
         The button style - "primary", "secondary", "danger", or "ghost"
     disabled : bool
@@ -64,54 +190,637 @@ def carbon_button(
         If True, the button will have a teal shadow to indicate it's the default action
     aria_label : str
         Accessibility label for screen readers (automatically set for icon-only buttons)
+    count_clicks : bool
+        If True, return the number of clicks since the last run instead of a
+        bool, so rapid clicks that land in a single rerun are not lost
+    debounce_ms : int
+        Ignore clicks that follow the previous click within this many
+        milliseconds; the browser drops them without contacting Streamlit
+    disable_on_click : bool
+        If True, the button disables itself as soon as it is clicked and is
+        enabled again when the rerun it triggered renders it
+    on_click : callable
+        An optional callback invoked when the button is clicked. Like
+        ``st.button`` callbacks, it runs before the rest of the script, so
+        state it changes is already visible on the rerun the click starts
+    args : tuple
+        An optional tuple of args to pass to the callback
+    kwargs : dict
+        An optional dict of kwargs to pass to the callback
+    scope : str
+        What a click reruns. "auto" follows Streamlit: the enclosing
+        ``st.fragment`` if there is one, otherwise the whole app. "fragment"
+        requires the button to be inside a fragment and raises otherwise.
+        "app" reruns the whole app even from inside a fragment
 
     Returns
     -------
-    bool
-        True if the button was clicked, False otherwise
+    bool or int
+        True if the button was clicked, False otherwise; with
+        ``count_clicks=True``, the number of clicks since the last run
     """
-    import streamlit as st
-
     # Generate a unique key if not provided
     if key is None:
-        key = f"carbon_button_{id(label)}"
-
-    # Store the previous click count in session state
-    prev_clicks_key = f"__carbon_button_prev_{key}"
-    if prev_clicks_key not in st.session_state:
-        st.session_state[prev_clicks_key] = 0
+        key = _default_key("carbon_button", label, icon)
 
-    # Call the React component
-    component_value = _component_func(
+    spec = ButtonSpec(
         label=label,
         icon=icon,
-        buttonType=button_type,
+        button_type=button_type,
         disabled=disabled,
-        useContainerWidth=use_container_width,
+        use_container_width=use_container_width,
         colors=colors,
-        isDefault=is_default,
-        ariaLabel=aria_label,
+        is_default=is_default,
+        aria_label=aria_label,
+        debounce_ms=debounce_ms,
+        disable_on_click=disable_on_click,
+    )
+    rerun_app = _check_scope(scope)
+    on_change = None
+    if on_click is not None:
+        _require_streamlit(_CALLBACKS_VERSION, "on_click")
+        on_change = _click_callback(key, on_click, args, kwargs)
+    clicks = _render_button(key, _encode_spec(spec), on_change, rerun_app)
+    return clicks if count_clicks else clicks > 0
+
+
+def render_buttons(specs: list, keys: list = None, scope: str = "auto") -> list:
+    """
+    Render precomputed buttons, one component per spec, in order.
+
+    All specs are validated and encoded before any button is rendered, and a
+    spec that was rendered before reuses its cached args.
+
+    Parameters
+    ----------
+    specs : list of ButtonSpec
+        The buttons to render
+    keys : list of str
+        Optional keys, one per spec. Defaults to keys derived from the calling
+        line and each button's position; pass keys when calling from a loop
+        or when buttons can be reordered
+    scope : str
+        What a click reruns. "auto" follows Streamlit: the enclosing
+        ``st.fragment`` if there is one, otherwise the whole app. "fragment"
+        requires the button to be inside a fragment and raises otherwise.
+        "app" reruns the whole app even from inside a fragment
+
+    Returns
+    -------
+    list of bool
+        For each spec, True if its button was clicked, False otherwise
+    """
+    specs = list(specs)
+    for spec in specs:
+        if not isinstance(spec, ButtonSpec):
+            raise TypeError(f"render_buttons expects ButtonSpec objects, got {spec!r}")
+
+    if keys is None:
+        prefix = _default_key("render_buttons")
+        keys = [f"{prefix}_{index}" for index in range(len(specs))]
+    elif len(keys) != len(specs):
+        raise ValueError("render_buttons needs one key per spec")
+
+    rerun_app = _check_scope(scope)
+    button_args = [_encode_spec(spec) for spec in specs]
+    return [
+        _render_button(key, args, rerun_app=rerun_app) > 0
+        for key, args in zip(keys, button_args)
+    ]
+
+
+def _render_button(key: str, args, on_change=None, rerun_app: bool = False) -> int:
+    """Render one button component and return its clicks since the last run."""
+    import streamlit as st
+
+    # Store the previous click count in session state
+    prev_clicks_key = _track_button(key)
+
+    # Streamlit versions without component callbacks would try to serialize
+    # on_change as an arg, so only pass it when there is a callback
+    callback = {} if on_change is None else {"on_change": on_change}
+
+    # Call the React component
+    component_value = _component_func(
+        **args,
         key=key,
-        default=st.session_state[prev_clicks_key],  # Use previous value as default
+        default=_clicks_seen(key, prev_clicks_key),
+        **callback,
     )
 
-    # Check if there was a new click
-    clicked = False
+    # Clicks made while a rerun was in flight arrive together in one value
+    clicks = 0
     if (
         component_value is not None
         and component_value > st.session_state[prev_clicks_key]
     ):
-        clicked = True
+        if rerun_app:
+            _rerun_app()
+        clicks = component_value - st.session_state[prev_clicks_key]
         st.session_state[prev_clicks_key] = component_value
 
+    return clicks
+
+
+def carbon_button_group(
+    buttons: list,
+    key: str = None,
+    use_container_width: bool = False,
+    scope: str = "auto",
+    count_clicks: bool = False,
+):
+    """
+    Create a row of Carbon Design System buttons rendered by a single component.
+
+    Every ``carbon_button`` call creates its own iframe, which loads the full
+    frontend bundle. A group renders all of its buttons in one iframe, so a
+    toolbar of many buttons costs a single component instance.
+
+    Parameters
+    ----------
+    buttons : list of dict or ButtonSpec
+        One entry per button. Each dict takes the same keys as the keyword
+        arguments of ``carbon_button`` (``label``, ``icon``, ``button_type``,
+        ``disabled``, ``colors``, ``is_default``, ``aria_label``,
+        ``debounce_ms``, ``disable_on_click``), plus an optional ``key``
+        identifying the button in the return value. Buttons given as a
+        ``ButtonSpec`` are identified by their index. A group reports one
+        click per run, so clicking a button with ``disable_on_click`` disables
+        the whole group until the rerun renders it.
+    key : str
+        An optional key that uniquely identifies this component. Defaults to a
+        key derived from the calling line and the buttons' labels and icons
+    use_container_width : bool
+        If True, the group expands to fill its container and the buttons
+        share the width equally
+    scope : str
+        What a click reruns. "auto" follows Streamlit: the enclosing
+        ``st.fragment`` if there is one, otherwise the whole app. "fragment"
+        requires the group to be inside a fragment and raises otherwise.
+        "app" reruns the whole app even from inside a fragment
+    count_clicks : bool
+        If True, return how often each button was clicked since the last run
+        instead of only the last one, so clicks on several buttons that land
+        in a single rerun are not lost
+
+    Returns
+    -------
+    str, int, None or dict
+        The ``key`` of the button clicked since the last run (or its index
+        in ``buttons`` if it has no key), None if nothing was clicked. When
+        several buttons were clicked while a rerun was in flight, the last
+        one. With ``count_clicks=True``, a dict mapping each clicked button's
+        key (or index) to its number of clicks, in click order
+    """
+    import streamlit as st
+
+    rerun_app = _check_scope(scope)
+    button_ids = []
+    button_args = []
+    for index, spec in enumerate(buttons):
+        if isinstance(spec, ButtonSpec):
+            button_ids.append(index)
+            spec = spec.replace(use_container_width=use_container_width)
+        else:
+            spec = dict(spec)
+            button_ids.append(spec.pop("key", index))
+            spec["use_container_width"] = use_container_width
+            spec = ButtonSpec(**spec)
+        button_args.append(dict(_encode_spec(spec)))
+
+    # Generate a unique key if not provided
+    if key is None:
+        key = _default_key(
+            "carbon_button_group",
+            *((args["label"], args["icon"], args["iconName"]) for args in button_args),
+        )
+
+    # Store the previous click count in session state
+    prev_clicks_key = _track_button(key)
+
+    # Call the React component once for the whole group
+    component_value = _component_func(
+        buttons=button_args,
+        useContainerWidth=use_container_width,
+        key=key,
+        default=_clicks_seen(key, prev_clicks_key),
+    )
+
+    # The group reports {"clicks": total clicks, "index": last clicked button,
+    # "batch": every button clicked since its previous message}
+    clicked = None
+    counts = {}
+    if (
+        isinstance(component_value, dict)
+        and component_value.get("clicks", 0) > st.session_state[prev_clicks_key]
+    ):
+        if rerun_app:
+            _rerun_app()
+        index = component_value.get("index")
+        if index is not None and 0 <= index < len(button_ids):
+            clicked = button_ids[index]
+        for batch_index in component_value.get("batch", [index]):
+            if batch_index is not None and 0 <= batch_index < len(button_ids):
+                button_id = button_ids[batch_index]
+                counts[button_id] = counts.get(button_id, 0) + 1
+        st.session_state[prev_clicks_key] = component_value["clicks"]
+
+    return counts if count_clicks else clicked
+
+
+def carbon_icon_grid(
+    icons: list = None,
+    key: str = None,
+    height: int = 400,
+    cell_size: int = 96,
+    button_type: str = "ghost",
+    show_labels: bool = True,
+    scope: str = "auto",
+):
+    """
+    Show Carbon icons as a scrollable grid of buttons in a single component.
+
+    The grid is virtualized: only the rows in view are rendered, so browsing
+    the whole catalog costs one iframe and stays smooth with thousands of
+    icons.
+
+    Parameters
+    ----------
+    icons : list of str
+        Names of the icons to show, such as "save" or "CHART_BAR". Defaults to
+        every available icon, sorted by name
+    key : str
+        An optional key that uniquely identifies this component. Defaults to a
+        key derived from the calling line
+    height : int
+        Height of the scrolling grid in pixels
+    cell_size : int
+        Width and height of each icon cell in pixels
+    button_type : str
+        The style of the icon buttons - "primary", "secondary", "danger", or
+        "ghost"
+    show_labels : bool
+        If True, each cell shows the icon name under the icon
+    scope : str
+        What a click reruns. "auto" follows Streamlit: the enclosing
+        ``st.fragment`` if there is one, otherwise the whole app. "fragment"
+        requires the grid to be inside a fragment and raises otherwise.
+        "app" reruns the whole app even from inside a fragment
+
+    Returns
+    -------
+    str or None
+        The name (lower case) of the icon clicked since the last run, None if
+        nothing was clicked. When several icons were clicked while a rerun was
+        in flight, the last one
+    """
+    import streamlit as st
+
+    rerun_app = _check_scope(scope)
+    if icons is None:
+        names = sorted(name.lower() for name in _available_icons())
+    else:
+        names = [name.lower() for name in icons]
+        for name in names:
+            if name.upper() not in _available_icons():
+                raise ValueError(f"Unknown Carbon icon: {name!r}")
+
+    # Generate a unique key if not provided
+    if key is None:
+        key = _default_key("carbon_icon_grid")
+
+    # Store the previous click count in session state
+    prev_clicks_key = _track_button(key)
+
+    component_value = _component_func(
+        iconGrid={
+            "icons": names,
+            "height": height,
+            "cellSize": cell_size,
+            "buttonType": button_type,
+            "showLabels": show_labels,
+        },
+        key=key,
+        default=_clicks_seen(key, prev_clicks_key),
+    )
+
+    # The grid reports {"clicks": total clicks, "index": last clicked icon}
+    clicked = None
+    if (
+        isinstance(component_value, dict)
+        and component_value.get("clicks", 0) > st.session_state[prev_clicks_key]
+    ):
+        if rerun_app:
+            _rerun_app()
+        index = component_value.get("index")
+        if index is not None and 0 <= index < len(names):
+            clicked = names[index]
+        st.session_state[prev_clicks_key] = component_value["clicks"]
+
     return clicked
 
 
+def session_state_stats() -> dict:
+    """
+    Report the click-tracking entries this package keeps in session state.
+
+    Returns
+    -------
+    dict
+        ``tracked``: buttons whose last click count is stored, and
+        ``evicted``: entries removed because their button went away
+    """
+    import streamlit as st
+
+    return {
+        "tracked": len(st.session_state.get(_TRACKED_KEYS, ())),
+        "evicted": st.session_state.get(_EVICTED_COUNT, 0),
+    }
+
+
+def args_cache_stats() -> dict:
+    """
+    Report how often button configurations were served from the args cache.
+
+    Returns
+    -------
+    dict
+        ``hits`` and ``misses`` since the process started, ``size`` (cached
+        configurations) and ``maxsize`` (the bound on ``size``)
+    """
+    info = _encode_spec.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
+
+
+def _track_button(key: str) -> str:
+    """Return the session state key holding the last click count for ``key``."""
+    import streamlit as st
+
+    prev_clicks_key = f"{_PREV_CLICKS_PREFIX}{key}"
+    if prev_clicks_key not in st.session_state:
+        # Only new keys can grow session state, so collect stale ones here,
+        # once per run however many new buttons it renders
+        _evict_stale_buttons()
+        st.session_state[prev_clicks_key] = 0
+        if _TRACKED_KEYS not in st.session_state:
+            st.session_state[_TRACKED_KEYS] = set()
+        st.session_state[_TRACKED_KEYS].add(key)
+    return prev_clicks_key
+
+
+def _check_scope(scope: str) -> bool:
+    """
+    Validate a ``scope`` option for a button created here.
+
+    Returns True if a click must be escalated to a full app rerun, which is
+    only the case for ``scope="app"`` while a fragment reruns on its own.
+    """
+    if scope not in _SCOPES:
+        raise ValueError(f"scope must be one of {_SCOPES}, got {scope!r}")
+    if scope == "auto":
+        return False
+    _require_streamlit(_FRAGMENTS_VERSION, f"scope={scope!r}")
+
+    fragment_id = _current_fragment_id()
+    if scope == "fragment":
+        if fragment_id is None:
+            raise ValueError(
+                'scope="fragment" buttons must be created inside an st.fragment'
+            )
+        return False
+    return fragment_id is not None and bool(_fragment_ids_this_run())
+
+
+def _require_streamlit(version: tuple, feature: str) -> None:
+    """
+    Fail early if the installed Streamlit predates ``feature``.
+
+    Without this, older versions fail deep inside Streamlit, with a TypeError
+    or an error about serializing a function.
+    """
+    import streamlit as st
+
+    match = re.match(r"(\d+)\.(\d+)", st.__version__)
+    if match and tuple(map(int, match.groups())) < version:
+        required = ".".join(map(str, version))
+        raise RuntimeError(
+            f"{feature} needs Streamlit {required} or later, "
+            f"but Streamlit {st.__version__} is installed"
+        )
+
+
+def _rerun_app() -> None:
+    """
+    Rerun the whole app in place of the fragment rerun a click started.
+
+    Called before the click is recorded, so the widget still holds the new
+    count on the full rerun and the button reports the click there.
+    """
+    import streamlit as st
+
+    st.rerun(scope="app")
+
+
+def _current_fragment_id():
+    """Return the id of the st.fragment being run, None outside fragments."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+
+    # Streamlit keeps the id on the run context up to 1.5x and in
+    # per-thread fragment state after that
+    if hasattr(ctx, "current_fragment_id"):
+        return ctx.current_fragment_id
+    try:
+        from streamlit.runtime.scriptrunner_utils.script_run_context import (
+            ThreadState,
+        )
+
+        return ThreadState.get().fragment_id
+    except (ImportError, RuntimeError):
+        return None
+
+
+def _fragment_ids_this_run() -> list:
+    """Return the fragments this run is limited to, empty for a full run."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return (getattr(ctx, "fragment_ids_this_run", None) or []) if ctx else []
+
+
+def _click_callback(key: str, on_click, args: tuple = None, kwargs: dict = None):
+    """
+    Wrap ``on_click`` as the component's ``on_change`` handler.
+
+    Streamlit calls the handler before the script runs, whenever the frontend
+    sends a new click count. The count in session state is only updated when
+    the button is rendered, so comparing against it tells a click apart from
+    any other change to the widget value.
+    """
+
+    def callback():
+        import streamlit as st
+
+        clicks = st.session_state.get(key)
+        if clicks is not None and clicks > st.session_state.get(
+            f"{_PREV_CLICKS_PREFIX}{key}", 0
+        ):
+            on_click(*(args or ()), **(kwargs or {}))
+
+    return callback
+
+
+def _clicks_seen(key: str, prev_clicks_key: str) -> int:
+    """
+    Return the newest click count the frontend has reported for ``key``.
+
+    This is sent as the component's ``default``. It changes on exactly the
+    rerun a click starts, so Streamlit delivers fresh args on that rerun and
+    the frontend takes them as the acknowledgement it waits for before
+    sending clicks it held back. Streamlit skips the update when the args are
+    unchanged, and the last handled count only changes on the run after.
+    """
+    import streamlit as st
+
+    clicks = st.session_state.get(key)
+    if isinstance(clicks, dict):
+        clicks = clicks.get("clicks")
+    prev_clicks = st.session_state[prev_clicks_key]
+    return clicks if isinstance(clicks, int) and clicks > prev_clicks else prev_clicks
+
+
+def _evict_stale_buttons() -> None:
+    """
+    Drop the click counts of buttons that are no longer rendered.
+
+    Streamlit discards a keyed widget's state (and its key in session state)
+    when a run completes without rendering it. Once that has happened the
+    button's iframe is gone too, so its stored click count is dead weight.
+    """
+    import streamlit as st
+
+    # Outside `streamlit run` no widget is registered, so every key looks stale
+    if not st.runtime.exists():
+        return
+
+    # Stale keys only appear between runs, so one pass per run finds them all.
+    # A run's cursors dict is created when the run starts and identifies it.
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None or getattr(ctx, _EVICTED_RUN_ATTR, None) is ctx.cursors:
+        return
+    setattr(ctx, _EVICTED_RUN_ATTR, ctx.cursors)
+
+    tracked = st.session_state.get(_TRACKED_KEYS)
+    if not tracked:
+        return
+
+    stale = [key for key in tracked if key not in st.session_state]
+    for key in stale:
+        tracked.discard(key)
+        st.session_state.pop(f"{_PREV_CLICKS_PREFIX}{key}", None)
+    if stale:
+        st.session_state[_EVICTED_COUNT] = st.session_state.get(
+            _EVICTED_COUNT, 0
+        ) + len(stale)
+
+
+def _default_key(prefix: str, *identity) -> str:
+    """
+    Derive a key for a button created without one.
+
+    The key combines the caller's file and line with the arguments that
+    identify the button (label and icon, not state such as ``disabled``), so it
+    is the same on every rerun and Streamlit keeps reusing the existing iframe.
+    Buttons created in a loop on one line are told apart by their labels.
+    """
+    # Walk out of this package to the line in the app that created the button
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    call_site = f"{frame.f_code.co_filename}:{frame.f_lineno}" if frame else ""
+
+    digest = hashlib.sha1(repr((call_site, identity)).encode("utf-8")).hexdigest()
+    return f"{prefix}_{digest[:16]}"
+
+
+def _button_args(
+    label: str,
+    icon: str = "",
+    button_type: str = "primary",
+    disabled: bool = False,
+    use_container_width: bool = False,
+    colors: dict = None,
+    is_default: bool = False,
+    aria_label: str = None,
+    debounce_ms: int = 0,
+    disable_on_click: bool = False,
+) -> dict:
+    """Translate button options into the args understood by the frontend."""
+    if not isinstance(debounce_ms, int) or debounce_ms < 0:
+        raise ValueError(f"debounce_ms must be a non-negative int, got {debounce_ms!r}")
+
+    icon_name = None
+    if icon and not icon.lstrip().startswith("<"):
+        # A Carbon icon name rather than SVG markup
+        icon_name = icon.lower()
+        if icon_name.upper() not in _available_icons():
+            raise ValueError(f"Unknown Carbon icon: {icon!r}")
+        icon = ""
+
+    return {
+        "label": label,
+        "icon": icon or "",
+        "iconName": icon_name,
+        "buttonType": button_type,
+        "disabled": disabled,
+        "useContainerWidth": use_container_width,
+        "colors": colors,
+        "isDefault": is_default,
+        "ariaLabel": aria_label,
+        "debounceMs": debounce_ms,
+        "disableOnClick": disable_on_click,
+    }
+
+
+@functools.lru_cache(maxsize=_ARGS_CACHE_SIZE)
+def _encode_spec(spec: ButtonSpec) -> MappingProxyType:
+    """
+    Validate and encode a button configuration once.
+
+    Static buttons pass the same configuration on every rerun, so the icon
+    lookup and the args dict are built only the first time. Invalid
+    configurations raise and are not cached.
+    """
+    options = dict(zip(_SPEC_FIELDS, spec._values()))
+    if spec.colors is not None:
+        options["colors"] = dict(spec.colors)
+    return MappingProxyType(_button_args(**options))
+
+
 # Also export the raw function name for backward compatibility
 carbon_button_raw = carbon_button
 
 # Import Carbon icons from separate file
-from .carbon_icons import CarbonIcons  # noqa: E402
+from .carbon_icons import CarbonIcons, _available_icons  # noqa: E402
 
 # Make the function available at package level
-__all__ = ["carbon_button", "CarbonIcons"]
+__all__ = [
+    "carbon_button",
+    "carbon_button_group",
+    "carbon_icon_grid",
+    "render_buttons",
+    "session_state_stats",
+    "args_cache_stats",
+    "ButtonSpec",
+    "CarbonIcons",
+]
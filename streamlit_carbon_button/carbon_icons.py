@@ -4,287 +4,265 @@ Automatically generated from https://github.com/carbon-design-system/carbon
 
 Icons are from IBM Carbon Design System (Apache 2.0 License)
 https://carbondesignsystem.com/
+
+The SVG markup lives in the ``icons`` directory next to this module, one file
+per icon (``CarbonIcons.CHART_BAR`` is ``icons/chart_bar.svg``). Icons are read
+on first access and cached on the class, so an app only loads the icons it uses.
+``icons/index.json`` holds each icon's category and aliases for
+``CarbonIcons.search``.
 """
 
+import bisect
+import difflib
+import json
+import os
+import re
+from collections import Counter
+from collections.abc import Mapping
+
+_ICONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+_INDEX_FILE = os.path.join(_ICONS_DIR, "index.json")
+
+# How much a query word matching a name, alias or category word counts
+_NAME_WEIGHT = 3
+_ALIAS_WEIGHT = 2
+_CATEGORY_WEIGHT = 1
+
+# Terms sharing the most letter pairs with a misspelled word that fuzzy
+# matching compares it against, instead of the whole vocabulary
+_FUZZY_CANDIDATES = 30
+
+_icon_names = None
+_icon_registry = None
+_search_index = None
+
+
+def _available_icons() -> frozenset:
+    """Return the attribute names of all icons in the icon directory."""
+    global _icon_names
+    if _icon_names is None:
+        _icon_names = frozenset(
+            filename[: -len(".svg")].upper()
+            for filename in os.listdir(_ICONS_DIR)
+            if filename.endswith(".svg")
+        )
+    return _icon_names
+
+
+def _read_icon(name: str) -> str:
+    """Read the SVG markup for the icon attribute ``name`` from disk."""
+    path = os.path.join(_ICONS_DIR, f"{name.lower()}.svg")
+    with open(path, encoding="utf-8") as f:
+        return f.read().rstrip("\n")
+
+
+class _IconRegistry(Mapping):
+    """Read-only mapping of icon names to SVG markup, in name order."""
+
+    def __init__(self):
+        self._names = tuple(sorted(_available_icons()))
+
+    def __getitem__(self, name):
+        if name not in _available_icons():
+            raise KeyError(name)
+        # Loads the icon on first access and caches it on the class
+        return getattr(CarbonIcons, name)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in _available_icons()
+
+    def __repr__(self):
+        return f"<CarbonIcons registry of {len(self._names)} icons>"
+
+
+def _registry() -> _IconRegistry:
+    """Return the icon registry, built once per process."""
+    global _icon_registry
+    if _icon_registry is None:
+        _icon_registry = _IconRegistry()
+    return _icon_registry
+
+
+def _tokenize(text: str) -> list:
+    """Split a name, alias or query into lower-case words."""
+    return [word for word in re.split(r"[^a-z0-9]+", text.lower()) if word]
+
+
+def _letter_pairs(word: str) -> set:
+    """Return the adjacent letter pairs of ``word``, including its two ends."""
+    padded = f"^{word}$"
+    return {padded[i : i + 2] for i in range(len(padded) - 1)}
+
+
+class _SearchIndex:
+    """Sorted term list over icon names, aliases and categories."""
+
+    def __init__(self):
+        with open(_INDEX_FILE, encoding="utf-8") as f:
+            metadata = json.load(f)
+
+        weights = {}
+        for name in _available_icons():
+            entry = metadata.get(name.lower(), {})
+            terms = [(word, _NAME_WEIGHT) for word in _tokenize(name)]
+            for alias in entry.get("aliases", ()):
+                terms.extend((word, _ALIAS_WEIGHT) for word in _tokenize(alias))
+            terms.extend(
+                (word, _CATEGORY_WEIGHT)
+                for word in _tokenize(entry.get("category", ""))
+            )
+            for term, weight in terms:
+                weights[term, name] = max(weights.get((term, name), 0), weight)
+
+        postings = sorted(
+            (term, name, weight) for (term, name), weight in weights.items()
+        )
+        self.terms = [term for term, _, _ in postings]
+        self.postings = [(name, weight) for _, name, weight in postings]
+        self.vocabulary = sorted(set(self.terms))
+        self.pair_terms = {}
+        for term in self.vocabulary:
+            for pair in _letter_pairs(term):
+                self.pair_terms.setdefault(pair, []).append(term)
+
+    def matches(self, word: str, exact: bool = False) -> dict:
+        """Score icons with a term equal to, or starting with, ``word``."""
+        scores = {}
+        for i in range(bisect.bisect_left(self.terms, word), len(self.terms)):
+            term = self.terms[i]
+            if term != word and (exact or not term.startswith(word)):
+                break
+            name, weight = self.postings[i]
+            # Whole-word matches rank above prefix matches
+            score = weight * 2 if term == word else weight
+            scores[name] = max(scores.get(name, 0), score)
+        return scores
+
+    def fuzzy_matches(self, word: str) -> dict:
+        """
+        Score icons with a term close to ``word``, for typos.
+
+        Only the terms sharing the most letter pairs (counting the start and
+        end of the word) with ``word`` are compared, so the cost of a miss
+        does not grow with the vocabulary. A typo that shares no pair with
+        the intended term, or fewer than other terms do, is not corrected.
+        """
+        shared = Counter()
+        for pair in _letter_pairs(word):
+            shared.update(self.pair_terms.get(pair, ()))
+        candidates = [term for term, _ in shared.most_common(_FUZZY_CANDIDATES)]
+
+        scores = {}
+        for term in difflib.get_close_matches(word, candidates, n=5, cutoff=0.75):
+            for name, score in self.matches(term, exact=True).items():
+                scores[name] = max(scores.get(name, 0), score / 2)
+        return scores
+
+
+def _search(query: str, limit: int = 20) -> list:
+    """Rank icon names by how well they match every word of ``query``."""
+    global _search_index
+    # Search boxes such as st.text_input(value=None) start out as None
+    if query is None:
+        return []
+    if not isinstance(query, str):
+        raise TypeError(f"query must be a str, got {type(query).__name__}")
+    words = _tokenize(query)
+    if not words:
+        return []
+    if _search_index is None:
+        _search_index = _SearchIndex()
+
+    scores = None
+    for word in words:
+        matches = _search_index.matches(word) or _search_index.fuzzy_matches(word)
+        if scores is None:
+            scores = matches
+        else:
+            scores = {
+                name: scores[name] + s for name, s in matches.items() if name in scores
+            }
+        if not scores:
+            return []
+
+    # Prefer the icon named after the whole query, then shorter names
+    phrase = "_".join(words).upper()
+
+    def rank(name):
+        bonus = 10 if name == phrase else 5 if name.startswith(phrase) else 0
+        return (-(scores[name] + bonus), len(name), name)
+
+    ranked = sorted(scores, key=rank)
+    return ranked if limit is None else ranked[:limit]
+
+
+class _CarbonIconsMeta(type):
+    """Resolve ``CarbonIcons.NAME`` lazily from the icon directory."""
+
+    def __getattr__(cls, name):
+        # Only called when normal lookup fails, i.e. on the first access
+        if name not in _available_icons():
+            raise AttributeError(f"type object 'CarbonIcons' has no attribute '{name}'")
+        svg = _read_icon(name)
+        # Cache on the class so later lookups never reach __getattr__ again
+        setattr(cls, name, svg)
+        return svg
+
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | _available_icons())
+
+
+class CarbonIcons(metaclass=_CarbonIconsMeta):
+    """Pre-defined Carbon Design System icons (32x32)
+
+    Every icon is an upper-case attribute holding an SVG string, e.g.
+    ``CarbonIcons.SAVE``. ``CarbonIcons.INVISIBLE`` is an empty icon for
+    spacing text-only buttons.
+    """
+
+    @classmethod
+    def names(cls) -> tuple:
+        """Return the names of all icons, sorted, without loading any SVG."""
+        return _registry()._names
+
+    @classmethod
+    def all(cls) -> Mapping:
+        """
+        Return a read-only mapping of every icon name to its SVG markup.
+
+        The mapping is built once per process and iterates in name order. Use
+        it instead of reflecting over the class with ``inspect.getmembers``;
+        SVGs are read from disk only when their values are accessed.
+        """
+        return _registry()
+
+    @classmethod
+    def search(cls, query: str, limit: int = 20) -> list:
+        """
+        Find icons by name, alias or category without loading any SVG.
+
+        Every word of the query must match the start of a word in the icon's
+        name, aliases ("trash" finds DELETE) or category ("chart" finds the
+        Charts & Analytics icons); words with no such match are looked up
+        fuzzily to tolerate typos.
+
+        Parameters
+        ----------
+        query : str or None
+            Words to look for, such as "arrow left" or "zoom". An empty or
+            None query returns no icons
+        limit : int
+            Maximum number of names to return; None returns every match
 
-class CarbonIcons:
-    """Pre-defined Carbon Design System icons (32x32)"""
-
-    # Special invisible icon for spacing text-only buttons
-    INVISIBLE = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"></svg>'
-
-    UPLOAD = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M26 24v4H6v-4H4v4a2 2 0 0 0 2 2h20a2 2 0 0 0 2-2v-4z"/><path d="M6 12l1.41 1.41L15 5.83V24h2V5.83l7.59 7.58L26 12 16 2 6 12z"/></svg>'
-    DOWNLOAD = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M26 24v4H6v-4H4v4a2 2 0 0 0 2 2h20a2 2 0 0 0 2-2v-4z"/><path d="M26 14l-1.41-1.41L17 20.17V2h-2v18.17l-7.59-7.58L6 14l10 10l10-10z"/></svg>'
-    SAVE = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M27.71 9.29l-5-5A1 1 0 0 0 22 4H6a2 2 0 0 0-2 2v20a2 2 0 0 0 2 2h20a2 2 0 0 0 2-2V10a1 1 0 0 0-.29-.71zM12 6h8v6h-8zm8 20h-8v-8h8zm2 0v-8a2 2 0 0 0-2-2h-8a2 2 0 0 0-2 2v8H6V6h4v6a2 2 0 0 0 2 2h8a2 2 0 0 0 2-2V6.41l4 4V26z"/></svg>'
-    COPY = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M28 10v18H10V10h18m0-2H10a2 2 0 0 0-2 2v18a2 2 0 0 0 2 2h18a2 2 0 0 0 2-2V10a2 2 0 0 0-2-2z"/><path d="M4 18H2V4a2 2 0 0 1 2-2h14v2H4z"/></svg>'
-    DELETE = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M12 12h2v12h-2zm6 0h2v12h-2z"/><path d="M4 6v2h2v20a2 2 0 0 0 2 2h16a2 2 0 0 0 2-2V8h2V6zm4 22V8h16v20zm4-26h8v2h-8z"/></svg>'
-    ADD = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M17 15V8h-2v7H8v2h7v7h2v-7h7v-2z"/></svg>'
-    CLOSE = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M24 9.4L22.6 8 16 14.6 9.4 8 8 9.4 14.6 16 8 22.6 9.4 24 16 17.4 22.6 24 24 22.6 17.4 16 24 9.4z"/></svg>'
-    SETTINGS = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M27 16.76c0-.25 0-.5 0-.76s0-.51 0-.77l1.92-1.68A2 2 0 0 0 29.3 11L26.94 7a2 2 0 0 0-1.73-1 2 2 0 0 0-.64.1l-2.43.82a11.35 11.35 0 0 0-1.31-.75l-.51-2.52a2 2 0 0 0-2-1.61h-4.68a2 2 0 0 0-2 1.61l-.51 2.52a11.48 11.48 0 0 0-1.32.75l-2.38-.82A2 2 0 0 0 6.79 6a2 2 0 0 0-1.73 1L2.7 11a2 2 0 0 0 .41 2.51L5 15.24c0 .25 0 .5 0 .76s0 .51 0 .77l-1.92 1.68A2 2 0 0 0 2.7 21l2.36 4a2 2 0 0 0 1.73 1 2 2 0 0 0 .64-.1l2.43-.82a11.35 11.35 0 0 0 1.31.75l.51 2.52a2 2 0 0 0 2 1.61h4.72a2 2 0 0 0 2-1.61l.51-2.52a11.48 11.48 0 0 0 1.32-.75l2.42.82a2 2 0 0 0 .64.1 2 2 0 0 0 1.73-1l2.28-4a2 2 0 0 0-.41-2.51zM25.21 24l-3.43-1.16a8.86 8.86 0 0 1-2.71 1.57L18.36 28h-4.72l-.71-3.55a9.36 9.36 0 0 1-2.7-1.57L6.79 24l-2.36-4 2.72-2.4a8.9 8.9 0 0 1 0-3.13L4.43 12l2.36-4 3.43 1.16a8.86 8.86 0 0 1 2.71-1.57L13.64 4h4.72l.71 3.55a9.36 9.36 0 0 1 2.7 1.57L25.21 8l2.36 4-2.72 2.4a8.9 8.9 0 0 1 0 3.13L27.57 20z"/><path d="M16 22a6 6 0 1 1 6-6 6 6 0 0 1-6 6zm0-10a4 4 0 1 0 4 4 4 4 0 0 0-4-4z"/></svg>'
-    SEARCH = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M29 27.5858l-7.5521-7.5521a11.0177 11.0177 0 1 0-1.4142 1.4142L27.5858 29zM4 13a9 9 0 1 1 9 9 9.01 9.01 0 0 1-9-9z"/></svg>'
-    FILTER = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M2 7v2h28V7zm4 7h20v-2H6zm5 7h10v-2H11z"/></svg>'
-    CHART_BAR = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M27 25V6h-6v19H11V14H5v11H2v2h28v-2zM7 25V16h2v9zm6 0V8h6v17z"/></svg>'
-    DOCUMENT = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M25.7 9.3l-7-7c-.2-.2-.4-.3-.7-.3H8c-1.1 0-2 .9-2 2v24c0 1.1.9 2 2 2h16c1.1 0 2-.9 2-2V10c0-.3-.1-.5-.3-.7zM18 4.4l5.6 5.6H18V4.4zM24 28H8V4h8v6c0 1.1.9 2 2 2h6v16z"/><path d="M10 22h12v2H10zm0-6h12v2H10z"/></svg>'
-    PLAY = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M11 23a1 1 0 0 1-1-1V10a1 1 0 0 1 1.4473-.8945l12 6a1 1 0 0 1 0 1.789l-12 6A1.001 1.001 0 0 1 11 23zm1-11.3821v8.764L20.764 16z"/></svg>'
-    HELP = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16 2a14 14 0 1 0 14 14A14 14 0 0 0 16 2zm0 26a12 12 0 1 1 12-12 12 12 0 0 1-12 12z"/><path d="M17.5 23h-3v-2c0-2.1 1.6-3.1 2.9-3.9 1.2-.7 2.1-1.3 2.1-2.1 0-1.7-1.3-3-3-3-1.4 0-2.6 1-2.9 2.3L11.8 14c.5-2.3 2.5-4 4.7-4 2.8 0 5 2.2 5 5 0 2.1-1.6 3.1-2.9 3.9-1.2.7-2.1 1.3-2.1 2.1v2z"/><circle cx="16" cy="26.5" r="1.5"/></svg>'
-    WARNING = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16 2C8.3 2 2 8.3 2 16s6.3 14 14 14 14-6.3 14-14S23.7 2 16 2zm-1.1 6h2.2v11h-2.2V8zM16 25c-.8 0-1.5-.7-1.5-1.5S15.2 22 16 22s1.5.7 1.5 1.5S16.8 25 16 25z"/></svg>'
-    HOME = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16.612 2.214a1.01 1.01 0 0 0-1.242 0L1 13.419l1.243 1.572L4 13.621V26a2.004 2.004 0 0 0 2 2h20a2.004 2.004 0 0 0 2-2V13.63L29.757 15 31 13.428zM18 26h-4v-8h4zm2 0v-8a2.002 2.002 0 0 0-2-2h-4a2.002 2.002 0 0 0-2 2v8H6V12.062l10-7.79 10 7.8V26z"/></svg>'
-    INFO = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16 2a14 14 0 1 0 14 14A14 14 0 0 0 16 2zm0 26a12 12 0 1 1 12-12 12 12 0 0 1-12 12z"/><path d="M16 11a1.5 1.5 0 1 0 1.5-1.5A1.5 1.5 0 0 0 16 11zm-1.125 3h2.25v9h-2.25z"/></svg>'
-    SUCCESS = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><path d="M16 2a14 14 0 1 0 14 14A14 14 0 0 0 16 2zm0 26a12 12 0 1 1 12-12 12 12 0 0 1-12 12z"/><path d="M14 21.5l-5-5.6 1.6-1.4 3.4 3.9 7.4-8.9 1.6 1.3z"/></svg>'
-    EDIT = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><rect x="2" y="26" width="28" height="2"/><path d="M25.4,9c0.8-0.8,0.8-2,0-2.8c0,0,0,0,0,0l-3.6-3.6c-0.8-0.8-2-0.8-2.8,0c0,0,0,0,0,0l-15,15V24h6.4L25.4,9z M20.4,4L24,7.6l-3,3L17.4,7L20.4,4z M6,22v-3.6l10-10l3.6,3.6l-10,10H6z"/></svg>'
-
-    # Additional Carbon icons (auto-generated)
-    ICON_4K_FILLED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>4K--filled</title><path d="M28,6H4A2,2,0,0,0,2,8V24a2,2,0,0,0,2,2H28a2,2,0,0,0,2-2V8A2,2,0,0,0,28,6ZM14,21H12V17H8V11h2v4h2V11h2Zm10.19,0H22l-2.09-4.06L19,18.27V21H17V11h2v4.39L22,11h2.19l-3,4.38Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ICON_4K = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>4K</title><polygon points="12 11.03 12 15.03 10 15.03 10 11.03 8 11.03 8 17.03 12 17.03 12 21.03 14 21.03 14 11.03 12 11.03"/><polygon points="24.19 11.03 22 11.03 19 15.42 19 11.03 17 11.03 17 21.03 19 21.03 19 18.3 19.91 16.97 22 21.03 24.19 21.03 21.2 15.41 24.19 11.03"/><path d="M28,26H4a2,2,0,0,1-2-2V8A2,2,0,0,1,4,6H28a2,2,0,0,1,2,2V24A2,2,0,0,1,28,26ZM4,8V24H28V8Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    AI = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><polygon class="cls-2" points="17 11 20 11 20 21 17 21 17 23 25 23 25 21 22 21 22 11 25 11 25 9 17 9 17 11"/><path class="cls-2" d="m13,9h-4c-1.103,0-2,.897-2,2v12h2v-5h4v5h2v-12c0-1.103-.897-2-2-2Zm-4,7v-5h4v5h-4Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    API_1 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>API</title><path d="M8,9H4a2,2,0,0,0-2,2V23H4V18H8v5h2V11A2,2,0,0,0,8,9ZM4,16V11H8v5Z" transform="translate(0 0)"/><polygon points="22 11 25 11 25 21 22 21 22 23 30 23 30 21 27 21 27 11 30 11 30 9 22 9 22 11"/><path d="M14,23H12V9h6a2,2,0,0,1,2,2v5a2,2,0,0,1-2,2H14Zm0-7h4V11H14Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CAD = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>CAD</title><path d="M18,9H14a2,2,0,0,0-2,2V23h2V18h4v5h2V11A2,2,0,0,0,18,9Zm-4,7V11h4v5Z"/><path d="M26,23H22V9h4a4,4,0,0,1,4,4v6A4,4,0,0,1,26,23Zm-2-2h2a2,2,0,0,0,2-2V13a2,2,0,0,0-2-2H24Z"/><path d="M10,23H4a2,2,0,0,1-2-2V11A2,2,0,0,1,4,9h6v2H4V21h6Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CDA = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>CDA</title><path d="M28,9H24a2.002,2.002,0,0,0-2,2V23h2V18h4v5h2V11A2.0023,2.0023,0,0,0,28,9Zm-4,7V11h4v5Z"/><path d="M16,23H12V9h4a4.0042,4.0042,0,0,1,4,4v6A4.0039,4.0039,0,0,1,16,23Zm-2-2h2a2.0027,2.0027,0,0,0,2-2V13a2.0023,2.0023,0,0,0-2-2H14Z"/><path d="M10,23H4a2.0023,2.0023,0,0,1-2-2V11A2.002,2.002,0,0,1,4,9h6v2H4V21h6Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CSV = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>CSV</title><polygon points="28 9 26 22 24 9 22 9 24.516 23 27.484 23 30 9 28 9"/><path d="M18,23H12V21h6V17H14a2.002,2.002,0,0,1-2-2V11a2.002,2.002,0,0,1,2-2h6v2H14v4h4a2.002,2.002,0,0,1,2,2v4A2.002,2.002,0,0,1,18,23Z"/><path d="M10,23H4a2.0023,2.0023,0,0,1-2-2V11A2.002,2.002,0,0,1,4,9h6v2H4V21h6Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DOC = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>DOC</title><path d="M30,23H24a2.0023,2.0023,0,0,1-2-2V11a2.002,2.002,0,0,1,2-2h6v2H24V21h6Z"/><path d="M18,23H14a2.0023,2.0023,0,0,1-2-2V11a2.002,2.002,0,0,1,2-2h4a2.002,2.002,0,0,1,2,2V21A2.0023,2.0023,0,0,1,18,23ZM14,11V21h4V11Z"/><path d="M6,23H2V9H6a4.0045,4.0045,0,0,1,4,4v6A4.0045,4.0045,0,0,1,6,23ZM4,21H6a2.002,2.002,0,0,0,2-2V13a2.002,2.002,0,0,0-2-2H4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DVR = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>DVR</title><path d="M30,15V11a2,2,0,0,0-2-2H22V23h2V17h1.48l2.34,6H30l-2.33-6H28A2,2,0,0,0,30,15Zm-6-4h4v4H24Z"/><polygon points="18 9 16 22 14 9 12 9 14.52 23 17.48 23 20 9 18 9"/><path d="M6,23H2V9H6a4,4,0,0,1,4,4v6A4,4,0,0,1,6,23ZM4,21H6a2,2,0,0,0,2-2V13a2,2,0,0,0-2-2H4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    GIF = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>GIF</title><path d="M2,12v8a3,3,0,0,0,3,3h5V15H6v2H8v4H5a1,1,0,0,1-1-1V12a1,1,0,0,1,1-1h5V9H5A3,3,0,0,0,2,12Z"/><polygon points="30 11 30 9 22 9 22 23 24 23 24 17 29 17 29 15 24 15 24 11 30 11"/><polygon points="12 9 12 11 15 11 15 21 12 21 12 23 20 23 20 21 17 21 17 11 20 11 20 9 12 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    HD_FILLED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>HD--filled</title><path d="M22,13H20v6h2a1,1,0,0,0,1-1V14A1,1,0,0,0,22,13Z" transform="translate(0 0)"/><path d="M28,6H4A2,2,0,0,0,2,8V24a2,2,0,0,0,2,2H28a2,2,0,0,0,2-2V8A2,2,0,0,0,28,6ZM15,21H13V17H10v4H8V11h2v4h3V11h2Zm10-3a3,3,0,0,1-3,3H18V11h4a3,3,0,0,1,3,3Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    HD = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>HD</title><path d="M28,6H4A2,2,0,0,0,2,8V24a2,2,0,0,0,2,2H28a2,2,0,0,0,2-2V8A2,2,0,0,0,28,6ZM4,24V8H28V24Z"/><path d="M22,11H18V21h4a3,3,0,0,0,3-3V14A3,3,0,0,0,22,11Zm1,7a1,1,0,0,1-1,1H20V13h2a1,1,0,0,1,1,1Z"/><polygon points="13 11 13 15 10 15 10 11 8 11 8 21 10 21 10 17 13 17 13 21 15 21 15 11 13 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    HDR = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>HDR</title><path d="M30,15V11a2,2,0,0,0-2-2H22V23h2V17h1.48l2.34,6H30l-2.33-6H28A2,2,0,0,0,30,15Zm-6-4h4v4H24Z"/><path d="M16,23H12V9h4a4,4,0,0,1,4,4v6A4,4,0,0,1,16,23Zm-2-2h2a2,2,0,0,0,2-2V13a2,2,0,0,0-2-2H14Z"/><polygon points="8 9 8 15 4 15 4 9 2 9 2 23 4 23 4 17 8 17 8 23 10 23 10 9 8 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    HTML_REFERENCE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="4 20 4 22 8.586 22 2 28.586 3.414 30 10 23.414 10 28 12 28 12 20 4 20"/><polygon points="28 14 28 6 26 6 26 16 32 16 32 14 28 14"/><polygon points="24 6 22 6 20.5 10 19 6 17 6 17 16 19 16 19 9 20.5 13 22 9 22 16 24 16 24 6"/><polygon points="9 8 11 8 11 16 13 16 13 8 15 8 15 6 9 6 9 8"/><polygon points="5 6 5 10 2 10 2 6 0 6 0 16 2 16 2 12 5 12 5 16 7 16 7 6 5 6"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    HTML = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="28 19 28 11 26 11 26 21 32 21 32 19 28 19"/><polygon points="24 11 22 11 20.5 15 19 11 17 11 17 21 19 21 19 14 20.5 18 22 14 22 21 24 21 24 11"/><polygon points="9 13 11 13 11 21 13 21 13 13 15 13 15 11 9 11 9 13"/><polygon points="5 11 5 15 2 15 2 11 0 11 0 21 2 21 2 17 5 17 5 21 7 21 7 11 5 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    HTTP = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>HTTP</title><path d="M30,11H25V21h2V18h3a2.0027,2.0027,0,0,0,2-2V13A2.0023,2.0023,0,0,0,30,11Zm-3,5V13h3l.001,3Z" transform="translate(0 0)"/><polygon points="10 13 12 13 12 21 14 21 14 13 16 13 16 11 10 11 10 13"/><polygon points="23 11 17 11 17 13 19 13 19 21 21 21 21 13 23 13 23 11"/><polygon points="6 11 6 15 3 15 3 11 1 11 1 21 3 21 3 17 6 17 6 21 8 21 8 11 6 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    IP = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m19,23h-2v-14h6c1.103,0,2,.897,2,2v5c0,1.103-.897,2-2,2h-4v5Zm0-7h4v-5.0015h-4v5.0015Z"/><polygon class="cls-2" points="7 11 10 11 10 21 7 21 7 23 15 23 15 21 12 21 12 11 15 11 15 9 7 9 7 11"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    ISO_FILLED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>ISO--filled</title><rect x="21" y="13" width="3" height="6"/><path d="M28,6H4A2,2,0,0,0,2,8V24a2,2,0,0,0,2,2H28a2,2,0,0,0,2-2V8A2,2,0,0,0,28,6ZM8,21H6V11H8Zm9-8H12v2h3a2,2,0,0,1,2,2v2a2,2,0,0,1-2,2H10V19h5V17H12a2,2,0,0,1-2-2V13a2,2,0,0,1,2-2h5Zm9,6a2,2,0,0,1-2,2H21a2,2,0,0,1-2-2V13a2,2,0,0,1,2-2h3a2,2,0,0,1,2,2Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ISO_OUTLINE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>ISO--outline</title><path d="M24,21H21a2,2,0,0,1-2-2V13a2,2,0,0,1,2-2h3a2,2,0,0,1,2,2v6A2,2,0,0,1,24,21Zm-3-8v6h3V13Z"/><path d="M15,21H10V19h5V17H12a2,2,0,0,1-2-2V13a2,2,0,0,1,2-2h5v2H12v2h3a2,2,0,0,1,2,2v2A2,2,0,0,1,15,21Z"/><rect x="6" y="11" width="2" height="10"/><path d="M28,6H4A2,2,0,0,0,2,8V24a2,2,0,0,0,2,2H28a2,2,0,0,0,2-2V8A2,2,0,0,0,28,6ZM4,24V8H28V24Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ISO = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>ISO</title><path d="M28,23H24a2,2,0,0,1-2-2V11a2,2,0,0,1,2-2h4a2,2,0,0,1,2,2V21A2,2,0,0,1,28,23ZM24,11V21h4V11Z"/><path d="M18,23H12V21h6V17H14a2,2,0,0,1-2-2V11a2,2,0,0,1,2-2h6v2H14v4h4a2,2,0,0,1,2,2v4A2,2,0,0,1,18,23Z"/><polygon points="2 11 5 11 5 21 2 21 2 23 10 23 10 21 7 21 7 11 10 11 10 9 2 9 2 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    JPG = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>JPG</title><path d="M30,23H24a2,2,0,0,1-2-2V11a2,2,0,0,1,2-2h6v2H24V21h4V17H26V15h4Z"/><path d="M14,23H12V9h6a2,2,0,0,1,2,2v5a2,2,0,0,1-2,2H14Zm0-7h4V11H14Z"/><path d="M8,23H4a2,2,0,0,1-2-2V19H4v2H8V9h2V21A2,2,0,0,1,8,23Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    JSON_REFERENCE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="4 20 4 22 8.586 22 2 28.586 3.414 30 10 23.414 10 28 12 28 12 20 4 20"/><polygon points="29 12 27 6 25 6 25 16 27 16 27 10 29 16 31 16 31 6 29 6 29 12"/><path d="M21.3335,6h-2.667A1.6683,1.6683,0,0,0,17,7.6665v6.667A1.6684,1.6684,0,0,0,18.6665,16h2.667A1.6683,1.6683,0,0,0,23,14.3335V7.6665A1.6683,1.6683,0,0,0,21.3335,6ZM21,14H19V8h2Z"/><path d="M9,7.6665V10a2.002,2.002,0,0,0,2,2h2v2H9v2h4.3335A1.6683,1.6683,0,0,0,15,14.3335V12a2.002,2.002,0,0,0-2-2H11V8h4V6H10.6665A1.6683,1.6683,0,0,0,9,7.6665Z"/><path d="M5,14H3V12H1v2.3335A1.6684,1.6684,0,0,0,2.6665,16h2.667A1.6683,1.6683,0,0,0,7,14.3335V6H5Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    JSON = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>JSON</title><polygon points="31 11 31 21 29 21 27 15 27 21 25 21 25 11 27 11 29 17 29 11 31 11"/><path d="M21.3335,21h-2.667A1.6684,1.6684,0,0,1,17,19.3335v-6.667A1.6684,1.6684,0,0,1,18.6665,11h2.667A1.6684,1.6684,0,0,1,23,12.6665v6.667A1.6684,1.6684,0,0,1,21.3335,21ZM19,19h2V13H19Z"/><path d="M13.3335,21H9V19h4V17H11a2.002,2.002,0,0,1-2-2V12.6665A1.6684,1.6684,0,0,1,10.6665,11H15v2H11v2h2a2.002,2.002,0,0,1,2,2v2.3335A1.6684,1.6684,0,0,1,13.3335,21Z"/><path d="M5.3335,21H2.6665A1.6684,1.6684,0,0,1,1,19.3335V17H3v2H5V11H7v8.3335A1.6684,1.6684,0,0,1,5.3335,21Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    KEY = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><polygon class="cls-2" points="30 9 28.0001 9 26 16 24.0001 9 22 9 25 17.9996 25 23 27 23 27 18 27.0001 18 30 9"/><polygon class="cls-2" points="21 11 21 9 13 9 13 23 21 23 21 21 15 21 15 17 20 17 20 15 15 15 15 11 21 11"/><polygon class="cls-2" points="11 9 8.8941 9 5 15.5527 5 9 3 9 3 23 5 23 5 18.7062 5.9277 17.2208 8.8941 23 11 23 7.1093 15.4308 11 9"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32" transform="translate(32 32) rotate(180)"/></svg>'
-    MAC = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m30,23h-6c-1.103,0-2-.8975-2-2v-10c0-1.103.897-2,2-2h6v2h-6v10h6v2Z"/><path class="cls-2" d="m18,9h-4c-1.103,0-2,.897-2,2v12h2v-5h4v5h2v-12c0-1.103-.897-2-2-2Zm-4,7v-5h4v5h-4Z"/><polygon class="cls-2" points="8 9 6.4849 14 6 15.977 5.535 14 4 9 2 9 2 23 4 23 4 15 3.8415 13.0039 4.4212 15 6 19.6263 7.5788 15 8.1588 13 8 15 8 23 10 23 10 9 8 9"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    MOV = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>MOV</title><polygon points="28 9 26 22 24 9 22 9 24.52 23 27.48 23 30 9 28 9"/><path d="M18,23H14a2,2,0,0,1-2-2V11a2,2,0,0,1,2-2h4a2,2,0,0,1,2,2V21A2,2,0,0,1,18,23ZM14,11V21h4V11Z"/><polygon points="8 9 6.49 14 6 15.98 5.54 14 4 9 2 9 2 23 4 23 4 15 3.84 13 4.42 15 6 19.63 7.58 15 8.16 13 8 15 8 23 10 23 10 9 8 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    MP3 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>MP3</title><path d="M28,9H22v2h6v4H24v2h4v4H22v2h6a2,2,0,0,0,2-2V11A2,2,0,0,0,28,9Z"/><path d="M14,23H12V9h6a2,2,0,0,1,2,2v5a2,2,0,0,1-2,2H14Zm0-7h4V11H14Z"/><polygon points="8 9 6.49 14 6 15.98 5.54 14 4 9 2 9 2 23 4 23 4 15 3.84 13 4.42 15 6 19.63 7.58 15 8.16 13 8 15 8 23 10 23 10 9 8 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    MP4 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:#fff;}.cls-2{fill:none;}</style></defs><title>MP4</title><path d="M28,10v8h0V10m1-1H27v8H24V9H22V19h5v4h2V19h1V17H29V9Z"/><path d="M14,23H12V9h6a2,2,0,0,1,2,2v5a2,2,0,0,1-2,2H14Zm0-7h4V11H14Z"/><polygon points="8 9 6.49 14 6 15.98 5.54 14 4 9 2 9 2 23 4 23 4 15 3.84 13 4.42 15 6 19.63 7.58 15 8.16 13 8 15 8 23 10 23 10 9 8 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-2" width="32" height="32"/></svg>'
-    MPEG = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>MPEG</title><path d="M32,21H28a2.0023,2.0023,0,0,1-2-2V13a2.002,2.002,0,0,1,2-2h4v2H28v6h2V17H29l0-2h3Z"/><polygon points="24 13 24 11.024 18 11.024 18 21 24 21 24 19 20 19 20 17 22 17 22 15 20 15 20 13 24 13"/><path d="M14,11H9V21h2V18h3a2.0027,2.0027,0,0,0,2-2V13A2.0023,2.0023,0,0,0,14,11Zm-3,5V13h3l.001,3Z"/><polygon points="7 11 5 11 3.5 15 2 11 0 11 0 21 2 21 2 14 3.5 18 5 14 5 21 7 21 7 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    MPG2 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>MPG2</title><path d="M32,21H26V17a2.002,2.002,0,0,1,2-2h2V13H26V11h4a2.0023,2.0023,0,0,1,2,2v2a2.0023,2.0023,0,0,1-2,2H28v2h4Z"/><path d="M24,21H20a2.0023,2.0023,0,0,1-2-2V13a2.002,2.002,0,0,1,2-2h4v2H20v6h2V17H21l0-2h3Z"/><path d="M14,11H9V21h2V18h3a2.0027,2.0027,0,0,0,2-2V13A2.0023,2.0023,0,0,0,14,11Zm-3,5V13h3l.001,3Z"/><polygon points="7 11 5 11 3.5 15 2 11 0 11 0 21 2 21 2 14 3.5 18 5 14 5 21 7 21 7 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    PDF_REFERENCE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="4 20 4 22 8.586 22 2 28.586 3.414 30 10 23.414 10 28 12 28 12 20 4 20"/><polygon points="22 16 24 16 24 10 29 10 29 8 24 8 24 4 30 4 30 2 22 2 22 16"/><path d="M16,2H12V16h4a4,4,0,0,0,4-4V6A4,4,0,0,0,16,2Zm2,10a2,2,0,0,1-2,2H14V4h2a2,2,0,0,1,2,2Z"/><path d="M8,2H2V16H4V11H8a2,2,0,0,0,2-2V4A2,2,0,0,0,8,2ZM8,9H4V4H8Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    PDF = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>PDF</title><polygon points="30 11 30 9 22 9 22 23 24 23 24 17 29 17 29 15 24 15 24 11 30 11"/><path d="M8,9H2V23H4V18H8a2,2,0,0,0,2-2V11A2,2,0,0,0,8,9Zm0,7H4V11H8Z"/><path d="M16,23H12V9h4a4,4,0,0,1,4,4v6A4,4,0,0,1,16,23Zm-2-2h2a2,2,0,0,0,2-2V13a2,2,0,0,0-2-2H14Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    PNG = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>PNG</title><path d="M30,23H24a2,2,0,0,1-2-2V11a2,2,0,0,1,2-2h6v2H24V21h4V17H26V15h4Z" transform="translate(0 0)"/><polygon points="18 19 14.32 9 12 9 12 23 14 23 14 13 17.68 23 20 23 20 9 18 9 18 19"/><path d="M4,23H2V9H8a2,2,0,0,1,2,2v5a2,2,0,0,1-2,2H4Zm0-7H8V11H4Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    PPT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>PPT</title><polygon points="22 11 25 11 25 23 27 23 27 11 30 11 30 9 22 9 22 11"/><path d="M14,23H12V9h6a2.002,2.002,0,0,1,2,2v5a2.002,2.002,0,0,1-2,2H14Zm0-7h4V10.9985H14Z"/><path d="M4,23H2V9H8a2.002,2.002,0,0,1,2,2v5a2.002,2.002,0,0,1-2,2H4Zm0-7H8V10.9985H4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    RAG = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m12,28h-2c-3.8599,0-7-3.1401-7-7v-2h2v2c0,2.7568,2.2432,5,5,5h2v2Z"/><path class="cls-2" d="m28,19h-9c-1.104.0014-1.9986.896-2,2v5c0,1.1046.8954,2,2,2h3v-2h-3v-5h9v5h-2.5352l-2.5937,3.8906,1.6641,1.1094,2-3h1.4648c1.1046,0,2-.8954,2-2v-5c-.0014-1.104-.896-1.9986-2-2Z"/><path class="cls-2" d="m29,15v-4c0-3.8599-3.1401-7-7-7h-3v2h3c2.7568,0,5,2.2432,5,5v4h2Z"/><rect class="cls-2" x="6" y="10" width="3" height="2"/><path class="cls-2" d="m12.606,6.4355l-2.5251-3.6855c-.3821-.4766-.9512-.75-1.5615-.75h-4.5193c-1.1028,0-2,.8975-2,2v10c0,1.1025.8972,2,2,2h7c1.1028,0,2-.8975,2-2v-6.375c0-.4526-.1558-.8965-.394-1.1895Zm-8.606,7.5645V4h4v3c0,.5522.4478,1,1,1h2v6h-7Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    RAW = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>RAW</title><polygon points="29.2 9 28.86 17 28.6 21.54 28.19 18 27.51 12.54 25.49 12.54 24.81 18 24.4 21.54 24.14 17 23.8 9 22 9 23 23 25.27 23 26.03 18.07 26.49 14 26.5 13.97 26.51 14 26.97 18.07 27.73 23 30 23 31 9 29.2 9"/><path d="M18,9H14a2,2,0,0,0-2,2V23h2V18h4v5h2V11A2,2,0,0,0,18,9Zm-4,7V11h4v5Z"/><path d="M10,15V11A2,2,0,0,0,8,9H2V23H4V17H5.48l2.34,6H10L7.63,17H8A2,2,0,0,0,10,15ZM4,11H8v4H4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SDK = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>SDK</title><polygon points="30 9 27.9 9 24 15.6 24 9 22 9 22 23 24 23 24 18.7 24.9 17.2 27.9 23 30 23 26.1 15.4 30 9"/><path d="M16,23H12V9h4a4.0118,4.0118,0,0,1,4,4v6A4.0118,4.0118,0,0,1,16,23Zm-2-2h2a2.0059,2.0059,0,0,0,2-2V13a2.0059,2.0059,0,0,0-2-2H14Z"/><path d="M8,23H2V21H8V17H4a2.0059,2.0059,0,0,1-2-2V11A2.0059,2.0059,0,0,1,4,9h6v2H4v4H8a2.0059,2.0059,0,0,1,2,2v4A2.0059,2.0059,0,0,1,8,23Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SLM = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 26.5.0, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><polygon points="28,9 26.5,14 26,16 25.5,14 24,9 22,9 22,23 24,23 24,15 23.8,13 24.4,15 26,19.6 27.6,15 28.2,13 28,15 28,23 30,23 30,9 "/><polygon points="14,21 14,9 12,9 12,23 20,23 20,21 "/><path d="M8,23H2v-2h6v-4H4c-1.1,0-2-0.9-2-2v-4c0-1.1,0.9-2,2-2h6v2H4v4h4c1.1,0,2,0.9,2,2v4C10,22.1,9.1,23,8,23z"/><rect id="_x3C_Transparent_Rectangle_x3E__363_" class="st0" width="32" height="32"/></svg>'
-    SQL = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>SQL</title><polygon points="24 21 24 9 22 9 22 23 30 23 30 21 24 21"/><path d="M18,9H14a2,2,0,0,0-2,2V21a2,2,0,0,0,2,2h1v2a2,2,0,0,0,2,2h2V25H17V23h1a2,2,0,0,0,2-2V11A2,2,0,0,0,18,9ZM14,21V11h4V21Z"/><path d="M8,23H2V21H8V17H4a2,2,0,0,1-2-2V11A2,2,0,0,1,4,9h6v2H4v4H8a2,2,0,0,1,2,2v4A2,2,0,0,1,8,23Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SVG = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>SVG</title><path d="M30,23H24a2,2,0,0,1-2-2V11a2,2,0,0,1,2-2h6v2H24V21h4V17H26V15h4Z" transform="translate(0 0)"/><polygon points="18 9 16 22 14 9 12 9 14.52 23 17.48 23 20 9 18 9"/><path d="M8,23H2V21H8V17H4a2,2,0,0,1-2-2V11A2,2,0,0,1,4,9h6v2H4v4H8a2,2,0,0,1,2,2v4A2,2,0,0,1,8,23Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32" transform="translate(32 32) rotate(-180)"/></svg>'
-    TIF = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>TIF</title><polygon points="30 11 30 9 22 9 22 23 24 23 24 17 29 17 29 15 24 15 24 11 30 11"/><polygon points="12 11 15 11 15 21 12 21 12 23 20 23 20 21 17 21 17 11 20 11 20 9 12 9 12 11"/><polygon points="2 11 5 11 5 23 7 23 7 11 10 11 10 9 2 9 2 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TSV = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>TSV</title><polygon points="28 9 26 22 24 9 22 9 24.516 23 27.484 23 30 9 28 9"/><path d="M18,23H12V21h6V17H14a2.002,2.002,0,0,1-2-2V11a2.002,2.002,0,0,1,2-2h6v2H14v4h4a2.002,2.002,0,0,1,2,2v4A2.002,2.002,0,0,1,18,23Z"/><polygon points="2 11 5 11 5 23 7 23 7 11 10 11 10 9 2 9 2 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TXT_REFERENCE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="4 20 4 22 8.586 22 2 28.586 3.414 30 10 23.414 10 28 12 28 12 20 4 20"/><polygon points="21 4 24 4 24 16 26 16 26 4 29 4 29 2 21 2 21 4"/><polygon points="20 2 18 2 16 8 14 2 12 2 14.752 9 12 16 14 16 16 10 18 16 20 16 17.245 9 20 2"/><polygon points="3 4 6 4 6 16 8 16 8 4 11 4 11 2 3 2 3 4"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TXT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>TXT</title><polygon points="21 11 24 11 24 23 26 23 26 11 29 11 29 9 21 9 21 11"/><polygon points="20 9 18 9 16 15 14 9 12 9 14.75 16 12 23 14 23 16 17 18 23 20 23 17.25 16 20 9"/><polygon points="3 11 6 11 6 23 8 23 8 11 11 11 11 9 3 9 3 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    URL = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><polygon class="cls-2" points="24 21 24 9 22 9 22 23 30 23 30 21 24 21"/><path class="cls-2" d="m20,15v-4c0-1.103-.8975-2-2-2h-6v14h2v-6h1.4807l2.3345,6h2.1453l-2.3331-6h.3726c1.1025,0,2-.8975,2-2Zm-6-4h4v4h-4v-4Z"/><path class="cls-2" d="m8,23h-4c-1.103,0-2-.8975-2-2v-12h2v12h4v-12h2v12c0,1.1025-.897,2-2,2Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    USB = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>USB</title><path d="M24,15V6a2,2,0,0,0-2-2H10A2,2,0,0,0,8,6v9a2,2,0,0,0-2,2V28H8V17H24V28h2V17A2,2,0,0,0,24,15ZM10,6H22v9H10Z" transform="translate(0 0)"/><rect x="12" y="10" width="3" height="2"/><rect x="17" y="10" width="3" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    VPN = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>VPN</title><path d="M14,23H12V9h6a2,2,0,0,1,2,2v5a2,2,0,0,1-2,2H14Zm0-7h4V11H14Z" transform="translate(0 0)"/><polygon points="28 19 24.32 9 22 9 22 23 24 23 24 13 27.68 23 30 23 30 9 28 9 28 19"/><polygon points="8 9 6 22 4 9 2 9 4.52 23 7.48 23 10 9 8 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32" transform="translate(32 32) rotate(-180)"/></svg>'
-    WMV = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>WMV</title><polygon points="29 9 27 22 25 9 23 9 25.52 23 28.48 23 31 9 29 9"/><polygon points="19 9 17.48 14 17 15.98 16.54 14 15 9 13 9 13 23 15 23 15 15 14.84 13 15.42 15 17 19.63 18.58 15 19.16 13 19 15 19 23 21 23 21 9 19 9"/><polygon points="9.2 9 8.86 17 8.6 21.54 8.19 18 7.51 12.54 5.49 12.54 4.81 18 4.4 21.54 4.14 17 3.8 9 2 9 3 23 5.27 23 6.03 18.07 6.49 14 6.5 13.97 6.51 14 6.97 18.07 7.73 23 10 23 11 9 9.2 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    XLS = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>XLS</title><path d="M28,23H22V21h6V17H24a2.002,2.002,0,0,1-2-2V11a2.002,2.002,0,0,1,2-2h6v2H24v4h4a2.002,2.002,0,0,1,2,2v4A2.0023,2.0023,0,0,1,28,23Z"/><polygon points="14 21 14 9 12 9 12 23 20 23 20 21 14 21"/><polygon points="10 9 8 9 6 15 4 9 2 9 4.752 16 2 23 4 23 6 17 8 23 10 23 7.245 16 10 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    XML = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>XML</title><polygon points="24 21 24 9 22 9 22 23 30 23 30 21 24 21"/><polygon points="18 9 16.48 14 16 15.98 15.54 14 14 9 12 9 12 23 14 23 14 15 13.84 13 14.42 15 16 19.63 17.58 15 18.16 13 18 15 18 23 20 23 20 9 18 9"/><polygon points="10 9 8 9 6 15 4 9 2 9 4.75 16 2 23 4 23 6 17 8 23 10 23 7.25 16 10 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ZIP_REFERENCE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="4 20 4 22 8.586 22 2 28.586 3.414 30 10 23.414 10 28 12 28 12 20 4 20"/><path d="M28,2H22V16h2V11h4a2,2,0,0,0,2-2V4A2,2,0,0,0,28,2Zm0,7H24V4h4Z"/><polygon points="12 4 15 4 15 14 12 14 12 16 20 16 20 14 17 14 17 4 20 4 20 2 12 2 12 4"/><polygon points="2 4 8 4 2 14 2 16 10 16 10 14 4 14 10 4 10 2 2 2 2 4"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ZIP = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>ZIP</title><path d="M28,9H22V23h2V18h4a2,2,0,0,0,2-2V11A2,2,0,0,0,28,9Zm0,7H24V11h4Z"/><polygon points="12 9 12 11 15 11 15 21 12 21 12 23 20 23 20 21 17 21 17 11 20 11 20 9 12 9"/><polygon points="10 9 2 9 2 11 8 11 2 21 2 23 10 23 10 21 4 21 10 11 10 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCEPT_ACTION_USAGE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m23.0022,11.0323l-15.0022-.0323,6.9985,5-6.9956,5h14.9971c.5523,0,1-.4477,1-1v-7.9677c0-.5514-.4464-.9988-.9978-1Z"/><path class="cls-2" d="m21,30h-10c-4.9626,0-9-4.0374-9-9v-10C2,6.0374,6.0374,2,11,2h10c4.9626,0,9,4.0374,9,9v10c0,4.9626-4.0374,9-9,9ZM11,4c-3.8599,0-7,3.1401-7,7v10c0,3.8599,3.1401,7,7,7h10c3.8599,0,7-3.1401,7-7v-10c0-3.8599-3.1401-7-7-7h-10Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCESSIBILITY_ALT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>accessibility--alt</title><polygon points="23 14 23 12 9 12 9 14 14 14 14 16.734 10.132 23.504 11.868 24.496 15.58 18 16.42 18 20.132 24.496 21.868 23.504 18 16.734 18 14 23 14"/><circle cx="16" cy="9" r="2"/><path d="M16,30A14,14,0,1,1,30,16,14.0158,14.0158,0,0,1,16,30ZM16,4A12,12,0,1,0,28,16,12.0137,12.0137,0,0,0,16,4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCESSIBILITY_COLOR_FILLED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>accessibility--color--filled</title><path d="M16,10a8.5975,8.5975,0,0,0-7.9648,6A8.5975,8.5975,0,0,0,16,22a8.5975,8.5975,0,0,0,7.9648-6A8.5975,8.5975,0,0,0,16,10Zm0,10a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,16,20Z"/><path d="M16,2A14,14,0,1,0,30,16,14,14,0,0,0,16,2Zm0,22a10.6543,10.6543,0,0,1-9.97-7.7578L5.9692,16l.0606-.2422A10.6543,10.6543,0,0,1,16,8a10.6543,10.6543,0,0,1,9.97,7.7578L26.0308,16l-.0606.2422A10.6543,10.6543,0,0,1,16,24Z"/><circle cx="16" cy="16" r="2"/><path id="inner-path_2" data-name="inner-path 2" class="cls-1" d="M16,20a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,16,20Zm0-6a2,2,0,1,0,2,2A2.0021,2.0021,0,0,0,16,14Z"/><path id="inner-path_1" data-name="inner-path 1" class="cls-1" d="M16,24a10.6547,10.6547,0,0,1-9.97-7.7576L5.9692,16l.0606-.2424A10.6547,10.6547,0,0,1,16,8a10.6547,10.6547,0,0,1,9.97,7.7576L26.0308,16l-.0606.2424A10.6547,10.6547,0,0,1,16,24ZM8.0352,16A8.5975,8.5975,0,0,0,16,22a8.5975,8.5975,0,0,0,7.9648-6A8.5975,8.5975,0,0,0,16,10,8.5975,8.5975,0,0,0,8.0352,16Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCESSIBILITY_COLOR = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>accessibility--color</title><path d="M16,20a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,16,20Zm0-6a2,2,0,1,0,2,2A2.0021,2.0021,0,0,0,16,14Z"/><path d="M16,24a10.6547,10.6547,0,0,1-9.97-7.7576L5.9692,16l.0606-.2424A10.6547,10.6547,0,0,1,16,8a10.6547,10.6547,0,0,1,9.97,7.7576L26.0308,16l-.0606.2424A10.6547,10.6547,0,0,1,16,24ZM8.0352,16A8.5975,8.5975,0,0,0,16,22a8.5975,8.5975,0,0,0,7.9648-6A8.5975,8.5975,0,0,0,16,10,8.5975,8.5975,0,0,0,8.0352,16Z"/><path d="M16,30A14,14,0,1,1,30,16,14.0158,14.0158,0,0,1,16,30ZM16,4A12,12,0,1,0,28,16,12.0137,12.0137,0,0,0,16,4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCESSIBILITY = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>accessibility</title><path d="M29.55,26.11,26.5,27.63,23.66,21H15a2,2,0,0,1-2-2V13a2,2,0,0,1,4,0v4h7V15H19V13a4,4,0,0,0-8,0v1a9,9,0,1,0,8.77,11H17.71A7,7,0,1,1,11,16v3a4,4,0,0,0,4,4h7.34l3.16,7.37,4.95-2.48Z"/><path d="M15.5,8A3.5,3.5,0,1,1,19,4.5,3.5,3.5,0,0,1,15.5,8Zm0-5A1.5,1.5,0,1,0,17,4.5,1.5,1.5,0,0,0,15.5,3Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCOUNT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>account</title><path d="M8,14H19v2H8Zm0,5H21v2H8Z"/><path d="M28,4H4A2,2,0,0,0,2,6V26a2,2,0,0,0,2,2H28a2,2,0,0,0,2-2V6A2,2,0,0,0,28,4Zm0,2V8H4V6ZM4,26V10H28V26Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCUMULATION_ICE = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="22 8 22 16 23 18 24 16 24 8 22 8"/><polygon points="18 8 18 18 19 20 20 18 20 8 18 8"/><path d="M28,4a2.0023,2.0023,0,0,0-2,2V26H6V22h4V20H6V16h4V14H6V10h8v4l1,2,1-2V8H6V6A2.0023,2.0023,0,0,0,4,4H2V6H4V26a2.0023,2.0023,0,0,0,2,2H26a2.0023,2.0023,0,0,0,2-2V6h2V4Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCUMULATION_PRECIPITATION = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><rect x="16" y="16" width="2" height="2"/><rect x="18" y="18" width="2" height="2"/><rect x="20" y="20" width="2" height="2"/><rect x="20" y="16" width="2" height="2"/><rect x="16" y="20" width="2" height="2"/><path d="M20,12a3.8978,3.8978,0,0,1-4-3.777,3.9017,3.9017,0,0,1,.6533-2.0639L19.17,2.4141a1.0381,1.0381,0,0,1,1.6592,0L23.3154,6.11A3.9693,3.9693,0,0,1,24,8.223,3.8978,3.8978,0,0,1,20,12Zm0-7.2368L18.3438,7.2257A1.89,1.89,0,0,0,18,8.223,1.9,1.9,0,0,0,20,10a1.9,1.9,0,0,0,2-1.777,1.98,1.98,0,0,0-.375-1.0466Z" transform="translate(0 0)"/><path d="M28,4a2.0023,2.0023,0,0,0-2,2V26H6V10H8v8l1,2,1-2V10h2v4l1,2,1-2V8H6V6A2.0023,2.0023,0,0,0,4,4H2V6H4V26a2.0023,2.0023,0,0,0,2,2H26a2.0023,2.0023,0,0,0,2-2V6h2V4Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCUMULATION_RAIN = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M28,4a2.0023,2.0023,0,0,0-2,2V8H24a3.4376,3.4376,0,0,1-3.0513-2.3164A1.007,1.007,0,0,0,20,5a.9894.9894,0,0,0-.9468.6787A3.44,3.44,0,0,1,16,8a3.4376,3.4376,0,0,1-3.0513-2.3164A1.007,1.007,0,0,0,12,5a.971.971,0,0,0-.9468.6787A3.44,3.44,0,0,1,8,8H6V6A2.0023,2.0023,0,0,0,4,4H2V6H4V26a2.0023,2.0023,0,0,0,2,2H26a2.0023,2.0023,0,0,0,2-2V6h2V4ZM6,26V22h4V20H6V16h4V14H6V10H8a4.9316,4.9316,0,0,0,4-1.9873,5.0192,5.0192,0,0,0,8,0A4.9316,4.9316,0,0,0,24,10h2V26Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACCUMULATION_SNOW = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><rect x="12" y="2" width="2" height="2"/><rect x="14" y="4" width="2" height="2"/><rect x="16" y="6" width="2" height="2"/><rect x="16" y="2" width="2" height="2"/><rect x="12" y="6" width="2" height="2"/><rect x="14" y="18" width="2" height="2"/><rect x="16" y="20" width="2" height="2"/><rect x="18" y="22" width="2" height="2"/><rect x="18" y="18" width="2" height="2"/><rect x="14" y="22" width="2" height="2"/><rect x="18" y="10" width="2" height="2"/><rect x="20" y="12" width="2" height="2"/><rect x="22" y="14" width="2" height="2"/><rect x="22" y="10" width="2" height="2"/><rect x="18" y="14" width="2" height="2"/><path d="M28,4a2.0023,2.0023,0,0,0-2,2V26H6V22h4V20H6V16h4V14H6V10h4V8H6V6A2.0023,2.0023,0,0,0,4,4H2V6H4V26a2.0023,2.0023,0,0,0,2,2H26a2.0023,2.0023,0,0,0,2-2V6h2V4Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACTION_DEFINITION = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m17.98,17.4922c0-2.8734,1.4971-4.68,4.1466-4.68,1.8067,0,2.9939.8603,3.5272,2.2712l-1.8067.8087c-.2065-.7571-.7743-1.3076-1.7206-1.3076-1.2215,0-1.841.8602-1.841,2.1162v1.6345c0,1.2561.6194,2.0992,1.841,2.0992,1.0496,0,1.5657-.6023,1.8927-1.411l1.686.8087c-.5849,1.5829-1.841,2.3744-3.5788,2.3744-2.6496,0-4.1466-1.8238-4.1466-4.7144Z"/><path class="cls-2" d="m14.623,22.0001l-.9635-3.0626h-4.267l-.9465,3.0626h-2.3055l4.026-12.0096h2.8217l3.9917,12.0096h-2.357Zm-3.0627-9.9449h-.0861l-1.5311,4.9381h3.1659l-1.5486-4.9381Z"/><path class="cls-2" d="m28,30H4c-1.1046,0-2-.8954-2-2V4c0-1.1046.8954-2,2-2h24c1.1046,0,2,.8954,2,2v24c0,1.1046-.8954,2-2,2Zm-24-2h24V4H4v24Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACTION_USAGE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m17.98,17.4921c0-2.8734,1.4971-4.68,4.1466-4.68,1.8067,0,2.9939.8603,3.5272,2.2712l-1.8067.8087c-.2065-.7571-.7743-1.3076-1.7206-1.3076-1.2215,0-1.841.8602-1.841,2.1162v1.6345c0,1.2561.6194,2.0992,1.841,2.0992,1.0496,0,1.5657-.6023,1.8927-1.411l1.686.8087c-.5849,1.5829-1.841,2.3744-3.5788,2.3744-2.6496,0-4.1466-1.8238-4.1466-4.7144Z"/><path class="cls-2" d="m14.623,22l-.9635-3.0626h-4.267l-.9465,3.0626h-2.3055l4.026-12.0096h2.8217l3.9917,12.0096h-2.357Zm-3.0627-9.9449h-.0861l-1.5311,4.9381h3.1659l-1.5486-4.9381Z"/><path class="cls-2" d="m21,30h-10c-4.9626,0-9-4.0374-9-9v-10C2,6.0374,6.0374,2,11,2h10c4.9626,0,9,4.0374,9,9v10c0,4.9626-4.0374,9-9,9ZM11,4c-3.8599,0-7,3.1401-7,7v10c0,3.8599,3.1401,7,7,7h10c3.8599,0,7-3.1401,7-7v-10c0-3.8599-3.1401-7-7-7h-10Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    ACTIVITY = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>activity</title><path d="M12,29a1,1,0,0,1-.92-.62L6.33,17H2V15H7a1,1,0,0,1,.92.62L12,25.28,20.06,3.65A1,1,0,0,1,21,3a1,1,0,0,1,.93.68L25.72,15H30v2H25a1,1,0,0,1-.95-.68L21,7,12.94,28.35A1,1,0,0,1,12,29Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ADD_ALT = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><path d="M16,4c6.6,0,12,5.4,12,12s-5.4,12-12,12S4,22.6,4,16S9.4,4,16,4 M16,2C8.3,2,2,8.3,2,16s6.3,14,14,14s14-6.3,14-14 S23.7,2,16,2z"/><polygon points="24,15 17,15 17,8 15,8 15,15 8,15 8,17 15,17 15,24 17,24 17,17 24,17 "/><rect id="_Transparent_Rectangle_" class="st0" width="32" height="32"/></svg>'
-    ADD_CHILD_NODE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M10,20v-8.1c2.28-.46,4-2.48,4-4.9,0-2.76-2.24-5-5-5s-5,2.24-5,5c0,2.41,1.72,4.43,4,4.9v8.1c0,3.31,2.69,6,6,6h1v-2h-1c-2.21,0-4-1.79-4-4ZM6,7c0-1.65,1.35-3,3-3s3,1.35,3,3-1.35,3-3,3-3-1.35-3-3ZM28,24v2h-4v4h-2v-4h-4v-2h4v-4h2v4h4Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    ADD_FILLED = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: #fff; fill-opacity: 0; } .cls-2 { fill: none; } </style></defs><title>add--filled</title><path d="M16,2A14.1725,14.1725,0,0,0,2,16,14.1725,14.1725,0,0,0,16,30,14.1725,14.1725,0,0,0,30,16,14.1725,14.1725,0,0,0,16,2Zm8,15H17v7H15V17H8V15h7V8h2v7h7Z" transform="translate(0 0)"/><polygon id="inner-path" class="cls-1" points="24 17 17 17 17 24 15 24 15 17 8 17 8 15 15 15 15 8 17 8 17 15 24 15 24 17"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-2" width="32" height="32"/></svg>'
-    ADD_LARGE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="17 15 17 5 15 5 15 15 5 15 5 17 15 17 15 27 17 27 17 17 27 17 27 15 17 15"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    ADD_PARENT_NODE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M8,8h-4v-2h4V2h2v4h4v2h-4v4h-2v-4ZM28,25c0,2.76-2.24,5-5,5-2.42,0-4.44-1.72-4.9-4h-4.1c-3.31,0-6-2.69-6-6v-5h2v5c0,2.21,1.79,4,4,4h4.1c.47-2.28,2.49-4,4.9-4,2.76,0,5,2.24,5,5ZM26,25c0-1.65-1.35-3-3-3s-3,1.35-3,3,1.35,3,3,3,3-1.35,3-3Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    ADD_COMMENT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>add-comment</title><path d="M17.74,30,16,29l4-7h6a2,2,0,0,0,2-2V8a2,2,0,0,0-2-2H6A2,2,0,0,0,4,8V20a2,2,0,0,0,2,2h9v2H6a4,4,0,0,1-4-4V8A4,4,0,0,1,6,4H26a4,4,0,0,1,4,4V20a4,4,0,0,1-4,4H21.16Z" transform="translate(0 0)"/><polygon points="17 9 15 9 15 13 11 13 11 15 15 15 15 19 17 19 17 15 21 15 21 13 17 13 17 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ADD = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><polygon points="17,15 17,8 15,8 15,15 8,15 8,17 15,17 15,24 17,24 17,17 24,17 24,15 "/><rect class="st0" width="32" height="32"/></svg>'
-    AGRICULTURE_ANALYTICS = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M24.251,21.3691l2.1943,1.4629A1,1,0,0,0,27.8,22.6l3-4-1.6-1.2-2.4326,3.2437L24.5547,19.168a1,1,0,0,0-1.3687.2509L20,23.8789V16H18V26a2.0023,2.0023,0,0,0,2,2H30V26H20.9434Z" transform="translate(0 0)"/><rect x="2" y="21" width="14" height="2"/><rect x="2" y="26" width="14" height="2"/><path d="M11,16V11h1a4.0046,4.0046,0,0,0,4-4V4H13a3.9782,3.9782,0,0,0-2.7468,1.1066A6.0033,6.0033,0,0,0,5,2H2V5a6.0066,6.0066,0,0,0,6,6H9v5H2v2H16V16ZM13,6h1V7a2.002,2.002,0,0,1-2,2H11V8A2.0019,2.0019,0,0,1,13,6ZM8,9A4.0046,4.0046,0,0,1,4,5V4H5A4.0045,4.0045,0,0,1,9,8V9Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    AI_BUSINESS_IMPACT_ASSESSMENT = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><rect x="24" y="23" width="2" height="8"/><rect x="28" y="21" width="2" height="10"/><rect x="20" y="27" width="2" height="4"/><path d="M18,20v-2h1v-7h-1v-2h4v2h-1v7h1v2h-4Z"/><path d="M14.5005,20h2l-3.5005-11h-3l-3.4966,11h1.9988l.6018-2h4.7781l.6184,2ZM9.7058,16l1.6284-5.4111.2559-.0024,1.6736,5.4136h-3.5579Z"/><polygon points="17 30 0 30 0 0 30 0 30 17 28 17 28 2 2 2 2 28 17 28 17 30"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" x="0" width="32" height="32"/></svg>'
-    AI_FINANCIAL_SUSTAINABILITY_CHECK = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><polygon class="cls-2" points="16 23.4142 11.293 18.7072 12.707 17.2928 16 20.5858 27.293 9.2928 28.707 10.7072 16 23.4142"/><path class="cls-2" d="m12.707,8.7073l-1.4141-1.4141-4.2928,4.2928-2.5861-2.5863,4.293-4.2925-1.4141-1.4141-5,4.9995c-.1875.1875-.293.4419-.293.707s.1055.5195.293.707l7,7.0005,1.4141-1.4141-2.2929-2.293,4.2929-4.2929Z"/><path class="cls-2" d="m16,30c-7.7197,0-14-6.2804-14-14h2c0,6.6168,5.3833,12,12,12s12-5.3832,12-12h2c0,7.7196-6.2803,14-14,14Z"/><path class="cls-2" d="m24.3076,7.3407c-2.2446-2.1543-5.1948-3.3407-8.3076-3.3407-.9365,0-1.8682.108-2.77.321l-.46-1.9463c1.0522-.2487,2.1387-.3748,3.23-.3748,3.6313,0,7.0737,1.3843,9.6924,3.8978l-1.3848,1.4429Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    AI_GENERATE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m19,22v-2h1v-7h-1v-2h4v2h-1v7h1v2h-4Z"/><path class="cls-2" d="m15.5005,22h2l-3.5005-11h-3l-3.4966,11h1.9988l.6018-2h4.7781l.6184,2Zm-4.7947-4l1.6284-5.4111.2559-.0024,1.6736,5.4136h-3.5579Z"/><polygon class="cls-2" points="32 4 28 4 28 0 26 0 26 4 22 4 22 6 26 6 26 10 28 10 28 6 32 6 32 4"/><rect class="cls-2" x="30" y="12" width="2" height="2"/><rect class="cls-2" x="18" y="0" width="2" height="2"/><polygon class="cls-2" points="32 32 0 32 0 0 14 0 14 2 2 2 2 30 30 30 30 18 32 18 32 32"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    AI_GOVERNANCE_LIFECYCLE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="m16,23l-2.1387-1.0127c-1.7383-.8223-2.8613-2.5967-2.8613-4.5195v-6.4678h10v6.4678c0,1.9229-1.123,3.6973-2.8613,4.5195l-2.1387,1.0127Zm-3-10v4.4678c0,1.1533.6738,2.2178,1.7168,2.7109l1.2832.6074,1.2832-.6074c1.043-.4932,1.7168-1.5576,1.7168-2.7109v-4.4678h-6Z"/><path d="m4.1208,17.6562c.5305-.3594.8792-.9673.8792-1.6562,0-1.1045-.8955-2-2-2s-2,.8955-2,2c0,.7886.4607,1.4644,1.124,1.79.6792,5.334,4.3472,9.8477,9.5686,11.5347l.6147-1.9033c-4.4355-1.4326-7.5642-5.2461-8.1865-9.7651Z"/><path d="m29.3247,20.3076l-1.9033-.6152c-1.4329,4.4355-5.2461,7.5645-9.7651,8.1865-.3596-.5303-.967-.8789-1.6562-.8789-1.1045,0-2,.8955-2,2s.8955,2,2,2c.7888,0,1.4644-.4604,1.7898-1.124,5.334-.6792,9.8479-4.3472,11.5349-9.5684Z"/><path d="m29.876,14.21c-.6792-5.334-4.3472-9.8477-9.5686-11.5347l-.6147,1.9033c4.4355,1.4326,7.5642,5.2461,8.1865,9.7651-.5305.3594-.8792.9673-.8792,1.6562,0,1.1045.8955,2,2,2s2-.8955,2-2c0-.7886-.4604-1.4644-1.124-1.79Z"/><path d="m16,1c-.7888,0-1.4644.4604-1.7898,1.124-5.334.6792-9.8479,4.3472-11.5349,9.5684l1.9033.6152c1.4329-4.4355,5.2461-7.5645,9.7651-8.1865.3596.5303.967.8789,1.6562.8789,1.1045,0,2-.8955,2-2s-.8955-2-2-2Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    AI_GOVERNANCE_TRACKED = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="23 27.5898 20.41 24.9999 19 26.41 23 30.41 31 22.41 29.5899 21 23 27.5898"/><path d="m16,23l-2.1387-1.0127c-1.7383-.8223-2.8613-2.5967-2.8613-4.5195v-6.4678h10v6.4678c0,1.9229-1.123,3.6973-2.8613,4.5195l-2.1387,1.0127Zm-3-10v4.4678c0,1.1533.6738,2.2178,1.7168,2.7109l1.2832.6074,1.2832-.6074c1.043-.4932,1.7168-1.5576,1.7168-2.7109v-4.4678h-6Z"/><path d="m4.1208,17.6562c.5305-.3594.8792-.9673.8792-1.6562,0-1.1045-.8955-2-2-2s-2,.8955-2,2c0,.7886.4607,1.4644,1.124,1.79.6792,5.334,4.3472,9.8477,9.5686,11.5347l.6147-1.9033c-4.4355-1.4326-7.5642-5.2461-8.1865-9.7651Z"/><path d="m29.876,14.21c-.6792-5.334-4.3472-9.8477-9.5686-11.5347l-.6147,1.9033c4.4355,1.4326,7.5642,5.2461,8.1865,9.7651-.5305.3594-.8792.9673-.8792,1.6562,0,1.1045.8955,2,2,2s2-.8955,2-2c0-.7886-.4604-1.4644-1.124-1.79Z"/><path d="m16,1c-.7888,0-1.4644.4604-1.7898,1.124-5.334.6792-9.8479,4.3472-11.5349,9.5684l1.9033.6152c1.4329-4.4355,5.2461-7.5645,9.7651-8.1865.3596.5303.967.8789,1.6562.8789,1.1045,0,2-.8955,2-2s-.8955-2-2-2Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    AI_GOVERNANCE_UNTRACKED = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="27.4102 26 31 22.4102 29.5901 21 26 24.5898 22.4102 21 21 22.4102 24.5901 26 21 29.5898 22.4102 31 26 27.4102 29.5901 31 31 29.5898 27.4102 26"/><path d="m16,23l-2.1387-1.0127c-1.7383-.8223-2.8613-2.5967-2.8613-4.5195v-6.4678h10v6.4678c0,1.9229-1.123,3.6973-2.8613,4.5195l-2.1387,1.0127Zm-3-10v4.4678c0,1.1533.6738,2.2178,1.7168,2.7109l1.2832.6074,1.2832-.6074c1.043-.4932,1.7168-1.5576,1.7168-2.7109v-4.4678h-6Z"/><path d="m4.1208,17.6562c.5305-.3594.8792-.9673.8792-1.6562,0-1.1045-.8955-2-2-2s-2,.8955-2,2c0,.7886.4607,1.4644,1.124,1.79.6792,5.334,4.3472,9.8477,9.5686,11.5347l.6147-1.9033c-4.4355-1.4326-7.5642-5.2461-8.1865-9.7651Z"/><path d="m29.876,14.21c-.6792-5.334-4.3472-9.8477-9.5686-11.5347l-.6147,1.9033c4.4355,1.4326,7.5642,5.2461,8.1865,9.7651-.5305.3594-.8792.9673-.8792,1.6562,0,1.1045.8955,2,2,2s2-.8955,2-2c0-.7886-.4604-1.4644-1.124-1.79Z"/><path d="m16,1c-.7888,0-1.4644.4604-1.7898,1.124-5.334.6792-9.8479,4.3472-11.5349,9.5684l1.9033.6152c1.4329-4.4355,5.2461-7.5645,9.7651-8.1865.3596.5303.967.8789,1.6562.8789,1.1045,0,2-.8955,2-2s-.8955-2-2-2Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    AI_LABEL = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M19,21v-2h1v-7h-1v-2h4v2h-1v7h1v2h-4Z"/><path d="M15.5005,21h2l-3.5005-11h-3l-3.4966,11h1.9988l.6018-2h4.7781l.6184,2ZM10.7058,17l1.6284-5.4111.2559-.0024,1.6736,5.4136h-3.5579Z"/><path d="M32,32H0V0h32v32ZM2,30h28V2H2v28Z"/><rect id="_x3C_Transparent_Rectangle_x3E_" class="cls-1" width="32" height="32"/></svg>'
-    AI_LAUNCH = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m15,19l-1.4141,1.4141,3.5859,3.5859H4v-13h-2v13c0,1.1046.8954,2,2,2h13.1719l-3.5859,3.5859,1.4141,1.4141,6-6-6-6Z"/><path class="cls-2" d="m24,18v-2h2V4h-2v-2h6v2h-2v12h2v2h-6Z"/><path class="cls-2" d="m21,18h2l-5.5-16-3,.0088-5.5,15.9912h2l1.3333-4h7.3335l1.3333,4Zm-8-6l3-9,3,9h-6Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32" transform="translate(32 32) rotate(180)"/></svg>'
-    AI_RECOMMEND = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m18,20v-2h1v-7h-1v-2h4v2h-1v7h1v2h-4Z"/><path class="cls-2" d="m14.5005,20h2l-3.5005-11h-3l-3.4966,11h1.9988l.6018-2h4.7781l.6184,2Zm-4.7947-4l1.6284-5.4111.2559-.0024,1.6736,5.4136h-3.5579Z"/><path class="cls-2" d="m26.2171,21l-1.7871,3.621-3.9958.5806,2.8914,2.8188-.6827,3.9796,3.5741-1.879,3.5741,1.879-.6827-3.9796,2.8914-2.8186-3.9958-.5808-1.7871-3.621Z"/><polygon class="cls-2" points="17 30 0 30 0 0 30 0 30 17 28 17 28 2 2 2 2 28 17 28 17 30"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" x="0" width="32" height="32"/></svg>'
-    AIRLINE_DIGITAL_GATE = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M18,23H16V21a3.0033,3.0033,0,0,0-3-3H9a3.0033,3.0033,0,0,0-3,3v2H4V21a5.0058,5.0058,0,0,1,5-5h4a5.0059,5.0059,0,0,1,5,5Z" transform="translate(0 0)"/><path d="M11,6A3,3,0,1,1,8,9a3,3,0,0,1,3-3m0-2a5,5,0,1,0,5,5A5,5,0,0,0,11,4Z" transform="translate(0 0)"/><rect x="2" y="26.0001" width="28" height="2"/><path d="M31.9658,11.7413a1.0007,1.0007,0,0,0-1.2246-.707l-3.0861.826L24,7l-1,.2676,1.4584,5.4483-2.7663.7405L20,11.2066l-1,.2676.9337,3.4883a.9993.9993,0,0,0,1.2246.707l10.1005-2.7036A1,1,0,0,0,31.9658,11.7413Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    AIRLINE_MANAGE_GATES = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M18,23H16V21a3.0033,3.0033,0,0,0-3-3H9a3.0033,3.0033,0,0,0-3,3v2H4V21a5.0059,5.0059,0,0,1,5-5h4a5.0059,5.0059,0,0,1,5,5Z" transform="translate(0 0)"/><path d="M11,6A3,3,0,1,1,8,9a3,3,0,0,1,3-3m0-2a5,5,0,1,0,5,5A5,5,0,0,0,11,4Z" transform="translate(0 0)"/><rect x="2" y="26.0001" width="28" height="2"/><polygon points="22 4 22 6 26.586 6 20 12.586 21.414 14 28 7.414 28 12 30 12 30 4 22 4"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    AIRLINE_PASSENGER_CARE = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M18,23H16V21a3.0033,3.0033,0,0,0-3-3H9a3.0033,3.0033,0,0,0-3,3v2H4V21a5.0059,5.0059,0,0,1,5-5h4a5.0059,5.0059,0,0,1,5,5Z" transform="translate(0 0)"/><path d="M11,6A3,3,0,1,1,8,9a3,3,0,0,1,3-3m0-2a5,5,0,1,0,5,5A5,5,0,0,0,11,4Z" transform="translate(0 0)"/><rect x="2" y="26" width="28" height="2"/><path d="M27.303,8a2.6616,2.6616,0,0,0-1.9079.8058L25,9.2112l-.3951-.4054a2.6615,2.6615,0,0,0-3.8157,0,2.7992,2.7992,0,0,0,0,3.8964L25,17l4.2108-4.2978a2.7992,2.7992,0,0,0,0-3.8964A2.6616,2.6616,0,0,0,27.303,8Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    AIRLINE_RAPID_BOARD = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M18,23H16V21a3.0033,3.0033,0,0,0-3-3H9a3.0033,3.0033,0,0,0-3,3v2H4V21a5.0059,5.0059,0,0,1,5-5h4a5.0059,5.0059,0,0,1,5,5Z" transform="translate(0 0)"/><path d="M11,6A3,3,0,1,1,8,9a3,3,0,0,1,3-3m0-2a5,5,0,1,0,5,5A5,5,0,0,0,11,4Z" transform="translate(0 0)"/><rect x="2" y="26.0001" width="28" height="2"/><polygon points="30 8 28 8 28 6 26 6 26 4 30 4 30 8"/><polygon points="19 4 23 4 23 6 21 6 21 8 19 8 19 4"/><rect x="28" y="13.0001" width="2" height="2"/><rect x="26" y="11.0001" width="2" height="2"/><polygon points="19 11 21 11 21 13 23 13 23 15 19 15 19 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    AIRPLAY_FILLED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M22.9961,30H9.0039a1.0022,1.0022,0,0,1-.821-1.5769l6.9977-9.9965a1,1,0,0,1,1.6388,0l6.9977,9.9965A1.0022,1.0022,0,0,1,22.9961,30Z"/><path d="M28,24H24V22h4V6H4V22H8v2H4a2.0021,2.0021,0,0,1-2-2V6A2.0021,2.0021,0,0,1,4,4H28a2.0021,2.0021,0,0,1,2,2V22A2.0021,2.0021,0,0,1,28,24Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    AIRPLAY = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M22.9961,30H9.0039a1.0022,1.0022,0,0,1-.821-1.5769l6.9977-9.9965a1,1,0,0,1,1.6388,0l6.9977,9.9965A1.0022,1.0022,0,0,1,22.9961,30ZM10.92,28H21.08L16,20.7439Z"/><path d="M28,24H24V22h4V6H4V22H8v2H4a2.0021,2.0021,0,0,1-2-2V6A2.0021,2.0021,0,0,1,4,4H28a2.0021,2.0021,0,0,1,2,2V22A2.0021,2.0021,0,0,1,28,24Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    AIRPORT_01 = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill-rule: evenodd; } .cls-2 { fill: none; } </style></defs><path class="cls-1" d="M17,14.5,23,17V15l-6-3V9a1,1,0,0,0-2,0v3L9,15v2l6-2.5V20l-3,2v1l4-1,4,1V22l-3-2Z" transform="translate(0 0)"/><path d="M16,30A14,14,0,1,1,30,16,14.0158,14.0158,0,0,1,16,30ZM16,4A12,12,0,1,0,28,16,12.0137,12.0137,0,0,0,16,4Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-2" width="32" height="32"/></svg>'
-    AIRPORT_02 = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M23,17H19.4141L16,13H14l2.5859,4H10.7207L9.5,15H8l1.0569,3.3046A1,1,0,0,0,10.0094,19H23a1,1,0,0,0,0-2Z" transform="translate(0 0)"/><path d="M16,30A14,14,0,1,1,30,16,14.0158,14.0158,0,0,1,16,30ZM16,4A12,12,0,1,0,28,16,12.0137,12.0137,0,0,0,16,4Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    AIRPORT_LOCATION = '<svg id="Layer_1" data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M30,15h-6.07A8.0076,8.0076,0,0,0,17,8.0693V2H15V8.0693A8.0076,8.0076,0,0,0,8.07,15H2v2H8.07A8.0076,8.0076,0,0,0,15,23.9307V30h2V23.9307A8.0076,8.0076,0,0,0,23.9305,17H30ZM16,22a6,6,0,1,1,6-6A6.0066,6.0066,0,0,1,16,22Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32" transform="translate(32 32) rotate(-180)"/></svg>'
-    ALARM_ADD = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:#000000;}.cls-2{fill:none;}</style></defs><title>alarm--add</title><path d="M16,28A11,11,0,1,1,27,17,11,11,0,0,1,16,28ZM16,8a9,9,0,1,0,9,9A9,9,0,0,0,16,8Z"/><rect class="cls-1" x="3.96" y="5.5" width="5.07" height="2" transform="translate(-2.69 6.51) rotate(-45.06)"/><rect class="cls-1" x="24.5" y="3.96" width="2" height="5.07" transform="translate(2.86 19.91) rotate(-44.94)"/><polygon points="21 16 17 16 17 12 15 12 15 16 11 16 11 18 15 18 15 22 17 22 17 18 21 18 21 16"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-2" width="32" height="32"/></svg>'
-    ALARM_SUBTRACT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:#000000;}.cls-2{fill:none;}</style></defs><title>alarm--subtract</title><path d="M16,28A11,11,0,1,1,27,17,11,11,0,0,1,16,28ZM16,8a9,9,0,1,0,9,9A9,9,0,0,0,16,8Z"/><rect class="cls-1" x="3.96" y="5.5" width="5.07" height="2" transform="translate(-2.69 6.51) rotate(-45.06)"/><rect class="cls-1" x="24.5" y="3.96" width="2" height="5.07" transform="translate(2.86 19.91) rotate(-44.94)"/><rect x="11" y="16" width="10" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-2" width="32" height="32"/></svg>'
-    ALARM = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:#000000;}.cls-2{fill:none;}</style></defs><title>alarm</title><path d="M16,28A11,11,0,1,1,27,17,11,11,0,0,1,16,28ZM16,8a9,9,0,1,0,9,9A9,9,0,0,0,16,8Z"/><polygon points="18.59 21 15 17.41 15 11 17 11 17 16.58 20 19.59 18.59 21"/><rect class="cls-1" x="3.96" y="5.5" width="5.07" height="2" transform="translate(-2.69 6.51) rotate(-45.06)"/><rect class="cls-1" x="24.5" y="3.96" width="2" height="5.07" transform="translate(2.86 19.91) rotate(-44.94)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-2" width="32" height="32"/></svg>'
-    ALIGN_HORIZONTAL_CENTER = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>align--horizontal-center</title><path d="M24,18H17V14h3a2.0025,2.0025,0,0,0,2-2V8a2.0025,2.0025,0,0,0-2-2H17V2H15V6H12a2.0025,2.0025,0,0,0-2,2v4a2.0025,2.0025,0,0,0,2,2h3v4H8a2.0025,2.0025,0,0,0-2,2v4a2.0025,2.0025,0,0,0,2,2h7v4h2V26h7a2.0025,2.0025,0,0,0,2-2V20A2.0025,2.0025,0,0,0,24,18ZM12,8h8v4H12ZM24,24H8V20H24Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ALIGN_HORIZONTAL_LEFT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>align--horizontal-left</title><path d="M26,26H11a2.0023,2.0023,0,0,1-2-2V20a2.0023,2.0023,0,0,1,2-2H26a2.0023,2.0023,0,0,1,2,2v4A2.0023,2.0023,0,0,1,26,26Zm0-6.0012L11,20v4H26Z"/><path d="M18,14H11a2.0023,2.0023,0,0,1-2-2V8a2.0023,2.0023,0,0,1,2-2h7a2.0023,2.0023,0,0,1,2,2v4A2.0023,2.0023,0,0,1,18,14Zm0-6.0012L11,8v4h7Z"/><rect x="4" y="2" width="2" height="28"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ALIGN_HORIZONTAL_RIGHT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>align--horizontal-right</title><path d="M4,24V20a2.0023,2.0023,0,0,1,2-2H21a2.0023,2.0023,0,0,1,2,2v4a2.0023,2.0023,0,0,1-2,2H6A2.0023,2.0023,0,0,1,4,24Zm2,0H21V20L6,19.9988Z" transform="translate(0 0)"/><path d="M12,12V8a2.0023,2.0023,0,0,1,2-2h7a2.0023,2.0023,0,0,1,2,2v4a2.0023,2.0023,0,0,1-2,2H14A2.0023,2.0023,0,0,1,12,12Zm2,0h7V8l-7-.0012Z" transform="translate(0 0)"/><rect x="26" y="2" width="2" height="28" transform="translate(54 32) rotate(-180)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32" transform="translate(32 32) rotate(-180)"/></svg>'
-    ALIGN_VERTICAL_BOTTOM = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>align--bottom-vertical</title><rect x="2" y="26" width="28" height="2"/><path d="M24,23H20a2.0023,2.0023,0,0,1-2-2V14a2.0023,2.0023,0,0,1,2-2h4a2.0023,2.0023,0,0,1,2,2v7A2.0023,2.0023,0,0,1,24,23Zm-4-9v7h4.0012L24,14Z"/><path d="M12,23H8a2.0023,2.0023,0,0,1-2-2V6A2.0023,2.0023,0,0,1,8,4h4a2.0023,2.0023,0,0,1,2,2V21A2.0023,2.0023,0,0,1,12,23ZM8,6V21h4.0012L12,6Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ALIGN_VERTICAL_CENTER = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>align--center-vertical</title><path d="M30,15H26V12a2.0025,2.0025,0,0,0-2-2H20a2.0025,2.0025,0,0,0-2,2v3H14V8a2.0025,2.0025,0,0,0-2-2H8A2.0025,2.0025,0,0,0,6,8v7H2v2H6v7a2.0025,2.0025,0,0,0,2,2h4a2.0025,2.0025,0,0,0,2-2V17h4v3a2.0025,2.0025,0,0,0,2,2h4a2.0025,2.0025,0,0,0,2-2V17h4ZM8,24V8h4l.0012,16Zm12-4V12h4l.0012,8Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ALIGN_VERTICAL_TOP = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>align--vertical-top</title><path d="M24,20H20a2.0023,2.0023,0,0,1-2-2V11a2.0023,2.0023,0,0,1,2-2h4a2.0023,2.0023,0,0,1,2,2v7A2.0023,2.0023,0,0,1,24,20Zm-4-9v7h4.0012L24,11Z"/><path d="M12,28H8a2.0023,2.0023,0,0,1-2-2V11A2.0023,2.0023,0,0,1,8,9h4a2.0023,2.0023,0,0,1,2,2V26A2.0023,2.0023,0,0,1,12,28ZM8,11V26h4.0012L12,11Z"/><rect x="2" y="4" width="28" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-
-    # View/Display icons
-    VIEW = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>view</title><path d="M30.94,15.66A16.69,16.69,0,0,0,16,5,16.69,16.69,0,0,0,1.06,15.66a1,1,0,0,0,0,.68A16.69,16.69,0,0,0,16,27,16.69,16.69,0,0,0,30.94,16.34,1,1,0,0,0,30.94,15.66ZM16,25c-5.3,0-10.9-3.93-12.93-9C5.1,10.93,10.7,7,16,7s10.9,3.93,12.93,9C26.9,21.07,21.3,25,16,25Z" transform="translate(0 0)"/><path d="M16,10a6,6,0,1,0,6,6A6,6,0,0,0,16,10Zm0,10a4,4,0,1,1,4-4A4,4,0,0,1,16,20Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    VIEW_OFF = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>view--off</title><path d="M5.24,22.51l1.43-1.42A14.06,14.06,0,0,1,3.07,16C5.1,10.93,10.7,7,16,7a12.38,12.38,0,0,1,4,.72l1.55-1.56A14.72,14.72,0,0,0,16,5,16.69,16.69,0,0,0,1.06,15.66a1,1,0,0,0,0,.68A16,16,0,0,0,5.24,22.51Z"/><path d="M12,15.73a4,4,0,0,1,3.7-3.7l1.81-1.82a6,6,0,0,0-7.33,7.33Z"/><path d="M30.94,15.66A16.4,16.4,0,0,0,25.2,8.22L30,3.41,28.59,2,2,28.59,3.41,30l5.1-5.1A15.29,15.29,0,0,0,16,27,16.69,16.69,0,0,0,30.94,16.34,1,1,0,0,0,30.94,15.66ZM20,16a4,4,0,0,1-6,3.44L19.44,14A4,4,0,0,1,20,16Zm-4,9a13.05,13.05,0,0,1-6-1.58l2.54-2.54a6,6,0,0,0,8.35-8.35l2.87-2.87A14.54,14.54,0,0,1,28.93,16C26.9,21.07,21.3,25,16,25Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    VIEW_FILLED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>view--filled</title><circle cx="16" cy="16" r="4"/><path d="M30.94,15.66A16.69,16.69,0,0,0,16,5,16.69,16.69,0,0,0,1.06,15.66a1,1,0,0,0,0,.68A16.69,16.69,0,0,0,16,27,16.69,16.69,0,0,0,30.94,16.34,1,1,0,0,0,30.94,15.66ZM16,22.5A6.5,6.5,0,1,1,22.5,16,6.51,6.51,0,0,1,16,22.5Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    VIEW_OFF_FILLED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>view--off--filled</title><path d="M30.94,15.66a16.4,16.4,0,0,0-5.73-7.45L30,3.41,28.59,2,2,28.59,3.41,30l5.1-5.09A15.38,15.38,0,0,0,16,27,16.69,16.69,0,0,0,30.94,16.34,1,1,0,0,0,30.94,15.66ZM16,22.5a6.46,6.46,0,0,1-3.83-1.26L14,19.43A4,4,0,0,0,19.43,14l1.81-1.81A6.49,6.49,0,0,1,16,22.5Z"/><path d="M4.53,21.81l5-5A6.84,6.84,0,0,1,9.5,16,6.51,6.51,0,0,1,16,9.5a6.84,6.84,0,0,1,.79.05l3.78-3.77A14.39,14.39,0,0,0,16,5,16.69,16.69,0,0,0,1.06,15.66a1,1,0,0,0,0,.68A15.86,15.86,0,0,0,4.53,21.81Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ASSET_VIEW = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><circle cx="22" cy="24" r="2"/><path d="M29.7769,23.4785A8.64,8.64,0,0,0,22,18a8.64,8.64,0,0,0-7.7769,5.4785L14,24l.2231.5215A8.64,8.64,0,0,0,22,30a8.64,8.64,0,0,0,7.7769-5.4785L30,24ZM22,28a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,22,28Z"/><path d="M12,24a4,4,0,1,1,2.981-6.667l-1.49,1.334A2,2,0,1,0,12,22Z"/><path d="M26,2a3.86,3.86,0,0,0-1.85.48L7.76,10.96A9.99,9.99,0,0,0,12,30V28a8,8,0,1,1,5.63-13.68l1.4-1.4a10.0059,10.0059,0,0,0-5.39-2.77l8.38-4.34c0,.06-.02.12-.02.19a3.9989,3.9989,0,0,0,4,4c.06,0,.12-.02.19-.02L23.07,16h2.24l4.25-8.21A3.9727,3.9727,0,0,0,26,2Zm0,6a2,2,0,1,1,2-2A2.0058,2.0058,0,0,1,26,8Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CONTENT_VIEW = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><circle cx="16" cy="19" r="2"/><path d="M23.7769,18.4785A8.64,8.64,0,0,0,16,13a8.64,8.64,0,0,0-7.7769,5.4785L8,19l.2231.5215A8.64,8.64,0,0,0,16,25a8.64,8.64,0,0,0,7.7769-5.4785L24,19ZM16,23a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,16,23Z"/><path d="M27,3H5A2,2,0,0,0,3,5V27a2,2,0,0,0,2,2H27a2,2,0,0,0,2-2V5A2,2,0,0,0,27,3ZM5,5H27V9H5ZM5,27V11H27V27Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CUBE_VIEW = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><circle cx="16" cy="16" r="2"/><path d="M23.7769,15.4785A8.64,8.64,0,0,0,16,10a8.64,8.64,0,0,0-7.7769,5.4785L8,16l.2231.5215A8.64,8.64,0,0,0,16,22a8.64,8.64,0,0,0,7.7769-5.4785L24,16ZM16,20a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,16,20Z"/><path d="M28.5039,8.1362l-12-7a1,1,0,0,0-1.0078,0l-12,7A1,1,0,0,0,3,9V23a1,1,0,0,0,.4961.8638l12,7a1,1,0,0,0,1.0078,0l12-7A1,1,0,0,0,29,23V9A1,1,0,0,0,28.5039,8.1362ZM27,22.4258,16,28.8423,5,22.4258V9.5742L16,3.1577,27,9.5742Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_VIEW = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><circle cx="22" cy="24" r="2"/><path d="M29.7769,23.4785A8.64,8.64,0,0,0,22,18a8.64,8.64,0,0,0-7.7769,5.4785L14,24l.2231.5215A8.64,8.64,0,0,0,22,30a8.64,8.64,0,0,0,7.7769-5.4785L30,24ZM22,28a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,22,28Z"/><circle cx="8" cy="8" r="1"/><circle cx="8" cy="16" r="1"/><circle cx="8" cy="24" r="1"/><path d="M5,21h7V19H5V13H21v3h2V5a2,2,0,0,0-2-2H5A2,2,0,0,0,3,5V27a2,2,0,0,0,2,2h7V27H5ZM5,5H21v6H5Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_VIEW_ALT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><circle cx="22" cy="24" r="2"/><path d="M29.7769,23.4785A8.64,8.64,0,0,0,22,18a8.64,8.64,0,0,0-7.7769,5.4785L14,24l.2231.5215A8.64,8.64,0,0,0,22,30a8.64,8.64,0,0,0,7.7769-5.4785L30,24ZM22,28a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,22,28Z"/><rect x="7" y="17" width="5" height="2"/><rect x="7" y="12" width="12" height="2"/><rect x="7" y="7" width="12" height="2"/><path d="M22,2,4,2A2.0058,2.0058,0,0,0,2,4V28a2.0058,2.0058,0,0,0,2,2h8V28H4V4H22V15h2V4A2.0058,2.0058,0,0,0,22,2Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DOCUMENT_VIEW = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>document--view</title><circle cx="22" cy="24" r="2"/><path id="_inner_path_" data-name="&lt;inner path&gt;" class="cls-1" d="M22,28a4,4,0,1,1,4-4A4.0039,4.0039,0,0,1,22,28Zm0-6a2,2,0,1,0,2,2A2.0027,2.0027,0,0,0,22,22Z"/><path d="M29.7769,23.4785A8.64,8.64,0,0,0,22,18a8.64,8.64,0,0,0-7.7769,5.4785L14,24l.2231.5215A8.64,8.64,0,0,0,22,30a8.64,8.64,0,0,0,7.7769-5.4785L30,24ZM22,28a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,22,28Z"/><path d="M12,28H8V4h8v6a2.0058,2.0058,0,0,0,2,2h6v4h2V10a.9092.9092,0,0,0-.3-.7l-7-7A.9087.9087,0,0,0,18,2H8A2.0058,2.0058,0,0,0,6,4V28a2.0058,2.0058,0,0,0,2,2h4ZM18,4.4,23.6,10H18Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    HORIZONTAL_VIEW = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M28,30H4a2.0021,2.0021,0,0,1-2-2V20a2.0021,2.0021,0,0,1,2-2H28a2.0021,2.0021,0,0,1,2,2v8A2.0021,2.0021,0,0,1,28,30ZM4,20H3.9985L4,28H28V20Z"/><path d="M28,14H4a2.0021,2.0021,0,0,1-2-2V4A2.0021,2.0021,0,0,1,4,2H28a2.0021,2.0021,0,0,1,2,2v8A2.0021,2.0021,0,0,1,28,14ZM4,4H3.9985L4,12H28V4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    EXPAND_ALL = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>expand-all</title><path d="M12,10H26a2.0025,2.0025,0,0,0,2-2V4a2.0025,2.0025,0,0,0-2-2H12a2.0025,2.0025,0,0,0-2,2V5H6V2H4V25a2.0025,2.0025,0,0,0,2,2h4v1a2.0025,2.0025,0,0,0,2,2H26a2.0025,2.0025,0,0,0,2-2V24a2.0025,2.0025,0,0,0-2-2H12a2.0025,2.0025,0,0,0-2,2v1H6V17h4v1a2.0025,2.0025,0,0,0,2,2H26a2.0025,2.0025,0,0,0,2-2V14a2.0025,2.0025,0,0,0-2-2H12a2.0025,2.0025,0,0,0-2,2v1H6V7h4V8A2.0025,2.0025,0,0,0,12,10Zm0-6H26l.0012,4H12Zm0,20H26l.0012,4H12Zm0-10H26l.0012,4H12Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    COLLAPSE_ALL = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>collapse-all</title><path d="M30,15H28V7H13V5H28a2.0023,2.0023,0,0,1,2,2Z"/><path d="M25,20H23V12H8V10H23a2.0023,2.0023,0,0,1,2,2Z"/><path d="M18,27H4a2.0023,2.0023,0,0,1-2-2V17a2.0023,2.0023,0,0,1,2-2H18a2.0023,2.0023,0,0,1,2,2v8A2.0023,2.0023,0,0,1,18,27ZM4,17v8H18.0012L18,17Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    EXPAND_CATEGORIES = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>expand-categories</title><rect x="20" y="26" width="6" height="2"/><rect x="20" y="18" width="8" height="2"/><rect x="20" y="10" width="10" height="2"/><rect x="15" y="4" width="2" height="24"/><polygon points="10.586 3.959 7 7.249 3.412 3.958 2 5.373 7 10 12 5.373 10.586 3.959"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    COLLAPSE_CATEGORIES = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>collapse-categories</title><rect x="14" y="25" width="14" height="2"/><polygon points="7.17 26 4.59 28.58 6 30 10 26 6 22 4.58 23.41 7.17 26"/><rect x="14" y="15" width="14" height="2"/><polygon points="7.17 16 4.59 18.58 6 20 10 16 6 12 4.58 13.41 7.17 16"/><rect x="14" y="5" width="14" height="2"/><polygon points="7.17 6 4.59 8.58 6 10 10 6 6 2 4.58 3.41 7.17 6"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHEVRON_DOWN = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 22.1.0, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><polygon points="16,22 6,12 7.4,10.6 16,19.2 24.6,10.6 26,12 "/><rect id="_x3C_Transparent_Rectangle_x3E_" class="st0" width="32" height="32"/></svg>'
-    CHEVRON_UP = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 22.1.0, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><polygon points="16,10 26,20 24.6,21.4 16,12.8 7.4,21.4 6,20 "/><rect id="_x3C_Transparent_Rectangle_x3E_" class="st0" width="32" height="32"/></svg>'
-    CHEVRON_LEFT = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 22.1.0, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><polygon points="10,16 20,6 21.4,7.4 12.8,16 21.4,24.6 20,26 "/><rect id="_x3C_Transparent_Rectangle_x3E_" class="st0" width="32" height="32"/></svg>'
-    CHEVRON_RIGHT = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 22.1.0, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><polygon points="22,16 12,26 10.6,24.6 19.2,16 10.6,7.4 12,6 "/><rect id="_x3C_Transparent_Rectangle_x3E_" class="st0" width="32" height="32"/></svg>'
-    CARET_DOWN = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><title>caret--down</title><polygon points="24,12 16,22 8,12 "/><rect id="_Transparent_Rectangle_" class="st0" width="32" height="32"/></svg>'
-    CARET_UP = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><title>caret--right</title><polygon points="8,20 16,10 24,20 "/><rect class="st0" width="32" height="32"/></svg>'
-    CARET_LEFT = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><title>caret--right</title><polygon points="20,24 10,16 20,8 "/><rect class="st0" width="32" height="32"/></svg>'
-    CARET_RIGHT = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><title>caret--right</title><polygon points="12,8 22,16 12,24 "/><rect class="st0" width="32" height="32"/></svg>'
-    FIT_TO_SCREEN = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>fit-to-screen</title><polygon points="22 16 24 16 24 8 16 8 16 10 22 10 22 16"/><polygon points="8 24 16 24 16 22 10 22 10 16 8 16 8 24"/><path d="M26,28H6a2.0023,2.0023,0,0,1-2-2V6A2.0023,2.0023,0,0,1,6,4H26a2.0023,2.0023,0,0,1,2,2V26A2.0023,2.0023,0,0,1,26,28ZM6,6V26H26.0012L26,6Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SCREEN = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>desktop</title><path d="M28,4H4A2,2,0,0,0,2,6V22a2,2,0,0,0,2,2h8v4H8v2H24V28H20V24h8a2,2,0,0,0,2-2V6A2,2,0,0,0,28,4ZM18,28H14V24h4Zm10-6H4V6H28Z" transform="translate(0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SCREEN_OFF = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>screen--off</title><path d="M28,22H11.41L30,3.41,28.59,2l-2,2H4A2,2,0,0,0,2,6V22H4V6H24.59L2,28.59,3.41,30l6-6H12v4H8v2H24V28H20V24h8a2,2,0,0,0,2-2V9H28ZM18,28H14V24h4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ZOOM_IN = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="18 12 14 12 14 8 12 8 12 12 8 12 8 14 12 14 12 18 14 18 14 14 18 14 18 12"/><path d="M21.4479,20A10.856,10.856,0,0,0,24,13,11,11,0,1,0,13,24a10.856,10.856,0,0,0,7-2.5521L27.5859,29,29,27.5859ZM13,22a9,9,0,1,1,9-9A9.01,9.01,0,0,1,13,22Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ZOOM_OUT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><rect x="8" y="12" width="10" height="2"/><path d="M21.4479,20A10.856,10.856,0,0,0,24,13,11,11,0,1,0,13,24a10.856,10.856,0,0,0,7-2.5521L27.5859,29,29,27.5859ZM13,22a9,9,0,1,1,9-9A9.01,9.01,0,0,1,13,22Z" transform="translate(0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ZOOM_FIT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M21.4479,20A10.856,10.856,0,0,0,24,13,11,11,0,1,0,13,24a10.856,10.856,0,0,0,7-2.5521L27.5859,29,29,27.5859ZM13,22a9,9,0,1,1,9-9A9.01,9.01,0,0,1,13,22Z"/><path d="M10,12H8V10a2.0023,2.0023,0,0,1,2-2h2v2H10Z"/><path d="M18,12H16V10H14V8h2a2.0023,2.0023,0,0,1,2,2Z"/><path d="M12,18H10a2.0023,2.0023,0,0,1-2-2V14h2v2h2Z"/><path d="M16,18H14V16h2V14h2v2A2.0023,2.0023,0,0,1,16,18Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ZOOM_RESET = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>zoom--reset</title><path d="M22.4478,21A10.855,10.855,0,0,0,25,14,10.99,10.99,0,0,0,6,6.4658V2H4v8h8V8H7.332a8.9768,8.9768,0,1,1-2.1,8H3.1912A11.0118,11.0118,0,0,0,14,25a10.855,10.855,0,0,0,7-2.5522L28.5859,30,30,28.5859Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SIDE_PANEL_OPEN = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 26.3.1, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><path d="M28,4H4C2.9,4,2,4.9,2,6v20c0,1.1,0.9,2,2,2h24c1.1,0,2-0.9,2-2V6C30,4.9,29.1,4,28,4z M10,26H4V6h6V26z M28,26H12v-9h10.2 l-3.6,3.6L20,22l6-6l-6-6l-1.4,1.4l3.6,3.6H12V6h16V26z"/><rect id="_x3C_Transparent_Rectangle_x3E__589_" class="st0" width="32" height="32"/></svg>'
-    SIDE_PANEL_CLOSE = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 26.3.1, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><path d="M28,4H4C2.9,4,2,4.9,2,6v20c0,1.1,0.9,2,2,2h24c1.1,0,2-0.9,2-2V6C30,4.9,29.1,4,28,4z M10,26H4V6h6V26z M28,15H17.8 l3.6-3.6L20,10l-6,6l6,6l1.4-1.4L17.8,17H28v9H12V6h16V15z"/><rect id="_x3C_Transparent_Rectangle_x3E__589_" class="st0" width="32" height="32"/></svg>'
-    SIDE_PANEL_OPEN_FILLED = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 26.3.1, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><path d="M28,4H4C2.9,4,2,4.9,2,6v20c0,1.1,0.9,2,2,2h24c1.1,0,2-0.9,2-2V6C30,4.9,29.1,4,28,4z M28,26H12v-9h10.2l-3.6,3.6L20,22 l6-6l-6-6l-1.4,1.4l3.6,3.6H12V6h16V26z"/><rect id="_x3C_Transparent_Rectangle_x3E__589_" class="st0" width="32" height="32"/></svg>'
-    SIDE_PANEL_CLOSE_FILLED = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 26.3.1, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><path d="M28,4H4C2.9,4,2,4.9,2,6v20c0,1.1,0.9,2,2,2h24c1.1,0,2-0.9,2-2V6C30,4.9,29.1,4,28,4z M28,15H17.8l3.6-3.6L20,10l-6,6l6,6 l1.4-1.4L17.8,17H28v9H12V6h16V15z"/><rect id="_x3C_Transparent_Rectangle_x3E__589_" class="st0" width="32" height="32"/></svg>'
-    BOTTOM_PANEL_OPEN = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m28,4H4c-1.1045,0-2,.8955-2,2v20c0,1.1045.8955,2,2,2h24c1.1045,0,2-.8955,2-2V6c0-1.1045-.8955-2-2-2Zm0,16v6H4v-6h24Zm0-14v12h-11v-6.1699s3.5898,3.5798,3.5898,3.5798l1.4102-1.4099-6-6-6,6,1.4102,1.4099,3.5898-3.5798v6.1699H4V6h24Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    BOTTOM_PANEL_CLOSE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m28,4H4c-1.1045,0-2,.8955-2,2v20c0,1.1045.8955,2,2,2h24c1.1045,0,2-.8955,2-2V6c0-1.1045-.8955-2-2-2Zm0,16v6H4v-6h24Zm0-14v12H4V6h11v6.1699s-3.5898-3.5801-3.5898-3.5801l-1.4102,1.4102,6,6,6-6-1.4102-1.4102-3.5898,3.5801v-6.1699h11Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    BOTTOM_PANEL_OPEN_FILLED = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m28,4H4c-1.1045,0-2,.8955-2,2v20c0,1.1045.8955,2,2,2h24c1.1045,0,2-.8955,2-2V6c0-1.1045-.8955-2-2-2Zm0,2v12h-11v-6.1699s3.5898,3.5798,3.5898,3.5798l1.4102-1.4099-6-6-6,6,1.4102,1.4099,3.5898-3.5798v6.1699H4V6h24Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    BOTTOM_PANEL_CLOSE_FILLED = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><path class="cls-2" d="m28,4H4c-1.1045,0-2,.8955-2,2v20c0,1.1045.8955,2,2,2h24c1.1045,0,2-.8955,2-2V6c0-1.1045-.8955-2-2-2Zm0,2v12H4V6h11v6.1699s-3.5898-3.5801-3.5898-3.5801l-1.4102,1.4102,6,6,6-6-1.4102-1.4102-3.5898,3.5801v-6.1699h11Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    CODE_HIDE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="17.713 13.471 19.576 6.518 17.645 6 16.08 11.838 17.713 13.471"/><polygon points="24.207 19.965 25.621 21.379 31 16 24 9 22.586 10.414 28.172 16 24.207 19.965"/><polygon points="30 28.586 3.414 2 2 3.414 7.793 9.207 1 16 8 23 9.414 21.586 3.828 16 9.207 10.621 14.884 16.298 12.423 25.482 14.355 26 16.517 17.931 28.586 30 30 28.586"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    PASSWORD = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M21,2a8.9977,8.9977,0,0,0-8.6119,11.6118L2,24v6H8L18.3881,19.6118A9,9,0,1,0,21,2Zm0,16a7.0125,7.0125,0,0,1-2.0322-.3022L17.821,17.35l-.8472.8472-3.1811,3.1812L12.4141,20,11,21.4141l1.3787,1.3786-1.5859,1.586L9.4141,23,8,24.4141l1.3787,1.3786L7.1716,28H4V24.8284l9.8023-9.8023.8472-.8474-.3473-1.1467A7,7,0,1,1,21,18Z"/><circle cx="22" cy="10" r="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-
-    # Charts & Analytics
-    CHART_BAR_FLOATING = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M28,24H14V16H28ZM16,22H26V18H16Z"/><path d="M26,12H8V4H26ZM10,10H24V6H10Z"/><path d="M30,30H4a2.0023,2.0023,0,0,1-2-2V2H4V28H30Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_BAR_OVERLAY = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M4,28V26H26V16H4V14H18V4H4V2H2V28a2,2,0,0,0,2,2H30V28ZM24,18v6H4V22H20V20H4V18ZM16,6v6H4V10h8V8H4V6Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_BAR_STACKED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M4,28V25H26V17H4V13H18V5H4V2H2V28a2,2,0,0,0,2,2H30V28Zm20-5H14V19H24ZM16,11H10V7h6Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_BAR_TARGET = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><rect x="28" y="17" width="2" height="8"/><rect x="20" y="5" width="2" height="8"/><path d="M4,2H2V28a2,2,0,0,0,2,2H30V28H4V25H26V17H4V13H18V5H4ZM24,19v4H4V19ZM16,7v4H4V7Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_LINE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>chart--line</title><path d="M4.67,28l6.39-12,7.3,6.49a2,2,0,0,0,1.7.47,2,2,0,0,0,1.42-1.07L27,10.9,25.18,10,19.69,21l-7.3-6.49A2,2,0,0,0,10.71,14a2,2,0,0,0-1.42,1L4,25V2H2V28a2,2,0,0,0,2,2H30V28Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_LINE_SMOOTH = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M13,15c1.4854,0,2.5544,1.4966,3.6863,3.0811C17.9983,19.918,19.4854,22,22,22c5.6709,0,7.78-10.79,8-12l-1.9678-.3584C27.55,12.2827,25.3938,20,22,20c-1.4854,0-2.5544-1.4966-3.6863-3.0811C17.0017,15.082,15.5146,13,13,13c-4.186,0-7.4448,7.4043-9,11.7617V2H2V28a2.0025,2.0025,0,0,0,2,2H30V28H5.0439C6.5544,22.8574,9.9634,15,13,15Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_SCATTER = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>chart--scatter</title><path d="M30,30H4a2,2,0,0,1-2-2V2H4V28H30Z"/><circle cx="10" cy="22" r="2"/><circle cx="14" cy="15" r="2"/><circle cx="22" cy="15" r="2"/><circle cx="26" cy="6" r="2"/><circle cx="14" cy="8" r="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_PIE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>chart--pie</title><path d="M16,4A12,12,0,1,0,28,16,12,12,0,0,0,16,4ZM26,15H17V6.05A10,10,0,0,1,26,15ZM15.42,26A10,10,0,0,1,15,6.05v9a2,2,0,0,0,2,2h9A10,10,0,0,1,15.42,26Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_AREA = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>chart--area</title><path d="M20.4761,8.0151,13.4473,4.2109a2.0076,2.0076,0,0,0-2.1158.2051L4,10.001V2H2V28a2,2,0,0,0,2,2H30V5.7354ZM28,20.209l-7.62,1.8022-7.0288-2.8838a1.99,1.99,0,0,0-2.022.37L4,25.8359v-4.455l8.375-9.4,7.0186,5.62a2.0155,2.0155,0,0,0,2.0459.2119L28,14.6025ZM12.5239,5.9849l7.03,3.8042a2.012,2.012,0,0,0,1.3408.16L28,8.2646v4.1138L20.6187,16.02,13.6,10.4a1.99,1.99,0,0,0-2.6885.2642L4,18.3838v-5.87ZM4.5513,28,12.62,20.9888l7.0288,2.8838a1.9977,1.9977,0,0,0,1.147.0771L28,22.2612V28Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_AREA_SMOOTH = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M30,6.6143l-1.3152.4365A20.9218,20.9218,0,0,1,23,8c-1.7344,0-3.3225-.9072-5.0039-1.8682C16.1621,5.084,14.2656,4,12,4,9.123,4,5.9146,6.2061,4,7.772V2H2V28a2.0025,2.0025,0,0,0,2,2H30ZM4,20.2944C5.874,17.3765,9.56,13,12,13c1.6379,0,2.96,1.1016,4.36,2.2686C17.8965,16.5488,19.6379,18,22,18a9.4686,9.4686,0,0,0,6-2.5288v4.9556A13.0026,13.0026,0,0,1,22,22a13.8619,13.8619,0,0,1-4.6838-.9487A15.682,15.682,0,0,0,12,20c-2.927,0-6.0676,2.959-8,5.1577ZM12,6c1.7344,0,3.3225.9072,5.0039,1.8682C18.8379,8.916,20.7344,10,23,10a21.432,21.432,0,0,0,5-.6782v3.3213C27.3167,13.4463,24.9155,16,22,16c-1.6379,0-2.96-1.1016-4.36-2.2686C16.1035,12.4512,14.3621,11,12,11c-2.9358,0-6.0632,3.3394-8,5.8447V10.4238C5.5461,8.9658,9.2588,6,12,6ZM4.249,28C5.8623,25.9087,9.41,22,12,22a13.8619,13.8619,0,0,1,4.6838.9487A15.682,15.682,0,0,0,22,24a14.7362,14.7362,0,0,0,6-1.34V28Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_BUBBLE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>chart--bubble</title><path d="M30,30H4a2,2,0,0,1-2-2V2H4V28H30Z"/><path d="M10,16a2,2,0,1,1-2,2,2,2,0,0,1,2-2m0-2a4,4,0,1,0,4,4,4,4,0,0,0-4-4Z"/><path d="M21,6a4,4,0,1,1-4,4,4,4,0,0,1,4-4m0-2a6,6,0,1,0,6,6,6,6,0,0,0-6-6Z"/><path d="M24.5,21A1.5,1.5,0,1,1,23,22.5,1.5,1.5,0,0,1,24.5,21m0-2A3.5,3.5,0,1,0,28,22.5,3.5,3.5,0,0,0,24.5,19Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_BUBBLE_PACKED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M27.5322,17.1724A8.99,8.99,0,1,0,13.6074,5.88,5.9969,5.9969,0,1,0,5.051,13.2217a6.9967,6.9967,0,1,0,7.9942,11.4844A5.9981,5.9981,0,0,0,25,24c0-.1216-.011-.24-.0181-.3594a3.4873,3.4873,0,1,0,2.55-6.4682ZM21,4a7,7,0,1,1-7,7A7.0078,7.0078,0,0,1,21,4ZM8,4A4,4,0,1,1,4,8,4.0045,4.0045,0,0,1,8,4ZM19,28a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,19,28Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_TREEMAP = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>chart--treemap</title><path d="M28,2H4A2.0023,2.0023,0,0,0,2,4V28a2.0023,2.0023,0,0,0,2,2H28a2.0023,2.0023,0,0,0,2-2V4A2.0023,2.0023,0,0,0,28,2Zm0,12H23V4h5ZM16,4h5V14H16ZM14,4V20H4V4ZM4,22H14v6H4Zm12,6V16H28V28Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_SUNBURST = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M16,2a1,1,0,0,0-1,1v7.09a5.9618,5.9618,0,0,0-2.46,1.043L7.8384,6.4311a1.4554,1.4554,0,0,0-2.087.0244A14.05,14.05,0,0,0,9.8047,28.5972a10.8482,10.8482,0,0,0,1.8989.7676,14.0982,14.0982,0,0,0,13.8443-3.1319,1.4336,1.4336,0,0,0,.0278-2.0639L20.877,19.47A5.963,5.963,0,0,0,21.91,17H29a1,1,0,0,0,1-1A14.0158,14.0158,0,0,0,16,2Zm0,10a4,4,0,1,1-4,4A4.0045,4.0045,0,0,1,16,12ZM6.83,8.251l4.2959,4.2959a5.91,5.91,0,0,0-.0113,6.9243L6.8381,23.7481A12.0168,12.0168,0,0,1,6.83,8.251Zm1.4228,16.91,4.2759-4.2759A5.9589,5.9589,0,0,0,15,21.91v6.042A11.8783,11.8783,0,0,1,8.2529,25.1612ZM17,27.9561V21.9092a5.9631,5.9631,0,0,0,2.4609-1.0273l4.2818,4.2817A11.8905,11.8905,0,0,1,17,27.9561ZM21.91,15A6.0063,6.0063,0,0,0,17,10.09V4.041A12.0208,12.0208,0,0,1,27.9585,15Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_RADAR = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>chart--radar</title><path d="M16,2,2,13,8,30H24l6-17Zm2.5818,19.2651-5.9861,1.3306-1.4226-7.8252,4.91-4.209,5.4416,4.0816Zm.1977,2.0054L21.3264,28H10.6736l1.7912-3.3267ZM9.59,13.4937,5.74,12.605,15,5.3291V8.8569ZM17,8.75V5.3291l9.26,7.2759-3.15.727ZM4.6143,14.3979l4.6535,1.0738,1.4844,8.164-1.738,3.2281ZM22.9858,26.8638l-2.5766-4.7852,3.0063-6.7646,3.97-.9161Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_CANDLESTICK = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>chart--candlestick</title><path d="M26,10H24V6H22v4H20V22h2v4h2V22h2ZM24,20H22V12h2Z"/><path d="M14,8H12V4H10V8H8V18h2v4h2V18h2Zm-2,8H10V10h2Z"/><path d="M30,30H4a2,2,0,0,1-2-2V2H4V28H30Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_WATERFALL = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M28,28V18H26V28H22V4H20V28H10V14H8V28H4V2H2V28a2.0023,2.0023,0,0,0,2,2H30V28Z"/><rect x="14" y="4" width="2" height="14"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_HISTOGRAM = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>chart--histogram</title><path d="M6,16c2.9727,0,4.2324-2.251,5.3447-4.2373C12.4741,9.7441,13.45,8,16,8s3.5259,1.7441,4.6553,3.7627C21.7676,13.749,23.0273,16,26,16h4V14H26c-1.7129,0-2.4834-1.2207-3.5991-3.2144C21.2075,8.6543,19.7231,6,16,6s-5.2075,2.6543-6.4009,4.7856C8.4834,12.7793,7.7129,14,6,14H4V2H2V28a2,2,0,0,0,2,2H30V28H28V22H26v6H21.9992L22,20H20v8H16V16H14V28H9.9992L10,20H8v8H4V16Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHART_NETWORK = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>chart-network</title><path d="M26,14a2,2,0,0,0,2-2V6a2,2,0,0,0-2-2H20a2,2,0,0,0-2,2v6a2,2,0,0,0,2,2h2v4.1A5,5,0,0,0,18.1,22H14V20a2,2,0,0,0-2-2H10V13.9a5,5,0,1,0-2,0V18H6a2,2,0,0,0-2,2v6a2,2,0,0,0,2,2h6a2,2,0,0,0,2-2V24h4.1A5,5,0,1,0,24,18.1V14ZM6,9a3,3,0,1,1,3,3A3,3,0,0,1,6,9Zm6,17H6V20h6Zm14-3a3,3,0,1,1-3-3A3,3,0,0,1,26,23ZM20,6h6v6H20Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ANALYTICS = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>analytics</title><path d="M4,2H2V28a2,2,0,0,0,2,2H30V28H4Z"/><path d="M30,9H23v2h3.59L19,18.59l-4.29-4.3a1,1,0,0,0-1.42,0L6,21.59,7.41,23,14,16.41l4.29,4.3a1,1,0,0,0,1.42,0L28,12.41V16h2Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ANALYTICS_CUSTOM = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M29.707,19.293l-3-3a.9994.9994,0,0,0-1.414,0L16,25.5859V30h4.4141l9.2929-9.293A.9994.9994,0,0,0,29.707,19.293ZM19.5859,28H18V26.4141l5-5L24.5859,23ZM26,21.5859,24.4141,20,26,18.4141,27.5859,20Z"/><path d="M30,4H23V6h3.5859L19,13.5859,14.707,9.293a1,1,0,0,0-1.414,0L6,16.5859,7.4141,18,14,11.4141l4.293,4.2929a1,1,0,0,0,1.414,0L28,7.4141V11h2Z"/><path d="M4,2H2V28a2,2,0,0,0,2,2h8V28H4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ANALYTICS_REFERENCE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="4 20 4 22 8.586 22 2 28.586 3.414 30 10 23.414 10 28 12 28 12 20 4 20"/><path d="M30,4H23V6h3.5859L19,13.5859,14.707,9.293a1,1,0,0,0-1.414,0L8,14.5858,9.4142,16,14,11.4141l4.293,4.2929a1,1,0,0,0,1.414,0L28,7.4141V11h2Z"/><rect x="16" y="28" width="14" height="2"/><rect x="2" y="2" width="2" height="14"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DASHBOARD = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>dashboard</title><rect x="24" y="21" width="2" height="5"/><rect x="20" y="16" width="2" height="10"/><path d="M11,26a5.0059,5.0059,0,0,1-5-5H8a3,3,0,1,0,3-3V16a5,5,0,0,1,0,10Z"/><path d="M28,2H4A2.002,2.002,0,0,0,2,4V28a2.0023,2.0023,0,0,0,2,2H28a2.0027,2.0027,0,0,0,2-2V4A2.0023,2.0023,0,0,0,28,2Zm0,9H14V4H28ZM12,4v7H4V4ZM4,28V13H28.0007l.0013,15Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DASHBOARD_REFERENCE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="4 20 4 22 8.586 22 2 28.586 3.414 30 10 23.414 10 28 12 28 12 20 4 20"/><rect x="24.0001" y="21" width="2" height="5"/><rect x="20.0001" y="16" width="2" height="10"/><rect x="16" y="18" width="2" height="8"/><path d="M28,2H4A2.002,2.002,0,0,0,2,4V16H4V13H28.001l.001,15H16v2H28a2.0027,2.0027,0,0,0,2-2V4A2.0023,2.0023,0,0,0,28,2ZM12,11H4V4h8Zm2,0V4H28l.0007,7Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_1 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>data--1</title><rect x="15" y="6" width="13" height="2"/><rect x="15" y="24" width="13" height="2"/><rect x="4" y="15" width="13" height="2"/><path d="M7,11a4,4,0,1,1,4-4A4,4,0,0,1,7,11ZM7,5A2,2,0,1,0,9,7,2,2,0,0,0,7,5Z" transform="translate(0 0)"/><path d="M7,29a4,4,0,1,1,4-4A4,4,0,0,1,7,29Zm0-6a2,2,0,1,0,2,2A2,2,0,0,0,7,23Z" transform="translate(0 0)"/><path d="M25,20a4,4,0,1,1,4-4A4,4,0,0,1,25,20Zm0-6a2,2,0,1,0,2,2A2,2,0,0,0,25,14Z" transform="translate(0 0)"/><g id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;"><rect class="cls-1" width="32" height="32"/></g></svg>'
-    DATA_2 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>data-2</title><rect x="4" y="6" width="11" height="2"/><rect x="18" y="6" width="10" height="2"/><rect x="21" y="12" width="7" height="2"/><rect x="11" y="12" width="7" height="2"/><rect x="4" y="12" width="4" height="2"/><rect x="4" y="18" width="24" height="2"/><rect x="4" y="24" width="17" height="2"/><rect id="_Path_" data-name="&lt;Path&gt;" x="24" y="24" width="4" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_REFERENCE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="25 12 25 3 23 3 23 5 20 5 20 7 23 7 23 12 20 12 20 14 28 14 28 12 25 12"/><path d="m8.5,5c1.9299,0,3.5,1.5701,3.5,3.5s-1.5701,3.5-3.5,3.5-3.5-1.5701-3.5-3.5,1.5701-3.5,3.5-3.5m0-2c-3.0376,0-5.5,2.4624-5.5,5.5s2.4624,5.5,5.5,5.5,5.5-2.4624,5.5-5.5-2.4624-5.5-5.5-5.5h0Z"/><path d="m23.5,20c1.9299,0,3.5,1.5701,3.5,3.5s-1.5701,3.5-3.5,3.5-3.5-1.5701-3.5-3.5,1.5701-3.5,3.5-3.5m0-2c-3.0376,0-5.5,2.4624-5.5,5.5s2.4624,5.5,5.5,5.5,5.5-2.4624,5.5-5.5-2.4624-5.5-5.5-5.5h0Z"/><polygon points="6 19 6 21 9.5859 21 4 26.5859 5.4141 28 11 22.4141 11 26 13 26 13 19 6 19"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_VIS_1 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>data-vis--1</title><path d="M26,22a3.9553,3.9553,0,0,0-2.0193.5667L20.167,18.7529a4.9654,4.9654,0,0,0,0-5.5058L22.714,10.7A3.0284,3.0284,0,1,0,21.3,9.286l-2.547,2.547a4.9654,4.9654,0,0,0-5.5058,0L9.4332,8.0191A3.9553,3.9553,0,0,0,10,6a4,4,0,1,0-4,4,3.9553,3.9553,0,0,0,2.0191-.5668l3.8139,3.8139a4.9654,4.9654,0,0,0,0,5.5058L8.0192,22.5668A3.9556,3.9556,0,0,0,6,22a4,4,0,1,0,4,4,3.9553,3.9553,0,0,0-.5667-2.0192l3.8138-3.8138A4.9686,4.9686,0,0,0,15,20.8989v3.2848a3,3,0,1,0,2,0V20.8989a4.9686,4.9686,0,0,0,1.7529-.7319l3.8138,3.8137A3.9553,3.9553,0,0,0,22,26a4,4,0,1,0,4-4ZM16,13a3,3,0,1,1-3,3A3.0033,3.0033,0,0,1,16,13ZM4,6A2,2,0,1,1,6,8,2.002,2.002,0,0,1,4,6ZM6,28a2,2,0,1,1,2-2A2.0023,2.0023,0,0,1,6,28Zm20,0a2,2,0,1,1,2-2A2.0027,2.0027,0,0,1,26,28Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_VIS_2 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>data-vis--2</title><path d="M28,2H17a2.002,2.002,0,0,0-2,2v6H4a2.002,2.002,0,0,0-2,2V28a2.0023,2.0023,0,0,0,2,2H15a2.0023,2.0023,0,0,0,2-2V22H28a2.0027,2.0027,0,0,0,2-2V4A2.0023,2.0023,0,0,0,28,2Zm0,2,0,4H17V4ZM15.0009,22H4V18H15ZM17,10H28.0007l.0005,4H17Zm-2,2v4H4V12ZM4,28V24H15.0011l0,4Zm13-8V16H28.0015l0,4Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_VIS_3 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>data-vis--3</title><path d="M28,3a2.9913,2.9913,0,0,0-2.8163,2H21.858a3.9807,3.9807,0,0,0-7.716,0H9.858A3.9916,3.9916,0,1,0,5,9.858v4.284a3.9807,3.9807,0,0,0,0,7.716v3.3257a3,3,0,1,0,2,0V21.858a3.978,3.978,0,0,0,1.6729-.9034l3.3638,1.6819A2.9635,2.9635,0,0,0,12,23a3.0117,3.0117,0,1,0,.9221-2.1572L9.7744,19.269A3.95,3.95,0,0,0,10,18a3.9963,3.9963,0,0,0-3-3.858V9.858A3.9947,3.9947,0,0,0,9.858,7h4.284a3.9366,3.9366,0,0,0,4.7816,2.8818l1.8118,3.1705a3.0451,3.0451,0,1,0,1.7326-.9987L20.6893,8.941A3.9839,3.9839,0,0,0,21.858,7h3.3257A2.995,2.995,0,1,0,28,3ZM8,18a2,2,0,1,1-2-2A2.0023,2.0023,0,0,1,8,18ZM6,8A2,2,0,1,1,8,6,2.002,2.002,0,0,1,6,8ZM16,6a2,2,0,1,1,2,2A2.002,2.002,0,0,1,16,6Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_VIS_4 = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>data-vis--4</title><path d="M27,3H5A2.002,2.002,0,0,0,3,5V27a2.0023,2.0023,0,0,0,2,2H27a2.0027,2.0027,0,0,0,2-2V5A2.0023,2.0023,0,0,0,27,3Zm0,6H17V5H27ZM15,27H11V23h4Zm0-6H11V17h4ZM9,21H5V17H9Zm2-6V11H21v4Zm0-6V5h4V9Zm12,2h4l0,4H23ZM9,5V15H5V5ZM5,23H9v4H5Zm12,4V17H27.001l.001,10Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    REPORT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>report--alt</title><rect x="10" y="18" width="8" height="2"/><rect x="10" y="13" width="12" height="2"/><rect x="10" y="23" width="5" height="2"/><path d="M25,5H22V4a2,2,0,0,0-2-2H12a2,2,0,0,0-2,2V5H7A2,2,0,0,0,5,7V28a2,2,0,0,0,2,2H25a2,2,0,0,0,2-2V7A2,2,0,0,0,25,5ZM12,4h8V8H12ZM25,28H7V7h3v3H22V7h3Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    REPORT_DATA = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>report</title><rect x="15" y="20" width="2" height="4"/><rect x="20" y="18" width="2" height="6"/><rect x="10" y="14" width="2" height="10"/><path d="M25,5H22V4a2,2,0,0,0-2-2H12a2,2,0,0,0-2,2V5H7A2,2,0,0,0,5,7V28a2,2,0,0,0,2,2H25a2,2,0,0,0,2-2V7A2,2,0,0,0,25,5ZM12,4h8V8H12ZM25,28H7V7h3v3H22V7h3Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-
-    # Form & Input Controls
-    CALENDAR = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><title>calendar</title><path d="M26,4h-4V2h-2v2h-8V2h-2v2H6C4.9,4,4,4.9,4,6v20c0,1.1,0.9,2,2,2h20c1.1,0,2-0.9,2-2V6C28,4.9,27.1,4,26,4z M26,26H6V12h20 V26z M26,10H6V6h4v2h2V6h8v2h2V6h4V10z"/><rect id="_Transparent_Rectangle_" class="st0" width="32" height="32"/></svg>'
-    CALENDAR_ADD = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 26.1.0, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd" [ <!ENTITY ns_extend "http://ns.adobe.com/Extensibility/1.0/"><!ENTITY ns_ai "http://ns.adobe.com/AdobeIllustrator/10.0/"><!ENTITY ns_graphs "http://ns.adobe.com/Graphs/1.0/"><!ENTITY ns_vars "http://ns.adobe.com/Variables/1.0/"><!ENTITY ns_imrep "http://ns.adobe.com/ImageReplacement/1.0/"><!ENTITY ns_sfw "http://ns.adobe.com/SaveForWeb/1.0/"><!ENTITY ns_custom "http://ns.adobe.com/GenericCustomNamespace/1.0/"><!ENTITY ns_adobe_xpath "http://ns.adobe.com/XPath/1.0/">]><svg version="1.1" id="icon" xmlns:x="&ns_extend;" xmlns:i="&ns_ai;" xmlns:graph="&ns_graphs;" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><switch><foreignObject requiredExtensions="&ns_ai;" x="0" y="0" width="1" height="1"><i:aipgfRef xlink:href="#adobe_illustrator_pgf"></i:aipgfRef></foreignObject><g i:extraneous="self"><polygon points="30,22 24,22 24,16 22,16 22,22 16,22 16,24 22,24 22,30 24,30 24,24 30,24 "/><path d="M28,6c0-1.1-0.9-2-2-2h-4V2h-2v2h-8V2h-2v2H6C4.9,4,4,4.9,4,6v20c0,1.1,0.9,2,2,2h8v-2H6V6h4v2h2V6h8v2h2V6h4v8h2V6z"/><rect id="_x3C_Transparent_Rectangle_x3E__589_" class="st0" width="32" height="32"/></g></switch><i:aipgf id="adobe_illustrator_pgf" i:pgfEncoding="zstd/base64" i:pgfVersion="24"><![CDATA[ KLUv/QBYVJkErvyFnAwqsNhQCm1AhxN98quMDxxL1wnE461trWYzkyK7e2dpirmsIOg/6HCzswMOJhBKC4ILPxc9/cpckgVreGxE9DOn0Hm4dMEazaIyvc5K8DyoKVXj1TH9spVfDZ2chl320jON5GfTeN5l6VaD8vN4leQ8sJg39CokKayNBD2K1d5k0iNvk/TIuQkRK0ejkvDnH+HI7bNQjboi+i6qXHpcJsproGcq/aJLKD0+dmIbd3v00Udi6QcODhFG0itmw7KKvp0kmR7Vu6CNW5bOL7yT3uPzk9ugO5Wfh5a/OCRpw8xc9e1opCUIGhiGib/x1Fhd9zukunSWDaVlHjg4SGAxen3g4GACATxwcDjAAwcHAlDgQQYUJoggAoTEgwcMQARgaFChQsIAow8cHC4YKrAAgUKFCRciTFhcsIAwwAMHBwoPHBwe8IAHjAcODiMYDxwcKKABDMZ0gAMDAmM6UDA6QjBmNEAFGtgAMeqBg4MJHjg4SECgQAOIV9lWt3TK1cPyiJJu+kiVB92VJI6iO1gAYYMNVKABIgDjAmIAwgHSgWGxqAUdFIfF4XA4HF6IgxcKROLQxCh+lTgoFIcy/GABASRcmACCDHzQss5e+1drpmf8jDXz/yxazpahISESDYhF4sy/nz0v7+ppfD1X99VbrfBXr5I5cCABB4QLf0jMD2dW2wylPDD7CtagvlbokhlkaGbCKs7HNWc3RXZolcJh5JRELMl/LI2oSkNp++VrwaCoguGQRR1Fw0GBULyLA4LhL88h8exAhTgsiOGQODzxzA0Mh3I9pSaqqO2yKbygUzTQF4cGMsI30CXDLQ6tywPiCAWCAdEEJSyRCURCYUV9Fj3YAhdZLMNBsWCow74HUx0O84iEAhuw4TDZJw4Kp1GhaC56hYpaGO2WmNaecZlCoWBow2GBuEPDLYyODg2JGy0UdVhYUVQfTbEBFbYoBoVCkTgGRCITxoBQII5ARFXnxx5l+mS6TPwYpuenzKqazKDzk/4b4lFK9cVnLPSM/SfbJDPuNU7Cy0+ayQyzPPpMaIrwbrWuJHl3iniUzhsTKs9kpdmcsy4zI18v3bmy01Be4kCLRKISTtTiCEocKpsNeYZD4g0JBMMPCTRiUCDu0IBY1IHKVnYKY7A5X91dHqJIeDBERKACG7DPRDLk3J5HfFGIQ3wSzkQisTAFMigOiFjY7IB44okxUWUDMpziEIdNGCEgk0ZNIl2fN8uMspneZSVDJg4IhvHiBwQcZhI4x2ANtrDDywwMp8WLgWHxUxClHBZ2wMXCVSzSDmUbmUahHtXmRavOZcbPnua6ew1e1VnR9R7v9cKrGl9Y9t/16liEWHiJczTs4H0Ozy6f7IbuzypMhkTDIBjIRsSbZDzONlLsSdFoW+mNG3bS/EhtUMeNucoMtzKjtfY+d2g3eUdVyyOWXc3yeZcvK0wq3yhz4MAhcVAc6KBYHKjsc3BRURGHO2Cm4gtE5ALBQIl6L6FYeFGLSywWxoAMZ0gwLBgaGNpADdaAB4aDIoE4HBa/yic9X80qUIF4QELUGXEMCfM1KA7Thp97OBwOgzi04ZCJibQ432hxQCAMFYkD4gc8chWHBCoOiGpQ5EFxibTeDC8znA5JaPLCCWKwA+LwszqQ28BwSNyh4Ysz1CHRDK8DMZyQisGKRRVFFAPaxgwLZmbw/mwLm7+skwhxJo2WGXizTb6OUySHBsRhkXS4Q6uB7sCQQDOrA5UPBws6MhgYSBgBBAoULlC35Txvhpk1tNdRtZN2ZkuPG2U4+EBlh3lEQrEoEZWRLQ51PcFQO9RsmIiD/Z6gw0scFsiADIc5NBwOVAc7POQRix8WUx/KDvOgQCgYGkqHIxYMh9JhHrFAHLDeOphBkUibQy1eCjtYUUWtiTIkDsSguM2H4ZCwLMo20OIWvwPi8q7OcwyKaSiGBB6uquwODMUezg7kQwOD4nDMs/JhcPBgdwwHROKZD4hCVJ6ZgQ4JNEPigDUfLLAgYQQjMMGYyT0pM1LoWc/N1pka5rhoDN1iYdr4WihnvXdkBp3MMCOr3otls5z7mmhXaEdZ5NJdz6vJXRYa5hxNb6bSjsrWy6oZmVGyNNpcbZBwUslvMuM0dGviO+M88sgM3zsvvGciVmZYW24T0Wb0wIHEQbFYTA9UdvnDYkxXfPHFGRpqQiDscMQTiAVDKXEHTGAi8QRDwxwwnzhMTWWXPyASigUDQw9zOFjegRjGlYnEQZFYJI44JBIJxQHx7mDk1sqdhjYcWjMsEK9uygzxiHhARCQWiOuiDF0kFAdMWKIaEoFG9NCgSEtjwEX18PvhncIWCEtblAJRhxdeWbXKQAwJSiASya6IIdGADF04a4pZpKJ3WAm7oZmR1RY3tSAFIWjhhHmBePmAAIa5m7Mid2FFPdOGxCAQYQhD0CAY3vDFE7+VIRlSkYhzTjYZEJiYeHhAwKE1ZhwsUIEIKjDOiORq3OhMx9gYv5M5lMyhhznU0jNGTZuikTn8rqLznH934jHjYAEGE0AQwYIEMKDAsEgcNkj48qOlUI4TpaA/Y7bMKFaZkUqVOEeF/iAW2scuMzrNH3UK0UZm4PQs8aakEUKzzDiZcZpjlp9GdpiElxmHRcfJql7iyAx0rzUltTVlQ+IOj/xYoS/P6sqMTBsslBl22NZt5ExLmbOy4/FG7lhm2L6WUeW4XJnDBokrO2mOsXHDZIPEAweHCiQeOBg+phAOHCyZHDdmeHR0DhxYHNAHBAOiyqBgOCS5IdGQYEgwKBCHTGQCE5i4SlCCmpiGBUKRQCAQRxyRh7BDGxZXII7I4+9XpzYkgyITzx8ujdKTDcigQOAxERHx0LCwkNBYHJzFKU7xy8s7YF315hqswRiOdmZWRl2UohK/sjpUUXlKQQlqOBx+KDo0HBKIp9twSCCeeIfyInFAPFFh03BgOCwOisQB8Tzg2aGBYZFAPA9YhzYwHA6HzxcMw0Dmgy1aI6Ojw9PpkFi0plotK8xC1CuhaBizUdnh7CzTEJZQNFivZzrEIRIMxSKh4cEQn8AELpCBsvLyEhGZYLD9DgxFTAKhaEBMYi6BCIZDFVYUIhQIF3FoYLhEw6LugVxkVXe4Obx8LhYNUzrcIUJxWAwd8oiEF25gcIPrQ8mmMhy8Q04O4kccFAwLhsO0pQOVWR7O0KBANGQDNlyDjRsS5oYuypA4edqgQOQQA4KsoRqowQ11QzVYw0xbauV8jsAahZFsF2l+NIo2TEMDQwMDQ+JlGIaGBYNikVhkA6IhwVDJ0BahaJghQsSioeMEHBo6rm1y2XxGp2+EE1Z4YQY3eKhkIioyOkI6JJ0QlCAFLYiBGmiq5aKqsrrCynohKlGKWhRDNdRYzUZWZnaGlnZDWMIUtjAGa7DDXM9HV2d3h5f3Q1ziFLc4hmu4waKRsNDwEDHxiMAEKnCBDNiAk00nZaXlJeYh84nIRCpykQzZkPPep9ftd3z+RzxxxRdneMMHUYQRhCiEIQ6BiEQcgUAkEArEAsGAaEAcJtGEE5SohCUugYlMPIFIJBKKxCLBkGhIjKIKK0hRCkvFFYqFgkHRoBha1MIWt8DFIRdfIBaJhWKxWDAsGhbDUAYzEEMxGMMxIEMynAGxmIY22BquARENiQZFw6KBYRRTU9kpUHFABeYRCcV04YUXB1PZYR6RWBzGd/ihGuoSCcXiMDWVMRzsMI9IHBQLhgaGqRsObjCVHWbDGw5HJBQLBgQc5pCAQ0PDoaGhoaGhYdGQaHhDNlzDNVSDG9rQwLBgUDAgGJIBGY7BGIqBGMrQsGBYKBaJBWLxRS5uYYtaeNFFg2KhUCgSCoTigFCkIhWoMEUprKiiIcGQUCQSCUTiiScycQlLVMKJSTQgFggFIoE4IhGIOIQhCkEII4poOMMVT/zPH/D2ut83JEMuMpGIzMS8rKR0NhuQAReYwOMR0dCQsNhwDKe4xCUOcXl3d3Z0vkOvwRamsIQhLC3trIzMNtZQDKWoRCEqC8uqyg20oAQl6JSUdGREZAYvfEgY4Tt9NpftesxwK9X1YhQ2VSIiImowgxvcwGCFFV544YQPCScQN+ZZkdvQhjb0oKgigTgiE6+HKjfMITGJWSQmgYMHGxubmmoCDmOGMjQwdNHFogtFD4rEm9hs9rBXq13Vaj1YFbltmIY5NDAwDMMoFpOYhCKBmANiEB/EE+1s7FBTHhrytHNAwMFC4oGDUZ0DBw4YJAaOjoMFGVCYQIFBQQIGGlRQQADGBRcoSJiAAQQLCqCQGNcCFMAqMCyQQAIIIKjAwICCCSqQYAQVFBIuTDBBBYYFCRhQmPABEFyAMAENXJBAAYIGE7hAYQKEB1iAQAGCBhJOMOEBG2BAQYIGiQGCDTww4QEgiHABAgoqYKHChQkYMIwTTLgQQQIJNrAgIcIEEJAAgoUMJmigAQTFBQuICxYQILgAYQIUJEBhAhpUqGABDSpUsMAAwQYmsJAYFiRcuAAhgoQLG6igAhI0iDDhggUIExjBBhM0qOCBEaigAiSooIGEE1BgGIGFCh+QsAjAsGBIsABBgwYLSDABggRgWJABhQkRIFiwwAjAsOBCBAkh8IAEBgYSVjDBQoULESRgIACHCh+gwAASmKCCBQVQmJCBCTSYwIOMwCEDChMuUJhgYQIUKkTgAQlMcEFCBTKooEEFCxNw4OCwwQUKEkYwggoKDCgwOHBwqAAEZAYCigemIOHCBQgaNLia1sPfH7+dSZliMMGCAh7glQowKqkAF1CYkMEECxKQkAGECThAFEiYgAHDQMIDDCgwoEDCBQgULEi4oAHiAdZq1Hn4crjW8SSZcQ6ry41zzPi4DqoCjAskTMBABQtQkEACCTyYMgDh4FCjfMGFDB6c4MEHJjy4QEHCBQoVFA8oTMhAQuIBdgMLElQA4QEjMEEE8oIJNKiwgQQKXJCQgQUIFigEDRouWEA8MA0kYFABAmcAwsGh4wIJGkCIUAEJGViA8IAHZQYgHBxuXLDBhQkULmBBggYmoMBMVQUuWEBIoFAhAuMCFEiYcAIJPho1NIxUgGF0ATSYYIECDJOrhAsQNCDBCCRY4AExALGBCCxAGAEJKliwoAMUKkyYkIEECnBgAA4cHCwIwIwLEgqgwAUbZEBhwoULEiogIQMII2DAA2QAwsFhXCAhAwgbXOABMQDh4GDZcYEFCR4YgQkigIEGE0yQeOAyANFxAcIILFRokKDBhIYHxgCEg4MIIkDQIDFQUEEDDSRsYEC4QEFCBhAgMChAUIFiXLCBhQoaVFBssIGECBUsTOACBQkjMEGECosNJFBgwgIcODjMMA1TAcaMC1JQIZEBhQkYUDBBhYQDBwdKuo4LJKxgwgYbQDgBBQgKBw4OEECM6wUftgHIADYukHABwoJChQkWTIAgFCpMuDCBwoQPSMCgACq4MEEDCCYoQQEgXICAQQDGBQ== ]]><![CDATA[ EjS4MMECDhwcLAjAsGCDCRQoMAwMIFigUEERgHGBhQoNlfO4gEKFCRtYkICBB8kAhAMHh5HysIACAbBQ4QIECxc2MIEGGjBgjAssVLgAQYIFhQMHhzFCBZDggQoYIApQgQkAwEE095OpE8soOdZ6OktKPlOOGDPN+EHXXS75p4bS6Tyn5S/7+lBVWlVZUu71dJbTed1TKR1XVZJLF4tQaDeS+p0NaxI7EkvXO02m9KrMxje+1+5nOJJFU/arXZqlmubQzJ3DCHQzc5/Sy0y7z/CFVTYP1SVR3X+VefNhVdaVDm1Hy8u9yGpiEa5/1WsMBes6IlquTqsfucpu1EKa9NUz6653ZUqNbmS1u0prc628p4uXSEZkZof5s06W62RZhC0dJz+tK1ubd1eTisYsn2Wt6N8hGV+m9KT7srPlbNbtrZhhTf4Si4wOC6c1ZvtZdles9U17a3SqTXnWXqKPbIw1+cH6s3hEtkQywxqeKc0lmbe9bF3PCOmXt7TbFRV27GYKLS/nruyIOOaq+b5nmmX5hb+zM5bk5PTFQjRdnXqF+LyRVdX5wcqXRyyHDZbun5E4R/r2pNZ8yNCI04G+28hMtaqynpHm7glFIDepXtkS24hmRMaqqru6nNp4N3Q5J9PdnB1OYZkdnutWvZw9DP/P3U7Kocqpk7FzZT46memy0l4lkrra0f1bekI7kp3k1TwOXz77WLamYu4M2mBxCgsnP2e+onppEq9063XUCLHqSD3JVtI6etaayblTsWKWda85sg/ZQlM59+uPNu+g23sVppmvacrD8aVd2fYrdXwTmXlcr5/d6Y5ImYZ0SDVWZm9V1u2P1KBrd6oaqtVgZRHPzqiuNafuru7SLFWbER4261Un+3Y1Wb1jTYK+oXqikZjtv7vjm0c7ItKlla5X2Tp5+JCmMKt3vcWLOX13OXXdfJXb/2R/dyu7DL0v3iMcVt2tPpmq1eO6Vl5d0pFbTTwbnfASD89kljaTVeHkf59SSrZvkcnY93MpMytvaZP3fK83hVJEZWanyhmiE5tamfiHkxEsfz4UnF5PluU+6Qjv+azcvfN097ojRM3y2Q6pQ3csq1wV6apeeyLcyUkkNmrLUpuo7tpIudCTM4Vkp41ITzLe7czsSRcSlm81RYanus5+STb5O+LxpLFy/F9ZWW3mO9UlWfa9ItQd7RR0r6zwbkMpaaNW8Y6DI0NHvRf2VEoqX69I7411XBHa3TFLYuoDB4fFuDIa7E2ekd3OpNUspy6vnJ51/DWn8XDsXjaTRFUkl+/odJ2z3zTvlWU5d1Dr6PY8S7PLg8/m1aW8tlJ539M2ueowPu+TaUeVWd7dPJZSx6nkwbZkdPecV4g68mzwrtRyUz6uTp7JRChaqK7M0pXrztnVq2XSuvaaGfGLntopQt1Pb5+ukmxWzb1Poht7WUvsrUPq6zROxKupq2rs33XX85ZiNp5M9bE8KdvoaVRk306IdTOm3Lhi45omrYymRKzff3JjwhnMeuKN0BiprY+RnaxGKuuyIbObfDksTrFnt3sJYWkMq3aYxhmZ6+/u5szqQ+Q7upVXT3O69zLF1UKkqQWp1aurq8upWtYjKytnztntSiFsIt0MyrFpst/nUllqyT6dE8vai2657JyR7DasUNZGY/bDJvU32LIX8aSuHqSmnaoodq2dEu2uZj8ixLbsVT5p9sr2HKtktvZSR/reaFp7z0zovfqRSe41w/vrJRvJl4qlsdPv5N7OWA5+5iTW1iA2wg0a+Ww0VaIb3Ukd1udMHzt808+zxLu8U91SJ9ZryrrSoIs+qtlTEo2XJ7y74zfPoyc25eWBHrzfZ25kXHPKnzmOUw9dqPCOjj5+Ss2TA8dKnlUj/shM1/Qik/rokX3o+JIQenTuyXxVEM1qW6abHjeu1CWfVSOcjvOv0jI/vMI8Gyz6eFdSTKqz56nEWDsJYS9n5uw02Ajj2+CnLbm20rY8H5X9Xj2TcbPueS9bil2zvfJOLVnV7INmgti3juzOMaFsYp3MWUIyl50uR5o9lhj2lYVoeIjHPBO0vlNEZ9W5e2tLUSlH6hY/2Jolj5MnfT0omPgrmR+R+C2l2Ivk7ryU+2tMfCQLPX2h1ztX+EkymemRzcZnUsqndT7vrUSxe4vdpn+3vEndzxANvlkl2JKVfiPWPo9Fh/Xh776fvLVXZd4HTUIu1lx55d4Wc6+IzvsVmphrhR+8oXzZ7N7XqOpWEt2R6lJVvHPrTjUjrtqmhEerqe5psrSamGZ0J5ulqjckE6xiVczqNEq0383lzvYR386EIuSVprJYdmY8uzskxQ7DO8kaxzsfYUfaK1iTJFbjbE8rrP1cFr+t3SwtNJyVNp6mKKfJyjvJG9OIzZfwtY/cdNileew5c7nXtrEnWordekX42ibxKue1K4snX0np4gguzu1zHfH1/F/aMfspp700JHa9orE5Ee14HXQmR+4Ub1go1RbaKdMkr/NRq43sWXmhrPTjTaTa+yvxqZPiDxonvm6YKPkOe6HUh214WCd0BccjrZk9mek4Vz0tOpHxR5ZXUw/EeqxwJMfDmUhDV3l2yoxv/NYv2I7Lo43ZO4z8VufyarunSJ4dxrxmy25FkmaNz2Jbs9NdOezoe1O8a3aukeTXgenJvB9ZDt6rt8zZENkdk0xElmanMpTC1ibPjpeXQTSO6ULXkXdOOqoOy9/mbrsfotFOjJBsvFsVym0iQiK0sd7pSGLrsLIz4S07cDyX9iJMoav/WJR2OqbU9XSJdtdxvpO8sxGNj6nOelP5tapU9l6lTHb8c4nWWzoeNmNiNsj8Xt3uF9fw8hv5V2aJx6OMzWLHblUWfEdljhxaNn8jkR2NJpV15wO9jXwcn4IR8rcWP3SVavu7HHzJJFbDGhs8nmGpOvjKrGQ70DRidvbK322M5CUBYvSql8SBhiMToTlp9cmaVF2rWb2JJ1a7rVbHtoL1oKlUDnSPVS8qe+tiyjFpDsRX1c0G5fXoK+Vs3Bmr9U6e3Uhjmes+l6CLpjblOmZe0B6198yuW6JJ2qOVN+PWnYZi8i+YAyuJWqfWYvIgoxN/tANNJveRVHK2kcU+aPJXdXMvOZb6uKzx1RHr4vo5Ov1hPetGcPyONEepZrJ+5RQbj8JbfsNUqxyp8TCdpTb8tFm9yCdW28xI2bBNGdWtXkJ2pcyVKTNfaYc3MiPRjvjzILnIlfOfZgZlURqB0oxH97nVve4qU1SSVmt36l5oJa4Omo5U0qU4hxEi0r2YJFR9nlg+0yn5xFuvktNRrLwxu7nWd6pnyXan+wSpw3dvrh0uLMM70ZWkO9BNMt7SJJ/ecHSQ8Pe0o7xow9NmWU7tFdIdVoebJ3TDtbl3U5KQdVyaZK5egjjctnwnO0rWjXM3k8r22XxIZtShFc2bk51O2eM5q92IZUADw4IAjH+gwgMVkAACBB5swAALiAcYSLgAQQIJJFDgwQYMuMADB4cLCOCBg8MHXiUdLVscoepqXCXPz+Nf9cRaiJ7x8WdypYE5l8JxdYnvs2yCpfKxQjjS5vbeMyRZctIJ2bh7iUWgN1v0mjKZs9FFoieexGdFVKLnuDewzEzP5m9yZG4EaCNfOaa7lZKLDzxwcIgwTDaCNjBPaho9pCv5BG0cZkiGPdNIsqJK7H21mGkcvgRznN9nzslLNsnlaEvjdKkcVonkX/6kQ4OmJnmjvw3L2ES5G+e8+1MjSfRI+0ndKHaG6OQ6LUsOR1LVGL3OFTQkkrxx9sOk0ySJy+NsUOrG0V1Tn2mKkcdLlrPxKqWUKE+sRtoIp4o8eiZJ40Z3V3LkQUUVo/GZu5yehCVTHlYn9Xhme7rhL1PYYa09dRedHNkYynRQj2bqd0eC5EEnm9TA6uXpkzaS5HFZq7QA49g3qapjVxrdeRcyD6xKk46sZ1/5sBfNdKNe7q4s1pH3M53ekjsPTxrFzvX3RDdEk5YYjUoiaY2k2oqO98rNo7BMrkZhz7rFk8X6GM3lW8fwd2WUHOtlGc7V3o7lg3lL/5xrX2O5roVkhVR2r9b0TZ1Z88/sXO+F5bSxZFhYU3ymT6o3V6Xi826h4mB9xsXP/UK1xLoNMa96sxx8XShmafn5pVhnBgdPzheLN/gznDm7w7IsGrQbPI01D2uJQlXTEvtg4XP+e61p1TE6hZy1warO7e5p849UKQ/h3Zs/KclQFltphndSKrbGEu9eiCWlwaZha6isxtZQzY2lhK27lxJlxsb1yxoZMnKlTXVTeLfPaJ9b9l1NqvfmRNu4xEoutF6SnbV+k6aeivzjGBVifZeFperUi352ZuwkqVN46TJi4RXO1KlceJKumbpbJEiu4dlQYd5rCIX8nuiWavGUdLyTWfFFc+KxT+3doFjVDO/GKklbx35OThJN0uluMbocGySaSbIyIeFNjNDwJF1HetauvrP7SFY4h2X6HX1C5xjahlSJbqLRy3zFFh1V8UgfoSIR0bleQ7upUtBibk/Q2Jm8K6q5+WpSo52zucPKYfbsQYTjOZN3vDUnWCPZ0WnVCJ7rWvdd11awroVGdb0S7KhVUdXIBEt10rrd9zpfVqagLVuWrMt5FA6VyFZX+0rGfPe5EdGVveUplA/dYUo97FQXRF8JkQm66oZq9qS4qNBu6lpiVfTIITS7ox4hokvMwyhZGjc9SpTa6iRIN06V7y9dyziZ/aV/J0iDEo2Mp/pZRMbPPdIeGfJJmkYNUpoqQ8PqkvLMYlRs674rSlewjGm2z5gzdLoZc7JEKHm1YBl7ceEnD2s4Px68yxdMNJQpk9a4e5FcGcuurr6jIY8d3nt5KXRYtbxys0amP3lYac9Z72VYkj7friXpzEskSee558N7Gsv+39OIkq85uf7KpG4U3fw8CI9WNMNEqRpleT8a1n+q0Vb99zl81bDO/dfDv0OEODMo2VIazeDRvarRmharr8/VxzLmyLTeSXI6+Bv7jSzvHrPLSSO6o9Q07ejodl1u426YT61rXdVN2Ld2SddsjyNJ9sofWrOWPY5dYrVq7JLasTGJ3bhzloeRvTfmktZ4K/sc3/E3Ndn75StNG7+qX0OdntTdqCnjZ8r8tJtuYhv5+TdewswbV2SZKT4XZZovb+TFmHhOy0vaj/40yluaTel1S3t2LoRj4/PVpZGNFBGNKw+mfQ5L6JXTzWfiGm7K1SZpHKsJ0SjzzOt2vjVNrfl2mjTf+ho7lD3Z0Ed6daU8qnR0m0s5D6oZz52uTHC0hIe9FA163XupJjRiHkZT1bO1zgrn3kyanEpJqsNcr7QiknERxY4qtdUjrcqyUkedsrR6UWUtyyb1sO++r9LqsKQetUkd2QMHhw8Mn3PoaYNSOOxuiCN2J4XjSWVitGbJUK0t3VW9ToqDxka9I+aHWcqrxJA6NXNRku9Yc8kqHbVC1/s0cYRu+D7UF9r3KiJ5Et2cfZ+e5L2Zo7qVFGcOzXCYPA== ]]><![CDATA[ k3Znchx4I6PeL7P3WDm0HJgziBbKOv8bPPGNUmXv/2iO1qL5fihXoyh3aJh/Yg3WTaLh9Wqka3YFryNYowixSTUbJiy8StoFb9y06FKMN2Ic9LSjctW3Egp9cBif9ojHzmxmYhKe8Fg2rWNV6Ea2R8/1molHC92o+xLrxlNCN554eTi2FIerrmmXBbHvceQcx+odsmtd5XDcjY91NKscHdVYmTOeIfwV65Rufym/0Xo+7VOsz/g5WMerkpcqg+NU8jlJHFhm8zvC6YzdzmwOs6qpkRySxHE1hFb1tPxRoVieoRhJYllZj6hVVmI1nJbVmc5pnkS6HDmIg3Tm+y3J5MYtmz/yVvv8doQl92FVPapY1YtjnTty1cuGch/YQfLJzDJ5m3ohfsb1krmq4Id5Kmutpx/Wq5YlK0/w4+omyQplLm1ZJBqrGkvi5MkOx8yGaTOTmc1QUtBcP5ScOVvW8ojO9vpLsMiMknNnu8s5eKb8zWpD9lplVVGzbFp2E540z+jCYztqrOSSmymzw9Z4e2oM76xYVRo8J7rZqUJX2sxD8bXquTLWD+0MPzOWdia94l1zmY6zhygzdSXFGuMp62Ra305zJTUc46fZ29lNjmsyZs2TIraotrTjvZU24+cKpzxph0QlrNoc7Tad3BMJn2YoNB21NKLxt7L8VNWk7kz+cXmvT5Jdzd3lST1bvi28r0o8vZ4/ZuJpDafwtZ54BnuvpkmPcup0hL2ZqjMsSa3Zq0OXjYm9j53po67HXu3iz91sl7N81XqZz6FrBctCzfIlkR1rh1S/ryhIJZTDefmhHHYvShOshXIkjTk/RrZDohxFHNt9zChIleO4J01JbppF21LFwDu5HFhURsuvJNFuxbQYjvIdJy1WMRxHs7RaHb09GzGqE2baGbWc97K7zqUhEfbGWEgoM4r1gMmsOcvbm3vmU8xDxjtYIOEEExqAAQUGhgsUJESwIGECD0YwYTEWocIDJGjgAQgXJmDAUCqQ4IAHG0iYQIIKigcjmLAAwQUMJmTALnxAwgM0qKDYAAUVKPDgAgUGGGAYCDKYIGEBDyRoMMECECRQwADDeDV2Jx9JEoUKFhoeUJjwgAQVLPDgZHJp7En/wMEhAqbgf5Wadj5lPGYtn85IE13iPFYqj+hiSUaCeZOyW8weODhEIEPqCNqnKGiWoUtHiipHdE+5vniC6JMkGbc+Iax40D6CGsHrfajwtp90ilnYmvh6aYmlQXFmGVoSU+gMq6SqjmxiopTxUT4zZFIWo8y7XJbJTep8VzESpuBdl56WxFuODxwcIhTJZBKlieIcmUtOe/czzQ3hberkpnh9Fd4KLzPFk2PhlUryziO3EbJK1lyqEFGsTLDuu9zsl9ilk2RQBukohISWZo2dUI5cpjRNNGL5gcNxHo0s4whoZK8ehXwiq8QSluxIR2JUv8ubwRu+JMsqf0mXy5pn6uz0NDGWZdmZI0xz8Mjo9LP+3v7sNTMZKuHZMdHkmd+nxhLtWKeck6xpT6wTi5A35Rcx772ekM3ZG9HU5J1lpu+1tN9fqRN0JxGRjEV2I45Qck1WVlNqOio7Sd4Q1WlcfrHkR1dm9u8Tpu15WBghsSVDbt1E15LnJrNJkQ8rZTZ5dp2/KpRVJY6ANuX9RmNXL5qR+bCy8u13JrtBGUOTflDizRFL7rBMQ8ecQxMssuMxK5Tj0GNPK1fKYjmq7PwZw3u5THLkfbAjGOFm5fcqqXakKvF9NPuVCe9EZqFMyrvHFcGvYuutUYbsROvQpdS6zysTp1yTp+7jk9iSaNoK1R5IVv+OcxnBZlc6sSr1M3RvuuSq6Wuai3Kf/V5EJIPOqd+LH8y7chbak0eZt06v3R4BP9eObyx7U708okurO//Q7SWbU9vtaNaXjcXWPKtXZ8RcFCGtVXILfZ0W2TR2o6cmJRtSZhGKkbM0Z5Y3tIpFKNkU+Zlkv57XJA+dfRAv9kzanVXPXrwJmR3nSAojnFtl05qyRiDbPYJZl8yyP6cRCmXLSoR0tBELh0bw9x7JnFTlpFu1hMqZV67C2lEEvNXMGd3mS81tjp6fCpnTanWlfZvmWje6SsklcvOS5JxLQiqbTWfmLDIbnflzQiQp8w0Jy6f6nbw8PbqRpWSqyUhDaMJMN404dEyPFJqeN5U8nOmNzK9LSVV+TYlcrut2sEbfFXvTJKfx0qsH6zS2+hWZWG27sZKqm4lIZTvx+Tqx2huhnMbWkMuqpm5XKEZndJl054xlHbEkWR7Oq9m9OiZH1Tq8ux9J/0afLBIyF46VTXrOchEs6epJZHFd529ot7XCOiPY7pI+VW8NSe3OWVXVljdmL81PWa/PUuOTtPZgfaUrM5Kza3Utsj2lyM381CdvQmQ8LLeOgyYmt2MutO9oVXeT5LXhlNkJjtHuY3uZT57FsamaXxQbY4Sac6liNrqwnvagOryi6ywfZ4g3Z2ZVeLxZz1a8ee9k6MqY7974mcpea9CYzdaKc6zLejV4OYVWN1OWTjPa75LOh3bznOUNegw7Nz0pz6H118vsYM2mWHfOeloZenpnHaNzJpXJpNH1DFKe0HZzRmh+JZrh5Z1liYbXH8syneizEpa9RXcj6cO6qy9fQpRW+NoM8fCSnP97N63Wnlr0nzITDzEzKZuZ9Wn9mTQ4T1f7LE8e785KQkNsi3ivahbth4cuG3uPeGh0fazBmy7lWpVVY7sZdT7moOrkyNbMkeZ1s0Lp2Oados0LBw2P5mQpd3zZVHxtEuGnSGJ/8fJE53nG6GPX7rvmHwcZuv5lukfXzir06+ixrVGtN9VsmLVhUY7P58jeHtltXHOZgzBvZJQ+o+xY0YaZc2ivzXvoI1u1ZLKskVUl2ijD2lmJaLuzhKP8ZxKN3euPPcdor5+kaf/btD/HP9ahsZf/wvf+2qRdIfaGro5+Z0W7qBDr1iy/duN35VutV79vR9sQyVzthrVHNzPSDfGo5uSs7luvcs44KdlxKkyrkTJjTtbwqEh1XeXdj4YyUUoe1leIxu5IVkkiPBy8YP06bXeGKG20ujOmjeNE+Rh5hAY/NcqBeVeeCQ/x6by76qmywUP5LYnmBn93v1umzRbT4PWs7mOjyZKkgbVqni9HP7vkaCDSO4jOQuegEJLlmYrUcVem4qmTv17dXStp7hS8uTuZau7uqefuZHPfUdFu95y6Kkqyq0Iq+ZQ0Mu+qrojuzruh74hV+Rq6K0xLI3KHrixpknbf5EjauKva8NXqUubIi1pyGvgiz6GVjKRHzvEtZ0hOp9Ei9jTyir31qLf0rVf73I/QpM7Mr+9WiroPnzTuiQbaIGXVMm0aVZWImL/pII3VZbokM29pN3hMk/I441DZpGC6bNLG0mWTLnsmials0qayO4syaQ+jQiqbpKJLMdp1aEPFZuU6zI4SO85GQiO0vBYmzYlVYd5dpunEnTnEuZuVylg9mQKMZ6L57lIlq+h+rRuyrTKDsM54J5lhheS66pWN61rPOc3RFRGdlYmNMpoj+vBNy9e572qKDlPwVDc1HXlpVHd2ZURCw6Wm3YumRj5sVabdCA07GoZEt8ssncxHpLDHO/JpdCf15B0NzKtJmzkf71R3uYFmx7R3xq2Td6O+J++9pliaa2epoMo77GAWpRKLbXacMUut4sco64UtqcG8kvPl75i3vP3U5SEaoceO/TWvz5NdPYlVtYuwqGpIhxXXTDVOF38/M5poip/+bnetl/UyNK2iK90UXyJztT6tztWq1ypVW0tN4rw+h5RCU/SUEbnnPFu1RFM8JdmQZfBOOXUVc+y5Z2Ki3c+JR5WastbvUx890fhzJ89B9OyNaIbmqK5uSURiZSd1rIS/XhrZP1dVISOp2ydrdln94ps5Ip+L/DJL6dg0hkSfqRPCNNWhGQ0JT+YqiXxSiVa3Oipm5bg6osph04no5juh8/lKU9STzFE0537gs9Co6pd5C4d6S5Nj4pkLT9QmZtJvjDmUlJMjXVVIZtneJVISYVZZzmsq6b1JqaQkqjklUdlHSb++N+UgZgmdxVh2YoY3UF6eI9XN0hxFP18O8/xGY9POEVl1jsjyk84bpd2IbFjJNyKzJMQ028iFA+1YRMcxCR3euKuXQkcfciGd7ux5zhlypd86StFcL77ZITKryxlVZDmVU0WTc4PymFNFc1NvHpF7WOQZZTZTdfSZZD4qp0Nmk+1G6tJvrd3wZbFqIxo8RBs0+Vh8w9Jy0mzszOrYpeLHUxfrk+VeffAsx409J9SbI6xWCX5gYVtHWJVEWDlj/EAnXtqZEyXNOJ2rVp5VJgtlP2w0tqvvysqeWfpdfWNpdjV3VRScuyqevXefNB5NJzh5I7z5Wb2JJ20mh5RyQ/jOndzUColqs7s6rLtL8H1R8dMm1qHZTF2Yk2OTaQsrp0mZLay8oqsps+1M95SC42shWqYmChUmXIBwoQIFRmCCCBEQiUQARgYUJli4UAEDDAvo1qpQAQJgU3PO3LQ4gmS5pWGlz4Nz5d9AsymxLZdoREIvNDIV2UdlVyHbUd1jI2Qn5ZGtZeN7aVX1bfzOjmLLui94NSP3pjnFVp9DMnPd5NV8SmzqZr1utmbZuLJZNoTXbJYhUjtDtszmn2WJl7lRqiOS4dHu0O56d8aavDNCnLSrzg3DK8rD633EO6aJ2SVZ4Q3ZadYeplHlvefrDUO89FXRmHZqP4SWV6OUdfvVq2ppdSVkwyztuY9RCdpZzdXcma/mjG7oBmJt7jpUhzZnaXNER83sfeYpYzZGTY/EC2UHWqUcjZoe1cmkkRGzznDwKG00MFuYRiuivBRvikZia2dPPFWlmSpvpAhpigbZfKhojIymiEz2dA2ZVObFzos9nmUiqySrLKXpUomCc1923AONLGsnTMXvxm42djWSehjKDFLV2XyCRpi+OhxKu8kxXl8+D6MsvClhzWTVUqwbSyevps4pOtbnPlGiB9mQsyZriOOsr65aj6NZ/d4lPGXTVZ8x+2xXTQ29VZa7auyigYTXSjLLKcdWdWIRGaduv7CyRr3GqTIrThFN2UlW0eDUkEyKbDsZu9ZWo8yKWURCNrKYdNWqE+WvY9N06tOzKaSxK84UUsmM+WUz50XDuzGkEoWRh0b6p6qh6W1TMlVFiNgrldRGIU9ROovV21IaZVbrJZUd2lRKI5+3tpX0IHTSlfMkiGfV8rFoVTaChFZVD/ogGiaaVD1YHxe9jmmTGUOsmnzlXySpnsYw07Lo7PhakeTLkMaZfiQ0LG+t0W9SNxZ6aVw9W6MiRKFB+Gvt0sySHfxPOHazfz4WypOJDScilU12ZqDzrKxuOdI5bNm4O0QoNYw4aCklNW5YgyODHbHRuaz1Uj/L4IWGT9ezzBQaNTmsUdi8MsxMqY5LqmElr+om7c44LY110I5G9+lwnMs/z88GZ2h+Rk2L/bO5M89KDLNO3uwR9cQ1aM5WHRoj1g== ]]><![CDATA[ sZKw7GjDOtY2ipRXd0SUWpWcULJG8fMqSazhz8sSbW4rCyWxzStEq6LK5pQt8zXSDsn2wZpk+jf7JLPIiZbXMJsiW2ZpjmyZfY3TnGzuqUyFllJ2mUrqTNnJcsRZSkw02rJHWPvh3DArJcHKIjpqjd6SEfbuyGI+M6vbJLonGZ0Zf0lnxppr3c3Oqm5suHx1ZhwbZ3VGmRs4d5OTTmtvdJ23956SQ+PqZMZYLqwck11N8e4/vUdHZre7Jt6uRZO7gVTS5pwVztg2q9qO6iKnzQhRNoUunYlopHsOhYasSJVEVJ2yorgtotukCR1Z8dSfuIroYx6YebWze+5BF29nFGp7KTZqs9KnIWEdXUmyVmMhPn2Vpaopo/zw3XLqeeOroE9VdeLRmOfjISRC+tyV+x+R8UimhGU1vnhEvrYyrfrYKFPiu9r4mrx8LN+iEy2NCnsb0mtuwXLSzRyNMG92JpdZVXpF2MFqGd3m7nmEhc9JMvo1Uax38x8eJPMgGZ2OUsz8n4zee1obZ6tIvzImNZHO8ohzVjzbodGLTnlFLxmmzYfna01X1KSR+qAWnbV6oSvKWp2kTQp92CTN9DI6jjzh54Jo/YmcdCQz/N1+upsUwp+QpsiSOOiKmUbj+pleco5P01w0WE0pEw7Xy9A1d51vxneZb0J35cuE0Cjmshkqs6/kcg2fSjVOHKuS13SxHxXZH3WSxFpKeYxXP6Qcw0T8DeW5kDDx6uM6a3MG8Wo6rI7tFd6ZRb5Dqk/nxL6k6VDZiyesyto+alaiV+eHc88RHyU/yBCfNbdKyo+SK+tZJ8wRzz+I3md5PIhqkFpVM0NChnMl1B41jTn2kqu1MKcAqGTuC2WySFNjDiGliEiCAADTEYAwQDgSDUXCUeGYWn4UAAe0nERaMhAGghxLEzmIkDEAAAAAAAAAACIMgwDm/ucWCXQUMcmO94UEgdiCVgSD8GzTw1iHHd9Plvyt74Ps10rd70Ax0SyITh0xdx/qUZb94yXzC98+LtuWErJJwTXpLvfqJFxoKqsdaZDz38QCow5cMiDy67WNILVWLWJQSN8qI+mVcvdSSTMFZu57HauAlbKivms8yTP6+wW9VwTc10NRpC+/qedXhUTxGdHhttLNd69lLaF7t0BBxsjkWs3QTFS7XMDms2+NNp2IqI2ozAE9zx18bsgppCsfvkcJiOkv7MFJj4jw4E/UxWXHnVnaldbm/kaHotFIA/9Mebw6a8fjTDH7qGZ3h+KutoWH3BHWTi/FVFTjdtCJujlPkedtW6tVTuzxaxgTJvQ8BhyOiescWkvyYTompip+xUxCbJj383XY6u4yYaGCt0wrWLV3FYnYcwODGSwyLhA24egr2aNwPI0BJoIc7QXPWn1u77syn/P6a8azsdjbYrWIyWO4Kpy3gEYNKDXkyl0sjM4E8I1yimQUkHmY1LYgg2w9WTaLbSIJoRU2i5kKPVjQBwP1+Lzrwf6iQFNGupuRXYq/LDfWoKUwIEJqxxSXIxzYdtU9EXKVqVrmUDeQRU9cX5KpMU85KKZDBTgBW9xCwkIY2BZk5ZGkotfrWGZ7mTEbWTcPn2Ip44H3LnZgXkkBWGGiFw8Ayt62kc8kLJ25I5mmi/Be/ArP4FKSiPp3irdgCzMF17lj8ig86+8qJp4w/8qoDnFxPOQx7QmmhmnQO0owk+CqljcTkeUWDtiJnH25gF3x0ig6Jkj9vs/qfLtZX01KeeL+8wftMv9NukfRfTBPnwtrZd4NqymChoJnE93qp8B5FnpVnxmXTR+oUd6OX/wU1LfZN2rgfKolkA/P/Ty7womxHzAcbfMyB68CmGXYbEad3A+89jympFDILz6YwJcGf1yuknjbaTiRR6j1tiHyLdi1skr7IzMTrCKy/eYgAgmm93NTmAUIkdInwax9PdNUpmrCrxSKqYxHdj6Kb+Z1g8UIiYhDTOoPiLCGLSiabgeU+vtDqW7qlA/yKkfTCWY/6qSCyPWhE3xVWN/aaxZS47VECWhQZ7YSiYn3gLNfUkPoWKnTUmcZFR1X9hiZl2/xH/fBjOYvoEF2DKLHY7XKhmAvHPI1OH1hBpTtQ3X7WuUoBGz3cArKSkVO/r4+vAlwhxDIZXF0/PeKmObBQbQypL7/7ruBzuzLJqFxpqDFIdV5xJZtJYjE4N6dGN3neTazYeQr/DuH52RbbrnmbNYq8DEAPUHL+AzkgfGTH0wvD+k53uMj3qKk4K4LJpsAzFSUoi2bldEs8E1jcR8LGfPqgTBj1IjVyth0Zv/LgiV2J6NPHRNmCZ7sNB+/i9AJnNCZ/cNibr+4TqZnjyYA9b1fyl1U3U7LEwvc0EFNd3IXsftoKw/WxhQ4nK3RVA9MrNDHl2T5WiTr1tp19R8RsZrnHGnkSdh7pX+6pEUYBMT9OGNt3PgxW8KVB1z8G3Ui1+QXF2epNpUcAyvX/PAkpfVup1huNb9HqjK0RZcrwkgqr96G9HygTdbD46bCTEUvP5tBJB/kxgeAf5n59dU8oeZjjvuThUVY81Zf1leqACwdU4EhyIhwKYpVLG0+I1brZndalUR9Omr/Rf+25X3rN5Jlb3kIQ0OkCXoGvCnQ4TAl8bEAbXAurC9PXdePOsNtWGEBYfKRh19AVw0g7nqUMb6iAvzhJSEtm+QTad73ppKnS4KJ0OII5FcfHeKVmAwJ5eFudpNPHIrSxgF30MtDprRC+1ZAQw6xTDuxhlaF/qQr+RavKtCJgt9Vd3jn0zxPgxmeXU4atkaBy1Yy7Rbr2gKv6jQO+rNhIj5nkXISNhTz7dRaMGL32M0cYIvQCLMUA7dSjwpHDmaQZlDA/ay8IE56O4D7EtTv/X+yTl+TlK1xF1iQPb6lMDrCBxIPQFb2iCQ2VwwNVuc5AfhyVTZleeplukV+dOAqdKdcloJ2BCgvo+eYRjFnQ26dlhh54bKrGT9lIEzAH4Qjm6isLvQtO029GiR0qbHOhaAKu6Ky9YZwUM07iACAkiKoz5EtxPRnQ6enjXV2UciqCmCS8uStJxs7VEoUPOJu+6EzLSJSL9QOoXcI0xOuO4ItMHsO76JAplUNLzR+FHPTjwcu0sHFJ35bdaWDSAXpCWSjwnTAIXNoCuIWiuczp8aFmomjx2iOEa0+Bvj9TJvv6SyVIM9mU7eRhBoEgnQQOjHnlyIbDgS2wJk9gc/vqFPKnkOcCfwLGnX05knNEZ2hUxYo3qnqbgOmKjfDkhG6hUl4siFDDboWXtO39qZstC9DsoC1BEgyB9AeNELCfHQ12RblMRi33X4JBENnFN0lJEVRBEO5aucStmEo1LtrJvA50NN2JvBH2hwofGDmWEd22HqUpMdHVWyJMC8+Slx5REDobWnZpX3dwtRXZRD/WCnUFX9Q1htzPIT97JhR0jaV1r4jFYjr4t/iJXRJXRu/kVYYJl5K/4S8eQ9OpHVISQ++BDAOWD5+Xls66XCeMrmfOq5NuFONyRqV00UQYMI9Ky0q2iXZ9dnPsXpkXV0nsUlHVDE9pSbzRROUk5WVTppvrOd2q7Ee2VmGXzPlyJdqGocEnpFn4M+pBx2gvLuA6FLha3hLfQJqXa7DiHxvUHjvoVXPkiPHQM85Z96E6/fA/9VnBRjZB25GZzpTMV8lx9USYVOwmYbSG8CdLeFaMXAmoRd6ZNjOeUDinywGfgLf3ZW0RRnqwc+D4SmK1DF1W31hPevyT5h4TGJq+QDI22XXEZk1vSwq7Z+EhnZD9m+bzD8SVlztobf8pZv5omUL7FUY/UVjtZh/uVggm7BI9exwGF0tCXbesFCfhn5cpjyqIQySNwHK6UG4nw+iJpdCHucI+x8SQcjIdbf915ijLmnBB8Ra8ZIwUSN6a/XwetroZ+Rgs/gRc+DLFGibLLhmcTrsRl2WeqW1g5kAHekXW0j4PtTyRpYea4ueeJcASbUezTALAJGDiwxm+qIDpvuvVm8UGdsNbdBE6bFASiK7uyhhN2XerONQAhCNhusuF69r4/Wb5G8RbVI2/dKTUOaR0qu6Ww2qH8gzWXjrD8Gnk2Ye+iBU2cwxguPzP5BOdQbUMtdrNAMNobZf7jOnqEtpK7akKmxNSu86+Ukb+ARv9fhLjL+bjG/XgeZ/g2x7AaukqR0my8Hwfphb0hRYtSfnuPKg/TeSeolI+lJfZ7oLbczzgeNgvuwQKXRgzpBaC39YOi81hLCukhKtTYKTJk+4tkvztS8Rn9sXrW1QIQtlfSXE+mQ+GnddRbDDMsW3Sryg4Q4zPwotRXLSsOXbJTlemM3e2RIHk9TLMShyZMuIsYiolEF0I2SgZDZliJEG/ORp+y6GSZ2qlMtSPSpswbS1XUvDAmqYMW83C1+qwyCox/Da2GEOYhd+eKtsDgAOcjIUPJpBj3SiEwlPRRU3Qo/2uiyl/N+zQbqFbWlkL5bL40i1TEneYsEzr4VIggiLChPwnh0vr+E+qT0EzMOQX4f2zpvJicA7iFk6r2+GzwHVTWJNxT/Go0ffMkAlzNOs1xP2WqKvBbiojupa3pN6crZoCK9oMjRBBB+MYfw8njQe84oUJTqImd6vbNHf9C2jEFSoT6NOqOuyXS8Fou0vI8+V81Cal3youejLBJjMbXGJC1cI8qUqy+MRJiYrruTaxQz6Ci517PjXyOWfwj5/hLVYl5dso2tsTgrahjbwQx2u9GBJJBqIStvD0MaUFZA1SSCqzAcaPo16Ky0gJprUhtCzL3ON9a8iU4e+LZ0zJZFQ4VNjNaH7i6WMX4uPRwKyATrHUotpiWgiu5LkwGTJKsS3U88nwF0HrCHslfcwcYalP1Ick+Kz6ny8iIL5kKxeoBnCU86fqehWvz6Ib2G4d4Acr9O3IoTpiNVW238sVrZSKmQOSewV5g3DYdBc8irlY59TNdvJ0kEAb0E2X9+uY1+eKL7at5MF0Nq/CY17qgRgmP2Yx+IUUGoI3f59atsFUPXfFBMJKndRVWdrmHesEu/9sF9DuiS7sF+lO2qPaCNzJut2JRuv3jtHNUevtFP922+6WlCZyjvJ4qegKuqY32s7hK28l50brAKAF2HWC1uMbf+xL4vdGwhLwrGQtDfuVIXglPBkGhRlaMwERMYaAJy5CbtsbGUeRpEEOVoWlMlEZe3I/Um2v+y4FhNWguSB3IuVyHJdbDnaYAe0YNWskifAnPGKy4eoex0irv2Ml0w62M/te18zyF/qlZ/8NanJ65Y7XfVBOKcK1O28EOc/gwEpKgdj1frO1ROgB3QB0UIkpNPHmvyD1wzzRUBFjmV+qpL57c6rcrFtei4e1wS2559Ztw2zKu7k6QOJPDTy6mVqiVkxJBivTdFKGZ1Zcp9nUT9sCXbdD1+pHfRczrulEq36LddfYs9kHqxivywqIIzpikzeo9Hw/BYH8THI/fxFwJAcz7ykQnQxjTyaPXPa0zeLBmcZv07L9+PVncJNBtlu/w/j/+r0SGwfwg== ]]><![CDATA[ 3RZMdA9aPpfJ3Ee8P+cT8S2OpnZV4XJWIme/DFRJgKTqy/b87hBTGxanWCFBZrsnHQK2G+oIZ0oxYF7pZESOyvRfLKouWk9nYG4aQDyr1pDVrMw63HG6EbQVgiFjapn5537FjuQYxf+opeYkvgcS7zPQs1kwkTw9Oi7imW6CdqcqSTyiDcgUdjEE38Yai0BW2USzNGI1o0IkS2vg1UfWYGLzPYLR2A7qHYD38TQyoM66I2gZIaZhaj2RC7lxfYj5Be5NFlHob9z1vJBKxbuuiGutPfxsi3tFbJnFlCa15cXRioIPT+rdjHb8KciVW9rEtcPgIvEd8ubija4gL+JqdWF1pdzxsbBx8OXLb3khA0bfneqmTaIsZzqYM8PGv0PWKyfFQlurw3ujTmu5L9s11B3IGko65w4bP5U05NdkJmURkBVCgtIuRPeLY7a8sBDHvNzqJ1ywE/N6Hrt3GbzPOSTe0dgmGqITiF/DHe8InYEmqUPKR/pU60h25S/KkD+o3pL1v+HTSKcjYeyOlifDy9ILHwpUyihTooC8hj8pCkKt3mbXguFgxChbghAmzZnCEHLLqH8a8YU3MJkD6O4rk0R+5HHEO5Z/piDtzC0TdCd4z272b3iYJ7BrGp9WwnDQvy3ELV/o3U6n5+FlGki4mtOb6bSaOHliC5FXQJl3buJMw9XJH5LP9DX6sdIb7TUcAS98/4KrFgt7ZeMGJN3VoxZVvCItHpKTphEoqgq/iVZ9BSwIXpeD7W1JvrC3bB2H0+mR1n24D6InPlgu15KldamJ7Tr71i8IR5ULm0BEKqUcIMtuNsgMEXFO5h8F4stDPte8ekYVNNibRxoGb0M1DhawpktIsKnDirwwP6BF3Jt1QF0unTgCGwyeMRIUvoEaDYmQLUYarSTulMsay3ECtK3rS3jStuUng3xWyoNwjeCdolEPRxpCEu/IDC7cUGrcNufgx4s0OMHM/HP3zxM6IdeQ+3LcccN+zPcpEDiJzrvjn/7M2GfzIBKMsJd/gxcfWXbQiO6IXkDxIsjH7y/KXpGADqjHd1NQXzqjgzXqOSlZU9fsnt7d61gHZ27MziYC6G3WIL1ADiC1LPXOK7mXrXuKjbxYMtteB03+F5CWIlUwPk0B8rII/lRAchUDxSZKCUQmR+I+yjI0TCrisegljgJQe01LFSzqxsMQtrHGKS4WkveTgVyOtdNwS2PUN6VoPt0/1dkUwni0dQBhaOaU7SpRft9egMtAztsYkxuDCQFTc7cwLN7KyUaIEmkCTz2GArD1PXAtdFmrAtJt2Ga4dOi58ns5edS01Nkstd9Qm8Th8pXRuCViMjZfQQCGCPTKoJr7Dw/3pCuIrDcngqyDLQb05fgsfX270O3N2VuqUPbkPyzs/UqLLcIbtHowDoAdIAwtP/uUXa5azHUvO3W/po8zgFNj81EFJUY9O8Zr+gdbNQq53xUNp+7FW+vLzb7XATQXstB3h2hUI5XI4N7DGJOxfIiylicKAdFwApeOvhJ0s6EstxsZchgL3vkFmdlHwWx93L3B5KPm4M8XKOpBAXaK6DInkg4f9ZeOr9xcCsX3nOtHACPvFgst5yVvqifsdKEJF21f5jxrL8oGM8eAaMHCSsm13zR72jM90zMJKBeS1Tsc8TDjKX2ish7Ri6DIOwauxSksFc5ZWUjI7bHPCZtSdozpnk9ZutnBq0NgPNvzvqLRj2UDaSRI0zhXBnzPxBGvYCEoajpMDsk/8PwBE0J2dITXS04Pc48bv9mqrWwDy9GLsFQOy7AtS+mY+gtfGkGzdWO2qshM3x0AEDHet7AcQgvVsFFgtbmGifFpP+8Ih5xQMcQsPxnIzkE2OnTLcQJjg76eeCDP5a9MwiOqK7GkgjgChTQYx2ZcfUNxtXiln+cb2iXk/BFu5kk9riD7lVGMpaWQwNNCliiVc+etl7GPKIffUCP/x0wBdmLHT65V1JHzclnfbVxcYQ8E9CwVXUeLMA7dpkvlbpYbvv5gsNj9rrd5YRDJY4AoMMV1FdakL7b4fvLPy7XacZudAvlQ/ta3eYOCd37N+HPT1J+l6yMsoykRj4rwgVwqP9T/TUEIE1KhPLZv5czbN14p2KkMkO7XrAjnLUKfCur55UDRRFb3IMgmpTd0nGH7kb51wLt1wvphhPtFppd6g9mJwT6er5usXei5uXsyXtt9ukaVZP8i7XaXTZ+h9A0+3fBRJGa/ORze6n899D3T2Dt3XJPsW+JaWvwRIqpx07DXpK31mbweOmJt5h1AGhcFLikCycAJnEtH4IoQRwUAyLZFNZCO/hQHMrvIAyitdJqRmVGixEHlTOY4FrQT2ervrcFb010ANy6y30W/pKiAlm9efdaGmSGQKsGuAI66SFw4lJ86GAtf7yyih+xZtUiZarHnUMmnSoMyHhg5sQ3RkyudnA8K+gOjl3vHwIwWz75L8UG5c+Gvr/fQkzysqq5fHMIU9GQlZdhNOs+sokffGn/66XavNN6c3Mhd8NsOcPuJPaCL0xCuKE++oY1SrSFi4WrBjYhi7UJWMQt2Ptih+eE+Ms8Ymmr11kWydpSRJVZGYlLZqSlkUaq4vlhICHa5da3Xoc3jpR7KWjkpBcbEKhvRDFqZ4ohSgZtSf10xsND2hsDhtE3wYReyVp4gNAnkvvfzVNOlNrSmqKfWc1O44TbV9yQkJ+KniAUBtlo92Q4kjJPVI4/6ulNV11cyGOMdfHxhVdV10QPLAX13hupOI5dm28jI5hUDp4csjPf5UU2DcAXizBVnU2JF8k+ueDhWBjkiRnkDhxKyeFH0xMkuhZEc+YIpjAHBTA+rkxwHx/fn4LLfq9+gwtmgrHuN/0VK5+D5iCFxPBuGOUlm5RkXHTOowzRLWspPuqSqNbZPNi3tSs7E3C/Wa9s922mEIANkjWZbQM6al8AnNmRlQGBlOGlxJdyscYLnJbEupM2tu5LnxDeQKLRLJFCvNNOQRdyiVcwuwjOPpVCWKj6f8e+QX46T0XXJHKAiFf8+S068AQRdvxerO5BhlVQz7G9QfC04EXB9f+Q397cIr7VSt4k/iQqOM1yX3wFgAaO/xD7cPFzVBdmbIFYvPJQwOJIFrkMqLJNyOV6Cc9yQTSUeUTBhUlukKYUgTcjqNBK9H9lKB7hcwtUU3clPyGv5+wWWRg+CTYLFFc9bx5EoMQIB0KkOd4quJA4b1m8Rt/k/CSij0fUim+VNoGL3lOv1/EpzzJTHkalgg/8hfSP0Fw6E3zZnE1Cq/AfQT0ZXGlo3oUDjWvg3l+CDeeflyWAnqilKgACB7hhvRxMFpQtERhidIO2o3GSmlYQ162AnOX0kgvy94+nHFBubZgEBoIF/kLeOTBaVP87BBCA5xwAWrjIaAXVVo5LlzmsiwN+eGGCWMwuKSbIUpdY3/DLfhEGRq3lVJd9dlNYkNdD4Ax9m1BJuvlwClQOn8BMRupellSwLUdq2Jspb8iE1NdqKI67ISkHBDzg5JHS3yAbx5wUoyFXq6rwjfsvsqZEY36re/X/VfSs+EiGuO5LSD3RqoQPCn8MnZYIVvQBKZauGgRDdiJHhJd6Nba+gWCMcN7tS5HCnab7xcFcD9zBjxbyYQVV21nJOI9Hu+CpK8RI7ePH8rdZ1JFcFebLDrkMNa+I7gSKbxHd4tGNdiz7iP+lDQfcH7K1jmXj0MoHrOvV/VNzN4KxfcBzKeWuWWMioEixR/WO3BU4ng0XNbK/ipQEgmL6Z7C6MFBEKM+yOSa4DCLRbUR/goj3KpX1J7g5U5JSWRUnzy/4VvXkcYnqzI5D9fI59o8EsJ+/BLaQZgTZ2ThcjRJi6gTHJqa+9soGAs15AKREJaDimrEtX0Y4cC2bJSzlFL2JInNt80SPHqTXzfWOL2Js6dbmGeaIxskVrOCx8ZhPOAlls6SmKOIGcc3BNUXdRZyoZUCbVZSoNRnxIYcRxqy9DsXQFe0klx6LJW0U8OBxJOYo6U/95imqRBt3HNt8Q0MTsH4JUkcIdykRe4gkPnxs/5xaHjZcaIT6EA3VHOi/Vpw4soStvYU4FhjvQhuyt1WnKJ8vchUtALDp7dnishk6fJVX6hf4Wd08ZNR9xwYEBwo9AKfkeFwa5tC2jfbFWGb6OW5miI1yNQwM7ioCOMJaNoMl5Smd2TkJHrzGYZSQ1qFAooz3y/zljM+liuTqI8h0FYLdVyJNpDdcEvciVNvJRxi5oorgdXZRBnQkiFpsPlAVeM3efUzD6nEuaf/ASXI/fp+KllCmh3XRYXclV7Xa3QwTBkv57VQ/wh0yGWPxO+9GvvpaVVIG2wD6JX2Nk70Y383IEGIiUiObAYPEKHZpvyCbu1stJ4WxsR8TUWe8egGEcBTwkdgj6W6Ele3O5cJIez80oFAqbxL8+LfCEb5C1pG9h6L0m2GCqmd1cCNHwfUIYuhxtrzU3R4X1QrCrH/YhGB+VUv3ZF5mkuZwVrp9odOelVn1zDWVkeY9qyupyxNHCENsdU0JxtgGN9RH0q6QWYZj14hJAdqCtZEGVZSJi+hu61I88pGJS281UYCYeGJYGWEG97z1wFhMaCa+MFtW40LYon87DqYrCPe3Vz4KXVM9AFG2qgkWFQHK3fBJEZbVY7+OGCd1P3XIfwk0FkJUAEhLuqXBdPy+QC0bZgA/SLE/S1iW8PLW0kdUWnapog1I16jSCwo3jSy603Te3sNwsvBkX3PBgo6FMpf+CuPys5MxIeheRLGriarfo2li9PrxGr9mftsb9ebS2I7rSVb0b1ALG7eSx/45FuAnEeydY6MImEIZEeLlpc7apBnELPcGgw9tLYJgWjiLuRmVM9CC61uAYIS20gbC3xegYAueNUTA0LR8duXn9CGXoW3uNg3xiR+AtsaCcRQmSbyxKI5zJ4hSaltSEfoqQ5AvgBGXZyGHmGrywTKBQMKOoaHwK/kLpYYLdr7cd/rLIslH9/0xTf6sZdsHo0c4kceufidPmMvmEbxcGoHjMm3NBWgo55gRqUCb/YXdytN7gFhg2oth89zHJBgfoiBw4o4Yuc60+AMnZOnIDWJgfPWAsskSGUSJl+hJQuEwLBuiiwtFr3XwxhzwA0vSwjAaOh+QSxKPe5evFNLLQXTSMzwyFM8pO3v/BfzWbZBU8Ht67lm9e1yd/Y5wlRyxeBJoMFUcj0Xv798csb5ZO0kwBdMJfr+ZGgfOX5mCk2MoaA8i7nNjQAaIyEthJpY4Y9CP8WgKSGSiZyTgVfhVZB5vpTe4Z0R5hmcFOnL291Cfzht4ett7uPhOqF7L+j4nSOAng7ofaWkXyvlpsSJiFtKtIK1Ea23yAECt30Z4kHrzwFW+tzq45JsDcCjevt4A7K5ABmsi4kHvZLUUIihAtEbG1SWCwC9ujDdc+3Gm/uOjCIUMINN+EAa7oBmWx6yqfNZ8gwxLQbxNeyOgCyUn4+921WQVMF8haQlMK5IX6K4nA4A== ]]><![CDATA[ vpWBDXmVOEaSgfBUAPI57AmfrMuS7UFVVV2pNA6ZgIoaq0xrQAyYVxGMoFHg1ik0qU4Br1MMAowjc5qz8B/L9AkPhoAp893nyGXmCCUz4/VEuWQZBgHoVzamMAgW3rgmC5WrdUhJA5miu6TIcdu+qe5f+z+OWCngb6r5PB1f2rz/2Ds40jB6Oom3paLFgOMvhjeVEaxqmBckcRSUsUxE51OJurfgqGEmA8SmQCF6ASyxhxdnEgEF+d8ASS+GZduuBxzlRACS9mQPKCRDyo1fdaTUDu2rtc8AmJzW4etWmn0LG9zbBJGbIcDpePXBIhn2O3X0JaBP7WjVA4lWAp4loP4zlL6UQyh3WlnWjv/pXCGbckcKFT/kiOSQYBjZCu2Y2AlfFWHZuQv2AWVlqGeLt+YBJ9ZO7kIKmIfDdzkoWK+4hQy8j7CVd2F68H4diR90cXNo6oCeuXAk4EETKnyDJXtbSksFvR/DOeeLrp4+Bqlzhv7rKxdh+Wx8rD2VOqROMTwKfrNbkjv+0Qj3KAiKegIN3VyE8E1r2XZcPcPGeYaNGNUCJcy8J72yW6fTND7bQH95fsfYJALxzcR5sDdE9DzL+g3W6sX7s7vcwJmqmj57zVv6aZnYYQWb+osQYsKwTHngZ/gDJlGuB6yha7qEvqtDCDqXiTZ3jp41EGHv4RiCqbDqmsyujxoVXf+CeMWVW0/E0un+AxOvYHWsN6Puhdhmu5bOlNN9c6j0TgHS8AuMusY19YN0hyXUwq2M1eJbNrqPvpF5JfuwfjrZ6swPqULO/4Fp5bOLkSeBgbtkwCt1JXrE5fyc3O1yLhp0uOrsNKaUkvbRmqCNIKR7Pa0z+Dg6ommO6IbRFPFWxDNFHJdVXKQdhufGQFTkcAA+FMnl6Y5rwePREJEnHbAoMVywuMoaR4o/WmCMGxocR3MISnMx5bgPCR+0jRnm0XgYLmrc/ybuGQSEYGaa+5xegRXzcDh2LxZC6gZMbw97Y+s6YglyUSn/d2RNDzDFro1/C662KvVxkAP0x4iKzpNTetp2ythnC2BfaBa0i4YmMTAJjsFeO2YJp/N6EAFcGTUlP+IQPuK2zFPYiPgI2cAaQM7ENdJT7QQiEt473yDC1rq6c/CqKL6IeTuCQSj99iAaFmDBU/G8K2upcntNorvgN1UdMjDOdbeS5q1i5zPAnUUvw8/h6OLYKSTVRdn6RDYdseLqbuRlTK5VXHZk0WvJLFOkXo4+ivAO7mhunebScLhTsIkaFgcPZcO3xwS211Ap+A+mj9bk1XK8aihBA9WztVabkTbLUrros0TFFK2nvHrg4CamfBf9SgeyQhaaeAzmpGcljtPy6W+CJWnfhZBp2kGcx/rIkMEWyXQgRD001D5c9MbRwQH9/p1NZxyJBF9GJH6RVKr9w4qgcDCROBWMtBRobSCi+/wAoI7OitIJRolXyjlmD6lcV5AmJqiZjVbT3LI8cvwo0BQm2XasTLCb1q1QXN3+Mp/Z21VoypXhEt2yRYPevbvrR/2YXMmMEGHVeGSKphBqOBWWUyFwmbFH5RN18T3QQq4K1I/Hmu99WApQeotgGp6uzjMXd0+5cJqzKZa+glnFXN4FO/HVSZzNzTqKGoqmnUBel4RDfzbOurj+IA2BBsQZHvr2IxvUVqxZ4EDLv6lYs5VErH9AbX47Z8qyoNCFs3BsaMrlpfb+oDrfPW2bh+JLdDnxw1bqT9QReCFQGQHBI20LJ3tB6t3Aos5+gbFcLVSeHHCb9xMbQjiABdFY6SWRKWMyLolqSrokIQG3szqg41T2ynT06HYi6M26cJ1HWoUu3OmGPuHnEcrsuT3D8ApZAkdf8iBf6IJ0IgzEIcSVNp2chy/p7GrkGDhPCnVHWxj8iF+fEnCt3+qzFxeRaDPvU3cBTfFJVE3AnC90lvQxDwp6yDWotss0PreJXAGhWDA+WGdBgcuqGUt9ggZGSoYWJFRNDcYeeQ9wL6F90XBbyFX/JMG0BfzTtyrDcyn1JeZVyFiAKb7v1+soudh4oGaet3AGYB1c3JhBQj0pfIIr91SRzV0Vp2QQUVVYgU6UR1hq0m66KPPZD9x3JzCOnTO0H8esUVamRHzx4c97E8b/DfLkWwFggncLPd0ChypVCD+Z4X7lA0y+hcF2JW5uZDS2cudsmXDIUF2FYbNd8x/tTyEyHNMOtCJwiP8lOkGTl7KiCj63CxY8NT+HgZp8yxOy7XCozN2gY1ijbNpf4Ss4aOAVTtuLSaLOUp7hSn1BpjppvhNeOtiUay8cZdn/1HSfo8VrquDz7Etn0LCHlkolxhLE6ov5rzgJE6K1OyGHILmWux/icTBmMKF4OLsNGxvwRIscmT0oOZlcble6BAkgkg2YKatS2ZWIlVJavaGGc1lHSq28Jn0LGVk+KMo+9I5Hb2oble5FQg26Bkbh+lh0sRhU7oVl0l76HYvNaHG+TZuvozKybwpSkKZPp/3i0t6GqU4S9NEz3WpXI4BSHkVMg3CSt/uwDqHORqEfLmz4C9WCkmGjGxbl4KGMb0NwFs5ycjXDByncBLwmJxZqGezaRQSHYuowYHo6nmxJyseaqIq+kumGep3yqMGjoEyzJdFbwX9VoQlL3mAVw6F3H25NPrH3MgKUT+brDcK0if2X9jG4qd2XT7JDvSRJqaH7ZqD/Px9HEH7rb7CJypTy4DkRZCFm5FCBJ+cc8uAK4Z7zO9pgBFsbhwmbAoK1P+xONfakAGQUNF+eZqzyu4lAJPlPkkP2I6soAGUMO8fTWgFt+nq9wtg4LBBqazuRj7AMGgvvQ7EXcney8j0um/YUmL7iG4DnLYtcKwRWYx+nRzuz+dkcVpKD4h+3nHB+ELNjqQXD1MU4M6nb46Hn9HLnSjI4ub6SYBLmYtLS8v1kh1EYFJYJ7/VK8YYYPh9ligd7ceViJttLEKJOUguD14TXJyCbTPVHP+skWD0mLvzmNyuJ1PT0Ng1pP64sFW9QV9h8w5h9Pir3+2GSG18GY0Arv7GsbOoFLj6HyzQ97XyNTu77lqlsBNZvajgRkRMue/7FJxWac4/3Qe48mUrD924gUbJEFXi0RuZaQ3mEQbvWQ0nB5CCtoXRmsnD1Mf3JAJA0SyCxAPY1yO54cmE1by1wz7RuFUMLYNrIqpEvbCQkZVn8ONHmKJR48BIBzuVgDoFMVWkIiZUtKYuUhodkTa8FbydgpdeMBA1ZWSMKgsQwbyRWZ1AYYp0fYY1sAoXAKa49qjmzEM7CyKWvJ4dIcTNbHAk4zO7VP9gLlF1yAHOmA7hV60t1fITaXkQWYMxaKhmFklMX9GVzPWiyGx2tQ6zrkouWs6QkR3U/RlKSTABiAiazT/XttDAf70gQQTGkBxdvipYXE9q2GEslQQk8rDYJ2Es+HFMLn+6zTFPqFpzNy6bG6WFngsZwJpHW1GHJcWBF+smnfyxjIKVJAGINLdA9Kp04lqQdM9kAoC2LAqczgcRJNQcaLTYwFfEHqwD/V9uKwCYShAxCuch6xTopEnBIRQGNMlv2OAVoENI4DllB5VIoAHK2EympsnJIpfLi4EH7CDgoaUapuQ/IcrJK+14RevD7VcywRZOVRFx8Oq0chVuxosoI5gqNuUDglWjETRYhX7EUWPi5CcgYFpsrlufFFp0fi8/3lJmyJONm6UY0bdCyXHdb+KfpAx27Wna4ULizhEUJtM+Wu/zcstW3KCCDDTNcyurKhSLpcqPSDLJvwplheSnlozcLGCJyfO+bzEwCukzNLwZ0DPQb/8IY7tPYgLEDwTTmK94zmMMJIzNZvM4M812+uBjHpX2bU69MdFRECxC9kFFZtlYqJtwzGOqaJK3yUKGlKUx0rW3cl4vASvr8UOdYKis/i0AOtJmABsYOpwxTfdKKhDkOQFUu8yr6mYlZjSjs2cYm/zJz6AVsr2YEcYrS6M1QKNB3tC9vxkpHzUxrmbnMvskUMKiZYPfAsN2M4QYMNK3TnHEuYhBzxhrBtr0zGYNe6nwmny2SEmgSQIMCu4VmK4pGd/y4pY5mUMSkmVheGhk4zW+L6MMBahBXak7On8JUk0kgSIHF1bgsa7Q3etFuTdmlQqn6rlnpDti8WfsaFfmH3GghHbiLoOdm2GDtLjTSVh+gkC8qxRXvKlYn2q734EonE17yTCZOUM5ULOR5bDwjnryANkgUaMjHaQo7CzNIKyQ0q+44vx4Z6pBFgEEygpDNRFG3KLyPxAY3Buv7WIFm70UVB1ClzS41oz/TRhYmOOy5J2P2LxhIy2waPKcsWIlzKIBDay+OPOW74jU4NcYYVnzhFxz4DBiVM6gndmoxHrYC1sXXB+nyN5ChfecFl905dTOAHsXX8vSzIXqklq138mvDSMbMghOT+G3De7C/l1RLs0gXAVo2MCgFJRRO75ptXT2R3Tk/f7IuvW2YEwSBH0CDSAv4q0n8kOwZmJC+WZyrU7JNcdDrfhARcK2toPJ4YCPVJUoMhLSftBAD4lIj4r5QqAyyHdrQXJLh+HQDJIedEYQw5ll16S7LHoaldyoxV0waK4KXnV2omYP+WE7jqgp6kqy/sXFGJ/5H7rdVWw31af6Vt+mdrNprn0WdB3Amjie170OZToW5q1JdrfDOpfqoI+F9uYc4SVvk6+MKOw/ZwZt3NGl4Ew4O+f3kUVdY3wpk7AlQhdImE82K9Le/X8CAEwP8ShAeOYgpDgAdPpLlL1qhl5fsyBQ1qNEPuFaHGCiVaaaO7eNaoqc2olSt5Uu/sBA/wGfHZrUq/WEBgBTNn7whdTAOFBYUSUWhj4B2EHIDyy7Zpp6vmRql+V1CQ2AzV6QbbAZ8lpoh9wTpp4UbBaIKWMCGNsiE65GeGuDEODpbOQcRk+3f291iO2JNrgI29H+dbtqoEwwAKOpQSYhSGcdrkfQ1sIY5J3K0Qs9NMJJYUIAhHb+w61DvDDjRWwpt8pJBnEhJklKXxWtyUBGNiNpk+dq6ekcuqiF/dXY7fh1Q0sI2MZgAB1KBF+jt+ULvEPrzrCUQCnfOQjlwZE/cUTBxep0dlJZcTli82r+mgLXtWIRzhyyKgjSUJ13SVVT6ssLLtIVCEXkwMnLxImRwaPmlFzjEN5t3Ao6tOeFj6Y8TdPmV0M1gYh58bOL3Z5PuiKT9/xzi3qLwDS7FJ2h2wQKomBudXnLVGgrC19BucqxIlHOSy1f8/9kwAol8BvZxeHeb22Q+jCC1MyFWriB/M08lBIKi7mQWMQ45OIr2hZ5eVWLG08GUxmqw4cvBSA04jHAVZG71P5kCEY4rO54YgoKcmuRYxurjClO5IQoK4jb3HNRUHPHuwbXIklQ2vtYXHiF3Ea8/GHT9NgGCMzUUTCLblNhAFXxqh1ZyekHokHAt5zsKOwbtnGsP5EfRK2HxSLWrCOrWG3Rj/iyaJzajEgnIY2UXQ70ImFzM7fH8rBQMQod0+VjRu5plcsPEeIpdt+CX1Q== ]]><![CDATA[ K6JL+GeIl+ST/HjsvT5tDVUxFOcG5JoNbqvu7j71VQ/FU4/GjsFA4uwDFtWirskVDGmxfaCf9V9GMlRcwE5DVxZLzuTxSO9PK2qyfkD2OJxtmS2GNFR+itzZ1O/PP6QA/JKd58LElBWB0bICCTOEsBlL6s7OVF3tX7UFyALoE6F7enSB9kCmpK747C2Fk9aazOgYcOIsSrLhDjFRgERgJ4iUzgcj5EJNVIpgDaxOQmicwh2zjlcO6+h7GAwSIzvgSBBFWjFwCHOQ0UjsQJYvOoAMwivKOBBxRZclhNeiOVyUHTlpDAFwCMuuood9naxR+QlkxHbmifDGhP1mog9bgjyVqEC5BP6Q6JomjAhTl/B+iIp9TOAziK4ZV0X8UPKHh4kJNeYhwWHCUB1qJ1AcKmc1gS8bkk0nbNBQqz4BfQwd1FCQ8YX2PAo3WsgKU6hahQg6IwrxARXumJBVqlDjEeJQVjhsCHnaFcZ90BOjQ9hQB6EhFtZyg+RdQesYpAde4aMF9SoWmEdBnzWNwswoyOG1JA1kUon8B+TnWSCWXw2IaF7hCAQk4l2hdwBxWPR/SFRQ/1hAP/YHzs740y4O7ecOxAL5vuflBfn5qvX3wbJh4dz2KSK09QkRFohIH5kojbnxyP7N5/3LWaDeqERNRyE6Y2AHOwBlRaOqI/FHndrNKiQd+11LIYseawILH1BbLBphwLB6rkWQMneGXbAPskxU50XFpKrmhDxNppRR94qah978R0aCMwnNWD7UgBdb7fKs8o8fifIqdBJ7dA8lQY3kBeSt5fkkqJC1PNqRb2UCCu8dCvQld93OIDFndOFhFcUUdfogLVkBxIb8QnaBtc6CTsf7xFcpUMtzP7E6IxZyUgjKX8vzc4XwTXw52SlfvGOGP/JEBdmyPPQRFHufmM1RYP2HfJ7TkkmwPY2PNtQqteOQ2eJWnkvPl2wAQZ+IPO3ivjkn49HpOAfMWQ94iEdzxtO1Mc0Alz2d8ZyNz+5yYYH34VEmQUP08HxhqyiRBJAgHjxzBPYNdA/xoD2GaLCKISEeKWl7YNUQhXjaOi2F5UY5xCPP52BLjN96ciIN/bzDw9BrQeLp5Iq2HHDBD+Nh/zxi3NwfGE+JBR+Bo3Q1wk+Dl2kRxCTjO/oarJ8az5o+Hfaawiri0U4lRbbUQ3jahJOE6q3UxDF5ihekiGY72dCwbwDQ2K1DYQfYyHF0sdjbTox/jaG0o1MdHNvDeUFjkx1fu6XJrssw1jkBO02oYfPEraPIkhHXXx1JAhgV+Ch11v6pAz3zWsoWBF00tfGfmSDaKhZTtUlmHLhxVD5Y8AP2bJ9gJU5yiKls8YUkVGkxgP4gkl+wqJqJhkDA8qmQT6LaNe1+xkcxDPSi+nzCskMvdZ1KgR0zVFgKfs6nhxTUbY4bSi3Tu4hLSs0kIo6SjdeQ1MYAN+FAkzm+eBnJxJ92cIYaQEvviMyJn+5cuPkbdxgzveIiR0MahEy5jxNswRcYy5ttzPDuApmJ6QBoO7LFhBscCyQ6NVVlFJ9wpE4wIEOE+GHOLi43l2y7IO4RLuEJK0xRVISxt+3DLleiqMT4IPJOyZtreRyWdjJRMQfMxilr/Rc+QdMxUjTUL88QukLSRMnti0OkrIR7yhfqqwPelXAvyHF6sWCnMaa8iCZ49ijAS1D+qsB0uzSKui7KlK+JLcqXd2PEfSAAjl877qu3oZR0GWh8QZUH/FpxLJdmarmxBAcjgwUBVlMgxdx8TcPL5NKQFpKecCkpPxNsNg+UvLb8ROzpGG8GGQki0ioKCBzlGLK+wpKnx89Hw01qNqJcbb6ex3MZU0ci9EcoAVgGJdfY/k7ePDDgB6O9oN3Es63zdTjleI9+KcS4M977K80+Vtj4C3DBpHr7sAT7Qfos2cbLL3Mi6H4iFWFodinM3JVaQ0RWRMGJKiCahi97/SPJFTO9OPdFdPoRDKRx/GLUU3Aa1jStzGwUwr0fJ7OCIOnrOF75tmG3+Py7OHK+WPWgUharxD6nRGx2T8+3fbQ3ZX1E4YVDL8N6S9nY0SmCeClZS9PITT448GvVJJHnRIW5NdGF2o5haM8USgvdVv20Cd3++HAkyettT3Rslh31kty66TQk0FVKSH0l+NEsoF5B8QproUPa8UNAvS1ZzKEzX31NOeaoVFJ8Sa3rJ5Eco0zWK9Ch0IUAXEJtN9HB2AGgaR2A6EQLixc/DSkjFcBRqxqf3Gl8FvEJl0egjxL2rOAUtrw7wLkynpVWylsr08jS2ziamFX3cHkqbcxGgEHL9EAaz/vUot87SejiHLGsVrJaf/hcLJVRLEnMQHUQCozKhD1eCwwFXpINDx+MZ+nzvjIxVpo5J8MSQHch8uVFTzCKNdohdsBuD26gUBryhVH+98gVoCm2GyoJlCvj0rBm+1rqDB6Gt4ww9mDo04S0PyS/kOIr94ySj8hxFORV/HraQUJiMKRCCWlbzl+UTGGuqYUCsjo1Vhyl6HacfoYlb3r4H3gz9DFRa/RFFqRNRMHNo4O0o+FJMjR4QorcIJgQukxcqxFF7CxGJ46ROPvjWsdLKVyzXxoQBxdLBemW1lUwddwdN0NjqF9kjBLAWSkoVV+xQFcbSGwSJMBD35jKu9a7bM3V1ibzVRKOobOWKrfp5hjLYj+ra84gbWTUE6p8pcqAlntFlUL+MlCTAgaKHkhnDymKYi6XPDtt1WcwrGng+paiI1cY0RtFttRO+L5ev2z70K2x9lL+P5p1VjxnX7vvSxAelcqxk+SvkJh4XtOiEPlYnQq025WgAZ1pHTzUorGKoaShBK51lAvEOA6wL9STOSG3ZwktDue2CTMbG9syWodoW7s+uCRC9ABbfChBF4Qfi6B7AyJPqHpqUctI9SiIF8rzy7P3DCwhE/pF2buXsunHl1TeJTOWo1tv0K0DySDx5y0rHwmk7IKwSTHAyuigKZGBJyGYwFOLFGq1Ge7dP2zhbdUeAU1rKmmkpsc/fIM369QRF8UGquqRkxJ3EDgqhqNi4yQX0O4Koaft1qZ1rfCp5R41oJjjs9mDqDdvb6h3Q5XAu9WgheVdFKyVd9MFBTLjsOVsqBoU4YXmvoEFyfOjm0RVlQxGroaE5A8EB6uAaogtpWfK5MmiNytitFQ+SrqO59hSPiIJRgAoywyiaCImuqPTIxh8i9MWnXQo43wJGG150j5qGu3uCsuaUUzRkoae+rRjONnGYhQXJwZiskoi/Tn5Lun88yZdcfoWpW74sJtEIe6l+Q72e+hHUnqHf0AFH9XvE5ASh4R8LbEhoUUVoVpSaELb1DoEhmUhx73sRia9gFB5Sl/dxOObKwXumEj6uwRaXBvDlBzeFPbvNAx6ebamHFRVseXVx+amNxeQ1GoTXwnZOZmmUIFjgFxY57lNq0e9KCxKcVrDgvrLvvI/RSJDiiYCFYCWWMocGe4MZ2wybH0FxjKZhji/heb9+xiyt3lAhtOOMq4huVHbQZBH/nr+43ec8ulfGgvESPp54kwKzaet7iXQE7Kzl6K6AfjtoyP59Nanf65BPK3CGIUzHxgwOjghcAmlM3Dq1N6SXgJ6s09JYPJ7KonE4QLef/s4GKbpiSpLapXNNeTJHqmxeKQysSi4gjXJHlO559aTvSyxcg18ctpYuTIcFQhP1/SfetzWEaAEUNiGIaWHns6Owd+jC3plNOfO04M4Tx7fu7C5wvDl9dHl87d2rA/9iH4D5sTm7bOkag6N5dylQQMGd/Kml4/ivNaKjGhNEELhhQf+A5pUIhlKX5tbZ4kFoxu+Gh13dpnk53fELbpKKeI5ka0CRupSXBq90Pqh5J7lPtf5dAWEh7Zbg/uMiQTn2yZJXivNdvNmEGDKwWwwWwv7PBsHBTTb+OUrBy5NCXJd/aSWtPfPW+zSBP0W6vRHDwwt1JK6ormPFvokz4V9xY5eC7RwxbadTv3I4N5d6qsflm8GFmp+BTNw8z6nzglQTX7W0MCtvHLX94EiIN90hRarO5m9FQTsHXH+86M5thq5joAyPiutjUnCXUeBNTUK8R1rN1VzCKS9xTe1+Nm1t9GM/GM2ZldzhidI+5hYE1fIwTEPSXWT0KJTNH/YuSx05/RfC55hMFIwlRsq6In0WECvg+YtBSZRRXVg8WWnQZFijPGoZ6RYPaMuhnJH0wkhFWVfUtaID36bENUIhrprDycVfVAjPh+ASoHaCWcw4g78acCZDUjzaRE82tSoXE8VwVX6fYinNWWnBTEUrQ2dmCgdAzHhONG49SayKG1yNns2M11NdHWCyQtNKCcmnrLRhJnaj8dbRslj4gnDdDbp2yd+6RqkNcUv0ckKqrp05KBfv/b4y5ZwMCvM6AzwYyltoWyk0EqnKjvVkjYzy+MxoxSl5VVnT3osQQRDIFVCH+pnJUXLJNunPpJ0zEgVBihd5VnngUhe1+PUQcrapxO1uPwRiqtHnvzFODty/UOI/PmQcdTVxRJwR9WbElGPRocWsH76ICMK+kXxDnaLaWzRNNxakb70UQ40Nbc1ySeu4CxLPTQmsYMpjx8F9RV/c68dPsT41D+VEmGXOLl5beyiTHmAe37Q7Em2DqPepbbNEIyH8EPMFirSsVeHhRCU4MKF3eBLKcDMfejtX/z/lV4o9YIH+h+X3Lo7SZU/9GR8nIvy/1PO8rXkwD7/Tz75gEYPF6np6MRU7lgj90X31hlAOBNGea3RYqU4DivVWip807tztZvHX7x/+EKVL/4jgQf0bZhbYozZTqSlgbwCHnqfd/phCkvXbhN7f5iXz2MSi0gRGFzTqdBszxcqgFkFuar562sAR8i6V05aEJc9gc/BAgOSAGtwRqsXWxYk2/IRmCLoZ/SAw0sexD5+So2gECJwotJ+VMyK6cl9s7ZTnRYsUSDFVnfMw3JY6FVa762Tce9Jrsalqq2DsKoFuAxEZDU6gAMaFj+44p6Ebf8lsn0Ole3oPT74S8Rmq7uwLYz83dgdWYMb5Vhba0vj0bXVSzlqRW0H53aozao/mjXS3H6VfTv4DXdEeVxUgbkEOnRFOAXhqZu6tIvsChK7i6OJtxtZGHRhzSvENmecxMtjFS/CefsIqM59OHulokXxvr9DTlW8d4f3gqUSCt12XLy8cy+iSLwlvh9t3pxJIDD7tHisE2TCunk7Zworhi7GBKJr3klkXnRs9qHYBZNYzCuWF+h1HGha0szyMl5OL3cA4os++jaX7K6yJ42QFEVIW4U+oUtO//qLwoKyoXRcET3HhMAa0YcAgge/1gPjuOrlOsD3lonEO61+fulPmW3gctE7L50LXrudwopHWDsMg4GDhT28SupwBVzZZQ9lxhc0OWlTuN1uw1naWmDlpgP42UJQXQhp86sO4kZMEgmCU8nnLItlDWxrs5PY+VBVR+ep05LDNRroBAMSZxOwqBB1MWFUgKwwKgGWjvaZlEoWYndZrpAeHCrAUoKQpLfDUw== ]]><![CDATA[ yQQodN5z4hmplBN9JJ9hA1gue7y1QftAiBz5baI3Tmd6w+zlHnq6gyObVQ5EdAmwTKgQtPInC5snv9pvlZUHDZTxFb1Rq8Jfc9qLnxg1QNM6KYS8r6udhPDj7yKMFcJmA8gP4Tqrb3co5GBPRNLRTls8yvdQ0hm3xmj0Mn1TAS+WJQwrunBZiabiS6YXz65wh2hToQma+GRYbN6Dnf9Mej7hR7Y3pQO/NKxdT5J5Ps+sOg10lNEz658U9YXhlnG1gv/ivmpzUFkWbMThAjr9Z48lxWSqH3bdt9VYRqAtn/K1iZQzMyEQ7PV3gD05SHdstIsVUTegL3JqwA9hGRoyIUeJN9LuvVFFCRuDNs1GCazjR3h0YU1K0TiwD/i2tFNUHIs9naQJKaoAnZKj32yG6RNByRlL5sG5bwci5RutNyuhFozcctwLwlTtgsVwl/7DiZ3c2GZb6Ff2zPqL0e89uZv1mHrxu/A/tfIbxrz+spvvn8KCL27q5sC0JYU5yWSZ6liNm7/ZAUaN6L6CL+2QoJ1gDUwXWKYihfSkQZoKpwPWiJZq2utyqiKDB81YqQenX75tqq1vnPr30OQg4iKb7XFgOVgFf7uve4ZfiRXeORW3QDbY0eglE0N8BMMAvjDQx9c+T3DZ/xbuAaW0Qs0vm9OG6HZL9QBD6Fs+hEhPYFKpgSnHPa+XBsk7yewjjc+3QH21MobEHO9nFBE5MkAgJGN6f1EYBevRGeu89rLMF6NsI3oXlyUgBnQhPN61UIMA5o2oUhIzaz1MpyYTFdW7T/Cpu008qutz7hMDqiWsDw4nU6tpABsQsWaj+RWkBTZpFQUhm9/Ipz32RozlDZ+ki4oEgJ+towE2X9SJEvusqurvZaFMXUBsxIS1D5zlp5HkFi6IpD5iDV+ovh2W0YXPU+CJi47rY6AmZ633WTgBPg3Ye4fZ3+Mj0Zd/X5j/E0t63y7LNJgfLJyVQH0JaRzXgq4aCVz/IgJvCNNHWTcPIk3Jhqp6WSr+V/x6agUHYkL7Q5tfRs233+Bp0I+06DUrCF960LcpivQBi2Go1luJ6PMDeGbQ4EoWE281K6BntPwYYB/CkErNCeYIYogh4KWVQxLfvKmMNlxp7TuPdvCU4t2I/9jE6DTKOpTSSpM8O+t2Cqx4+FVp54+yVj1O9TZdgbKbCifRWXJse9gsm5H0SGiFOfjiMhZTta0chuUGC4NQuz5AjPch0K5cjRdH4MB1o5seXBsw4PbQbyH+bxE6LbRI85V4bjszUVrvTsnnV8n/fKHop/SRoPRDICipmX5nyqkxo2nMiRrb5CiNcagcbDJQNwOlV7PZLTTQMxC9xpllq23viP8ONt56gqRpqU7rKSjuJ6Q5o3jETksif3k/aX99vDVjmkm/x+78ScAi0Ih9gCVGRrw97Gr863O8KRJrnaLc30HXLdCrcrkUaQikAPmvz9aPbCQkP0mRMOEBxfubjeyZZ27p/By3PhPbrhxn3ffnIyst6+mk3cpDvtKRbnal6rMDvDYDomW2SKjw1cip7oYmgUpskYOapO1+UhJa06RpVJ2GVSfTERxAQsbF71oCq2Ne+XFtrptTuu30RGVhLGIs4eSH1sZt69MUk2Ig6zp2GASDguSElbN/3w+kEkFsCgiVzfVmKjinEXT+9ZdxDGhBgXlkUK46zV6u8/dHkNnklSi7T0xRN+G8tN8Uafvli06RYury+BqMhYinsOapJcqL7GXWo+iEzVVw7MVOC3mGcv+L9CwSTTZCQ1N0faMWTL8uFjd7KLK8+ILabpMK2Q5RvhHX1smuKYVSzqX2v+ItVrCLOP+/xPl8QZm/HjErfye+KNbUOe2wnZ7V06s6Geae8TsjRFA5YAI9z9M/1SilqudB9TDj0bCUHnG8abjgF9CTQADM5mOYv/Frr09YuQ189Iat7UgO1zsxlQawHsZRHD2ITThSgyTQy2l/b+S/3yICpvIyz1blzneKr3m5bjn5C199o9L+wjT+1T3z5s1H5tvpU0UCEVba2HvWVPhimXHgyLNTaPBUkhzd6Z+oMi8LI5dD/Ee3cLMPOa2gT5D0eiB5PlzP/z5NRQ/NMsLPBC16sIstHolfkAmx8r2p5Uojk+kiTP3Axx8JlTP3WNd7v2oXaaeAiycwRtCi7Km+Cz4PBM09qdmHPbEO9Jgh7aV2fMR5AfAJ8ge/kos1LwhPpnjfsZacVqQ5QBM6ijGV/Q9EjhnK/8dpR0c6E1P1kjS2Qi7X2SHkEFXLloSOnDYaVuVCLwsm75QiE5bnssqBnDe7Z9iwtKjzzpNskoCInoZt2HBnGFrIQg4XD8rwgHRJouCyy/esIarAEqWKrzZTFt/XGASNSY7wVuYPeExc+dKX88llCjLE+6Fk0v1UBTB79mHT9qFMP3cfruLSGDBjGsYgBVZGm4YBQNgwDVSU6l9wqjeaSHCitze0ZOUluR4M/TmS/tkdGnt0n8+YVeAvLz9SpBIkUWAkn5b0qX+kRgUgJqX0w0tDZeSUeMs0TI7L5sS0Pg0pbjlBG5y1Wp2wG0u1y6gQTiV01IvxLy+jfs0pSeP7GCn51bP7Z0IhFsX98f5mTHGjuy9kie9gqeGTf4Rf3JZIn/LJLIEoEc0xH1JdJVQqvyyV9N3MaVHZlfWyN3HNuOmm4fOlDVJRvTQZYLqIJy/max7vnRIXPP6JyAEs6zO9C6ctPbspvnuXILZuatDV/c2Y6Ha6S//JlV+8FtvUlQbGZ0Dnf4kp+7Qy20QXp/GyOYJyKGhKJ9SxpSLu6z5tTdvdGPyhB7pOhJo9ESj1IHDvZkGIEPDARUhp+TEmRkaPf9iDg1CK3XbTM7hXpXx2/8zO270ZuaTffBnGQzchUr/gR/5SUzPp7iqWRn2Qnqm1ggr6x4e5IsKuIP08QmxpSC2EdzY99lfkU19Ri1Y9V1tQBUYeAgqeIGBprqijXFTuSMNQVLkDr7dUh4NkBOr77X1m7Hcjuj9k2TGn2OEohTmW0thsns+7qhTHt+QEsHypXeD0ElaaXR7hJSQLNf5ZQBgykOE1ZR0cJuZSbQitDgEJCsUOJdpbRgsZVxWf8l4S/nXISF8gVk9pEYfy8FR9hU0woH7aatSpvkpzYNKAC/HYqqVqhKnuAmm1IyXKmwqS0Q7snJehAVfmJHsd0aqj618VzJGTkgdrlxTdBG6QWkGkipWQcf6glCbLxKKiGv+RjzEJns6oU4nbePHJnD9+4JeaQI8oYcDv5UFIxNlHJHcdkR7KEbn38uSbPMmmegxEnihlz+sJYe2QLJGqm8kf8SjFHuV3RYj9vPt4RHFCvR4pOwKlCKCpkxW+ESqYSVKIRBLDR6EFYqzTAkyO8tAmIPiVRNCXqRoY/KfS87cAM+LIhhhH83xxfJ2QnQfNw6DaDFm2Iw5Ew+AhRIy6RozwG60Z+I/0Ujo2VPdFjGEMtbVUAv/gb7f0XRwBNrdASgsNMJXggf3Jz6vgaArtR8GP8Ci8ECffyH4UIav3rzuF+grPaDJG/PtwOMrbixa9T+XzuYrbZQt6yINJ3c3t7eaEA3UxG7uachHFtkNPc93TJu52E1cEJyqPk/Qb+a4hgBydzp+9gFHjKea368kdaqAn5GkzZRNQzVlkRRWPodR4Crn4dU7hY0l0mvOPLTr2Pj4PZtZNzx9KvRtzE5HhG8b5icn8iAylHVsANi/GkpX0LvVX0qthbnx0mYWJrEoYJwTXR6CZW8M0WyOFFFzZNsNRfA91DXjeNThtNS09hOXXd8dKgbe+lzBxG7TGfLViJZLifc9UEG0Xws1A1h29xvFe2STDjCLjtqPhbzOtctMnMm5tohV4tdRzuahpr9XoK0ipMYA4iNV7Fhlb5IMeLVG32prqH6sYnizPoSzWTyKe0CYIkLYpkS6QphMGcxkjK2qxWNTBs3eiRdUnF0WJF3UZL4E6KVh6s93XWCRnyRQNNZOj2JxVmobd1IGCPUdjRxAejHAavLDxHM+G5cUhSnmEph+CQ9YfMPJAqPIUxVMddH49zywpYEEaxmZGeDeLp7PCCqAbdahqsUmw2S8zDLM5hkeRcJMy8O0eNxrPVHBpOnaies3iDD6bGk3HAPuxmkRGOs3lpqn5877dkhRp8tYRyTv55dbwP4l5UNI+lKztLpqKL/UDEr7XLjK/jsxw/+1rC+6mx119K3Lfu+q9uMdUAd4VLLC7mWBdb/CGD6BYCDD2CFiR7Z/2/whLLphb8UD3bHOBaTDzQOufr0CtecYyqllLhX05Wlt66T9Eh0QbfKZP/IMzOwDQ3Ao0e/x0PugNyPHTopm4ambHZjoQ6USgdu+s6Oxm9MwsknpBvYGG1X/WQlKCoidXP/OubqyNJSYL3VoLqTgg2gvDHurpDmjJOyp8UnRqp47UR1GDselUnrUimjyxwyFqMRkVbWzV5uzaQEQRqFdgfxEWzQcKAHpnk9AgRKYvRD4ffC3XLtP1ZCiMew82/5CRopp6IkqN1BZU/3o6Oq7GH7dayK3aBw2t6OD3txX74HfZMK7DfSVNOK7+Na6XCXEN+JoETYyphBLWlbTpik9svgp2lBW/kJtjH839dcR3IB8l7eAJjZ5E9UwbuNlbcE65w4Q9akBZybbAxDAim0Nf4ClamK3jCZi9NOupvUuZ0dX2uyhLmhGjS0bAHjWS+r3LM3m422e+Y4/nqyM2G0T1dlcPsvGR/84T+2p6Lsur33uILe1yANZNm+1T4Dr0DYnNLfcTkF5161KOVDkEghXtK3TLsXHCY9jUMw8OdTMFKjUYQO9JaZslZ7PRCxosdc0VyHMXsu5G6aAmtsZYUd7yl7NcY7DCNjaIqpHXiGRzKyX1ewFJtdMTQR9r2/KNyqndaqrk4yUVqsIONtF+cTfoDCVkb8BogcL28cSITTVnUS/fTjHZznbC+LNJKrXLrk84qcJK/E2SGFESrrsk+kTntTL18sP2ahctBizVumPITgsqrnra8lnoYx3v+jJ0KL92ImnT/9oDbdFYTxFTFJ4A1RVnIq9nHEfCpxB8XEBxt2QVovRnM/rdT4oR5YeLU5T3Qt02+F/6fsCGKWwnmYhFPPDeqEbXgbu7btz847AQS/q2STHfGZw5t41hL2bJIPwZdQXG9qclp85qHTUpKdsvfGPD0zoTeeItSoZEUxgfP3DW2/q0kA9FTHvlD+u2dj7K25/eiWV13vIxvlB0e4z+XV/WjgUO8atefND6v2cdIq172ARaq6W3Vvm1cpVbUdQwVnDdPrlOv1wxoXyq68YNr5GSVxpEYIGeFIiNAJslWJBVJ1J100p1V8QCqVgaMpZlBHDvYN1RFoAIDK0qHmSnB03wQbYBIZ5D3fXWopE66dkGAFOXgkKLTuF669bZhdUkF1kURGDkHGxdjovOibsYutUgMg86vR8WHZBq+wn12MujLR9P6pD+Q/8oFAd3G/pii6v9oRtTIGPAjbHWAiDkKzcUqg== ]]><![CDATA[ /35qUv5BUwL9Mj0z/TzLFIoikAZtWgRbY2ZR+rgioqI4KqO19JfW7qgU9RN4z3SFXS4JVs8/IVPGShz28x4AU4h9oU/g9qEw0cNanLgjVnx/nSvmbWZvg+e5PFER+mgZ+SBBNZ0dWEgnJQFG0uS8ACaimr+J54jTSCESySyqXRi9iwBJilFkP3QDkt8frVcMfJDF/+YnSSgogyD/1v6GJkaqDIMlQUNbSprMjKMM4sKQfxdn9BV9xkK7W8BtjiJTsDw4VIT+TXwof3M0eI9kfkkSvmReinnMUYq5nRZtrIrIVYrmQwTrpmmP1VyaYLSqYkdgxSSn1REyCWM0IGZhN6YEVeXe1WadFmsIshWnmkX0/sQosaPSFY57nABZiK8Epv/aDdGRRemai6pyYLBkQ0ECJSEmPIvutigsNBSOCa9QTzSLmzQDF6DwV6cXoxMg2SyUuktw0sHMsj/EK1tq/poIdRrGSFPGBuJzEG/vQlxaOQ3LjlAiRm7EldRU4YKZy9pE6QTU4YSLIJh6hiNqZQUtOKLh94wUTRBnSbFpnHCCW59EVqJIIEad/SzKlTwm8yfZF1tCeb1UJyfELI5XUx+clVBKVkPXo5BfkgndJnkNXreZJucKFYbt5+6V325hee/bm11bISjGgU7nHshCjf1SaRQeLQ+2TFuzu4NlAnQEAa12ptQW6KlA4xzopBAPClqWHvD36IOl/TENVuh/8gSiI10SYmfUMsYjj03xoL/HSCzC0keidicmCVLUFskzxgGerTNfbNrbDf3PzwKQjG3CEkZPt4YPqGEuJ/e4GfeB2vSZUNUwtGLv9+uemE0f4caPjB15vv3yucBgQalg1hdYsoIM7GvaSrPYAfyCAiRHyk2q7HLnZsBMWuJQyGzKpw2SlyYfVmm4wAJhnfifrvkXA7aEINHV4AEB+rpcrxOkIb+Yu0QnbPXnqlWf/Uei3abaJdb5qwCY5HY+EeJuEoLdZvici5HD0goNRJ7lbRlDVGmorwGteMt+f/C/uGwYx0L6/+Q1pUGGj8q4p8gCXoBYOYMHu+AjTRFcqprQyXEWjPjR/0NGEj5YGY0oDowLl1hb2m+5E3W9XLBCmXnadRpifmTNHZNiyOrc8FsMMwlTkUsujVWx76va3JANcYPa6LOJj/JF5W/qn3lYmPmY05ZS/mjjdIMosZZN3TQjoEt1GSRRqndLkAQaBlL1A8TpNardREUPdx6j4TaCxiuhItT1eacq3gXeHbTd2//l7SuiwrxmVErNHRd65L7AqFobhGz9xvwgmZkqzAfqhMGU3D1QxMylRPNASPJADA/u76Dy7oDhkVRdCvwwxdoVHpqit16KeA5aJW5eLAeZTA4+Hgc1bjpbMQgsFTJNbyz1I009Eg4OFOj+u633EWANf+euy11h+Sl+Bz2o7NzRzwdqVF8BEvlBeSXgyKATAN4BYBWh7BiJI6Xjd1/JNxx6ixFOc4BaDF/0MQe/0l7vNtgvpXqfE2l6tH2iV8TzFS8p1BIazY9DclmedZrdS57eRtp33eUvfRTQ0xikAFjE6EsIBJPoVJnn+7w+tlFfFTIGpP0QC7KykkzJ/SGyLGOYedWcf0S9bkDXzbUtWlEp2lAhLxX9Q6V5pvX3Yn/bOdx3f0bwH87jL4Czm54g9IalOBY6lIpWOcnMok0PE64VWbJbxGSnm4F+3jqdzDgC2almFivcPP8bZRoeAj24t7uuyj/EQMdJjlO1F5Vq0xSlqq+xRWaIzqJeTDNCcPhBxBewuvgSQpI6TkdNgI9zvhAkV4jCCfFfsKhuerMQBJUHGkSAvE3MEEuHSEJbDVvwrywuoAh2KmI3EalIxKye0eqvdkV4mUcQWM6AGlBcihTKHSAjntRwjalv0kJOEvSvoSZdNMLDxIOxtNiIf5cztZmrSornYmDT4YjFFDZC387S0Fn3yX7C9YPx0JF8gG7Nwg+CIfk31Q/NPn6feOeWZVQr+ug1a+nXKFZuVTkyJYYsP46bK3sp9ETACdq5RPq8n47Ufre/6Bcukd2ogmNfU4uzy4XM193gS6rrnWyQrjqievn0wAh8dIRIrh9YEKipwvtP2KMf9rxjWPsHjBYakqbCsY62vICG7VFf8/U1LEUBwLqnbRooIKlU2wC4C1VoZnOE2Ug0DTG8gYdH9+c8KmAAxAIaChhcwqq7qo17cq9IFCA64TlbAEY4JoBqCZ0flGheP+FtvS13n12O0JcjLMxZKXMG6Ro1HjfOBzuDx+V8mejwkDGEh0PHtudQVBaDVrMjGscil1a3s5Pj+12OYnLYoXsyDN7Kq1eLWXuIAJ8dY9hOyJxWIOQRs+x5wS50Q7TJBDe4ESpJUtdXttmSKrA/Vw7e3QrMtNFI3xNFtx9pBmP5FLSzk6xQj3ScamTelYBGVm0fomNtLGJ51aSHLZG/JlBvFhnrxqN8vIBJM7QHJrl+ieO9ZJNAQMXFplu3E4vYfaTs/FShPZ4Ii7s7jshscn2gUqIJnOFuRJRPgk/cJDbWEOPtNHkCtFKXKQwKxsamo8kr8bGob88n62vQMMUscV8evdVJmjOI16kABYEtxxe4zuDrn9MfDLyo5YmyYc7+H5N9ZA7B8IIIw4BptI6AyFsoy2q7q+V6ZTWWgLsvMLL48r4dgZwIDOww+BmPc4biRauWlM0hbM7te7qd2MpWWPDd2/meLRLAzEKnmJJiYzNFcs3KXzX7N81y00Xa+ojRrL3P7Gkzy9EyW2cy0/iYVU8xuxH2h1knmLH+MoReRrfLiLnMi76tWsaYZfexLODKxqxMhhQoKgPCE07vsAMoFW6WiD9LNVib8MmHqGxPzvUu0+sPpBGOR3FpprSIkjjc1Kebn7fsPKny8pBiLlnS8kmHF0R0fNVhz6tnJXss4oX9jtcsC6uOBCse1NuWKy8QsDyCEke5Yp2sKJNwLDezRqmswm5FvL0b3DrhQY2LHg4kSTFHnpjEocCkKDkTA8Px1V1E/TwcGxMfKnl/WuhQWdloVN0uABwVKr26bWWjQdmQcE3shQCwBWRzAZal5DoiqyECiuw+pq1yh8sVQsQFLTPYWD6EH8+ErZLEMvptBiuHkuXW4IUITDJKkXBW0vSAfTDeCYBLXoCyb9iYRNhiO+QPBP+r37U7xlPTo7O5xv8dYafXuT8d9wlSDnJ8DqbCMLa+BbDi9wCZ3segFNlBkpEWKv9uuabLDBTsgBYuEgoaeEQPhXRn4LItgeqIq0uGNW5wHQ92UyujTja22aP/7HbPGTjb2hB526NwVx13SDhxVcoNojyyX3/uJd5eP93vuTX8D2Mx7uHgrpox1/wUoqMksSoswnsIthwEZPelJwVRU4Ma2NPAxmkYTYdomIgRhODTTtHRfBhN4g9zqZywt3x+wEUEYE03sPNsGkZPi5XNXuQSO0AGCCwtb9sWxxDB19+b784CbJOZO9VCxSkl16muHcTnT7XwMMqgURaO4tuOQkhSnJcUwZSyxQgkeAWEUXclW9FFBpj/ZEw3F+UU5gAoujAnXKhBo21JIJYXiD9hINArNRZ2gzP4b0anZtyZkY4Zu5ch1TLKVsanjNDJGEqGTAWnHRumDMV6zdinpqTRtPP2SCP4Yo8RpT3STo/qV9r8pSNWQIMQVKeD0o6WH1y09M51EL7p2DZiwaNIUd+M3Z2GRaMBjiq/i0AWhaabmVpgSqH4azUkLBdEs/YFTmIejqPujWdxCqkVXlQBY9Q5oJipGK576qb8ry+8o1+6Oj5zU/sJ+Zi3et1DO4jUEQ6TQLcOIFMDLCme8oElzH15MgltPyOgJ3g0PxZPBmQtw5y4oDHLHMEnTnc/Cq++nDE0pgX2Cq7XQq771mGSk5C/FarjKB20iVz+b9hgrecYmwMnB8nfO2WvxEJYxNACpcWA4jY4Z9CuD9kZctJr8CgSADafEAAqEsnMe1vACGPVLDO4NGhhpUBrwZ+XMOqxEMsEdfhT8fAQjYk2I9mGdKyUmhyTBp2gvG7YjGKQmaRVOWnFWHQ/zAIwW+6ce6rqFc+k8RK3JEIsYA1/7wZzB5/btuUauMr+Da3fNOE3X3PmNc5lvZc771HxxoxbWjrPGKge6UZ05+6a3FPuZhrcyKj9lf21YUWroFEbSKTd/GcvM5Qql10plU0f2aB87F4Qext4mmFSgcCPitxwxBICkS++3ZYvX08amWladpSQA/89QMjcAzmmLCqWokaKYKDHfpA/UhLx/CXoaK8QHQq+FRUiaWlEn2AStFeafTJON028DkKuQ80YEgSUDpzfhn5Ef+Q4cViSKLrkldRLObmGPVSw9+jXDPXa0C6csGJwRHpbOJ1avQQRFWvGVoy27hHQeh/MvlMVluIxiPJuIbWbJ3bc1PFZILItDaISVl5l4A3gwL6hryQwxNg+4LNKXki+yr6O+WrSHethK0T+9AMlfdr4Nb12dqXlh/zPUHptHivjwM48PhcVv7hd8BdwQfBnOtH7PvZUq6LVNZsuy7wU9UDZsQ+a2GtJYyWHDrxB96FIHaTb1HiV2qqOkp/x3vbwRDiqpUscK0aVGPeZL0euKQcqPPzLguYLkf/HkYNM/42jxzkHGnYswJnVQTBENGTt9EkxdKWJPqXz0qww0EezwWpasa54hVaNP6xHlSk41PTwafBNeFlNnrHd3jk33Z3TcSydmdHogll8ztKRkD4gABO3PAVSp2ObNsLBCjItK0zjbel0Squ58IybSQcj0npg7N65sJkfBFvwKUvnv4w6jvyLRbGTj4WpF0Ynn28vKqOiPeQ50dfDqJQ8hkHR5UZvuC0Q5M5OtMbkMpcIMo1imCI2jtYFKUbVuUklVeauRUGh+Kpu/eflnsCiGUd8OmGxSdBCxMaSHmXYIKspy/tY7Ci8F0kQIZMUgncf3kTbhhEZ8COx62IIFQU4f37E6cF49uZhNvSzZxzotAiAVsJCDgsHQiAeMBFD947QrEAbnEYE6fCiJKBFHroQ4CD7o3nDMBgpvx8NVCOk/gd9mJ/4m4/07ml2ZayXIR2DOg8y/hpjRJq0UCoJ65gHqWySdVZRz9z4kjeKNxK+/71ihR1c+g0KQT4RjVjad0Dt3S2G+oCQNOxyNrGhIIJV7Y9SKR/BwrQ2ZnXT/H4qnnnr9GWkZ8B+ZKF4fEpx6623RXKcVX9h4jK+KLOCyHaXuxvhorExaM9AIVDCg5LoTAiBcmlpeZvkgSRiDaPHHewWXdpLcLVkqSCq9nVma0ClWkSwa50mRFAiNIeBcCbhsFEzNF2WeBriVCGXd+SyIqY9Mu4iASWJIUbzpPXH0/qgZA/55nHnO/pVh645gD9QSwHBtgKK2HPHBApKWSg2SSDfQpMNFgYRwEYZEYP7VFtTJj1P930g4bfxnWtkek7LJDDawY3fHTcTiGLO9/qaPPwwihNdEZRInsW1D9fSGzD74DIeRE0HNeQA324QrUcR+BkIp9xgF8EEJw== ]]><![CDATA[ sOyCzwduELCu/r+nmpI97qhOQ6V6Z/5SWzFOHMEj1Go6DgU1V+IVgSsLlwpdlF0oMY64g9+9TzCjCOe5oH1ByQrQ2ZJOSokrQSRkilohrqQ20DIB5GFqLdrOUpSn1Soin2NFT5QCVDlPGZ0tk24Aeu2nbGMjCAFOY4EKbTceER1DvYecWJEsx1Ylvdeypa/2poGCTCM4HYMqMsC6gl42QaOUYWFubhuzH1kZtsZEOsYE4COFo6pM7P7abj2/LYvlDj5nSOfkQXw3Fej4V9MCC6/UfdpyfmQx++OG9f4O96yCf91PiIboNLm4lPcvnQnurGHdv1uanVwsOnrg36wVTaMpB1zZjnWkKPyj5nqNo8Y1+i7IigyjWMjITUwlh31uY9zYFqj8jSK07KRlJAbq9KiIxvJLFSXctZz3a99Wwy5PNICGUjkfnNpLb5v9GscZ8WD8JV/CGZLqm3t82k569ai2cLJq3m7vbXvX5zP8Y8kSCb9aS0FRc5jlwdkmWeEEuWdppAVpdqAU9dAo1RjC10SiftKy19DgGPJBXvzQfB+Q3T0sdEUKtnSTx9NmHPQsZOeMcJoeuFub15YgMqS1QSZh3kxwcOKAL9N/u3Wnuf44jcQqPfogJOgDFyiBmrceIG9DQMnvaIfTkTqguCp7YcU4gRUek0ZTpF29PAFKEuEmmHwt/vMfop/fgrwgZsahuguyBPPJ1VsYuqcVpkh1wn2ddYRl7F7p1NDDKXoVU0x/LXiUDqUX9cq04Ve3qsRb5GgPRsMAg1NKj1G2V2zSH+muRRXuUaSrOtrzrTGhWuQOWsk0yhXEdoG4DFRi8i+yqiWkFYcGhoNL771ot66YkdYI2bL8AP6mkKAs8jv9sQvEu+DpvAbCVWYsy3ceQbk7h8IeMptkdew3Z/SVsEKgcXNjUQuNmtRXrsEUAgwLU3YWg7UQHVAww0VWtQlSE4SG/2Hi9dFXf2TdaDWJWkgnYHtBadjtkRNDsBJz4358pSeWu34W7Yhx/w8FnTxD/BkMDSAVaYRGgdfOFsYMsNRgvji6OIp3OBdT/WCLLVEvYaIv6W9Etn4mvPaAC32m7HUCe+wVfLUE6ty2Ux9QTZJCB6s2PDzlnAN0sVIGVaWUKSWZSvBB+W52dyoELgUbBRoF5Ksr8EtoWiKV4vX2beL2Pg69mr5kFJyLFKrXTKuPEyERNaKC9CjSFCGaM0cxMpmFXjlo1E44FZsYCqlatBNjO4sR6zY6PaVaelVLJZnRUSITK06n3gpVqOLE6J2KkiFiMm+M84pMCY24aJ0Y1UaG38wn2ihF+GE/ntJLfrWKxqoqh6qqWqXzCs8dIraesDBK2+yyqNBtrIrZGJuOlqJ4h+YLoYxjUq2RThh6COosNtWqer3qKoqJvRKBPPWPyeORHcZlvh7G9Kr9UId6r+0QdzTCTxRsDk0fiScUptNppSRhvOiDZ4QSOP+MvEJeeUyQL/hQ9/gRRuPhTPhsxvOZCDSuMpDKKQlDYwPr1VVbfus6jFDyzToM0oSpqZXDq2CuCiEZiZ1oFsPfN9y+b/WELF6Fm4jSHo2XYryNxDT7gipmglZBPyeuU+12lLGS20T8xHgqdjuLdlrVcygmMxxTiN3INneLUj0xVQknTuLAEmrV5lgIhyRkJhvKYzJVcsljIpPOYlUShKJcUqZgKplCqeQXPZyoZsEFMmbgREHF52kv/xYbypc/jIuz758zdIGXmRZ42uwxMZ+YzaoibDY1khDjIVGJIYhEo4SgMd2d8JlOkA0N0d36bFqfWRr6kNA/Qh96ConQ8zJCK3qQRyGBRUEjptUETVAMDaOM1askRvlXUzXKMVOcxyb2KXGEOTLhCZpSvPaFV3m7k+w/ZfKN6hPMsfxYL94a+9ZYrJ5Hyt1NUUfCoxlr6Kl8OJyV4wklw5c7Mn34ko5odJHuYyGNE2JdZHI6+PBCihjBkPFe8OGokI3p5HNewslD5tUZxTIvNjayE4nwRBeurta/xzHf/Bmaw2EQY2b7PIkpbkVWYuQrN76pkRhVMd2mU7PMY3Wi6PDCWuvOlrgZM5nTirUfiZktJtip2BajIDVBqvIg9T5IPUhJ9RSkXuLH1XlGApGQShGESsEgJLSwClWWytTEGqMIVMXgmtWCiwyuuRpcb+2Y+p9tMd4qo0lj9WJE1NB0REXRVt4WUVVTMdWT3ZBZ9SI1Qn21+mdOHC3mWZFUdTrtJ0rmxYnIfcrEvEKqRCyKX5SxZv3L6l+2Eb/u+UVc0V/7QLLpZRVIVlWdlHgdew7l+Fg8nZYuIkJCFCiUCRQKMZAMG6ISKKZJEcybIl4wHSglnPgaHCiNVhiSkISKCYVmQnBCFMiQTCFKaoUQirBAoUhiCJ7hESRCvGSEGIQgiTNEQ0iLLCWYY5WL4X6FmQol/BaCwUYITkiFChUiUOjqEOVDzMhDREOYJEQ7DBHulyzEQzxChNoYLuF00MESRPhLuIhYKBSJC0W7KBQpISLsJhJIwhrYyqwquNVQr3bUoa7rmuyH8MwQtme7fINNcQm2TfvBEF6ngTpqoE1ToE1XdepZcKU0G8Y0UrApMXYFO8IttHATSyacD1M4L12gSGjDGq0+REP0ZYN0vofq+F9HPHKoJV6UQLbJ4wgK5BcplHtPZ3qQkrBJ4mGKLBOmpsipMEVF5agJrHAqqAOrZhSmFgAAAgUoSG7cnYiSRk1QuLMY0WYxS0jLqkPRGROqWFQh47hbryRKnFgNWSNiinnYaTeyTQQDVYUa7gxC4cSZ09+asGpRWHlWYVUNorCqzoRVX8FE06GhUDNFDTWrRqjxIkKNTC0SZM55uG0xG+qyeEG8IDYFm8K4I7Nwj6eGkyBlkHJBGqQzFRXYlmkmUKOcmT2XoThjKJY1FUYCfVmFOL0e5pJwUjhnE055PZwUDq7V3AsSpE+1RlrMpcSR14S2EXEJjS6aw9WqUWsyDg4ONVg0khytGo+BQYs4XK8HqeXgfMXxPCzkjUPpOK4pcR4ouPMM+tKJkjeXlXgvlDl98kDjfPewo/GXVtTQDR8vrcaQVCAprQ8n5EESTE5CanJGihRMbjpuI0tkjIaERSTVcipKKkIkrHSUFIkUDCvpnlKIkiV8zVSJzclaSxYVipyhzUdxrxPKSBK1cCcLldSUrNVJ046KDo5UEFJe4+wmaQUZbJE0EY1oyjMJJCRhOGqhkJTsyRm+w5ZJoYyUZKVDbOk1Z4V6dbI2p6MQnMwy8zCsqnmNijjzK2NhyKF5zWdheNK5Up3TRgzdHylnFhtJ2GdG4yGHyRZGJmKRmr+M/BIKIlZ4dweJvq1idzQZjdOHkrGGxFfdhelmQsl6NmJOfV3vyGuXhLDMNW+GXKYGJThfFo1yyaEbbqJMQ8hDmbyKRooIjujEYWNkbCPhS40/S5SuhSv0WyiBX7lo9trl2fjWQWvnLUvtwa0cZBdNpEZoL5mRLMxe6pOyQ2eU2XTyqIZaJDdZctUVs5BzRItfufw1CtKN1OXF1oN0VMLXRClQF30b8SJLF8KTjV8xE6Gy3vvr9Qoio/0iq3h8iKTgP5PsGzu0c0leQSg7T5r5i2qKgi5Ef01UhMnk9GqcFibjDH0yVlpxXUJCaZ+iYLfXQx7bqwYnVZabE6gWv9ZyTpm5HSNW1CI4hqI9hqzJNLgmY8iI7NyDSjJ8YxduWKOKejQLfSg4DUGTm0Gm+38WX7ACZybeMiM/ROG0EZIHoon3O6gNNZvITMlEajFPkUSVdEsmdoSL7ijEWNTCphlVPePEat98vYiMfKoODbIPVpTjlhqKB2VGKj7TCqIJD9Jsxem9Uz5rXMag6UWvpqQxSGyg8UKnsTPjdvylMn5LhGZ9hI8k/Uh5W/YnBEkOOclsIncNQQY5mtNIF4KkGoXa+pAEGj/WBNFCjJ5wFPsWjW/N3GQSKTk/8/pWhVKqoX4e4khLiUc3tWp6mv1VmohOYI2UhWwmuUZX9whEI0o86nSiIgUpywaWZdn4Jx/TpVbf1e38f0xDTIscYmg89bMzKqAEIQ9RcQWURWhJSZHLRNEJrrHCFEekokFKioiIVJ9oYjIJlccyQ48Ez4RRiTAEvSZ8hh40vMtAtKJVWIXVK6yKRpwK5Ah23S7TrmqNQhxouiiOhYiFCIaohGAZwS0jLIbCGW4QckRpOYSRcAnSNjhECJo8XGhhzJkwPAMtUASKQBFo1WCg2ROmKwmemDJ4wSbOghdc4BKaoaGsRoTzNM4XTjOcRUpDRUpioSSMsDalBRIJJGWpjEsHlzovgpgvYRCLo6Rf6qTkE66wVy0U9r1u3xBm3SmFusSH/zKc8oEzrmrgDKcPNy1yxxviJNEQdzwulQnV1iq8rVkTSiQaRMRECyIiLC+IiFBUgkiIJ1hqwoVaDyUhuqk7XPhQDsPHZSqcrArneVJMODdyOOcmA4PZWTaB9kBE4UCBHMNA9PB4+ITaLHQivKQmSuzH3baZED7mm1S9tqonioo8RRMTQX9xKCpqMVuQKDYT06jEYhhzmWMeMhLuwmh5do6cImrEshkuY3m/f1bQULwuUdSTilV4lnqo61lYFe5GLqq+JmgCybt43HNMjEjtQ4qPzc5a1b+Gq9zz8ctz1NM6/sz4llHNJ06ezQSFqkWNzvy1NmQRVo3EY767JK/oCgNEIeoStQrRmNUUPyLiT6gOcc0oD+MUjUJa0FYHBAsQHFjcgCt8eoR9CkrOsKJWCAMUUDBZiIUooOpqgiIY7SqkD8EiUUz0EAVSjzQIDCAOmD9CFQ9MdRAFDOmA4AAKKIhCgCACCigIggEUBEEAhgowAAB0I3KJIozMJkydypF19H5oyDUiPj9VZIlSdGIVz6B6PnNS2OEYoqp2HhJVDHfGqnOUGMUcjl2FRIjEIlERytrNIrvdcUaqUZJm2TylNSSbM6RILBQTZFDaW6pYEmV98TEteuEYvdBltILmMBgtKl5oWdwRsVjQsEUNh5OkL2qNGkZtFu1iMqzWqKQVw3NCU6XySCNlRhpVcGK1mC5co5piVc8lZDGJ37km/2jr2M1GwpdqBDeupqIl40dodyUoODO35rNHjatpcyqD0lXitJKrYshDJrJrZOSzNqNsFhjxxEo+0XRexLc07MxQ7I3i5jwU3yoSOl2kDJrsU1UMKuGlX0cuMjtkV9MMyescazMKshTsDIcfE82F55vP/FOXP//8m+Cno5q9mfJ97CCJjn2oPOOqrOrjhPkcI6GxYqGMMMpS6sW9CJ7jWVa1pPa8e3QeS7Qij0YnHdYXj1U2vrD4b+RPMO5d5o9PzfnTP5oh0Zgkc8YK3WzIjG6uGEjFmJoMsSS+TIwzKNN+nEnMuAVV1WuEUed0FRgsPc1dKR5DXhT1mkCk0qyvlKiNVxzFVDfSWTIJJR2m3TFJKEsyRIlO5LOgcGGRHDFL5i4iIi3pjUSXEUpLyMZbQ6ydKty65dyaDjW2xQ== ]]><![CDATA[ 8QwqU5CxasLRr6q9JsoLHTsKXU9MSamKXKaKqRLsQjZ+1ZRP8nejFAUrNnaFK1zz3griSt6wi8oS5NDIhx0thMzTNVrU+IoRrbWicAhNRibmQWonjeLPqnWN5gkFZRPWMMzwa2OUdPfqdISZeVNfJyGLmAp7fn/YPWbziIhqjhoJzWLkEtpbErtkRqZLJG2VqyUvEtP6cG0zDQqN5TQi8alZ1NjEZFgz9dtkbsmzwp1xm+vu1JqGiyV8lLNFUna3NeQo0b6cfMfs37pGBch6VzRBMmllTJ+Qt6FtXB/xd/U0fqKCf8uLXB2pqktfkLWoymtRNKNEaYbaeGhNAQrXxCjc2oTYNGJpN0mrv9y6r05JTOwLcRPmRn7T5fxGNv+soiGjWINcE3UHw5MX+cY3rT1xxWPxxSEKSoWk0rlCoqWdiEmuaW5jpO/Lz6W6v+xSmx5TVyab4Pwm2SpiXpPF1P+SO0r9qDwpUtbGsCUT2A1LLYNErM4ZVZLNRnJZHRGTkAK1QeTYeFFPYyrIJeVF8WEKIpc98giXCKKabq4VdDbdKcF+RlnXyyh2VfqKmciwZFM1v+aWmtf0JPHz6UjheUhILqMUvUyLUM6ycQiRJ7kbw242wg5HP1fBlWg4nBDzNpbNUlN5LIITMRpDKA5lR+itD3pFrkwqiKO2CtchIjKG4sjtEe9FNQO/mlSIsurK+/bVKlRjXWbzNtEwXnyKn3I9zlCeHTXl8kgql0crd2uoHWVVTYoUouKv+rFCv8+ce9EVX7VT/cOe2dwwX67RTvu2rrS0dtHMOKtdM2P4bG0lpNObRsKUlhRhpyo2ldHbGnmiv3eU6LSiIfTlLCmh2NhyStRLmOaFg8y/otiR6xUqeNbuyENMounaygsVbEeqOlRbSLipBCUoSHB/Uet2ONqaICqDJBdE58XTe+KhYHdhjAEDggcMoKAEC5RzEsvAENEEAgRAsACBgZlv3aeeGrAAgQEJCxPlI5Lv1IAgIEDBEmD91Aqr2argmms18SKp8DKFj8KLEaioWIFGFeWtqkouRKw+Jqo28W0g4pMMhpQBkoQ9MFyEqoEnUEVICCpT1dRVq6oKUVETIaLKISpqJhRJUZFXhiiaUCeiEhGFiFkYKtLpRB0Shhka6mgahkOncDoV6XSAP002UUgw0TDIpY4TSlUih1KFqsZBiCUJOahqEokdRCBNRjVaB0FCZXIIYgdVoYYdSKgZAzTsYEZEZvN/PB2hcBB2QTZCRePqhE1IzCjQG5eZh78H32/tR38g9MO39QRO4Bs41+iP0pgnnvF1Wv7vWmmJlemnuW3X5fLU3qf+TGgpiEPEVU5GitgMi4T5EZ3JmBk2j6wLd0KVdB+VgToRglqjxsZD7QgnTHRCvK4jOIGhaGijpHdDD9KSUpCKlFMKbJXPKYqgdY3F0Nq1BxqcKJFKKIl6iZyhhMolLWEHE1NSMsmrSAycYqgxUrPxyC/hlfALw+XSiztjiZG4HeFFYpm2tR8spsWWSdeHTvmVukPLSgh79xfxTyY7JEGJaAQK7dGHkJCHvFg8MSgCBZFoNiI+ip0YSpF8OFkYNsKcMjzDpwmVYjCUReEQ6V0oQgZRZiBIBsloKdQQFcgDZXHqWiBNAySLYrJwQ9DBYQiqhBhVxEkUVIaZpQNKmJnwzyG+7/1MfCbzYKkdLNMQvscllRtnKLllgJSGkHWE2B2QmhBB54riBW4sbhLbWiGKz8LCxFyRJ4sKcqMETr2s4wx18PnF8DV832RWMrMwq02Y0ccJs+lDUIWlBBqNUqxUjd5y1DgyoSatEB1E1TI6qqwEoxSCU6MJwWJw7ByEc3YwivSh9NmQd0CiH4jlxmuYV4wIhkRICAmRXUI8doXEElDAGaIQsqCDpMgEyil8ciOIVIKIiEgFIRvRQVCoWII56Sjng0VWt+VluN1w2cNFPJeZi0SFeD8xIxd6Pw4jQvJSfaQWSsah5I3STJX2ixq/msLKDiLwbDvjDiithLYO7WnYex1UcCmcl8em9Xc6HUgEMgOVSgI1WqpWWKvswCNuhfkmUKAD1rcBjygijBfG48CQCOU6lFd8iCCH/d8XlLBWhZ0Y8sAPPR2iNNQOfcmEnh30L4feZwd20TYU/P/soOEPPzn8jDAfejnM2cEn8I7AmUCf11fvgDUNMcJS6uKId0LIBMlDhJAnRBumEgfFJsTmXiA7gQ8ciggyp81w5l3osIOFdGSmww4iOtU5eDge1sTZ7B+Gz4zjBUsOMzMe6ULN5BWCQmy0VS0eRkUXmZBnHhHYIDRFRDQ1QUoTSr+JHciJH/pEoojFg+qw8iRw/JgPRJayeAKR1IGIQxIOREOKhCIurIgdCM1DVET1IYpmgQ8WVxeGbSE1dpEeViuhMEaDC+sWtorR5JkFo8iBtVeUJ0EqSKoluyWQOAsrCa21aPHQIpYAAgJYgCABnnI10S3Co2CEJ48ZPKfaL1W0myiNzFWZAQ4RPWKNJSvWhMQKP4ln6uGVqJeCFqqIh+OGQusauVPc7TYqjNCLnYiJwI4rDmwDuMA2KvRpAgU2N0WzUFVW8kLZFMrUUB5+iBeGC1/mZkhGDki1wFKbWA4RMpEhUkn2uSn+C1Vle1JN4IisKtWKWF/HUQoVRcQiELeZLVC5MS7QiKKDqAObz4Wo3eHNhOA/LxyEXD0d1By2aQTZ2MECBAbotZdu1TGXKqFwBaFSB/MgUVYChb4QUtZAefBUNkBIggUIDEyIcUiY1GKRcd2dCNcUgouH4NBTXYWoGR6pEI+zg6i0NMgCX0IHAAAAwxEIcEAYDIVDggGxqHb8ARQAB6RwOJo+i0NCQSjUKhXCBABAQACADEkAjj8ExtNHqRUxtj0avWbHvF+sUty2a7YBo4K5G75SwVjlZFpAs+9N5u7MTkhPLl+iR+2LLxtjgA8smK03/kqL4DP6BWmhaA/sTlyGkgcPslbXX7ERM+FVDkYwqfbrNguLV2Q2qaa73zZdGX/DWEdmWQwwcJYBr7sbOu7byLQxuQTx3gtbR4SG50aWpA0FjgQhDDMWLTONdaqp7E3EKeGf4epeMdEbG0cv770ucHg8VKAoihaxLG2rsTa0J4bvF+ULVxBEXK0raDPGz2wyFG4yu3Gl+/w2i9rgln4HTSkgw8IX71Ccj1WD2yscBajNNkJrKE8afG6Jmb8uBZ65hjoFBOG12AXGwACD/C+qOydCsN34zJ64R4OlNBa+iAKMF3JF3Xd3iXJz0gbem1cnViyCMV2buLzAROwJOVOChazdyl+O0xlXZZVstsPCJhm4mPgwCLHL8fcpAoJjQEOUu3haXcg7wzgMoCc4SDaHMFWmRUsAQcEJxiQaxRiqr9GgT7CuHDazjrOylvdU0VaEO/Bw639X78orSP4RKN5rDDKaVp7NoqWuu953csQXuWzfEHlD3F2w0JAu5RdHUsFdX2WP/pSoGOnt1Va2FjEUvfgpn1A9Zk4/Ck/rU3MsFgFpK8OmaH9fl1nR/j3n/GknHOcEM+nC8CN6YUbO4mh5owyDcQpDx6G+JAl4i1JNgmUKG2o967iWA2QbawG4Mo4Tp+XGUToLU2djZb9ZroxFzuv8xpmYLyYVx2QBCgP4OMGy8L6VwLxYz6rZzljTAbZX8550ayFQNdJqsa8SE/Y+B1cewObJ/+8/1e3TujaDOv82Rtftfeasa5pA0SsYhYORmYnXTcQ8hcC03o3ekNjWN6o8LJ/bjah3XbMpP+05WRjC+ikhzRSLbvOhC7eAWh3MKU8WwIrNbRqnnsY9cqst8XZ+e0dDLjxaUOdmPGfAXL5XdUlewXJO4/Q9+LCLTm4LXFzTFK0kJmPSOX7HZ8DcgOseD8xvZ6/dvMtWII6CyRL7xidAC+3A84dI7OReXR/nzaagoemXA48TwvAWn7wjl/63ACBKcm1tNFbD+4TKA6LHgWu6MzmTUQvFnHBD3eBxY1mVrYwM6Cis5Ye+CqstNjX722G8UM3rVqn773G+sy+22c+QLHZqVOYMu9u0EpA3TedDlKxV5Tk2yBm8eoMNrLwNN9XZit+KdBiPM1ZTPdbCMFtHUzf0AsXTMDq1EnyPoEFoA2kxkIWoVUpvOaQdTIquBIl413GitcGsCuNRoLkHUzsRnz4K/e0/sDDeULgIMQecSPtpj5qxMyREZ6Pxp8T8a9RmCES5XSiX/aFp5FzQSRXiwYYR3cg9B6Z40Rt++c9CeOwiZJmJrMwxL3ccEhyZDO3uXznDJ7DtqgXDGnhwyMH1Kix4C5xzW5lFMcJlhZvby/IyRN2hvCM5Hb8JNs3BL7bvk7RHtelva2J0cI4Sz74vWylPiCUPSXgUBkjhsggBsivwal22SrUlZR01iTt8kdERPXG076wMUHnIdCfGmg+kaLSr6WXJ2nyFARpjwgU6vE94eOxC5nk3GRwDn8UqDHca77ajn7MjsT98yb3fuWCcNr5DQ26EhNbNoA1LaLSMXkk8ou1O3vOqFhNrV1T+hIIwf/BArXkNobDf9R88iAzjJjwb5kxg02petVCp9RMHbplxnfDlsiDgatWNCaMb5FeQ4Ogm9CiZeORiFCtofGYTmxdPzidTeWQ6YbWXUQClBBwMFmrjciEN3p2j0dT9JuDsB4DtE3pH6qZ1cr1JMl8fD/x+YJyovT4gMdEbNVxQsl8MBneTtCp6Q4xmNYBq/G/f/Rb1AjgevF1hew2cOBdP3yB1fGwNqGFvF1jCkFiT20wMZLcjYbfHFbtdjoe8HGVGW1Yk8muihHVWIsvrHwAnAyLa8df0KzumDBR3cYNyULIOmGyWN1m5AO6BqJpgzGb9+N1Y28e2nKbJx7nEJ4xnPEF0dBhE4YQ1z9YIxQoXdm2nx33qhG1Nc5XRe1sTFHNBDjCJATWUSssC9ohDxSaDxtJdfudncZ9HD7JuNmMLHhJjkSF01V/wO0b7q+jtuTwZdjDjHVykYT9Y/7LuNW8ZQCgflJxw0iZ4gJ4oolFNbTwUa9EN3/FqWuUSpYZj0fOcpooKbR4o+zqYa5h5zsznqcAgXilNqPdWctWx60C1klkjXqzEB/kJzGPHPeDHfSc/FmzZVlJ8AsMaX7gn5TnerAgafFScW53UwgjCnNF84cKFU5k08fHb6gC1QmmhZxmCqj3uQ0IDn6sHPd3KBh19RI7DN9NFHmllOjqBylCE+gUg6Dkk1qB4lCgyCDLf0xBTrN9RGRbByAoFSBHUoZso9Pn88hY/nUNacdNtq2GBso+ZAPAOSHMMdHMXOGPCT9EeJVO8NpVcIkiroAyicgOCywEPh1gzX/lMRCSTk4BMRxT6IYZc0e2P3xAeN4ApDNjpKijFKzEh89K2giMEDRVsrrz6iJ3lgYDpQgVmvT/jgf+3ZOjboQ6N0AZ1dxXGnKjNHL0mIfhpVibG/5HYcPcYZLPHid2fC2T1dLcZdRg7/GJzmyLmHtlCr31OTWVabgbYSQ== ]]><![CDATA[ rxdHsSG/KKmrRBBdv3AGj/zow00gyBwm2Btyf7x5CpRgyccGyDwo274/FM4ueFDhM4SCB6Yia1QnLb2Ia84iyYC24Qg0S0K3vA1oF0QkjTjQH+D6FC1xQw9qXURpDQFXfIaAH7m3mJGEhisKG2yKHY9bzjDF7qxGAsH8nxjIu/STgL+oG+YACpl2Cbud+zJ+T0XQQd1t60EjnkUwU+R3/G2q3gk4nxm9MeuSblxc8GB1fhurPc8RdHcKEOriZN6QoMtD2hNoax57VwTdBSPQEUGZFnRDalePBE7YgKnOU0TaP2iR/CXetWADGMqncWazE24A/GXnenOk7hF5XEd0zxYOFLdONmhEgScTkkWx9SFF74clbTMeg2vLxWVlFv/Zj9iwZW0tyQLBYeQK4jR1Dk9IhHSdv8OZ4l7mhZL9AJLygMaf//Kx0gDahDwDzXfAmnETRaIK1YghI8YswnJCDa28TPI6A1VI0MZ5mS3BCIINKW+i9cBUIAhRiP1hZh5/3sAYpE/TAbCDRVjHEJsmITLK6ifwfP3VRm6EuRANa7phv2YiHCXSVD6bqwNk+xlAhSgmGeWlutKyyDYQ35L60/SyBB8++sAAoe6DdPp4BtrRelh3AAwFQ3QFbybB/QnhYadbQfmF3A1nxXNDkJ51iU/e2NX/yfIW8V/aZeXv11iJFlw4tG3si3PZo+6JUBqoCTsegFghALkytg8g3Lgp1J9GCSG9JjYENTTDXmiGvB1c+JhAbYmGUSBwzphPUDf9nolQn/MjKKentAmdUeU7SMvJmC0SDPSzAGneLGwFQNaESjFCEub34G1CesjxTr5jXD0QPDL/7K425xg8sgZ1GRKtj0rQAtH6XH18tydtuGZ2rHj4zh/7j/K5yi3G0QJSFN0A27Mwu9/hKdvu4k7opZFjaTugsLGuCLwcm01wF17ZyZiy1vzht5icoQO2V3d8PclBOlsdlM2mMeo4uULOqRSwStqvEBbwF2vU31yQSxtcMHghca4dsM/S++AY0JsaDzzHT4xRbmlz+I5aAocnAxvPDBMBY0IESzKmGLoO4l4wnRyAchQ29xDYuHYXQAUxufHcE5WFbAV01iWpn3a/bDpUFpgkueZiVPQ5iv5+tzYrY/MRRUvuZjHK9z2dEsg2MUSah4mokIE+8BLD8dQeN1iQx+xcU4XLAB+H8I/b5A5xFUjLGuG3Z5SNewretZnMPyPwGveLHHaHMJdpf2zS9PociywroKuHEHIjPxXxCSMkdJbFx/2VZkgAmqQxtUs07hlEORPqQowWzrAcxL6iSC9NYk+ZuKHmai4DvFUWG9ALCI/Q8E6JB5474q0U3R5fGGNCTbLRXAMs1mAr7ckbvq9LlLEt1w4r6vBsDhZEmikLxhQ/zoypteSQQIVwQxcPtpSaGN+2lefsc9GKycJMoWHw8BIaYZMqcKakFXpgRh0vGu8pxANsrK1Ig35Hwm8GVEuxJ7aRL/lBXAHpkVMMnNL27VMzZbrZGT6xNk2r9YJz6n0IvF0gWcZ2DamwBfxvsGCEgUam9aA+pQ+QXne7fkfyBn6XHDJNQ/3CZwppi6snObKhu734GfgZFwrAfOriSbcnRo1wCg4Lz9sf91XViFkzVNsNiP2yHfA5Ht/88gsZwIFP+YrPIhY4aNjYKjE9a3s9RKDBoFn6VZoez9NmugAXHAmkGuPIxc62WgqDcHycbt3DayntNKG5B6DQl8X824p2RyRbQN0Oi8xgBkMfE+NjZtC/kdSMBng1A39HEcg9OzGsir61CeCE3EGbYhNjLu2HDRPgIKZNgI4jbDaJ+UYfOQ3G7I/zZKp7UuPzxKCuPwSDHuankQZqswqQY5/APY3/8wMzlNDxgvGLek3yRmZAj6nbuPtMhB+MnPHUaWcoRuCODUsQAwv1x0zMDeywf1NyetR4UNveGw4HtYhfEjkLcvc5FicDho/GavZ1/Bz8ANZ2W026vXkrp/uCMKjhrm3Peh2Ln7QaqdGUGLYAC/erQagukkB2VNMo7M1Mfbz027exGsaBWlVrj+pi3BgyZ0Lgyb8FYawfgQwr2OPEGea/MGCKyFFuv5RpADqiHKgAscUdfqlB+txkX5lDbD1aDkYwqOSoPrTfuHPax3DKshgBhXH+UaxxUxEjTD5jxU5vcSW7LMDNIBVeTPbywTOcZ+s9Apql4iDxySDlqEJW0g4AizNy10Ods10FUEjVE4lq8WBAWKzTnuBztdwyJkCqPlvg8C3JwvBCEgcQmSfgCmWoZd1wX+cj0yQXfRBmQ35oNRvn3VeL1VfLD1DNg6AYrhy81u3XkqmLAdhSmV8SJ0v9eXia3bxDAkESc82/JewL5GpDlBGmxS7tamuhMdwESePefI5u2t9H/rviwlyCaQQVhYr0CDiXA3F08dRz0RY0MaKNS/YcbS2TSPE6W6Ir2IdVbYfV9p6zkd6pTyoi/dOohNF9FJc9qimDQk+f2HlwkbmM7p0baHWqn4jbPVLHptFetQD52mbZBAGSqu4s7Ue4Iatp4TNeQTQWwngi1kzkoIDes1SGG6YiAEsbRuFHKMPcFOZsKPe9OnHmFITaurwyfjYJ8rS0aEQTvnjIxw4oxsDH7LZekDzSjumVdgWc0QJoMkr2b3RAaajyaNcVqlJ3XnOvrAH8OAitOdivvGpAncNHBeZYppadImG8Qoe7RemaA8ulTeZGZ0ejQFvtLdz1SFUfpt0wTOZUTLGpBBS75nbW54oB1xPIDR6NdiX5J0ri6FEY0MAscn1HzAbgNtIhvuRSa6DBVyUICnf/Y4a/mfAhTssZKSNAFbB78ezwaVYdB8eFOGAogybDdo3BwaV7N6e0MwkuzaEmY2WIAIJF29+ER14Ap21pF9LraN6VCvjjgNi20AbyiMTxqcbn4QaI3SiLTpZpBJ7WIhzGJDy3Nc3lapxeSSyR3fWc/1Fdw7pzmXaTtDdFOHjiPE2rP1dA9p4HdUUHc4YBTU6A8c14tJ+I21lKS9A5azLSEGli2P2hDKDFDvJlF3oXR7A2iPzjKsmqJ15rmI5tbwlByv6vXpzbGCi54zKyV0SLlq/S8vOlSTh7L0b3AVnRwkhvRuyMCxMWbsT4xzqhKqnN8MFlerlWkJ/gLA1i+JXQrhpQPqyJnWmCS4exVte6B+qN+zusarnw9d+G1eQio3Wq4GVrjCAxfFusmfYxWmvHj7hcFacfU4onO0BA+pD/r7cHTfXzTZiGaZnxamNU/W5vkpKVKisb/UPXb/Ulol008eiJVe/CePAYIVE4K/X/gDKtKqKwf8jdh1YxVpJ5+YFVMXHa8wiPwrDp0zseq9gK+mxWUnzaFPCXMypL2TgiZGC5WS6lJWoKcZDJWkBzAw8EBivWKcMzmnO+Uzo/jba/YP68y9c2rcMY/kYijAhM4oAio1O/TzSEmO315q0AZCW/IqaAT0FnxGZAXFbXRtAh4JN4MzK0vu0jtV26W6ys2Pr4sKz8hprBglpXTMJCT1Ec9BL7qGpTjejv6mASCEsP02QR+oKtPw/sJ8bbTQPMXPdE6RiLDNhBsZPhNn3UfWQcr/dhRocmZwNd9Jgh8O20O8NeOJSTqyf1i3pnsxSBnzB3Cvf0mU+SgZSbP6/m/QI+3RLdyUuSjwfa2IpcRWUqtDFg9dnkLLPY1Zp9Uguw7RIo3ILh5oBxLP2XB6LIZ1vUCevqFFwDGpmEhf9phKLiIyIBgVBOJ1wEsOu71jedaxrwngk6PVorOgiZfmZWLxo7tZeW0PeEjvptScZc8dDnlKpD39V+W344sPEeblzm8fusVqx3dwBf7RtcpYthbSJvujqqGmrSjDUWJu1t1MQ/WmqDR3PJOBuWFKRYcAxK3OWN+q+2S8/0teRIdRZM9KPmOJMRHFhT8pH5oFIucN/4+EnbUVKnfKn0pLslRNtr3NqXlOs3bHcqMm7dFR0VKlA5E/FiYlq0jxpNxCegRjAxDJ0ahhCvb4Bwuhk/rO9ZlHAyU7tFr5LWwVLbGMWVoiqqXK4M75W2RbN/NRFsVjyD8eNcTC/naNhCj4dMlIQdmyMhlcHqRLHLjISaEMYN5jG/RrSWkqSyyDN8vA/ShdLOYtNpQh3YQNvQY1USylIW6YROuf/kOM6eA6h44AZQLlRZ2oJ0kjZJnHDux0o4KASYSOg8+/qHUbLt5fgb5SdJM4eQoe4pxnKdJxJkUZbxCX4evDCNcHsMKOCqVaEv5WpZGEKedSjbNWKk35yrG+t44wiCZTAhoXRf4F2OZIUQJ2/C8pzL1yyz7E/CjrQipm0LKnTU1gNv/j4VIVDOQYDZ4CqkrWPFKQTJtAwbIaHMNzxDQWsA/l4nIsAulDPOx/9vXftszu8eaHfI5u7ilbBBG2KXc1HTzKFlb7B99SsynR5HV/M0dIFRiZGqJPUEVtnbd/ivlcJrdE137GQ6E5LXA1P5d03uBDLtwmrGY5uXBOTTODb/Clgbp8d6+9sO9UyXoIoMVem4ridVYSCJDSf82OKjHTAwHowOooZhqabboufDguC2bgqLCybq4jB5QkuTyApPKGYhNMuF9mK39OGfuuLtisZcENGHacPuArQESWJVah/AB6m0p3r8U5bV/iUmNEBN7dKxYrFuDhevwOtQTJGtxQvZ7zfwa+Hv/3BiJFsydNOPZlOVXIAc6BqONuwwGYwL8XRdHNhUjytSU34RW/ln+6kssgN35MG9GaqrLaeIevKW07lYmCBZXYEVWntehKFAMT6WjZaOXjUUEHG0A5djuPujFRja7MjhZbrRPW2rgat/yXhxyqDCPsN8qQWfity/CYGe6tp6bv8PK2TkSr7zsFgeNoXEcBVrIoESQzrzFEaBUCJ2jIIHb8CN2OYSS6ZmiEP1HL2fQY+KBK70j1EsNM9XharPwsjtxc5KodYhGZSYysXYAgjRPJxS+AwQikI2KqiZWQHsumCF1gK53+P4RKERNtvTCpcCTG0zRUkB4BW5utAlNxF2UcERPMnNShhuo20scsDJgxm8z6VLVlPHLRE59uiXi0mE2F1pn2pW7fHYsUEj2BaUT25nNC8WfDuBDs5mXFJiouIo3CJkUOwjWO4l/F7xazwSB6g3AZFgc04LzcxM3YjHxMMNIL4UaZQ5cF12ORwIIw5LNmclDWQVsxwamJwIKS45eY4sNK1B7MT35Vh46RDr3Wgpsy+5US3gNSHz41X7Alg7FnofXaTP1MmGr44IO3gyOFUh6y9+KTJdO59QBfnD3mY1YO3iWQS6gU7CVK6j28D/EdEc/ai1pz5cGVlWnXOa+d5T6j6yM0oSEDz1IWO4NruHyWTIMZszJXjJKCLww4F2KqB2MtOz3Ykxed20owpNHr/MdStphl2fqmcw0V+JKzHrXxIU+PtvXI0l/r1iyw0q4qhvmZl/xpQtktJ/uGal6PlHpbTcSJQHplbcADHBiXdy3CgvT/HgMrNnK34gR46rHwws9zrvZg== ]]><![CDATA[ YZhxlzg0RemTRUMgfR2BXxPdILyPW1RbESuNkWVvbuhUXoPuD/5hj9+3nfq4n3eGOr/wc9Ti0SpUukzY+fKP/ne/B/niBX8BZ1zSJMvlwynHpWWyQ9eOn8CKY+M8iVkq6vMoEm0NvMXm3P6CgQ6/hJBFUyasi2Z9F/h1AgYB8vVFu9eeoqCpO2Rbsm6WqLwxPzjBqbD1rNY5gSELO+J6cEK83jeQWhRSORlK6pMq8bvJXok2EGGFDpH+da471Syc1AdfIyOHp0QSm78zotab8dwbrQygOBgb7iK9DCuNoPILOixactCQLjqo+gS3an1tSDsB82+LfLTFXg8o0MI7jVTZkfNpIWdgGIZL4n3rIxfN2JPAt3fWiFpvW9DV3WDShIUVCOxGh3EeT0J2iE0HupkvO6r1wmAM4NMdZwHKgObDOfi4rbim6dlUbzqfgF7cC7B3Hdv5c4uyPMAP0ekHvAUUPbrcqL2EwJykHfvUqambDdIQAgXbIVaASJiEJB8f6Kc6kk4bRuJoL/NfvBpuJpidpYboI9XNj81kh3nhuMzJECZgM1DoPGqgV/fUoV9cUfztykG4f+lXDh1PztowWiPljExGFKiS5DO4ZAOjYVKo2odFKOLW9de8ggynkFzfyutZWvlEIqpJFdOx+BEmenwKKzEow1heiGDOfXSCEKVTN1D3r9Xes5x7QUQGIjfEtDOBPZtlSzSDLrRBOQk5AttdNkrWSQ2dGVBqTeZluRFCkmMgDImrDXMgUZwk6NtFtkeSzW3DEHug0Bqk6qW1Vv1DHBivvFoU7SXCG4lFuEHxYp3IIoP8yytA0Ijb+CQBBl3giWDB6HnTJYM+dKAJ4ghZVv9XfqMle+oNt4Pd5Pb2TRnlKGwU3ewvO8S2ljm6X0sutBu74NqSvj0peHmLD1RZPL9/dU1u8oOkkscPnfLtoPW0rmaScwJe+MINLMsRJZ8OEVSgLO0wmvgxyzP4RcNeqHbEUiI0fkyauplRtnQXe5Xr3L9ajPpupmsdaBIhX9RIIUinJgtBbCFFW0rUn+Y1TlmdKMxdS1jBYQulgSThSjlRQHOZN/I6KonIwWj9yHL1E92Okk8yH5NPR1bY2Yeu1eZpnquPC29z9vOB6QO9D4I6gkKAaOpYUO724o7k+JykbETHB+ulypJ9wEKoBi7kz7c6SQ0xKa7SjBP5PC4P1+JDGs/5Z+5bWLc22jLakugCzymPC3bxH2dZT/h87yVn4iYB7fggxYzqXGHoXzeNSrnXqfYI7/KSp+lMzkhg0jglw7RoKFih9t0Jm0+Bba/yjvuUs5h67Fm0AJalIJgRV6KeLA1BX1or+NbY0MWKU/6E/YxIcJlj4VIYlQM76gA4ZkZp5WMOlW9kD2RLdZM+3pVmk1yhVJP4fotn8rN3SLcdwss9Kis6w/lJfBcfcCR3LZz6G5a4+mtJsPxmaD1ZI94K9gzCaMS7BLRKaOogCUow+WynqVFnw5RAO6FFv9gKI54GLF55JbpZGbg2XRb+HRnLjoQ0UVF0zJaZlM0+azfuFrPGwlsXPdZx0b0NZYccN0b8efMRXZ6KZVQgUEesIeT/j1lKyPPMzXotJm+ENn6plUgYdBKVvCUosEaA4Vbvz+9Ks6FHIOusPuLzgD++CkMFKYvStZZf94ERFncYh2Ph2JwVh1BpY8zAWQij8Mk5GuWAfdKDFYJnbANBDKacSnIHCXj78rzRsa5kZvRGD5JdiAt0FolILL3EUJFu87fUYrG///rTjfSVfeHBgq5ysOprL8fsst5qK7KxEdnkwJRidtHT6MPnbQr8B4ajpN+xjWyawNdXu5GZoP2mS/aDVa8jY2Y0JZNguyYc85kQGlgWCMRNxA+xkEOD+Ay2cudQqvzXZslqQ3x4gG+02lxOJCD99uVmhhXGHsPi+zjKV9hVRdJU7atpxsXQGcXwQN9gqnpneBtKoxDeTRR2pW6E3wPKbxDn2qkcAe4FeyqgTmkq/+qc6k0CeJDA/Nf83uCvarHgNYEj2PSX8EX+TMVmiLJzjhRpXaa0LamEXyHGgmpSzhVJiE+WLWDkqfggsOBjx4qtxNG99biQKcQ+QlxeHyzFI3ZYa4q0dcm2cji4d6ZjjCIBVSCx+loilSF3LqxYDEAeAu53o85+q+60C4NXSD/XgNq31QQjkm5wQEkKCRh0N15F3heJsy3wfu71OIkoyM7Rys8FehhLTNi1u8nSnLM6ILf1j8I2VqROpe00C6/6K9EbkRxYDhWhVnDPDhlDOgZ8jHUZGUGJi28nA/pvCAxqR/men3PvRvL4+KLcSB/PFs5CBuKDs5s8gKL1eGCWx45R8rTmlRz3buQaCLtE8oeFRgWuU8X5lAuhcd/0m1MJa8G8WEwQGZWiAIY+YmRkrJrYrFo1xl+2JJ7F6N8MZOKNtXaNH58hsCGeQTiwMbrvvP/I0O+O3LhmDoMWb4UzVUxnGtbNnFLpHWFw3liiAr70oTHSsHNigUUpkkLqwIt5KsCCG4mFykSd4UoVg/S4BGA4kB6x3+QJCNRqy7zhfiB/WORR1Znl6DP1cOzHsULGsidCSETg480hDSOykv7GVGKEiiAdkXZ5BdA8x1BezQH/i6pDqptnrvWYUXjyJyNk6bXlNHSSQPJOrTvHrhmM5Rp4POFEasMBc9xBwKs50c12+dowps92et90GyZiYeoQPRIkKFsvOUFS/5UgVgPQD7SpjmRh/lrHwpMoK+3BpsgaknaCl1ucUTGgNmbwwxo5pdC9wTktot1IwGg96twN3aAFcexwhUfwIn9eWjQSyk5qngDX4Oaut+257zl1abxHI+2Bt/ynck2RA29llKgyJTHnsk5TExUcOQNiLn2dQEvFcu2c/oB6l+poBwtf8JxeA1GREiLMetm0G8FGGxe9s2UifQ4hZqtMS/zl6IT1DvP7Ed5iBvlJOiG8WEZ/QTGy0mHUQedeYQ41+uEpf8x8D50vPAFtSO2jVWo0x+mEsbWNuT7mGl2hB4L5DfLWce7qs7oWGJJdD9kMNi3Trjwo2MPvajuGjY/vbpTIiRyApFi1MANvGbrQpMDjyeeftpWHMLV0hFruCZBaxIOvKcEA0rgLCGhjpszW6ougliBzGCbhpe9BVYzA+969kEppETXh2oYC1kLBYJUuCCWsf1X0+Jrz3yTQMHkbQNp9xlSERdpXDHEznKUzIozpPZFIWXx3WhRQXWgswjAqTASh+fbQWXw57/8y95+PEdYllUgI8WPGkGGdzx5mrKKUV+S9ZAKwy9v4zDFYnZjKC9HcM3ZCSPv6RwciKB9F3f6Q8yHvV6nGbLP3hAD1WF4a2z9p6fC9aKrGOD+6YVhZ96veQu1DySOixQoSp/mJDiV3kTqvSO8NoEcbqwXOh5THnAJWjUYLpw+XaYGS1Paxyp/rt+UDf5dGSNPDtjbnfT6CcBhyTyeuoSkEGTQJAzuGAy5ehfMqe32IkSnJHlsXBFjOD53bAxXGPof00ircdn7voBX68U9ijDmtOB1YiCHMuCLjTnFMknsMOESoXQMIJ8DqslMEaeYeEQljoZbi30ER1DJ2Po0jRF36N+aHKtJobT8xSTI/aaJiYX9RKwjSDDD8plJWFHMF7SycmFY5T/QmIiIaOs0oBxVyKQ4wnu7NLQMUSo5/SkCNQaqldCrqFMj/LUyrGiVs6ZRY2rbf/gLJLgF6xCH+lGuRezSxBarPx3qO3WKla2LmGD5OFjKWX2IzG/B3TPnx1yhKEJ1UKK2xbhVWEx5d5e0qiTOkjHZksFxIkErerAYoI1h25CAaJOtOAuFkX5u6SDvtJol33KrrChBXuz6PMJ9Ha+9z0aUbjNHe4ckaEus2TRL/CGK+9MEyirgKHCTTjgulz6Zxyi29Q+s6njcoVoqxSgAxov+auzpcOMtd90QOdGYFXzdbHHSb/wSsq8/H3+DKB/D5dXY8DhSdacl+g0t+WQb1+yKNWf4G5QtYDLohif8/MUC8vp+pikDykcWwQs1XKzzuETBzBWV6BCRf4TnozwB8ekSxsNDlORYk/bLgkB5R+yz0ySMKqIWmpeCVZYMtZG9HYOcW6uCRWLhQn2UuHNnVhSPBuwDEzgtXHHzBUZZfELgEDA68ggGGOwImDJ2Nw3CT0cRwcSq3I4UvhuYNBjiGByHI8ABKBgjsU4Zv3TL4AsgMrnQESJth5hzZdgaudGT5GUgoDg2X60gE0mDUB9ap4FjpCIcxP2dXDTdxjnBxx8raTUOqOAIyNvRynQ1fFLbhEjiihRvapNQNMH/ecNX1G7zqRoAKDn6o4YBoWhzOsI+DKUU5eH4jEDGHqxv51DnwsTGSS66AktgIgehwyRrRMB1am6rDQo0Aeh3M0Qiss8PiMzK5HciakXvQ5t3BagAeXJaRQ+KhEFt+GXmIpebBzxh5jh7ahxFC1oMrZ3sADUZ2vgdK8fDn+KDVL7KiqBdJVbSLJEQf2uQitPbBocYPaLZF7mBfWqRyTB/KoNr4HyjAIpIDRPNWROG4igwgEE2piFYGosIpIokgykkR3wqiAbCCBgE2kDLG+18i60FTT0SJ9J8s4kTqIzSROhYi5qMNQxyNNTXEpSJSVRZVJEJxBg/wED0I44wITCPCImssKuz2XUvEChGBZj4YIoRDRRyiNSQ3PA2hxEAk3kU0/CEvMaI+H4LYjPDUQ3prhIXU6Tg7PXQXcSKjYwMeIq+PaK5DigOJKmBIjM4hECoS/uIQ6Edi84asURKEbMhYTIKUGkJ1Ej3QkMRQol2GfGBKlBxDaFXCH1knvBIsmgZ5ii+kvs47MPoTII6XwFEt5Asw0R0WIt2/RC1WiMthopCnEIFhopxRiD0cE7U9Ia6WicJMiMtnoqxNAAvUBJtISBeb6GqEjLmJZprDCSkiBMOcGAgh4+oEQyrvxOUfpNh5wsQepAc+4bAdpAnyE25ykK6AwuMGycig8J4GyXCFwl0ZpJseCjPr15UoeINBsMUuilcPmm8U7bAgJEAK7ykIa5OksLhBJjolCDmlsBZBgnApXEGQliMPxIJM4ZQDiQfZFKYcMOwUQzAQqHyvQNj+FHd1+cEhosK0j1R4i0Agayo8D0hiVGGaAZG1WEEFRKZW0YWARIgYILKvovAAMnOs6A1AEGiFGf9Hn2yFNf9hK64oqH8Y64r2+odAr+iIf4j2K0rZHxo9WBQNVwgQi+L4w92MRXk2J2g/rFRRfj/klQWj9mNKsyCyfhA9i9LoR260qDQ/5p8WzcgPAmvhHn4Ewxa++K97tUVc9yHOLRxsH21vYRv7SCRceFofvcaFBfWRWS4cRx9pnwvf5yPhdGHYfNStC7vlowrtkg/NdmHl+Gh+F/7ER0PkhVf46EUvLKm98EU0vtABH2D2xb73eNAvOO4eo/4FqdwDewNGHWav48BY1B7gLhi2ZY8QhOE3ITpSGFmuhz8yDH8NeSoehu/UIyBieD09RJoYZQ== ]]><![CDATA[ pYduxegZPRxejGLQQ+yMUdbzsOAYPZyHch6jQvPwCWSUvzy0IqNv5eGcZJQmD7GcjDJuyoCmV8aRyKMZLsO341EIM+xlPDqOFA9rnT48jJgZRguP+GqGQ4NHtTfD28AjZs6w7O/Ifmd46Ds6xGc4rXcUAxrG4h1xhYZDdkd1Ew0ndEcRR8PouCOukoajvx1Fl4bHtqMqjLK1QwXUMId2cJIanswOVKphRXagthomYgensYaV2MGxNTyBHTxdw6XXQaSv4eU6+IYNS1oH9thwW4DZsIB1HKON/qqDzdpwmjqCr23YEnV4fBtlOx3iHjfqyHR4C91oq3QI3C5FOkC8oWkBGAKhTWp0FMQbLaIjQEHo0FpvVP45JvpGiT0H4d+wmR84YO0cx2E5BwLCcbzNITvD0aU5+iKOhmmOoRVHR5U5cBGFKZgjS9zhguByxD8i/MqRq0+OtymHN105ahgx6H1jBCUHB27DQjEz9JmDK8iBhXOYeRzweQ4vHAcq6LA74wAuOmxeHERTOgz6NJ/NcEkmq9Fk9L2ortSBt+J4b3U0Dbhq6wANd7+OgzKBAuEoC5zWxKFVDok4ZKKjjhXd4UAt7uH1y9KAdnxB0pTRjnM0Z26BDodYvFracQwlx3AodkGqve5IdphOOPhmHhx1TC5J4q9HviKw4+TfOs4pOHDYOjxbwgkOcVmBw0SroxfAsejosTo005ZSIvyNotZRct/oyeqogtbyDacO90aN3PRGw6gjKm/Ak4E30AG5og6ntxtMbutGwFGHLboBwuow9ko6TP+axupgZW6AcUNuIHmGG8ix3gbJUccft6GnldsIiNM24laBbcSVrjZCAaeNbBVauaV5NshWHbcAW2kdp8lHr8Pp1+A13WBsiE9AqWx82KgyDTYa9RfpSpKV07+vRpO5rlE4tnGNnteu0dbQKo3WcIwd5QFrZA07xw75qwGHdni2GqCsVg20Z8fvqIaKLnzQ1HCCdhiN1OiZETX00Q7rn0Zrk52GDe1w2qbRdJNpGGBvaRhYpTRc7JA0vB1+NFzRDttGo+akVYsGM/fwFnLToovo6G5oRGhHUUJjgz5BI7ED0Mjrus/IZDu6cs8AbDtM3AR5Bh2342I7Q2raUYjVYrU81ErOGGADzhiw3mZc3I5qXDMEvR19pRn6t6PDmaGhOwqczBDfzzjoxQwvuKNbMKPMLi9j2xEuY8s+y1j2vDIGcq3SVRlhPYx/TBlyuMNxKKPz18nwwjfAHV5MBpXucKBkVMg7/D4ydPOOziJDvpFDxkTdUX1Bhs7NjzFsnseY00oxiKMxcnZHFThGlXVHCeCkqzusbCBOPnSMRvMO52UxiY4L08en+caQR9jidxwQpbuk4njV6zB5hwdmPYzHq4Y8nCkqDyl05uFaY1g8jyZV9ICrMYA6PVr9g9RSDTkNsOk5Xh7SDMBbHMZgNXUxQjViMbJqqBjJzidGQC1LjBzr0UQjBr2UaLvnREx538MIsB5WOQwavDWM5n0xjAZPFkbfCwqjhvcIo+z3wYiBPWwlXw8bDcaM9qhXMBhxD08EI0TvYcrA0IOPPlzjYHzEBxht1vjQ/wsYy4dif4F9Pj7bL15QH9z4xRr2QbUvUHIfHZXCj1P6ArX8UMkXwPqb6Ycd+AJyP+y3F8zyh+d6Aer+MEsvcC6AJ+fFJpS8cAuAFIkXBwVICXiBTUAsdxflDreLAweklV0ISyANrgutC6Q6dSFi8ln2c9CF8wZSC+Bc4OPSe7loJUE6kwvAUpDXcfEvUVygk4ULtLQgj4ELeQzS6Ft02SBVvMVeHaRCt2D4QZxvi8IhxHBtYQUJaZwtjDIhTYr+FIWQvBalVyFi1gJxFiKrWsC8kDXUYl4MYWBaHJoh7NECaA1pGFrErvWzsH5DCjuLCYbfcLN4x0Ny/NhwKLrOhzgui3YCEdtr7lNU80LETbKAUkT0QBaQR+S/sVh+EuEuFoswEYKJBSrrsEiBE6k8LApBkW6FxdhSpNJgAaGKeAksUl0R+36Fahbp4yuU3y3SKUymW4SQXpHeRWrwilWAkfq6ApwY8T9XxJIRy7hCaDPS6q2wSCMNbYW1NVID2UbAqxUYUWhFIGVmRe1vpANZEaVFrBBq/ir0U9lV6JEj/bhVTOy8PTaBHNlbVgGPKdJCrooGOVJOVYRFR8pKFXd2pAeqQIpHnJuKHmYuFWsbk4rHeqTtqJDGR1Gx8C5U/NQjXQIVzuuRinwKZTc8xQB7mayQgSkCpdQUFfZI+9gAwXrkEkwBE4+cuBTPa1gKlHCnFER25ORJ4YsdKSwp0kkZKTRygxROeKSkR7FIHUcRoKDDE9F8UQBiR95WFCqqJop2eKSGiCKtUtqh0IvLUMiUKRSy15GKYYSzgWBHqpvColiD8+vIekGBDDhQ1E4soOg6R+IOE//EKtP8xIrb+sSSOdIxPmG55ki9PaHrkZ7YE0eKyhOq5kgxeMJoHSlxJ+RdrxMDfIedmAiPNIU6IcJTNewIzOcEiIKWE9mSMU6kTtPgRIRWbyIIj1TiJjLqkQraxGM+0r4mCPFHzAsUUCB5aYgOko+Uie5CYgxNOASR9OhMGBVJPWbCmZF0UCaE4IFM3DyS3sWEUCTpgjhJoIYJ7pWkI5hIH7T3JVTxaZNJ8hJCFUltusSxJ+mYW4KftudoWY2SDCzBZylpkJipPiWaE/5SJVepRCAr8fTrSmxOCS6EJTJT5RazhJyU2loSBUo0/ZY0eh3Z6ZJKnAScvMRBkyjCvsQhTEInmLRYEuI3TFq3kAhx9V0xWYgkQPWY7Ha1qFlHIkOZ+DESzJiJQZEAqzMxe0jQoYm/QgIZ08R6sDtOvTNQgwSyauIlkCj9fgSGvCZePiJpNjHTI6K3iQE8IibexMxbCSs4oTpHkHbNi5NdccSeygm7ZCII6OfecwLMRrybTgjVCIRK0Yj6OilkRhTCnXTIiEXwpDyMgJQnRr+ImOmJXxeh1J6UbBGy8UlLFmGEfdJpRfjqJ8WoCNt/0mwg+gEFHG5BUE4bEcwg2pqI5fixRAzHJ81IhLYVShuAdDMU0HK3Q/nJIdgGNbPegxMsmhvzEFADxUmHAHlRPHCIXM8oHjaE6Px3hhDyKN3FEIUxkHUoh10IMCPliYWYKinEKcQDTwrnCcGXUqqUEMlA0yKE1nFrZ1kQoo1HSXkQ4GTKDw7il24GgQBTTl0QUjKloIIIQ7cEYUhTykIQfzKllAMBJ03xCgORKvK2NIWQgk8gmkqmZB4QAGDKKozg+qVQCxBzyBQGrgGW0UMcU14b2gCIaKz1YO6e+Q/ToilVrDQFhjt2bFMcC0AQ2mVaBgi03JR7X065blW1g5x8OlRweunjFCfRNkVWSZriUyrj25QnBiBKiXB71X/o2DnbFAOvccoLzox/EBmgP7jFKQ3fD9129cOSx/wwKJvSMvygsSlNug/SM6Uw9sEMNKWP+iDn8XyYN7Z8GGHtyo0PASLCh7iqew8xJbmHNJpSS3tIgkzpgz0cvpSy1QO/lmI2PcT7UrwSPQiT25diAHjtPPgVk3moxuIiBGI9HtBgVTwg+QwPyPDAA8lfyq/voKiNd+htKd3oDjHRgDuohdcOYjJy/kkrxSt26NB4Heqzsg5lsFIdirxPh+LY0qESvNGhgZXSEDrgRykvew4/JXIOSFyaAw4IzIGIlHIe+Fw5mA1ODm6jFEdFDgEpxV1UVhficagiZ7fnJoVXxcGxJCVgU27axJsU8lZcJKUwIQ5sK8WGuwZgU9QtpQ8fUi/TGzCFj/SqxV0iyRRgQxmXplzr1lXCm6cpNipuChgspzwtO8UesZ6i+/opFm5QQfYb0DxU+uQZlRMnUnkIHEQbBxymcsorFQgWaSoPgUM8eyp+sB5V/gIOCvuRUQWw4MB4qlQHHCKvKiUOWOUTQyRD4WszhVVsgMEqLzCzeFU5IPQzODQ9bMliF2afJljlxPta4ZDTKk7TsIoZoD8GB4+FBYcy0hergMPGVhAvOMSlBX8KOJjGjmIV/zitiqbPqnhkogh6WnAwbFU84uSqeLKAzrYmdQGHBGWMk9FUxS4GBzbFUCGGQp5iKhzGbFW6OhwYrYrJH6VwoHKsckv9MDh4zAMOjujNvUECcf51bBUc+Ib2uoq9ggH8KnayeVgZ5Au22Aat15Uy/8f/tMoxV4rggbQqptsATLWiZDNbscU2yPNWyqgNouJK67PBdM6VyrJBg13paWxwC680CRtsoF6p7TV4zFfK5BpE/kprWoPpCiw1sAbfwdJfNbhdWJoCGhALMKaBkGIpeRpyGUs10zC3Y2mmNBARWaQ6NyRoyEmTTpCGTCvLddHg9MvSfCE6hwYfM0FDB83i3WdA4yy2PANaz2KmM3AMWjzgDCijxbZmQFVaHM4MFJ4W62IGGKcWO14GMliLaZaBZq7FddbyuGaCLbmhDIiALc01eEyGWWRLzyNDF2iLB5FBxLb0+mMQpGyvH0d2DAL5jiFQtzTbGLLlLRUZw2T3LR00exFc0lQM6RouviUGvuLimxADt3FxzWEAi1y8YBjgVS4OCgMd1vF/tE1hMIy5lEAY5jmXcgK6iBcMmEq6vEyWJ3X5Chjqti6OHAHZ5dGY03Z5zwsF/yb1BZI4cGtdQviCQqGL/8OvEvICAbg08wIa7hC9nPYu8Fy9mIxcnNe0C91pL5XVBZr3YosulMowWObC4HxpIBfGug4Xwph9afdb4Ba/WNQttGewLbxZv/THFkToLyWtBdUQtXCo/9IjLQg7wLR+FrwiMF02CxrWwLS1LHgbwVRIFuzNgimeoJ9rMOlLLHjcYzGxIGomLNT4EaYNYIF+wrjfKxR879wVqDLVD0GvCKbIrfDOYdrAfBhXWgGzEPOSFUZHDONX4cUlhqT4KjoUkyJDibaTVcwlSESlgiMthudU+HsxlEkFzBjTKCqkecZ0gQoLNqaEpwAPx8jsVCGtjiHNFKh5TK9LIZkfU9c7tNbGH8joSwr/QqYipIBTZBwchbQcGf+iIGk2UZglmUKHggyXTKdQUN5kygUFGVCmNaBg9JPp0U8wkjJ1fIJDKtOhJ4hsZUrfCbLfOuFBlikTb8sAzQk4u0ytOCGp8iZ4/jKV4Di34F0hZnjVhCw1NEF4ZKaGsEUzc/4l1KMZqzAhkjXj5EsoajPuXELAN+NQS8ggZ8y6sISRwM1VAgw34zQlcDyesYsSMuwZiyfBrc/0MwkO/TOdAsgbaKggCcmANhcJir3KIaFFO1MpSEBa0Xz4Ed7RaOh5hJHs0RAJVzLSaMMRdk+aLjYCiqWxnxHSYRqzGMGrpmmVDpXgj8qAQYcEIwyjb3MaoopQu/g0dmrguF8i+BZqCkeEylHjA77UwAoR4IBqqr08HQqjgGqC9CVO1bA0hGpZjQZDQIWvEHrsapoBAjSxZosQVjVreD4IV2sNowYBwfNhLAhBdI0jgpAVrw== ]]><![CDATA[ sWQgRPoaAwKhP7CxDhAyYti4W0TSS74BdJHliR+bkP4AQ17Grx/8YDaU+MGWs2GSfQAb2pRCH2SbNmWPD/ZhdJEPPvnatN8DCNpmtj2Y4jZE68FMvQ2f9AAh3NTRPGiOm2Lkwdvlpjg8YIxWot/Blrqh0h3MYzeM1Q5Y3U0RdtAe3jSsg/HMm/rTAVi98b9kxL43tudASOibTJgqEn4DnWA0/I26coAN4Og0JnJgCyNi5AAYAMclka41Dk4+eJppxIHLQeLAZU04sAfgWAAclL73Bh7D3cDX/cYlN6gBOI5tg5Zd2sC5L9nA0QM28Pe2NdCUwPF7RB3dk0w3gUON1IDKxGmgkD9poOgpGvgVON1Ag+gEx4pn4ODgtDcDwwinMjPQiIXT8TKwNZwelYEwH06l5a1H4kTkKI45yACgxXE4BoXEOO4XA7vGaZgYWOg4tcNAyD5OIXvIgUAfOW8hTI5rYUAtlGP/BWVWjge3yoFF0XJuqpdj5jTmOAwG0GfOjcbmnJ2Ec2yUOucXo+c80fZz8IABggadJpwbMKAeOk5FjI4XCemI+ysdR79AGE2nOwMGtgGKIqPO3fyp4/OwOlIN1nE2GKhN6/SwXAewMGD3Os3yGGeBsFOyMGg2dgqDwciy04X57KgCBiDUzsmP7VyZuh0rwODpcKcLyDFQxlfuQBAQTXcg5AUQd6fAL+iVd9L9ioZ7JykvwNx3rnbBAcBDRRdsJngokAvgCU/zt6BxeOq2BYtKPL21gO/isUgLMtx4rB5OzgqwfjwOyYIiJI/7wqogyvNLLGDS8nh/Bcgxj2lXQDLaCmKwebxE5/GQFTx9nk76c9LQw3gjGlRTKI4+ehigh4EMFixNOFVeyFXbRiERUYhN4ffos2G3SSS6UsGrNjYTiT2LMWdQAeBcPm2w9Ks+bMglPKjAg3h1iXldNmOQD7IAUEH2iDkMI1ABQgd6oihQgd+Ieq6uXcHupiAuNpBLWrefPdilgKoONWRJKZkrKQB4QRZQLwWVdMr+zWD8sYwmBfB0KhV+meDdFCYFh1kfXigOo814kwL4M9w6rmQ606SgDB6z2RRoUrD8vb04qtY1xaTA5Woa9ClDKLShSUEabVfaNSkAJOTkDCZaWXzTpGDO0cpkW2ySnCUFRmW1FKdtiZIC3UDe40ay83/hlcmnJQWmTl9LwDRRSQFDlNcxdVvMKaijbPxTeQxB20nRTuwJkBkISaAkVWwMVW2ioHB+kwFMFMijsHtcgxPy5UQB/u55MbuoJgoofmcXbrvV4UTBy38TRltZ2qUKBYk5nG2i4GqHtzgKiEUtujyzDkPkKAjUAHzbfm4And4xTmIflasmCpQYRGVmBARGTPxJCdSS+UsPtSJWKEC/HAQLILc6+kI3zccnWCHyaC6MX7wT1D6pbKvbk3EmhAljb+8EaG6J1ncC3tVfeb9z8I8TjCrMMffeKmV0nMCCOjjgTkbQZ/JzbTwJO06wTBdpq9gJbjfOrjmyEyxCe7CxxvrFDLETEJMTzA0kLKZeZXmpHSPsBPMWv6445sk6wjgBsESIL5Cq9rzUJog3Ltm9FFoCBk2QmuKoSQGlTjsmWLyEQY2QfqzCb3mRC1+CoJUVRRD1BzJGLQF7zMI0zmBiBY4k2OOcR6sM7y/KTv1XySiB8/HP+guLbDxaGitvthh+cWJIXJOAO6hoWfFCeiIfNAlWfyaUrzyV/BwIa90LMy74k6aHBITvfxNQDJTDIQF0oDU5gGC+MvoI0JoQGxl1GboRTcuajqA8NtesjgKL4pWLnHamdASEnOU0GaGhUlVrBJBiB5IwMW0lw3P3NDqA1paBtwjqnsUjUCnb3VWKwBjf3Kd5iUkETkouiWD9Sz5FLCAClKZ8COV80MYD798goBbevri1DwAXAlIFn/FlRgOXEHj/8Irvd2of9jQbQcX/9UAnzASENCcIUE0FgNo1OLauFAiSFq2SdpQuEH8BBGIEu4DK00/zEhCIubxC49cRfkC7OYrdAX7SR/QBoyNRvFT7HhCqSSQlZPf8Jm89IAfPeYY1qvPA2gAB5Z3xJ7ylxb+4Y2rgyBI4GJp9dECuL+CzA7ks3GlfVp0yZB5f/tABkY5D4V7MAeXbNfwHjJ2PA/FZ0IYDGa4U0aEJr2Df+gYg673AGC6K6Aa4am1s+rM9jttRG3Ca2ZmuJh42sG8lt/8SY2ORPgRrYA6UsSjZn+62gUIEDwxOA+5P0hH1TOWdBiRFGx1opwLFoDwXDdTagTcP0JBnYLrCeZ+AwjMgs4Po2g/KF6mNQ8wMMKHymhV4nKsyEMgHuVez16dvkAHMsiDQG6k60gFJUsXhxUDMQjELdJXHYcDaRHj37gOIesHAEumW+Qj6W/kFxLE9xrt3rP+jnxfQylhYFBauW98ipi5Qy1szno7aPMEn4TVE+xMtVc6otiIk5M7YAnCMmYYsyllW1UJ6qxG1bfKzvdJYIFoVLvsSnLyfAGdmb3V8WoEoeo8kocs6VwUGjPfG/Vs0VCCyl4bHjomPmAJsnWa958O19SEFoKWzvZ3OLkBpRAH86fBamA26WyD/E1DznNOcz/4J8P12nPVaNKev7ARgTCtYjZOqbQJZcqEoPm0Cwcnp9jrVZd0VkwksKYMQ2m1tCSAYqpVyNvOijHwpAZLcqzIiJYEwHs9m6yZC7g4SEC8+ReXtveIIEOWFH8XlwRFwSR9iiJq8PF8EypVFJvxMXfRGMKoAqgQqKQ+B2WkMXyEAKyApeu6GXZIYBNYOn57jfTkJCPxjZEhsXV2TffID6L8Km0VWKygRPsBDnT2VY761gtoNGCNYk4vDqAI8QN3eFu1VvQq5Drg6zn0OMbvbOSBJI815B6rAQ0SFctDyhLg4iojLG0CFxxLWECsQ1dOfq2XOBkTntjh0okNSrxqQuh6CvGbyHRowq5OlmAEXqFtIDNf5yFqPARApqQXdXv4VeLJyz2nw8PlKpwr7AmTbU2qFJAYkQrqA2mfc8Z0sruoQpBZA0mhuM7w6UljA9Bu+PBHDONmrAFaA1mxuZQXQKG0izjZSPVSAplSAIqonByV0FJDWH6ibaj7jF5+1FAefumsC5NVDiLWbU7EEUPFXKhz1lgAHfL3xoW9seh8J4EQT2mUXyntsEFBMI2AQygQPlBoR4A0Qt82awIYQ0CsYzYmQ7YjhPPcJFv4Bkr440gpjdjDrARZwcV+ApMMOwO2ai0UF0izTOEDwsgrwJMQYiaENsDqOOeyQ7b29RQNQSxcA2WSbjAyA5kEo6VteYb4AllCifc4BfWmcUwuAet+xd6jNWKwAlEaeGHMcUaykAIhslQoQDTreBOi104CRZlJZ9Wy0PVsu8BQNR68IwJGM3YZC4x5OcaZQeg6NvIFRMr7xAFxQC6PT8Ptc3W8AYy2WBk54A9BvPvhC03kDAC3N+HGnnmY1lgFoVg0RjT8QPY0LwNh1nPxT5nnmTQEEciqFaJmyLtZVFRF1Jslk1HQKAegGhzk+CHCFIBJYhOuWhoDieUL8/cX0HgaNJwBCqpWMkaj0xkj0AHBHpwOPYq0AsMBm34tp0iAGALidjue1HYuo3wMAa9gjSzxWlu58r/+31H2RVFquxP9VzTTsKtwVPzbof64SNcNuPdXAOPZR9/5TMSxwhZW1Ni3rv0IR19MSytYxg9n8f9K5+Rl0OTclif/tswA8FJ6+ufvntRggXlVyqewfv7FhBVuNK/uvpE2yf6cH7iShn0Wq37/8jqn/LDc18q/uAPpPrBM5uRUZLYMRRfAOwb3Gf2SzaGszjb+c8H/vDF/3/v/ANWdT8QUUjQrlbflJu6ZLQPFval/7yyA0g0M9DBT7E+s1FW6Z1ENV1v/wlB9J6wEa6s/3AoWTqKgdO/pLsRpKbfpzlxR8/qw8Oi0RjlbNX1sGwg9Fqtvyn6Z/c5X4oEvy50GBpI3/6XGfUUEtd6Z++Pu3o/RcWRQ09OCvq97K/3uJlcV/v+AVJvYmxqsY2t7PB3+NiJ6+9/d4vyX+nHVnofbuB7wmecwkR/e/O6GnJ3QXBfeDzw0LeV0Eufa7TXOUSEQ1qVqj0JE7OPuh8Cl60mNOKjXF/o8txNpXNr4i0l1/k+I8wN7qY6sRyPr54p8yl0kipvonFfJ3InShBvUfthedJlAkruKYfr8hwRukH0hH3Ug/BrGzyO1ozg47b8/xfJj/CFf9+THRNp+9QNIA2s6feMR8g7tu81twodtRXlFD5j/Ma9KHk0Rpyw++p51NJm6A2/IDcUGuY6tY6pSfHTK2h4oybWKT/HPaf68JA1SEb3dA/oiTIH/339o7HD8VUK+camGyXcwXfxKWEZfCMfEnHWKww3/gLIyMIjMo/Hazq3F7iYJoDZkRhCmwBCCSjZ+Anxc0yDUEx4yW45HWWX7fHJa91yLDC9+nPwObROoI6SHT6O55H0GcNQJU4LHD0PLuIzvmfyOXHau6H4WXAVLmvgq4mwnAIJpVxnC/fgBEGevpgyhfgqOtCHxO4Ja4X+koBU3312CxDP5+AFpWELPty51GnrhfyG+6kWgfc/q62zerTdbKLtu/wWc0B44PU/tIZO2sa1+BX1n+1P5vr3/a+3c+g+AsfYDaV+ODzMt3UftWFMiMrdqg9rEHSRXGsqo4qP2dhAD740n3R+1z9CJFEbWfaBBOnmhTZ4Og9llqTwoOWGLHBtR+AscyUkzguJ+A+ezPW1SQm5KUX4qYn30LxX4+I3qLr88+KOUljZ5uFj77mSjw0/altWboVfZ1jnTRHdX7uSv7TQJASjTvjYYsxr5m+KL1voIDsWD/RV7lqsyS4rZgP2t8ltQSelI8C/ajShv5iWjwn2Bf1wXt+/xPfSzBPjDW5AcCuybYr5AttkHVHNLAvlrPv/LAvgzHgVON0XWM14dDWeF0JWe+9WG3xymFsQUp2qyvT7h4qVRwZtZn0goY3vT6KZvZzPqkVrQRZ6VZf4yQGwNuImvzD4LabCpaQnas8PSa6vdusjfVl6/mxAHUtOSZUh+MUEtV9QDU26U0qL87UmqTYG8yEKc/En4+FOQiq0t/+aWWKRMyuDWFlfSxRKHL02JUSZ9Oj7d03ujz9FGqK6pe4VuIfs4yc7KVMxNEP393IjrrDiJaHvSVIJevWQzftkj58zFikxHHuZ2FTM+/WZysJOj814pcGlXMyDr1++b/Sgycf7VLQyXc917zmySEIr5DuSCRMx+lp5fq2TqfyksUK+Y3CMO8jABBRbi8fNl1/J2BWGbh10THAlgXbbsQTVSVrzEgmQPoeNPHMS64ZXOZ2uOYOziFyV9PYFUziy+bmDbki2b4ztLVxz+mwGXR+na1dPyAnFmZRfBM3iiwusQh2IyEiPFnGbox7Qa7zZBk8eO6A3IReFaZWxT/+Nf53kqkSqbTgZH4+oWf6cGjk7A04/PDd1l8iJpjIAbmL7fhe1K/DX9LD15uXVH/2A== ]]><![CDATA[ wjfxlsGFw5AHCX8rCAUIOzagT0YbfKbJfIYkccgR/KDmqHJUEIYI/KaE4gj8gPJ1J3hpgv/7B03Adf32+5TfPzuYRLblr32fw+56fPEsVsn38u6DvamvyrG9f+FGdzcQkYzSewDtv0rjKUFW8Ml7Co3LiK3sS/sA71Nv+Zivyuq03WdTtofUnxR/65/GW/caIFJXVT886Z4WsLq5t7eQtN9VRkQK86W5xP2aaHehbQki4J4SML18axr0c7evdIhlWGzDuu0ZEnzIuQxsJfdl+2qvrszd2UaVa39eGAU92NEWPkjts1fJujGr1B5NH8v44Hqu5hwN6qC5KTEymLp8HGj/7Az6JS9p52b/hZTa2T6IQrvsRWHvF+GgW5pQ0Ev29cdsABx7tbYO+i1AP/bwxD6e8WPR1783CQKFvUXuln8Zep+qH7DnRxVCoCTXpChfDz7Z5cPr2ccuL0QMsKF0rt/TdmTWi4di662/PJrzpr+sqdYbqQgc0F/CqTPrBeH0AaX2lbt9WH+jmirnsD4r7+ljNHX16Dy+53exrh4Q7ZXZNmmVWP00SCSyEPyo+uhtRNGaAPD5p34WQ+Kf+vYxPOtHqpKTpf7yKNLBLtOOlG3U38ivlabcpB6wB8qmBqND+fRQnAl2I+WVMljn9ECAd7QBOdDEnammlz3Qy+sI02tKCE2bqAnTu08cLLilT8ie/dHrnaHMHZWTPh++iiT0XVZ6GiJ5v86dgLIJXSt9JgIQDvnAaf2t9NDXxGT0cv220jsuNzKb9HPFPIUVOc1J0Sa9vrvg4l9tXTwCKWO/Y2gIYVDmYKb/UNHWpOe9gX0rf0I8qbVetEkj4iTpj8si0tswNFiwAoCUfbC1wH5E+mh4UN0Q6c/fu2MAVyl0Wo1IH4j9vCkm0rdQX0DZMLGDGoRID+7bizeDnHi0/Ij0IK8XCYYWdUj/fGpHMW5o0zmkb2ez3mBluV2/2qKxOXOiLsQUnX5G0WIjgDQloBCO0W+sL4td65iIDkU/GRPIwuIPPPrQ64UCHvQ1s8tmoe8Fn3IK3KD/QQuboO4gF4F+vaBrJpCFup+XQi7gAS2kG/J2zqEPDFT19PzixI43LLuD548UjfeTY+Jk50XcY1lZieGgNMsjYHMVDWJeh+DjvIaXD+0lN+/ag9m+eaQsaCWaLvvlVZv3KA0dsObFnDnZWN+s2H/4JonmM1HS1d8ciTdNG03+zLw3+wjFbWCyxBkyP/0Y+h7wTIOAP8xLotKoHCD6C1MeehnAmcVHmq7Lbx2aYb0v1bb8qdK5lbdiRgrYkuUR4xbWbuXj5m6iJwiYpvO7OGcJc1TeemGl4aO0F1J+x75nJzm2FCgPi3fMakQA5QcK8QYBymHrJl8SaiSag1vuwVnK9w24PFW45E1sxsM4DtYmoiQ/OOEnhX9H4HQ58pyyRjGRu6h5Io8S0fJLIe/5SI7FLQJQK+K589Ds0H0U+R5/F0MUZRnQuHLpjr+AMLfpEn+Fesvx68s4B/zvrd1oc6nCSFQuyZgUdZnGQ6ih9fy4pMHDhTJ+JxgEKvLFjQzGSyGeWeKuydM+qQLbmb2+mOz1Hq94XQG4dO+Toin+/bF8Jx53brYXYzAJKfHI/znT1hQo6yJ+NGK8FuAKWA+q/LPSHbYHxoMxgYHYSQzXGueCdonDNwoluUQV2yM0PFHFUTzciVWXsy+8duOG77l33fla4VPGHeAferhgtwmfil42Me+ki/B0pDN9FOTWNR78RWdhQYDVYc3gX+GISl0QkiUVPLBYOLurSzaSmyyG4E2tntx/cly2gcXAD9Nqg1f6Kx4e8JOHsqTifU8N8GEXkq2/t6BOm/3337DWqbBCKxfp79cnBiwlHbzPs9/FwEPlM3UF+X2fK0hxk01z39VQNT9IBCEtT9+vEFRlPYFH+R7lifuVMvQQ8P3ebfjIGOUM5dXw9r5us8Qu2ohxvWP/r74ITCt5LL3jKMjrQFninnhnZC+c95aZ1llJeReCcbF3fBKhUhanWSInp9RCn4bxnjR8qLGv2aT2wfsMVDivGUKZxezdQ/DB+4dy9oshdxec2i50wwy0SLsvLAJC9DD4UV93bxkk61e/7i99H+WdZAq9+upuOBDewHROd+TguJdvDoto0R1/UOKQ5NRzr221kncQnkNzR3jrWDpquUvrlXtK9L4vtxdK5M4uh31JverCFK1UmnHvyZ6HRWXcn14ODHzAk7UP93PhPX2JmUJu7eC+QDRbGEmNv/0K7ZIj/ydN29uTgemGng433m7XntoInlb2wcntXZ+VmB8Dtz0s3V0XXE/bb5gyvfcFTNttw+qFyO7uPSr1MeM+WcOVS4ktBdsxQQhhcGWnnVEV167OkYBviHe1b/O2KGuwLf7dmp3CUvvZ2vFi5wgrcdqbHxrhA6moltLeUztKumQa9qJk0d7LIrapUD22SEE79vSGc/jDBSfPjlJKj/PXNRTOPrMHbfAgATn4yuZ6ZrcbQBblc0Uvu8a/NpfKDtPMUAWY1oMRkbjY2dbPhPtaB+sIF7L3Tn5mulsdv7cXjj2K0pmDAhePoAhNBSmvwLRRlsrETkSE7sPethkLD3sy2gdzWS9QmhX2p9+Hg+uHymDP0367jMoPSUES2IXzm4etkqLQr4dorUcYMaU64CS+3v7xtI8RjXxeRGs3j5Tci+Bw1/VdDzYCsf0J6lUu7Vs1Y6ligcrHq7mOfrDY/pUHrl7E9cQ2kBcut9qtp8kQFixTiumy9Rkt7Xn/mFsszR/yBVGyFlLQug21j8MLubgmXtZpeG2H4jAUtk1C7JnrkCUBRep5pJaCd1ExGRaMM8QTPeLHQ118deaV6GnJGl7x/xWfqysoYEC88vekFWp18vRRQdRq9cfAE7neEnItrC6hOwzCTVbd4DYIt0tcsEfV/7zFZ5kgAHDbqQXPldIZns4MSkB1Be0i2LuIUwdGiicrZW6cXuqJhrlFM5O6FYJ1BqtwT0edNqMkjzo5YWW83AGyqJdmTVkSEVAa6jCDOhwKhob5hrouF1JUIagPLDPCs4ptfbrXT7f9DMkZ5+5AMDmePjeezcCmnMsx7Oj0IcK11LRv+ozXgR9xN1dNYU33BQde7MPgcTN9Mogll4lhSoOROyPExtr0pJeQuWiyNXTpwDFbS/06xRFLD6lLkEZ7LKLSX+duBQgAUojfP37SFelX5toZ1xCHJX3mrRI11LbMiZxlcuHObBSaxMQU0kdkK2BC/Fthve/RlYJeTA/u7dGZECgRNsj9cnRIydrT6LcvD4xuOA8VcjpBu6I7JBQVEmhsSJToy0oGmGu7aVq/mIMudHdDfhgldN6CSDdcKicQ0Grx3Z78zoHbBF0BU6Dr5qKoQM/4156wZKtAXyZHziRMkQPovzb4keTEb3qKPz+lBC5kschqykfe57o/qHjQ5385h1jAY/Df95ywaXtowmMBxOwGdtbzFsnDgkBgz3NvEi6pEty5Gdx4LoqNODdOYockgq2iHStC3Sb9hMvOv1L6/K1oLZCBQJEAoQmGImjB6y8B+edc/6gNv1nO2d/NSurpvWRCOUXGObiP2KZNOFZhDc7nY6gBwgNMb77IE3fS0Wa3UQ+IM96DAfgWDKls7IARigkp7qDzHtdOwy7UcQQ2B7/0VDIt6//V3OybsHTtNHdRUY88yRt30TxttVjCU2EpTHjm4dtIPTz8SnvP6RQzcxJewQLLCyrR/0JlPmAGRyxgLn0hc2WnsvdqzeRgzC2vVnA9cIgK/3z98TntD+YmuSTe1tLFX34IA0Pu9fVythsCH7tcdEyCCPB+CeNybf7L4kVn2ViutrxWQyknzMIkkpaD9ftUXLY/dUiNLNeyLKEyGEZdIb/yna4h/Jy+V/IphBPNfrktB0+msOEvsTt5BcDtqFxC0Utoyk85BFPyqJFyjrVWmlSJhs4ICB+MocmcfvJMfptaxPQHZxWSD0wta/JXi0exKDUb/7NCJFjSlVyscDZcJA/JSf4flc9fmx9fIznYSymP/M5EmhOI6c3IvQ6dZLli4Ep9+ClywXm6a84lLQw+5G35Rk2N2LlCbhIY6SeX1IKbBYNcNHBFUh2mQomcFxGQJ07B+fFnRbCFjwPJ9x8qncd7DnBH5Vx5x8vFoDzg3izqePpASkgsDh2X41o+BFAROQBoDuH4ZYNPcA2XWG7cP7WTCqb5X4Xz69zSyZXaT+Mfi+3wq9Ke8dfckaPxmLYYUUCkroz3oQqMDF8ZFy53DkEzxpV0hWlVJNBB/HT7YmpaUcSWqHdenPlZ1L5ELljwXDNtyiM38gUqOcGhcCMiSTJY9Da9xRs71PmRLW/x6nT7eiP84yzumUhhRSg4i89rnyREYEgZzuLA1iJ4jhwxuLg7sht5mAgXT1mHqN6zXsDFaYCC6gRk0p2QORIuzs0nDFgvzu/phtGLD/VBXKyrhMfFUaC+xdUVLrlrXPyeSucVjmtxcQZrWAhFnJTIuPiDBELzG/wK18XFowIpsFJ1XFywwwa3kbLJj4sXu+Qsb5fy66rFxQXmC7wNNOLip8s7v6c4X42fuPg7vtxHhorkbu2Liy9JjpB92nHxSgcQtvo4wtIWLZ61beQSEN++4gys9Y2/4oCVdwa5RPZX/KQKZsbXmu9XHPGnSvtY7VblreLQ2cHIC3+npjgOGCteCquhERuKKw7B5KcTX23PMw6Vitgxcfdi4aRPAHnriIcyp2R3w6SCEuOmPuLWTfB+rlcjOgDfAIs4/Yhb+QcZ4oWgUYoTGepDWMSlRBAvoD9nzQUzifP8Lekl5D485AS9yImsPFwemZCVdYHySYezrIhfxY234HDJd5TofpuVI0ppJQ9Ol4GNfNj0/X3aOsONkldLYjgbVqTSbjNP3ezC89BiejJASf1l4cgBESYnVJZ/KvwPwYKUpcJ/QbiChUKAwg1iU+LTTpTpSvjUzwTMULThJ8UIDxYD2goikzMIDz2b8gZTqAfvCtb35fukOQ7eihnHm0eKoMEJkbbIDMaDv+BKpgh1UofhKGgFjzsIGqUplaGoZyd4cQP6gvQ02lIEvwKOkDsne/rwwHVAOzl4BskZ+NPVJXAyy1OBY70liS8TQxyEQOBE02/bO80N4gVewDe+Nbc7pIYGeL5b/gZSZ48ArvU4esnZQ/bfJv95ipyTofw7/5Pumk4YN01/E6+nYruk4O+vQD13J/vl+Pot4mllvs6CsO04v3HQFhsAD3lf/J4BQyHF70azsoGRBjpt875tKMrrmHGgIqe/4tk3/oUDvVN9d0OTxc5tqfrmtDG2VUNofue8eL2iWjk5iKVM1OSh92K8AAdFJ4T5xhNmvh/mCPOtZJyMHo75xDbjBF6mfJT9+GYJKfOmhvLCy7t1Y49j1Vv4jhV3iZnvzUCL2zEXQqRb7v2jhj91o3xzoq/S3kQa2VZJe1P28215jZjwVWVhaW8/TZNk094ZSNRv/Q== ]]><![CDATA[ tLdMYCoxWYjSkfaez0nyTmmlvTeNbK8phI8f097U6vKYato7zPzEG7AXNN38aW8Oq9Q9UFiQ9jYe89yDOmnvwaql8/IH5d5NyuzOS+yD3Ntfkcg+wnYLKlTujT6veB6gd+LeoxTAxTwJIfdm1A2TtLtD3qIu5N4TxNTuT73FQu59fB4TaK1eX+5dPOrieIIVAO6tbY3wyLRI9tOgW1Ia+wBF3vuuSFAjN7WIe4dRbhY4TQL13kRfOo0NYOfVeydOVgVB733/C8ezg5bCmkvo1HtXZTa28g7FMZreO/2to6n37icgmDAGbGFfvlnvzSJvCOPf53pvGLy6A/QvHXes3hsMoqTGwbclr3G4kGdaeg++h2lsKMjYoYNvhp7tzDCjqS3C4FsMHRl7zXid5T/4Fg+lYwQxhYhtg2/RoFXTi3Dtv+m9C4a00gmNqBLEAei9o0+0e2Hxt03y3m35ZLUO3DsYFq9x+P6BCO49sQstIO8NcU6mRN5bjLmMsnVR6BgP997pRsyjCKgX7j2d2M97Y1xkEQZN0b6A6o4RZJmuSRT5y3tbgg6mheSulkveGwjJNk39oirPS977eoFRpee9K9rZ9q+qKuHe1mVPWFtPtApw78QBTcK98SE46wThOLi3ULyiJeaBllNwb28iLRk4juq9/ychcq0fl51C7/0j5cH3/2Wden8ng+9+Iyami+9UYDxEQ4ZDBd+ph+vYhuCbCPxQQncEXb23p2G0392t3fTepDSBabPKNIOIe9cvTxIybkBRQMpAiKcMhAvMWbLzev95LUTxSFk+8QPMFjsu9XcK9y5U6G5XeQeSNjpvuwnJMW8b8V1Iyr6dQ3mH0ww2A80WosBAzR/vmMCEMpeAI4OyeBOVQGNk2JdqeG8EqonGAiAm4lFlCd7KnHffbmBs322k97Nu4ahVqeXdQrQBKQfzVIC4dHer4bPPrmjDpsDdI2bUvF3OgExJd+1WtKFDc85uLGZPgaatENNi9/gyTVlUg4bPVCLuRlnZBGNIZ92gAa1zuq+wVN2J5hGzhwB+g1B3eY/jxb61fLh0e/9uzmsNDBbGmHwc3e+Y2Du6IYzjBYVkwHC90M12x0AzUiQ518Nk8DbOnWbbB76c+7ZS9LQmifg0d81W5JO3jIK5uQK3m+6d7Htqrtwi+Q/WZCgxmP6nk5sYPixzrRT5taYeykTuMS9Q0Gbgki153BmnFxNDiba74Gbcc1SZOk/Ip+LGWqnjSM1VK6EQ92CcIOrpJgGGG4uLsUd+cGtcswT8LBCGgdsgO0KIJ3hl6m8/KE0ZS/v2TziG8Le3q0AHFkG9mjESL3lbJhX/6EryIkMjfsUIcupKbbfzS7cjxhaDIls6kOwmt20nlEwlk9yBe+H2cPHethCvRMvc9kE4AW6TsTJdwLZPiof/eNo+tC/cauEIjWnSebaPupQDjNe2uZZtAGwxX7YJ5eui11w1GDm2T3RBncln4br4CtvHvKdS2OYYC9lCwkjiqwTPHR5axx0y195OYtboleINPgy1thQ0wlRZtKqWI5CBOVIbNLqM1daNNWQbb0/tmTsyraPE7pGSUfu9D3uERkrBrqcNZwy87FNuOyD3m9rhHotrFBSrZ++hYujZaVfahjN4pzMQ7Z5Psm7tqBP6qiU9D1UTl9H+J2ICg0P+uVAh2v2a3hy0ISPkZj9/dm42st/0JrvEOZNEp9E8UaZhZysyPbKGz4Vx9qy7Ftf86NGlyaAzI47Jfb5CJuMUzSaGTFBXv79YUkFmu+kITgJ1MtgOMXgiQuEmqJmZOW3ZMWlrh2wLzFb2LQFxxzf/cy5SdliEbkuPy21tsvd5swcEF7wkG+nKN2qkOB+J7PmtoImF0/XcNwHZACpzDGSr3b4RxbmyIYuCwhaDMlp1oXFjK5pNqF1+D6uMzVBy5GKDUV4wxT6fJUHUxDnscYdjDYjF3ZAfvZ3WGohNATLloe3JRpYcvGELNm3K6HLy3MIOxE6WsBLTQ8KmeA8T/7W22mBjOVWTiE1aIrxMsG1P2+IisAU5BTZmnONWy+QXwApg4+7RGiv+GlCKT5eoDvbe1xDWiuD1DLL5mneyZPUitFIqxuCyex0/o/X2Q5+pqdc8W+zLgIO/vOblzUYt74lFcR7QFV7n6SF7NdGLTZ7ctZYdi9Tvy26wa75x9bqzQBGJbtN17rd+eZbsMtq5tkf4mKPBcsr1XhCJbcbn5La4HhyFQ+aqGCNgBde9hIJhTAupadaat+biypo+fQjolXBCu5Mw0dZFd/FeIR8/nV/rmvYjWJsLgL3VmkGADU3Kr9FtWocLN54wviTA9erP/ugYwsXJO+uFvLMdWTtrgOyHHrn6ZdDMehsUf7CHk6KyNjsrnR/NFt7qMWXI+lAASS4Y67m+B+dCBSUjvri4jKfLJ+ZyuXfz+UTwuvKrs+4eUs1tHtHm1bdTnbeXTBf91dUp4Wr2TsIRaN0QYquHQtoShrGGZ7UVC8WmWC2egMHac3dXrWeuihPJr4exnFl14+BNVpJZmoG9qpqd7Skfo+mEqnnOUkrHUKs4uU8ns0GGVshxVE8gMdhCtezFXT71PhsJoTtaxNqc2i13IOMcMFJTEwOPsfzMSISpz5aM0zDuz8XHUo9naY5AMd28xYr2lymjEFhGavwSTVCecFxWVo961ylseMTNqJ2/FUi61dfX69SxgcZ+MKFK3QGauIq7hKgbQ823faA1xknT5qC2CymuUl2gJqNA9KzN8KeHqzaKD/3Ae5pPXwXikvm0ZmZrl3AwzhDv0y2HFlO12a54d568swYcjq7Tn96d+aBq7ZzGuqj7zXFc2ciTMLO3yse8XGSlVwp9z4KGR2bT/5o7xlnTCLqfIn1P1oq90bTSK/Zm3XNrzfRlFLO7+wCXbQZk+kJPefihLN7HwzTbFyaxLQzvl44O0Uwjs/N1afql/Vnedy29IwF9Ko9YktPCOEKYxdKmggtya9wUZqUv2nbcKNUCKFQ6WX3KSDYtR+k/vkFO3Cz9fdKbfoKPEFb2eU16LLm4bdI8JzUnUmYHg00BQ0s6xjeE51nMusaSJB1yKhQhiqn0b6QbC6AqVjk1uVuJdFz0qBfx6/8jpPlG/8H8o2nzfKqYg2axu4ZqPfovIUhRpMqPHX1rC60WVEQc/dx/itjTn4qNpkuEQdYH4xN1uDyj+SFjnAE6so3RATODMpHAu170gJTkNAQ2frRogvOLUpOLvIom9SOb/PLEZZo99hswomiOIigvOhMdg2/OFxkh0VJFDpHoF40cugYhIvr7aAevhDvJ7ivsD/3ikMQeEM0QYxzXT1W+/g4NK545GSfWWt8kph4p/k1xO4hlaKsSJ4t3LUXTedpuIYjtZXjLnJNC064rkq6rJqEpEkJnrep8XCB04A+Kvb3wkmT93xv0YBtVpB2GLujbbEkVCfqhhRYnY+O4gf7KE3mI4+qTBJruFCRBTc9VQAefA4h43DhMAPpVrZGzGT7jnwvQwJCrhxy9n3/fz6iSB6whAfOzzJLx8u8+0z3HXamBklKfFz0Y5hDfjJjPt4jbPQwrqUf4fBzQjIyHe27PIsGJSDif8e58U6/nqGZAFa4QIyqS6fk0EB5zdJ7JW+JZS4wcwEp5zm8POTqLZ+6VYHsj0v9PeCaCY0RCLvAvjfBs3rOEAa2OCc+ws/7oJkAdpgQJXwnPxfU1rW1ntRKeH6sOCoIafb0z9s4qEKeo2/TOtzmCsd45NPA+TXl11MTXO2fobQFpmm24NQS9c5B67+XOuLP9nhyjO4o7DyJJA/zSEY47kzDLcmBLio47G4pHKsESacad2zcoSchpT8Sdfy3RAzAm7TGh5OLOt1oy8HAoDejQzi17zSacQhbtLAWl9w8vlS3amW0umB30FhIFlT+0MwePZCbuDAZFN4j3zqQQluT3zlf044+0m5zL3zvbCTPw3Zz2kR/Kg8beOYww4JnwLHxyQtsKyzg0aYTndhsOpjt7XSQ8d4Qaj2JyCM8FHO+cgkyu3pmrnRYziMn9hQF3ZrnJS1fWYEi4M0YATE6sxkb9/nZWe8M0v53dlyNjtOYdmJPS4O082swqzQcshjHCpRoBTAtTdXOHyrPPUNF2vTJgoRMi6eyPx0C9WyoGPA1kY2LPE7GxGfmkGt8Kr1zyEuJe4sDUWVgBGirfjhakc1jdL9bXuH/OJWFqd8gopjbn/WYQossdZcvZKV8SQK5ijf1ZrkdyFvkJK3ebRBvLDBtnztFESIGRYbTEeU1KsTe4mCIJZ/1dpkxyRYXuUQDOkSEvpoSFG4Ny7s1KwQR5b7beyfDcyXbYv4x2cwLKWR9CbiZEasEBC7NF4mHmuAiUmqzeiHmpKW3et4PPZZM273Fm5EZMoiXZTHx1kri2/JCR78pZX8ZmxhfsRswvLWqPgc9m45Ug1bFNp+GmTZ8ciIxxTKVuBlIjxcW86bQ6L/nN6RTMruDUrmPNaDh3t96eEGlbmL4x5nEuqfD6SCdnTrPIwZx/dtUg6ZzBV2c/dC7aizVowcx0OgoHwas69fjpEFVpr1NjmGFQnp2S6W0Ed4b4wipPk8M7/SEVqqPaM/DUa0DPwBRPwN3sBSjPY10gYehgVek8v3zRmZ6dcNjrWcaFrIF7r+CeWeJxueCzNFv5NPlM+WkIti99guj2WT+6T8hP624Hy9Ips59xrmd5/VlgVbZSChZUmT97TmfhdPZ6tCJTJl+wF30yqBk7CEnsEsARQYuxCb8Vje8Wt4kbjQaN50Ik5EGN1sU0Qn2xu8fw/7xYqKFUV0MYamcvQXkNRfz0zlrunEMXqsC0hxornMxBiD7oslRBI7o3jGSJRsR81z9Roee02qGi/yGAlEXVtjJZlKVMmR1NQK4uyt7PjAIOo8SMXjVR9PGsRtVQamRuNMXoNyng5t1SRFS/HKVFEY/c0cOfLHyPTunW2X90h2WIQ0hzhsE7Ir3ZBwQa6VifES5J+jOugSX1jFldWk06XYfxJ725dt/JfGust39S2BD3IlJqw4t/UakUkDEhO5mHDAGnC6XU35ZisqXl2JlP1KUvtIu0tDfyfqmL/RMGh6k3N8hCpiwOd1aqT2b69QKLpp2cuJpWs8RapD0p+t40EtzSVsYpthP6nMYcBzsNKkXCus6voZqN2pNwjTYivSkgicrd+ykWger3PXBuUNfQn77tRr/wfcDof6jIPhxHisqTYIehjIol/EvtqNKn1hR+lFIL+AMglaFipWYAGQBT1PdKXmxYPFxHWlk0lY+bkji1Ous8XE/1FSkXGlSd4AKfGlWbwXxtqb5Sqvn6VGfncx+qOgPLFDtWrYyuGnmjWAyr/n6GBLNq1kOOqFa/b73JW8X5EmpOb12qw/YYYG3n3l53NWK/Im9X/TKaIQel+nW6EH0KejUISfpj+VX0gp8EKx32Mjgb1igBi1Xz+1h9T1Yyb3MRs36uIOPwjU5y7ex8D01JWA== ]]><![CDATA[ hF/AIJ5pPXsH7apWNFiN3Wt141MZOVtBH7ZpcKvv6U70VokMiZ7BNcXBwjGux77g+GpyFSjnqqIXCYoKHOg+7roGCNyuUimKogSvj2GkH5VXv7eNdrWFuEF6Dcsh/clLB6jlSL7qhM39N0lXC+2rKFSSmf2qqkS+/L/ufzViCKzTT1BnjGD1gKK4K3waR1iDhd0+n6ryAbpblzWsowjFfNhIyqEcsVFBXdwDig04iz3Tq4TF2O4JTLjXWCx6Hp9nv/YPoVrh3Bf3kF3teLIh2WrD1pnJwt8oHkWURQdGcpVtw0Re0EbTspaVIBrTy/6+dqkzZpd3Knxm24AVkLDZyAyScJa1DGg66583vMmzKTKh0gZtXpiDhucUCdppRJbd0Aqb/UVFi4rEq4Y3WgZm9w8NiKRVj5KhbGm9wqbF1TXN+2nz5n8EpPZpShsb1ZpykLRW29qim6JiLXbxscpam2W8lOnaJ4wEBb5WhPreC1tEZR/BsbWcFkDisjUTtLVoHeNrGP5nZmzomGz74G678uIyiVt2f2lQYG7x6lb3k2EGMKMtKs8pz1u49L09kh1O8wyMlUswwL1LwWURhJwYhUuxr8uO5atdAhP3Yxs0w7h92R6jswWeXx33V/5o6bgQAyR9yDXu7swwudZxNs6Hksrl5g6PXW5BZwucaeZi3SzFM4ocPBfJ00s30KWdn3conSD+YpDkZNL1paJau3O64iziWDIYztU90N+6GwO7vmTe8ya7uIp2hSqV6avtGuLuX1HQXfm6K0X0rktO5DQ2Hg9ts2nwKo+Il6/xOv7FUnvkxcaV6sTUHzM1V/NK5SCOz2vLQ4GgR/g8bhmoNwDiKybU+/+KM16+bA4IAddZb0pQQkoUe58rthf4da8MxQ5BVrfc1nXJzZbv4StDbJ3nXZSFIc8Kznz7VmmGVXp8LFW7hqpvAsNUbr+vjynpk3pfheI3O5iDRAV8ASpQp97eew+++pUTyHe9X4AawJjz9xTCXxD+baKsfsl/O0+negFYW9vYM8aqUeH0e4P7CXiRHYe0ARcavIoEvix7tAUO8Jfg14HMzdz5G14EdsblqiNMgBFcWoKnlpghSR/YyqnX7Y9forf1gbUaxOWWUpMnjpZezUfUqtTCB8Z1acRGPyL4wNaklp/fU7y0/4G706dNHaN4/APr4IOzw5CJZYFg/GT4STSj/RMIPl69wOp97B4gwv/rMlag0K3aAsFFbFkMThSE/SnewCTklbQoGGpE7+DdwEEJzMvy7g2sqPBo5PYFZVGKNi6KZOzqLZsLrIPgtjgMIwxEXGCus9elKg5RoS5wgMdk7o8+ROB0gbWbXdTmNBT/LjCJTN0oZy0vSuD4bppwph5FSeCa4ek9tAacDbj1eFxpxYQYbsD8H7YkSphzA/7+32YRpcQ04IXlXjpoigYspoZQZnjSR+D23YsoH4HBz5Gpk4O/A2vGMaHQxIqCMqgB41YusPwj4HMYdHJw5nrmLtsLqOhWM3NzBHxvMo0i4I/alwRnn+BUmUsL/IMzLYJqEqfQow75zHMUmBCw4XrggvecI+B8QTqQ3nK4J6pHwD6wSWvACJFo4uyWgDgH4ROA4MAUEfA79KKodOaYEAEvVUx69UIvbVQ5u+geGALdioCrUeBpZMAmQ+gYCO9kwLug5dFHE3ArA+YtPYRSqymCWQasvyF7c1ms/KQMWLkKVYITLcZYBhysIIf+F5oZcJzrIwLPTctmFspN91xVCILDbZeCPN2lUc/zAs4bBi99zQZUrsUtM0UDA401Dt3WgR9JgdpQ+ZJTEME0MAmNNjSwaK1BkJsZAHW7Brzu95h1bgR/4yBZE4PMVgThaWBis+dZJkQDK2MUo1FrrwaOJv6ypZffpM81MAXa0ogOf8vytQpy6IFZwTopWzBwPTCappIuTtS700chwQ8F+VMf4gQfuMo1+1azN/WB0//kQUpWpnrBZNAP7JfcBpEUu2/aPnC1CHxoyQPhah+4J/W2F4Chq8HPY9WpUCSJULGIx/7Ah6pvaH0s1583C07VD8Ch7Yb7K/7/D3xck0oxP/AjYobINVjTqRU4INv+k0FmEzZzoDlguaOIfeCcdjiEj+DIvp9vO4JVVVehJvQMr+9bLnhgnIGRcQS3koQaAiXBII/ZKBNsSh7aP/2HIzpFSvDFnZz+GNDRSRC8Irb477xPCGz5WiVFCUZ3lSTZUaIEw9ozMgRKE36elGASTnFECjITrOEW0ZlAU8LeJliEJqYNrGD41+dHUqtO8FiJteWnhDjB7M9maPsEs2IWUYQt9QRTTgLieILRs27bJCtJ4Qlmrz8GsD3BfpKB1wS3ClnveYIxSSkxunqC3RIzAA1PcA+mu/0GxGU9/ARjVc3zvv9WdYKfPgNuOcG+B4QtUtPlTLi/I48ruNcwlsDgkWMRwPNeGC4PWaSE51iw0K/Rj82EBcu5cjlALVg6QrPUTyJeHvv1P52P/6Hbx7TgIciemVow8vY7AwLVabdnwX7s4nFrywQWPD3oIrohErI8Fhw+DDDIlRoGe+Yb12INTQokDD6LTbcbe6y+EgbjE0Ll4eM9TksKAGM0jilqMJWKmPnB+o9qMBMtQso4BEubahd4qAabyRvXWEBRSlOpZq8GZRsWF5ZqMP6JQeEKnIyAY/LBR1qW2xlrhnByAifFHuHn9GQ5MOH41PgnFF6buxNRhV2G2gCSYxZmK5e+LfHCxoyDUncmOQ3Kb2RYHCmw7VljmBz9LIyTMXwCJxIjJyiapLgwtlGbW1FjGA0kDjMV0hbGGKYA1XZtePy/yM7G8MQhMXrqMIZzX9LKaFXHlyHEM2ciVlnZFADcGKZ8W92t6zvD8Z0Xe5CaKmc4qCSSVTXIbyCSeKau35wn55WUusf9HmDCGQZkHiafhaN8FFx6WkdAyuTewxleAm2QcTNsJFQBazhQlZ7BfcNC0eHrEREcDz9Ks0Afhkwp5IdbCuzDFdQ/uwSxsx9+NcR1XNa9LWLXyMseMY7+U+7p+0lsszPpAya2U76YlBMb5uFPjNkeiqCYyGJxSjFjvTaO/Evhg1gCZlapizcJO5QMQBGhLkpV9PkWN9HG9sGLUYZ6BcYOMJ1JZBzF+FYQGkzGHWjTvZwxPoaxCALYtDRGdOfp4CBRtL/vJ6VRqK0B0z71IgkcX8rbBg2IVALIMXaWrCLHpEnFLjrW+Sdpx++FtkjveAzsceDTfpZRHy9flSb/uBJMix2FIK4PL6y6eIRKqJYhy+xd1BbXbIhcVpFTpAzKnpHtEfzMjsxuAxTmk+mIZHOxodsko+hnKehqe33JzDBNzuTpq+A8OPlkDXPz5K0kElWwFfIp5WaUmyhi2jmVchQMpKdM3NXa3vqsKsdUBh2tRP4qa7N8kSsXxVpKYsIyh6wtl+UNijdALX8WsqYet9zoe8EtW67IeyFCucwKXpfvAqO7jEUlMt172YgBzAZOmBFA3vxC2Vm1lHJjxh3J/CqONS2zkLYdmHzUG/CtZQ5pS5TJ6ehb5oXQpaY3ajbz9TUj15PdQCubWVIRK/pjDwObWZKX8d8BEGeaOoumVDrX4byqbOa1bg/GG2QG03+UMQMi8XhInFRP5P8ze46ReohHM+ZjOQU9AbNmz2daUE0TG1R4sqCk9RzJz26srHnyXRhiVTaOhlgzP53PyCNd7xdrVmBCKFidw5od9GXJ0aMOy5qt/wr/Pilz9EFa86SQljh+UHwqUzjYojVf1azZoazIxJvWrBUMv7Oh1gzWdgJ+1lwgkAI1fGt2VxBEYjp1R3PtsyfuaJamnI0s7uNta1p+RFR9Cb46Gcxo1v/Ln+bRMT8ub4MLiqd5+j/n/zQPxdYR1g8ISKP5cxU5qJVEnpJoj3E9DD/ID5tdYYnRHPYyIeVpdq9sFpQNSsgccDinjp/AN5Zea1YY3Qm3mWOcSohCyFu0lBTNzj1x+0ajaC6Iz4CGkiIazTkfVyJIQvrmyWBqSp0smn3U+gTkmfeD90otz4yo3IchjWOeuUk5PW2nKNCZ/TmD5IMBrK0vdeaFky/bxe49B3ud+ZUpFDxE2yO/bg5bDVMPiXZmMUFEHlnRhDI3mZnGKriL9VGZGZCdueQ18ohmPxrov5/mX4MsBDXUPM0vyFEeBhBX2vJphmDrbMiGF5Krl4KGsMxoXmfM0unFQp/mkFMKeZrDjbVNz+vK0ywe3m41VTwy7p/mnCl54IE3x6cZbcpZx5rzWJdw2Ow4eeKhNi9p8M/NroPmm93xBr4VzirSubrjvEhsCnMGglftoXNiHBSD6hw+NFO+JqcgkMjDET07YzvVMXjnpEUixbOLLiG/PiPEADl8PYsjDtJUnQXJeFMpPxchkY9FviagQzaM1g00OcO9C3rNGGYShNZSSg1Q6DcFugkM7Q1VKjp0M+NNiGh2deU00QHjBPlXtHYNhQAY3aD3XRpd8foOZ+RoG9qjzX0Sqm8UTywiRjok8Si2pG0MYiLIoP/M7JWmsAaT7zvlFnbObgGkWJpKuvSigjTaMG105OltuYFSaj9DIzPdQa19zDSJptFKTWMKjpnoplMjHg1z+gsE+MDTpokQ/zJzPi0Mmdo3UBumToa6I82rU9QyK6TuqKtjE5YRjo5aDooZfpN6inAqvtS1IleuKs6Tt/dBtcplJ2dItbtRNRrXlpdW7RJShmVjdZyt/tLy19VdpwL0qzuE8/qCzk4yEZBW13f1yk6tZ9bk7Xuh9fA8mlrvUFJXbN2E6dDq1hWc/Xe19ksWnIi5tjIn71XXdC/beu9awN+zMmPbg6/BOPYx9esSbWqGAbu6YKdGMdhAE7ZYEhL5THYKYb3EHomDkB5+ndcQeG/sc3Em5Cp45yPtYoOPZ8Zu6mJUgAays/SuEBPeOdGB7A4eYqfvb+wpeWKzVbYgjWTD7riB7Exbb6iBbmZSYPhv7Mdpri65iz3zrW1abG9d44pt7KfZ7N3FwVVy1GT3Glv/EuDH/h5FHRPOBneeP3bTl/eEBP+xY2GbRO07GEvmH/tT1gTRjfB3h8P+2Hju1RuxCgdkB4BS0km2UQVIOplloifZVkqNJIJyo2TzQwpL5CLoYCVbBDra8/VUK9mBp2zGn9M04gbR1igbi4OxSjHrYBCOsm3JzuMkr1hRNgtfUnWKvvFbUTbTosUsbwN2UfYX2OJTk2DiMsoGKCdAJoYgmmTvKdWVpL9ABBZPTAHZlzPwMhfGk2y+CNk7SEjHSXZKIBV0HaUb/x2uWHeSHdnDu6y9Uw35BEn2fQgfiLIfqfoZS5nCqELZ6p2LioqBQNmk8QyDLQPK3o5alJt+ZDdEiwBVSD+53JkqRS6L2ZsVzFOO7DrwMTM2shsS3a1Th77F/kR9YXgffGyNhrZXUZ4/tiy+GTBnf2xe0BhHS/HHjngqUVhBEMQZ3W1ombxIIhE1zYeuA3q+wwM3lR+72eKW5X9szQekX+4RBA== ]]><![CDATA[ zJgfOyYR6CfGY8vGRmHNOUx6LJWHeSjRUW8VPCP2ML72LIt9qnX8kDiW9ECIqxKB8S22VFE4ReMUtNjRJq2yZ0I+0qXuFjuFXHbCKTVeNgYdIewNKnLMWH+L7UuYfneS5XK32CKR49NrWuxdpr4tURF4Sez3JW7x6iT2a+CHxmXDltTASnwdbtjvHBhwfcNu4jLGg2YHEbhhFx/qIdawXTAbnDPWGjZEdihahAWOr4bd3wQ7uRp2Lfc5zGYwUVEEgRvBJIfJaYOhYVMcUc0TNp5/NGyNrkFOD9oIO+jcIcFF785J2O3Nh0W+baNlJ5MazQfNT6CC1xfa+RfPVI5oRGNVy12E3YyVM49YwG8XYS9H6GvsjrD3CfldZUjY9cIA7v+KF6ISbJUvumASBsqXWYJtKLT/+b1cCbZfhBluny3xvkkk2Lm3DuwcwH4m2ItPk0SmhM1abtgnS2w8uZnaxYaZ94JcpkFElfkD2TKWfFbaaPwkB8h2VsktKLG6CAXZ9P/Nnm91MOcge55boUYIsnWZZi8ASvZ2YdOmbGIx1n+0bOORjv2YHYCp/Z1r9mIa5ktnh+RbeKHP/gZP4Q5tpEo8nJB2A754Cpl2Q+3gSHPCkmkvvJOvwSCHdGwzbbh0+9iJ2rxUGjNdtfU3a7X2tiaIe4PaOX1pbR5isK+AqvUj4awW29luln2c7Vb69R2ooKRE7dmWVetFQklBIz/bUpjpZ0tFMY4Zz3YIgVyWihF5thW+MBcLsSFwtq2FjB4SvGLMYjuGPIMq91RsvzKCgXbYznb4JAH6HrpEdLaPBX7YReg2IcrZHne5lOla42xTIOaTOoOooZazfQ5GmGsAA0NtznbA5QUFUK9tosT5+6B3bTPZvFMhw52hL59tuhjofwv0Am0vSrjtV+SkLUdEoW2tXbOf/9xU+xhALGg78OKhR83ByjwPtG3QoGelSp74bKHtCPOypNcxYYe2t2ikaE1ou43xvDvK+BLanhoJGT9K888etO1rG/cu8pWqItvzTDMYghIC/7ENmVNZPy9J/ku2eRLbNW8t/3qynbQ7vBWnGMrd0grXyN9e2Q4UUPl1/GfjqumC7Ug27MsBg+0fhlAxK/BnsC0IcgtTuTcVv2Cbec7kwAphGWx/wiNI5Dh6brDNasjwPoqCeLDtLbV7I9TQvAM2V3YnOodQb8m2SICyPzjETYls/9E2upN4YQXEFW0rKOdh49C249JkMYF7bVtE5Z3rMfsL6q9tZ4GSdVbV7LOwFU/bvuIEiY7b294V7PbYfOrtKajm2t0OqfYe3HpEacT3NqwKxSYYt/eIunDIbVp4uSp3znYRPRlTil0uJG6bPLex3mcyuvUySU776U4N6+arZONhN+lfKlXtZvUL8QZw4dOyKX6P/k9FAxTeLIfXw/E2cnm7FmIV6P0nMMdOve83NyDZO/gnFLs3Xl3hnpyp/E8DpNeF5vsrCgEZ0z8Wp/Vt+76X2mcwj34Xwag/N/5+7T0igHMi9gEc0WXAbSrwzLYdYzxwL/b5dHyC/xc893DGK935a7DbNji9NwXTgH16ONjMj3m7Y/GE20Ru5ivgdmqx8ADB8L1Wn6bhuvh0pBxebIX7vIcr+R/3FxnE175cjUJkYCMtSJyLRjwxcbkrtA+Kxz51UT7xOKKv6RT/UOol64rnQKh6cnUldYdqhIBxx2SYZJzMfZbGh5lTt/EZl1QB8kSv0XC242zgh1RhPEiyIP1x3ffgIB8110iIfHTNyG0UyVGAnPqOPxzwsa1Vcg563V8z9XOeHGtFdpTDRiImqFxXaHpi9+0qOivvV5qqWA44ZBIUT/a+/NZyZ6Uuz6D85ZQQcwfp/Ity216yTzRaM/95jOaf+g8MlFoAv9r8EOfa6M1/Y6oHjGmV1d5mMymbLyFvi7JBruG5lHr+TvGtjfO54s+ty9hBCAr0RA/61ySSoTflkHGK6AmFHUlyRc9Jo1uLY4vao48H9bwb6TplU086DlJmPmLpwTB9rrCfavooA3QZxOl3qa/nPH0sqAt2HMkr6hIk6MbAe+nBqfznk3qqxHYgnHpRqq/XvLyrTsC7ptGqK6jK0utWv7mB9QCT9Y0GU19aj95BNdK6MHqTd27rwk2uf9cMxwLu7fqsr8Ab7HX/Pf+/DpQ4Q9jjru4RO2Yl1VVjx0d5dkb2rPIDYNm9nKjQbHbyXNHqas9WoQZh9mL1koSo3bqfSWrtSfuVHMf2WOIu4ijbXgndnlveE7P72TsB3Vpow/23I+ZSrf1iPSOZO8DZwpBadNfS6l4QZaXdsTd3Eec8rneHmLVn432wYJHq8w6AAxHaiL0zorEbP+2CK0sevntJNrRR33FluDu/c/w7R4+DrQL+7FkkG39PqjvwGhY3Lvg9u9aoIHxN3ribf+c+TwovgcSvDL++n1K0wwe2Ip8l4t/WxJQPUMBQ+aQVf9wXTxUopI7Gx56ZHsd3uq1RrKaoxwtAV3iNkD+5AmbdyF85dgw9v/i9J9875WMJIQWx/MHv173Lux6Hk5hnKsCbzTzMjV5HbM2bbx6pnism6HzxhWpBnif8lSn5ea9e0P+KNpqQ1WProvfio7d6EegXpY9i+hJ9IFGn714pggz12dijO23qP6z6oBJPO8ch6RY2pFn/PZ8A/jLeSbWZq8oEXVf+MsIwUxrGwZuKlrr1OuuMfU3zIH0NY9+/WGK4851y8mog0C+3vrTcYO/FBC/rsw21z6WyXi4gLMr6mpathpZbH6PvelGzLlQA87u+fmiTEw70Xd+tprGtetdr57pWv7t+C9CRVf5dv1pklP1peP1Sga1BGHWKxiJp0ErBc94t4vXFy0o3+WFkFK/3FdgjFUD+t2KPR/br/XENUnul5VS9JdCsfePPth/+9tJxJvcMub/VQ/dkPbv/gHiPJXjkrvdkHuat7w11f7Lo77PO4CmzgV9US5EHv1bDXyotoliG7zZnYBbxBX8iLCNxxT+7BH8DDxrfbo9vb8UogI18VX3yqwRefSwf1FR8xXzTKuHZkuBrfnY/u+n8/eAUkGmfTxAy9DeaXPOjH2P9t870b+jYZiPqS6OjZvtVP9QYj5vWX2Mb0Z/lrV7f7kPfpL1r7ItP6vs7+8Wx6BPXa79n58wA3KemmP10X6dDNEjy/oJfmt73gcoyPMGfDR2p4c+ewo9/YP4Wf7N9leTjB4g2Hj7Kn7YG6ijmNx+kv8OoAM6/bSAeFfT/jJTEKP1v6r8IaWDPuP5ERbtVZf/g9pv0EHJ0958vajTwv0LOKHFyAfqUdzt5k78Ezfm7Kv0t+REQW3/xxmTyJLzcdBF+/8ORkDiB/O939P+rzIqBtvY/5/SixX+ns2gPW/1s+r+i6f8EzcCOoQTIDpzABN7/iIIiPxAQgu05AAAAAADgXnDvA5T+PQFEO8v2b7r+/6/8rJ2fp9/f/fl55efpt5QpJSlF9mcFUs5+XmBlsbfN3pZbpGkhMCMaI94v1AjYp0gc2hFwXNYPaFB2o8nAnkK7Cjk0P5YMSr21OSdwzutw5+6bPrhvo/dWz9Cpzcid0TFuZTONHlptw8fmcf7ePlCink00ybe1CWTrfPYKwemuEDaCan6KxOFn8vTeMnJnM+90FmaspmHGapqDgQDjGyp8iImzZywd4hoElxPaDVFKZQczJmsDpYad6dP7mzoJ7aoWjj6rh7hPqSJ6pc3uhxo1/FGliDR5aPWVzWdvAN16EOMeEeSfHfM2RsOY1VmZubI5yJGvH0CxWBNl+vWZurZsjJyt5bUIL/7BggbuNYEDpz18uLZ9sZwvXM3DWDfbALbRMXRbrY2gm4xD6FbDmNVZHhbii4OFgV3ZZpmG78zneOH8VKqiz6BkdJbw9T2FezWNn9osU2c22+i91TZ9bN7H8M4uorRx/uQ+zt9cvePN6wpUOHoOV0znHsO8XlQZ2K1yTNJbVkLpDFhCZSsakR6oMe/zKM5FmQgraX69gVLDfmBE4p9KNbybQL00dmm1zd/aL6Ls2/4k2t0ycmSzjB1ZrTM4Z/OA6e6jR0GyJ84vWdJk1xZS7Lt7vHk3UmXgPeQI+HsO62LwtloYNO3XNc4OK8oEpEEoGf0bkoTWR5KCtk6g3e8hvLN1vnSdRg+tlqFDk4Ea+WgDqmGP5eOSlhBEc54aYfiBGPO6TpfuaTRsY924rBWweKyPKgd5DOduHL84r9Od+0CKfN6pM2wnULFoowc3FMlnR4ka3lOlh3ecF3Lks5s4w/aB1MQbgWrjN2Aa9kKQfV7HS9d3uHg/R3Du3/i1/Ro9tnonTOeoZ/N877yeWk/Y7vY5vLN/CDF+g33R8KXRTKNd79QJvmfmzjoM2ZyFsbuWg3WFcRAevrjWKwwoce9XKPI5W2AdzWoV4ZS3WktlCkQ4aaZP7vbIUtBmMIPxVziyWVOZSPxKnFymT0Lvc3hn0+Sd0TJ3Y/ROOO4jVQpunTgJt0KKffdM3hl9bdtmY+S2M81eGi1TV5aFs7E1gG3zTqHdfH3zWk5zdcGoZcFm+NK0PYt2NZH4bydxriYS//Ugyb1+8wfXZ+LY+s53zj66BLyhTME3AhSI9pUOcb1VRXQG8aTUS+ixOecMxvmZvjJaiZP7FbhY9AlSNHYHMCR9lGnhbZj3hRz5bCPJQajUsL30Ga4VwHiktYxszllJMuUEMBY7UyjXFpLM+0iagb/Bi8maApFOWsKQTDrBiMZPRSLxG0AFf6BGvaBGvy4kmfcPlAjfVwVEfqZP7m0TqOZp+tJooci7rZJm144CLdweSQraPFy8f8MH92nw2uobwLg6h/v2cwbjuB0Wxm+xEESdfCGcpNZLlYYeyJBvRo6t63jhtj6IdbbNX1ufsUObc7hxDWw89gczxPUSp4FSw7606f1HltzuU3i35coBLe4pWMH4Fahw9EqcXJw/ua/DnfNgu+8T3vtEjoBJmtzv9BlO0IKxR5Uw7Eqa3T+3ntOV6z6HeT3IUe/xz975ytk3gm81TiBcxwGU6ziDb3/7JXZl61mdcFwXssTznIBLmN8hR74t1YhF3+BF42faBH+nT8QuwQeotkOraF/AArL7GN59oMY8qxmTfejR7+MAwn0dbp0HWtSzgRL17KBHPBtIMc8qhiORJKCv6UvrMXPbecavTM75wtU2gW40DR+bHNTY159Gw7bT6NfOAcvR1zY5e2XrYjqFc7NTqrdX2XCsp0ok9gMoEvsBE4r+gAnFqxyXNBeraBdzgmpzYALqn0LBt9Nn4a968dghxKjsTJ3fJE3upxBks8Zg5LPO+nFZO3AR+Ysk/e6bvrfPA6a7nTwJt1Mlwj3hOzuCEU0tFwKqWg5cUOUKSTzlqRGJX0iSz7dw9BOGbM4akoTWFpZ8zgtWPPomUPAHYsz7NHtqNQ3fGZ1DCFdHmRr+DayffmsJ528K5d4zema1DB7ZPETJ95lGux7qtPAvbXp/zh/d3+Hi/aJIwA== ]]><![CDATA[ +ycx7+8YwsnUldFcBgO7usliTKbdvsEA1WzWD05ZKdP7jSgDvw2fW7+mbeWcLpydtClo5wzGfZq9tFlokq9XxYCkMbSCzlyson2CEc/5BGOttPn1RJKAPymT+yP7ljq5dtQpomcwI5K+wnFJN4AhWRsoJdT50tHsrTXy2VOqiP7xK11+bQQlFn9VDEf/NBrW6dL9oMa9H/TI53W+cZ/ncO77JOJ5njDd3/nO2T6Kdj+oke8DKeLZPoZ39o2gm4+xs+cYui/P5KnJM3xo2pxwW58ywUhr/fDUgrhyWsusKHwYk9TPdSTUS6UieiDFPSjTQ0+luuh5BPFsm762KFTDH1VaaAs18tk2fW0+hq2s5gnT2UqYXdsAqXcsCTPw9lG0+wnn3Tnct2/TdxMI1484Af2TadgveX69ghWMnwGLyD73tTBlWrEeyLmOFUSyX2jiSTMo4LEzmXp7EOSeL6oM7ApeONYPdFDSC2Q41hBwVNJQqGAcQLn+k4j3ky6/HorU8DeBfm2nT/B3AEPSK3Cx6IUe92ycv7h/0/f2b/7e/E5XbgvEeLcVety7ewrtKlApxWowwFSLgcqojNXjcoZCNexFmn8JUjT6CDss6wg6MmkINihrJs4vztfNx8yRaWXsyOaeMJ5HwOLwb2ji+TUg2bSbRr9+Rg9tjqmztTlhuPqocvAnUAFJS+ixSUedHtpImF0fZWr4nUq7ttOIrn8a8fU7YbkvY2empQFMk3kc6egDKxRrrVVOOYIPzNnAJ+FYjd5an7Fbm59Gw7aUaeKv8WOrZ+zMZh8wnt0UCu4KYjTWDXJE1llANGcJQTTnBS4a/ZNo4U9ggvFAicOgxrwPtLjXlTYH/xSJQxtBisYulYrolza9X6iR7/so2v2doknA7wRKaD+Fgm+gQ7/Pg+eTNLm/qfNrK2lygRjv7qPJQfsplPB2AiW8kSoFb6BEPdsHjGcPNfrdR5SBdxHkn52EGXgHPfJ5IMg7z4M492XuzrQ0fWW0DVet13jVtDeCcLRSp7d70II6b5+0+CGolKAd0BDPRpXcDrS453W4db6HEO/zcPF+Td5azxmM+0aTgR8K1bBPpRraRpV+tw5Xzs4JJEW8mTa725u/tT9Th1Zf1WytDBxZfcNl8znfOB8jt9XKzJlphyb7PBGmng3kmNeLJgN/kubfVmnT+40w/zxO963X8KnVRJd7PoELRc+gRiR9IMWhDxLr1TlgORqn+9ZxAuG6j6Ke5t/vWayrafbW6Bo+N/oHUc8HNfJ9o0nAocm+nMG4H/M2Rse8jc03f280fma1DN4YPTNnRuMMvn2bv7ZOgTVUe0XkUsuAxmNnUMNRadPbhSL3PpPo1ytQ4egZvJCsGaSQ9EaR3L9TSNdzvnIdyVLQzuoh7haWfM4VlnTSW0c2P9YPMe00Wth7EPNom67bDPSoVz+RGvYIQDa1GJyEyg5iVNZHnIBeaJKvM5US1hKQWNYZqoDSCl4wdiDHvC5TZybfdNtopNA/74RKWDOAAdmpTCQ2hYI7ghWLnQnU+3W4dt2ncK8WUuy7fxL3fFBjXxeK/KupUDD2CkU+ZwYtIr0BUcNPZSLxM2gR2aFMwXdPGO/ncOc8kCKe3RT6tUcN/4ETiH4KFVGI0e/vgOk+j2GdN7r8E5LMu4seA+2d752vuWsDUsz7N31xngavrcb5k/s+YLwbyVLQNlBKaCMgkXgjIJF4Q4UWKom9t9EkoN1TaPd/Gu8MqIY9AxqPnYgSsNcAqs1XNzt7fbPDYubIskOSgXQGLqfary8o5i4DSshZQDhlJs+w1xGks3sI8X7S5uBfwvzaPmA9jyMY54ce/WwqE4k/AQpF22gysKewzkaqDLwL724ZO7JZJm5slpnbzjaDaN8n0c7fDLb161mdjYm7sz6OdR6H0K2WqRuTZfLMtDrfuH8jCEfvgOtqn0Y6T5nXiSz7vJEloO85vOs0f2e0TJ2ZTMN3Rt/4xfmcrxyd83XzPIh0Pec7V9v0vdVDkn07XrqPM+jmdbhyH0cQztvsufWZOrRaBo5spslDq2382uoYOlvLtyFEcK2XiBi4L8/UodVc+9UVAYhlzYDGY1fgYvE3kCHpRAr2SJtcBCoWPQQa4hoBCkRbadPLta9uVPYtI51+w5JPn6FJZ9davawTwEj0FKyTPgc70+jXN5AhWV+AEjprEcmknUwJvw1gGz1zlzYbZQb2Kx6SPSsIJp2ABWMvuvT7NYFtcs1f25zjhes6hm/egGnYP8AR2SUE0Zy3rphqNVQpnTdIIZ2xfojpA6eK/0nT8CaC/LNt+tzqn8W9LkHI5mzByOcMNYp4JCloF0n63UaTfjfR459tJDn4kyy7dlMnob3Eyf1LnN5PRULxIzih+Jk6uzaQ4d6dMxj3a/bW6h7DOiFHPpsHbPd1vHI94bu/462za+7UPE0dW8/hyv2gxD67ibO7VcIcvJ1ACe2pVMPbKdR7J4m5P4h6fuYObY6ZI8v2HOLVC2JA0heUhMpKnN5+XftYvs2CxdBttTrgudqIcrBfFaGcQwTghJztkqIWIYUEDcHGJb3TtftAins/qhTxY92o7Fg4KjvTJyET59dm8vTePm3+RtDNAzHi2TthmbntXPOnVtfotdUze2gyd2RamboxmcZPbZ6xQ5tj4L4cY/flK9uNvbZ1sRm8MpkGME2+4bLVOuG52kaQrZaxu2WYMy/Gx7Jh3NaKxdDZso0gG10jmEbX9LnRRJd9vmmU0Cdtcn0P4t2V7Wtj2LYyzV5a51Gk6zjdt35V69qrWZ29xt3ZGb3rnNfG2N3ZmT4y7ZWtZ7lXBxBDkX1MoF5biZM7JNnngRr1PI5Xju4pxKuPBrtPIp7vSaxz8jT0BkjDtlNp117yFLSDHvm8D6NdB5rM6z+NdzV/bDMPYl2NhNm1AYSjY+LItDZ/b3OR5Z9v+iT8Q5R7/yYQrtPstQE97tU7hHe0jV9bbQO41nsM6T5S5qBHkELRb4hiOotJGdE/XCmtr3BM6gzS/Z4wnoc6LfQNXkT2KNTELvTI53nCdLaOV07IUc8umgwcouT7Qox+/+dQzxZ63LOJIvtsoUY/W+hx79bhzvkZOjWaBo+t2/y59S9dx+HG1T1gPf9TyPeDEP9sIMS9G4dvztYJpLuHIPe2S5bfrRIm904Sc+2jycEbPPd1Buu8T2HezxGc8zN2a/OMHZoM5JjXH+yI7Fc6xHTPol0NY3cxGbs07VClHxLm4H9CLay1qHhmuQQwQtvFBbWukARUNoIctHW6dBWeeMoWmHTSUiMMn0LBt9Kl9/cY3n2bPjZf06fmbQLbek7Xzd4xlPM1fGw9hm5MK4NXJpdpxa5oNFiM3Be7wv0wmTyyOQcsR9t012iZvFuOqfvZK9zHXuPssBm8NC1NX5vco3hX33Ddapk6NK0MnZos81ZGy9SRyTdct3rHUM73LNp1oUm+jsQp6Be8eOwJVij+m0G4egbvjP5JxPtHmYA/CbO7A66rr2y2fHWztTBrHXuFu7Myd2P0TN6ZPMNHNsOUyWAwZLMYzJo2DGgx7/cU3vUcLx3t03jXhyT7vA54rq7Re5tp+tLkG8E3WsdL128E2/oN4FvfCdvVQIh9f0jyzwc58nUd75yvG5N1wnH10aZNnxtN08c23wi61TR7bXMM3FhW5g5Nu1NoRxuJBb0SJ/fzHM75mTw0WgavjCdxrn4yDXshST6v06X7N4BuvmZvrabJU6t1vHX1ARSOMwUmn1otJpyygVJDHL847wQK/k+hhR7JUtAeivzzO146O6cr14Ea9byRWNATTfr9n0Q9zwO2+93G762+AXTzOH9v/6YPzuP4xXkbPjcgRzxvRBloE00K1keZgH4Ikk/HK2fX4LH5m783x8BfRPlnK2kO3kGNfB8nUK7fBML1HsQ7n8O8ntOV8z2Fd93oMrAzhXbtIck/n/OV6zR7afNP4513Cg17KFXDrsTJ/Uuf3r9gRuRMobVTnqCkU5ZCTbzxa9tq/awnGOmUhR7/fA5X7vsU5gkp9tk/i3df50vXc7xwPigS7wM53tk64bm65k+tvrZts1e22c1jr3NbLE0fm7xzWFcHSe51nLDbfIXrWRi2OmxmD027ozg3H30Kzkid3Bqpk1sLUfbVQ5N/dZGlYG2UKVg/pYK7ghiOtVSJQx8ECdS414Um93xPYh7dg3jXqVQg+glDOGksIJR1gheIPIdzf8bOrI6RG9PGyNnaGLkbe43rYle3Gnt1s7EwajbY1a3GwqjVYlCkhjaQYt7vOazzR+LAPyTZ52f21LQxc2TZm24bneOF6ztfOq/zletAjXm9iPLvK3F2/bfO1/C50TR7azSPIl2HSg3bVCgU/dAkYM2TONd5Du06jiCcvwlk8zaDa50H0a5W6hz8C1489qZPwn8T+NZn6tRkGj42+UYQjhaa3PNQqIfdgGq4x7DO73zrPE/Yrv846tVKn99aCgVifSDFYj+y5HYgRr4O2IMYATsQ4943Egf+yD7bSCzonUAJbynUxL6gBSTdIAYlrYCFY90E6r2BFPm8jnfO4wjC+Zm7NJrmTq0LOfLZB0Yk/ihTw08E+WcHLfb5JcyvTVVi0VfBaBRq5LN1unR8PccL53kO5/yPYt7nCdP9HfDc91G0+0OQfLaROPADJe79HS+dndOV8zmEcZ3HsM4LRe79nkK7n/OF8zvfOj8U+eeJJAG9keXfV+Lk/iZP7/00Cv4JVCz6KFPDH5TIZ9/wwdk+hnd2FKnhh3BDXB8ocWj/KOb9Gj01H8NGVvOE6Wwmz64dZUq4RcIEtH8S8X4QY94NdJh353Tj/k0gm5exI5tr9tZqI02//1Qa9k2iYc/AxeNv4ELSV6l4/ESTfj/mzWv5FgvG4xjXr4JIdgtNNusEMRK70eZf50Gc+0KQfT/Bi8Yay8cl3aBGZK01JJNmIIPRF0n63Tteu95TaPd1unQ9ZzDuF00G/ijUQ9+AhqOPSj30PYV2/4bvzeP4xX0c7tvf6cptfxbt7iBHPbun0O73FNr9mrs3OsatbI55G6N3wHOfCPLPBlLM+0eVg19J8+t9FvHqmbu0mYbvjLYRdJN3CPHqH0Q9D6S494Ea9TxPoV3/UdyrfxD1/M6Xzu+E7WofRDxfZPnno1IPPZSqYS+qDOw7YLv6hutW8xjW+aDGvD8EyWcbVQL+KRKH9gMblXSCFI29KfRrBz3y+Z1Cuv7TeOeXRL1dShXxU5lQ9E2iYW90GdiTNLnf6DKwH20GdqoVi3UDGZJ1AhaMnQqFYqcyoeifRsH/CFPQC0HyfaVM758ycegNmHpvI3HgN7L8+0ZiQY+UOfiZOL/2k2jhfxoN20mYXS/UyGcDLe75nsQ6r0M453sK7T6RJKB3+iS0n0AJb6DDvr9DWOd9EO/8kaWgvYT5tZEsBe0gxr0PtGh3J1l27ajSQtsAadg+ogy8gxT1bJ9w3h2U2GcTSQ== ]]><![CDATA[ 9tlFj4K2ESXgrdOl6zeBb73nsM4WguT7R5h+9xAkn63jpes6XjmbSLxnE1H6fSRLQRspc/ATUfp9oko+O+ly0FbK7NpHkYO3UCPf9zG8I6IMUtyzc7hxNh+cPeTId0uNItpJmYF3TZ6al5kro2PS7nmmjqzO+br9HC+cv6bV2auajRWK3PtEmHlfaHLPK2lybadP79jTKPgjcQr6G0G3PoN3Rg9R7n2qFYb/gIrE3kTq/TqHcvQMX5o8k3cm2/y19R/FvdpILOiPMgG/jiEdfV3b3gC+1TeAb3UNHlu/+XvzN4BuPYdL12v03uprmy1f2+7Zpq/N2/ipeRo/sy6DN0bLzJXNOINu3uavrYYpo7Ew2zpb08dGD0n2+Zo8Nb9DWOeHHv3ixuQYNluWoSuTdb50Hagx7/8k4vmbQLga52+uvgGUo3cI63yRuI+n8K73HN71oEc+H/TI13kK6TzN3hpt4/dWF1H6/SfR73bpM/CWSjW8G8SA7FGliN/AqOGPQj30R5Xcr9Ol6zreunrJ8+urXjzWUqqGf6mTazuJgj+Tpvc2mhz8TqLg70BGJQ0BB2VPkKLRL1jB+A2Qhm0jceAfevT7QIt6nojS7+gS0OYxpOs9YTz/yPeRMge/kyfhLaVq+KdQEe0jceAPWuz7PGE62ycRzxNV8tlDkn3+Z/HuDy3+2Tteu15z1+Z1uHK2j+Hdt9GD6zN0ajWOX5wHQty7mTy7NlUJRJvBCse/QAWjLUWKaC9ldu0lTe8dRWpoN30eXQLaSZuC9lSJQnvqtHCblDn4hSL3bBs+t24DuNaBFPP+UqbXTsrk/iTMrg9y1LNxBt/80KPfn0o1tBGgQLShQA/toEa+fxPoVt8Aunmhxr27B2z3bfLaPI7fm/1jqGcnXQ7aS5hfGwcQ7l/TvjYmzpZl6shkHO+azXM4969wtsw9cADBbS0YkCPe70ms8zR8aTSO180HNep9nfBcrQOuq3sY6boO4ZwnwuT7QpN7/icRz+uA4/oMH9kcM3fLMXRbbc5g3O9RxKtvuG00zV8afUWrxbgWzCsmjkwrE5c2x7iVaWny0GobQTVfw7fWZeTO6Ovarb2q3doZu7OZhk+tjpnzWr4NIYLPH0Rc3WqtzFwZzbEhujhYh66r2sfuhO1qJE5BPxO3VtforXkdbtwtFMn3cwbjvgwcWR0zt511vHIfSHHv63Dpuk6Xrt/8vf2eb94vkhT0RZOAf4nT+5U0uXbOd67GGYSrdcB19E4hXR+S/PNHlYP/aRT8o04Pv4FRwy91evijTsG30mbX63DrPs6f3E/aFLShTr9bpc3AW4mTazeJhj0UKvhDoYK/kyf4piKR+KNKC+0kMdeWUg3fUqaJP+oU0TN1fu0hR8AfxLj3gxz17B3COq/jlfs7Xbv/c4hnBzHq3UOQfPZPId//Mcz7RpOBP2lT0DZQSmgjGLFoS6EW2kaVfvcPeO/OGYzzM3VotY3fW+1zmNd3COs8jiCc1/HOeR7DOt9DeGfzfOtsmjs1T1O3Vut06b6RZOA9VWp4Q4UW2ghIJN4PYEDeVCQMb6ZMQhvJUtAeevT7QYx9f4ix72bKJLytZjjaDWQ4eiNx4Ceq7LOHKvV+jZ4bXYPXVgMp4tlCjHx3T6Hd9zG8+zmAczbOYJxXwhzcTpkm/gMmFD0RZGDHCYTrNH5oM83eWSdy9NsOOfLdN31vdk5gnA3EaHcPRfLZOV+3LzM3Rl/X7GwMna3NCbt9m763OmbO1sKYacFgzLJhMXO3fDPoVuNw376NoJrP8b59Gjw1+trWxa5uHhtjd2dvvms9iFKv3wi6+Stbz8KkeTGYNVoMBk0Ok8HbanHCb7SOYRw903cm1wyi1TJ2Ztpr2529qn0s38phMGdzlmYvbb75i6tj5LZamDKtGK+9vrj/EnF181gZvK0sg7fVXt+8NobOY2X07uxVjcbyDhw68K4MHa5pPiyHMK4ngQb2GTi1LwNHRutw4+6gxb4fxLj3bfbcus9hXm/y9N5AYb9/0xdX4wTKdZ+wnl/K7N4GRgs/E6j3/yTieRtBtvrK1rPXtjurQ1hHAzXmfSPxYD9QgrGusKrpJfCw7FCnhb8ptGv/KOZ9HTCc9zG8+0SVffZUqqEtVYr4mTy7NlPn1/ZBvPM4gnN1zmCcJ7LcuxmscPwKTCjeRZJ+94+hnv1TyPd5wnP3TF1aLSO3Nvsk4nkfRDxv8+fWae7YaBxBOC/kyGczfXLvJMuuzWNI928E1T4PIZ4/ogy8lS4Ft0WRgLbOoF2Nw337N35xfkbujI5pG5tj2LbyDB2aPHNXRsvMnck83zsvpNh3EzEC3kKLfHcOn929E1i3PZr0G3Pa/G6bNr/bp87wFiq08H7yJNz2HNbZNnpw/YZPrtPUrfWbPbh+5Dh4X82Q/Fo4xLYS5uB98/f2k8RcG2nzz6bZa5tv9uB6D6HdLaTYdydlBt5EjX63UOPenXQ5aDuFeu+kTkFbKJLvX9222uvardX5ynUiScDftPndIkkOjvkY5n0dbtyd03WzafjUaBm6m5bRG8te27wcE/ezNIBqMwyZHMbBNoDgXgSIGLyt2BXui13naq1OOK7+gcTrPY5ynqavrIYxw4rgYB40cC+iK6buTOzn8a6+utlZnv3qur5tsTFuWy0vAwODUdOCXeE8dobPTItz2CbjFLbRNt02GcYsG8ZDcODiPSzEla1nafzO5pm8M21M3M9e2XoY137w4naXCP5DiIA5k8OucF2OubuzMnf2zO0wL5gybBiMmhgYt8W+YNJqsOvaHXZV+2FXsj7HvI3NOl45W6dL93sK62yaPLTaZxGvRsLseiPJwZ/CvR+02OeRxFz7CFPQE4n/ug6XrsfMlWFj5G4xm+4aLSTZ14Mk8/7PI17NY5hHI20O9qdTwr/kOXj/KOb9n0S7W8cr93W+cPZNIJs3qvy7pU4Pdb5xfybvjIZps8Vs+tzqJtHujWCEol30GGjj+M35Gr23mkYPrYYx81kYMm32qjam5QnT2TeBb33mLm2ewVOjZ+zWZpq8ttkH8c7/QNr1GLgymXcZe0XbyjR2ab0mr83T1K3VM3VodE1e2pd5M6uvZ1+G2c5aGLQ5S+OXRvMY1vkcQTraJxHPAy3m2T2EdjdPWG5Lc6fmbfjY7CFIPvsokvuNKAPtJlDvXTQZ+HMG6f6Nn9vHEYzzN39wHUcwzvN862ynT+/tYMWjfRTJtW362DwOINw/ygT0PYR3X6bObNb5wtlGk4B2kyb4dtr8bpEsBW0mTe+9hPm1fxjvbB2unN1DeGfneOF8jV5bXbPXVh9ZcjvTZndb5Pi3HWr0u3W8cjZNn9oM09bFyEKEiLm7tTWBa/R1rYtxbIcPHAQGLp7t8IHfYl1jYl4yfGTYGnCaVgbvLHt1+2DcDEwEH8N6zfilgeEUumlxvnFyDF2Z2MxdGvbKdofxDgaCh3X4wMW2OPC6q8P1Tft1rdt+wbzNX7x3AME/VMDAwba4rnV22IweGpYmUE1LI6imrRlUm2m4aVkYNi2Wf68ujuXQgXuvDzBqYCJgzsS+YMpksKuZF3Fdo8Oua3QYDFpWBKdFgOAiNnBxGsQHHBD1TlaECFZXThPK8Mo4OF1JsHKycrpykuDAyQFb7eTA6UEEJwkRrJzuqionB04OnP7OV+3k1UVsSDtr00vj0GDHQ+1k5YSAascuDe+uDDuBjoEWVgQJVTtxTg+wsKwYXEGwkkC35WSFVxbmhCbHtSPvqO2EuMq6yoqAxQACFgQsB1ZWDCJcxUW40nIAIc4BhAdacRAeaD14kPUgi0GWldUDCVgSHkTIsrpyEIFBlgOsCA4eOLCSgOUgglWWBAkMrqwiXFlBwIoAwcrKKsvKysoKSwIDqyyrOC0GVlYQImg9wILw4EHWgwcOHkDIyrKCkGWVZSXBykqClRbWAwcPtCA4eCABK2sDgysIcQGcht/wHH7DdfgMr+FXHsNreA7X4T4ciCNxqiMq7jZm4WuM5QNmlxVTck/KDsm+1hyZmFH2vgcEQFZ0goBXtAKAztmIJJEycPWHZRdIC7FXSAqx14eKym8OGZVeHi/EXh42LAl3rLAM8zC1LOxBeonYQ9PyMAimpSIPTLEiD7ElYwGa4sYbYjAQLl7BOAWHK+NMgf8HDjiCHSauw3W4DJ/hMVyG0/AajsNzuA6/4TJ8hstwGX7lMDyGx/AbPsNluAyX4TO8httwHu7DnZqkYv7auIROwV1EqoUgrnVlXJyqagF3mjrAN0ywgvGzLQTpCG/AGvvg8DYewBdlqBW4xjsuAfj0m5KAJB2WsaNea+um4RHLS8IiopSDQ3pQdnvoEHd9FCDmCqlhSSjElFJwiA4xV4iMy8Iep5ZhIKRisA8S4jCPUUvDH5ybjkkOM09UaWukksU2zML6wV+geEYsW36kjS5jfuMAYOXGCYR5GLN2WPrCuaVTAF+GmEmyC1wsqwF3CoriQzFOXIgX8R3ew284Dr/hOjyH7/AhGSMeReTEoYwM8AZOUbwNm2GqSWbXhDGMLiwEuADhIIERXU5BHL2IVnBF+JT6dQGVGPzAIAAjPoCNn3QRcimAzAmGIgm5F8VJJB/rksxJKIHfLVxovgBYkcU0tphhIg6hzDwMsikmBGJC/P2BItPwx2dnJBJCz0YkiJqGq5iYhEY+KweD0JgEXOVBOSjkB+Xgjx6Z4R+p4iBWyOgQ+OHRxj/mPANc0fpxEhEUxjY+DB1J1MDpwrA4BgQI+JWSAc4gyIlP2ShxJxkjjnT14UQxO/yIB/EjnsSVfqY4XWFCDOHWwzXQBsG/Bg1cCqkBR7JJwIm4Ew/iSDyIK3Ei3sSJZAxwJyUF/Htt8BH3gWEdMEJE4pMCdMo+Kikk+6SkmOyDUkPSrwmOS+8R0skdBoy9IQBK9pH1AFuz0AimpZfIiEvCIaSahj9EOxVXJTk9neRpqpjCRnkEy5iili1eExXKXKajkUPMRh6S4nCP0UvFHZqXiz0oLcM6TFwi4iCtnFzldqkkMHcYN+mA4ACoXD8zArlgBmUMHCyCA54hQhW3cOWAb0V4wDVoReAXJlzxLg0SuJ21cMUj4xBDx+ahB1LwK8O4AC89AXTJin18KcO8sQWtEckC37HIAh/UkBXSEvCJCzHgkxmSfKxAMrlPTC9PXFnLGy8ghh1HAdE1gADaTMYmYck+JkAe91gNeNxj/RLph4SI5Xc1dVJQCA8xNwgNTcYji2IYWs4ogXAZs1xxJQ0zHIRU3P1BQ/wFYkL8/ZHi8uvDRaXgEBxir48Vno9KwpwqqLRxrUDpa1961GkH5Kj/tDjpYS9d6soSVtQqS1njKhtXDcWEQEyIwUNIxYRCRjMZjyA+IgnAl1vgCnZrLASE0ghILyNNyRBaX1h4fY2BfJ2NmWABFbAyByKAZV5sPcB3MjYx1CR0kqmp2aq3mTolLvNFFjVKI1/GDA== ]]><![CDATA[ oWTxg1as0IdYBlBnok6B86Rc4hVdbMIo+tmql+kCixpmjyxnlEa6bDULwKLmuemkr7L7I8YluIeJTk0kf56VSbqfpU/sIJ9sub9ImnxAKk26F4oT34gkyy2qCeVPk7DIqSeiEctQSyWDniuiuCkmUUL21yrERivAj9nDuEXYAVbLEPY4ighuAgnIhUkW6IVJFOh54wKI2Y0BIHY2/iKiHnfp8mMuXve4i5c91hJibHxFBN5YAGLiE1jULgmVbGqCoUhqql55G7yyZf4EMCJmxQr6JfQ5CAb06ffVNIPxC0sB1C+vcQ6wwx1NxlQrnXw1WVhZA1RShV770ir2NqYiJo7B5ewShZW1xyQKfMIsW2o/AWiRE6kY4DFraEGztLHFLFNFlbXO1NY5UVRWO8tV1rO0ABTgvRBgYkYLQAy/KKX1doRS5Y6EouUW18hyBulDy1ac2uqGGerEzhLUSR2mJZJAyzCQU0swEc7MRCSNmpVJBiFndCHrHrCAvDdeABuXAC5ibWMtYd8sAZgzVWRZwxx8IjrZ9wRIZeCSFZVeI6SVg0pMVAIiwSHZ96SHZN+THqeSTMB4RYz4PyNPOqaLK2qlJ6TQjXhU4jjCMUmkaAoocY6rVrZ1C7RqRYx1gIkY/xDR/eJl5lRhxe0z8Yjk5ydrnqdlE8HLMBBSTEMgmpyKRR4zT0xhcxtDwWbHOsS8Wq7QnoxGGjPDQj41JZN4NSWNgDEXjSxeMg5pvDwUInZctbINVGLE7nsy5PcxIWLHTeHhD5Mo2RqyUvGNUQz4liOouFmGVzXFXCIqLrlCamh2hdwQBxbBUTm4KqNSEIkKSsEkJigFk5gQe5lsajI6CXc6soI5VVhp+zax0iOHdLlBUaPQeYKZZGp6mXR6XrL+XbrIghbpBAB2pRAuZJg7tqBVAtlC9nlCClwoKJQ8Qiis/m+ZUXdIQFWb5cQz2zWAEvKblB1eDERKmahYSVeU8UhjIZMl91kCOGq8Kj1sPSg+7rQpMWwta6q9gUupvMFLqrYOyo9fKYRKmSOQJ2RgIUTI7Fp92GdYWNxmXV7Y3wsLvzVWzSIgMhnmx6tgkDwO2GY2IjG8JDQCevktQnr5RSJq2SXiojIwSQ1JPyY7JP2a7JDse+JDsg9KDsm+Jz0m/ZgAEQsmWXEZVhKZWRnFD/MElrVNFVjYMgvIkqYIZMt9WcAVNFPUVjzRRCeNoJBLCMU/upBFJulyIw5h3cIt4fHlKjXk7AAKyApeiVKLkWwhmyTSZbtIBQFPqMULLWnkAFuSSZc7XOVKN4xyxT+ybrn1rKx6WgEWNX1F1eYCQGgdZoCqN7MS4/8tMOqsAinqbAJazNjxjGydAZrI4hlYzhiXePmRObqMZY4+odNUXH20/K6eVg6uvqAMJEJk0g+Jkcm/JKuRfUqQRPYtITIJeKTH5F8SIJB7UFYl+5jsqBRkkkLsNXJaaYjksRLSiaAloxJDTTEUQNJR1jzPFlPcLGdQQdtMMaVtUccTMjsjQfx2SYsfosqIOoy11G5rrWHXUSFSy10RUgdqiVJf3siCdilEi5melCB/ggGmYVhYRsE6jG+ICBv/AHNDABK5rQBLtPcBiGDfEBBCLyqxcoOeaI37VG2lAzVtteMc0RqHeAUA3W/8JbsIxYAv1lqi060retuTGvaeEh833RMcN9yTGneZlwLquS5E6LAWLb0ShhYzzEwnfJeJRxotF4c0Xi4aQbQEH+ms5B4xQTm4JFXcTXKKSfiEEjPRCWKo5JOvOEiXMrwpTWhEIVFuUUcmhprfJKCejkzCn45MCj09oehVrn4ZM1xS5TuuWtlyFoBlrbNGFTbwKpNb/kJDbjBEjK3yASk3EFKp1SAAVG2Zlhmee2T1Jlw9MhYnBYftwQDVOUIQzPnCkc7eNQX01jY5HZOjkPiylBL+jsLim1158b2ypNZZq5kyBCCRXQEMRe/BC2lNJsWFDZZAiXoDAVKEsRVASZZSBpeyyxFS3DhDodxZwsiC1ihFgd845QD/KAUBe/JIAndmCyxqnqGteJ6QS8CdiUsaN8FHOjMJjYhqnkaJcyMAK9ZrvOMLQwFYfGl5QQ2DoKQUzIMAXIgFrir5lzOuoGHe2ILmbYKlZlNgiTZPypEaTkqQes5SQxtGABnZsQN6aOOsCKkbk1y5LYNkMUt0csUmfBLFUybZMsY5gwrbZgFW1BaTSNnWChSgZZCkEstgCKTMwQCncpuVGTfeEhpkHxIwpadmhGsKWDy1HhZInUOMX2D9vDypL3FcQWts7WJDIulyZ56Y0mbpAksa5KqXGzO0le4SPITUsktkhaWXSGrmYRHKTXGTQDEMLWeRPg64J3l8GbNckSXtcrR1DpORyOJl4ZDOTEcjhpmpU+AIoVDpcU9u3D8KijuMlUS/O5Jju7ijCZneEB3bsScuvhgU1T+3ouhrTWh8RSFOxjxhRGkjJYWS94liStxlDitnZ01c2E8muP+qRtN8rEsEDSAa1kABhdmtcYuvsgWAaAFZk3jMHFbQMGtYSWPswaRMvGPKWeQPKmRsX3rUEQwIDWsqwKs1QBr+EYSI6a4upr3LiyqNoUro3HTa/UGSdzaDGo61CALAwMIFYIk2rOVLHbnDy9hlqpQ3TVAodpebTPQ2PZ3kbY620nWemPKGeWMLWuWPLGReJa29TsqQTsYlB923ZPUbHoliKyrx8jNxcEnbbHGFzZOElDhPFVXcKoFgKUtEwrr1KmHyA48csdWk4Oj9yosa6wWGLGIBFfIZFRm/TcoMW67JDXvuCY+vFgVH71hqyNsqM7o9JUZdlkTF2FmSFtuxJyrutCMutnRFbmz1jOAYU3tSwAfbUqL2MoDEHIGJ5dwgRyTt4MekDLalRL3NgoO2q3KEfmQ9wM6EgUVNMskBt+KTLz7QgCp0WwJHtGoBICKTGYBItuwARLKAVaTQjVCy2ImtXHwiFCw/MgmXbWQRLFtDJ1P+Ghcgs9iYBpYrASmwD5ZoYqVaMGYnYCkVG4sSo9ch6WHXEeFxxx25cbs5uWGbXdFBq1nB0e2g7LDpmPz4dExw3HmtQ/4hjyRkg0mI3H5IgNx3UoT8uFYdPrB11X4UEoWsD8oQ28ZCo56/tKDXtOTwblFkbLlFepDRQblxZ/AyKmtYAFWb9gVHV/uio6bDMqTes8KEZmSlcjtG0WKLh2Qh02xRZQ2SlYvtHYCX+fKEFbbMwyKUm45GDC9HW+fEqVLcIFe92GEuXmpELgDoi08O8IpYAtAXqxzgHYl8sR2HHGB3EdhCnykgRA4LwAtt1pJN7ZJpoB3BiJgG0YW0c3EZpTlkIZ09bDGlv6KcejEqqf+zorjhltiwAYnsIAP7GGL2BbI65gfEx9YtyYoyOQrqFsQX0D9BAc9shC2Z2i0BpGZpLzPkGgEcWi8FUMgeFjiRXRADsu7AhPPeuyFDbc+Ij/u24sJvQAAJbJWSSezQo58dZWr4r3pYzllBNGcFMB7pIUs/2ggT0DuoMUmDOGDEnLZFR/1nxUmth8CTWW28BEs3btU+PvliUw7pMmbIesXnRXFSo7HyoH0rC6/lEkPWVmEx/y02ZttKjLrG8qK2vdiY7awgqfGqHKnnsAyp76wU6XRZgvQ0AOygt1xuzDOWGHKWiotZnnKiizBAhdwFABNz2ZQavgxKC5ueksKLsEKCFsOCgq6jpPBvRWhs74TcIFs7EmMLJgXVb7ByKntJSa37Exa9jPWFbVOB0WkrLOo+xUXncECpbGEKqAziSyqt1aKCLqtSQB1YBMlXHELlTlydctNhKVKXHdBj9gng0I4poGNOI0CPuQ2BHzXdliF1XRYi9VoXH3TaATtqtyk8+hmVAnznEoPebqlRu2HZ4eum+PDbLjRobQIx5BAEUKGNe3LjdmNy45OxurCxUVLQHqyU1l1SSjsXlVG6gxVTeqvExFgaEhRlWiWm2zDW1P8VBdV3ZTHtFaBw0lpKNGd5y4nOtuTFNnuFhJ8gxVPLlQCqvFXCwq4TEqOsbwcOs7giL8rIlqTY3lFUfLsnOLZ/ToTYbll2eDMA6KBtA2zMhUia3J03prCJi1whg3RiZctYJct/bOLFzjQxxU3MQgsapJAv91cBLjTYAC51XwKt81wCS+TEK128I5MuNp8BtGjfxqxYeewjDEMBUrEWFCDFanXh1G4lkJrdkEWUBlFl9HdRIf1YQiQ7AhWI3wqHo8faQdkrHOmkIwgR0wdWJHaiy79agYzF3pXltH9lQf1draOedqJ6z1JS70/lhL3d4sKPZVnx6YwUsO3zwWOMCwFVLU8jnSyTdyYWE2eG3TDls5MJIWF2gQln79BFtN9ZXPjbgBuzAxiRPsIOyxrCjcn6agdlz8AqOoPQglqLaFWtt0hU3HJBaJDpBclBFohk1c6Tsuo9AGzIZAjwoV0zYEenEZghfwHAhVYEAFpkQXA5ocVeWUHbUWB0s1YY9tbJCz9PUdF9FBTf7MqLz6YlR78NsDH3LC9osy01+raLjBrMgBSzCANOzCG8pJBFYDFBg+CiSnP4MiKrQcupjKHKqKxVhFPGwPo5f8gy2j9kOaUzsIrOHZaU1v6Iie28RHX79eTUg1FJ9SCunNZdUkp9hyumdAYqonOEIZe0Ax2RtQUnoHIGLKTyFhZSuQKTUG0HKqQ1GRIY/07IDTK0JS9uu5XF/1Fi9CyWFTRNRUUX86JiFjPARP0FABUymJcVcn2lRV1PWdGxVEr0DFdKtRSceM4dvKDOMxUSX23KDb/WhMY3o1Kj+yguep/ioot1MVGDUSlRc4hSSk8YsjlfWPI5S/CRSWPdsKwj6KD0UqfgMSDDO7IjSMHbQCchmQHS8GdAg/F3mPL55yamZGKtpnYGKZ/1AhqRcwMakzSFI5s1B9bQ+kOTz5srCeeNXVK6PVOyYiyOCY0tnBMbtt2lBv29zKDVttjwg0uO2ISrRrZ3VYB8OC49ep2WI/TgAVFqxCpZfGACUuizsZGs2QGGaNUU4EGXDcCHfCuAY9YWoIaWa8wizKrJZpiBF4VykyohvYTqpY0+++opFoc11pBKGkSW0R/WZHSrRSSTrpqh+CUQuaxywfgjAJnsS6SDn8YvrbtGL5CRiKFJZ40BCijNoIDFT+Wi8DvwEUl3AEApnaZExRgaEhZjGFpBaSDJPHonsW528EOs1RAFtJ5CPbSLJP3uCUg0a22WFN1LaeE5HOm0tYBc1k2hXzupc/BPpUCst6SgakFoOaXlJSPuGQoKf6bkxf22pMbdr7ygMSCQipXwJFN2EERytiIiOddXWnQyKC6+LGVF7VlTfC1rij62RMXtn7TwtZQTvpbSol5rrWHHWfHR76oA+WNZatQdFkiVJ0jh1F7YMpqVq6yo/ZMWHtt6ou7SokprqFI6Z6AiOmcF0ZwlDMmkJyDplCso8ZwnKOmUKyj5nC04AZU1tIrSIZ6cejDW1P+B9ZTWwDo6aw== ]]><![CDATA[ qFIqRxhySTegMUlLlTDsCFQkfisakR6BigQnFG0JPDbnryaon8MS0Z6h9bMGkSWV5qJyOmNgHZUbyIDsWkY256zVTPkCq6iWy0opjaF1tIKRTtrCks/ZwpLPWcMU0JqLy2jtpSW1DlEFtXNdGc3qUdkrKPmcJQjZnCHYgPwXmHDWFZR4zlY2JOvOwa0QZN6dpMn9GIBofuyqaJlsZNTsG0ktm5uobjdACe0Oajz6AykQ/YEUjDQTqPcXTQZ+n7DdnQMYt5X6PByjECSze8hSWttWYtRyUHTYdU1y3GusNOwsFhSdy8vpzOEAVNnrAFW6d3lBmxmwYx5TIMf8VQAXWi4AkMh+cTFBfziAhAxhVSw3jfjSRp+C889knkyk6Qfhx6WMwEVjbcAEuDuVIHRQw9EvcPHYn04JGcRw9ESWfR7IEc83kXJtAyW8XwcM53HAbDUQ5J13MiX0VCYShyb7PE+hnQdazKOQxHMWwVr6NUwRpaFIGHYjT8BayJKPhvBjsqZasVg/nRJ+qRGGH4vIZJ0hi+is4crobMC0cEbObZaxI5t1vnLdwGkiPcFI5xz2hETfIEW0AYzJroCFos0E6v1OqN4fpVr4q2w41ldDKmkEKxa7lIlEOkKQTJmCEc85wg9MmgEMyApPPOcPWU7pryinXisJp+ygx+Rs1SOSzgKiOVdo/dRuVRGdE6xwrJ9OD2sMUEq1H6ycIkix6KVUEf9SJxhBCUcvhZrYE6yQwGNzdvCCsjtwUVln9cikI/TQnCHguKSzgmjOEG5M1hWObNYNVkD+Js7ulkiy7+YxnMOykUlfKBI6IyDh2BRa2A+gSGwgQ1KKtNFLpR4+mFFJUxjiOW8xCaWzeFzWC1g0fioUiLbUCEMtH5o0hBuSPer00Gb69DZ9Ev4kTa6CFo3+aRRcROn3jSgDI/So7FUvFm0qVcUfZXrgBKJX8CLxd3Ztpc1BKFDwWFJm4M0DtvtGlYD2kc05y4iYZkCj8QhT0Cd1DvojS6sbkX3Bi8d+pDnYiSADPQnvHS/dj4kjy17lbK1M3phchAlYZxXBpB/skKyXQr1d5ztX0+SpyTR+azLOoJxMs5c2x8yNZWf40rQyc2duY1qaPbXap/Gu43jbOo0f2lzo1nPAb0qcCFQVbQOlhl1p0/uFJvkmBaVSDz0CFIi2UeWfDcSI95M8Az9VCkTP5mPmtnPb2fzjiOe1lnhqQWRJpa96WNJLn97vrbOBFvd60qagPWUC0S+A0eiPNgP7zyNeLVS516tgQHatIJ0zBSSgMgQblzSViUYrGpGeCoVidyoNW+Fw9FpFOmUtI5tzFYxG70QK7k2m4TrrB6e8IQqqzCFKKR1BBybdJBr2UKaHHgEKxr6gxWPH6nE5X9mg7FY3IDsVCsaelNm90iGuMSAJlTE8AZ2xelzODmBI+qjTQ5uoss8+EgcKSep9Bi4ePQgopd7CkU4aKFHPzhmcq4Ee9fyUisOOgXVU7qqSWmtYMjo3bVa1cPRWLSb/1QzJpUuwDSUavpk6vwdQEW0HMCJ9AhWLQIx8P4d8PSlz8EOdFv4EKhZ7wnh+CJLPwCk4yFHPTtoU1PnG+SFKwFpqhOGHOi30UyUK7SoXjN/qxaOdgMSibUQZ+IES9aJQE/uUKuJn8vz6p9KwV+DC8cAJRCDGvJ+0KdgD/kHU80ONfnYOoFwM3L1DOKc0KugPoFisr4RAeidU76/xc5Ova2PYa9sXi5Ejw+4c1u2E8eaZurZszR/brAQ6aMMHR+d44fzfWj1zhzbzKNL1pE6uV9CiEQKOySJMwLoIE7AmEv8FPfJBwFFJY/Go7Fk9xFc3KrtTaOG3mjFZS6Ui7oDn/g547h9oUehFcDn1HLKQzlIoEOuhyb6/lOm9ky4HE5RQvCnw4KwXtGD0QZB6/kYQjuZJnOtRqYdWNy5lLByZMwIVi/6ACUVPRULxiZTQLpIU9EycX/vqRmWX4COTljJx2IUq9/qO4tw8ZOlHS5lIpLOIcMoXkozKDFZM1k+kX1HCX/UismbwQrJWoMLRHxiR+JUyu7aROHDBCkefIEXjVIlC+0CJQ1vq9HAJlPudSsO+6sVjn3CEM+cL53G8bl4HLIeBSql2hoLCdyUh/Q5eUF7VsKwl8LDsCUgs2kvi7z3kyHcTTfLdSZuCR5eAVjEkfQIVi15pc/DrdOl6DV4cHfTI56lMKHoEJxSPLgGdQME2FKmh7fRZ+J1CvfcQ5d6v+VOrZ/bM5hwvnD8SByJA0dirXDT+qFPw/WOoZ+P4xf0dwjoiSUBvRDnopU4UeqwgmVUwILtRJWDe7zG8q8F76zV5a32G7oyWkSubZeLKusxcGW0TyNZ1wHD+uuZlmDKtmIFSQ+8FhfRfgBIqD4n5fEwcmXYmLy07ZPlHP7BRSVfFcPRDlIKzkGXfvET6rQ2UCNdKnlx/gARj99BaWksYkkkDMe59Ha/cTwIV9AxqOBaJA3sQpJ5X6hz8UCUKe4IVjrUVjckuhVpoJ3UK2gdMKHoEJBz9ghaOPoMRze8AhiRMmheroaD4W01A6yfUwjpIrFc7qX59ByumtBjrCJ+BSqj8gAclHYVq+JmQ0hyQfP4OSDxtDEM666lTRSbPr5dKLbypSix6LBuYdBWKSA+FCraSAfkZtIj0TJhhe6kT3BOkaOwLVjh6qRSFtVJpt845hJNxwHGzk+rXZxHZ1ErosTk3cPHomzzDVzkuZwxQQOksH5ozVQnGnfBcPTTZ54so/36QI19HEnM/FGrhR6Ai8UfgUdkxPAGluZSQ1lxTRmkIOC7pBCwca6jSsI2E2bUBXOtc2yVixg5N1kZZUfv54EGWRgTGlgMrqhxViuipSCR+By8o+9Rp4idiBLR7vHVkRZF8Y0+i3+0RZeDtg1hnJ3UO+i0koPUHJ53bCDoy6UW//oOo55U2vV+Bi8YjS0HbpzDvG1EK2lOqiB/CjMgfRYLQFqrM+zeDbP5G0M33gOtsoke+LdSo4UcwYtGWOj38R+LAnsI732OY14nEf32o0q8/lXpvBS8Wv4IWjf7AiEQdr5wQZJ9XogT/Rrv7xs/t1+S91TR4bXUPmG6bIyhny8yV0TBmH8tvLRgPwaGLg3V1CTH6/Q1RRGkJOzrlJc+uj+PdARSJXWnz63fAd3XRZ1/N4AYkvaDGI72lZQQWLUmMey7HjLJ5yYnPgQmonyJxWFQZaNPn1nN415tKv96qhyTtAYroz2BE8zNw8WiANPybPGny0GpOY7+uaV/LdWW0vgKCKS+Vdmul0MGeYIZirbVkc17wgnKeSoFYOyhAsrbApJPeYg3lWiLat5CAdgk8LmurGJI+qrTQbgIFf6fQrw2UmHcPPfrZUaWIXgKPyzpCjMtPRUJxKlXRN3GC7SlURJvqtDHI0a8nkHHoExSgWAuJ+WgfyLt5ibRpNFxTlYCkJxAJ1W5NMZXnJyXsDq2iHStIptwgBiVNJPnndb50ncewzuNw4+qcrlw/EgcaYQL6ptKvjwBETHtgPa0zPBGdJez4lLuUmPqvJaU3ByKiHeq08HMbG8ZDePBC0EKxv63O2KIlseFFLCFRIxjx2H8M/fpQo98NxLiXE1jnhyD3tlKkhneCFIj2kfjv7gnjWRCS+bmSbN5bRzb/FY5JD4TY11OI938U85o6vzbSpeAPop4XksxbAqUqgWg3cNF4S40e3k+Z4S1TJqHNtNndYvrZVCcQbSsZlTUWj0z5gY3KmuoEY0/i7PobQDe/862DsCPSbyji+Ssc6aSTMgf/z+KdlGnhlkELxTuJE9DG4b59GLJajM9dYFc3j+05vOtTJRQ9lg5xbYAE4Q+S3Ktn8tTka5stBkNWi8nQnWV3Cu1oHkY7GUgyjy7q9KMV0HCkfauJu0zJittrSmr9YQnol2Dj0gs5+gkx+gVB7vmaPjZ6hg9NS3T5Rz/QQUlnQNLZK6xm9qhT8B3EuLfjpSuS9LunSCzWVjYkawQsGBfUeKSnXBzWDnpMzhScdMpTJwq/0ufgf0oF9wc8KOkKSUBlDEpA6QxFQukNq6F9wxFPXwFIJy11emjrdOc+DZ4afePX9nMG4xSgWLSvakz6BSYivRMnoZIk4c3gxKMtJZp4+xje2Uqbg3YFKJx0hSag8pQLRPoG7CbT9LFpawbZ5p1vnY9CPewZoJjKHrqkzmBSUH8XllJ/gcnn/MBGZR114rB2Og3XCV401gpeMHYIOCppBCMWbSHHPnuHsM7vEN7RB0ow9q4mqXUGJaNzhBuXncMRUI81knpjWN2UiSurhSL3vherqQdrLVE7mJGprWIB2Q18GtpKml+PJOZ+G7+3miZvrXYK9W6zdlB6rRuYf0oV8b/VOl+6HlUavqlIJP6nUbA9FLlny8CZ1fyWsTFsW7mGb60LNfL9ps3vnZQpePOE6b7M3Nh8bfvZq1rX/iDi2Q9kTHoGJyLtJU7B2wbP7a6hW7Nx+uLsGTo0fzXzcs5g3F/gIrL2cAWVBkGFtFtIAio7jRb2JMyuNxIHCjn6LXF6bSwelLWH1VCbwqom/dN412ny2Oggxr0vdXpoP4DxaD+Fgm+aurWa23P2yva1Q2K+XqGI54xBCSj9ZBr2bh2Mi3kAwT1s2OJgXB6ubTY25wtX+0TizUCTe3SOYZysZDrYsYZU0gZMC30Ol67j9M35HsS524ZPzbYBXOtKmF3bwYvJzuQZ9jnfubqmz43O+crRQ5N+n6iyz/YJ291+bv/Gz82nEC/DE9G5gxVUOqlT0EORIPwTlHTKW15E564spp0DldD6AIpCu8jyj8pE4qcqsQjBBmXXAoLZKaxq0lGmhl8ocu/q9ueYNjKaJk/N0+St1T1gujEmTe995Ci49QHj2UWNgTfT5XcbJWp4GwgttJ84C28q1cQbQQpF36CAyHqptFtf5/4XH/vyktG7s0ib3H6BCWetRUSTvrJhWUfYsSlPlVDsQpB9vgkVTEtAwil3sFJKg1ExtbNPTu8PR0Z/VCiiTfTYt8Xhvn2fw7x+AUqo3OXktFu9oOxSpok/itTQduIEG0EKPpBxSTuAIembQAMWpoxqH/DQzAZF/skxcWbYK5udjYmz5x1wXT2VArHWUsIpd+hSQmuhVVR7YEXjHHTZpw3K3JOPRAflB0IstSAOOCGL4JJChuAjU6s06qWdTsO1ghiQ9FaX02yPEoO+pciotVFU1CKkoHYPVlTlzBlBCkX/QAclvWEKKX01pJJ2QiWsp1AgdgutoVouL6iyhiynsocuJ7IbDBiRraohOSd9cnsOoZwcY7fF8rHsFwyaLKYDppsZ1Gj0CF4s9pwvXB1Dt9XSALJllUIHuwET4A4EyUfXAKrNNYFr8k+kHlWMxRzw3HwDODcPVfodZXLrJlMwDQTJRw9N/h1lduugSL666BKwFpoEnI0uA3sUisIuJPlHJ2l6O4Yrp1kuA1S1V0HEM4MZkXUDGpXzUmbY5wDSdZ/wng== ]]><![CDATA[ t7A6KnuggkpXqaCsgRL3vB3aXLMHR58W/h9EPX9N22ZhyjqW29ksTBmN5bbYFw9hoQO/YpDFv7a2gjL5tAZaHGaPPLmz1IpF7VUQyxkDF1LthS6iMlDlnvxDuZd9sAQTG8IAKrR2FhkgvpzQJlghKRtVdmsoVMQ6w5PULBiWEjUbq40vB6XHp7nImDUgYAK7tSU1i2VNQWeXlPhbUEZnBzMmayoSjZ1DlFK6K0pqnWFJKH3hyahsIFVxLsocnJ9Kw75BDEqawupmbWD0u73pW7uvaP3f+K2N2fSt2USUe9sDJhS7AheNfsEMxi5U2TfP7KFd37ZYGbs1LA4g3azzpeszdmna65md5XP2i2NDgOAfKHDgWgsqcK8KGmT6yMSQRrlzFpNQLIRVzSuaDca1Yl4zdmvaqBOHtYYEUrMavKBqrYSItRq6qGYzKICaVSIl1PpQ4mWLPgezWwAYgT2jooMum1LDcyGgqkUQA1KbxOmtIQzJ1IppUTGzNdHh547c2N5PXHg0JC/usSQotmBUUr0WEVBtVQxJrSedWqgT4Xqn0G62CYSTcbpxM49i3dzTaEczkX5rDFRG5a0rptoITDBlKheKdRLoYG3zZZth0mowXovwmvEjyxJl+vUcMJ18hfPYa5wtlqP4Jsv4kWGvbDRYjN0Wu6M4N0OtQJQ3JFAqh2VRQX9pUSFfsGKajUKhOD+NMKQZ0KCcHdiwlBG4YLTyUSkncPFII2kOAjXu1Trgubpo848u2vyrq2pIzh0MGCF7fTExU2D91C55guki8SDNFAruU6iH9lTpop86TfxUJhr7EWWX02BifKvFztSh1UmWXdtqhqN9oUjm7xDk86YigWgDMeLZV7StzLNeIngIDB64BiwKfIqpAc+y0qIJdMPyRNLJMnxmYTBo2q5rnQ+bEUQLayphmJ3ARVQsa4to2IJVRy0VDkeshwGcyKJNoeHFtqCgr4J0ZqFMGecjya+XSqE4aynZnLkSQJU9JJAqcxmAKoNpOUHbUVz4u8mLr2VSwltIAiojaXY7FKpiHfZE1f8jJ+4vVhJ1VCojneOlk51IwX6rdXTmwCraI+jAvKbJMgwZVr6ezfXM3Fm/4YP7PGC7n/Odq3sW7Wogyj5tzNxZGA/r+sDBOnzg9FcX72JdXEQXCK7hAwf+FQIE58CBA3/ggAJvEJXFDQhVcQcHIPCyLw9AmntZDAuUCJuQZRTrIIhYK8VCUZ5K0ShHMKKp1fDFVN7ygqo9sIKRvhGc0/YU9s0TWkOzFAAwiq36UYm18KU0u+1SAF1HhUgN1wqkz1hiyBm6jMBW2ajUVmAN1YJtKVFns7Cgv7CgmLeumGq5sqTOYFVM1F5WStAaWkNpCkU+ZQUuHsV+NNFloCyVQnFOEvXSOmE7+YYLJx9QoVh7eVGlubiM0gx4PNJMqGCaCdVL/1DezVe5WgymjQar4arNPpF4MxKp4OwTaTfbeNvkK1sH42AZOnC6g4fr2wx2A4bLLqWC5QmtoVkai4w5TQqPusxKDjrb5YWslcKCFpNyosZaxZSfShFpqhSP9NYVVO2HLaU1hSafMoUmnTIDGpNzkaVg3bNoR+OE3WYLUUyzs5YUHQQCKrJXSDazSqNeuqrGI03hSKj2wo9QGgIMy55ESfh9CvFyuG9f5m1bc6/FysyReQQjDMcsINHsVTAS76bQr91gReR/AvWOXcu2Wp6FZYEr+SzgQTtRXAgHildNXd0YwmGJNP1oGDSsCP5hwhbfEKECp3AlgWu5Nvxo4mWhbjSGIZ1+sUCWgGINhFxiMySgikXw4lFGkOKRdoBjcnYSPawRtHCks5aIaQMoCHuTKiHtoYspjbdqg4ySRZK2Lw0gZ2pBZtwbmpDSRZGC/qeRj1bwwrH2gMWUntCENAvk2DcrbRrKYldU0PaTFHbYE1VvRWOy3+zFeZm5s37j1/ZzAOdsoEM9G2dvztPsoc1XtTJsTpeO5mHEk7n2gxefEOECp6B1gXNpyCCTt83S8KXJMnVnYjR/blmavzYsr0N04EpFC3jTjgIeVbSAr2U9RP1wBPsax8h2SICLsHvLDXpwdcj2+8PImFsTGjcIBFLnJVQvHVNHFgZT1kXkFMbJGgRQAvu70Jg7FAAFNtvlhbxGZUcn24JjvrEUQG+x5JDDurTQZuhCQkyCks9sBi+pWaselloh8d/888g3B0Xy1UqfXlqKROOMhSNz3tCKKm9BMZUpHOGkJyDRrDt0KaGdWVV0DlRCa6RNbkfKHPQZWjnrCU42Z6VRLx2z97X8BuviZFgvmj+2bBEmYG0ghaFc1Pk38zDmyVMvFGeizr95Ji8ty3+YF7e7vK5uc1iO4Zx2iDMwu2QijDWAgjF7IYERYhwWWCHGBQAVYlwBeAEm1gWGvMEA1WzUCMQ6KNJvXholpBvsoJS3rqBquQ4wne8oKmyzKS++lRCxfIWzw65wX8wAisI5QxdUrNUPsUz0CahloGNS3kZJYZ8deXGHUILamTi/to5gnef52t09Ybubx1Bua5PX5mHG+jwDl/Z9EOvsnO9cHfN2yzBkWrDr2sdyMC8RvMKEDZwDhQ2cCagB9+FDPKjGAP/CsMUjeYcFutTTwqCFhbjqzWAxgLYXjJzc4cq3BRF02gd2IMgkWFMKxbChT0GskWZXFpIUnA+ocJxFZFEhe0DAhLaCFNGstyKD3vJiKiOwkUgvKKCx/uJy+gl3CDH7PIVSx6n6RE7Qho+zLienHao0sTeFgvuBFIx0E2m4NsLk0k6ph/OGLCOydxIU2/lJCftDlNL6QpJRbYZV0fnDkVEPocajLdSot5WhM6uvZnUWhqwWgxnrX0eXXnrrCqrWZ1Fv5loTMPAGCbT41oStq9scJsNHpp0BPMNe6+yvKRqOWQ9jF2I+n3xf1zq6i7d9aSh6wRWxgMvlF9e4xhfY+EbYt8mV3gnjStthktZ7q8UGneXEE6tU6pV5CvNonkU8rYYFSGThpOzwdVKAdFoLDFpDAqpZDAagZjcoQAKLRQCGPLfExyezwkPe0IUEFmoEo9xEiigfcQ7SRpyBdFLoYB+i9OtJnF66CgalDIJLKp2FcsLTrSq6Z9LC/yUsPggsI+YGNihlKhSKPkhx7+YJ09lFlYHdhts28zsbgkdwYIFTSWVxrQgZYNJ82I/knnao808blBkYBkGKptjc5cWspUBpWNBlF+zItBCMAgFahKgPAETsPsARMbAxkK8MYxdfWgBQ/YrgpRTMweqmGAYAkBDbUAAVYVdNQsOgVChqlUK/M1InoWygRKK8RPqtizr/6C0qarzWHXcGA5hqdRrnskGYe7KVELE2gwGkWibT8EyEOajdgIBq1q6y4rMhUVEWYopqX7oE20qThLfU5+EYAtVwWZQoIRkPoF1ZzNn28xksy7+4QHANFbb4l4cO1znPOVjwwK8WZOAgMnjg9wcvviHLAv9eXD6WetgYvvuL32EeOBgGDDOEZyGinECKgDBGAULE2ElX2djKl9mYypc8RiJCNkAPsRAKuMgqiEGpTTAjUp4wZRTbYQAosHhMgvzIH1TIuL6M1hWofGotTOGku7qcdrMmLu4byou/VqTGDQZlRL+w5HP+eiJ6a6hSKidw8UgDQfrJPIl4sxSJRvmKR2cWA2updoGLyNpJFPwvQAmVbSEmxkA0Ma0ZuHj8O4JzW+5nLKexX3ybDcPp1mkzsJLOYU9G+K8pJOobQDotp6ClgWPQ2sC5sjRwERm4+JjXByJU79fZGAm2UYoCn29sABZr3AKETipehx4Xex5wUum4fmYIdqgwpgEi0ABetIMJfJGx4x5hVAU0aoEo82gDJQxprdbQbLZLChowSJAtYw8mZYRGkNxoUWbYUS0KZ6BIwKyBFIda+4qN2dAGETM4IzduLCKa2qNLL3202aWdTA1pC1FAZQpMQrVDmH21DuFcXcQ4eE+NKtoHRiT+p1LFOSmUUE4SFax7GPFmGTwzbMycrZWZG6Nr/tpmna5dTbOHNvMvsC6elaWBNyXQ4h5AdMXMmYnF0J190XTnRDjRgAzhNb4B1sdCxLzGOL68xkFChBg76RIx/uLBHgeg62vcxcOEMY8OV2MSISIgoEQIrQKM+OIwXhHWYfwiLEKWUTAEOiaxWEc+sR28jJBDeClBU3gimh2qBKRvAuXkos+/2eoIJjYEAkrMWQZsaiFMycR2UKCElp6SwoNZOUFDjWCUl0YPtRewpGI9IDBCxlJ5IZM5keHJWF3YFHx8zkaPgFufbp1ZEBdPDYirhxZzZpPxLQ1fHEKCC1yBlAR+Z7uoZjDKVDUUeRk2jIPAwOEHE0/bFZhB71kp4v+yQKkXPOEUAcNme+BmYBl8RvCBkDB2AUIeWwEhN14gTG8sAKzfuADZxScLdPEPL2SKQljH6i80ZAirnNmkUELtFgJMiDEWYd02KtFi01RG3BsMONUyoCE5V1jCSWuwMjofONFID032+SHIwD5hFbPfSVDPulpJ/4EViPUBFYs01YtHGWtVU1biBNNcKybGs7A+8CyYN6LsI4NKJXyrPefC8MWzsDpwrgwiYuLurE6hHC1jN5ZdCg3PCWhMancK9bQzemxiQpvcsK1xCbF6rAPbFUCXmdCABOZ6rKWLw5iVy6dHd4uDOaDiTzlEnMkmiDvtDHGZwoIYw7MLRzcSOwyhgrtyEPXAhCoDZSkTiTTXFxLZPCU77q4QImONOoycfY+sjrkpoXF78KI6L4F+6yfORE+lgLlPaVFv2HIqY+no1EKIkTlf8ejMPuChmbXqkZlN2iSkr2Vb7bXstnkYtuYiurD8QgUuDmLDhx1GOVqpBCC9RGKQNvr060GZerORKKCM4MZjdoIWVbArJqNgUSgqw5ZEG8WeVCPFiEy/XziWeB6CToA7TGkR5YIwbuHhwniHhwtjHR6qxio6FC2B3IKZNLviZVsGOAYFSHy+muLbDA6uXVsD0QtvlwMunl8RvoyCScloxDoYcomtvdiQ95rsGKszMoMMDEvqjF2bdkbvLEszeKY1Iv2bp3AwZrkMkELsTIuNzrbkxRYMSop56lRSBmIU1E61aNRyCcBEtisAK7LYAMTICh45YrdN+UFzJbBC7KqGZY10KIg2NPinhlMnZ8Y9fNDypKQHHMmpAc9QocLP5p7YhQKoinGNW4BJSIA0zAGWzDAM4xYiAgGwRe6cVNL1hFwCJvTyha4CQOqHoBlfrh4YfB1qRrxtzaSyVZBJZZMQQ7qmBUQkEcPW+EgHtPEVML0tTui0Lz3mLgCsyFblmJQ5DOBUtmMF8vOwJKk7qwl7AxZR+sGNyboDllDPZQXUU6lA9DR9Z/TN4FsILiN6GPFmKx6Y2W6FBu3WJMe/2qEp8ywNHTgSggo8KaoCT4qawJGesjg2xFcVjMZugQimnwr9nukAvpldyeTOybBiPLvhAycLAWJmMC3EhAOgEEE2XhLmx1hC9LGXLrUxAg== ]]><![CDATA[ ItjGBnzRYy0gFIxZcKg5QVeB03kt4BsSMHEEPkR8ht/syAhxC1cOdCzxvAyYYMxiEdGUOVxBlbFSRnibigsvx8TGthDIKpkfER9bugnqWIVVzT41umgzgRZ2o02uFktJpjbLZQXdoUuq/GBHptZptLDzLPJhGwThDPOQgBlhV6ucWCLJvpvX2ZprTQDBvba8iD7/ZNvLi95tXb3BUJjYcl+A1PYAcshpCvyY97gwocNRuvTMF1nUKm94KVt0MoAOnmKAObBKAbTbsQC6LoydbFgwtrGFlOUyA0zjVgLXZh3gEIyUeFKMD5+R4TFXR0/cTkQFHUu7EECbfWI5iHNaCl9Cs3tLemz3oOjYfilAoqbwhJNeCvV2n7BeDNxW5loxrxi7sWxQ5p4MYgAptGJcWMg1lRrzhwLECJuiQRn2wIro19c4B1iGcQwRSzoUvRgYcNrlx0fAvl4MmC9fbEED1WTtE0WNUtcNAuV/2NJCbAaP7otbaUXgHjJI+FH9A9HHUUKAvygwEyqQwPw23hJmj1lDjI27hLAbIyC2HRvglWGMhEPPjcEtmMWuxbUNFnAjGSB+4cBTTuodhwxjG15mCeyYzarM8FwGmM4brKDKXAqQ0F7wkiq2tzrEhmsF0s+m3OhxrDnsf2WFl9CEsp4BNNPyPNJpQRSAhHzhACTCZPrMvvjHgmBScRgmGAVKL4SCxXeNgYSAenEZgqewC0aTdwcmwzYHVmS5CAY27vH1t4WLFgzFSw3J48uWs0SVN0AjrHWHcY4QRS28IXBE4z4U2Sj8YGGM4wPYuEkXhTGSDUwIOFFBxwhilswJuCzuJ6IB90rwxLGIkPgTDxBfsvHhSjE9HIjjzBSs6vEqmGORLHcjDtaymvVF3cCHY511hLLm8OWzl12Z4Rt5OCkLBFLktoO8+GJLVtARbnjKC2xIylZEMrP9Swz6AwKqMxaTTqyTC8WwCAYYEeJtPAXbNzYg69XChU4jwJHsVRZRsCUV4bCqKeKwD2MbX31cBAxufEUMcOxFezZ2EiZiPCSEPC7yJY+ZhNCOn3iljQ/4ohsHICxuvECYGQIcqMY1MARNeaxw/Ry74h4rilP1CPEersNj+EzUThIPe7CgxlHNqwgVMPt0Akx7QAB1HvPywnsRIJWGetH1P5NytlIp4LfKQUlngDIqSxiSSdfwrXXO1aGLS4CwdX0b+8owhiECsUoC/VGJAnagAbxo68ZYsGVjVrAO4yIfrsYwPGSNcXTw4yxdg1cQkAlxfPmVj0q8YsIjmpXdIiPElUz82MYEEME1zsIFYVxka8KYVYM9XqArbVyAEGhjAYSYxwh8kDBGoqFoHDqBh8qihJkccVkcEduAZ6umeFYRE/fhPDO8hlNAEJXjmdcB64DRMHsLjXp2MsK2sjFZz7yh1VxE2JdnCipvoKNQ8DRTWFnbLDHlzdvFCi02hpE1ItENk2CAEV9o4yLZrnGPEDSPah5uKuO8lHg4fiAbYxERxnJAjTYGQIh7vIAXdoyAB7DxAh3cxgT46mM1ANZPCQG0dwBIgBjgEQHIXhoH/Lsv4zDsuAAdEox9YPgJQqkl4wlHgQvOWjwsZ/E4Dw+4GAQpHiEpiUflBPEnGyGOVBPEf3gOv0ZwMvD05XMD5uORcOTf6hHPyCTgsJQr3a0ASLT3eAi2zwsTupGKAf8SB5YzzBpb0L5KqnRBJlD6nJcn2rLxESw9JgIWNl4VcTUu4bUAC2jXAgGgfujjKF6ABUBA26eAAtnDIAj8SRNU1LgLJCCXjbeIEBs36dowTtLBAAJGNeAA+dOqkYEnAaZRjsB9hAW8AxUV51pwgM9XCnibBQY878MCXoit4n4dpjhcFhQnU/DEsU5M/AEQEX+yAZLhSDFCMY12BrExkK/BA6LUdlF42G1KZGzvLS58GQI0etkCML5YAkb0rQOQar8MgGJmU6CAj5eFiA8zwIqZCkhkGBWrZYglIo0f/DiLFxhIAl3vSwGwZOMAeH0YV+F6MJbBQQkAmVtBURQv8Kx6LcyQiNOCsdxeccbfIAa1LcJPk0YKBsYoLmiNkWjAGiPZohrfwLA0Vq3As+QxK4bEGwQu+RvwQ3kBN5QZ8DoNB3gYVRHnaiLiGYyKuISiId4gp+jKZywcgILZ8xiQUITBtAm4mD1riduoktu5BhEgeBgNljmJpGsJ/pEq7v6QcWn4g7MyU8ke3/hL1o9ZQ/zxlBDasRMvD2MmHg6MR2wgan3MADU2gaHCmImGqrEMDTtHwhNqdvRFsAkyiKXjRBFLp5URC6eIIdbMjcEGMjP4Gtj8CEO4GbL4gOaHYpXMC8EFfFLtAPebqXidhyrupcAAZ/CjxJNqijgQD5K5MZIJChrS3SDImoC8yR2y5LN7xIul4BBWykAiq5WDQQq49PaQIe7+kFHJ9UGjkusjBqbiKqSYE4odZAwuZYZAEvBz4wPC7MYHiG2NmXBAMH6x9WNk0YKNDD4tnSJerR8skRKCtognHB0AtMKBsQwMDcY8tqjGNTA0jUlYGOIiaUHGRh0EvocBins9HfEqHiHuNAPEi2aAeJFMEFeSGeJLM0JAnCcnp4j77NDUhbCax1w+WIaFcEr6HeES+VekiGglE6+lEC1lnaqscpqJOj41EXOIaqZCiatscQUNE7VJ3OSJ1rVCLlr623gLmNr4y5eGcZUNGMZdtpDGMSToWJF8EFOD7Ypr0gy44xcDbrc1xb+DJ04veOJgB564BCQlDiEoiTMASuJVQEmcAdASt9BkgGMRSPGzLCne1yEBV7OS4hyUkviCHiLOFPPDkXJoaGL4jIGdoiAgiBkujIl0iBtbESOUQqWbLdBj/jBuIdY1LgDMbIHV7CWhjhmY3R5ASAt3GBE/3oCkpNRRaAhjyhhgKwJasDEWDw/GPTQgFWC0AtNYxgScVkkrmyKED64v2BrwUC0D/uWi4m0PDHD6wBIHM6DEMxQt8QtISbzCkRKPcHTEIxgl8SyjI65lRMQxNBnxDU1HPEPUEQfh9MS3mJw4Ap0kDnQN4jy8h9dIcIICG0cBIQb3MNE5eMRKaBdJls/AJgiACjbZ8im45ErnYJJWzC6QIZhfHjkyvT1kXB7y4KRkBKKYqApFDc4AAAjLGh/ZejA+guForDph50kkVoyKtwfcUQwBj5vQxMkcFPEOT0V8C6mId0Ul8a8ESbx2wMTvB0z8KwqJe0Ud8Q1LRQ16ijhTjNDRNYgLcSCew3n4Dc+Zufb9Kr0sBRCrBBP59BRUUgQUsLULJyCTAyT9klSpFCRCg7K7g8ild4eTy2+OI+KwDRSWjjkkIUeVzBXaoHLHjbmEZRg/2WBgjOJCDhPDrCsKtSre2PXEK7+ieNdCFIezeuJqDJx4WZUT74JC4hCEiHgCHyH+pCPEn3KCOFSOEX+6KeJEVyEexIOG+A9vqhHiBmSKOJRNEXfKGeJGMkF8hzc4OpIap8hwiMOAL/YaOa0MLOKEMnC1hyYnlDxNxSKQYi8PG5feHTtIC3U0AS0sIIlnIowak5U7wI6gQu64PrB4tnEXMATjGRl6pChqXUvHHPBKLBUH5GLif1xL3A9DE/dukOLfDlG878IUf4MAxWUDTfwCURK/CjriDXKKeAIdIk51U8SVrkK8R4fvcBwuxHk40jWIP9EU8aIYIRoYfkXqOaIw/sFVyakED7PrY4em4JEpmoNGsGQOrk65HBSyetn9IeOSOwSGZddHEssukCGVjj4WKSl9hCNBe+zxCdlCW41XMQwJILLClcaZFf+cEXDOjoAzfknxQQ1PnC7CEid7gMS/oo74ltIRj3BExB8MFfEFOkMcqiaIG117uNGVhzddgXhTjBBfigniSdcgjhQDxI+uQDJXEAqkLIyZbJhURIKoyV39ARroZEooN8mU0UEmVEK5S7ZwclenWAquKrHs+nCS+eWhRDN8owBLxgI0FVWbrK2NDfiKMBaigWrsIsMPFkitmBVoV1yxCwGPa2CA21BKnIxK6UKQEK8QVMQrAB1xraEiXvVDxBHsDHEGQEU8gc4Rl8pJ4kc0RPyHA/Ed3nPlMTGcpof7cCDeA8OvYlhQ97gAXZZhIKSdXCJLPAWZeNEEXNIlU/CIl0wukSriQSA6NAlz5Ogk5CGkE6zDyWa4ACKWjDU6HUWN0B2ugHKWNuby5WFchWuHCbcCx8Q2+ICExLmKhjhYkxGXp4z4bCCJ/wRJ/O3KAFe7MsDlJBzgd5UUv2CUxBv8HHEqnCNudB3iPTgyNvx69bEZ4hMgQF0h37TMxgqEEHOD4LDkAvFh2fXBxHJwyBBx14cNS0IeKcSEQkYxDX98isNCMi8Nf3CKvT1kWCb6wLRU5IFp+WiDkmujit1g/CPDTpRBClzSq4rXB5Q4iKchzpVUxMOijngW6oiHQS1xLqkkfkHpiF8RKfGroCTOIAeJG5gp4j/c58aG49Tg8Bpus9UgwdZ4ygZx4ZBLTS4RI5fcIDgwu0F4WHqDrND0+vCh2e0RRJNLxEjn14cRTW+PIprfHUE2D2uwsFzEocnVkcWfjRMQ8ZOlkcJV1GPBgPYHvNtBAf9UT5yDkhF/oCPEq26C+IKaIE4lM8SbZn540tWHA3Ee7sNzeA/f4UUyP9xppmiH9/AZfhPTE2FsRINmV8gNT+7qaqcgktZQ7pItpF4kXUq/RbSYhoNsEf0GoVJayKOVFOxDyiVij07LQhsrLhV3aEqaJolzRAFFrW1sBYxqPIJDTOpYFkd7EMW3iJA4BB0iboUjxB3sAHEGOUC8QY0Qd7AjxLGAiHjWUBGXEHTEJwghcQg8RlzKpuiH78zwGs5hrjwxRvzuojBVZbRD2ngBEZeVrX2VgkxMVPKxtooFhfSwBP8wtQwDObUs7EEqBgMJreT6oGFZ2ONUXMoK93jDy1jjqgE2pqQRryViD01LxB6a4sUelFweW3qDMY+tGR1sE7gXQwL+gciIL7j54VAxPDxKpodLzQTxpqsPT+JAPIjvcCKYHr4UM8SNYH54Ds/hNByHx3CZmAcHFHiNV7siUWBBE4ORYIoJh5BaPh4htKw0MmhZaWRQXNgj1NLb44Xmt0cBn10hq6GEPIp0fnn80CTUcQOz8AaKS0Ubn4gnnqSpjREQsTQ+tQDjaUPgexkQcO2BJ34FZMSReA/vseE0nOaGx/CZoJ0hfmOwusdfvC4NgXRefnvMuOz+oIHp/ZEDc7DIks7uEFZQQh+snV4gTja7QJpgensM6STcscRS9Mlc4g8xJikSO0kWUdL6xlm0VWMTHWZQuE3gb1oJ+AMfopsYPqPDc/gO1+E+vIfjcByuw3ForjwGhl+vMUZHSzWSfFv2uIuX2AWXM80vE0/Jvsm+JU4m/5IYqfQOGaEpaQQsHjGlDdNyyR8mIxFFS0MgmpiMRBY1JY2AL0Wf0F2mSnmzPI0Cd7ko5LHyC2SEY4wsZYNXEJA7jJ10uI6WReBvFKg4h6IkHg== ]]><![CDATA[ NfPDjfgOD+I53IbbyHCZGB5Tw2s4zZXHzPAaHsNnOOc3/Ibr8J6rEY/AoMH1T21LCIUhV4Rxjg55YwBgL8Orn5XdVRPiQSMrLL1HTi8RjTxiKq5CZkoe+YoVg0RafnfkwCTE4QPzy+MGZjdIi80ukBmZhDtmXHp50MAM60hxuYijE/KTSB5gkQPmD2MsXD1Jvhc4XwcG/MuAAS5VQzTDOYe58iuP0eE/XO1rQofxEBB+4wWycGMuYX1sJYTa2MsXoxAD7ErBIlYwuUKeWHp5yBB3f9Cw7AJpIe72wHEZzuHCMszD9BLRh6ZlYQ/Sy8Iep5iEOXJkXjLp09Rcwnc5IkpbZQFRzh6RUNkaarHS2cZevhKMTXANSVnMwOEuKOBTNkPchuNwGT7DYTjMlcfAwOxwIN7DhfgN34nhNJxzGG7Dc/iQjhMPYQGCko5LDnHjAYBVdlspIfOqJNmEhMJdhDKA3hglAN4SdcqbZaEQTXE3iIpKro8Y4u8PFJuQRQolZ2gp03w8Ep4cBHKDUnAIDkvCIKmW4B+nlF0ePSzDO1I1SUR5a2zlYqeNmWC54y/y3tgLliiJIQeOhsWAL/gx4kN8h/NcaTgPr+E/MDV8h9dwGy7Daa6cc875lcdwzjnnnHPOYbhMWU5iO3I79A4bXIQsKwlOWA6sHjDAgmAloQrCVQSsrCsHaA4epGlVYamVSahSc3B1VWWGhgah6sxBWtoDNKu0rDK0NDWtLDMJDiREqLKyclBWdfZA66rqCq3sqgrLgQOrrCwHEBg8iFAXQkIEBlcQsLKsJDhhZWE5jUntUNBKk4DlAC3tyoHVmYOqszQIWlVWZVhXVVZWaA+0zrSwqOQyvDIOe2XYMjY6uK20tbI4EE5XD0BspaHNnbXJyQ2cEEhQu9JCK7OKcPYA66rqgZZWWZUECWhXVQ4gnEWoMjNL00KDAMGKygmu7OoBAwccQMh4dltjDqxAbFE5UXBCMHY15mCMymmCEwcQcggRdYOvHbs0vLsy7Id6pwyvjAOaHJeU1LjBCx8EuYfABOPHumFZS5k4pNlDm2n21ugDJh5nryioXUQV1f5VhYX2AhVVrFAjYJ+hWzMSB25AMkorbXqFKvlqBDAaZwUzIGeoU0UDoIndaHLwQ5ke+ioVjUye3ZsI8s9O2uQybRJ+Ici+z5M413XAcvVPpN4cVWJRQQtIOgmzayKx6oSjLbQI+H8Y8xCMWLSnRiT+KFTD78hHU2ASqhXRpPRDsHFJL312fw75mDIJbSHHvi8E2afAxKNfsOLRRyhgk5agQ7N2IKOStiqgkoZgo5Ju0divCqD0Ce99nUG6H8U8CDQsa6sYkjAiu5Qq4jeaHPxJmF2rGEGKf97H8G7HS5e0OTiliviLLP88UaVfdwIFfwUuFr2UaeIXguSzOblAi3nfRg+u63jnvJMomAiT7ws59hFFCvqkTW6HIi20pUgVjSoBbQUmHj2WjMqvAEWjjRMo53cK6TrTJ+GPQj2kyUOrb/zk+s73TqiR71OZUPROn2F7Bzz3ZdrMaC5nxTjWC2yGTo1O2hS0FZxoPMoM/DlfOK/k2fVNo4Q+qHHv8xze1Tl+dJ/p0/udQL23Tzjv1unG/SDGva/gROOfKm3sTaBgpc7BX3TZZ+d84zzOoJs3kPq9ulHZpUoR/01f3E0gXM0EWtivdmDKEXpoyhOCfMpUJiJnJ9LCnoTp/Ume3W50KehARiWd9WNTdioNexo+NhnGrYPRCJ7RPYd3PSuHuF8Q8llbvRAnib+2VKpidwot9EaSg75I/OeHIgHrJ1JCuwk07H8a7zxNn5occ3drZ/rO5CjUQ+9ARiUt4Yen7MBFZc20CT6yDOTSJW0K2gdGJP4lTm9QJN8DHOJZwhBPrYUkokbiQP80CnYCNWwKJQRS1NP6oVl/NUH92SSp9hYU0blKBeR/GgUrUMH4KxTxnCkk6ZwvsH7OWDsou4IUkJ1pk/ADNeYtaOHot5iE0hOEeBpRBv4n0cJvw7KGKi20hR75mDwH76oUkn5BC8ekzEGgR71uhAnoj8SBRZWBvaqFo8cqgNJHnYLvHME53xO+Q+IU9D6IeJB9H2cwrq7xU6uHKPs6ghWHNoIUil5K1fBTmUj8EWxU/gOqhjqDdJ/HsI6H0O7X6LXVPYZ1Pqlz8CMowfgZxAiC5KOTMLt+53vn+Z+xHESXCBk3NfrqRmW3kgH5s3pUdqNLwDFsduaOrNb5ztU7YboeJKlXz8yl0USSgD6Ice/P3J31mLSyCT0u/RYQz48ghaLP8cJFCnqgRD07ybJrS6kiQqAhriMDr3RM1rQTE7aWSQmv4QloDUW6WIt+PYQc4rqCkU4aAg7MWcKOTvlD62ntgQoqjQBFY68JXKNh0Gaxa1rH9oTxLAjhrKlMONYGRgujTg9dPP4DJRi7k6chVYlFGr80+hr3szR9afSS59cvWAHZG8iwlLFwaM5TqohOnuAbyVLwJ9z3jyYF7aoUjz6BCcacMNwlYI31Q1PewGo6Q6BhWRsgDdtJmN5PJPnnqUw0dgQoGqFKwzYR5N+BVET7whDObmGIZ+3ARY7XjcIRzRrMien/TlDcX1NKDE3u/Rk7s/oGsM3veO06gxaOvmvJqMdQBJRm2iT8R5eAt9Ek4IQgmHUVC8Z7ChWHuB8ocWg7gXrvJU7vlyIRthPAOPxImYPeB/EOCXPwX92Q9BVWNfsCFo4eCbPrmzjD9oIVkFKqiP8ACsNvpOn3Z/rKaJm6W74ZbKuNLAE90mXXK2DhWDeI8fihTMEzcGv1DJ4affMXV+sQztU74LvaCdX7sYZczgxmNBo4LfxQpIY21Cjib/ACEuaWszV4bXVTKOHH8oFJY92o7E6i4F/jp0bzLTbLs11ffEyrvbbV2hwvnPdZxKuBGPe+E+nXBlLM+zJwZPTVbZslovT7E3Bo+gYvGv/UCcNvw13rVjMcbalRRLvBC8jPgAVkX/IctJc2ubeVDMi/5QS01mCElBY7crpV+4HijG7GCzU3IDDKskpO+J5uHwMYjLYEIZtzBB2Y9ITVT9mryol5TnLiY0giOkudOtZG4sDfY3iHIMWijyI9tKdSDe2oUkRfhSKyI1BtRHBCUYtH55yFQ7OuWiHZD6Q2DkHy2UeZgJ9JFMoUbNvIrKtQRPYn0q/99BnuTZmEt9Km9/A3lX490SZfTfOHpqXxU9MymXq7VhJPbYUinrMVDEmvpPmFcKOy1gHHIWUOIlF2a/LUPPdYrYzcWNeARLTeHlFx205U2BykjNYLVkD2HSZQ7zeq9LsRoEAswVg7hRZ+I7EgkphrN3jR+LFyTPosHJj9SbRwiLHv7jmsmypRaGP1mPRUKhC9gVJCWwmTcOjxz/Ow7FY0JusoUkWfdPn1BkYLfxULyD4hCGZ9QIXhD4rM+zaBaZ6GD63e+coZGDX8ClA0/inUw51vndfp1nmcwbnaZxEPSpXQvvoxWT+4MVkbOC30R5qDfemz66VOD+0pEodfSXPwxgmE6zldOaNK7pCYr8fEkWn5TYvxWivGe5jYNe3PMna3TCT5F2ZEdGwDEdAutLh34/S92T6HdzbPt84uigS0afjKuozeduZlWLCtJJ59Qo9LfyHIpl/QYjHHCxeBB6ecgZVUFrHE9INBGdFnJSVsMSOntwITj34mTo0+yvS7GcBYtJ9Ev9sn07A/UIKxK3DxSEvg0TlbWA2duZCE+q3Vz06lqsi0yd3+GOJtgxT3bCnTxC8hB2bHmlFpS6EW2k2h/in00DtwIemvaGDSWj40aQk8LmsEJxSXNLk3DyHdgRGJX4IOzRorhqWnIqE4laromTjBP2r00JYKZWTkQ2CD5mmkk5VEud1AamF3Gi3sCExA1hOIhGozSCnV0k9G3B1aRXsEIZmzVQGUdNEk4McRnKNvAN/qnC9c3XN455tAw1e1muZgIsBw+uJsDauh3SNBLfNaMmqDeELaP2AZ7RSGeM4ZinD6qcDPBOptAGOyrkIR6Y0mB78PWM8fTXZ9VYpHr9XD0jtwIa59CvM+Td1aTYOnRut45zyRZN/tBAr+UaeIfgr10FagwtFTlVj0RJB/neD7gYxJfzVjMocL5MgUyrUXtHD0B0gc/gYtGu1NwzGmTMJ7aZN7BzHufSNLv5vqBKLtQEYlLQEIp5z1A5NmICOShkI97EKVe/3HUY8uwgSsDaiGu9NnIU+Yjslz8Nb50nUbv7ZaJm9MvrL1MBizbFjM3C3vENZ5nkO7XuN35m0E2Wqjy0ARTEZtBSkg+xFl4D2liuiNIgHvmTq0mucw7qb5O6thzLBivO7gJeTo90HBV7Qx7TWtzt4AvtVOoob1BSWhsuwEhecgZZS2mjHZoUQVvZPnd/uFE5LEs43EfveRpNdPpSpK6JFJZ2DyWWfR0OxKmIM3DZ4aLdNmRtvktX2dwbkEKRJvBy4cbSnRxL902d0aSQ5+J07DqwIewLCsnT699w2gW5eRO6Nt8tq8ziDdN5Ic/AtUKN5XBVB+BSUiu9Pmd2skKWgnRX7tqhOOtlQo4qagXeEJ52xD2CbP8K1hawbVZh0vXY9KPfQZnpjKHryozmKtqt/LSqm/sITGAkLZNbSK0hWEZHYlzMEtDqDbVgburA4q3BvDqiH2X0tMbQgxKvuCFor2BSihMoUhnvODGpQ9aLHPO4GCrWhMXlASKkfIoTlfCOJJcx0B9RWCbNZXNiR/1AjwH4r880aVf0uXYPtpNCzmTgCyaWQJSIg3FhUaHltA4rFGr62WiRubYdZmLEyZNutziGdf0ZD8DExsb/L4sjd9cD3BCscQraZ+i7VUPpCCkTbQ540w/zwVCsS/gEWjZ9oEH00O2lSpi/bRpKBds9dWw5TNYlwLwotrO3jFwH1ZaXPwJ2Dh2I8wBb2MHZp8dbOzNH1q8lFm4PdpzKNn7NDmnbBdLeT4569m2yyXw75i4LZyjWAaDbM2Y/kHESLmrGy2yYuzCWTzMXDbOQZuK8eskck9iXWeAhRQrReWETUEHpbzUWbgt+lzq2vy2nK6cVGnh5SBClw0egUuGmf0zOor29fCoM1yjBsZXaO35mny1JQyu3ZSZXcLdLh3G0EK2lClYZuqxKJHkGLRL3V2afjSekycLV/ZajmmbYyu0Zu7ixoDb6ZLwm2UqOENFVp4P3EW3lSpiQ4KkKyXTLv9Omd/8e2XV4zm4AQimjWPTXmKRBMqmM5CsqnlslI6h0U5/X8Jia3WCOpNhbpoJ00Gjh1V9pHldN9uJfHgVsNqaM1lZLRPnSZ+oEW+rtTp7VMmDj2CE4ofK8clvXUklDbgmZjF47LGonHZPRQh7WFJUG2uIqHeSgbkdxLtbokq+b4TKOFtQQhnv3CEsx8YkdhDeGcPPfr9KFJFTzWC0Sttdn/OoNyfmUOraejQ/E3f298Bt5Hl9MGN+RDq2UGMeXdNn5rnNIgQnAYxwvAvZXZvGbkzmndaCw== ]]><![CDATA[ M1bT17FecxFdX3xDhQ9XNluGgIOyg9BSQt5iJZWtaEx2BS0au5SJQ06upzpx+KFOC4MU//ySJREj4B2ztqU59isEp0OI4GVhYjuHc/7qx2RttUOyNsIM7DN4ZTK3s197aFgYtR7Gf1bENc2DcS+L6FowGbmyOYcQrpaxmzJN/Fc1NOkHNMS1lCriDpju53zlOpWLwg+mBdV34GJKT6FATLoctI8oA28ix8CfgMTh2AYdn7eWDjFQY54B0ELbSRT8Y+BumkYPzRNB7o3xhOdq/M68kGLfbSTpdx9FCm6PxH/bI0tBmymT8Gbi/NpEk3w3kOOdXZO31mXitjWNHpofetTb8oTnbhk4snkmb0voFdwKNQL6oMi8L5M3JhNlAs4flIx6DUlAd751niYPrZaZO5N7EvPopVEuhBvi+mk0zBOms3O4cDZOt+0vYNH4w5ag2ltJPPuPYd6/8ZujgR71+pSKw55hCqkMBmVE75DElG7aLExwgvFXoYD8WTPEdoIRjjaSZNdeuuxugRbzDIQW2lk4MPsDGpQ5XLp+4zdX+xju9aVMr41Uya3hY+szd2fdxk/N1+Sl/Zu+tvsGcO228Uu7b/7e/FXNyxzL9cW3X2BKn4P+idbC2D37gSsE13qB/STq+QpFPGcLTEizWUE05w1RSmUOUEbpBCsSPxHkn+TevZTZ9SnM+z3hO5m4s84/FgtDRmdp/tBmnW/c90G880ihgJ4KBWOXUGTSQ5EA/5k6NC0M2QwGYyZ/XeFsbA54bgZ6zOs1f27aqxuZGA3fmraJ1PuVOgXtGj63L2XFZ0MiY6vBCZaVxJxk9CtJZ1nX6ufYFGni/XPI53O8czWSmGs/oEHZl0QFvT2LdH9qBOE2wg1JuymUe+eA2/6OoVxX2gy8mTq79pLYewMt6nmhRUCkTUDb5q+t43zdfBbp7KkRhNsrG5KfCVRwaxOYZoTDF2fjAMp1rtyv2VuruQ0Wxrd7/YOWVNqrSWq9RJkTOGfPxLF1ne7b1u/mL64+Egf+KhiNXcuHJl2V4tEfZQISif8mHNls8zlhOdoIM5C2EMU065+08GBKTu0HM8T1AdXFLmFHpadSTbSRJAPHfsJ5t8/h3JhQ5J4tFLlnD0HyYd24TMLs+ps/uC7j1ib3GOIhVQYCNdrdOV43WyZuW8vEldUzcWc9xmyMjmG76ytan7mWgwgYMy02pxCu9kmcgHdUKaJXwvzaO166T/TIyMRZ2CX4ANWKaD39EnpszkKPfF/HG/dp8NA8jl/cznfOpqljQ7OzVzWbjnkbo2382siwYlGoiR2syeidAQooLUSp569rY1iZvDRs0eZfjZXjkl7gwhFoUm9uOg3XUScOEZxwrMGanNpdHD3Ozlpd3B2ukCZNypE1BiietIZWUdqDlNEOAkqp50ry+a9oVHYFIxx1uHZ9KlXRV8FohEGrs1e4GlsDuDZLnR7aHaSEeg5LNm8Dpt67JjCt33DXOpJm4G8KJfxNoOA/9PjnkcRcG+q08OsQzvlrm9de42psDaDazKEV1HNwwmnP5JXRQ5R7n4m0y8T5tXH65vwOF+8TQf7ZhXKIr6vbHMZk6u0bDBihtdFuLZJm4J/ZQ5vhWHNVEe1ZJ6ZjYVBGeA+tpX2DFNEDJxZrqNKwraTZtY0yeRiHrpg5Mi0tpUUfzCGEbC2IjK0HKary1KnijxpN/EKKfTcPV45sqFFvLOoUfBtNbkgSWotgArqtUORzZvLs2j6Ge92nEO8bUQr6KNREHa+cLRNX1mn2zH4S7e4cb9vNE567r2+1Ngaua2fw0rQyemdZHDAbhdVQbVcV1HqGgsJjl6h+D0lEv5Rq1OmhX6DC0fd48eyZu7N+E9iWREn4nTrD9k9j3ZwazUNIR/bFeMd+cRBcHngXFwggRT7PQcpoLQEIp5zUOfhzvnJ0T6MdvfT5ralQKHqlTW/3/Ksb9ICkGdiQnDd8KYFlW6Vx69mwcaa2OuPO8MRURrBisaZSsVgvwPFIT7UwpK1+TM4WpHjOUicKfdKn4JUQyzkDFFJZQ5LQmksJad2VhPR/HQkdA7Hk88aicdkDxrNn6srqa5uX+Swm4mpWZ3e+dZ7BDEXbC0rnWIclnraTKeGnAVSbZfLGZCBIPO9ikq5iAdmNJgNn8spomLJZDCata3cI6/yCF4o2CCieWy4lnTbT6NfL5Jlpr3I9i0PoVhtVcnuCFZBRpoY/CbP7D5A4fCLh/U8jCP9OOO7HzJFpZ/bOsjqLcfPUikSaQhLPWUKQzTlqNHzT5K3VM3Ro89MomIYvjY5xM5N5vHc2k+fXV9lwrB8AEc8YWENlEFdQKQARlUUsMf1iRk7vDqujc4gv3rUFYk7IjW3bkRw/jMmJjkA1su67gRb3bvjivJAj3thUqqHNwMXijWQJuOUxrPNKmlw7w6rm70rCOdZhSaed9YPS/xj65XDpug537kcx7xNN8t1LmIPbpMvBu2iS72b6HLyNMP980Waf3wnT9Zi4rVbmzp5rANXmJdAvWhMYdtgUFDQEHJhy1+HadZ7vncybWVEkoH31Y7L+kCTUxrDEsz7SDPw+i3T/hzGvT5kWbh24aLyTMgNvmz+3nv0Q4rpWY3kQ6+qpEolQJcI+SJzXafLUZBi2DsZtLVhMnJlYDnhu1kGkk30k7WgjzkCawY7IeQwKCzvNiIstmJQRfYMUURpK9bBG2uR2qRSG/cIUUZnrgFI6rIqq97pC+hGwOPxGmH8eqkS4M4AB2atWTHYsIJS11pDNmQvJ56eVoI6FJUG1t46I0lYuIu0bPrgfw7aVZ+7OepHj3/bCkc6+oVW05lBFlAbhBPS+0OpJQ5E4rH0a84gu/+qqF5G1BSakWgxFQGmlTO+3EWSrbQLZPFJl4H3BCGetoVW01jBFlO7AxPPWMrI5P6EW1j2LdnQNV23uQcyjoVAR6wlIQLUbmpAmfQL6oUq/7pQK7lpLLustLaIzAxqN3kcRr76y3ViaPzUt0uhf/TQiTFvZkKwXsHD0SZxd71QK7glcPNJMo1+fw52recB4tU847+YB49U9hXv1DlhvVvACsg5jUqJzaEJKT/ihWXchIf01EVWyDaueX6iRz45529ZCkXs+bAmqLUNJ0bFyeGYZvJCsoUIV+xInYY2eGz1Dd0Y3gXrvCkI0OwUdmF9KFdHvgOf+TF3ajMONq6NKw3eCE4r2U2nYAzHmfRiyruUiQnjBjM3ZGTyzGShxzy9ddrdOn92tkuXg2IycWr+y+ewN1632WcTrB1Qg1g0KiKx9GvNoGnt1+2AxcmRYoUhAegMCJLDzlhY0GJcUTJ3gjuM393m8eX2pE9yZOL82Txiv3wC6daTLrpfw47IOcYTUvmAElL5Lm4Ea87JuTNpOn2F7Ji5t5jU2DCatzvBEdM4ABZR2MiX0OOE3GmZN/uIgMHDgGChU4BwsbMGU1WA0fmzyTiOdDESpN+cgymmZRnBpCk06ZSkSiF3Ha9ckakjvEN7RRphcugJrqFbEFtXu1QW1tvDkcxaa3PM8inIIXCjWT6aGtBPoYac6wdizdmTSG1Y9vQYhofUDF5MfSbJ7M20SfgYqID8FHpy1V5LSj0VCSgamZPTumjLqOVT59BGEWNYJXiz2JVIv/ZQK7hKGZNIalozOVzcqe5MouAs59n0nUPC/YASUDtEk9A7BGnp7mBLqM0Tp7AwKeEwK5dZInoK1Emi3xvJxSXuoclpriAJaR41ArGn61ORr3J0VqtzrWauTvsITzrlqhmMfEvP1mT00LA3gmozDfatxDNvqKBKGXcvI5rzFSuq1RZXu2oJaU2DyqVWgCvkNdBreQYt9XwbOTMtzeEd7uII6Y5Wk2lo9NucFKxz9AhWMd4IRjf8JNGwnTXrvBSwge4UhobOEHplEj4NdwQrGj0HIZ60FBLM2ogy0Z/DU6JyuXG8QI9JryOF5V+jB2Q+UUPQ3gG5+Jq9MvuGj6zqBc3cNHluXkTubr2Y+y21ZLIZtK1/LtlqZubIcL1wXetzrMazzHOzDB6714OGGK5dlgKNSuyEK6Zyk6e18FhPBs15eV7o7y8NIRxtZDvYJUzjlf4AMumyLjdo/aeEnFPnU6gjaOXgx2TckCe0cloh2qhKM3aiS250+C70UaqKMHdnM/xfYDB2a/OOI540kBW0gxb1/TftabmPDrm3b7I+jHh1lIpEGmtybY+DKwmDMtGA8xBYXj1ClxbGmsvgGLAq8g4GY2UPT5hjCyTR9avJV7ovdeN3knMI3mtdhX7wDBxBKmuCexMn1T6qIs1brZxbEl1S6AwKpstYTT20CFoxdiDLvI20KdgxQRuUvKagfrIqJeosIaC1hRyZNYdVztrIxWVexgPRVLCD7AxriuoMS0B+25NTucGTUN3hRWTuJgqlOHNpLn94vJMnngyj56J7EO9qH0a7T9LFlgR73agOjhh9Js9t7EO2MKAe7kia4M4F6P5Qqoc0UyrWDJPd8Iu1oHUM6GofQrY6hI8PyGN7RTqFhmj43Gcash8nImWV5EOvqI0xBL0Sp12f00OaZPDRtjmEcLUTpR+8U2tExcWNyjNxW3jGU802jXy8hyOZcN0Hx3ZLM2P4nKb4FJp10Emb33/jF+Z5CvN8gBiW9AcloPUGI5/wkWviJGv1uH0Q7W4eLJOZ+BSYcvdYPzboJFPxp5tpqm7+3maiyz65C4Wg3cPHodbp0fYbOrAZixPtQo4a/SgXkd+CismYwI5JO2uT2HkS72ies53W4dl7mzYzmPgt2dRvTBjXy5XTlugxc2lyTp+ZxuHPzkGRgnaTp7Tthu/qq9sM4FoQHGsA1LIXWTplDFtK5RxGv5tiwEDN4bLKRJmB9tBko1QJx7jBOIdYDQGMekyLDe1khMTdxhm2fwry/gIWjp1tJ3J6JiRtLiOWsxNn1VCcY+4ETjLTQY5+fuTObr2tzdgbvbBZq5LOdOAm3QYp7dozcdoYp04a1fTG+FeviYR828BsMRAzdnZ3hQ8NyERi4uIQDWjxEhQwwZ9oQNt42mSgTcOZJxJt7HO1oJdBuHUS5R8e4jWljyshoIUe/vqCAxvpvmVHPRQHizVoL8GBYStRXOjS1SpzeDiFHJe2B9bTeHjEx1lfDRlqejgLMtEtI2BBuiOsGMSB7FQtIKxiUPYORUPoDk9Kai1W0Y1gVnaNMFXsR5WDX8c51mbkz7fWtZ2sA1+gfxzyaBhBNC4Nmg13ffFjNX9t8Exg3X9U+9vq2xeZ46eijya4nihT0PIh19Uyd2cx92BevRXjVAKrNS6KEVzcyMRi2OiwOLRs3FtajqDcfaQ7WRpeBvcZPrYZJo7FXtlrsGvfBhDD3aglHOrVPpWF/4xfn4cjkmDYyrc7Xbo6yooNpOUFDwFFJ7xTS9R3COi+hxyZ9wcmotgQkLeSo93OoZxtRCtoGTLeWhNJbSEDrAyUU/SBc3YN414Ma+X6Q4p/vIdzrRQ== ]]><![CDATA[ k4BfadNLRaKxawXplDdsOZW1mHDKUyUSafjSaN61YFwrQsTM3prWSNPvK30OeqDFvZ5DGFfnEM7NN1y5rM9jniwk5qN3EO9kGTszrYycWfZHck9L5UKxhjJhWN9w4WSYNFssSFKvdlCDkqZK0UgzmXo7lIpCekICpmHZBFbQWC8qaAg5NOUesJ6vyXurHciY7G9DWphtjbC4lzzBdI2e2ywk2Vc3jX590aXfD4LU8zngNw47Nse6dGiiOX0Wfpq+s5qfiX3xMzAvGTyzsOvcDQajpg2hE66TQoFYczIsCC5BQQUetrXBptANe6CARq0FLaPZrCGdWqsfYi2DGmJtBCCbWg5fRmRrJShsrSScMt0THLfkjilliESm3HROetg0a4uutcopN5AB2UE8Ie1pQ1aU4dmAodbGg8WZzKSE7cFKqdUNS/lAikUFKRq9FKmin1JFfBoFV714rJU2vV/GrmzGIXSrD6BYrJdACTtMWy2Cdy8PM3pq2Z1DOrqmj42+utnYHK8czeT59Q1gSNZMnWA/o3cmcy8Wgnu4wMXPwr4OrEDsGa6cZplGfGcb7puWZs9NGzNHpr2WdSy/sV83g3IyFAnDbqFVVGvgVLG+wt1ZfmdDXOtsMZtumwx1orDmkMVUptDkU17iJOw6XbuOw43rPYZ5fYn0W1OIIpr18GWEDMLLiLkKBuWsxOntUKeF/kEO8YwARWN3Aj2sqUowDk32+akSif1DlNI6y8REv52ssG0oMHwIKiboBTAafU9Yr74RhKNp+tjkmLky7FVtTCsE2fezgmjODWw8MoES9gYyJOsMU0jlrS6ksgIYj7TQZF99lbOzMGleTO2H3XDh5p3CulmHUM7/SObRQJF69A+k3ozU6ZWJLANpIUi/TiQOpIcs/2ojzkCaCZWQTgL10jyHdfUNIBxNRAnYqU4w9gc6KOmsJpmy1pLNeWvLabaLC4lZa5VT9jHk6zFrZvRR5eDPLjnh14K82GpoDaWDHvn6Vksk/vNprPM1gmlTqYY5XjjPx+QwDqahAwxaWAggTD1tlAtFLZKoV74CgimDuIJaa7gSSuswxmk5hqwLfPbAdaQ6mPUqgIn5jqLih9hSgr4akqk1uhykoVAV6//kRe+7saNMrrKiDv9gsmUUEmULqCSJH6Myo39dQTF/0JJKcyEppT0UIe1ZJqp3l5JST2HVc5bAQ7O2knFJTyACqq0AZTQLocdmVoGLx6kRhr9p1Gvzt/YPlDi0H9SQ7AlUG3+Vi8Y/wUinPOEI5zw0CVjHyJ1hZfLGsjaCcFkhyT9aqJKvE10C1k2k4K602f0GSBG7zyJe594rBO+QgYt7D1024DUZAhDxHIUSqNNkYVQKBIJRCIUyCIMyGMJhIOgot9IYcxGgQDAYDg3EAsPhUOhXHhPAwWNGuZZSDhFCSBEREREJRIIoSIqS1KcDBxaA0+pCregAp+e/cza5COIhHv3mhI+AM49npXMPYLtRQIiSZM1MQuawg2eEDjLUJPO7qSw7vobav/m9i//iUs5QZO03fZe3LwpASDmNDvhllHPrapWiZnLOd2n2I2fn8GTt44y12pHTr2K8zckhURnNNDf97U2Fy86ZmZw5mFHOv5SVs+UGUzl5tJX/jGsE/SMCl7UAlX40hjp0SYl1TddnVk1XS9F0iPm02p6WNB6/UBfVrKazGfKeig7SdpTOE1kR6NtNyrKETJNN30eEcLaanJPE80LwfJVom3p/AtAnWEN/5WKfgQ5mWY/7poy/tBEr18cUy+B0vvopoU7/lnVVHDbJYb0WD6O/pst1O8G6AC5mkY5Vytl3ZPkl5SSjggYfUiCc6c78ECJw5+jh9c/iSAT4+8afn03N4WUDF0E+P2xygbv8seg633u5bhwPCF8lpT8B7vuK+1ZaZ75jH08Io2Pjru45ZEkvee/bWppFQQvxAITBR0GbixWbT/O28UX85tNr+X07PAOak0s/eY3QHtaty8L8RO2OuDTuyfmqRH+hSVbBcenhHRtrztneCrxrPvSeDr098/zhgvxKK7xUJn7p+/cw8fYd6eV3GqpLVHB5nkX0nZR5llS7FdFrBECLuvjO9tFZT/yfFVP6ODu8W5p+1vgUmF6M/nx9zqlZwuv+2H807rKZcpg38qggy0af4S2K8x7mwBxwswmJw5T5L4fxPZnnG9uX8TQ3xyABY3Dh5U2a56rtEy32uEP+rGnEnenJgl6ER9u3fPLhKaQlxd5V6WZR3QlX+Pw+Arh2C/GTIbiQ7ebz+XBCePfu4x3nfb57ib9POnZMYnZ0VGYsfXu2WX5WX/2YbI56udvDOGd4dD5AOLMgebKbJ196XJ/OB8SU2rMjLvlZtc3ZQIl1S062QvgYfvHm8Mj+DnY1NsNx/+yaB5J+fJ0jET9raj/1yQLMpT/re9Nwv/pROMT/OTT0Zx3YB5vON+3F+MvYurDz8r3mvdeX22H6BxvvDXaZHoinDIThb5UI7z9r83dwAQ3Xim/5s9ry5OL/5nwfK7Vv28ioN/C8OMdRnbtMjBn2zyqas63Y24XPtVjz9oZxqzyySii357l/p43+ajcQHcVmL36JZJaCfwTfw5GOHG8w/mctno/6/IKl6xpuzTqD6ChHJWD/uAnua/qLMMeRF1MIPD39Zw2ZNe/nhl7vqbP4DN/p8xa9uUNP+5q7rT3PaiHyM8Nlpu0UP6uxXT1/AW9Ce8nlDSjjJoWu/aztTOwhZDXllMftrf9gf+M/V9nYV1aQqkXyZ5Vxc2Mcg2FnPY+HA16SJfM2SuNn7b4Ruulw6nufj3OvQlqC2JzLG//F82BthQbwP26XX9jlHt5NuBsvf9Z3r5oJ/rPu57V9PmSX57GF2ZI04hmstfl1EuH/KrXWYTGcfZLwpOsHLe7DiX62/4aZepTk0UyzK2F533W95XI5hfo4DNufSJ6jbaJNKRSvaxs//9lPqI2/cdg1zMpfuD2FisGd+947P9eG4Rf0f6SrPCKp/OLTW2TsRnFjJ0viPm58ryXF6Kx99J9mZ90Z8opcvxTLp4PoOn7c/REyxSva/NdnH7eVJr+HxGRc/exI+0/bFPPCA14fa/6Z8tzRf5KuoKsDPQ8OWkvVq8cvf9zzAvCuFqweh7xxC1L6L2/1dGK+fYdcJmpPwuI9D+PX47tMxadXR9/sNKYfZ1vzQrEvt1JE833J5KJZJAy6k342fyDlm3yPtMqnN2ZWEkIy65uu/d8N24OcqHXmOIzT8UH2sVWD0Da9VLdH7ry2dXiB/fEf51tX7SfbcTXUJ/70ggPaaD/j0c4Ep6Xe72gI0Od+p6gpmFHScpbePfcjW+INMWkvLbZHyLYkRUcLBk9+XfARsIQ0Wzi0uEGk51hIBa5Pla2dsbY27oyNQ+TonTK1+twgCCeUDbHTPlZzl4MFPuX5ty0DlpO7OxwWNSTn5EmKKn86Etgc/nJQM6fdweU7hfH9tkBCcB+whOqudneHO/XLQyg9TNdsx0Kdogwz0pGrGKvLxue2omPIJ7i55uxqRbtLN/Qi+kxKOCwhYmggZub6gjDYuM5/aOjYoWi/juxFFQc//VtpFzbRQUv2J/hIrkf5ZpUU4LUQ3jAZJd/16w26JWjkN76RtPWSLU8F449knzhVvnH3q6JrYwn5g0QUFnLhE/VKJ0mxUYYeOHreB2Bz0hcBn/OEmCrXSphRUd5TEX2dCtyZPZozX26Vc4f4fsk6TyzMzRGmz+t1DmpOs8/1/zSvxerz7ptdXTmUco8/vaBVP8qQYQJ5A1ALifYYuNUZTsD9/lPtbDr+BQvnkFD2A3VmbworVUOvHtJ9Vcc5yPL/rf+HZUcSzG6qmcPo7C8pdLkG1utKWzYtmF+L57ewpuj9bJ+mbvTNMVzK7vkHG4Jn/Wj7MKvsUrLMMchT5SxzT84EkcXwm/wRe82ABw2tb0XB/gHv0n79jl5Zwo/YHPZwm7nZ18fyTiTlvvqa15U/Pu8H2cXF7lEyp8DgN4vUeD5C+N0auC1HvyOkwSrjVgE4OJL4asLbJ4/VDEx7nl3BsP5rD4FjpXdXHLahBvawVafWhhG3jvwOG/SxhHGwWPlRUHSLMR+LxBdc5WmiDgXdF4oBg369NSDvjDLpCtksFaJvFMF9JpHXRxlPh3ieCo8h+Oza+bvp4RohPwRYfW/KT4Ow1mmkuwfpNnI2v0k+J7ycUn5hfC7Gf85vNbkwTRoHOIz4u+bPiR6xy1Ez7ft7j3Znmd5AxGpePcbK/m8P/J0YNmq/wEhff8Fgbg/kczzsJXwxhxZZdM+uA6PyY2DrckPihZ04NAsTqIpx1Brv8vIxPfgZi29SWtqonnSOcGgB8EODgP4pdv8M9w4XreoKgyGlfLcKTALzxIHGjL/9zwAGesrez8s9936jNYzh6B7Y1L1/Vd8PMm3AmjHG/aaLf0eGPtCfef/bRi34dVvOgbd4V0nM+Fp46MgKTvja2kc5TBHcHAYye/tzSl6tybTPPO2xRYrJJ5s90s8G9j/NruNasdqe4o37OIMRWxpG/5m9t+QFnpV7DZ29l4XdbwH4Vsb2OG4uNFQ471j3qGMOScnnkO36MG/r2Z+n/8PrvGZf27R8Tjmy2Zs6lbYUfIITiPuZBR014Pc3su1KQl+Z16Oo9YUObPJ49hPdKPYdigVL77NE/BJjfZr7RTz7pcPbH68nEfzAtPmWi1nPZ3LjpR9KYewYroZRn+o48Aoo0Xux9aNC+XWdwAdVyU2iZiddlNcdeDXX/jkMgLnY88Hf8plgnOj15U8nh1S89msIRwd9lrIgvSTSjUXeDc/+OxCq2j8yLEjs9g7xDkB6x7u4vkdPqLge+k406gaC3i5WBdEfTT+J1/2+XiYCvVrPb3GP+9nSJGUeShnGI7X4oJJ7/7mXh3XXL8r3L9CSAYT5CWscZG73hmY166SJR6xBw/lIc3skxxWKAJxzH00SkgiQKhM30dEIQAwlIB/A/OMEkEkB/MXGQc1ydCVGwqQDMnMBWTWWygDTGrnxXKSM+DgF9xuUlHrveoG6mRnbXWrWyInfyFnAjeCyxnIKBdPexJPBzxw3DR4ijg09Iwe441j74ZDnNsdH2+PUAvvhbUl6D27e4CpKjlQ4owBtLTIzZKejJZORrRKu4m+QkPgES+IrZlAwuJXHrjTi0ws0T6zL5c+AsopbryKWb0nusqOBha5v8jKe7G7PGakN+ZWwxxmML9ezjnsrs3vmUAC1nmk+1DqXM1cP4C5kP5Do4DGEeRohdUgITGRXCSv6PbzDFzsB41LnFKjoKxvdf2Lc9XiAyliNY4+zjz0B5qP6/1ebuHqomitonJ5WIeNau+Dvp5uaSNJjRgOppqznOntc4jvGXWYHFjzb9XPysbbViEKZ3ACAy9caQnX10udHVmxdx31OeCsqeHuvO+Emse3ntuWeHVU/tCxY2Img83wt7bR734+q9lTK7PvefuPwwiUGDw== ]]><![CDATA[ ogZYYyk3kYC8cQSDlYN0Cn8fUDS7iPGvIr91kIFj2ZluPJzVAoVqAVjg7355U2NPPt85qHx9Mbg0moj09/ZKW481xAVFh3l56K71W0rpJsaKx2fGdvpYg1PNRWvIbRLCsz0bxOYHiXEr0aX8XF/6/LHLpXHKze5Lx+lxUTCzkq12bUBTIowLWIN91f+g7sTSbuXt/jO0AEB2xLrPkmNe59A/W7eatwoR2/dQTTZfyGxPjZ4GNmFapU+VOYvoJeYwqgPNRjXW7y9dK/zaFX3V5RboaBTV53spFleWWhEnlpswdISICnfDDLi6DR1h1MsAONs7pfqUD+SYKFi2Hd4nMFMOZicp3ykz6dlRFqykgTfd1exWksTJihScqgDAWsGb3KiYOXaqVziUT2CGHtwH42ET50GA4yrnqPWmWXeWqiLOksAYo+sApmFov0O5CtSEpqBAOnHqI4KNg49rdzCBwGSZBCnxow+9rmWLoLf9gbch3Vd2UV+IL4GrWNOM+JRhcAVXiEjRIGA8l8rsmv1qUfwj5i7KfeSpv3RGSOjOE5uCBr5hZwBI0rmAxXMnvgkRT4QUHH3EWdvwx4xHxaafY8JIHc+vWKGxFJrFTtySyZRBflht4Iwc0F25wKzyIgeBqCzKAmtfYEwn26cuzCZUPKUnGE9DGW0MBccO9AkAlArIOWU1YWViYTYyLTk1YTEtNDdiYi1iMzMzLTZiMGQzODhkNWMyMzEyYzY5YjQ0LTU1NzgtNDg3Yy1hOWZmLTBjMGNkNjU4Y2JmMjc0IDY2Mi4yNTIzOGRlMGQzYTI0LTU2ZjUtNDBhOS05NGQ0LTY3NTZjYzFkNzgwY2E3MzNmODI3LTViMzItNGUxMy04NmI0LTc5NWUzMjI1MmNiOTQ3NDYxMjUyMzczLSAxBQshIzzwejO5/abqIAvAWk0aXKvx8zyE4ZETCKdq/gVtcyLBtxMEbrjgGiD5ArXHCZ3liXVW7qmZQ2g40KzNwDEhXZAuzD8f4fkQevDLb6fQY4IDuLMe3HU6bNzZDR1rWIAnOKcovJg1o/HfLATaBheoAeIDC+cw4L/JA+AliRG9yRZ4z0d8Pvw3R6+83gE2bMQAKn0wFjWAN2kDMzADMzADMwAA29AnpAk2SRpH/pMlu6VvGBiiAqOCaxa/Q7VRCq3snTJRhEQsfyxb0XkBZAE6AXOiUdEeTRKZDxJUIZXOJyKxDN8P6LEeD2jaOR/bMJ9sM6OJxH3uRCS6Dy7CbeYExFMp6oKbfHMPSET1wc4Ekn2kCpmQbDS9/f1dP2gP/MFX6EYqCiwkaEoS6DYkEwJaI5JKpxNNkokIBKL7XLqeZyJJJj6peEvCWkhwSJC9CSQgK01IWEc0n4nWCMRtmqZKHAdBdR6WojI0kuR9ehagaSWSaTo4J7H3wDMlOiOHwU5lGDDRWGcYAwoAGhuhPcJkUqH0hWx0pRnVyIWsnYjMyKHSaLoQkK2SldwI5DaqIwDiQo9dMEElK0kklWJKFAFkgl6zXkwoVCcINWqokvmQnklSowUzqjQ9bCRJ86UFVKPmsROUUSlUn+kRTQvqZEaRwoDIRPLpmRSQCdXmQqs2F3ogFc5CEeDa3AOOh4gBigAPUFGVHtvg0ACi/YE039+e481DtuW8lmv2u0X/4cs9pL1M6czqnOXRR/Nw1nw919MHXMuL3USHvgkB/py1s3P3ZHw1I/gd+usI2yL/3T13zb330L24RPlay9hSTVWy0aWYDdw0Cgv13Adk4tyAgtJABZQ3I4nmXgdvshQikNuIbENUnQhfaF6YA4Wmhm9Qn8eUKDQ1OBJoRgskqEK+IJqehQjkNhAgqFiTGTn0AnqtaUggAhPJ0hm5zHhA5/No7n2ce5+G+1xPpClBPMqadfN3vmKETY2+3b37tdfo8QZS1KfGCWIlTMvwoBldRlMjhlSfaykYV8I2kGXU6XkwoFojCUaE+zx1UiWT41gGRj/3MybzSfDUCpvgcT+qwO0TkVBcSI0gu2CQZo3UiJ2d0c/PmdH93P2M59zPcPZlwcDmRgWi2iBkGNzCc2/D3VsQpZRSp5TSSKlTSml8D3fgNdCFJshE6ZwVss/igT6T1kiyTTMhN3IkLVEfV7qSZDIjPDOakoRaI2fxPNaBWGi6B8SbjaT5oDBRQOtTIZ4KQQH2gZCNUdS7Zy9C+P8MMgqjxOdguDSXkLVyROauHJK5BeEnI3QG+b2aEewwyva6W7Lm6NJJ1gxfMnQhhQW7ghiFURiFURiFURiFURiFURiFURiFURiFURiFURiFURiFURSEURgFqiaCm1sxUI5qtCa5Sf9/zJWDl9aN9Xt+z7lkkKFs5hj+8l4/e9VwzvEt0NtSDtX4tryt96u5ZtHX4gtKtix2SzV+PfcaW3491l6D3WxRdIHP2XN+sDnoinZbbHH5jrVv30052HlcFju5NOZvYW6xbtBJyeQrR2O/nFwc5Uf5mIOvSedQjW/vMffLAiNrH5tj7vk3yZwr+p45by2btbvXWFSOpxwM2y/Mfa3I3v9icknWvhR97rVXlLVfiy92MDZrL10361//Hh0yubhB59h7f8d6cWyLXZEj9OeLffGDTzn4LYZr8VMP7CBceFkKwpDhohwMF8MF1xJZQ9b8snVHX5o1N9mejItcvMH4jjW3llJ2fH/MNU+1DVWaDM3RMXSHajBUjiV9QeSvpRzOv0AYOstXDNwN/l9QNfif4S/+j7K1xnx5lPKZ/KUcS0HgfxPNBku2qVHDG0fnhuwe9Nj/HsLF/ZTb12K3QNV4uJ3jO15kzdIVgwBqYYFbOQ76Al1g93+/+CERDKNHdgcX/y92JbHA3nJxu3osKAfk9l6rffHy70EWva0FLv6WUjLJvzzIZDe3y4/sTUF4YW+KgdtRDdmLk8rBy+Lnb/zYnWU/6+ZQDXbn+IullKz9meTnJcrYv5ZyxFcQdl/xlQR3u5oCRJXiMtCVpGlBim6kglEaOznU5zGhAs0oC15jIwcJyAaGv6jTKjLIGKIhGUmSUgeDEUBQQCQOqAclY6EeyBnJBxMAwUYj8WAsEIpCQ2AYGAYCgSAIAYMwCAVBCAKREIYxGMQgKPRNBwAQbaZTYC3OgAlyj1lmokHFC6Fl6L0HsEkqiQp6WYvic51klu/UQsuZD/Zmc+n3U6TH9su91fj9JmpJIxbHEk7KgWKtt62J0k5036CVq7B8A5018JJCKV2VAHASRUX/ROrbteLfkNe9wl6ioThCO8UTyUj4KycJA6IGmFi+J7cFzoiwzaMfSjZzEwpjAlFJjt4KWn8sulIggYwM3GQCyWruQxecEwMhVDCb783blMuztokgdkk9rly4Xt9Woexj4dE64np21ysTRVQ2WxNXDWnkKF0TXMgiAfKlK935BVb/EVRcmtDOrDIfcnteKH4DlpgQqc6Twf51eh5Qqbc0XYYCbSQcfjQ/Km0D1T1yFZwxlAajgNUr8qMNqqj2h56wH1QgR5OgbK4PE7KOFCRIuUMWTT0EkMFdQNGjgLpyL6KfGYgIdZXbBiVfnsfAv8WranFJJnDyb0/w9hn+MLY3ThATY3gQNYcqpMj3dtmnZ5OJoqBEEmBPvoZVfnpfzbn87VhefGiJcRLZfW2acYnurVKTcAZdHnLj2MB44GUHVhYvzJntpMdw+gfQODV+BhYOiI/Lhw6IpMngEktgsr5OfGax3oR26DWcgYmeD4nlc+gHVzcdjtgcz4oBopaYd4j0Dek4ORn81yh37AU9YiI0QGezwAUJ49ljRU4hppV0uOwmn1lutJrI3O2w4BfuFehWKrowv2W8wM8Zv5NrMlKsyhBHO+Kv4GSVUYu5GpsIS/OohQR5VOPTO5jwMnnX8PvVoTOlpraCAKSnUwYz2vZIwdKujOzBhIa0iKt50+Q3Xy+C37c0OJpbZgTVyMANmmKXPD21RC79ctghTdwp3GAHUlDniwE24lnEA6sMjxwkNvrCnRnVpoMu/Ve/xVHJqHiZunALErmLNlz9szwLvSk4OVq1ztIgTizSFuUBu+HbVZx/Y71Z8L09RvsP7AUBLVrxlZ4Df3tohyOJRMnhqODMgsNBAiSrLfr6kaPxTnaPO/4tO6JFHb8U0WkOZU4KhxxPRxzFqsIDnERxwN28cQTJTcWRNikcGy8fwYo1MFLUTMylCQM0C3q8OgMydrIxsyFSJsQiZFaAGpN8iPFbGF0V78uAATS+LBqX7PIilNHF06+4NJToqDoFyTZFCNWFnIOht3Xk4TlkvpB0SXukl4xxoZPM4rNe+r7RTDTu5dMcMAm2es5Gbpwy5QVg4RTZMylCGLd9RXm2G845fzeTFjiJaEkovps5OHMDrgrvk45raK1wfV4ZArq622MzHzUApYmIg4tOmqaybClPo6evaMMuACWmugsY33AbfYhcNDsNVyOQ4QRSMw3i5nAptv9ng4rH0O6KfTOZYKNno44QsJl3IWUb+ViL9WTqVtEKugxpd+7Y9ABosP7CwjqNbqO1B/MHEZJeVFjMjMVeTgLHbiRHmi805azgpV9xsyipibax5hoowsjbGTEn8IeEX+G1DDlQOd9jY8gVPH9mhxW2VxTHnkYsRFxti7WT0D6hHxPwJsE4cSzT9Z9cTy3O6y/qJz5DBq69EKpIAUyF4BQQSs0kJL/PBqbET2QxH5ZH68C7XCIhBWHAB/PC0tNzB0BXwvIY1XZtRiTyCRbd9sVaMhoPyVPuSOdeKKx+pQ+hw2hkRrSLKGRaBteLaCRZncD1YZyhCrwqiQagJsUBhOWhWe98rfphu5a5AdiQUcpy2Nk4ci4BoHAdy39ucUAbRjMIpHaIwGNobigzXJIJQ9ZxNVc9n67sDO3YwXw3fkho/A6rRhMJ+9y+aOtLY5znzZnxfbTlQAiJYjGpOor5t9FPs7lZa1YB6JdM0jAd9nmUrNJhCYI2/PLtReGZa/v3gcJJjAJYPGNlT6hCmVhqu2yqGGdrqzP3D7rUbMc5AiHzndlC4N0PXRLBCWgZjkEOAWgRCCGw4ITvkIURp+HM7rLF1nWiK07lXVDboqQyNr0IWxlLAq2X8lgfCmN86ILrvuxNRFklF/RerO57INyXcQFD5//GqgiCBfkKy5bQoxm4o/QCodgQwIpt8/pDQIQGXpN7dJU/QLA0cFBpgydx1TXwyioRhRXti9l5grAyBKiBlk33aEWAwqq5ZN3i9Rih9d0JwyR8EO8a9DwZEZpkEY59YH4cPwZTjgJoRNRpsw0MtkQqpij/0iOAy+NSnFy4aFYOUtUuSMd4uYexXXHXSylO1OlxpexglPJ+SbBG+fXI6Fzjlvw6PuVXlShExu48QECl69u4hXRfw2lqoQmHxgjJIfcttiINrGCW9k5aEehXh8tiKakVrwGTgrbhrqP/kOMAKBKirWQWKO8SZ+oRPxqn7Xh1+t7P/QMU+Vcp5AGE4iUlqmBMV7sdbxRCNDw0qA== ]]><![CDATA[ 3zYFWF8lyWB0H2EjFZbFiPnA8kEQJJbuYnSLZYEi7CuIuZcaBD7mgoBLLY64uVYy+Q6pAhUY/+Mif00HAhCxwGc5fS/uxipiHYKNJVop4h5BxAFnu0koreCAmLSQsQkYJwy9+obZxbFW5e15K/1otkqqx1HVAeVMggZFZm6P5Avd7sERnj23MvHboFOP+GDYbTJF579xNoj+EIRxyiaTaeDJsgrYSgVzJ5Mm2/irrxUTAcNHaGrQZ1D+UGvpeTiUkp6XI97EnZmQJ876cCY4pmYnqQt3WGqxwGxyEDL5qPQZn6VV+KD2zKssYf2sEBrCj8wjlVcE2okMJLJuYFWOWhtDMUBKyAQkDmh1MTXFfA+jQZt5DU5jplqKZ8Kbl0TqKRGI3fNtAeCYGtbar79mMV0QH05h+BZ5AIljC5ny0hDQOJ/AI7Gw2tRSiM0dNpqCCt5lTiU6djAloVXDj7Tw/7evxMe22r1MjY+Q/OLhP8bS1YYtChlX4NkhR1fPNYvkmMFhLqvVXjInj/aGd1sHu10IkRt3B3vb1I0QOMJyFMm9a45Aolo5qS2H7XPgpiVTuZ+qsGxUrOom0awtZLSjagBPCG5I+R+NFX4DwSNKbrrY2EneKG7YlxzqYBVDxBtqruX1PPULH0gMtZDWmbGPQblubIo4qExR2OXX1BX8rSqz4SsPgZEw4A94bfp9S+iI4JaFrFjW5ZXJewR6XV+uaE8qBS4kOWTgpALIVqW+BT9ANWrV63NF9kAq1R7WDTsf2wQDAQFjrTnECcRzsH4MZPuM3vVwhclH5VESEt8FpjKGm7fRHMpYIsK9k9QHfyqjCAVeTsSK3E7GE0sIf6PvxZgVMlWGUCyWAgKrgBj4dXMsANXVFB4x2Kra4Z3SLjCnKAcdHgWHopIQj3iWyzoqKEUN4MvHGK/3F/QdY3mKFssyNLU8awNq0JgcIudXU7h4ueDcUTZJaPM6QhyMI+4s+qVGhsCavmwEtXBhmDZ/HRJexzF5shb+KF2IspXgCYagR90KljL6XlC961oVXbRYZbaeJuW5GFVHiyLok0QT+Tc6lcA2nQ2lYEtC0pmQ9K64txzTMToEbicwc2Hg9Q8uJV6pUghyy+KWCNbYJCodlklZBhdiqLHSKe54OxceLvz8lbQ/0/CTbRA7eZUR29hxtZqskjg70yJ0sum8kmstIAwM7EVoRHm3L7p97L1TJrUzJpHxbsOmYLeQLjD0S7Tzz3ZhO23PRDbQ+q4JAko5Zvu9IQ1KV6mUUPIKUqBdSupkucL8ZJsJKcaA+nh8DkQlYp0YgEivjRHJYppUF6e0Y6DdAUH4wQtEt4WSFyVsEpUU4n3V3kHDtQq+Zu0jhSUg01qXKVg6W7L+bugFfGP6KCdmCB0ruqzdjJNqA2pSIg0dRlJJfsdRWjXEwFj1qA4h8SJLB1mbEc/H1gepFyEr5noOVuyY+oD79xthxDHgCvUqyvgv5ualfThF/PoYleOxI5hEKvO7Ngj7qCZDvO11zVRp8R13zucP9yfiMcxBB2ZSJ/BrC08lkIvQTCexLXjr5FQxbf7s68i2+EoXqVLQlh0bsuDXnGij7G3foxj0n+Jgd413kOOUBQcLy9cSib7rx2ltZPgucjN9XNPHS0FZSAq5DbwjbFk8IeUGsRMDq0vmJKZcuEKPrRzPMCSY2wwQLEEKHrJBoSaiFTSrO3DBlXmdQ4zPtG3UYnPImzga08KUZfRrTHDtOIo0o2WmXz7ickU0CySGobzdUmJPifVuKEvb0iSV/ZYPeKUFz1jqI8XY5tFpSuwqBGl8MmFmMqSgnBtbxlhaCGRLmOUKVA8BJrFFsynPQKt3g7LbsI23KYdF5O/DWoZhSFya+0tpoKVmVzlAsEOnncFqH8zHfbm1o4gfKQ2xFAPbs9qlCuWYizCqIncIoYRFMj93W7Z47lJ45LHoImS07kjyA2FE5mKbf/MdDhxtz9vhiQeK3bE6E73wtCSJKcIRlzIeHFNSOAkQio9pV2cWVmXoSVjAAwW6f9JxaDaTCYE+RwBfvC+GNLWCmWLJTUgyx0ZakfrB6KJz4PF8OBY6OJZkTUiKRwSWWM3vfpJCZwmz8nHvTo26KC1+jgTQRb/z/rYSWvBi9wB69lqFhfoonZ3F2wG+PIuit0NYRyiR48KOaRWRJXWOG35MjEUnFL2iUkyk0YD3UfTDKO9UufxOU/RMVPTKuCsX+m361qCvilzpvpw9iTw59I+4iPAMMAuIAE5bIr+56rGoixUHVgInh4/UGdN3BtmK71Xob8/CE2FarHEqYkZea2oMVYsVCcT3WrHhTsY7lPgNvuyMNhTnZosk7RK0Ei9rg5vEB6X7QYfvE+GVX7xQhd3UmoHXl37xy7oppQqa89GOCxDx1i6GYN0B2kWvHQJxbi+UsYph0I2xhOBhHJXTcuW3CPXwsov3araSLk0dfLpRwMv8PCIyywU+ALKs+G0B0U8UZth5a6dlHkUwOkb7hvwpF5lIb9Us8WJ+fC5h6zZEolDTiMCLPocgTyixlxf6YglLPI/sWmObJAeMc477OHthViGmKDXzzw5Gh2MrLO5nGdOdlT4cOjkCzqSabTAfio43tBC/MGtQEfuZo1ORtlSgovYzXpK3ZjrkB12bjQVoJlQhJAxNL/EQmPjyj50k47fIrJg18Gjqp6TZOgL4Sjg0dGAe4t2xod4rb6F2B6fuaEycMG6B0LaYSp3CoF2cNY66fRSCwfSrEdD3JimwBAD3Ag4y5Ey4rgOn4u6U2uIUABuRkLFFJE45aYyFEWVMMcLf3P7OXuB4M4nxsLhKZ/dfJwtpvHBlwJlmgyRXIbsWk1GurxEx1z1gGJCoGU7udHvevPaZdcC4HYVaCmUYmzFocGrT7s01AVhPW+EfZNxFiyafwa0b2JYsPOGtPECG7WUPrAzX/mXv/dLiYe5E6yxE/xgIDdOWT7ErE1BGGduuntyj22g68YjGgEH02JZoRUqGZsXZwJ3YUSN2VmV7djhYIhLWRUpMPLM1RU+nvTPF0aSFj4NuGCwUIgAAVjWSoFgf3INUXz5/W0ZnyejxN5RjfrVoJhJnkkk7ybOaXB0Zb+8BzJwNKk86F6jEqkJa2CzzENJiBrNHRsRt3Cmg4pMkVqZg0nxu6Dw1txbvF9BEfCRQEaxzhwQvFn8xkK1nHQ6cPIOEGA1Yi5cliLI3TcM/yo+Q1TG/TloG7uUCXVW/5G9aL14svPqE0b7IBBctWvuupjdvtR1iRmar79VQs5u1G7yNSCzyjBv2mTQAEmQMWVzFPqAUMMMKVFiMoBVzT7r1gsgHiOVgk7HUGrgiKtEDeRom1qL9AsqheajyU1cNp1T3/grfuRgIxYALaJ24iQ854wOj1yunKPxqWp24QWYRBTjN0EAztL+w7uT4sjj1P72ZAstgtplt8A+VGraw2WYutX6AYh2T783R7HHSgkcfKM8gFgPz/jAKAAqDf0cukbeIHgXu7crAEigzIADXxhjAXhkpWqtrNkH8BA7NFZDavyirD2XZhFZ1awqCv8AUCw91KLryATp74OFilQkbCE7ExmLN7Zzk/zIDUyxAECnaC1YcoZTsJSgNGCp1IIUmpiJaALwoHsSSe3fQfstU27WSBTAyOV5qbDcE1UX9sT+z1Sz5s6oHLnvIemMV+9M6Xcb2jWFjlZ4DEfGCAZ8bZsLPgDbQ5Dqs+yomKOdnjW9wfAdMnVr2x0xFFVTF6KDBAYt3KUJ1tfvQwoWeafReLZPHmA8384ZgIeSPx3QziQnotpgbKMcy8jHkVnrnKV2R3KpQDX6tA1ZW8qEYsZnqW0Z5xMh55k2ddq6uOTqaoa7YgypWXQwXuGP7mU2niYoafKYwR/1qaiaQG97E9E+RyJG6yfe7eW6XUy1xok7Bv6I/bL85gQMKYioGhfeCA54jRfPAYCdmzdjABptRr/xyiNyAcYic1mtOie83S0FUrkdSnCVstiJKZr8JkvFQvbZNkZ4jeXO7V2QdqFRj1IVpNUi6OxdkDQDtcqXLTjy0KQMKu7KDRzBFpDgHgFwo93YNBQWBwj8MDNCFgYEFeMaKm0hDJCNNYp61ry4DAxEI4K8KRU1X++6r30qEpJRSSimTXpvGqxiE+MAAIgQ+MQc9B88Is2rtl14o17VaXT3rWq2u2N6orMlOs7vX+5demE5bZde+7sTU0kovWen8kTZeoaYZaRnUb573ayblqql1WqFunpaSMsbzM8WZ6opk87x/6Sur8n3rrO981PS/Mmmp/gpVZ70wvZ5N+xUKZ/NltW4nviqUS6vxnV+R5P0q23tP6/vnf2ap3Bj7xJvOWy9cryq7GbsqfXr33H9teuXP7qSSbirpzXc6nV996q+wn7rOl3bbn+5V3/nS0vf3DzVMfiJ/aZ13211nzvPaTf+SVNhjq3/qCvuv+qemf/VXGLWzvp34qpf8WmF/1ZcvN8Z30t8VVqm0sla3df60VL6k1687X2bres+nfkm9rc96L4yxnfWSl164QtVOhe3Hl+rrqdNJL2mlvTnbLB/PLO3e1U6KMfbzyp3fYnqnX/nda537pb2X2gqT1tK7J/66Z6Z+78TXz5sz3VLDlNmbpb2Uys9XvpO+FlmdyBJZXXU681uMZ97veeav/5rOTP+q+E4tc71ktl5zll/v7qj9n/X6/LPKvd/eiam0O+NJpc1X1cmcpXVr//7r+f+43j3p/1WhZn2ZPyVCCrUtpO/8Pd/KuvesX2HV5+e55b7kV5meu058yXurxfXS0y+sp9OJq6xOXKH03JWpyioMTyq3/ownva5cp2O7306XuNr5stqrIv2sP+sl9aVbT6v9Op2Z2gxXnfHc0t7XPmsVbR0p5EgVado8b0W68FvS299b3nvhqbO0GN87bSgEqvpv1cm3lt66dabXnZheVXZ9xvQ/Q8k7c5Yf63yzLNPMesVVVxvpCWrFrNTfcelJK9J1VdiV8Z5fL4tznhrDV+fq9C2dln6GaX48L0riS9KnHhe+fklxNVlqO0m/VpmsUJJe8k5N67/fz7Zr5n5ab61Orytz13fSevUlKd0Vk5fiWrGkOt+5KWrXqwqRfsn/S+pdZRUms/Y8da0y6dmdWN7pebrNU9fropVWGep6FSLdPgU1wO9z3167/0JZvevV2ats6ktqTC2dVk+a8VOn9Tq9JKZVlml9SZwpxu/0L/m7YvrSV6avS2KJpZb5Z5ZaVxvpWJVVmMRyy70lrjC55b72JTeeeV+y5kviCiUvNvHrMFG3edrn97x5ZntxnTmT+63Taa+qL+pXzvSuTFWW6dzX9a4yabGl1OdfslI9f2/61NaaN3Y9n+qa2b9krfUnpRVK2rq/znvJ6hX1RegMyzAMhWVYlokskVVlmcjKMpFVYSJLaxdZIqtKMWx/ev+f/kWqpn1lbO2lt4l05X2vHTnpZuu61u3ivF17RBpd2LO9RtRH10ZJNdcnfQ== ]]><![CDATA[ AgAAAADUrN29yk3lh3SvsKzCKqzKKizDMizDMvr5M73nrjirsFrp9K8y////r7IKuxZfPbGtmfrMmU6tdZVVmNzvFfZ2Wzwr1bNWmU97L951Xl2ptdPr4+nUUj39KYpmFYavmz29KszqXee/vvl9fnZlr7Kt77xXhWV7HU9br911WtS0lymb+7Iaa31VWL4obaoyzFYYfWlzrhj/pHXSvzJbHatb73dKs64769e1ZreV5q0dO9U410qz67eOq88tihZsFKLSliDcxNEFJ78xlZESGYnI0mg6IktkiSyRJbKsHWlElsgKudBw0ZagcIgsnUt7a1M2/b60Eh5dGolkr41qfJl0qV76PiJZN1nTqETapMv0e3SVtLfXJW3teq3WXPVJ1CrkggAEINWRWyIjsqqSx4ngEFkiCwEIAAAAAAAABCCA+ou0SxfhkPLj8hBZC7TQI7JElkhkVSkLBwhyHTaGWwJPwk8el23dSBO5jYM8iVpFpVORNBLXvX3e+xdrpLU5U2r/Op6/N6WW2pxd50u1X/Iv1vQf55krlEZiz7TWp9jefTO1814SO7YTVySNzPn3pr/x1VLfbO0/rfSzpfs6tbTO+xV/3Tbn7Td79ao1fpyt1/0163uxnjdrjC91qy/V/9PinCnF1am1lWI9/+3eU6P0VW2y+ldGZ/2rQtWvX4VIZ0B1XOenzboqvcpqhfqLTpf57efHrjV2+3i6zNlW7Pc1nn6x3flijSueLvW1X63V2WJqtdX2/X3X+fS6+zGles/8FMs2RjFcrSFp/PF8+3r/+65QHBW/1pesdOft7lmFaeo/dZXpS+KZ94X39Z/6qlBaazSSViNNVeKQL120dQvG0BhmRFsiI3oQWVUDKvxMGRIZDL/L0lYKP9IGGj+LisRfYVVWYTursPvXVWU+81VhOF+rt534ylB3Yvn3wYz0VAFfCfzCTZ0Va/R+LXPGNOe/ZP2bs1cV0r9qMND/t6+3//ydtbXaa93X3pwxrr+n33tvJuutUP/v75T6/79T6m+fvr3kO6UVylb7ttpa/6t17bbW/2ptvqSt9b9ii+ut9V7N78ph7/yLYiotlfjyrNE640vqS9qNv17ykvaqUPJ3duv1WntdM++d9pKvP1tkiawSgkRkOciKyNpUImNNQh7RKHKZ5kN/68/Xr861urv/03txzZRmWi0aual+/5mp/U1df8XZ2r1vdvo027p3xrduTLH2rbVXuqv9eun+jPfXfZgcbQQk8i21aCS1llpAEmrRSPdK95670q+1YnfrGutL33f1/FXb167xSOtUT+za1nqt/UvtY/077/w5f/W3FT+l7pjmjSud/pTWit3rvX7t1e5vdbbZ1l2trrhWS79SS/M71fTpW0ASSv2tV6yzX2rtW41zrtnvrdXt/53umNKas0Ujc7Z4ZM64+s3ValzxW+z5Tndd99aX5nvxtWjkXwtIYtFITGnFGNO39TW+F9+9P2Os/1J7q1s00kM+8uVE/okDlB+kT4VCpUISSSsRjUYjq0/f+OnF2GqL3zrWFd+s8/T7V//rXK3FI/G2FvtfvD1/vjfTjN1mXOc/nY51xn6f3kq/Xlw39myvpbb6V6y1vfqn153trdni+9r/fn588+e9vVL9Fo/E+G3V2fPW9m3Nu+qrNa4241q19Xd9f+uaL92Or975Wovd+nbq+m11x9brxRXji/N2f7yt1fexRSM/WzyyaqopvpliaqdTrG++FmuL39ZdK7b2aotG7m3xyPvZ1un76m19/6Zfad1+H1en+lbt2Xrd9d+ikba+xSPrfZz/TpfX9eN8Hddbc6aY7oulpTbbui2uVe/9N+Ocf1tb8672ra4Zv/9rOv3m7Lpm/U/rrvXxpdid2qp1vtrar3Zv+lr7tr91xtWp7123RSPd4pH6Os3uGtdMt61X1+x2u2PPn/XNF1f7fy+9+V66t8467+kab8d1vkUjr7V4JPWfn/WuVLs7pb71Y2vtpjtrjd3fopFOt1/H+O/NmPrVtP5njSm221o8EtuMqa04703rpb8x1du1O329tX6LRtbHlFo08vNbQJJ836KRG2OrrWO//7a+zta3tq/39HstGmnd9XY79/5aLbb0Znz1re51uvyN7dPp8la68c15v093xxnTv7tWt9mika/f4pH5Vkq11e97Y7vxfotHuv2n9GJMtWNL82s93Vr6+956nc5aqcUj6U+X1e6dr2v37Tb7630tGonzX+37cXZNL6XvOWtq6/W/1atFI7N9u6fVWdO/tdL9eWe7Lda5/vVt8ci3mdJa98VuX/umFbumj3G2O+Nq0UhNLR6ZK7VkijXd7zdjmq/e2mp8P7vre61FI3e1eGTdbwFJrtaf7bXuet967dO9762OveJa8dVGbwvRKj67X2x3zff1fcd42/q/pTqNda3xY3srznPf+661BdjWVleMd7ZY3+0a4396M9betoUevzpfax27xnnvjv0437fU4ryxz9IGkhoPSHIiaZ1GUmkcBCSVRvpUVQA4Rp9tHLdO+5Q8jmhLZCz/GLuUZto2HnQE5ZUFfJ1HhtuYushaa6vzrVn7T5fY7v273ipdZjvnS5/YEnATYrhtyC38TJtGljwNVMCR+LcEAQg/kRyKpJLXjUYkDfzy9KpBk4U+m5jiNLAjidop1ErgF24k+IWbS6lGI7edLinFmuIKjh6CUTR9+aoa5ATFdSiRUfuIjNpH6qyv1XV/3dT+zdXiar3WbKdTu3HNjnO206t1634rvnf6l7El4Eat20ChtrGhNG5zL8SSt4HbZutCPA/xMrtqkBNR3Lz9oAY5kcgHKR2kaQMhGF14KiIhXITcUF8oguV9J3Z3qinV2h/j69p+zvf6pRg7fn3ds3bPeeN9Lf631K/VOt+sK67Tp9/pdVtqq31986b/+FpNMX6tQbZOe+9vd/+vV9ucXWP5dFa6a/7p0jG+Gu/7725pvji7vlpTujPVt9I96bY3V+ye87s7xXbL/ZvS69VaTCnOX73ejd3qSqdLqx3f6RXoL345IV/Tz1jTW+m+2l6sXWN66/QKtFnILdVpKqZ6g3RH+60/Xww3L/wwmT2JyQJJiRPH1IVk5DIqcjKSNpOJI7cEXCY7rlORE5DT5kvv87yPG1OkTQGnUlUPlZK3dRpQfty752/H0uV8D+nyouu4TqV04W0JOJuo0XVcZ+RSJe/DxlD7VGT1ICWykg6V8KKj2+kLxxCJEzXNiaSNoW7EidxGRXqcgyx5qcqWgBtJG0qzqMhJyCNykF4Bn0dRqcTtVVZ85ZZJqslLly4rFZcuK1lWJJVUE0k1EY1a1xFhlzeEiRaE2ojLtm4UuVAjkshIefN0OV1a6ZJqIqkmVLqIuKVveUet61yX1f3lS6qJpJpyUkFpW0iGm8iobdmWCvG+DCkujBomIqZCTanjSN72kZfstI8UaiKYrIiIIqTUlzFqXUfOEZTXX1Yk1SUnlZKX+kByjqCssiIn4VYKL2S4hWieViFFxFRYXXhcSKr7aLnlnS9mVzZ1rgqQFlcLOKaL2ZVdK+/MWd/6e0/PcMjPFk+X9L/aW7/+fa+S1kvrvdlqTCuQmCJ9JpG2hZlRwfb0cdYBG07ReSoeje+zDbcqXRqFhFIImeZY2HBMMxFhwMKqHjCi0NiwlSgMXBTi5hDyiUcGE50gEDAXMlRgDIRTFkciDkSGy/HIHKKA7ZwMcL7zbJyyEEbAkqujQ5MzB7NCySsMIDKGoYPBELIVT/iAYlgxGGBVFxAh24JFqsET2qicrAexcyBaFSjio+MfHQ/hRigBAV84u+MaAwEIhokFJBVimyjCrcpCo3ugdExsgfcoJqKjARHEqiKFRxAYOBYcrw+EJIQHt8ATEeCHVV0ac7Qf1qPFyWdj8xF6cEYZhhepbIR1YeFzoViVA2rhswolt0YZGNUY6WixI/R4vNRhOR2WKiBgsTKtKoJk6vjnoXoJGkHnQLzAmo4X6LBWdS0KbCAg4E1GB1AMgBJGkoQJkgrBL2FBVDgYEIZWdcpY20Y8AS3SSwPhEebRolVpjCMfIUh4qhh3gzU+Ll6h5AwO9MAWoHi0aFXYJpKEbMUrNpOPkEN8CEMx23QolLzz3AtlBNKRoh5dIVLRKhh4LpSUzuq0HpqBUASDLBRqIX4ailVRB4wBNp84Ks5tbBiKGaXiHiMjmlFwKG0ogW2xyEhgNAuRYgABVQZoHBj9yCwgklHw0JqaaUBUZCofmYWCQTQgLcIvIBcYi5oAB0zASx1FQAwXRvFgcJkq4RATSrdFpkJoDhTOET8NhQEBJMJRE/dCuUgUzKYBA0GRQ9QCROMhQsFsLIcbkYm4nQKbEc6ouxgFQBpeYoCBQvVSCRaVhorX1IuNrlNFCrvR0MDDqi4qaOo2YhOqaK0KY4IZXC9nGF6jgHhwNp3EBxZSQE00Uz/mQQSzKbDZFZ8PhwEhYgUCtGkIcCyeDJAdccXKPG3uhYKZAIlwhdN3gBpoQEaPEJpOEKlJtqh8iEiUOqCUmdyqvu1CM57mjH4j4YDLVIgY44VFifulw00bzQJCiDh5tmmjGTMw9QGjOmAMsLSCUvE6imAolQpKxSujDQwlg9wLxaoa5Fb6SNvmagkJLJSpSAdZjQq2jNdGbfMwjt7X0UDPhnOYQj5euFF8Yyrj2fC+Dkfaws9H8jiejZCCbYTieDZCno0Q6ctG7+t4NkLv2QiF2gaCma5LdbbQgu20oUI28e9jY2fzkcgHDtQwztdTqFWEWwJvATeK24YS+LyvwmLOxI3eVpIoeR8GGrXRF5Iyj79RZgvRUBKUmkZPguvEVEfyJD7UT+FXwBhmUF/YIX3eV/FxowYava8zbuIoFeIw6xXwbX7ruIxLM0aPCz+bqEE7TvNGqJRIxjZq4eZtns/gKLyPW6CFHpALSeK2mV4Bn3fyUlLkTJ/cxJTsNG/jSUhRkyKklChJXAeCmhxT3wKtkxon5TfK0rZ5MvUtCD/ZwEmP00JCPG7kSpv0PulpHShT34JNFDXk7Gw8TYqa3DrOJD1NhnhcAk2U3iZSgBRDPG4cN1HKTWSUW6jJTdxEMiQZXBaygUBQCzMkthDto9GEWsnTxpCos/nQl8h8ZgvYuI3RRmAUtQ52CrUKFBdmiDqbz79ERnpIxK0DubFLVWwJtFC4OeUiCvhEPA0cRS6TJ09iJDSFJHEABCgAAQZwAAEMwAAS0hzF7uRxBWjhxguJjBooCvG4BF/F1nEiBEDNC2Xm6ENA+jabmOI60gQV/AQVfKnSaQGK9CE4UaSJAb33SwxIjQeEIoEKxAkq8DztI5G8lGmKYSnUuNHTJqhgGz1uokibCH4TVKCBqI/03RRHjwsf5DrTLIUkF+mmiOq4cZZC0mcKwVkKSSGht80TKmTkxtGHYPO4zrSV5gkVQqdH4kZTBLUu3BJ83sbRHJIScOFGLhjJ0uZxpm0jCcHP5HFbiAaKfA== ]]><![CDATA[ OE+okFFKnKNnmt0oZpPpE0+hhsJayOZNEexKc/RMIQh+SPjNUviB4keaYUf6Ru8bvY80RZAzfSETVBBuJU1EnGK4Q20EgqXZjeI/HjdxiuAnsoVoKG6GIDiaIQhuXfeRPraOG30VlW8rcRuV0UZAkjpwhiBISjBnKSRNUEG3lT5UCQRnN4peCCduJVBDjdxIRM2wI80Q3FlkjVpnmmIYTlDBaNq6aTJ9pW3rRvOECgHlZ/IkRt+EHD1uC9HATjt5WjcCuZMo+TYx3BJsYdd9pDn6EFQqvsnYeDZCJU/bPC6THic/T26JjERG0pfIhD4cUeO6jORGL4NfIgOSCrYO5DrsQxmhD0ezUQl9OPIzo6hlFfmQsRZZIde5+yNtIQVbyZP4nMEvw7RlXbdh+KsO8TgRkfO0jXuNoc3Tuo+L4yaKma0baZWRxG0k8sG0ZeEY6rpURyJz8unTvmQbFXBuiMcVsHEb2oos+ZpQ121YHUncZutGWsaG0iw6jfRl4kYi3EZPgvRtRi2i20IS+TCatuxeHOF9AeDCL4KCMs60iqyNpHVG05ZZzWjaMr31vZBSFLcQBFMhmV8ik/qwrtswztO4eGv1aNoy+xRTT/h9XUdU4kJP1teCX4ZICAcqbVun6VLgBuq00dd5Pi5kC6WCrQNRH0mCXEcieVqnjWSCK8xy7HygUlxpq/CQiIhbxX05psAxdSG3RMYr+H3kFqKlQjwtk2Bq3EJS/uhxIRhuCT6wYvzAkIh2W4ItkwtGrtNSGDLE47xt3KLGdZrkRk/Dojgq2Ea5eVw3pj4Zbt42jlpnkv4SGQ3EFTV+oDg5sJS5TvtIIXJMfSfS5522biS3Ues+kZPynxNluIEaKLeLssSFIXIBydtCDRQ9LRzlpppaesORfKnJXe/FI9dxI23kShw5Ktgy5BZ+5L9ERqLqijdG05aVtq3TaFuYAb8Qe1EClPlQikc2O+nmbetLm0yjy63JXqXN/9pGrzHdpXDrUiCRVVEKtW80hhmJyBK/D+jL6DZQASZxNG0Z6hvHb7SgXgsUlLzUpyFx3RdgEj/E40oeNxq3UKglIH0d6hvFFIk+iKGWQCR6CpIEDqLXoRRoo7bZOhCliQ4JHkSWOG6hrRtpXKgleG3UStq4oSQiKwogEf7RCHF49mWSLQ1MNcBwwFCAFJYGplYDDAcMBYYDhgKkQMBwwBhYGpg6fhwwE3dkJ6QmfgI1sRMmUAvvkEDxE6iDA4eEOlE57YQqIn5Qq4oIsS9eFDAjZowIkXxERESl09on2hnJDjSr+uiIc4ADNnRcOAesqnIOcC4McJ5zoKFjGrCZyX3jsfF4oDxkGF5ydWw8GBYUPhuPUOFzccgwPErhY51EqdDAcnGwIVyUUtdrNPxBKIpQkGjQcHCP1mFVo43KyfKQDgsyEIBgELkWGt0DBQJDi5yDD4MBBlJ4BKFeA8+BDtFD9RIQ8HWgc2BgYk+ghJFE5IJfwoJXPhKDAafN6bNcKFdE8SmJGgxwJoPBIKMkajAIHdhoMCAA2jQY/AMFg4Ho0pdBdrpQDEIIRBoMcgJIYjDqrM7PhUUzFx+h5ykGp+ytClMZQCgCiczzEJYR5Q02rkXFmijQQXwqYIlWFhQ0tUHUqbg46jjo0FA8MZPfiZl8Yiar6qhMzHRNzORT4jAlDqGIg4MjFHlc4nBNJiDge2VuDHA2BjiPLZgc7AA7wI6NhpEFE8PIgqlCKSexgjE8ZBgeO4n12/B8G55vw6PBwXASN5+cxM0vI4ZJGhRKvlBBqfhEpG11ItI2R308lxBHiMOqQhzfBIlwjEIAK1D4mIGpE6gJO7ITak1NTEgoHjMhfprpkFATKB4zUSdQk0ogmFRgOGAkEEiMElY1biQY0UG8jF+FeBld5IU8F0qEVUWERIREgBygIPQPUJATh4aKcGhoxNXBoaFhqE8XCkYNNfWUPPuU0qcL9ZQ8GpYFCurTCB1VHGh/UEeXjjZCR+BzOJsGzgEOwmVVnA0DnNeAtIaOC8VzdVwoHM6ByUOG4R8YJCPLw4YhJWLoLHwulM1X0bDxkKQ6koyBDMNrRO4FB+fAiIdKHUCVCmCTCL03XVGxqtMm4/qAMEDABhcNMVzIOgfTYIBIlmwLGyANHit2DjoOUBQoAQFb+O44tYCkwo6JRSWMXCpoE0FQUCiFNBZaLHVYkmjiFRBwyMLU8UfQORALdFiPDtRAQE1ghNABlGsqHAzYDvTAhtaLoULCzuokANo0GGCgTYNB53ShGFjVRCDSYJCBQKTBoGNPXAbY6UIx4OyJy+BAzVwGnAMbDQYiDO8yCBGphOMivYJ28Y8AgdrQzpx8ILIQj0UlAeGD9NwENOEpR01ogkGFAwRDAoWFYlUYIg4NxSriKKN4DKWDo6ODg9JQIdE0iCPPT0wciaNQ5LlMiYPJQ5FVcSScLAsUsyoEEcsCHVkWKBZRRxeKVXGEIo7LqgiMGBgxMGJgxAABhNGB9hwH2mOVgzeNGBgx4LlQNhAMGOBUOrJgGlkwOdjh2eCgTEBADQ4KxoVVfRvfxrfxbWhwGHwyDJ/KsOskfhvfhudC8UIMG4LNfUOwebUh2FyyIdi8gMQB9fGgPp4Qx2gBiXDMcsAsSIRjVkURaZujPh5QyFYc9fFcKLClganVAMMBQ6EAKd7SwFSVAnTQwFSrWsBwwFAoQASKBqZWCtCzL1ZVSU08poDEweQTqBEDngtlYmQnVA2opiYeQ7GqCZTEOiRUq6omEiQOCXUCxZACd0IVJ96OGwmGYlUYx8iCyb8Nz4UiISJ+0IqMDUyVQKAgGT8kGAkEkxHxg2pAmgSCMUT8oJjHQsnDjQQDarCUkedCiRBxaKhVVW9VIg4NrTRE2uYKmHHk0CRgxhoRYoAZLxSMVIlDQznaQskjQhoqfd/YsCxQDeja2KcLBQN04RE/DcTBVjGkRJ7UAcsCHfWJdhBoGN5T+mh4LJRPpGJVtGJSRxWNcXMIqwpFngulAzoQHWivAWkKBp5LgwMCV0nRkVV1KJ4DbWIX0NARh0qFRaJpABs6Dt7knAOgzSZSUQA7PJfq2hjgvAKFp4INGw6FCUgFhgPm6qgUmtQH5RyQNFRYFuhCSiSxTxcKR2F+NreqzhM2dHAYLgY4HhMz+cYjFFXzwSN+cP4jcBI3Z9jYEGxeoT6ey8jCVQ4WLM4lo3hIqFa14dAoOBIMZXPh8RoN3/AaDV+Jna+iweJcLhELCdpb1cbDsy8YDAibTaRibTaRikb8NBQ6ApFheKvKKEnAi2XdCYcIgQqfCwWDISWKcEsBJMI/Gp59MfBcKBvx00xuhuExMIYLa+A0XCgYFTVkKy7hmAWKcXj2ZcF2WCrOGT8HilVlHBhA3LGaCisWhtTV8LEs0ATa0eBwNigsNKjDhqFVaRXchRWhCyBgeBwneA5EHSAbC2sh4M8Aio5rnQPRqj4mtvPASCYit4YKeQFBgd6PTgjZicGAzhMyRxILCFijAILHraqCnQPRQMfHBJQTELBVVTB4x98BJBUOMGV1ckxsGKY4LBVf8HRFpcMDc7hYVYQWK3OhIlw+HRsI4vWxLNCDEISx0CLnIMPwk5GFqyAsIIBE+ObgskBLHQMcHWxhrEB8PBTMJqVgcOmMEAWzCU1sCBsCExUN9qdNhiXikzRwaAZR8YFIid2FT0j0pB4DCBH1QrCiguHIPJ+BoA5iYoDHhlpVpUL8oBnFPiARjiAhYl/ACWZwK5uFDwMRJcqEYQWlwbiQ0FBLGE6JBAOiYogsYYixMJBslDAIWAcSCBZEPty0XRyMHQuOrZMbDiyUQ7OqjRGRB8PH56Pj4NLb6fpGUBa0IlYUAg4KRyQiEAFZXJM6sSDoZCoMZGBM1BCh4cIEAgwaCAIDsA3JgAvHQ9OwKgWcHYhXgmcNHx4YyeQLWGjKtZEdPiYKigNxIXWBsBDh1KVQsg+nOBApIsKEBMXDKHEgYnAIXEAYKEjkApfX43gjPi5y6FW84GGrAkUiDkTKJ3Qy9kYRByLDJkFjGTR0OgciwkfU/rKgjRQDEj7AQEtNGMg0Oha0ZkC1KBreKBOGE6pQcgmMkeNAYVto/3iMruiBMCDLNDB1gIKl0Yi4E8MBM8FwYWhVqY5CyREoZPl6DZBUWJmwRDxQNCZ2wmH8oAsXnYwBAraqBo4Esz8DYihCKJS8gxEMGMysc3AhTISI4YyQXBZohStYlchl2KcEEANIaFEouQiVOjB5QLjQFOtBIBViDAZYlWc80DK3IGAQofGFgIOJGY9wAnFxMGAEQ+RW1eFQoHxQGHP8YBiw4UAQcmFxIFrVJOPiw60BAmNGJGIYYQhkQAgc2LCqCQaiggGbpaiEkwhUSVBSphSiEREAAAATEwAwcCQckcikkrEidkjyARSABF1MLHhUSC4Vh8PBQByOxDCQAimKoihkkFFIIYRqaqgAExlAbS/TObn+ZmBfvTQvoSlF1XvjrdCimKqq3vOhHlBevbsJDc/XT2VLLG1WvXhCuFcvus+gm6teaqBGcSD4c/EXWPX28lQyUJ+QyukviFW9QRh2N8Vdm/yeinwcnoBpTXf8NBFiHjDbinx67a0jQsSL61YeFrNjnYtARVBwxMJ9+MnaOt/Y3sDkHq/Tn4OpayTNUxA7HOfezLQtisJ7NMshh/FxkHVjr9wq99kNpoc1juqXh/jlkEXkSACSr+TXbgEa6ixhDkcCAaS2WK+DcjozpICWH0B9jGcl+cfhoxZFTNich2LVnniUuzsguPncpDOXzRVjqhhDVp4SktkSDry/kIKDC+568KuoZUOdywj2L577buZHE0+i8OUrn8DyKIYysOmScyAE/mwghnK8EopueVHf6kB/9BUoKMEXcuhUaWFmHFSE7fvlGxrDirJfSGufhKhzoFgpCyFfTQr2sXeFda5VW7vzpZGeiNnuTZw3xWw6BHHx2dybM5zak+0T6z+ld700/8PjjLPr7EsSGzTpWMji3ZAHE/Xd/Qk2afJcMWpEGY7rTihZPE+itBFOJJEl5y+5zFk8ywrV/6fO4d3VEEevK7eEim46DcREq3kw3q3HbH4PXBFwr2X4bvPVez03KJ3cd3fZLHeaGIPj3V2Zl7sFR6ZEPTiiROJdz8fkjTmwTeHd1QKD8I3kl+uixWB3zF6dQwcQS46XlvTYNt9dQqLv9AP0UfGuh2TB1yPnEoSnYb1SGkMmmbss6ene9JOH9O7GjG3OGmd4CqyXKjBUn7rsoAOnpd2atTxBe+DIJ7fZwPcYCqnmGMdnh6oxxSTcK1z4gY/0QKOohUfpwY/eBEvQRTPMfDNW3gWdwcB5a9P1onND+HNumfFqWSPXaorjTZvJoS6BrewuxP4kAVEpC/LSmQvHiFE1CD9hdEfrTWut7qb0vML8GgxeN7PG6Nh4hZhZo3DG7ogJC0+5WiD8ZoYFo2C8XIeGZE8TZZHVOLTR5uGZDd7mnw== ]]><![CDATA[ lHNtCghXmoxCwJZxBW7jYBlZOjL4jQJRaEgWMPj9aBh78P0K/E1ZU8r8vaEgsPiqtZRq5U8C9WSakOJOadUTi271MUIrLeqYbCPSjmqem15rdjaVXjf6yU84vICt113fpOSmo8wmAxGtNUIZCfb3eKkKXq6SpLWRewktt2RnR3kPZkRwnAG/wLhV3+9JFlx+Iitce7ZhAigaORwP75DI1sDk/G2wpJDFXd4bN7Yi3ecBczxH4hwLe25L89QKeh14A6W0AFeCZH635N+0UkhpZ5M8MFAsyA2UhAu/1dy7InvvOFPDjv8dVpcMp4d4mpE6vXeHdnXDbCfphcfbrsDUvn7W2kF623YRQ7JqXbOzx3DMRUXLk9khYFeHP+1q5PDNL01QfYiFiOUhxVSFNOsX0FvSoVkxyC9wS82Ivbj4mjuatLoELTgoRTD8e/WkWnaM9mGcmsH4lePKPrbGc41M6BQbexHiVUACjerUks/upkDL/M+hEAV6JGF690BrdeCN41AZumwfPCSmfR5jck1WOdodWfbEkT8irbGsmBhy48wFxvXFbR6XNbQC9lZN3HrfaQYKFCACy/itidi1KH4+R/cK+PGiAdIHUTFqiY5zdEOxfdAZfQZ4O7omGv6xawhJZitLIFTMlhxdvFLcM5po/qTQERk3DkmUudDqS1h0/VhF4sxY8ehGXdpk4Oqja4g6zGUHXcF2wqI76np01afbIVDdf2L9FQJ1TWjqoh7191+XppMmfEN6kvFi2XvEj0v/BEKvurhODHOmTPL0IrF14h0YVAF+V99nGEEuvXQE0/gOUPcqf5hxyciF8VlrrJFiRy0ztyNFAKWYZOWVXvJFPcRw5ChGm+/awySLmEOt6iBWMXO/LeTMmxRbZmw1iXTeF1JrLzhZGRZMAGFaNzJFEXE/0gDPyzuUslqNz2mJp3m1huyAsAjp65U/rGrJJNoiCJRo/L9WMKn0getL7SRC9kvRurzUMgthyiZShY48faE6+6S6k4w8tgx69M72jjA/EpqlRAkZFvCbjOvE+/K2yw9Ei+DDlEeUx56ut1ggcrfE2GqyKBi68nuMIun7DjMPx0TMWBVJh5OKyuUcTQq5hwxChr3uslbuhTuyDN5E7Ehl+xwjzJ6wyJ2kXgRfzSXQOuB6y+kO7OtrqjnSuAA4mqj5Hn954+cnQQKe45md43ghQCADrw30NHlS61TwbTxRbD/yHOhHoqH5zXWL2MIPxGF2e4AT1hVFmOn+tW4GCf8Se8gyXYjg0YrGsOmdzpCXrjf7yxdKDTUF052fvCWlgf6wR5XpgioVeRnkKt1YF6aLvwnHGgpRpqs50VWglTendCeLmK7yvBEa/kUE07UBgMo6J5ckc2AxXc9m4m/X+QtqLoM02xWH2X0Osg4epgmJRI8iYa6MoPXrGJO1Ju9VhskHj/z9mllylU79W4/xvICpUl6251uhsjISSh/KQacCXGmVV8C6n326c0sYoTKMEEsB+Cv1Lg2Vy9v4Vg0pruBMjMoIKMD68DhEdaAzrYkCkki2VRlss/TP9X8G4azexmCrZd1KYu6jLr5O2V2yjoTuuCyURQIG1RImnqWVMIxVRCfum5mRARW3uqJkjFiFIedUCFTJbU+6n0LWKwSTxeO4ySQPHncQ8QglJtNVeD9mlpmAqjsiHmwtufUNL6jkWx9FI9u+4mWYpJhD62a4saSioXRATLU7h0Cb4Q/i0et9S/gUs0QbKcAMh3iexG2NqeiquYgnAsHi3S85dmuQHIxJCKVI6GkiltqRZYliHbDBWP/b+uUTKauNtr8klE8o2c/iqCL3Mf1M0RnHzApcI5sdIfpj0a9TvvIUgRiogTO4SxIguv9XareQYoDlkW9kjGHWiwQjXIxRUhjLdTXmezkYKQHSohiSNcVaL4tBIaOWvGy9TiW2Li1jnLF8ZYHn16DZBWUGMMiFrCdlyOXTWH72MFN4thvKaP7iODNHfOBjUMC3l1WNPz1NPxyPPX84couFN2diJ6DPpAeza9N5ZEtjOkz3AYuEKvOvwN1J1WnXOL2y1yjCWZMXdeOWnKi+5otepByJY1AO6QnMFMjJWCQjPL1RfpgMo3HpANI+EMTZpFGWZXQnvrNK8a7Iz18xd/3Vf9/G2PCyRAbroYlxI7ONUDMSUs3758td7nniykhTpTSEhY81Qk8zq2OinQZm91nJJYOq6gwQqyB7Jgb0VIboGuohBEzerBRmNjsrrYVyrf4fMry42YpMQZz/nKUu6wb7pmzrHBBgZdfvPZVMAlFaUprOA7Muzjok1CCzHQmQc29ouqUe3y6QxbqiJQrMh3/rkPRjrLq4hIi8gTZmeUM6RjsMhqkdLqgvWu0NCo2LhfXSXa4MlGOunRpWQnPvJB7NK2qsGY+V184XpeddFatA5hZtZd6NQ52pSRYckViKx+gV+zYAhxTDz6rHeNV3ZeMSbbRwO4nV2o+9jBbT/WzSJXa+hN/Zo1itNclsusHqy7Q8hmd285y63VZhkeq3C4mIjPpF9ZVsO0UdEtBfQ+Br2gVD0e7RrVpMiRjeEN6NCjkKLY61tAPAAkMaS1NfbM01ZicOMmWreYRGAXNPejTHx6uU1TwRHc1AdE8ZhbfD9wGZtapvlWwvAtu1YHxdZRBfEIIPX0ltsRBet4TNK7syQ/OKG7IE37YKwTZrel0SMUp/XUn2/ercm3Owa812MRgfhA0D79P7FAyAuSmGltCgouym1ThLVEa/WLFIoUrDooMF9ArLwfax278UEe2s4cRn6kNgvcY/8P3zUdWUyRRZO4RjRvFvRvDByanPsf8pozeYdQCCB59c6KsHp5rFFkS+CwKV6vN7r6HIMe5fGEdeTauIEx5WpjMA6MJ84t4uJtV0V2DuqaAVgZpSezEiTnSF3YmvrdFQ39Mrwc+9ulY05Db8eDPPJs9YTeFkeHUHj5xxgxHntMfZd4EuKpFVeH9ODpXHRa/SwUsSSMADiUDTCXSVzY48gNbF4saPWOPScpZZwIebMbl8SHyOmNBvH90P6x6x4zgd8TL/ZA9vvC3S8j5+RxxrsWfZQ2UrPj4HOFnXHo7/PDyaEVthU7cqupfEQrnw8Z3zW9nLMB0VFGl88o7E6qwsYg8rdBAScVqW/LiHzZCXnbBFXHCV+EOG6Jjl7aFgidmvR7wzmaT4SLsm7l5Z/dLS3Cb5ZcgZYeUYhIsCDK5FRHhryUBSjmXjsmxVmwi7fzav4rTFWTbVQHmZljLOV+vN2FRrmZkyEYXWsURHC/trYZi9QSo96m/Hzk6YTBW4GMGyPpCAP449LKyfimD78N8zyhRl5kjul5Jtsei1ye15Ct4uDdTV1PqI2VV5KbghDy9RzXz/tzar8f2W9B/jITV6dn/VtAyBbRgP8jZ+OazCt9hDhsAKn9Tkl2BHBRKqBn/rjy7nZ0ypcE3VpOq7nYcXIOFtAmO8UzsSSKB6BIY4w5Jv2Qw5IdDAqiHJAju1ECUjl6pWiMdo5YcaxyYQQBhIux5h01j8td9WL7bAa3Q/uon2Lr9aN//4ogydGBpb8qXECgtzFwvRk29Gs1byx8RQ7a2l4ovqpmlaZYajoky87Mxx8648zcVHEyNWL6Drjz/jtdwPxtI/MppRzI2veQ6/F3uDKZKTi3GQ5x3hpIktuGpm18s8a5ZdFj3yWfc3IwHwbOnGm2Pl9PQ+k3rZ3opd15b6Bqv2u6uZUCcz636ldsHgMAWrKdmZsqKwFcsK5TK1ZobBUYjKhWn4XY7PsG1hqcLM9xDCaeVHCgA6UJsmQs9w5TTjbcCO7bpua4OjJ3+bPhMHOh6wZy9ZuQ2QsR/WbGeZanJ+zX5OipGalQekyCGXDWlOfXEYP6U3cAQGHFaKp2CvLGLWmcMFxF71fAeGd/RYZDOpH0C7yVH4BGO8WvNjS4LXRFF9Y8QAOOAbMo8WzPlMFZfms5i/9u78wqwSCiODAy2q4OX9pEI2ppzbobIhFr0mhvThwzd53nChEFTO21qO84MHYMsENA5lnUo6/6DsJGw3sfnMl56EjKmYt798CGDrA5uJ4Q6BPN+FKPSJ1ATCwGwkvMFBCexYOBivNvxE4pk/pxgWSLpsIuHmMVzMmxWmj7X7EQODM/IxZP64sHt+nYCMzpshQlct2pcI0BpTcmqGUTbzQr2qkIvJ8CZq/px7w2XsoAR9VXiIICMQ5GNKCDWczBW+90oxUOvLrBwfdkOJGt4DmFbNtcnMDDtbNPYCHHiHpQX53LxMRAISCDETao+E7H7SHGxhodMWca8bUGe/IJisFEQIlwLyGi0LR4zyRYdVxw/TPtbs+PVmOx0qUzcvMysrA6FL4bb2eMb0SMe/F+o0zMNMURiGIdqyF1vnMlZC38+VOjQdrgKQcnB7K2gdov3pp05wkdUR1BzGN7cOkIysVuiDQsM6+YlUzc8EdB1jMQkM64Ts/rXJDjdhqFGShaYqUQj24UfVgEB7/v7FbBTia0Wqv48DmROTZ1nXzzVRbJpoOpa8QjGXv0tZalb250mGOmSTwXO+1q9QBZh54j1fmOwdu2/IGzdaADRiv3BYNRcmdXZUfp3RoeEcqb9AJwtjjRYO9txzqAMJIkreqOCiCjTgy7B+UeNkE9IjOLRmdCJxn3qoXuqHlNSajl9r0m84hWLQC3zQ2vcNRS9YXoUH+c4sv2jksY4IeFxkTqL0ybTHPvfODdsNAn4EDZQcINJzrTmw+FGlVRjU/8lfHaKGvh3bWzno2t3Fu/EwsRfTwNuuBZl/TFknY1Qwtb9ie9NhOxkXKu7iTPFgGbDjHtZPUE3dY7TLeKZPuefn3LuZ3aUS78xiDS8bWpCxvIk4X1FLKs22YpisL5nAKMVyFMS54RCytiUfeYGhweR8zmher2xTx4S/iJmolkwLWO4dXsUgpI8y8ETlvPKBJCwjXVHTaop6SGmzQPA7K1Zf2gY/z6P8MM67oueNzd2lDOxmPlUl1LYSK1G2HCTAzTDgLSsivYjijhs/Vk4c1hdMkbZniLwHdXFQoohH12fA8DvhjXvxav4nzJAJXcREHlneMEkIboP6DWFeaYk5XsH0VzDnhuIrCTJ/AXNX6691P2bLq8wuxPBPoCBxw8fHmOYn6Egwdfij3cOFl4ZvMYcq0yH4WvIeditX4TbYAGfASkuNh/pAnKLm89fg8RPFtcZwFrsL158tgkEmK1I3kHt8fAwkY4301GoZmADw9wHsHWju6pVgAwRCtiCw0NsFmFVwl6yhT8x7leswFNOYdtH89xu8AGeA9c30511QrNSgYHoclqyEIfwOmSm0f0maJzjFKGNCcksPQoLuLH6dbs0SPHTmg8MT2ptRdEN5eA336tmlYNgvwqRVMpjQqBxGM9kiDBfHb/xm8Dyp4StCRBqZ2qHCCYI6lx+MpFK1I1+O03H9Q+GIn5qMn/rLKyej4Zp+gAeCTFJyTErGwvUtddC3jkd74A== ]]><![CDATA[ DUdmNuHNLehPGon+nU9Wz4N/GW/V4e/NylMxiDSe6LBXTxwcC24DmjNb1YnVteyvrfTtJGYrRS+q4IssiZDMKclJEifcl8x3i+uiyImJe2d6hWsXIV5/OAZl7N60aegjx17ZTHopD+L/NK7IgU8BN4WJe/HFzgrVDKCaKlT5NbACR3VnFIfVK+ssBelfGjUhA/uV5wRAdl/ShnmjvtxzYWpqzXlbLiPtUG/pH1Z2I03zuZqNL1VguZst3c783GS098Rd3I6JUrOK8souHrO5xYt6u9I4jOau4/4s1hpRu/1y1A/DAoFTq+XiVzrNVyTOsEgnLZszWI2L9KiSaqoVo2kPdFs0heDDRCFHyrE9U+NtvT+GR3CpaxW2w6X27KxWtnQ6ScdQ6vqb2Av1NQ5pY5jZUeIYzx5Y5s4nqJzkmz4PeApiZWcEX5AxZYRCrsX1WxAVLjlQuFquz5GBB1RDDr26vwO6xMvvNfmFoz7P0MJspckkt8DwyMzJw1WS07ezv8aXt17bN0nGTzBzZv2/TRiYiEOCgmH2f9yglWHY+EDcO0u3q4MON+lUtYfgn7ltm0t4VchiW1uMZDYGLPo04gSaDnIRbLQSCYdzpVpnmp7gmxiLDHPadmJACVKNrxcjpx1kBBvrzDMf+KOqcbKSA0lq/qtRxAIlYycXWOpdrlEjcFKYKhjCsBIX8Be2WtCUCLi8d2TPx1jQWz7BsJRVbsKNB7xgaNCgRJwMVE8Dgw68DQ+S+29o95KBtxR7wJj0nB0Js5mQ5UEyeZjbEAKHtVAQZXsTBwCfkzQjQwDw7NY2GMNON+ehSDM8ow8o2Xme/uXvczIX0wbT+JaZrY6n6V5Zu0zru4cIYjERMS8VKFpa52chvvSAlgRrxEeKqQYd2Y3iPBXtJGaUnhbtFgStLIRUp93f+CHctXwGXZS3uWZJfEDBaR78PYGto9c/PJ9UYEZIz9YZtwWaDs9SZXJgqDAuEqyTNOFfK2OoFiKN9tYMGMJ2ZFbaIOIDw57LQLeRV6ZStURYWjxDs1MYKFUgreMkDnU8PNaUZRqcWBulfRJySBZuCi1XM56h3wxL8+4Uhc9HYgfFhnxRQHom3zXh9QgKA8fTVSxpBhT4wrUPRu5iKF0S4AWKMKr+trKxJ25QA+lBi+qn8c7xStnD0ThiYeEryapkumkfeglvHg1+wUenrNF3lruvTMTelxryg/H0PiMF7rkoAVJIEi7wSQ+REall6POlG0DQstg1cmEkRfcjszYYa6ipJkDum7oVD4idazB/RBHaBqYpRNUsoigiGnBDwoG2Zk1EbQ2M0M95ReLqGr+LCvqVH191W+XNUP9TYC8Ijl+jIakHTbd+kSLX8kElQEtBLfOCcoDZPkoHpHwrChk2bhoCz1qyDwBhZlwHGAeHbU4vUYRtX3HmdV33ILvE1DYX7uHDpArJiMKfLSxjZc9pJFXBJkTnxN+O5piKG89xPbL/6qAddB9E6obYktkzgZcAJNdj8Pk8nDIn9ORPryf3f4xIFQw3Rbm+nNB3IgvyaMBtX8xtiFuoF3CypO8VWDcPEfPJjILCnE2VOGnpd/UH4/l1Tm0AJA/xubAXGe6gkp4j6BvbOiR4LH0ml3F7bV1wpIvWw1n19wcgTkEbS2dkeRQMqgGlkYwHcL+y8VTPzqrqWitpdTQfMpJzLTCpaOrQnVTYEgqpK40cmbaBTc7BY8rn69TOxfVerW8oS9V4ecwum+XoYchVLekX19qBG58LA95CmGV+YJVkwgeZ1bfkmpgTFSjSRhpqTAnHX17oJs03EfPP3JmgCiOY1fKRFkzjJWONYxk1mB6GYPlXn6t+0Gyg2NhH1P3O+cfQDjiPgLXOpz3d0+TBZy54hOtwO+MremHFi1NPtDmd87anoSGuFhMsB7Da55DncuDce95W31U/FzTAr5tq2i8FEZWgs4mJgirQMbs1BfAIxMkwbPlALmkB5JLeAcWz87UCL8nVjV7MwWIeAoBsPKdB3pz81GFLbAbssz2FDEf3HNZZlu8M8mslk9BsIsy/orOXohrdEbDcX8HyN54kREZA2c0t+/nyZh+dPpIaTcat7k1HO3nS6wv3DZkALGoPXBQ/10geHLUswKGaeutqsj+z57sJGZl5hnvNA693mXsDqOSpQ0zQKgBooIVPGRPTMEVD0KGUTdSvNpVQvoIj9cgSRNMzLSGvwS1Dn5QR81D6IAKaTPINRn0fxt2I2XC0xlv9smdNkKPEilMZXwXw8uXPvCdTPP+7Uh4x03FhkUYDa3WREd3T6cQr5Zmdq+kcHFyfdS6b/Mr15QfqyDq6nCXBXd1UfORVZY170zZIJxRYe05VcgQNEOnEr37+Uw1Lv8awGv/i5n9FwJUXTZ5da5BpyB3blOEJhQZhEibtKPl+l+CTfCH8jiGKKmI8hEJfdnIzILTENbiZisaSjJ+tXr0jB54CmGJtkuQas9Cxz9J2xXcKtmchQrJTSc1Kfc+GXK/HK2YGAawh4KMFvH/rwClO3gyO8VTSoX4AWrQSI2ybeyNTeYblSOVzGv3acX0WKzu5Ea0p7fypmmVLZ3Z8dvVlrpAgr5MBltIG5kIM5FQ4hkXItvtSmhykybLnwmwhzTml025rYbP/CF4HK6l1FEpHO4pAX/K0VFn2H2gww8N1ZmUeEI39OttswEe1cAfJO41xSrUmQuc4SSPTrPzLyqEhB588VMwXDcs2hfFEpi3nMZ6AqN16+o6dcTwnpKq91rUYOuRxup445LGW3W/Dze2NC+cNbN69heMoDEcVNgjHUI/b92RVlEsgso+57JaeO8F+a1NeYL4wdAXi68XCwrq1+S9ZIht5xT3QJdyAH8RKHQIUjuJuDzbQWu31nKBAKppuf43uPRldtWKESRn7d7m4NunJpx+2itpfTdYiq1EESa0L9x5ONAhVwJc23lsJYg3T4GfIxBphKC7N2nJBKjS5GHpXKlfgoPCTvfwUIA3cPLVA5gGY+1aQ2jazszWD+L63+KvBSdBqmBiIwJ6ukRaFEuVPs2qwuo+W5LtRa4bxaeXCjOVVCRJv1VNuYDSIDmivFpA2DPm6xuJshIbQgW7GaInguCVJwlxdvgco/+S5cvMwpZDva42HsB7gnvfw23AvmQ+SnYSU9s2yz5mA+XY8+P+CznyBF4OXTQF+n30VxZiq8grAkGn2BGYXe4ItcHUrNNAD/4AC3DbCreFO5QL+l1lqSx44OtGI8G4AG39xCBsEK+RPPYmS9jUHAPmStVKwQjXGr5LRW27QNfM/rbZASGleJCvH7n8P5C4cGyrYO6I8z6qzOVgCzGGD8G5aQWOMhepsKAsK9IT11b/8uBm9SxwPYc+RTPdRfZIsU5CcqWq9K10WtVQHtY7HFKsVgPHheBI1TlVbPRl6YFiRBGZ2YzFwtZIF7OwCjNfe5TEY5Go2i87ATP7/e5yUXO+zBeExNwSFAk/3i3gkHCjheKmC8MZf+0LiCwXGmQaoF5jDXQJeCTRGPAXdvmQ/8NishzZHv6XFHcf+FlASlC884K6S5IXqFE5W2HxnfIMl6Fkq2Lvc1V6oDoNVxCbg0mgUWfuLs5NSdcQ2RRWYxXWDdR8tDzfmejf9hVB7mTWJNkAIt3ZqZtwcz/LJp2tzfwPbEmOaLrEVsUE/KaHd/YFW8AAi+taNAydobaFmZ4Jwz4iq9y80CphN78Hca5C/9EolmF+oRr6UJtKs9VWJMrABgwTVMT9yxBJZjBZW7z/WoZ3Ag54bY8sWnbZndrpgI6QM3C0sdXQ10h+ymylkFbsKKntaowj2HT31eDO8lnAOnofBx6qiEgDNspRdB0MMpaUbzT0AZab0iLmyFXyhUH5HKTyVOTs0XCpuDxYc/AR7vBmUYSK1wrKrLvy3f69TBosXeGlbE3K7d+g01GsZGffDU6dxLro3VSjnlbKQvHrroFhUIQSOwBloixKAGlJDiwr5dM7gKYEWV2IyAQHBlSELWs0+Uvs9oCZSlkVWRaqOauV8maSj6xWU96mdrHJFza19QXzA8BiR8giL6yfrk7vbHEw0+WiLsfZCMKLF5vDr6Yid7bCFiaz06wmvwmMjweRLfr8LFtNqs1WYuRHqv6HJg+r6BmlJRKgx7u6IO/Vj7xsdOwgJWKRByoRURp5Bvv+RPZO3S5eSpINVIqBTgAOwIe4iBmac5chYyaZEoyvJd04AOsORlFgPgi+QGLIn5g69T7kkjAvhkz+iUouAao+01/QCjr8Bd2aheCAsLps3cByefpmfxzjApwAxzqfP4fi/pIr8EbmwbxGUC8ybWDLMlcEDs1bWQZS8toCqj/IuKCO6jo1kkR3AOAC1Vm9RpE/IwENgo2yb6ESToImJaMsQLjk1aR51Kz4fS8agU6g7/xoFPw0jCjIZ0LC6XACXUHc/zt5RL9rUrTDqtviFivikKDG64DRpqY8Mko+LAayeWnD+a8m5exx+RFMzph1b2Sgimsv17/D44b/BEkHs9KunNAqQGi45/wnGH4A2b6e0Yh8Gq01afJUZCVoR0oP1gBafQzkOIFUSW+RDHrGADRIk0DH4jxyBsmeUjGMbUR1wfbIDtZldMKKPhyme49t3jUkLE7h8hYIvmjNbtISHzH7oe132dXzKjj/8Zxe2cynqfUtPHXasnRDiY993jsj7z5kqnNOfAkr7x0VuLrVBfdgMQ6eCHOQ/pvpXSirQZB2XS02s20CnJ2FDVBmCYwQKiM4horBeVGu0xvD81idGn4CGYkp0HXgVTOEdVmETq34k4hVHC19+0vp9hdSYIvEpa2r0eVmIKEjjDPoQiglCmC43f0IWdQ0C6J2ePlBo6giX9CYRS9JglMbUr5YLx607GfbJ5u3ThAMaygp39ga0LqUsAgp3QaBkhz4m9oDo0OSP8SDisQBJ6g63oUGLbv1rijof+v2QQcLhxfjR3GX8Xz473Otf9RA8j1kN0KY3ktBgaCtBz5//8U6hfCq5Ky1eNrGXHWrpdVhbMJkyrXaFEA/cqbgE1A28RfihpimrOMKYg0Zh60VBsrC6UvEV0Hh43aoxCdEyWcpFgQIioIFuBNSP02eoRddWo2DYiAvKs4xMeSz32sDBRhro2gemlefNYN1E3iaN5qeAti1zK8fxIOLdF0FOuz5vwkXVIeB+3Wpjrn+FNFtjuQwU6XSMTsOviH1gMbcnYtchzzO7+9gYlVaDcMN5HN7v9i8etSb39X5ZhOgzSVBNIO92uouO9XximB5w03WeSoFEi+eq3kIT61Goy7sK3EEQtVUJ6V9EgimmLK1I/0k7MMZxjvuIFmMFmDzQMHGAWkxqNJdxa25OraQpEOvG458FLF59SpW+yFQSJ2lKEPdYItGR7n5ubrPAk1PhjJkApMPnx2e5IqaI2BEDIxCh6l8MRB1fi/p/f4g91m/4GJEPuDu02RdxVk/FN/tS6oLdB8ZVEETJUS+XAjVS93MSnA== ]]><![CDATA[ mNwnfbc93xQwkUtiaqA+re6F1HkMBZbyiVuNJ13R6iZ22ad/iKWdXq6hOLKlHbz5UONocCoUh5cNvJ2uNU2LeumiM6LcYlsCehkJKlJYIork/2Rlyu1OKaGAoNJHMYk4lashnRZILdULeyjU+9QRHLff3Ahz7wt6hBLg8oufjXmyXLxGIqRkRVhVX3GCC7+vETLgOOEJLH2zZSzUg7/nOvk3gMUZaRQb10xT/kOGRZCDs57MG2X/BhmSdySnZrIY0yILuAnvv1oPyokyKsUETDh6dGeHc8qb9hu9vFf6IplhWVTt6YgynFcrA9MFLGUqz8eM8EXWFHVu4L+KlpO4TUcqw7tpYYrum8PEWmueXjPTj6t6aa7CLkI5nW56SSUTJeU045LAtaA40k3H7jVALCEw7SZkR/jC5GAkdA/JTIAQCyFk0obl7U6eqdnzqOPW/sxWP1ifvm8oBCFias3Y51WpDyaa1pr18SOrZir+V2uUK3pB2wB4Y7P3viq9aDi8OS4J06TgVbs/2KwGto145L9p0MZaAJNEnyRDlW2/nIrYMsmB5DYslwMesISDnZRYCsJJdIleRHXVeo30KD/ihjdNQwZQ3tcy+FxSfjve8KR2JksykLQoFX7ScUQP/uXkkdlqTy+L6k8zIF3TKMXXbwiLfIuNPr4mowkoxp5PQp2hNTbiCKybIBwGQTbGL4Wteu2aLeJ7du/bi7uCiVhdQUFzXx76yyldg0qKJ4YWor8fWYj7MInu2JFCc4ztjk0IBZ4Z7UfGo4uxRCCSlmcwsY/hCN0mzhKGsn9c+OsgawfZJEMq9uuTUFJuXZxHbkmqsvkjWPqiRTXST0sDNGD/LzP9jcSorhRwn0X27ixAdIkZkbnNI1By5q2Bp3DqmYJIDc8zWgaF6nay/R+wQop9JbDH+YUgtCiBhqe7089fB3FLuNJ8coRdvHG8mGUsradrE6mUpGqiq8RnGXNBPbcLg49PL3We/A+TxLq5Yx6hKfhPptDl2PsNZst8Rvk+csVjxtC8HrlN5qavv6EQHudm8fFsbuYyItZPxAsPBewYImzRMZSaf5MuJxemtMFShKEG6bPSJaPqePgLhhgJD7KZzaQP4Zs2cbwWP5/am2rGxOsSfjVN0iUuODNBEkwnGHjmW/DsAiQh6gG8JXQDb5W2427rxqPQGFTYTHM7iIb1FZ6Xkl8etAnU77PmizMBs9qKvxG8qhhAXDBb0KD7+0vXJgpDdXkt5JL6uIsYloUROI2Xb7W2SifcFLc0MoS2ByVvI6tAVrNkNSpAKwy0LviEVB07fK20MIAsweu1QkVnJ+M2vXx3yvDXIHkYGoNByBcYDa8ZCJIajILqpDeRrmIJpIaL7RxKukQbCFVKMVYLUC+XFvOeLwP5boEkWxlvdAQSkwxjFzurtqYj7ZtAt2NvMgPpkdhAzg91lvciN0rh5iNQGxSsS9PiUaBAcUzIo5z9VH/EjtD1YYJhX96lp0fsQ0FCGwidoPk85iaPfS9EyXtr5m1deoJxKVlBZpF73GA6hIgF1DOx6OPURTDcto0gKcgNVjAYaMIzqeIEzQfRnOTtoHbrQ7x+05yi16K8X1gUfnJ0Nv3uF9gjAH+DqHDgJQHKItXSdmqjJHyHixYOtBJ6WTaNWQVr8wlRy1bp0+StVBzW9iy/kVV/lNS6Tm3FbUUeHZASyVaxOJeitZWqNmu65dyRjVXZx1IS0d9KBp+6pZrsHyrzZX2+jbYKjIKWcalZGzD34ZdQ3G7ulWiPQADqzwtJfJlOHd60x7jyp/9OdD1V98V7CiVCQYnuukcxqTslrLRJeVxzA4oX4DqtyJ3gKu6I6eiZg/8BTbweCIW64SiM/Y2DevPbbOzlxonPMSOcwwVdySJMALpO3GH5rEm6OoAwwpgnhIU/2YAAqu+d71LYkBsg8Qw/SQ7NJrd0ee3G25NRvt+sLv+HVoTfMxFpCQIVHMp5IxBGdEyAMQGQo53Y+ENeK5LlkD9ARkYyS71QqvhLStDdtCBN2XO7f6vMZW1dq9dGdWxi2NvqgpVmlEwROfOJ3Mmq70Ixdy3l/pW1ZLIuXwDSwaGkLoCbH1UsOJ0vsO9aBKdHcJgAP9O81igTI4zTgcjA4plC4I8z1Xq6g7yetwI7sdFCMhMn99ZOY2BZHuabkeJCiX87I3ySZrBrwDjEynBU0jY04UFqq+TnufuE7kVBiXP0CcaGJOKmNh6JxjbHkhEm3yHVxMqx2NBNv21UiSvB0LTl1ZF1CBwd3WEzwKGJuiHJ8FEDiesFCuQhNnYIviVrXLU8+u6acEPM2Sbk8Bayd4X8ZWuxrVrUHHAXRWKhgFIGYekhFwUBeG4eiiALLY5guEFxhWdSTbR1UZBBWase6bQ3BPADLmPZF4UWzLHmGgPzmxaFGCVyCqG746FwB7vWY4RyIbSsG/61FxpqMFt7OIdJAdCO2i72PIyytLJ905ssDSC5Y4g3oynxmXNRke2/KbHjSeXjSX6QaT13EnoPlImVue/7L5DviahTqpDCRxcOm7d9NxZxLpUW/BEuuwZefaJmw/Fn4pd5uEUpLCWOnhVVyfGeTVHy4HttdLyLfDzoNdip16L/T/ElO84iplS7CNC/h0bRqj3klTyCI3CwZ3giNv7t9MjwQPXrgUYTn5KbzJGKmMDZaCzDbjK7K8ueGROAcp+qxLoZUq5V97pxQmoRYJByN+gDsy/+gkddGQ7ucUjZrILbdEJBjKTzuyNNOq9UxgevCEes7ID3rbPtPKCpStfT1oUQE74AIC/Qidjg0+O4nQuBS18AZVSCvagGCDTsywpan9r7fovU7CLx/Gtw701hj4xh3HL8HZJvAAxtY15iFzhDDfsWw3VJT+TeAscm1vuN8L25otd2BI1B9d0CAU5STYpPV02RIcQby1p+4pXZEl+DoUsPRJynS3gtEvcEshzpdyk7Cn+HVdX23lRkbwgj3i+ZWPb1g5ry76DhchPcmGt9hpqfguqBUByDL4u1REPSpwERKhKwQ1mNyHCPHQbVY/DK8JnU47aMDJuBpf+Kp2D5YJe//HCmQAzFbxzApEDBN9TP50ZzGzNNEbl5nhbsh12KIYUys1HLNicmSfeUCQANyj5o1wNddFuTumkvwjC/JrP/p4GOxD84y+aYgI0MjkhiBQWSztTcWvMkL8UcS2SszMrZDP1HVwX5fOJyiBcbyxiJhwQmdGsauPCGK6yaeITSJGTuUOa9FnGeaiCxpsPfA70e96+4x6JJZWTTMKcBKvJC8AkBSeCye/OdzKFdwjDK1iOId/WNgVEAcW1Xg1MEBM93H/kXTvgOpH1QyzRHo13zO5WJBaxv4E6mjiF8Zz35f4lnAyYzccOkyqBSWNzb2Rbqlv+3rcRXCTmDEnfR4iD+EwaE0RDdD6mD4jXoNY5AzoMGAqRXXqqhUCu2rfTI35usnMfB6qr/qqO6r5ZuVMOegaP7TZp+fKc9E2hvYRU6jKoL4bw2FlQ69jQhfBn/EhisGlYmgk0LRRV34Ge67vPqnES/Y1OP5NvHw8sUev+B0C9cmQxstlNGQ6X6sVPLDpuutnEV0o2egtaC9mKQ+0WMG2Es2jslux7cKOAeI8Yb6qxYU5tQoamGPqCqEAm3FiPWV1dFWYCr43mocgkv/dKB1M7XHny6TQCZzdL1vTC45WU+3D1UjDLPHEbnssUOER/tc2T8vEqgE5Q2pce1LJ/xIfkWGcE/QmfLI8aV6wD/hKsx8q6ha2nvUKuSVQJCbjGvYpKV7p9HWD+fURsK75O3afgg2kCWJvy5a55yla/3EVeyHdmTbeF6NW933Loc+yYsF+jI3CKMPW5C2xDmUDqYjKaeh0IPCZILzHgkXcL7RG6wmJTcZbBL2RRtdj/RJorYVbCgHQEKmxDbIYOIgsnrA9FHX/ej+1y7xKSb4U2GZsiAy0olGwFPmNpAWqMZymebAUVbrOHnVIunnM3L9tjxqvaVIGdE+OVmuMieVjvc3/goCpryKmY0TGTai+jcfq7oG7RV77qTWL5CJ0MiLbmKX0D08E/6UnpXihe3522K7abaq27JdqcDVyVvPBf/nYF+W6rPV2UEOz95HA1gaEqtGBwlDoJK1lMvDZqqyWzPnGAqJEtYLpGPigT7GcfcUOV+kiUOU8EViWYqWMO6h8vCCjA0TfrC5noSZ8YJRCmwox/Vj4jDil2Ies6AoljHextvpb1CGLoGrKgpI4xaRv++WDVEIKfQ2X63IoMo0PTdfu3nuqCqUGqZTDfzhnWw4LmzULph38K7kAPjY0/1v7U49Gz6nA74tTxtFKXrNvcdbG+mj8hqk1FPfGayRGLCfR8MCDjKtTRfcsizrDdqs18M0MahU6Y1EJWNM7DFbOMpyb6vaNotdQR59zY+XmE3tLtuDqi4Dvg9J75d2AtSspifj4A4ouw0AiDhzgEPIA2qALT+nh+/Ey07Xr8sZ+Drl9pEhU2V5EvmGzCKf1m5Fdjdlt1osmfHt31Sa0gcuxBOvAjXZuciVVL1cwCbi4KiT7BDCdcKAeb5Lg185in0PV9sbGOXrfnSpHCXf+cQWu+EpSv08h56QkxoEeCIdiavwh5baFN9XZj7JYCinUr/DNQaz9UwfEehf1IlvTFqAcY3WLEIblmAMSZ4i4aWk0OwvMezrQT1Fh3dQxeWQQqD/zYucEK9imNKUmgdZBbpG9aU9CatevM2Hpbk3EXgWC+pKSz1C/0hniVz2wUzRgzGNKbdlWsPZ52NjabN0Xkoo5STUUJjFvvs0u1rbohGzhbAKYZOElbta9vvckQDNfT003ItOi1nrw5sSY38h1QUtQUWkt0H3hHZDIQVnVBkS1+lndMRKLs1I1QJeTPHyUBPfHdt00gYZfKZ4KeDloSmsWDVUj3ENga21HnY0W/rcQALtxxpk2mPxz9gsY4kjwTeRmCQS6IdX5l0T+mDRNsl22JCbh9d9W2xL4N9uwKblYxCz6CCl0oJu2f4y+jbcGozUA6oXfPJFLt6Ed4TehxPxTyfOw+hXxKC7yEli8j2KWdr9PlvPEHxXLoSflJM3djcEa8+KvnfiTAw3t0+nfiiyEicR7B0c6COaKBs6OeW+KUax50NNiOYTphY5PIH4FqbDF/dNtxOOLUmik4B04aa82GED5wuYBk3UFt/Q3auSLFo2L+RFG9v9/n5lT3lk7LIp0mO8z4DNJ+fafYVUAIyqkzDZ2wsLJ7Q7rKHf9kHcAPNLtk0iF/DDV1P0cOdzwjA0UuR/F0o0rEeJlfD9zDuL+ABMUm9SRU2TeZfir/6LmK6kukYNNauVFptcW4HLCkA9cNrJOVJp0AYPEqI9j6vSRmaqQJwYgfYO+tw1/JEqo7IV0a4NnmAf13RThXaJrJIPB/qzl1VZbuPLhZ0rW/r1FLfdMLYxo5Njqu0J4apQJB4zpSZ8taGGzYRWXKETMvoU203yjT+43f6GsZ7HnRPAw== ]]><![CDATA[ ZLW6r283R7S88wUWBB+iJ62Yms2x0L+uZpGKgiuB6Mt6H6rwQOfDfaabhJc759Cv186UG7tODuOCtYLzglztJpDA6eZbDEnwaaW2Yc4gfFbUVwEPogX5Fl4uwgipo3PI0yjAWl2HYRfzIGIcKA1ZfcCkZv0750MBmkDO8BRq/GXvEPct7BneQAuogFLC1+gUmYnwpcYfJOE4JPvCGn+3LF6rW6TbXrJxaU5SK6UQg1ZipWKNmV53VezOa5/6Vnl9yYGbTeM18gSDwLCYx4k2rJb5v0ZBA1f4HzWDjawMGz2WjzpfKrBDU9apd/fqVuK8nXWQmr8P4VRloQBxK+zxTsdaBLernTZPVUMkskxvRTwfAjnzVJHPQXXJpeugqH5L6aRdc4FDLQRaPTxtfMfV2dCrS/q8BujV4XLbvUBu2QpKPvDjA/6jEChSLtzbV69m60vgUnPWuAqhRw3Qyq/icq46tMd9anNXr64UsCPw9yYu5UorgcM7UCqvb9frXGIIsZLnQUSpJK7quSJVN6pb3EjGZ2/cacMKg5chBuCBrIDTdpZ7ombNBwuOmh+dzwpd5X2B2smXMAwyZrt0S7Kd/mIuKQ1JJbAO4i5Fjj0A3WPHTEoFl+9WUu3CzI+ldOv0Nh/FXIaUS+FTYqyQ5STpBBM8Jwmes+cZRfTbwoMboeKzUg00iLg+epmHdme1v93G75zaOAjAOziGyOwMrBO4GBgOh5wirxHUy1vhbYu63G7uAwbI6BZChprvI9ldLiACmjKfFAJXK33TlBRAtPrkiKviGjhPb68BcmsJ6KnVfu0aNaGhCV6Iqifatk+XlFfHU+wq1ACMT0c6welLvrVQm0P3XMN7KDS967mapagqzvNiLvfq73JbLFXBXJYDLBgN4321VQXuw23qM8x5jEjbTVpSUF7Ud6jJxVKuKFGqvLLd/+RP5Gu8NoPA8UA4Yh5kBe8c3Z6OhoZVxMZW7NBFZuNerpelE8QC0dUZ1lCGicqkYuBCD5PeA8sgRjZF7UZ5lUkGrYKiFKjGl9h5H9FWqiI6y3RfYQINGxSHcmyhSrMD4aHKdOxqGKjtjqaHmO90tYNXzSs+v/OZJubkVVbeTUQBJ4UAnoMYe+7bywvIHlvi1ffucPFoGX5PH2E1m2MXaGWSvXUApMDnrqRdnzlbBzzF/JyWJcpiL027p3CWcuP2bVZHOv7A/ztKK3oinyPBAdLYcuE11J1UfI27L+3rp734v1iclsN2Ro1y942HLylJY5GQLm6lv1+LhD+CdOM3vXINGJWKean+QQ2S/2/a+L78lrUPClwxsojteniHGIhViO8rm7LmUtVeJcNch3+YzAhdrSdDapTzI3+z2amMp3YPzgphlP9lt9SiebTvGpt7v58jfIOmvYBYsJ1uhf7LRr2h5ar36tZrwhecQXy9N6Ul1USgTZQZQBDHQx3MKfx8EVfvLsLK3xUH1G6/BtzFX2WKBqIaYLmzsrAwTHjQDUaIy2sq1gS2IVhFJoCCpXz73pQC75TtcMh0CNohhjooR4DHWqbMMEY/r/ZVF9O8cjhkt/Cp9QxpWgeOUOt7ZaXMb1FCIzA1G3Kk46JvUGDbYRiuhn2lmOE6mVcMlt1YKRNkjuUOpXtNsFGFUbLQLcCKNxlZgxRzAoIxaUhDB/OIBYdILChR5JjlBXsmm8rO+Vu+W+1a/cDLfecY21iqXuGM1H8oebWjNGYYZgT0nczsrttFlKUFY+Zq9lK16qdMpEuMQceR02DGEslvd8E9Wgpa7V3mCs1sVTskZNIXuWBmjlG7UGGUnTQYW6uCs0ILlKYotrT+OhEg1N4EkP9s/nDu4FhVnP5av72Q+j81kCPLkPYOvZhioVCDQik9RwgS60FLKQ1KSnTj1IMXHEw1jcg+YecEqNsygqvsaKwI4y1f2Qx/LXqAIhVnJeYpCvEudodQRcGAwYfpBA8N32qKgPyZUTTzAPbvAlF14jF6v6Rrt542M2uO5c4U0DbaJz0o0TANOpHgCmoUhyCQk4FWAvW+5scAQEziryT7jlx1V6PLBRfQ8gPvH2MzReKS5BdC3kOpejgZXSDWVGp7nmptIRw4WqvKi6LNPTQfIHQiCJrLRGq1oFyCW3xmEK2QwTUpW4aF1GZwglQYP8GA8iMHiL0ggPxZv8hM+Tt3PHiHi2IPhEnTsWT0TEVVtpBapihhpsYUeVcRYcozQQroH8iWqvtIOu63JsnbrdthyIVgHmIDOwXKCdIBJPKjIls93qO+OZYyIUltjyqArJI/vNw4IQGv1uhLqc1zNhm4FuD27gBk117D4CNkhLKFpylXkg0VfUf9DrZgwIG50LElpwoVl38VJvSfD4hQy0seFR60Of1M+OdVUMjdukM1EkpGvfRHLkiRCi/6CaXUg7Uube35G1r70AU+uzbOiCpqAS9HYy12H5be8Aese50yVkMgZyZeJi1+ad2qwq34WLF4pgPvkoyOe95nZzJavGUzRTA+PIsRC7qeVKvipMW+2Pvn3nQ2UPJ483r0VOCU9CkzeVCGx9V8ZZhfZlMga8mRpfQeexw1+v7KSP2wMrOsJh0+lYjuYfjM5SIAzbI4wIOvVw7xWqnKcoCXR8lCcktvKU2DDVGwZDtFSN0rh4uyDPBHLB1by4mmiEX7C11co6K4r5mcu7kvPvUyuaRb6jJxskmX+xjRFd+XD18bTEWkTvbGvSJOP0getLtMbrBhCif23KRD1bsBwBeMho3Hs0GR40Dxl/IuAHcjd4t3ctivVfZGpKKhTUyPCcTBvqZEmtnitI2OI/gD83yQiU2QM/ntjoI1oJ0UkXrEntlRBjwm1SXn2Cgc2p7dYGxgTrxhBlTTb+4qnaqjXUyMM1Op00SqSkCgBZnJmWDyGa1xGEhgv4vjjxaSEdAO0mZcT0STFxXrPSSk7g6QgFSsDAz8tMchgzlkvmq6Ado64dnnJmbEcDY/nonU7UnRhxEZwWzDerFvkL0HqFTdH/6QnMZLohz2LHbtiRtq2YmyHDJw++cj/lZmm31KfKbtjHwaI3w+OAomS0IYe6/PzG+rDMxXdFwqdgbFFx1I9m5+/VSbMaBpVSBQMWECqL1zkCoykPfqBoWWoWmofqV9CGL4A0Y8tip0JpmCdgNsZkEzp2EG1QPuSfCJrBKaM8tKN9XUGPRAFwcZhv1QMnI7d9cBIQNo0+KShX7/X8W2pnL0qMV0pejqWKyOr4pzxJAp+wt2TRoEODGV48tH7pbFaqyMkd8oyys3cTl20qHnjvqNe0Yps+6vMjb1/0ACiyBOa3McKdVRZ7UO8MJvMedV2FG1nbkY9ZM16cf4iGjTY3zodvKuwY0m7exbSkuo/G8iyJ/tlomPVDJCAx+ljUBSSy678rRRu9kB2nQNob0hIDoeXgrU1NIh5qxGIr1ZVfRqfmJaURVRa7fR0LgHJWFGVx7RE3Uzqe6tc7FAhir86leLTbZ/wBjP3W4l9JjS0aQlp0bSBl1HJ0XwEAUvb0udN8LJ01WtPg3bEgyCpzfN/RL0YVFiUKWapFD88JJgm4b6BgUcHStrQYGmaeTAto/ig34RNEHTi5eklZG+0MeDUOa0Pioq8oJATMe5HTUvInmaadL2xAe2zJm6750Cf/3wdNT634j6kYX3XOl9XYA78xcOtNiJxeUqhRSKupG9z1mSbuGyCbfKVSahJIYyxRfBEKFZppXPBFSKfebBbQwX7ETQMGlCVlx/C0KyomL88FsYdMMnFoBPkc/oh0Hr2KP1YowiiPd+AHW9OAYTVP++nKZfX72yUhRBszWHt7SLpyFBWgrTfMHq3UFqbLlKx5IAiFJ+uEJLIhhmUsiK1nbHmbmP1G1a/RHypjNdlxpJBR/+nFy31wLi8rAQq4hSsXL10zIKgZ0X30BbaWB52odWzkVUqlVMIdUnxi7NCJfuJgpn3I1bEvEWb/M62eAZdwN5v9MmBxy6aKd0ol1gQ0RS5xUChUewWojFcmpi0UcRjU8ipolHdJvSUa7G0Zdo8iAuKhsZw8Bi1zc/WN6BETF/YODHRf4i7EpDbfFJJDeej8+FiC6+Qqm9eFswGqGpeDE9TX1QaBBZJ+QWYrlUsUlFZaO4CDtl4IMI98/f2HuIDJHmorUIii0QLD6NS3yoXRcn+syZkrpuFWKgHmjoH1T1nzFFL1RbPShTdiGJKdvQ5YA0mYJ2Xp8GI78LkI6U4xlYv2wiHMOVVkosRkTo/fqKzLVTRqDw7Eqg8PwDCo/gVBV75WWEc+zWLojowCpnFeAQP20MtEGhXWZQaBldUGj3jy7KLlVraxK2OdG93FP0R8C7OQSolCilNdUQHGDKkcl/M1NGD1A9V7s8HF6Ufi1d6SoMJr2658HoGGWiAoQnXE141XwfqCsXUS9uGjntwgUliKEkm/HCp5cjoLF81Dxt7O1pFoCNz/0LMTkdUt0inDHavWTsqW7yLvT6zCeI+Wirv65oQ1ZQ4g+R6UFnx3ffW+ZtGybDRM/CZvOtVAAvmPHGJHh7mgSd5FeVKkWPNjORd6Ru0Hwvcty9KfhNihgNeY/upKIY21ViaB5WkpQJp6hwFLjGWrIi/TvREMQVpfEkFK8e65UsgmdNgEtq+rdf7+CIJZJBeReZUgPKLLpsEz7qwJuAPKmzVwtlpf9mIIclTvv/91vQpxArSflgsfNrr/YOe3gY2boJJCI8FQRom41EvcVXearoDnSEFtP2OEJYt9e+dayOjrPPFSA14ZxxcU+0Gh+4s2In4hjlGfpqqeC6bCP0lrSkLABqw+YrUgDsLGfRTvZPbJcCDsvPWN7uL63nVIuz/ArrLrBmqpKsiGRDRM4W+xCqYqgI/jVwfJMEOMT/rXcCFvL9IxCYYN0q0N87Vg4tFlGECwE1hvcZhRFaanedqGVNlxIhJK48a3rrluebcufCX1rFQOlyaEDjkOja5FGjd0ltCPd92g4LQwpmcUpZse1/qDjBVbmNvHWQBlpCv3MZDUxOzQUctAqTTxzxUSxs9e2ZwpU9RlRC2Hh++1V/XkJttWP8nfpzH709Aby/SPxgLrWCuJFdUM8NuJ3myTiW3sj+c7JA0CsI9aykhKnVTbmHy/5eJUNAd2rHLMPCG6gf3o5vHrqGO2sGXKsAr1wF7yFo73J8cxiZuBPSGxcvkbdFuFz6+jBxyO3q0ISmI/mLQhHNSofHcmcz4/cat5fP5gTWU3xVvkspQqDj7rVxMF9hk8X+Zg2tv7LXyq8XWZbUgAEf3vWPDlHwoR73HPbmFP4WbfKFqeTxqczpMH/0LPwC9swJ3iiVsTzFc6jE1CvDQBNCzXn5f1mPKVkADMv7S7gPX7gGQa3MfjxF5jBQrnO388/W+Fr25nYqTGFMBCEK1L7UKhxc+15/UzYVGfF+t/aQj4Gyr5fNnDZ00Uxx4dZNAnCSD+djmpZzQDKullcmQCUDQglNUi5Kgrwfu8elnt+iVZVXvC4Rww== ]]><![CDATA[ 4Xu8xmW/bDRz8BTiwVSDmSOsilu13TQ3L66ALkhwfBgcshmN8J2uuLXUOVRY6f/LdJZqfIRHpjZqAM/98pZcNCm6RWG1Y2mLVuV0K0RtHc9epMJqqoT8It6d2edZy98NHmqfg5zLS7ZVeXL4USKXT0KoxbYZz2Bes3gEidmeYOGLd34VrBHsSJSPJBgXs6bY7PIdy1A57TvpOyLdJ9E4o8aiYMMjTr1MLSQEovX5tMmwk4LtVqgiDJNdYgTIPDfzqahGVS8dDQuIexsWoAUr/G3YNdK5oRmPdY22PpsBctW5FJWtTHA9sJ9r5Tm+Jl65YAAYRXlD9fLi77ZD/c2J9HTWJMA+TQkBOvi8MSaQRMT5AADG0SDZ+RKoY929Ez+GutyITamUtwZBeyMSAQAQAQAABBwDDQMHA9ygpGkC7VCarQYMFE1mZqEQvO1VIE5PjWszQYmSRZwEVteC5+OaJ8Oc1kQJBikOkYukX0KWtgQNLrtskNhJd2WDx5epMQrvVJb3sADVpXobXA/C/4E72WcoLIvHRyyaGyNtV7dbBPEQ0fx+q9MwLzDpd2k3ezxJNh0C1cSft1VK5ie0nIYN0g2oI7jMnwwevufgULjPkF5iqgK3MmQYKYdMUIdoaI2OEGI1bRitNf2NFZoOSYu4e5lC3GFjpNQ9JG3UJy3LqD9MjYHubQOJrNNnsK/TUSYBnO5olDT9/BSaTtYFSj+BQnAPOQ5wz9REt7+jUdtVSKLtpawC6d9qwtkqzUi3A3UpNkWDfg6jiRW4tqMfZx5gHudt4GfESbkBxwAENlnJT5t9VusuDXDUVuSy9BkiBr/km1G4RURXnhNT4a+JEqdKoNSjr0C8wDgjmrvU8s6acKqTJpzq+0N66JLHgzG+D6KpboJoCkRTHWPxeAqkCKLf23onUzpZPDufmolmIjediQY8nU/tzss+sk/3YVkOpxDGG88uYRqYxtW4mq2mxm9n5bnLcy/Jc39d3PQFxm/JYdCJx2mUE1nI4DTKciKbeE6jnMgwaKOmzhKDsibxDclL8meJQVmT+IZk4huSl2TiG97GsbiJNCJgVY8iAsoVBGxAwAYsQprqUUr776v6KS3dfiOm+1X9V1WnNPoQm+QY+6a9qbMbI1zSGCFGuLwu7iP0Xf4j9PiPUGFGuKQxwgW247e7am1aMVxCExaZCpRbiKgA8zFfhBuqQDyYCmJGrWaYsNnEXm1Xhz6mwPBSLDbp4xoNdgp45THrjdZ0YnRjjGPDUZ5PjFt4hdX5KZaTYl9QTIhbvIiKy5NpznTvCXew7Il0sJKN4V1VGgJ6bD4t6PE5NDatt3m+QdcMhfgXXu38QZbO8EpMr6VL95VXPeikd2DIKzWiErYuQDkGo3yy5HF8kq1NtcmtTSSb6t7Gmjz7YwcGcyd7s/Opznc+NRO57Pe2P/tS4uxLyT6djsdNpGCHjoggso/s4/69W3UZ63A8HA8HkgZgQb3wXuM4jZLkM+7MKxyVub5ypnskSa53hCx3niDH9R5BQHVKbGmYqLUVs2/nkO4+H0ii97YW1rkcLVM9+iCb8i6LdLIfMdJReEg5KFCWTiqdRimBKAblRkUWJ9A8LC6SbKqPOPX7X+wTzgLmPktpL610ppsEabyD5mXu9OdM9ziTZZqz8GHwhAgDG7nUxQq5TSMUuRetgaBKyHkGKKKn1o4KLfE1d1ZGRc+ZqNJPSV707+YrX3tI4F8tboV72yZdoWoX62IZI908PtONUGlzP9Q0gscilBg33efoTLegeyar6Wks1E3tpR6u9wUyQPbH8UsVbUtEEE8KCuta8KQgfjsP0RbwJ2A8rgATsmg5H0yFEhYyf4wgQ7oRb8tplKYTZKoaHJDjm77cYrADGVxFED8K4rd/iLXgvdvJnuS0eHd546kyRRa10f+gQFn6liDHL2gY3x87nezFhwjiRUH8djJj4v1FElBdFmGTt8UDA5P19XQgu9ywPKfwkwohx0/AvzYHYOtmlU0OKzZWEDgrizI4hs7hmQ9CgHA5LK1hxaZC0qxAlAhHSVo+WxC/XYx8eA/JQfhhm0bpufBeo+rR96aeufBeexjfJ+EL77UxcuFdPNeC3+wlQZPf/jku3+da8N3icg67vHvb2C5QEsSTtoqCIKqHgvjtIeo6ZJ1GCae8M1Si9zYS5TmiyWNFH4m8YFvzxMcuTGJYF/0kFJZaT8T09tHAwGSt4dhr7ZGTd29LzFonCA3lpEx4HEF0v2e69+xLhe+Z7sIsACzJc+ck2DvtlRiUZNfi3dtmnTPdqUolegTlQ1qagxVqqdTy7rnMYhWeLfjBY17xVoyRImYy77RgVuBeD0XkUOU6cg3EY8BVyNPmvK3SYTYn+fjIqWoochzxGHCPVrq5zsdHzqwsQo5A+2Q5QCgFAuS2JKyPiyqjEB7/4XErHJR9Ky9ABbL0F4WhPifFWsuS9VF27HKmGzUPurfZtCsXV0yZWOMkIRZNURzKJaipVmfNSXQWxcyQYFULI5FQyjO4YDkI9PwQFLztiyDIv2ev1UoLGGj4ZUOvJe25a+ltC5hk8pEBAWWt3e9UHT4Gm2e6jaFgHMUmCmzpAAXMme4y03i9r5zp9u34Cvh4HD8kI27Iurxv1eV9h8bHJzvY9Q5Tp+FqJQYl2aa899hC8uAMlTg50z1uWPTeNjnTvWkJ0YeTM9189YmeLYysSCWlQign1ReHy0x3xHSDTDjVQxODxUf1nIFoqmtkjLXgQX+KuCB+O0iKBFSfdbakk31Yanl/SU7HLIJ4PuCm+zAyyGgLdTRBPtEms54616MdbVjL+uoQynLEkh+E8gwpCKXJ+YSyFWOMIjWvdBBYDReZPODU6bIWVKTLkaFtGiXLDcQmUwBKEX+QJ4wztVKHXaUf+6Z0k6Az3aQKKp0Dp+qX5BDySaHa57ge/7ScHj8CepADZ7pJxvv4Ay1ULfzeFi8WgzL+oQ+nAYUfRI0Oa8XkpAZawdmLWsB955szHXS6QiWFCRHiaVy/IwZhJzeoIfzi5kx32dJQ+G59CHSyvCffMWe6P2s4eW8jMWc6GDFnukcvM22MRzL5ypnuDxte3ysdlbneNp5IkrvlDnZ9ZRUZjBMeSUds+lp9/eXtyTsd8jj+JzLO73CC/iNP3gmkKCBdl3THJRiF9GHw/h1a24Mke57wr00BEpXMvhXDu3obiCTREBDa2LSsTErT7CwyTt7P+O3n2c/4PM/4jN8fvz/un3/yj1/8ppIO7V+eKb1ZCsN8y+9tnnM+epvIt827GL99LISeh5cCZyduVwsMX/SWhiyKW+xkzC28ccehj4OG8Bjn8bXfshxK2dseMC82YxuDAgkFYkNv86ippEOF7bGEaiJN/fC21iN2iWs0R0BHjt5J6ICJn3R/QYIrtaHa5LgEXJJcDbbj1zU72X+G3M0W3imWk6JL0Eq16Ex3WapHZMfj+N7GKSTXi49O9j6kIJSjQgTxoCB+u8sFWevF4+FnN3evjTFo+gHzUN1tpF1XfhLgfyGNAbshLDGsf6f+NE3LmLx3K9vFToJaf5qu4VtrgXie522zSpYNiK1qgZmO0eqZVgnMKlk202SBGQC5Vm307GLJ9GYcYXp2oWDy+5Jp+YKis0xeaWYAWLDiwxrQOsVc3UPPNNjMlt2X5ZdplFzDuGQWjQWL+N9R1KtgrI+is0yAjUsGABYBURRFWTLiLJUgZQCl2aWCybTTnCnRSmwZQAm2weV/HfxpQCQMBoTBAJd+YwUQAoj//z98AXMUQJgdkSgRBoNpfm/6DRYwf+L78jwT/puHE2H+bYBA/4myl+bpN1jgf2/w8P+joSf+AI9A3yCrgN9gsEAIi51Y4GaCBbpAPwX8Rs8CyPCGgkFK3m/pACt3wobXNyams3PYDcfW9TZv87ZVZDD2FEMl+oK3xbAuTlQqKdW/uR79WYbx/Q89eY+pIoj/zJP3TxB/HadRrurRH2cy7yLqLf2x5YHNFnAVrQWRevIuSEhGLOzKtYentBsP88SNCNCfvK8czEm1vCffiDROnDWcvI1kjCc/HgYn0cv2Vpl8wSOZFhySZr4p/TON13vY8Hpbb8eXq4OXRGWuqXK9t4kkaYMc98EZKpE8kMQNh7AOrr6ukkgT/kry3FuPcOZwZyUdKggMjtftah8ZjN7WWRnCu0JlZSFvjxV9gZYQPUc5qd56eBuNUTBpGtZCG9wsVRBG9Umht5He22iZDbOw+Kwj06SoyOIQTsri4IfhXU/ruYNwoowLmn6tr0m6BfNSgzRugjiNmPokQQaOHa8qxaDsFlcdvL5ymirXV850W1Te5m2xljb3zagS/xkIoqzdasCo9Otf+qwFXe+yMQqnfWr4P27IWr3N22Jv8zZvU0m10fe2FG58fySq6aiApiPQTN+TJElWFDtfaNUz+L5nOpY8jj84P4xP9BrIpJfk80gEPnKXch05RSvdnKSTR5D8zFrqi+K4qAXJg7VWZAeMOuCuv9IK2VQFs1HDaQIajw86yI766NIPQ54yIhWH3OgDbW5tv8iZMLCRe9U/I0iF31tVUHUsH6jqbSzZb/VXSOX6moBG6VtGr8JnJJ/qrWwQDsCUDak5AogkqOSTNvJgFjIzIwIDMwLAAAMTaEAYLByRysQi0qRqZRSAA1FGLEpOQDY2HhXKgmFAJAxHYhyGURgGQRRGQYkcUrcBSM7+VlM0xZtHNjuKqTYDw8+4J1BZuDwxdccVPGGth176GE4kJ5JfLm8JEjRHalpwk5bMG1xv8clBinAHYoAlGzJhh4LSfHOwVVYPOKrIkCcOj1xo62ikropcVfj88016Eb5Yh8DDI6dbbgw1UYVXr5vhQ9ILlUZ4deKNqQx+DMWiJ4lcPcflZgnSsWR5GRRYVLbcCxH/zs423xVZDYtrNDHu3ZyiaA+95IoWRUuHMvyBxvzsoVdD48Dx8huiiXdDujT10HVF0iLi3q/U3i45KGilOkKop7FR+x/PnI1FdlZc35D2hZ/N6mG9L2g4DVY9CUVo/bYDs+bCpi48POnVpgCOGduiS5qTCXK8oR8dllZbiXQJDItfBYN08AXB2F57F+mmORutAPp3XKbUgrMpkANIS2pPL1nwm6mN0T9+fIrZlt1SVwOoo+jA6ISuSexZ6uJEjOi8aWXu0VEqZMCDHNoOZKG7XgK/yjH7WSwUtAdxTQOwS7/Iw8Ej6H5wutEZrxgDHWGsqW7SF44uDAku8D6gI9Cmf2i6hUzXD3dAJzR+/V/xl80d3GpH//BR9v/h4gY6qistea4qKHX0dXOQnZGRiBZ/bnmsR0vFpbilLDLCBZ7xrbqvYWFqN9b323C3BIj5ZhfelON7TvO9XA7aG99YPN9QFGI3vgHqfKOGpFuf7sZ3NM3324YrPL7hPt/I9DO+3Z/7br47onDN+N6C8712s8D4NnjzzYlLp2h8c+l8U2AjylLOZL6zhuYz33CN7w== ]]><![CDATA[ dzLfdp1eEQodzylwQjEh6VOp2qWd9iqcNXYqX4LRMPZkvX0A46VfYAIh9uzt579DICOvpmUVNOHtU6NbhpyhTnan9PLo8qAqi5qUNJhiXaXNWlGQue/yWCq0q3Q0GM5NyyTLpdRxgtkUPjwjjXJ6UW/YkTXi2ModJ+IeNHw3kcUERHxAUFBJlUH3xHYNz0QimpzmpfQdDK4ghRIV4MoH6P1jkJLE6EfDITSpkTi01LbmDPq/ivrj1Eeq6CTJpDZwk0UQw/zAWdlBaTOsQr4ynvARYdx6Rrs/zuRxekg7Ba5beVVTWzKIaqIz9F5s06U3ByXOnuLD2mad6fFyqE2roV7TLj/F9cCa6yuGgTn4YRTOGJkTaahfufegSrE5DusbXHtB97FGDaL07rVR2yBn07Em57XfFUQTmQmXYdgjcafSn64IhhlBpKLq6dI1ISWokp7oRzdUHmLelSDGIH/9iDgDKzdpeipQr41LSvr9egDxGanjBcYPgBSFVnNubb4/6tIs4ofOD5z0b3BFGgeYYVQHjvipT4to0OpkNDmGhFAT7YcQGkGP9iU0SPIhEIKOgTapEdETaEon1RAjG5S3e+Ac/671BTpINjQ88IiAa7bGwQGrGgg8SAy2eklZqASB07amir3a/gXEEz7KeUaUbiIbAy2yG4qVJeGf6mcSJm/R3BdU4p6SmNwIbJPdoqOlekwRWdgvL9CzeIxC3E6fzwKkz/CYjocTcxmMVIirdDeb3pKQimbGRhhGRfNgTeb3hU23eQQB6SVJ39L13go0SLq7BdLZJJ0gbOQKekq6f5BOgOMilm0RVUMg3SrpRpfxKnl3Se+PQjo9RrmS3ua5oQLp7ZI+TJjmXk6/I+bAQTrExP14HHHG4u6S7p8C6W1JL371uQXS1ZKOBBeFKEi3H4bwGAc9KR4hJ/HOgS185VnHfRi6SMpkU739prgNk39Q6cYp465EolEnS8Q1DzLTQGk1+uLrxEFsUYdJF+sp39TFQoK7NOR7VSeTLaTYa0slaw3J/CowxhsLSQMDlEQ4a/YhrlXNQKSxiwbJqll7bS9NrAt9I8wxQYfITUCHTfKKnS4o6H0pD8V3yIPzJjgo39+i0UU43Zl5qpg+c/gYjZvutu1hwDXlbyJn0JH2XNVmzDtZNOopQb9Guh95nFktwHFAlXoo3vds6woFiioJ6Qq16qZiyBsgZuPldKs895ao2FQ5i8fZcUbgec07uu6VAMcQ4wJSLf07b2TSJjSvBirT//NukbOpnpMejZhbzoTR26LdbK84mMRQVZvYiZ5sZ4aK1QlFJyhkn80qzfMvM/f9bA8j/oozvn3CtYOuMNBVo8K0dcY/XF7Lto8M2QOK2gQ+fU8M+ksUpECwzbq4AgODEo1UEa0rIjjV8KoQpiRurx5qO8JEBQ/n21oPSoWvam3vGK/EYTnSIgMydGXTK2F+mAZAlb+ndTTzKd8KCtDCn5c4QAsP9x8OJqax+cYPEPzhuhmxDIdy/HPGeMy5wO4Fc5nUbItsnX97FflxP3x1SqdupYt73TPEqFpVN0lWiM9BWPY1vj2RIbetPav3HawDws+IVN3+Whkf82m0ZH6/ibZRu+0FqYXHi/CJOLh6cnbR/W7ip4lheUn2+kQHGQxDI8pA3XdMBHJxyyX1zWF7XwUsCrPryYr7Ntgh1YTIbmJK0KISUvJYJyt3XOExSy9sSYM2cyunrUOBpE03x1BqDCysWTk+8r6utstpSEKhwJid7eDm7p0yNFJ1BimDESn/Skztnxc3LSPgIKL1cdWYn7+9wj6dhNLFVtcI1U7tENMgdKVNuPAEsa9ERqPbBAryDMeok2ZGBkKoGsPnDCx85fNLU+DJKV+jHVCROqiCUHq/Es5MzAOPQwhivymw5nrp0aNY4v1AHaOIYP/l4Iqj8p20xQ2nnGJDUX92yGcsy6l3roW5c/qD/9p2E1qkrMiOS046rnxl/4qbzfz1/A0P2CccRQq4r0ASjxQhDMM/J12w3oe/G5lCMLZrUdkAWKuXcoxFABYy14CKNqURXaxNr8QtSFzSxfeMBcHbzk9H6DlvtnO79TI49DQYBAJRffQltXIPAkcvaOD+RfbcsISM+HzjggASL5CJbHVIR7wcVk5VN8nrXvk1qXvvTs+H/3ldnZZkkzglbBo4poMwxttCznZEpKAIqNZuj5GdkP3RCOKHM+Bpmkh9BufMZ1n4DndgmDyevaHMDXqU0wsAA8f9kLyH2IehzUgTbWjzdq/mH0RKTrCWEA70GK24O4RdOpjGPy1zd742q0eVhyP1kzxIyxy3qsYNQkNRUoD7Jxbbaaa+A848cZBTrmLBYtcgPk+gWsZw2WVpH5ZT9FbJ2KbrX+aZrSa64YNnwDsBL2OiFNc4bT97igW2rzslUY750WZp4OU1FrpuH9Qyvx44PBQC1LphIMyeQvjsgaa5dBQOy8Fxmdkd88dJg70dDqPe/3Jj6MzJz8epgjmJrFYKRGCHjU0mwjev1n+hLtlgwo541ku9C8qj7QPPzv9olMWj5Og0rQUGjGMppxr8LgOXnxDIbCbKlo1/InuTuVCezAUjyK1SiRZ/RD1rWgHuzrZQ5ypCwkNRUtLFunVXST95C1N8fhVNjCIoZMEtQF4rNSYXDnJc6qAVoMeLGeyVM6HW/QjaKOWG7wr+GjsZcMCdS9pfefflINGfNItV+S+EZsG+O8YCOTB4CZ+Dh5qbqhrOWKRmO04edgtrzyZqHCY2WMrIxOwWsO3GZcoN/AdlVYFTSyYyMHBdc0GXcbgQ/gmScASPxPzf9JTXHwsXcFnTiikjnPFz1ZusGvD2+UDL/YoLGSXBmMP4g5mB8VLxFOMLJHJV/BMzn1hH5OX8X1tO5Qdv0BvKYAKoko3y75Lkk//lLCIO8EGGWINKTmtux9UfTBPmeNeOo1zxj8z2gYQZX/O99HfMjgqo9Fk24a5e7pH0iSbdt/FxnFq0wIUEsY4Yk5J1V0EGU8zwQDdxvBHiqW90MyxOXBmDp3xOl0z8FUSi5LjiKY0fQ5r5yBlCsjRU8ZReBVt4jPhBPC2nCtzapiTEUwQKuViuR/HErPLFXwcknmxy4IYd/IUyiifxxYwgzz382lofHG2dYALCQ4AKKUuN8ONu1jG8FdJdYJL5+9eegOQ0q/BpAuOLypZDEAfX0b5Le+nM+NFcx6jkwDXCoPvp0LmIj+m+EoV7NYICgpJDbWwIkFUS0TpsrOqwYBnLp5gCRNDsX3i8/V9HsuiKd2+vuuzUZW+LJAZ8GcaFK/on5o7J+GMqih2P2PqEqYzJ+k8qQkAjYSd/7ku7fqyqhy4Bev/jSpS2V+V9Nj1TSaghuPVqd8FlDrPUTbmNXKiO2yUSZCQ0ctNCNCUo1clBGLGaAErgl03n81TtAmG6fltfA1VlmE0JXCiluJB9PAuiWLJFss4VD+oW6S5dQwAtlkizg7hEi0jTyJbJkrUwez5pXQk/6Js/pT90xhpW3DsS1SFkB1d8jD5+ROZwGpN7jgYTRtJgXX3sBz+rsLvYJsTg+F5P7fGkkp8yxTM5HSC2VLnKXNyg+GbLqzh/Dvh9/Qpf8Ky58IAiLx8S8hfHfDwlW/KtyMMpKi5w+SPfPZ60XwqlxbCg8XRfw9Pzx1P/fzWhgOJ6btHgY9V2f8J4aTx5vAm5nNASGk+fnuWFPJ4Yj8SqotxZ0NDQFeY7JTkF7U/pQKNZnFNUGSFZ7utk1tBY3G/IOA4+FJ2ItSAeBoBnOPWudVjyvfDDS5HOhSrI2MooUjcMEYR72FcVGsdkG7cXGDBmYEJbIw+9tXBS6tuJhKhtRW05J1+dDIxx4nNiyGdUjHmPHvlEFEr7wJNVCow5WQO62qe1XNerFIQdoJMs+yBbRJ8XzZe94pOJN7vcP9qtG2lFzFJfinjPRp6eDBasIabZBiGAd1SavryumnZUdjsOFe6VapUlb5SXRob84byYTDTJ7MQmafdlH3V9Y7jFObtul2oDXlyOnjMM/V6g8ELyC40zm8mYYaTG+nwHulRmmGCsykrtKwQ53ybtaDyoZo1ClxTZuDHmNRoRi2C2DmYNPmQD89RMuqcbwCtgHxyyrCO3KjPBD+QwV2RzvI7/kOmYcOWf8K+s3+wPM6wgtnBQDgiFbWwyd1PMKVf8tiJhmE81+M4SSW0cz1IydaqGBPxYGLe5EnPZsUuCaFoMnUrZgq710hhRxYZRnsQreWJIdyW4NkMHx4crnpEFr6mF3NSUnjsaeF15zwok24Hk5BJm2V0khBZKtzp1k51st5WC9WAomgGYW3e35rTWV4quH457pqOZtVMyriSsf1bX1ql//eqxat6RcbDWtn44MNyXmPiswuCkQUlJvnO+D+PgtqT1JeR2MbcPJUhqblB8iZ7hxAMGbw2AAqWVWsbwksQ4Ru/N+jgJy02K0IAnvB40xVFJ4gy/jsLr4sAh7llivtQOH7hXfNvgNiSH4sOkY7/MeRrv1qwN9A4EnGF1bRcsEZ6hwZhoSbAE89Xyjh8s4aKzgUFwxLxHX77KyYlDLrMLYlJO/fykiKD2fywuPSCwODsXDOkks9YlfnypZSXQsAOKyIicv4dSQnSqu88LbUQoDhV0cO5eeNH89QaEakgT/5JF/+K2u9KeQNfc1PqEiR85GgybUGRe7CEwF6S2f6dQHKchLRARYEJyywIPO6+5yd6LEfbbpuLfDMarf5VVyixvJEP8a07/9qQmpcJz/dc4gX/9WdXVh+1IxL/+Wf/GNHAkVQO0PnF3NjUD60L/0tpiQfMj1vi3u07C3gdS9/2pmn+QAA6900nWrCSQLwue+LeV9G8iOTsdhY8k87AYlIsl6t+almHyR6uORBTuP1yGpnuBJpzpLXSWa5p9Qxw/5d3G+Lf/ElqsfxO6mBfTDYF/iQ+1AC9VUWgs/oWYL2dR/3ZaqeMMesHfAFvVB7bBZCqjevFvqi7BNXq9l/6F11/k0yWoTOa8/g08wu8D+Bc5pHq2cCncPo2/Hg7/NpXldKnEf22MP1cIc8XNZrY4i4+6LckADBHpqSwiqkmALOGDcWTmKE+W+hjO6qPJU+z727OAnTy9AqgoP56SfkEgI4EtZkT60w7G7aDT72dKMaxkXBHokqcdl/Tldd9b0bgDYcxwgAKnrYgMw4NOoICAor1yvQmSBouZstjFQtIs4I4JQCApR/kRtyVKhBDBsd0dAsjivgVfGsiB5v5kFVcMTgyDLyk+epR0Z2qs1ducr87VARZcJvGLNTd71WTSVKTKLfgUIzHPBclXi8fTPvJ2CgxbNve6s+cnKyS/wzlIR5UfPfzuyUYsMaKbfEW8V5fj0e65SpADA8uyV/6EXuh2/soDOUpCk2+RrltgnvDQsGSYLob8SYssY+DhepqrJ3vqvrShN+tx9qqoM1F1pumhDUufYbRqk73GVw2G9yj0MSVHrBfEBycs0rRMTP3JHRYbWw== ]]><![CDATA[ wMReHXwh2RzGhD50SXghXCD4jcWTESUqOQa5gl8/QSXZzIRLMkRmdIm83ZvfoUaJhbUN04GQocaI5qJXoDetHfodKNT89JRkf7AWfX5UphzKZqj3TetaGw/tESNzMzRAvRbAIS3xUGcaX0G9f563c6lXNDIOtso1mgPUCybIotvTlDXqQb1g9kMpG9pVWtFxkHofryRwhjxue94c05feTndsB8maJ1DvswtZEoLdaglyufZVyibYOOPos77+GWy8PUVK7DVSO9tXjH+ublsIAzYsYkKJ+0N9XHFh8UTlEUJ17clWJB8v64OfUMh/LbNGrTfvM0CfQyzXfKm2kW9o+TxQ6rj59HjyZ0SnDhwkXKtK7h7LiEwi2khhC/j711zAgnCsDFjC9mcAyhj0cC+t91oIk326ZcpgVr684+sBZMT3EmdZcZ+lsO78LBR8FNOIc1JF7uCHKL9UKNab0DQts5pdMRNypzvyVqAFsZT8EcWCTSwPDmKMKWZlPsmbckbB2HmwanhEX886Ld8iCUSiBd+uIl9B5EJYk1354RTyoE7G2tT/a1ZQ6cg0EoOa1ovQM7yQwhaVwju9baqIkDfXeRH2mcF5Bs67crZJIlojqcAg8l4/mDXh5BfmloVb4CEInNcHPHHuISTN1VD/mfQsD3ZbCVfv/sx68ObKFMaa23x29RINyDzfXhsTGucEWAagwVeQ4u5isanqVWL+eOfqlV+8y1WvOjeVwTSMKv1dy3MF ]]></i:aipgf></svg>'
-    CALENDAR_SETTINGS = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>calendar--settings</title><path d="M30,23V21H27.91a5.9592,5.9592,0,0,0-1.0244-2.4707L28.364,17.05,26.95,15.6362l-1.4788,1.4785A5.9584,5.9584,0,0,0,23,16.09V14H21v2.09a5.9584,5.9584,0,0,0-2.4709,1.0244L17.05,15.6362,15.636,17.05l1.4787,1.479A5.9618,5.9618,0,0,0,16.09,21H14v2h2.09a5.9618,5.9618,0,0,0,1.0244,2.4707L15.636,26.95,17.05,28.3638l1.4788-1.4785A5.9584,5.9584,0,0,0,21,27.91V30h2V27.91a5.9584,5.9584,0,0,0,2.4709-1.0244L26.95,28.3638,28.364,26.95l-1.4787-1.479A5.9592,5.9592,0,0,0,27.91,23Zm-8,3a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,22,26Z"/><path d="M28,6a2,2,0,0,0-2-2H22V2H20V4H12V2H10V4H6A2,2,0,0,0,4,6V26a2,2,0,0,0,2,2h4V26H6V6h4V8h2V6h8V8h2V6h4v6h2Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TIME = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>time</title><path d="M16,30A14,14,0,1,1,30,16,14,14,0,0,1,16,30ZM16,4A12,12,0,1,0,28,16,12,12,0,0,0,16,4Z"/><polygon points="20.59 22 15 16.41 15 7 17 7 17 15.58 22 20.59 20.59 22"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TIME_FILLED = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="m16,2c-7.6001,0-14,6.3999-14,14s6.3999,14,14,14,14-6.3999,14-14S23.6001,2,16,2Zm4.5872,20l-5.5872-5.5898V7h2v8.582l5,5.0044-1.4128,1.4136Z"/><polygon id="_inner-path_" data-name="&amp;lt;inner-path&amp;gt;" class="cls-1" points="20.5872 22 15 16.4099 15 7 17 7 17 15.5822 22 20.5866 20.5872 22"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    TIMER = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:#000000;}.cls-2{fill:none;}</style></defs><title>timer</title><rect x="15" y="11" width="2" height="9"/><rect class="cls-1" x="13" y="2" width="6" height="2"/><path d="M28,9,26.58,7.59,24.33,9.84a10.94,10.94,0,1,0,1.18,1.65ZM16,26a9,9,0,1,1,9-9A9,9,0,0,1,16,26Z"/><rect class="cls-2" width="32" height="32"/></svg>'
-    CHECKBOX = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>checkbox</title><path d="M26,4H6A2,2,0,0,0,4,6V26a2,2,0,0,0,2,2H26a2,2,0,0,0,2-2V6A2,2,0,0,0,26,4ZM6,26V6H26V26Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHECKBOX_CHECKED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>checkbox--checked</title><path d="M26,4H6A2,2,0,0,0,4,6V26a2,2,0,0,0,2,2H26a2,2,0,0,0,2-2V6A2,2,0,0,0,26,4ZM6,26V6H26V26Z"/><polygon points="14 21.5 9 16.54 10.59 15 14 18.35 21.41 11 23 12.58 14 21.5"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHECKBOX_CHECKED_FILLED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>checkbox--checked--filled</title><path d="M26,4H6A2,2,0,0,0,4,6V26a2,2,0,0,0,2,2H26a2,2,0,0,0,2-2V6A2,2,0,0,0,26,4ZM14,21.5,9,16.5427,10.5908,15,14,18.3456,21.4087,11l1.5918,1.5772Z" transform="translate(0 0)"/><path id="inner-path" class="cls-1" d="M14,21.5,9,16.5427,10.5908,15,14,18.3456,21.4087,11l1.5918,1.5772Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHECKBOX_INDETERMINATE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>checkbox--indeterminate</title><rect x="10" y="14" width="12" height="4"/><path d="M26,4H6A2,2,0,0,0,4,6V26a2,2,0,0,0,2,2H26a2,2,0,0,0,2-2V6A2,2,0,0,0,26,4ZM6,26V6H26V26Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    CHECKBOX_INDETERMINATE_FILLED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>checkbox--indeterminate--filled</title><path d="M26,4H6A2,2,0,0,0,4,6V26a2,2,0,0,0,2,2H26a2,2,0,0,0,2-2V6A2,2,0,0,0,26,4ZM22,18H10V14H22Z"/><path id="inner-path" class="cls-1" d="M22,18H10V14H22Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    RADIO_BUTTON = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>radio-button</title><path d="M16,2A14,14,0,1,0,30,16,14,14,0,0,0,16,2Zm0,26A12,12,0,1,1,28,16,12,12,0,0,1,16,28Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    RADIO_BUTTON_CHECKED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>radio-button--checked</title><path d="M16,2A14,14,0,1,0,30,16,14,14,0,0,0,16,2Zm0,26A12,12,0,1,1,28,16,12,12,0,0,1,16,28Z"/><path d="M16,10a6,6,0,1,0,6,6A6,6,0,0,0,16,10Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TEXT_SELECTION = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>text-selection</title><path d="M28,27H21a3,3,0,0,1-3-3V22a3,3,0,0,1,3-3h5V17a1,1,0,0,0-1-1H19V14h6a3,3,0,0,1,3,3Zm-7-6a1,1,0,0,0-1,1v2a1,1,0,0,0,1,1h5V21Z"/><path d="M13,7h3V5H13a4,4,0,0,0-3,1.38A4,4,0,0,0,7,5H4V7H7A2,2,0,0,1,9,9v5H5v2H9v7a2,2,0,0,1-2,2H4v2H7a4,4,0,0,0,3-1.38A4,4,0,0,0,13,27h3V25H13a2,2,0,0,1-2-2V16h4V14H11V9A2,2,0,0,1,13,7Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TEXT_BOLD = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>text-bold</title><path d="M18.25,25H9V7h8.5a5.25,5.25,0,0,1,4,8.65A5.25,5.25,0,0,1,18.25,25ZM12,22h6.23a2.25,2.25,0,1,0,0-4.5H12Zm0-7.5h5.5a2.25,2.25,0,1,0,0-4.5H12Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TEXT_ITALIC = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>text-italic</title><polygon points="25 9 25 7 12 7 12 9 17.14 9 12.77 23 7 23 7 25 20 25 20 23 14.86 23 19.23 9 25 9"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TEXT_UNDERLINE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>text-underline</title><rect x="4" y="26" width="24" height="2"/><path d="M16,23a7,7,0,0,1-7-7V5h2V16a5,5,0,0,0,10,0V5h2V16A7,7,0,0,1,16,23Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TEXT_STRIKETHROUGH = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>text--strikethrough</title><path d="M28,15H17.9563c-.4522-.1237-.9037-.2324-1.3381-.3352-2.8077-.6641-4.396-1.1506-4.396-3.4231a2.8684,2.8684,0,0,1,.7866-2.145,4.7888,4.7888,0,0,1,3.0137-1.09c2.8291-.07,4.1347.8894,5.2011,2.35l1.6153-1.1792a7.4727,7.4727,0,0,0-6.83-3.1706,6.7726,6.7726,0,0,0-4.4,1.6611,4.8274,4.8274,0,0,0-1.3862,3.5735A4.3723,4.3723,0,0,0,11.9573,15H4v2H17.6519c1.9668.57,3.1432,1.3123,3.1733,3.3579a3.119,3.119,0,0,1-.8623,2.3931A5.8241,5.8241,0,0,1,16.2432,24a6.6344,6.6344,0,0,1-5.1451-2.6912L9.5649,22.593A8.5262,8.5262,0,0,0,16.2119,26c.0088-.0012.042,0,.1,0A7.67,7.67,0,0,0,21.36,24.1812a5.0779,5.0779,0,0,0,1.4648-3.8531A4.952,4.952,0,0,0,21.6753,17H28Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TEXT_ALIGN_LEFT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>align--left</title><rect x="12" y="6" width="14" height="2"/><rect x="12" y="12" width="10" height="2"/><rect x="12" y="18" width="14" height="2"/><rect x="12" y="24" width="10" height="2"/><rect x="6" y="4" width="2" height="24"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TEXT_ALIGN_CENTER = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>align--center</title><rect x="6" y="6" width="20" height="2"/><rect x="10" y="12" width="12" height="2"/><rect x="6" y="18" width="20" height="2"/><rect x="10" y="24" width="12" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TEXT_ALIGN_RIGHT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>align--right</title><rect x="6" y="6" width="14" height="2"/><rect x="10" y="12" width="10" height="2"/><rect x="6" y="18" width="14" height="2"/><rect x="10" y="24" width="10" height="2"/><rect x="24" y="4" width="2" height="24"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TEXT_ALIGN_JUSTIFY = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>text--align--justify</title><rect x="6" y="6" width="20" height="2"/><rect x="6" y="12" width="20" height="2"/><rect x="6" y="18" width="20" height="2"/><rect x="6" y="24" width="20" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-
-    # Data Operations
-    EXPORT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M26,24v4H6V24H4v4l.0076-.0049A1.9977,1.9977,0,0,0,6,30H26a2,2,0,0,0,2-2h0V24Z"/><polygon points="6 12 7.411 13.405 15 5.825 15 24 17 24 17 5.825 24.591 13.405 26 12 16 2 6 12"/><g id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;"><rect class="cls-1" width="32" height="32"/></g></svg>'
-    TABLE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>table</title><path d="M29,5a2,2,0,0,0-2-2H5A2,2,0,0,0,3,5V27a2,2,0,0,0,2,2H27a2,2,0,0,0,2-2ZM27,5V9H5V5Zm0,22H5V23H27Zm0-6H5V17H27Zm0-6H5V11H27Z" transform="translate(0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    TABLE_SPLIT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>table--split</title><path d="M27,3H5A2,2,0,0,0,3,5V27a2,2,0,0,0,2,2H27a2,2,0,0,0,2-2V5A2,2,0,0,0,27,3Zm0,2V9H5V5ZM17,11H27v7H17Zm-2,7H5V11H15ZM5,20H15v7H5Zm12,7V20H27v7Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ROW_COLLAPSE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>row--collapse</title><path d="M26,20H6a2,2,0,0,0-2,2v4a2,2,0,0,0,2,2H26a2,2,0,0,0,2-2V22A2,2,0,0,0,26,20Zm0,6H6V22H26Z"/><polygon points="17 7.828 19.586 10.414 21 9 16 4 11 9 12.414 10.414 15 7.828 15 14 4 14 4 16 28 16 28 14 17 14 17 7.828"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ROW_EXPAND = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>row--expand</title><polygon points="4 18 15 18 15 24.172 12.414 21.586 11 23 16 28 21 23 19.586 21.586 17 24.172 17 18 28 18 28 16 4 16 4 18"/><path d="M26,4H6A2,2,0,0,0,4,6v4a2,2,0,0,0,2,2H26a2,2,0,0,0,2-2V6A2,2,0,0,0,26,4Zm0,6H6V6H26Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    FILTER_REMOVE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="30 11.414 28.586 10 24 14.586 19.414 10 18 11.414 22.586 16 18 20.585 19.415 22 24 17.414 28.587 22 30 20.587 25.414 16 30 11.414"/><path d="M4,4A2,2,0,0,0,2,6V9.1709a2,2,0,0,0,.5859,1.4145L10,18v8a2,2,0,0,0,2,2h4a2,2,0,0,0,2-2V24H16v2H12V17.1709l-.5859-.5855L4,9.1709V6H24V8h2V6a2,2,0,0,0-2-2Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    FILTER_RESET = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M22.5,9A7.4522,7.4522,0,0,0,16,12.792V8H14v8h8V14H17.6167A5.4941,5.4941,0,1,1,22.5,22H22v2h.5a7.5,7.5,0,0,0,0-15Z"/><path d="M26,6H4V9.171l7.4142,7.4143L12,17.171V26h4V24h2v2a2,2,0,0,1-2,2H12a2,2,0,0,1-2-2V18L2.5858,10.5853A2,2,0,0,1,2,9.171V6A2,2,0,0,1,4,4H26Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SORT_ASCENDING = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="18 22 19.414 20.586 23 24.172 23 4 25 4 25 24.172 28.586 20.586 30 22 24 28 18 22"/><rect x="2" y="18" width="14" height="2"/><rect x="6" y="12" width="10" height="2"/><rect x="10" y="6" width="6" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SORT_DESCENDING = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="18 22 19.414 20.586 23 24.172 23 4 25 4 25 24.172 28.586 20.586 30 22 24 28 18 22"/><rect x="2" y="6" width="14" height="2"/><rect x="6" y="12" width="10" height="2"/><rect x="10" y="18" width="6" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SORT_REMOVE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="30 19.415 28.586 18 25 21.587 21.414 18 20 19.415 23.586 23 20 26.586 21.414 28 25 24.414 28.586 28 30 26.586 26.414 23 30 19.415"/><rect x="10" y="18" width="6" height="2"/><rect x="2" y="6" width="14" height="2"/><rect x="6" y="12" width="10" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_FORMAT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><rect x="18" y="11" width="8" height="2"/><rect x="6" y="19" width="8" height="2"/><path d="M10,16a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,10,16Zm0-6a2,2,0,1,0,2,2A2.002,2.002,0,0,0,10,10Z"/><path d="M22,24a4,4,0,1,1,4-4A4.0045,4.0045,0,0,1,22,24Zm0-6a2,2,0,1,0,2,2A2.002,2.002,0,0,0,22,18Z"/><path d="M28,30H4a2.0021,2.0021,0,0,1-2-2V4A2.0021,2.0021,0,0,1,4,2H28a2.0021,2.0021,0,0,1,2,2V28A2.0021,2.0021,0,0,1,28,30ZM4,4V28H28V4Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_SET = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="25 12 25 3 23 3 23 5 20 5 20 7 23 7 23 12 20 12 20 14 28 14 28 12 25 12"/><path d="m8.5,5c1.9299,0,3.5,1.5701,3.5,3.5s-1.5701,3.5-3.5,3.5-3.5-1.5701-3.5-3.5,1.5701-3.5,3.5-3.5m0-2c-3.0376,0-5.5,2.4624-5.5,5.5s2.4624,5.5,5.5,5.5,5.5-2.4624,5.5-5.5-2.4624-5.5-5.5-5.5h0Z"/><path d="m8.5,20c1.9299,0,3.5,1.5701,3.5,3.5s-1.5701,3.5-3.5,3.5-3.5-1.5701-3.5-3.5,1.5701-3.5,3.5-3.5m0-2c-3.0376,0-5.5,2.4624-5.5,5.5s2.4624,5.5,5.5,5.5,5.5-2.4624,5.5-5.5-2.4624-5.5-5.5-5.5h0Z"/><path d="m23.5,20c1.9299,0,3.5,1.5701,3.5,3.5s-1.5701,3.5-3.5,3.5-3.5-1.5701-3.5-3.5,1.5701-3.5,3.5-3.5m0-2c-3.0376,0-5.5,2.4624-5.5,5.5s2.4624,5.5,5.5,5.5,5.5-2.4624,5.5-5.5-2.4624-5.5-5.5-5.5h0Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_STRUCTURED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>data-structured</title><circle cx="9" cy="7" r="1"/><path d="M27,22.14V18a2,2,0,0,0-2-2H17V12h9a2,2,0,0,0,2-2V4a2,2,0,0,0-2-2H6A2,2,0,0,0,4,4v6a2,2,0,0,0,2,2h9v4H7a2,2,0,0,0-2,2v4.14a4,4,0,1,0,2,0V18h8v4H12v8h8V22H17V18h8v4.14a4,4,0,1,0,2,0ZM8,26a2,2,0,1,1-2-2A2,2,0,0,1,8,26Zm10-2v4H14V24ZM6,10V4H26v6ZM26,28a2,2,0,1,1,2-2A2,2,0,0,1,26,28Z" transform="translate(0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    DATA_UNSTRUCTURED = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>data--unstructured</title><path d="M6,24a2,2,0,1,1-2,2,2,2,0,0,1,2-2m0-2a4,4,0,1,0,4,4A4,4,0,0,0,6,22Z"/><path d="M16,4a2,2,0,1,1-2,2,2,2,0,0,1,2-2m0-2a4,4,0,1,0,4,4A4,4,0,0,0,16,2Z"/><path d="M26,4a2,2,0,1,1-2,2,2,2,0,0,1,2-2m0-2a4,4,0,1,0,4,4A4,4,0,0,0,26,2Z"/><path d="M18,24v4H14V24h4m2-2H12v8h8Z"/><path d="M27,22.14V17a2,2,0,0,0-2-2H7V10h3V2H2v8H5v5a2,2,0,0,0,2,2H25v5.14a4,4,0,1,0,2,0ZM4,4H8V8H4ZM26,28a2,2,0,1,1,2-2A2,2,0,0,1,26,28Z"/><g id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;"><rect class="cls-1" width="32" height="32"/></g></svg>'
-    DATA_CATEGORICAL = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="m29,30h-10c-.5522,0-1-.4478-1-1v-10c0-.5522.4478-1,1-1h10c.5522,0,1,.4478,1,1v10c0,.5522-.4478,1-1,1Zm-9-2h8v-8h-8v8Z"/><path d="m8,30c-3.3083,0-6-2.6917-6-6s2.6917-6,6-6,6,2.6917,6,6-2.6917,6-6,6Zm0-10c-2.2056,0-4,1.7944-4,4s1.7944,4,4,4,4-1.7944,4-4-1.7944-4-4-4Z"/><path d="m22,14h-12c-.3604,0-.6926-.1938-.8701-.5073s-.1729-.6982.0127-1.0072L15.1446,2.4822c.1937-.3229.5246-.4822.8554-.4822s.6617.1593.8554.4822l6.002,10.0033c.1855.309.1902.6937.0127,1.0072s-.5098.5073-.8701.5073Zm-10.2339-2h8.4678l-4.2339-7.0564-4.2339,7.0564Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-    DB2_DATABASE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M16,3c-5.2979,0-11,1.252-11,4V25c0,2.748,5.7021,4,11,4s11-1.252,11-4V7c0-2.748-5.7021-4-11-4Zm0,2c5.7976,0,8.7949,1.4341,8.9968,2-.2019,.5659-3.1992,2-8.9968,2-5.8413,0-8.8394-1.4556-9-1.9824v-.0049c.1606-.5571,3.1587-2.0127,9-2.0127ZM7,9.4277c2.1279,1.0674,5.6426,1.5723,9,1.5723s6.8721-.5049,9-1.5723v3.5596c-.1606,.5571-3.1587,2.0127-9,2.0127-5.8501,0-8.8491-1.46-9-2v-3.5723Zm0,6c2.1279,1.0674,5.6426,1.5723,9,1.5723s6.8721-.5049,9-1.5723v3.5596c-.1606,.5571-3.1587,2.0127-9,2.0127-5.8501,0-8.8491-1.46-9-2v-3.5723Zm9,11.5723c-5.8501,0-8.8491-1.46-9-2v-3.5723c2.1279,1.0674,5.6426,1.5723,9,1.5723s6.8721-.5049,9-1.5723v3.5596c-.1606,.5571-3.1587,2.0127-9,2.0127Z"/><rect id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;" class="cls-1" width="32" height="32"/></svg>'
-
-    # AI & Machine Learning
-    BOT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><title>bot</title><rect x="18" y="10" width="2" height="2"/><rect x="12" y="10" width="2" height="2"/><path d="M26,20H21V18h1a2.0023,2.0023,0,0,0,2-2V12h2V10H24V8a2.0023,2.0023,0,0,0-2-2H20V2H18V6H14V2H12V6H10A2.0023,2.0023,0,0,0,8,8v2H6v2H8v4a2.0023,2.0023,0,0,0,2,2h1v2H6a2.0023,2.0023,0,0,0-2,2v8H6V22H26v8h2V22A2.0023,2.0023,0,0,0,26,20ZM10,8H22v8H10Zm3,10h6v2H13Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    WATSON = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>watson</title><path d="M21.74,9.49h0A11.41,11.41,0,0,0,16,8h0a.76.76,0,1,0,0,1.51,10.15,10.15,0,0,1,1.91.21c-2.26,1.08-4.76,3.58-6.73,7a22.48,22.48,0,0,0-2,4.44A9.58,9.58,0,0,1,7,17.22a3.43,3.43,0,0,1,.28-2.66v0h0c.79-1.37,2.44-2.15,4.63-2.2a.76.76,0,0,0,.74-.78.75.75,0,0,0-.78-.74C9.19,10.88,7.1,11.92,6,13.74H6v0s0,0,0,0a4.84,4.84,0,0,0-.44,3.79,12,12,0,0,0,3.2,5.22A11.36,11.36,0,0,0,8.52,26a10,10,0,0,1-2-3.48A.75.75,0,0,0,5.57,22a.76.76,0,0,0-.49,1,11.45,11.45,0,0,0,5.18,6.38h0A11.42,11.42,0,0,0,16,30.92a11.74,11.74,0,0,0,3-.39,11.48,11.48,0,0,0,2.77-21ZM18.58,29.06a9.9,9.9,0,0,1-7.56-1h0c-.86-.49-1.21-2-.94-4a18.85,18.85,0,0,0,2.48,1.72,13.92,13.92,0,0,0,6.93,2,11,11,0,0,0,2.42-.28A9.78,9.78,0,0,1,18.58,29.06Zm6.06-4.66c-2,2-6.66,2.74-11.32.05a17.36,17.36,0,0,1-2.89-2.12,21.08,21.08,0,0,1,2.08-4.91c2.94-5.08,6.83-7.57,8.47-6.62h0A10,10,0,0,1,24.64,24.4Z"/><path d="M4.16,11.72,1.14,10a.76.76,0,1,0-.76,1.31L3.4,13a.86.86,0,0,0,.38.1.77.77,0,0,0,.66-.38A.76.76,0,0,0,4.16,11.72Z"/><path d="M8.29,7.59A.74.74,0,0,0,8.94,8a.75.75,0,0,0,.38-.1.76.76,0,0,0,.28-1l-1.74-3a.76.76,0,0,0-1-.27.75.75,0,0,0-.28,1Z"/><path d="M16,6.08a.76.76,0,0,0,.76-.76V1.83a.76.76,0,0,0-1.52,0V5.32A.76.76,0,0,0,16,6.08Z"/><path d="M22.68,7.87a.75.75,0,0,0,1-.28l1.75-3a.75.75,0,0,0-.28-1,.76.76,0,0,0-1,.27l-1.74,3A.76.76,0,0,0,22.68,7.87Z"/><path d="M31.9,10.25a.76.76,0,0,0-1-.27l-3,1.74a.76.76,0,0,0-.28,1,.77.77,0,0,0,.66.38.86.86,0,0,0,.38-.1l3-1.75A.76.76,0,0,0,31.9,10.25Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    WATSON_MACHINE_LEARNING = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>watson--machine-learning</title><path d="M22,26H20V17.76l-3.23,3.88a1,1,0,0,1-1.54,0L12,17.76V26H10V15a1,1,0,0,1,.66-.94,1,1,0,0,1,1.11.3L16,19.44l4.23-5.08a1,1,0,0,1,1.11-.3A1,1,0,0,1,22,15Z" transform="translate(0)"/><path d="M4.16,14.65l-3-1.75a.76.76,0,1,0-.76,1.32L3.4,16a.76.76,0,1,0,.76-1.31Z" transform="translate(0)"/><path d="M8.29,10.52a.73.73,0,0,0,1,.27.75.75,0,0,0,.28-1l-1.74-3a.76.76,0,1,0-1.32.76Z" transform="translate(0)"/><path d="M16,9a.76.76,0,0,0,.76-.76V4.76a.76.76,0,1,0-1.52,0V8.25A.76.76,0,0,0,16,9Z" transform="translate(0)"/><path d="M22.68,10.79a.75.75,0,0,0,.37.11.76.76,0,0,0,.66-.38l1.75-3a.76.76,0,0,0-1.32-.76l-1.74,3A.75.75,0,0,0,22.68,10.79Z" transform="translate(0)"/><path d="M31.9,13.18a.76.76,0,0,0-1-.28l-3,1.75A.76.76,0,0,0,28.6,16l3-1.74A.77.77,0,0,0,31.9,13.18Z" transform="translate(0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    MACHINE_LEARNING = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>machine-learning</title><path d="M16,25a6.9908,6.9908,0,0,1-5.833-3.1287l1.666-1.1074a5.0007,5.0007,0,0,0,8.334,0l1.666,1.1074A6.9908,6.9908,0,0,1,16,25Z"/><path d="M20,14a2,2,0,1,0,2,2A1.9806,1.9806,0,0,0,20,14Z"/><path d="M12,14a2,2,0,1,0,2,2A1.9806,1.9806,0,0,0,12,14Z"/><path d="M30,16V14H28V10a4.0045,4.0045,0,0,0-4-4H22V2H20V6H12V2H10V6H8a4.0045,4.0045,0,0,0-4,4v4H2v2H4v5H2v2H4v3a4.0045,4.0045,0,0,0,4,4H24a4.0045,4.0045,0,0,0,4-4V23h2V21H28V16ZM26,26a2.0023,2.0023,0,0,1-2,2H8a2.0023,2.0023,0,0,1-2-2V10A2.0023,2.0023,0,0,1,8,8H24a2.0023,2.0023,0,0,1,2,2Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    COGNITIVE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>cognitive</title><path d="M30,13A11,11,0,0,0,19,2H11a9,9,0,0,0-9,9v3a5,5,0,0,0,5,5H8.1A5,5,0,0,0,13,23h1.38l4,7,1.73-1-4-6.89A2,2,0,0,0,14.38,21H13a3,3,0,0,1,0-6h1V13H13a5,5,0,0,0-4.9,4H7a3,3,0,0,1-3-3V12H6A3,3,0,0,0,9,9V8H7V9a1,1,0,0,1-1,1H4.08A7,7,0,0,1,11,4h6V6a1,1,0,0,1-1,1H14V9h2a3,3,0,0,0,3-3V4a9,9,0,0,1,8.05,5H26a3,3,0,0,0-3,3v1h2V12a1,1,0,0,1,1-1h1.77A8.76,8.76,0,0,1,28,13v1a5,5,0,0,1-5,5H20v2h3a7,7,0,0,0,3-.68V21a3,3,0,0,1-3,3H22v2h1a5,5,0,0,0,5-5V18.89A7,7,0,0,0,30,14Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    MODEL_ALT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M28.4473,16.1055,23,13.3818V7a1,1,0,0,0-.5527-.8945l-6-3a1.0008,1.0008,0,0,0-.8946,0l-6,3A1,1,0,0,0,9,7v6.3818L3.5527,16.1055A1,1,0,0,0,3,17v7a1,1,0,0,0,.5527.8945l6,3a1.001,1.001,0,0,0,.8946,0L16,25.1182l5.5527,2.7763a1.001,1.001,0,0,0,.8946,0l6-3A1,1,0,0,0,29,24V17A1,1,0,0,0,28.4473,16.1055ZM21,13.3818l-4,2V10.6182l4-2ZM16,5.1182,19.7637,7,16,8.8818,12.2363,7Zm-5,3.5,4,2v4.7636l-4-2ZM9,25.3818l-4-2V18.6182l4,2Zm1-6.5L6.2363,17,10,15.1182,13.7637,17Zm1,1.7364,4-2v4.7636l-4,2Zm10,4.7636-4-2V18.6182l4,2Zm1-6.5L18.2363,17,22,15.1182,25.7637,17Zm5,4.5-4,2V20.6182l4-2Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    MODEL_REFERENCE = '<?xml version="1.0" encoding="UTF-8"?><svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } .cls-1, .cls-2 { stroke-width: 0px; } </style></defs><polygon class="cls-2" points="4 20 4 22 8.5859 22 2 28.5859 3.4141 30 10 23.4141 10 28 12 28 12 20 4 20"/><path class="cls-2" d="m27,19c1.6543,0,3-1.3457,3-3s-1.3457-3-3-3c-1.302,0-2.4016.8385-2.8157,2h-5.7703l7.3005-7.3006c.3911.1871.8237.3006,1.2854.3006,1.6543,0,3-1.3457,3-3s-1.3457-3-3-3c-1.302,0-2.4016.8385-2.8157,2H7.8157c-.4141-1.1615-1.5137-2-2.8157-2-1.6543,0-3,1.3457-3,3s1.3457,3,3,3c.4617,0,.8943-.1135,1.2854-.3006l7.3005,7.3006h-5.7703c-.4141-1.1615-1.5137-2-2.8157-2-1.6543,0-3,1.3457-3,3v1h2v-1c0-.5513.4482-1,1-1s1,.4487,1,1v1h9.5859l8.7146,8.7147c-.0442.0927-.0815.1877-.1162.2853h-10.1843v2h10.1843c.4141,1.1615,1.5137,2,2.8157,2,1.6543,0,3-1.3457,3-3s-1.3457-3-3-3c-.4617,0-.8943.1135-1.2854.3006l-7.3005-7.3006h5.7703c.4141,1.1615,1.5137,2,2.8157,2Zm1,8c0,.5513-.4482,1-1,1s-1-.4487-1-1,.4482-1,1-1,1,.4487,1,1Zm-1-12c.5518,0,1,.4487,1,1s-.4482,1-1,1-1-.4487-1-1,.4482-1,1-1ZM7.8157,6h16.3687c.0349.0976.072.1927.1162.2853l-8.3005,8.3006L7.6995,6.2853c.0442-.0927.0815-.1877.1162-.2853Zm19.1843-2c.5518,0,1,.4487,1,1s-.4482,1-1,1-1-.4487-1-1,.4482-1,1-1ZM4,5c0-.5513.4482-1,1-1s1,.4487,1,1-.4482,1-1,1-1-.4487-1-1Z"/><g id="_Transparent_Rectangle_" data-name="&amp;lt;Transparent Rectangle&amp;gt;"><rect class="cls-1" width="32" height="32"/></g></svg>'
-    FUNCTION = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M19.6262,29.5256,19.11,27.5935A12.0035,12.0035,0,0,0,25.2312,8.3323l1.5376-1.2788a14.0033,14.0033,0,0,1-7.1426,22.4721Z"/><path d="M10,29H8V25.18l.8037-.1607C10.2617,24.728,12,23.6206,12,20V18.6182l-4-2V14.3818l4-2V12c0-5.4673,3.9253-9,10-9h2V6.82l-.8037.1607C21.7383,7.272,20,8.3794,20,12v.3818l4,2v2.2364l-4,2V20C20,25.4673,16.0747,29,10,29Zm0-2c4.9346,0,8-2.6821,8-7V17.3818L21.7642,15.5,18,13.6182V12c0-4.5781,2.3853-6.1924,4-6.76V5c-4.9346,0-8,2.6821-8,7v1.6182L10.2358,15.5,14,17.3818V20c0,4.5781-2.3853,6.1924-4,6.76Z"/><path d="M5.2312,24.9465A14.0032,14.0032,0,0,1,12.3779,2.4734l.5161,1.9321A12.0035,12.0035,0,0,0,6.7688,23.6677Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-
-    # Navigation & UI Controls
-    MENU = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>menu</title><rect x="4" y="6" width="24" height="2"/><rect x="4" y="24" width="24" height="2"/><rect x="4" y="12" width="24" height="2"/><rect x="4" y="18" width="24" height="2"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    OVERFLOW_MENU_HORIZONTAL = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><title>overflow-menu--horizontal</title><circle cx="8" cy="16" r="2"/><circle cx="16" cy="16" r="2"/><circle cx="24" cy="16" r="2"/><rect id="_Transparent_Rectangle_" class="st0" width="32" height="32"/></svg>'
-    OVERFLOW_MENU_VERTICAL = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><title>overflow-menu--vertical</title><circle cx="16" cy="8" r="2"/><circle cx="16" cy="16" r="2"/><circle cx="16" cy="24" r="2"/><rect id="_Transparent_Rectangle_" class="st0" width="32" height="32"/></svg>'
-    PAGE_FIRST = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 22.1.0, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><polygon points="14,16 24,6 25.4,7.4 16.8,16 25.4,24.6 24,26 "/><rect x="8" y="4" width="2" height="24"/><rect id="_Transparent_Rectangle_" class="st0" width="32" height="32"/></svg>'
-    PAGE_LAST = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 22.1.0, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><polygon points="18,16 8,26 6.6,24.6 15.2,16 6.6,7.4 8,6 "/><rect x="22" y="4" width="2" height="24"/><rect id="_x3C_Transparent_Rectangle_x3E_" class="st0" width="32" height="32"/></svg>'
-    ARROW_UP = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="16 4 6 14 7.41 15.41 15 7.83 15 28 17 28 17 7.83 24.59 15.41 26 14 16 4"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ARROW_DOWN = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="24.59 16.59 17 24.17 17 4 15 4 15 24.17 7.41 16.59 6 18 16 28 26 18 24.59 16.59"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ARROW_LEFT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="14 26 15.41 24.59 7.83 17 28 17 28 15 7.83 15 15.41 7.41 14 6 4 16 14 26"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ARROW_RIGHT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="18 6 16.57 7.393 24.15 15 4 15 4 17 24.15 17 16.57 24.573 18 26 28 16 18 6"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ARROWS_HORIZONTAL = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>arrows--horizontal</title><polygon points="11.41 26.59 7.83 23 28 23 28 21 7.83 21 11.41 17.41 10 16 4 22 10 28 11.41 26.59"/><polygon points="28 10 22 4 20.59 5.41 24.17 9 4 9 4 11 24.17 11 20.59 14.59 22 16 28 10"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32" transform="translate(32) rotate(90)"/></svg>'
-    ARROWS_VERTICAL = '<?xml version="1.0" encoding="utf-8"?><!-- Generator: Adobe Illustrator 24.0.3, SVG Export Plug-In . SVG Version: 6.00 Build 0) --><svg version="1.1" id="icon" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" x="0px" y="0px" width="32px" height="32px" viewBox="0 0 32 32" style="enable-background:new 0 0 32 32;" xml:space="preserve"><style type="text/css"> .st0{fill:none;}</style><title>arrows--vertical</title><polygon points="27.6,20.6 24,24.2 24,4 22,4 22,24.2 18.4,20.6 17,22 23,28 29,22 "/><polygon points="9,4 3,10 4.4,11.4 8,7.8 8,28 10,28 10,7.8 13.6,11.4 15,10 "/><rect id="_Transparent_Rectangle_" class="st0" width="32" height="32"/></svg>'
-    MAXIMIZE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="20 2 20 4 26.586 4 18 12.582 19.414 14 28 5.414 28 12 30 12 30 2 20 2"/><polygon points="14 19.416 12.592 18 4 26.586 4 20 2 20 2 30 12 30 12 28 5.414 28 14 19.416"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32" transform="translate(32 32) rotate(-180)"/></svg>'
-    MINIMIZE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><polygon points="4 18 4 20 10.586 20 2 28.582 3.414 30 12 21.414 12 28 14 28 14 18 4 18"/><polygon points="30 3.416 28.592 2 20 10.586 20 4 18 4 18 14 28 14 28 12 21.414 12 30 3.416"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32" transform="translate(32 32) rotate(-180)"/></svg>'
-    MOVE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>move</title><polygon points="25 11 23.59 12.41 26.17 15 17 15 17 5.83 19.59 8.41 21 7 16 2 11 7 12.41 8.41 15 5.83 15 15 5.83 15 8.41 12.41 7 11 2 16 7 21 8.41 19.59 5.83 17 15 17 15 26.17 12.41 23.59 11 25 16 30 21 25 19.59 23.59 17 26.17 17 17 26.17 17 23.59 19.59 25 21 30 16 25 11"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ROTATE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>rotate</title><path d="M17.91,26.82l.35,2a12.9,12.9,0,0,0,4.24-1.54l-1-1.73A10.88,10.88,0,0,1,17.91,26.82Z"/><path d="M24.42,23.07,26,24.35a13,13,0,0,0,2.24-3.91l-1.87-.68A11,11,0,0,1,24.42,23.07Z"/><path d="M9.5,27.25a12.9,12.9,0,0,0,4.24,1.54l.35-2a10.88,10.88,0,0,1-3.59-1.3Z"/><path d="M5.67,19.76l-1.87.68A13,13,0,0,0,6,24.35l.32-.26,1.22-1h0a11,11,0,0,1-1.91-3.31Z"/><path d="M29,16a12.85,12.85,0,0,0-.8-4.44l-1.87.68A11.18,11.18,0,0,1,27,16Z"/><path d="M26,7.65a13,13,0,0,0-20,0V4H4v8h8V10H6.81A11,11,0,0,1,24.42,8.93Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ROTATE_CLOCKWISE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>rotate--clockwise</title><path d="M28,30H16a2.0023,2.0023,0,0,1-2-2V16a2.0023,2.0023,0,0,1,2-2H28a2.0023,2.0023,0,0,1,2,2V28A2.0023,2.0023,0,0,1,28,30ZM16,16V28H28.0012L28,16Z" transform="translate(0)"/><path d="M15,2,13.59,3.41,16.17,6H11a7.0078,7.0078,0,0,0-7,7v5H6V13a5.0057,5.0057,0,0,1,5-5h5.17l-2.58,2.59L15,12l5-5Z" transform="translate(0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    ROTATE_COUNTERCLOCKWISE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>rotate--counterclockwise</title><path d="M2,28V16a2.0023,2.0023,0,0,1,2-2H16a2.0023,2.0023,0,0,1,2,2V28a2.0023,2.0023,0,0,1-2,2H4A2.0023,2.0023,0,0,1,2,28ZM4,16,3.9988,28H16V16Z" transform="translate(0 0)"/><path d="M17,2l1.41,1.41L15.83,6H21a7.0078,7.0078,0,0,1,7,7v5H26V13a5.0057,5.0057,0,0,0-5-5H15.83l2.58,2.59L17,12,12,7Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    RESET = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>reset</title><path d="M18,28A12,12,0,1,0,6,16v6.2L2.4,18.6,1,20l6,6,6-6-1.4-1.4L8,22.2V16H8A10,10,0,1,1,18,26Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    RESTART = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M26,18A10,10,0,1,1,16,8h6.1821l-3.5844,3.5854L20,13l6-6L20,1,18.5977,2.414,22.1851,6H16A12,12,0,1,0,28,18Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    RENEW = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>renew</title><path d="M12,10H6.78A11,11,0,0,1,27,16h2A13,13,0,0,0,6,7.68V4H4v8h8Z"/><path d="M20,22h5.22A11,11,0,0,1,5,16H3a13,13,0,0,0,23,8.32V28h2V20H20Z"/><g id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;"><rect class="cls-1" width="32" height="32"/></g></svg>'
-    REPEAT = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M6,6H26.1719l-3.586-3.5859L24,1l6,6-6,6-1.4141-1.4141L26.1719,8H6v7H4V8A2.0024,2.0024,0,0,1,6,6Z"/><path d="M9.4141,20.4141,5.8281,24H26V17h2v7a2.0024,2.0024,0,0,1-2,2H5.8281L9.414,29.5859,8,31,2,25l6-6Z"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    REPEAT_ONE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 32 32"><defs><style> .cls-1 { fill: none; } </style></defs><path d="M6,6H26.1719l-3.586-3.5859L24,1l6,6-6,6-1.4141-1.4141L26.1719,8H6v7H4V8A2.0024,2.0024,0,0,1,6,6Z" transform="translate(0)"/><path d="M9.4141,20.4141,5.8281,24H26V17h2v7a2.0024,2.0024,0,0,1-2,2H5.8281L9.414,29.5859,8,31,2,25l6-6Z" transform="translate(0)"/><polygon points="17 19 17 11 15 11 15 12 13 12 13 14 15 14 15 19 13 19 13 21 19 21 19 19 17 19"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
-    SHUFFLE = '<svg id="icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32"><defs><style>.cls-1{fill:none;}</style></defs><title>shuffle</title><path d="M22.59,19.41,26.17,23H19.55l-4.37-7,4.37-7h6.62l-3.58,3.59L24,14l6-6L24,2,22.59,3.41,26.17,7H19.55a2,2,0,0,0-1.69.94L14,14.11,10.14,7.94A2,2,0,0,0,8.45,7H2V9H8.45l4.37,7L8.45,23H2v2H8.45a2,2,0,0,0,1.69-.94L14,17.89l3.86,6.17a2,2,0,0,0,1.69.94h6.62l-3.58,3.59L24,30l6-6-6-6Z" transform="translate(0 0)"/><rect id="_Transparent_Rectangle_" data-name="&lt;Transparent Rectangle&gt;" class="cls-1" width="32" height="32"/></svg>'
+        Returns
+        -------
+        list of str
+            Icon attribute names, best match first
+        """
+        return _search(query, limit)
@@ -27,4 +27,3 @@ var e=Object.defineProperty,t=(t,n,r)=>((t,n,r)=>n in t?e(t,n,{enumerable:!0,con
  * This source code is licensed under the MIT license found in the
  * LICENSE file in the root directory of this source tree.
  */function re(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var ie=new Set,se={};function oe(e,t){ae(e,t),ae(e+"Capture",t)}function ae(e,t){for(se[e]=t,e=0;e<t.length;e++)ie.add(t[e])}var le=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),ue=Object.prototype.hasOwnProperty,ce=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,de={},fe={};function he(e,t,n,r,i,s,o){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=i,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=s,this.removeEmptyString=o}var pe={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){pe[e]=new he(e,0,!1,e,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var t=e[0];pe[t]=new he(t,1,!1,e[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){pe[e]=new he(e,2,!1,e.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){pe[e]=new he(e,2,!1,e,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){pe[e]=new he(e,3,!1,e.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(e){pe[e]=new he(e,3,!0,e,null,!1,!1)})),["capture","download"].forEach((function(e){pe[e]=new he(e,4,!1,e,null,!1,!1)})),["cols","rows","size","span"].forEach((function(e){pe[e]=new he(e,6,!1,e,null,!1,!1)})),["rowSpan","start"].forEach((function(e){pe[e]=new he(e,5,!1,e.toLowerCase(),null,!1,!1)}));var ye=/[\-:]([a-z])/g;function be(e){return e[1].toUpperCase()}function me(e,t,n,r){var i=pe.hasOwnProperty(t)?pe[t]:null;(null!==i?0!==i.type:r||!(2<t.length)||"o"!==t[0]&&"O"!==t[0]||"n"!==t[1]&&"N"!==t[1])&&(function(e,t,n,r){if(null==t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,i,r)&&(n=null),r||null===i?function(e){return!!ue.call(fe,e)||!ue.call(de,e)&&(ce.test(e)?fe[e]=!0:(de[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):i.mustUseProperty?e[i.propertyName]=null===n?3!==i.type&&"":n:(t=i.attributeName,r=i.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(i=i.type)||4===i&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var t=e.replace(ye,be);pe[t]=new he(t,1,!1,e,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var t=e.replace(ye,be);pe[t]=new he(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var t=e.replace(ye,be);pe[t]=new he(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(e){pe[e]=new he(e,1,!1,e.toLowerCase(),null,!1,!1)})),pe.xlinkHref=new he("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(e){pe[e]=new he(e,1,!1,e.toLowerCase(),null,!0,!0)}));var ge=te.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,ve=Symbol.for("react.element"),we=Symbol.for("react.portal"),_e=Symbol.for("react.fragment"),Se=Symbol.for("react.strict_mode"),Ie=Symbol.for("react.profiler"),xe=Symbol.for("react.provider"),ke=Symbol.for("react.context"),Te=Symbol.for("react.forward_ref"),Ce=Symbol.for("react.suspense"),Ee=Symbol.for("react.suspense_list"),Oe=Symbol.for("react.memo"),Be=Symbol.for("react.lazy"),De=Symbol.for("react.offscreen"),Ne=Symbol.iterator;function Me(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=Ne&&e[Ne]||e["@@iterator"])?e:null}var Ae,Fe=Object.assign;function Le(e){if(void 0===Ae)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ae=t&&t[1]||""}return"\n"+Ae+e}var Ue=!1;function Pe(e,t){if(!e||Ue)return"";Ue=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(u){var r=u}Reflect.construct(e,[],t)}else{try{t.call()}catch(u){r=u}e.call(t.prototype)}else{try{throw Error()}catch(u){r=u}e()}}catch(u){if(u&&r&&"string"==typeof u.stack){for(var i=u.stack.split("\n"),s=r.stack.split("\n"),o=i.length-1,a=s.length-1;1<=o&&0<=a&&i[o]!==s[a];)a--;for(;1<=o&&0<=a;o--,a--)if(i[o]!==s[a]){if(1!==o||1!==a)do{if(o--,0>--a||i[o]!==s[a]){var l="\n"+i[o].replace(" at new "," at ");return e.displayName&&l.includes("<anonymous>")&&(l=l.replace("<anonymous>",e.displayName)),l}}while(1<=o&&0<=a);break}}}finally{Ue=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Le(e):""}function ze(e){switch(e.tag){case 5:return Le(e.type);case 16:return Le("Lazy");case 13:return Le("Suspense");case 19:return Le("SuspenseList");case 0:case 2:case 15:return e=Pe(e.type,!1);case 11:return e=Pe(e.type.render,!1);case 1:return e=Pe(e.type,!0);default:return""}}function Re(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case _e:return"Fragment";case we:return"Portal";case Ie:return"Profiler";case Se:return"StrictMode";case Ce:return"Suspense";case Ee:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case ke:return(e.displayName||"Context")+".Consumer";case xe:return(e._context.displayName||"Context")+".Provider";case Te:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case Oe:return null!==(t=e.displayName||null)?t:Re(e.type)||"Memo";case Be:t=e._payload,e=e._init;try{return Re(e(t))}catch(n){}}return null}function Ve(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=t.render).displayName||e.name||"",t.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return Re(t);case 8:return t===Se?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"==typeof t)return t.displayName||t.name||null;if("string"==typeof t)return t}return null}function je(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function $e(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function We(e){e._valueTracker||(e._valueTracker=function(e){var t=$e(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var i=n.get,s=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(e){r=""+e,s.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function He(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=$e(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function Ye(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Qe(e,t){var n=t.checked;return Fe({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function Ke(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=je(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function qe(e,t){null!=(t=t.checked)&&me(e,"checked",t,!1)}function Je(e,t){qe(e,t);var n=je(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?Xe(e,t.type,n):t.hasOwnProperty("defaultValue")&&Xe(e,t.type,je(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function Ge(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function Xe(e,t,n){"number"===t&&Ye(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Ze=Array.isArray;function et(e,t,n,r){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&r&&(e[n].defaultSelected=!0)}else{for(n=""+je(n),t=null,i=0;i<e.length;i++){if(e[i].value===n)return e[i].selected=!0,void(r&&(e[i].defaultSelected=!0));null!==t||e[i].disabled||(t=e[i])}null!==t&&(t.selected=!0)}}function tt(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(re(91));return Fe({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function nt(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(re(92));if(Ze(n)){if(1<n.length)throw Error(re(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:je(n)}}function rt(e,t){var n=je(t.value),r=je(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function it(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}function st(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ot(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?st(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var at,lt,ut=(lt=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((at=at||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=at.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction((function(){return lt(e,t)}))}:lt);function ct(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var dt={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},ft=["Webkit","ms","Moz","O"];function ht(e,t,n){return null==t||"boolean"==typeof t||""===t?"":n||"number"!=typeof t||0===t||dt.hasOwnProperty(e)&&dt[e]?(""+t).trim():t+"px"}function pt(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),i=ht(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,i):e[n]=i}}Object.keys(dt).forEach((function(e){ft.forEach((function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),dt[t]=dt[e]}))}));var yt=Fe({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function bt(e,t){if(t){if(yt[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(re(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(re(60));if("object"!=typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(re(61))}if(null!=t.style&&"object"!=typeof t.style)throw Error(re(62))}}function mt(e,t){if(-1===e.indexOf("-"))return"string"==typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var gt=null;function vt(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var wt=null,_t=null,St=null;function It(e){if(e=ms(e)){if("function"!=typeof wt)throw Error(re(280));var t=e.stateNode;t&&(t=vs(t),wt(e.stateNode,e.type,t))}}function xt(e){_t?St?St.push(e):St=[e]:_t=e}function kt(){if(_t){var e=_t,t=St;if(St=_t=null,It(e),t)for(e=0;e<t.length;e++)It(t[e])}}function Tt(e,t){return e(t)}function Ct(){}var Et=!1;function Ot(e,t,n){if(Et)return e(t,n);Et=!0;try{return Tt(e,t,n)}finally{Et=!1,(null!==_t||null!==St)&&(Ct(),kt())}}function Bt(e,t){var n=e.stateNode;if(null===n)return null;var r=vs(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(re(231,t,typeof n));return n}var Dt=!1;if(le)try{var Nt={};Object.defineProperty(Nt,"passive",{get:function(){Dt=!0}}),window.addEventListener("test",Nt,Nt),window.removeEventListener("test",Nt,Nt)}catch(lt){Dt=!1}function Mt(e,t,n,r,i,s,o,a,l){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(c){this.onError(c)}}var At=!1,Ft=null,Lt=!1,Ut=null,Pt={onError:function(e){At=!0,Ft=e}};function zt(e,t,n,r,i,s,o,a,l){At=!1,Ft=null,Mt.apply(Pt,arguments)}function Rt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{!!(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function Vt(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function jt(e){if(Rt(e)!==e)throw Error(re(188))}function $t(e){return null!==(e=function(e){var t=e.alternate;if(!t){if(null===(t=Rt(e)))throw Error(re(188));return t!==e?null:e}for(var n=e,r=t;;){var i=n.return;if(null===i)break;var s=i.alternate;if(null===s){if(null!==(r=i.return)){n=r;continue}break}if(i.child===s.child){for(s=i.child;s;){if(s===n)return jt(i),e;if(s===r)return jt(i),t;s=s.sibling}throw Error(re(188))}if(n.return!==r.return)n=i,r=s;else{for(var o=!1,a=i.child;a;){if(a===n){o=!0,n=i,r=s;break}if(a===r){o=!0,r=i,n=s;break}a=a.sibling}if(!o){for(a=s.child;a;){if(a===n){o=!0,n=s,r=i;break}if(a===r){o=!0,r=s,n=i;break}a=a.sibling}if(!o)throw Error(re(189))}}if(n.alternate!==r)throw Error(re(190))}if(3!==n.tag)throw Error(re(188));return n.stateNode.current===n?e:t}(e))?Wt(e):null}function Wt(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var t=Wt(e);if(null!==t)return t;e=e.sibling}return null}var Ht=ne.unstable_scheduleCallback,Yt=ne.unstable_cancelCallback,Qt=ne.unstable_shouldYield,Kt=ne.unstable_requestPaint,qt=ne.unstable_now,Jt=ne.unstable_getCurrentPriorityLevel,Gt=ne.unstable_ImmediatePriority,Xt=ne.unstable_UserBlockingPriority,Zt=ne.unstable_NormalPriority,en=ne.unstable_LowPriority,tn=ne.unstable_IdlePriority,nn=null,rn=null;var sn=Math.clz32?Math.clz32:function(e){return e>>>=0,0===e?32:31-(on(e)/an|0)|0},on=Math.log,an=Math.LN2;var ln=64,un=4194304;function cn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function dn(e,t){var n=e.pendingLanes;if(0===n)return 0;var r=0,i=e.suspendedLanes,s=e.pingedLanes,o=268435455&n;if(0!==o){var a=o&~i;0!==a?r=cn(a):0!==(s&=o)&&(r=cn(s))}else 0!==(o=n&~i)?r=cn(o):0!==s&&(r=cn(s));if(0===r)return 0;if(0!==t&&t!==r&&0===(t&i)&&((i=r&-r)>=(s=t&-t)||16===i&&4194240&s))return t;if(4&r&&(r|=16&n),0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)i=1<<(n=31-sn(t)),r|=e[n],t&=~i;return r}function fn(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function hn(e){return 0!==(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function pn(){var e=ln;return!(4194240&(ln<<=1))&&(ln=64),e}function yn(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function bn(e,t,n){e.pendingLanes|=t,536870912!==t&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[t=31-sn(t)]=n}function mn(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-sn(n),i=1<<r;i&t|e[r]&t&&(e[r]|=t),n&=~i}}var gn=0;function vn(e){return 1<(e&=-e)?4<e?268435455&e?16:536870912:4:1}var wn,_n,Sn,In,xn,kn=!1,Tn=[],Cn=null,En=null,On=null,Bn=new Map,Dn=new Map,Nn=[],Mn="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function An(e,t){switch(e){case"focusin":case"focusout":Cn=null;break;case"dragenter":case"dragleave":En=null;break;case"mouseover":case"mouseout":On=null;break;case"pointerover":case"pointerout":Bn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Dn.delete(t.pointerId)}}function Fn(e,t,n,r,i,s){return null===e||e.nativeEvent!==s?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:s,targetContainers:[i]},null!==t&&(null!==(t=ms(t))&&_n(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==i&&-1===t.indexOf(i)&&t.push(i),e)}function Ln(e){var t=bs(e.target);if(null!==t){var n=Rt(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=Vt(n)))return e.blockedOn=t,void xn(e.priority,(function(){Sn(n)}))}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Un(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Kn(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=ms(n))&&_n(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);gt=r,n.target.dispatchEvent(r),gt=null,t.shift()}return!0}function Pn(e,t,n){Un(e)&&n.delete(t)}function zn(){kn=!1,null!==Cn&&Un(Cn)&&(Cn=null),null!==En&&Un(En)&&(En=null),null!==On&&Un(On)&&(On=null),Bn.forEach(Pn),Dn.forEach(Pn)}function Rn(e,t){e.blockedOn===t&&(e.blockedOn=null,kn||(kn=!0,ne.unstable_scheduleCallback(ne.unstable_NormalPriority,zn)))}function Vn(e){function t(t){return Rn(t,e)}if(0<Tn.length){Rn(Tn[0],e);for(var n=1;n<Tn.length;n++){var r=Tn[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==Cn&&Rn(Cn,e),null!==En&&Rn(En,e),null!==On&&Rn(On,e),Bn.forEach(t),Dn.forEach(t),n=0;n<Nn.length;n++)(r=Nn[n]).blockedOn===e&&(r.blockedOn=null);for(;0<Nn.length&&null===(n=Nn[0]).blockedOn;)Ln(n),null===n.blockedOn&&Nn.shift()}var jn=ge.ReactCurrentBatchConfig,$n=!0;function Wn(e,t,n,r){var i=gn,s=jn.transition;jn.transition=null;try{gn=1,Yn(e,t,n,r)}finally{gn=i,jn.transition=s}}function Hn(e,t,n,r){var i=gn,s=jn.transition;jn.transition=null;try{gn=4,Yn(e,t,n,r)}finally{gn=i,jn.transition=s}}function Yn(e,t,n,r){if($n){var i=Kn(e,t,n,r);if(null===i)ji(e,t,r,Qn,n),An(e,r);else if(function(e,t,n,r,i){switch(t){case"focusin":return Cn=Fn(Cn,e,t,n,r,i),!0;case"dragenter":return En=Fn(En,e,t,n,r,i),!0;case"mouseover":return On=Fn(On,e,t,n,r,i),!0;case"pointerover":var s=i.pointerId;return Bn.set(s,Fn(Bn.get(s)||null,e,t,n,r,i)),!0;case"gotpointercapture":return s=i.pointerId,Dn.set(s,Fn(Dn.get(s)||null,e,t,n,r,i)),!0}return!1}(i,e,t,n,r))r.stopPropagation();else if(An(e,r),4&t&&-1<Mn.indexOf(e)){for(;null!==i;){var s=ms(i);if(null!==s&&wn(s),null===(s=Kn(e,t,n,r))&&ji(e,t,r,Qn,n),s===i)break;i=s}null!==i&&r.stopPropagation()}else ji(e,t,r,null,n)}}var Qn=null;function Kn(e,t,n,r){if(Qn=null,null!==(e=bs(e=vt(r))))if(null===(t=Rt(e)))e=null;else if(13===(n=t.tag)){if(null!==(e=Vt(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Qn=e,null}function qn(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Jt()){case Gt:return 1;case Xt:return 4;case Zt:case en:return 16;case tn:return 536870912;default:return 16}default:return 16}}var Jn=null,Gn=null,Xn=null;function Zn(){if(Xn)return Xn;var e,t,n=Gn,r=n.length,i="value"in Jn?Jn.value:Jn.textContent,s=i.length;for(e=0;e<r&&n[e]===i[e];e++);var o=r-e;for(t=1;t<=o&&n[r-t]===i[s-t];t++);return Xn=i.slice(e,1<t?1-t:void 0)}function er(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function tr(){return!0}function nr(){return!1}function rr(e){function t(t,n,r,i,s){for(var o in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=i,this.target=s,this.currentTarget=null,e)e.hasOwnProperty(o)&&(t=e[o],this[o]=t?t(i):i[o]);return this.isDefaultPrevented=(null!=i.defaultPrevented?i.defaultPrevented:!1===i.returnValue)?tr:nr,this.isPropagationStopped=nr,this}return Fe(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=tr)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=tr)},persist:function(){},isPersistent:tr}),t}var ir,sr,or,ar={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},lr=rr(ar),ur=Fe({},ar,{view:0,detail:0}),cr=rr(ur),dr=Fe({},ur,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Ir,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==or&&(or&&"mousemove"===e.type?(ir=e.screenX-or.screenX,sr=e.screenY-or.screenY):sr=ir=0,or=e),ir)},movementY:function(e){return"movementY"in e?e.movementY:sr}}),fr=rr(dr),hr=rr(Fe({},dr,{dataTransfer:0})),pr=rr(Fe({},ur,{relatedTarget:0})),yr=rr(Fe({},ar,{animationName:0,elapsedTime:0,pseudoElement:0})),br=Fe({},ar,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),mr=rr(br),gr=rr(Fe({},ar,{data:0})),vr={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},wr={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},_r={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Sr(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=_r[e])&&!!t[e]}function Ir(){return Sr}var xr=Fe({},ur,{key:function(e){if(e.key){var t=vr[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=er(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?wr[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Ir,charCode:function(e){return"keypress"===e.type?er(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?er(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),kr=rr(xr),Tr=rr(Fe({},dr,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Cr=rr(Fe({},ur,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Ir})),Er=rr(Fe({},ar,{propertyName:0,elapsedTime:0,pseudoElement:0})),Or=Fe({},dr,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Br=rr(Or),Dr=[9,13,27,32],Nr=le&&"CompositionEvent"in window,Mr=null;le&&"documentMode"in document&&(Mr=document.documentMode);var Ar=le&&"TextEvent"in window&&!Mr,Fr=le&&(!Nr||Mr&&8<Mr&&11>=Mr),Lr=String.fromCharCode(32),Ur=!1;function Pr(e,t){switch(e){case"keyup":return-1!==Dr.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function zr(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var Rr=!1;var Vr={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function jr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Vr[e.type]:"textarea"===t}function $r(e,t,n,r){xt(r),0<(t=Wi(t,"onChange")).length&&(n=new lr("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Wr=null,Hr=null;function Yr(e){Li(e,0)}function Qr(e){if(He(gs(e)))return e}function Kr(e,t){if("change"===e)return t}var qr=!1;if(le){var Jr;if(le){var Gr="oninput"in document;if(!Gr){var Xr=document.createElement("div");Xr.setAttribute("oninput","return;"),Gr="function"==typeof Xr.oninput}Jr=Gr}else Jr=!1;qr=Jr&&(!document.documentMode||9<document.documentMode)}function Zr(){Wr&&(Wr.detachEvent("onpropertychange",ei),Hr=Wr=null)}function ei(e){if("value"===e.propertyName&&Qr(Hr)){var t=[];$r(t,Hr,e,vt(e)),Ot(Yr,t)}}function ti(e,t,n){"focusin"===e?(Zr(),Hr=n,(Wr=t).attachEvent("onpropertychange",ei)):"focusout"===e&&Zr()}function ni(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Qr(Hr)}function ri(e,t){if("click"===e)return Qr(t)}function ii(e,t){if("input"===e||"change"===e)return Qr(t)}var si="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t};function oi(e,t){if(si(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!ue.call(t,i)||!si(e[i],t[i]))return!1}return!0}function ai(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function li(e,t){var n,r=ai(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=ai(r)}}function ui(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?ui(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function ci(){for(var e=window,t=Ye();t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=Ye((e=t.contentWindow).document)}return t}function di(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}function fi(e){var t=ci(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&ui(n.ownerDocument.documentElement,n)){if(null!==r&&di(n))if(t=r.start,void 0===(e=r.end)&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if((e=(t=n.ownerDocument||document)&&t.defaultView||window).getSelection){e=e.getSelection();var i=n.textContent.length,s=Math.min(r.start,i);r=void 0===r.end?s:Math.min(r.end,i),!e.extend&&s>r&&(i=r,r=s,s=i),i=li(n,s);var o=li(n,r);i&&o&&(1!==e.rangeCount||e.anchorNode!==i.node||e.anchorOffset!==i.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&((t=t.createRange()).setStart(i.node,i.offset),e.removeAllRanges(),s>r?(e.addRange(t),e.extend(o.node,o.offset)):(t.setEnd(o.node,o.offset),e.addRange(t)))}for(t=[],e=n;e=e.parentNode;)1===e.nodeType&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"==typeof n.focus&&n.focus(),n=0;n<t.length;n++)(e=t[n]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var hi=le&&"documentMode"in document&&11>=document.documentMode,pi=null,yi=null,bi=null,mi=!1;function gi(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;mi||null==pi||pi!==Ye(r)||("selectionStart"in(r=pi)&&di(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},bi&&oi(bi,r)||(bi=r,0<(r=Wi(yi,"onSelect")).length&&(t=new lr("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=pi)))}function vi(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var wi={animationend:vi("Animation","AnimationEnd"),animationiteration:vi("Animation","AnimationIteration"),animationstart:vi("Animation","AnimationStart"),transitionend:vi("Transition","TransitionEnd")},_i={},Si={};function Ii(e){if(_i[e])return _i[e];if(!wi[e])return e;var t,n=wi[e];for(t in n)if(n.hasOwnProperty(t)&&t in Si)return _i[e]=n[t];return e}le&&(Si=document.createElement("div").style,"AnimationEvent"in window||(delete wi.animationend.animation,delete wi.animationiteration.animation,delete wi.animationstart.animation),"TransitionEvent"in window||delete wi.transitionend.transition);var xi=Ii("animationend"),ki=Ii("animationiteration"),Ti=Ii("animationstart"),Ci=Ii("transitionend"),Ei=new Map,Oi="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Bi(e,t){Ei.set(e,t),oe(t,[e])}for(var Di=0;Di<Oi.length;Di++){var Ni=Oi[Di];Bi(Ni.toLowerCase(),"on"+(Ni[0].toUpperCase()+Ni.slice(1)))}Bi(xi,"onAnimationEnd"),Bi(ki,"onAnimationIteration"),Bi(Ti,"onAnimationStart"),Bi("dblclick","onDoubleClick"),Bi("focusin","onFocus"),Bi("focusout","onBlur"),Bi(Ci,"onTransitionEnd"),ae("onMouseEnter",["mouseout","mouseover"]),ae("onMouseLeave",["mouseout","mouseover"]),ae("onPointerEnter",["pointerout","pointerover"]),ae("onPointerLeave",["pointerout","pointerover"]),oe("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),oe("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),oe("onBeforeInput",["compositionend","keypress","textInput","paste"]),oe("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),oe("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),oe("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Mi="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Ai=new Set("cancel close invalid load scroll toggle".split(" ").concat(Mi));function Fi(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,i,s,o,a,l){if(zt.apply(this,arguments),At){if(!At)throw Error(re(198));var u=Ft;At=!1,Ft=null,Lt||(Lt=!0,Ut=u)}}(r,t,void 0,e),e.currentTarget=null}function Li(e,t){t=!!(4&t);for(var n=0;n<e.length;n++){var r=e[n],i=r.event;r=r.listeners;e:{var s=void 0;if(t)for(var o=r.length-1;0<=o;o--){var a=r[o],l=a.instance,u=a.currentTarget;if(a=a.listener,l!==s&&i.isPropagationStopped())break e;Fi(i,a,u),s=l}else for(o=0;o<r.length;o++){if(l=(a=r[o]).instance,u=a.currentTarget,a=a.listener,l!==s&&i.isPropagationStopped())break e;Fi(i,a,u),s=l}}}if(Lt)throw e=Ut,Lt=!1,Ut=null,e}function Ui(e,t){var n=t[hs];void 0===n&&(n=t[hs]=new Set);var r=e+"__bubble";n.has(r)||(Vi(t,e,2,!1),n.add(r))}function Pi(e,t,n){var r=0;t&&(r|=4),Vi(n,e,r,t)}var zi="_reactListening"+Math.random().toString(36).slice(2);function Ri(e){if(!e[zi]){e[zi]=!0,ie.forEach((function(t){"selectionchange"!==t&&(Ai.has(t)||Pi(t,!1,e),Pi(t,!0,e))}));var t=9===e.nodeType?e:e.ownerDocument;null===t||t[zi]||(t[zi]=!0,Pi("selectionchange",!1,t))}}function Vi(e,t,n,r){switch(qn(t)){case 1:var i=Wn;break;case 4:i=Hn;break;default:i=Yn}n=i.bind(null,t,n,e),i=void 0,!Dt||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(i=!0),r?void 0!==i?e.addEventListener(t,n,{capture:!0,passive:i}):e.addEventListener(t,n,!0):void 0!==i?e.addEventListener(t,n,{passive:i}):e.addEventListener(t,n,!1)}function ji(e,t,n,r,i){var s=r;if(!(1&t||2&t||null===r))e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var a=r.stateNode.containerInfo;if(a===i||8===a.nodeType&&a.parentNode===i)break;if(4===o)for(o=r.return;null!==o;){var l=o.tag;if((3===l||4===l)&&((l=o.stateNode.containerInfo)===i||8===l.nodeType&&l.parentNode===i))return;o=o.return}for(;null!==a;){if(null===(o=bs(a)))return;if(5===(l=o.tag)||6===l){r=s=o;continue e}a=a.parentNode}}r=r.return}Ot((function(){var r=s,i=vt(n),o=[];e:{var a=Ei.get(e);if(void 0!==a){var l=lr,u=e;switch(e){case"keypress":if(0===er(n))break e;case"keydown":case"keyup":l=kr;break;case"focusin":u="focus",l=pr;break;case"focusout":u="blur",l=pr;break;case"beforeblur":case"afterblur":l=pr;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":l=fr;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":l=hr;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":l=Cr;break;case xi:case ki:case Ti:l=yr;break;case Ci:l=Er;break;case"scroll":l=cr;break;case"wheel":l=Br;break;case"copy":case"cut":case"paste":l=mr;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":l=Tr}var c=!!(4&t),d=!c&&"scroll"===e,f=c?null!==a?a+"Capture":null:a;c=[];for(var h,p=r;null!==p;){var y=(h=p).stateNode;if(5===h.tag&&null!==y&&(h=y,null!==f&&(null!=(y=Bt(p,f))&&c.push($i(p,y,h)))),d)break;p=p.return}0<c.length&&(a=new l(a,u,null,n,i),o.push({event:a,listeners:c}))}}if(!(7&t)){if(l="mouseout"===e||"pointerout"===e,(!(a="mouseover"===e||"pointerover"===e)||n===gt||!(u=n.relatedTarget||n.fromElement)||!bs(u)&&!u[fs])&&(l||a)&&(a=i.window===i?i:(a=i.ownerDocument)?a.defaultView||a.parentWindow:window,l?(l=r,null!==(u=(u=n.relatedTarget||n.toElement)?bs(u):null)&&(u!==(d=Rt(u))||5!==u.tag&&6!==u.tag)&&(u=null)):(l=null,u=r),l!==u)){if(c=fr,y="onMouseLeave",f="onMouseEnter",p="mouse","pointerout"!==e&&"pointerover"!==e||(c=Tr,y="onPointerLeave",f="onPointerEnter",p="pointer"),d=null==l?a:gs(l),h=null==u?a:gs(u),(a=new c(y,p+"leave",l,n,i)).target=d,a.relatedTarget=h,y=null,bs(i)===r&&((c=new c(f,p+"enter",u,n,i)).target=h,c.relatedTarget=d,y=c),d=y,l&&u)e:{for(f=u,p=0,h=c=l;h;h=Hi(h))p++;for(h=0,y=f;y;y=Hi(y))h++;for(;0<p-h;)c=Hi(c),p--;for(;0<h-p;)f=Hi(f),h--;for(;p--;){if(c===f||null!==f&&c===f.alternate)break e;c=Hi(c),f=Hi(f)}c=null}else c=null;null!==l&&Yi(o,a,l,c,!1),null!==u&&null!==d&&Yi(o,d,u,c,!0)}if("select"===(l=(a=r?gs(r):window).nodeName&&a.nodeName.toLowerCase())||"input"===l&&"file"===a.type)var b=Kr;else if(jr(a))if(qr)b=ii;else{b=ni;var m=ti}else(l=a.nodeName)&&"input"===l.toLowerCase()&&("checkbox"===a.type||"radio"===a.type)&&(b=ri);switch(b&&(b=b(e,r))?$r(o,b,n,i):(m&&m(e,a,r),"focusout"===e&&(m=a._wrapperState)&&m.controlled&&"number"===a.type&&Xe(a,"number",a.value)),m=r?gs(r):window,e){case"focusin":(jr(m)||"true"===m.contentEditable)&&(pi=m,yi=r,bi=null);break;case"focusout":bi=yi=pi=null;break;case"mousedown":mi=!0;break;case"contextmenu":case"mouseup":case"dragend":mi=!1,gi(o,n,i);break;case"selectionchange":if(hi)break;case"keydown":case"keyup":gi(o,n,i)}var g;if(Nr)e:{switch(e){case"compositionstart":var v="onCompositionStart";break e;case"compositionend":v="onCompositionEnd";break e;case"compositionupdate":v="onCompositionUpdate";break e}v=void 0}else Rr?Pr(e,n)&&(v="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(v="onCompositionStart");v&&(Fr&&"ko"!==n.locale&&(Rr||"onCompositionStart"!==v?"onCompositionEnd"===v&&Rr&&(g=Zn()):(Gn="value"in(Jn=i)?Jn.value:Jn.textContent,Rr=!0)),0<(m=Wi(r,v)).length&&(v=new gr(v,e,null,n,i),o.push({event:v,listeners:m}),g?v.data=g:null!==(g=zr(n))&&(v.data=g))),(g=Ar?function(e,t){switch(e){case"compositionend":return zr(t);case"keypress":return 32!==t.which?null:(Ur=!0,Lr);case"textInput":return(e=t.data)===Lr&&Ur?null:e;default:return null}}(e,n):function(e,t){if(Rr)return"compositionend"===e||!Nr&&Pr(e,t)?(e=Zn(),Xn=Gn=Jn=null,Rr=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Fr&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(r=Wi(r,"onBeforeInput")).length&&(i=new gr("onBeforeInput","beforeinput",null,n,i),o.push({event:i,listeners:r}),i.data=g))}Li(o,t)}))}function $i(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Wi(e,t){for(var n=t+"Capture",r=[];null!==e;){var i=e,s=i.stateNode;5===i.tag&&null!==s&&(i=s,null!=(s=Bt(e,n))&&r.unshift($i(e,s,i)),null!=(s=Bt(e,t))&&r.push($i(e,s,i))),e=e.return}return r}function Hi(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Yi(e,t,n,r,i){for(var s=t._reactName,o=[];null!==n&&n!==r;){var a=n,l=a.alternate,u=a.stateNode;if(null!==l&&l===r)break;5===a.tag&&null!==u&&(a=u,i?null!=(l=Bt(n,s))&&o.unshift($i(n,l,a)):i||null!=(l=Bt(n,s))&&o.push($i(n,l,a))),n=n.return}0!==o.length&&e.push({event:t,listeners:o})}var Qi=/\r\n?/g,Ki=/\u0000|\uFFFD/g;function qi(e){return("string"==typeof e?e:""+e).replace(Qi,"\n").replace(Ki,"")}function Ji(e,t,n){if(t=qi(t),qi(e)!==t&&n)throw Error(re(425))}function Gi(){}var Xi=null,Zi=null;function es(e,t){return"textarea"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var ts="function"==typeof setTimeout?setTimeout:void 0,ns="function"==typeof clearTimeout?clearTimeout:void 0,rs="function"==typeof Promise?Promise:void 0,is="function"==typeof queueMicrotask?queueMicrotask:void 0!==rs?function(e){return rs.resolve(null).then(e).catch(ss)}:ts;function ss(e){setTimeout((function(){throw e}))}function os(e,t){var n=t,r=0;do{var i=n.nextSibling;if(e.removeChild(n),i&&8===i.nodeType)if("/$"===(n=i.data)){if(0===r)return e.removeChild(i),void Vn(t);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=i}while(n);Vn(t)}function as(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t)break;if("/$"===t)return null}}return e}function ls(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var us=Math.random().toString(36).slice(2),cs="__reactFiber$"+us,ds="__reactProps$"+us,fs="__reactContainer$"+us,hs="__reactEvents$"+us,ps="__reactListeners$"+us,ys="__reactHandles$"+us;function bs(e){var t=e[cs];if(t)return t;for(var n=e.parentNode;n;){if(t=n[fs]||n[cs]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=ls(e);null!==e;){if(n=e[cs])return n;e=ls(e)}return t}n=(e=n).parentNode}return null}function ms(e){return!(e=e[cs]||e[fs])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function gs(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(re(33))}function vs(e){return e[ds]||null}var ws=[],_s=-1;function Ss(e){return{current:e}}function Is(e){0>_s||(e.current=ws[_s],ws[_s]=null,_s--)}function xs(e,t){_s++,ws[_s]=e.current,e.current=t}var ks={},Ts=Ss(ks),Cs=Ss(!1),Es=ks;function Os(e,t){var n=e.type.contextTypes;if(!n)return ks;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var i,s={};for(i in n)s[i]=t[i];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=s),s}function Bs(e){return null!=(e=e.childContextTypes)}function Ds(){Is(Cs),Is(Ts)}function Ns(e,t,n){if(Ts.current!==ks)throw Error(re(168));xs(Ts,t),xs(Cs,n)}function Ms(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var i in r=r.getChildContext())if(!(i in t))throw Error(re(108,Ve(e)||"Unknown",i));return Fe({},n,r)}function As(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||ks,Es=Ts.current,xs(Ts,e),xs(Cs,Cs.current),!0}function Fs(e,t,n){var r=e.stateNode;if(!r)throw Error(re(169));n?(e=Ms(e,t,Es),r.__reactInternalMemoizedMergedChildContext=e,Is(Cs),Is(Ts),xs(Ts,e)):Is(Cs),xs(Cs,n)}var Ls=null,Us=!1,Ps=!1;function zs(e){null===Ls?Ls=[e]:Ls.push(e)}function Rs(){if(!Ps&&null!==Ls){Ps=!0;var e=0,t=gn;try{var n=Ls;for(gn=1;e<n.length;e++){var r=n[e];do{r=r(!0)}while(null!==r)}Ls=null,Us=!1}catch(i){throw null!==Ls&&(Ls=Ls.slice(e+1)),Ht(Gt,Rs),i}finally{gn=t,Ps=!1}}return null}var Vs=[],js=0,$s=null,Ws=0,Hs=[],Ys=0,Qs=null,Ks=1,qs="";function Js(e,t){Vs[js++]=Ws,Vs[js++]=$s,$s=e,Ws=t}function Gs(e,t,n){Hs[Ys++]=Ks,Hs[Ys++]=qs,Hs[Ys++]=Qs,Qs=e;var r=Ks;e=qs;var i=32-sn(r)-1;r&=~(1<<i),n+=1;var s=32-sn(t)+i;if(30<s){var o=i-i%5;s=(r&(1<<o)-1).toString(32),r>>=o,i-=o,Ks=1<<32-sn(t)+i|n<<i|r,qs=s+e}else Ks=1<<s|n<<i|r,qs=e}function Xs(e){null!==e.return&&(Js(e,1),Gs(e,1,0))}function Zs(e){for(;e===$s;)$s=Vs[--js],Vs[js]=null,Ws=Vs[--js],Vs[js]=null;for(;e===Qs;)Qs=Hs[--Ys],Hs[Ys]=null,qs=Hs[--Ys],Hs[Ys]=null,Ks=Hs[--Ys],Hs[Ys]=null}var eo=null,to=null,no=!1,ro=null;function io(e,t){var n=Oc(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,null===(t=e.deletions)?(e.deletions=[n],e.flags|=16):t.push(n)}function so(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,eo=e,to=as(t.firstChild),!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,eo=e,to=null,!0);case 13:return null!==(t=8!==t.nodeType?null:t)&&(n=null!==Qs?{id:Ks,overflow:qs}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},(n=Oc(18,null,null,0)).stateNode=t,n.return=e,e.child=n,eo=e,to=null,!0);default:return!1}}function oo(e){return!(!(1&e.mode)||128&e.flags)}function ao(e){if(no){var t=to;if(t){var n=t;if(!so(e,t)){if(oo(e))throw Error(re(418));t=as(n.nextSibling);var r=eo;t&&so(e,t)?io(r,n):(e.flags=-4097&e.flags|2,no=!1,eo=e)}}else{if(oo(e))throw Error(re(418));e.flags=-4097&e.flags|2,no=!1,eo=e}}}function lo(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;eo=e}function uo(e){if(e!==eo)return!1;if(!no)return lo(e),no=!0,!1;var t;if((t=3!==e.tag)&&!(t=5!==e.tag)&&(t="head"!==(t=e.type)&&"body"!==t&&!es(e.type,e.memoizedProps)),t&&(t=to)){if(oo(e))throw co(),Error(re(418));for(;t;)io(e,t),t=as(t.nextSibling)}if(lo(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(re(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){to=as(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}to=null}}else to=eo?as(e.stateNode.nextSibling):null;return!0}function co(){for(var e=to;e;)e=as(e.nextSibling)}function fo(){to=eo=null,no=!1}function ho(e){null===ro?ro=[e]:ro.push(e)}var po=ge.ReactCurrentBatchConfig;function yo(e,t,n){if(null!==(e=n.ref)&&"function"!=typeof e&&"object"!=typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(re(309));var r=n.stateNode}if(!r)throw Error(re(147,e));var i=r,s=""+e;return null!==t&&null!==t.ref&&"function"==typeof t.ref&&t.ref._stringRef===s?t.ref:((t=function(e){var t=i.refs;null===e?delete t[s]:t[s]=e})._stringRef=s,t)}if("string"!=typeof e)throw Error(re(284));if(!n._owner)throw Error(re(290,e))}return e}function bo(e,t){throw e=Object.prototype.toString.call(t),Error(re(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function mo(e){return(0,e._init)(e._payload)}function go(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function i(e,t){return(e=Dc(e,t)).index=0,e.sibling=null,e}function s(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=2,n):r:(t.flags|=2,n):(t.flags|=1048576,n)}function o(t){return e&&null===t.alternate&&(t.flags|=2),t}function a(e,t,n,r){return null===t||6!==t.tag?((t=Fc(n,e.mode,r)).return=e,t):((t=i(t,n)).return=e,t)}function l(e,t,n,r){var s=n.type;return s===_e?c(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===s||"object"==typeof s&&null!==s&&s.$$typeof===Be&&mo(s)===t.type)?((r=i(t,n.props)).ref=yo(e,t,n),r.return=e,r):((r=Nc(n.type,n.key,n.props,null,e.mode,r)).ref=yo(e,t,n),r.return=e,r)}function u(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Lc(n,e.mode,r)).return=e,t):((t=i(t,n.children||[])).return=e,t)}function c(e,t,n,r,s){return null===t||7!==t.tag?((t=Mc(n,e.mode,r,s)).return=e,t):((t=i(t,n)).return=e,t)}function d(e,t,n){if("string"==typeof t&&""!==t||"number"==typeof t)return(t=Fc(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case ve:return(n=Nc(t.type,t.key,t.props,null,e.mode,n)).ref=yo(e,null,t),n.return=e,n;case we:return(t=Lc(t,e.mode,n)).return=e,t;case Be:return d(e,(0,t._init)(t._payload),n)}if(Ze(t)||Me(t))return(t=Mc(t,e.mode,n,null)).return=e,t;bo(e,t)}return null}function f(e,t,n,r){var i=null!==t?t.key:null;if("string"==typeof n&&""!==n||"number"==typeof n)return null!==i?null:a(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case ve:return n.key===i?l(e,t,n,r):null;case we:return n.key===i?u(e,t,n,r):null;case Be:return f(e,t,(i=n._init)(n._payload),r)}if(Ze(n)||Me(n))return null!==i?null:c(e,t,n,r,null);bo(e,n)}return null}function h(e,t,n,r,i){if("string"==typeof r&&""!==r||"number"==typeof r)return a(t,e=e.get(n)||null,""+r,i);if("object"==typeof r&&null!==r){switch(r.$$typeof){case ve:return l(t,e=e.get(null===r.key?n:r.key)||null,r,i);case we:return u(t,e=e.get(null===r.key?n:r.key)||null,r,i);case Be:return h(e,t,n,(0,r._init)(r._payload),i)}if(Ze(r)||Me(r))return c(t,e=e.get(n)||null,r,i,null);bo(t,r)}return null}return function a(l,u,c,p){if("object"==typeof c&&null!==c&&c.type===_e&&null===c.key&&(c=c.props.children),"object"==typeof c&&null!==c){switch(c.$$typeof){case ve:e:{for(var y=c.key,b=u;null!==b;){if(b.key===y){if((y=c.type)===_e){if(7===b.tag){n(l,b.sibling),(u=i(b,c.props.children)).return=l,l=u;break e}}else if(b.elementType===y||"object"==typeof y&&null!==y&&y.$$typeof===Be&&mo(y)===b.type){n(l,b.sibling),(u=i(b,c.props)).ref=yo(l,b,c),u.return=l,l=u;break e}n(l,b);break}t(l,b),b=b.sibling}c.type===_e?((u=Mc(c.props.children,l.mode,p,c.key)).return=l,l=u):((p=Nc(c.type,c.key,c.props,null,l.mode,p)).ref=yo(l,u,c),p.return=l,l=p)}return o(l);case we:e:{for(b=c.key;null!==u;){if(u.key===b){if(4===u.tag&&u.stateNode.containerInfo===c.containerInfo&&u.stateNode.implementation===c.implementation){n(l,u.sibling),(u=i(u,c.children||[])).return=l,l=u;break e}n(l,u);break}t(l,u),u=u.sibling}(u=Lc(c,l.mode,p)).return=l,l=u}return o(l);case Be:return a(l,u,(b=c._init)(c._payload),p)}if(Ze(c))return function(i,o,a,l){for(var u=null,c=null,p=o,y=o=0,b=null;null!==p&&y<a.length;y++){p.index>y?(b=p,p=null):b=p.sibling;var m=f(i,p,a[y],l);if(null===m){null===p&&(p=b);break}e&&p&&null===m.alternate&&t(i,p),o=s(m,o,y),null===c?u=m:c.sibling=m,c=m,p=b}if(y===a.length)return n(i,p),no&&Js(i,y),u;if(null===p){for(;y<a.length;y++)null!==(p=d(i,a[y],l))&&(o=s(p,o,y),null===c?u=p:c.sibling=p,c=p);return no&&Js(i,y),u}for(p=r(i,p);y<a.length;y++)null!==(b=h(p,i,y,a[y],l))&&(e&&null!==b.alternate&&p.delete(null===b.key?y:b.key),o=s(b,o,y),null===c?u=b:c.sibling=b,c=b);return e&&p.forEach((function(e){return t(i,e)})),no&&Js(i,y),u}(l,u,c,p);if(Me(c))return function(i,o,a,l){var u=Me(a);if("function"!=typeof u)throw Error(re(150));if(null==(a=u.call(a)))throw Error(re(151));for(var c=u=null,p=o,y=o=0,b=null,m=a.next();null!==p&&!m.done;y++,m=a.next()){p.index>y?(b=p,p=null):b=p.sibling;var g=f(i,p,m.value,l);if(null===g){null===p&&(p=b);break}e&&p&&null===g.alternate&&t(i,p),o=s(g,o,y),null===c?u=g:c.sibling=g,c=g,p=b}if(m.done)return n(i,p),no&&Js(i,y),u;if(null===p){for(;!m.done;y++,m=a.next())null!==(m=d(i,m.value,l))&&(o=s(m,o,y),null===c?u=m:c.sibling=m,c=m);return no&&Js(i,y),u}for(p=r(i,p);!m.done;y++,m=a.next())null!==(m=h(p,i,y,m.value,l))&&(e&&null!==m.alternate&&p.delete(null===m.key?y:m.key),o=s(m,o,y),null===c?u=m:c.sibling=m,c=m);return e&&p.forEach((function(e){return t(i,e)})),no&&Js(i,y),u}(l,u,c,p);bo(l,c)}return"string"==typeof c&&""!==c||"number"==typeof c?(c=""+c,null!==u&&6===u.tag?(n(l,u.sibling),(u=i(u,c)).return=l,l=u):(n(l,u),(u=Fc(c,l.mode,p)).return=l,l=u),o(l)):n(l,u)}}var vo=go(!0),wo=go(!1),_o=Ss(null),So=null,Io=null,xo=null;function ko(){xo=Io=So=null}function To(e){var t=_o.current;Is(_o),e._currentValue=t}function Co(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Eo(e,t){So=e,xo=Io=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!==(e.lanes&t)&&(ml=!0),e.firstContext=null)}function Oo(e){var t=e._currentValue;if(xo!==e)if(e={context:e,memoizedValue:t,next:null},null===Io){if(null===So)throw Error(re(308));Io=e,So.dependencies={lanes:0,firstContext:e}}else Io=Io.next=e;return t}var Bo=null;function Do(e){null===Bo?Bo=[e]:Bo.push(e)}function No(e,t,n,r){var i=t.interleaved;return null===i?(n.next=n,Do(t)):(n.next=i.next,i.next=n),t.interleaved=n,Mo(e,r)}function Mo(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}var Ao=!1;function Fo(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Lo(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Uo(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Po(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,2&Tu){var i=r.pending;return null===i?t.next=t:(t.next=i.next,i.next=t),r.pending=t,Mo(e,n)}return null===(i=r.interleaved)?(t.next=t,Do(r)):(t.next=i.next,i.next=t),r.interleaved=t,Mo(e,n)}function zo(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,4194240&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,mn(e,n)}}function Ro(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,s=null;if(null!==(n=n.firstBaseUpdate)){do{var o={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===s?i=s=o:s=s.next=o,n=n.next}while(null!==n);null===s?i=s=t:s=s.next=t}else i=s=t;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:s,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Vo(e,t,n,r){var i=e.updateQueue;Ao=!1;var s=i.firstBaseUpdate,o=i.lastBaseUpdate,a=i.shared.pending;if(null!==a){i.shared.pending=null;var l=a,u=l.next;l.next=null,null===o?s=u:o.next=u,o=l;var c=e.alternate;null!==c&&((a=(c=c.updateQueue).lastBaseUpdate)!==o&&(null===a?c.firstBaseUpdate=u:a.next=u,c.lastBaseUpdate=l))}if(null!==s){var d=i.baseState;for(o=0,c=u=l=null,a=s;;){var f=a.lane,h=a.eventTime;if((r&f)===f){null!==c&&(c=c.next={eventTime:h,lane:0,tag:a.tag,payload:a.payload,callback:a.callback,next:null});e:{var p=e,y=a;switch(f=t,h=n,y.tag){case 1:if("function"==typeof(p=y.payload)){d=p.call(h,d,f);break e}d=p;break e;case 3:p.flags=-65537&p.flags|128;case 0:if(null==(f="function"==typeof(p=y.payload)?p.call(h,d,f):p))break e;d=Fe({},d,f);break e;case 2:Ao=!0}}null!==a.callback&&0!==a.lane&&(e.flags|=64,null===(f=i.effects)?i.effects=[a]:f.push(a))}else h={eventTime:h,lane:f,tag:a.tag,payload:a.payload,callback:a.callback,next:null},null===c?(u=c=h,l=d):c=c.next=h,o|=f;if(null===(a=a.next)){if(null===(a=i.shared.pending))break;a=(f=a).next,f.next=null,i.lastBaseUpdate=f,i.shared.pending=null}}if(null===c&&(l=d),i.baseState=l,i.firstBaseUpdate=u,i.lastBaseUpdate=c,null!==(t=i.shared.interleaved)){i=t;do{o|=i.lane,i=i.next}while(i!==t)}else null===s&&(i.shared.lanes=0);Au|=o,e.lanes=o,e.memoizedState=d}}function jo(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],i=r.callback;if(null!==i){if(r.callback=null,r=n,"function"!=typeof i)throw Error(re(191,i));i.call(r)}}}var $o={},Wo=Ss($o),Ho=Ss($o),Yo=Ss($o);function Qo(e){if(e===$o)throw Error(re(174));return e}function Ko(e,t){switch(xs(Yo,t),xs(Ho,e),xs(Wo,$o),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:ot(null,"");break;default:t=ot(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}Is(Wo),xs(Wo,t)}function qo(){Is(Wo),Is(Ho),Is(Yo)}function Jo(e){Qo(Yo.current);var t=Qo(Wo.current),n=ot(t,e.type);t!==n&&(xs(Ho,e),xs(Wo,n))}function Go(e){Ho.current===e&&(Is(Wo),Is(Ho))}var Xo=Ss(0);function Zo(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(128&t.flags)return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ea=[];function ta(){for(var e=0;e<ea.length;e++)ea[e]._workInProgressVersionPrimary=null;ea.length=0}var na=ge.ReactCurrentDispatcher,ra=ge.ReactCurrentBatchConfig,ia=0,sa=null,oa=null,aa=null,la=!1,ua=!1,ca=0,da=0;function fa(){throw Error(re(321))}function ha(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!si(e[n],t[n]))return!1;return!0}function pa(e,t,n,r,i,s){if(ia=s,sa=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,na.current=null===e||null===e.memoizedState?Ga:Xa,e=n(r,i),ua){s=0;do{if(ua=!1,ca=0,25<=s)throw Error(re(301));s+=1,aa=oa=null,t.updateQueue=null,na.current=Za,e=n(r,i)}while(ua)}if(na.current=Ja,t=null!==oa&&null!==oa.next,ia=0,aa=oa=sa=null,la=!1,t)throw Error(re(300));return e}function ya(){var e=0!==ca;return ca=0,e}function ba(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===aa?sa.memoizedState=aa=e:aa=aa.next=e,aa}function ma(){if(null===oa){var e=sa.alternate;e=null!==e?e.memoizedState:null}else e=oa.next;var t=null===aa?sa.memoizedState:aa.next;if(null!==t)aa=t,oa=e;else{if(null===e)throw Error(re(310));e={memoizedState:(oa=e).memoizedState,baseState:oa.baseState,baseQueue:oa.baseQueue,queue:oa.queue,next:null},null===aa?sa.memoizedState=aa=e:aa=aa.next=e}return aa}function ga(e,t){return"function"==typeof t?t(e):t}function va(e){var t=ma(),n=t.queue;if(null===n)throw Error(re(311));n.lastRenderedReducer=e;var r=oa,i=r.baseQueue,s=n.pending;if(null!==s){if(null!==i){var o=i.next;i.next=s.next,s.next=o}r.baseQueue=i=s,n.pending=null}if(null!==i){s=i.next,r=r.baseState;var a=o=null,l=null,u=s;do{var c=u.lane;if((ia&c)===c)null!==l&&(l=l.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:e(r,u.action);else{var d={lane:c,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};null===l?(a=l=d,o=r):l=l.next=d,sa.lanes|=c,Au|=c}u=u.next}while(null!==u&&u!==s);null===l?o=r:l.next=a,si(r,t.memoizedState)||(ml=!0),t.memoizedState=r,t.baseState=o,t.baseQueue=l,n.lastRenderedState=r}if(null!==(e=n.interleaved)){i=e;do{s=i.lane,sa.lanes|=s,Au|=s,i=i.next}while(i!==e)}else null===i&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function wa(e){var t=ma(),n=t.queue;if(null===n)throw Error(re(311));n.lastRenderedReducer=e;var r=n.dispatch,i=n.pending,s=t.memoizedState;if(null!==i){n.pending=null;var o=i=i.next;do{s=e(s,o.action),o=o.next}while(o!==i);si(s,t.memoizedState)||(ml=!0),t.memoizedState=s,null===t.baseQueue&&(t.baseState=s),n.lastRenderedState=s}return[s,r]}function _a(){}function Sa(e,t){var n=sa,r=ma(),i=t(),s=!si(r.memoizedState,i);if(s&&(r.memoizedState=i,ml=!0),r=r.queue,Aa(ka.bind(null,n,r,e),[e]),r.getSnapshot!==t||s||null!==aa&&1&aa.memoizedState.tag){if(n.flags|=2048,Oa(9,xa.bind(null,n,r,i,t),void 0,null),null===Cu)throw Error(re(349));30&ia||Ia(n,t,i)}return i}function Ia(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=sa.updateQueue)?(t={lastEffect:null,stores:null},sa.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function xa(e,t,n,r){t.value=n,t.getSnapshot=r,Ta(t)&&Ca(e)}function ka(e,t,n){return n((function(){Ta(t)&&Ca(e)}))}function Ta(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!si(e,n)}catch(r){return!0}}function Ca(e){var t=Mo(e,1);null!==t&&ec(t,e,1,-1)}function Ea(e){var t=ba();return"function"==typeof e&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:ga,lastRenderedState:e},t.queue=e,e=e.dispatch=Ya.bind(null,sa,e),[t.memoizedState,e]}function Oa(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=sa.updateQueue)?(t={lastEffect:null,stores:null},sa.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function Ba(){return ma().memoizedState}function Da(e,t,n,r){var i=ba();sa.flags|=e,i.memoizedState=Oa(1|t,n,void 0,void 0===r?null:r)}function Na(e,t,n,r){var i=ma();r=void 0===r?null:r;var s=void 0;if(null!==oa){var o=oa.memoizedState;if(s=o.destroy,null!==r&&ha(r,o.deps))return void(i.memoizedState=Oa(t,n,s,r))}sa.flags|=e,i.memoizedState=Oa(1|t,n,s,r)}function Ma(e,t){return Da(8390656,8,e,t)}function Aa(e,t){return Na(2048,8,e,t)}function Fa(e,t){return Na(4,2,e,t)}function La(e,t){return Na(4,4,e,t)}function Ua(e,t){return"function"==typeof t?(e=e(),t(e),function(){t(null)}):null!=t?(e=e(),t.current=e,function(){t.current=null}):void 0}function Pa(e,t,n){return n=null!=n?n.concat([e]):null,Na(4,4,Ua.bind(null,t,e),n)}function za(){}function Ra(e,t){var n=ma();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ha(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Va(e,t){var n=ma();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ha(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function ja(e,t,n){return 21&ia?(si(n,t)||(n=pn(),sa.lanes|=n,Au|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,ml=!0),e.memoizedState=n)}function $a(e,t){var n=gn;gn=0!==n&&4>n?n:4,e(!0);var r=ra.transition;ra.transition={};try{e(!1),t()}finally{gn=n,ra.transition=r}}function Wa(){return ma().memoizedState}function Ha(e,t,n){var r=Zu(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Qa(e))Ka(t,n);else if(null!==(n=No(e,t,n,r))){ec(n,e,r,Xu()),qa(n,t,r)}}function Ya(e,t,n){var r=Zu(e),i={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Qa(e))Ka(t,i);else{var s=e.alternate;if(0===e.lanes&&(null===s||0===s.lanes)&&null!==(s=t.lastRenderedReducer))try{var o=t.lastRenderedState,a=s(o,n);if(i.hasEagerState=!0,i.eagerState=a,si(a,o)){var l=t.interleaved;return null===l?(i.next=i,Do(t)):(i.next=l.next,l.next=i),void(t.interleaved=i)}}catch(u){}null!==(n=No(e,t,i,r))&&(ec(n,e,r,i=Xu()),qa(n,t,r))}}function Qa(e){var t=e.alternate;return e===sa||null!==t&&t===sa}function Ka(e,t){ua=la=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function qa(e,t,n){if(4194240&n){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,mn(e,n)}}var Ja={readContext:Oo,useCallback:fa,useContext:fa,useEffect:fa,useImperativeHandle:fa,useInsertionEffect:fa,useLayoutEffect:fa,useMemo:fa,useReducer:fa,useRef:fa,useState:fa,useDebugValue:fa,useDeferredValue:fa,useTransition:fa,useMutableSource:fa,useSyncExternalStore:fa,useId:fa,unstable_isNewReconciler:!1},Ga={readContext:Oo,useCallback:function(e,t){return ba().memoizedState=[e,void 0===t?null:t],e},useContext:Oo,useEffect:Ma,useImperativeHandle:function(e,t,n){return n=null!=n?n.concat([e]):null,Da(4194308,4,Ua.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Da(4194308,4,e,t)},useInsertionEffect:function(e,t){return Da(4,2,e,t)},useMemo:function(e,t){var n=ba();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=ba();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Ha.bind(null,sa,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},ba().memoizedState=e},useState:Ea,useDebugValue:za,useDeferredValue:function(e){return ba().memoizedState=e},useTransition:function(){var e=Ea(!1),t=e[0];return e=$a.bind(null,e[1]),ba().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=sa,i=ba();if(no){if(void 0===n)throw Error(re(407));n=n()}else{if(n=t(),null===Cu)throw Error(re(349));30&ia||Ia(r,t,n)}i.memoizedState=n;var s={value:n,getSnapshot:t};return i.queue=s,Ma(ka.bind(null,r,s,e),[e]),r.flags|=2048,Oa(9,xa.bind(null,r,s,n,t),void 0,null),n},useId:function(){var e=ba(),t=Cu.identifierPrefix;if(no){var n=qs;t=":"+t+"R"+(n=(Ks&~(1<<32-sn(Ks)-1)).toString(32)+n),0<(n=ca++)&&(t+="H"+n.toString(32)),t+=":"}else t=":"+t+"r"+(n=da++).toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},Xa={readContext:Oo,useCallback:Ra,useContext:Oo,useEffect:Aa,useImperativeHandle:Pa,useInsertionEffect:Fa,useLayoutEffect:La,useMemo:Va,useReducer:va,useRef:Ba,useState:function(){return va(ga)},useDebugValue:za,useDeferredValue:function(e){return ja(ma(),oa.memoizedState,e)},useTransition:function(){return[va(ga)[0],ma().memoizedState]},useMutableSource:_a,useSyncExternalStore:Sa,useId:Wa,unstable_isNewReconciler:!1},Za={readContext:Oo,useCallback:Ra,useContext:Oo,useEffect:Aa,useImperativeHandle:Pa,useInsertionEffect:Fa,useLayoutEffect:La,useMemo:Va,useReducer:wa,useRef:Ba,useState:function(){return wa(ga)},useDebugValue:za,useDeferredValue:function(e){var t=ma();return null===oa?t.memoizedState=e:ja(t,oa.memoizedState,e)},useTransition:function(){return[wa(ga)[0],ma().memoizedState]},useMutableSource:_a,useSyncExternalStore:Sa,useId:Wa,unstable_isNewReconciler:!1};function el(e,t){if(e&&e.defaultProps){for(var n in t=Fe({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}function tl(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:Fe({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var nl={isMounted:function(e){return!!(e=e._reactInternals)&&Rt(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Xu(),i=Zu(e),s=Uo(r,i);s.payload=t,null!=n&&(s.callback=n),null!==(t=Po(e,s,i))&&(ec(t,e,i,r),zo(t,e,i))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Xu(),i=Zu(e),s=Uo(r,i);s.tag=1,s.payload=t,null!=n&&(s.callback=n),null!==(t=Po(e,s,i))&&(ec(t,e,i,r),zo(t,e,i))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Xu(),r=Zu(e),i=Uo(n,r);i.tag=2,null!=t&&(i.callback=t),null!==(t=Po(e,i,r))&&(ec(t,e,r,n),zo(t,e,r))}};function rl(e,t,n,r,i,s,o){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,s,o):!t.prototype||!t.prototype.isPureReactComponent||(!oi(n,r)||!oi(i,s))}function il(e,t,n){var r=!1,i=ks,s=t.contextType;return"object"==typeof s&&null!==s?s=Oo(s):(i=Bs(t)?Es:Ts.current,s=(r=null!=(r=t.contextTypes))?Os(e,i):ks),t=new t(n,s),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=nl,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,e.__reactInternalMemoizedMaskedChildContext=s),t}function sl(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&nl.enqueueReplaceState(t,t.state,null)}function ol(e,t,n,r){var i=e.stateNode;i.props=n,i.state=e.memoizedState,i.refs={},Fo(e);var s=t.contextType;"object"==typeof s&&null!==s?i.context=Oo(s):(s=Bs(t)?Es:Ts.current,i.context=Os(e,s)),i.state=e.memoizedState,"function"==typeof(s=t.getDerivedStateFromProps)&&(tl(e,t,s,n),i.state=e.memoizedState),"function"==typeof t.getDerivedStateFromProps||"function"==typeof i.getSnapshotBeforeUpdate||"function"!=typeof i.UNSAFE_componentWillMount&&"function"!=typeof i.componentWillMount||(t=i.state,"function"==typeof i.componentWillMount&&i.componentWillMount(),"function"==typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),t!==i.state&&nl.enqueueReplaceState(i,i.state,null),Vo(e,n,i,r),i.state=e.memoizedState),"function"==typeof i.componentDidMount&&(e.flags|=4194308)}function al(e,t){try{var n="",r=t;do{n+=ze(r),r=r.return}while(r);var i=n}catch(s){i="\nError generating stack: "+s.message+"\n"+s.stack}return{value:e,source:t,stack:i,digest:null}}function ll(e,t,n){return{value:e,source:null,stack:null!=n?n:null,digest:null!=t?t:null}}function ul(e,t){try{console.error(t.value)}catch(n){setTimeout((function(){throw n}))}}var cl="function"==typeof WeakMap?WeakMap:Map;function dl(e,t,n){(n=Uo(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){ju||(ju=!0,$u=r),ul(0,t)},n}function fl(e,t,n){(n=Uo(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var i=t.value;n.payload=function(){return r(i)},n.callback=function(){ul(0,t)}}var s=e.stateNode;return null!==s&&"function"==typeof s.componentDidCatch&&(n.callback=function(){ul(0,t),"function"!=typeof r&&(null===Wu?Wu=new Set([this]):Wu.add(this));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}function hl(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new cl;var i=new Set;r.set(t,i)}else void 0===(i=r.get(t))&&(i=new Set,r.set(t,i));i.has(n)||(i.add(n),e=Ic.bind(null,e,t,n),t.then(e,e))}function pl(e){do{var t;if((t=13===e.tag)&&(t=null===(t=e.memoizedState)||null!==t.dehydrated),t)return e;e=e.return}while(null!==e);return null}function yl(e,t,n,r,i){return 1&e.mode?(e.flags|=65536,e.lanes=i,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((t=Uo(-1,1)).tag=2,Po(n,t,1))),n.lanes|=1),e)}var bl=ge.ReactCurrentOwner,ml=!1;function gl(e,t,n,r){t.child=null===e?wo(t,null,n,r):vo(t,e.child,n,r)}function vl(e,t,n,r,i){n=n.render;var s=t.ref;return Eo(t,i),r=pa(e,t,n,r,s,i),n=ya(),null===e||ml?(no&&n&&Xs(t),t.flags|=1,gl(e,t,r,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,jl(e,t,i))}function wl(e,t,n,r,i){if(null===e){var s=n.type;return"function"!=typeof s||Bc(s)||void 0!==s.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Nc(n.type,null,r,t,t.mode,i)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=s,_l(e,t,s,r,i))}if(s=e.child,0===(e.lanes&i)){var o=s.memoizedProps;if((n=null!==(n=n.compare)?n:oi)(o,r)&&e.ref===t.ref)return jl(e,t,i)}return t.flags|=1,(e=Dc(s,r)).ref=t.ref,e.return=t,t.child=e}function _l(e,t,n,r,i){if(null!==e){var s=e.memoizedProps;if(oi(s,r)&&e.ref===t.ref){if(ml=!1,t.pendingProps=r=s,0===(e.lanes&i))return t.lanes=e.lanes,jl(e,t,i);131072&e.flags&&(ml=!0)}}return xl(e,t,n,r,i)}function Sl(e,t,n){var r=t.pendingProps,i=r.children,s=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(1&t.mode){if(!(1073741824&n))return e=null!==s?s.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,xs(Du,Bu),Bu|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==s?s.baseLanes:n,xs(Du,Bu),Bu|=r}else t.memoizedState={baseLanes:0,cachePool:null,transitions:null},xs(Du,Bu),Bu|=n;else null!==s?(r=s.baseLanes|n,t.memoizedState=null):r=n,xs(Du,Bu),Bu|=r;return gl(e,t,i,n),t.child}function Il(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function xl(e,t,n,r,i){var s=Bs(n)?Es:Ts.current;return s=Os(t,s),Eo(t,i),n=pa(e,t,n,r,s,i),r=ya(),null===e||ml?(no&&r&&Xs(t),t.flags|=1,gl(e,t,n,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,jl(e,t,i))}function kl(e,t,n,r,i){if(Bs(n)){var s=!0;As(t)}else s=!1;if(Eo(t,i),null===t.stateNode)Vl(e,t),il(t,n,r),ol(t,n,r,i),r=!0;else if(null===e){var o=t.stateNode,a=t.memoizedProps;o.props=a;var l=o.context,u=n.contextType;"object"==typeof u&&null!==u?u=Oo(u):u=Os(t,u=Bs(n)?Es:Ts.current);var c=n.getDerivedStateFromProps,d="function"==typeof c||"function"==typeof o.getSnapshotBeforeUpdate;d||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(a!==r||l!==u)&&sl(t,o,r,u),Ao=!1;var f=t.memoizedState;o.state=f,Vo(t,r,o,i),l=t.memoizedState,a!==r||f!==l||Cs.current||Ao?("function"==typeof c&&(tl(t,n,c,r),l=t.memoizedState),(a=Ao||rl(t,n,a,r,f,l,u))?(d||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||("function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount()),"function"==typeof o.componentDidMount&&(t.flags|=4194308)):("function"==typeof o.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=l),o.props=r,o.state=l,o.context=u,r=a):("function"==typeof o.componentDidMount&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,Lo(e,t),a=t.memoizedProps,u=t.type===t.elementType?a:el(t.type,a),o.props=u,d=t.pendingProps,f=o.context,"object"==typeof(l=n.contextType)&&null!==l?l=Oo(l):l=Os(t,l=Bs(n)?Es:Ts.current);var h=n.getDerivedStateFromProps;(c="function"==typeof h||"function"==typeof o.getSnapshotBeforeUpdate)||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(a!==d||f!==l)&&sl(t,o,r,l),Ao=!1,f=t.memoizedState,o.state=f,Vo(t,r,o,i);var p=t.memoizedState;a!==d||f!==p||Cs.current||Ao?("function"==typeof h&&(tl(t,n,h,r),p=t.memoizedState),(u=Ao||rl(t,n,u,r,f,p,l)||!1)?(c||"function"!=typeof o.UNSAFE_componentWillUpdate&&"function"!=typeof o.componentWillUpdate||("function"==typeof o.componentWillUpdate&&o.componentWillUpdate(r,p,l),"function"==typeof o.UNSAFE_componentWillUpdate&&o.UNSAFE_componentWillUpdate(r,p,l)),"function"==typeof o.componentDidUpdate&&(t.flags|=4),"function"==typeof o.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!=typeof o.componentDidUpdate||a===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof o.getSnapshotBeforeUpdate||a===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),o.props=r,o.state=p,o.context=l,r=u):("function"!=typeof o.componentDidUpdate||a===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof o.getSnapshotBeforeUpdate||a===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),r=!1)}return Tl(e,t,n,r,s,i)}function Tl(e,t,n,r,i,s){Il(e,t);var o=!!(128&t.flags);if(!r&&!o)return i&&Fs(t,n,!1),jl(e,t,s);r=t.stateNode,bl.current=t;var a=o&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&o?(t.child=vo(t,e.child,null,s),t.child=vo(t,null,a,s)):gl(e,t,a,s),t.memoizedState=r.state,i&&Fs(t,n,!0),t.child}function Cl(e){var t=e.stateNode;t.pendingContext?Ns(0,t.pendingContext,t.pendingContext!==t.context):t.context&&Ns(0,t.context,!1),Ko(e,t.containerInfo)}function El(e,t,n,r,i){return fo(),ho(i),t.flags|=256,gl(e,t,n,r),t.child}var Ol,Bl,Dl,Nl,Ml={dehydrated:null,treeContext:null,retryLane:0};function Al(e){return{baseLanes:e,cachePool:null,transitions:null}}function Fl(e,t,n){var r,i=t.pendingProps,s=Xo.current,o=!1,a=!!(128&t.flags);if((r=a)||(r=(null===e||null!==e.memoizedState)&&!!(2&s)),r?(o=!0,t.flags&=-129):null!==e&&null===e.memoizedState||(s|=1),xs(Xo,1&s),null===e)return ao(t),null!==(e=t.memoizedState)&&null!==(e=e.dehydrated)?(1&t.mode?"$!"===e.data?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(a=i.children,e=i.fallback,o?(i=t.mode,o=t.child,a={mode:"hidden",children:a},1&i||null===o?o=Ac(a,i,0,null):(o.childLanes=0,o.pendingProps=a),e=Mc(e,i,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Al(n),t.memoizedState=Ml,e):Ll(t,a));if(null!==(s=e.memoizedState)&&null!==(r=s.dehydrated))return function(e,t,n,r,i,s,o){if(n)return 256&t.flags?(t.flags&=-257,Ul(e,t,o,r=ll(Error(re(422))))):null!==t.memoizedState?(t.child=e.child,t.flags|=128,null):(s=r.fallback,i=t.mode,r=Ac({mode:"visible",children:r.children},i,0,null),(s=Mc(s,i,o,null)).flags|=2,r.return=t,s.return=t,r.sibling=s,t.child=r,1&t.mode&&vo(t,e.child,null,o),t.child.memoizedState=Al(o),t.memoizedState=Ml,s);if(!(1&t.mode))return Ul(e,t,o,null);if("$!"===i.data){if(r=i.nextSibling&&i.nextSibling.dataset)var a=r.dgst;return r=a,Ul(e,t,o,r=ll(s=Error(re(419)),r,void 0))}if(a=0!==(o&e.childLanes),ml||a){if(null!==(r=Cu)){switch(o&-o){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}0!==(i=0!==(i&(r.suspendedLanes|o))?0:i)&&i!==s.retryLane&&(s.retryLane=i,Mo(e,i),ec(r,e,i,-1))}return hc(),Ul(e,t,o,r=ll(Error(re(421))))}return"$?"===i.data?(t.flags|=128,t.child=e.child,t=kc.bind(null,e),i._reactRetry=t,null):(e=s.treeContext,to=as(i.nextSibling),eo=t,no=!0,ro=null,null!==e&&(Hs[Ys++]=Ks,Hs[Ys++]=qs,Hs[Ys++]=Qs,Ks=e.id,qs=e.overflow,Qs=t),t=Ll(t,r.children),t.flags|=4096,t)}(e,t,a,i,r,s,n);if(o){o=i.fallback,a=t.mode,r=(s=e.child).sibling;var l={mode:"hidden",children:i.children};return 1&a||t.child===s?(i=Dc(s,l)).subtreeFlags=14680064&s.subtreeFlags:((i=t.child).childLanes=0,i.pendingProps=l,t.deletions=null),null!==r?o=Dc(r,o):(o=Mc(o,a,n,null)).flags|=2,o.return=t,i.return=t,i.sibling=o,t.child=i,i=o,o=t.child,a=null===(a=e.child.memoizedState)?Al(n):{baseLanes:a.baseLanes|n,cachePool:null,transitions:a.transitions},o.memoizedState=a,o.childLanes=e.childLanes&~n,t.memoizedState=Ml,i}return e=(o=e.child).sibling,i=Dc(o,{mode:"visible",children:i.children}),!(1&t.mode)&&(i.lanes=n),i.return=t,i.sibling=null,null!==e&&(null===(n=t.deletions)?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=i,t.memoizedState=null,i}function Ll(e,t){return(t=Ac({mode:"visible",children:t},e.mode,0,null)).return=e,e.child=t}function Ul(e,t,n,r){return null!==r&&ho(r),vo(t,e.child,null,n),(e=Ll(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Pl(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),Co(e.return,t,n)}function zl(e,t,n,r,i){var s=e.memoizedState;null===s?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(s.isBackwards=t,s.rendering=null,s.renderingStartTime=0,s.last=r,s.tail=n,s.tailMode=i)}function Rl(e,t,n){var r=t.pendingProps,i=r.revealOrder,s=r.tail;if(gl(e,t,r.children,n),2&(r=Xo.current))r=1&r|2,t.flags|=128;else{if(null!==e&&128&e.flags)e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Pl(e,n,t);else if(19===e.tag)Pl(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(xs(Xo,r),1&t.mode)switch(i){case"forwards":for(n=t.child,i=null;null!==n;)null!==(e=n.alternate)&&null===Zo(e)&&(i=n),n=n.sibling;null===(n=i)?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),zl(t,!1,i,n,s);break;case"backwards":for(n=null,i=t.child,t.child=null;null!==i;){if(null!==(e=i.alternate)&&null===Zo(e)){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}zl(t,!0,n,null,s);break;case"together":zl(t,!1,null,null,void 0);break;default:t.memoizedState=null}else t.memoizedState=null;return t.child}function Vl(e,t){!(1&t.mode)&&null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2)}function jl(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Au|=t.lanes,0===(n&t.childLanes))return null;if(null!==e&&t.child!==e.child)throw Error(re(153));if(null!==t.child){for(n=Dc(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Dc(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function $l(e,t){if(!no)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Wl(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=14680064&i.subtreeFlags,r|=14680064&i.flags,i.return=e,i=i.sibling;else for(i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Hl(e,t,n){var r=t.pendingProps;switch(Zs(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Wl(t),null;case 1:case 17:return Bs(t.type)&&Ds(),Wl(t),null;case 3:return r=t.stateNode,qo(),Is(Cs),Is(Ts),ta(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(uo(t)?t.flags|=4:null===e||e.memoizedState.isDehydrated&&!(256&t.flags)||(t.flags|=1024,null!==ro&&(ic(ro),ro=null))),Bl(e,t),Wl(t),null;case 5:Go(t);var i=Qo(Yo.current);if(n=t.type,null!==e&&null!=t.stateNode)Dl(e,t,n,r,i),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(null===t.stateNode)throw Error(re(166));return Wl(t),null}if(e=Qo(Wo.current),uo(t)){r=t.stateNode,n=t.type;var s=t.memoizedProps;switch(r[cs]=t,r[ds]=s,e=!!(1&t.mode),n){case"dialog":Ui("cancel",r),Ui("close",r);break;case"iframe":case"object":case"embed":Ui("load",r);break;case"video":case"audio":for(i=0;i<Mi.length;i++)Ui(Mi[i],r);break;case"source":Ui("error",r);break;case"img":case"image":case"link":Ui("error",r),Ui("load",r);break;case"details":Ui("toggle",r);break;case"input":Ke(r,s),Ui("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!s.multiple},Ui("invalid",r);break;case"textarea":nt(r,s),Ui("invalid",r)}for(var o in bt(n,s),i=null,s)if(s.hasOwnProperty(o)){var a=s[o];"children"===o?"string"==typeof a?r.textContent!==a&&(!0!==s.suppressHydrationWarning&&Ji(r.textContent,a,e),i=["children",a]):"number"==typeof a&&r.textContent!==""+a&&(!0!==s.suppressHydrationWarning&&Ji(r.textContent,a,e),i=["children",""+a]):se.hasOwnProperty(o)&&null!=a&&"onScroll"===o&&Ui("scroll",r)}switch(n){case"input":We(r),Ge(r,s,!0);break;case"textarea":We(r),it(r);break;case"select":case"option":break;default:"function"==typeof s.onClick&&(r.onclick=Gi)}r=i,t.updateQueue=r,null!==r&&(t.flags|=4)}else{o=9===i.nodeType?i:i.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=st(n)),"http://www.w3.org/1999/xhtml"===e?"script"===n?((e=o.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=o.createElement(n,{is:r.is}):(e=o.createElement(n),"select"===n&&(o=e,r.multiple?o.multiple=!0:r.size&&(o.size=r.size))):e=o.createElementNS(e,n),e[cs]=t,e[ds]=r,Ol(e,t,!1,!1),t.stateNode=e;e:{switch(o=mt(n,r),n){case"dialog":Ui("cancel",e),Ui("close",e),i=r;break;case"iframe":case"object":case"embed":Ui("load",e),i=r;break;case"video":case"audio":for(i=0;i<Mi.length;i++)Ui(Mi[i],e);i=r;break;case"source":Ui("error",e),i=r;break;case"img":case"image":case"link":Ui("error",e),Ui("load",e),i=r;break;case"details":Ui("toggle",e),i=r;break;case"input":Ke(e,r),i=Qe(e,r),Ui("invalid",e);break;case"option":default:i=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},i=Fe({},r,{value:void 0}),Ui("invalid",e);break;case"textarea":nt(e,r),i=tt(e,r),Ui("invalid",e)}for(s in bt(n,i),a=i)if(a.hasOwnProperty(s)){var l=a[s];"style"===s?pt(e,l):"dangerouslySetInnerHTML"===s?null!=(l=l?l.__html:void 0)&&ut(e,l):"children"===s?"string"==typeof l?("textarea"!==n||""!==l)&&ct(e,l):"number"==typeof l&&ct(e,""+l):"suppressContentEditableWarning"!==s&&"suppressHydrationWarning"!==s&&"autoFocus"!==s&&(se.hasOwnProperty(s)?null!=l&&"onScroll"===s&&Ui("scroll",e):null!=l&&me(e,s,l,o))}switch(n){case"input":We(e),Ge(e,r,!1);break;case"textarea":We(e),it(e);break;case"option":null!=r.value&&e.setAttribute("value",""+je(r.value));break;case"select":e.multiple=!!r.multiple,null!=(s=r.value)?et(e,!!r.multiple,s,!1):null!=r.defaultValue&&et(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof i.onClick&&(e.onclick=Gi)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}null!==t.ref&&(t.flags|=512,t.flags|=2097152)}return Wl(t),null;case 6:if(e&&null!=t.stateNode)Nl(e,t,e.memoizedProps,r);else{if("string"!=typeof r&&null===t.stateNode)throw Error(re(166));if(n=Qo(Yo.current),Qo(Wo.current),uo(t)){if(r=t.stateNode,n=t.memoizedProps,r[cs]=t,(s=r.nodeValue!==n)&&null!==(e=eo))switch(e.tag){case 3:Ji(r.nodeValue,n,!!(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Ji(r.nodeValue,n,!!(1&e.mode))}s&&(t.flags|=4)}else(r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[cs]=t,t.stateNode=r}return Wl(t),null;case 13:if(Is(Xo),r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(no&&null!==to&&1&t.mode&&!(128&t.flags))co(),fo(),t.flags|=98560,s=!1;else if(s=uo(t),null!==r&&null!==r.dehydrated){if(null===e){if(!s)throw Error(re(318));if(!(s=null!==(s=t.memoizedState)?s.dehydrated:null))throw Error(re(317));s[cs]=t}else fo(),!(128&t.flags)&&(t.memoizedState=null),t.flags|=4;Wl(t),s=!1}else null!==ro&&(ic(ro),ro=null),s=!0;if(!s)return 65536&t.flags?t:null}return 128&t.flags?(t.lanes=n,t):((r=null!==r)!==(null!==e&&null!==e.memoizedState)&&r&&(t.child.flags|=8192,1&t.mode&&(null===e||1&Xo.current?0===Nu&&(Nu=3):hc())),null!==t.updateQueue&&(t.flags|=4),Wl(t),null);case 4:return qo(),Bl(e,t),null===e&&Ri(t.stateNode.containerInfo),Wl(t),null;case 10:return To(t.type._context),Wl(t),null;case 19:if(Is(Xo),null===(s=t.memoizedState))return Wl(t),null;if(r=!!(128&t.flags),null===(o=s.rendering))if(r)$l(s,!1);else{if(0!==Nu||null!==e&&128&e.flags)for(e=t.child;null!==e;){if(null!==(o=Zo(e))){for(t.flags|=128,$l(s,!1),null!==(r=o.updateQueue)&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;null!==n;)e=r,(s=n).flags&=14680066,null===(o=s.alternate)?(s.childLanes=0,s.lanes=e,s.child=null,s.subtreeFlags=0,s.memoizedProps=null,s.memoizedState=null,s.updateQueue=null,s.dependencies=null,s.stateNode=null):(s.childLanes=o.childLanes,s.lanes=o.lanes,s.child=o.child,s.subtreeFlags=0,s.deletions=null,s.memoizedProps=o.memoizedProps,s.memoizedState=o.memoizedState,s.updateQueue=o.updateQueue,s.type=o.type,e=o.dependencies,s.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return xs(Xo,1&Xo.current|2),t.child}e=e.sibling}null!==s.tail&&qt()>Ru&&(t.flags|=128,r=!0,$l(s,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=Zo(o))){if(t.flags|=128,r=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),$l(s,!0),null===s.tail&&"hidden"===s.tailMode&&!o.alternate&&!no)return Wl(t),null}else 2*qt()-s.renderingStartTime>Ru&&1073741824!==n&&(t.flags|=128,r=!0,$l(s,!1),t.lanes=4194304);s.isBackwards?(o.sibling=t.child,t.child=o):(null!==(n=s.last)?n.sibling=o:t.child=o,s.last=o)}return null!==s.tail?(t=s.tail,s.rendering=t,s.tail=t.sibling,s.renderingStartTime=qt(),t.sibling=null,n=Xo.current,xs(Xo,r?1&n|2:1&n),t):(Wl(t),null);case 22:case 23:return uc(),r=null!==t.memoizedState,null!==e&&null!==e.memoizedState!==r&&(t.flags|=8192),r&&1&t.mode?!!(1073741824&Bu)&&(Wl(t),6&t.subtreeFlags&&(t.flags|=8192)):Wl(t),null;case 24:case 25:return null}throw Error(re(156,t.tag))}function Yl(e,t){switch(Zs(t),t.tag){case 1:return Bs(t.type)&&Ds(),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return qo(),Is(Cs),Is(Ts),ta(),65536&(e=t.flags)&&!(128&e)?(t.flags=-65537&e|128,t):null;case 5:return Go(t),null;case 13:if(Is(Xo),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(re(340));fo()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return Is(Xo),null;case 4:return qo(),null;case 10:return To(t.type._context),null;case 22:case 23:return uc(),null;default:return null}}Ol=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Bl=function(){},Dl=function(e,t,n,r){var i=e.memoizedProps;if(i!==r){e=t.stateNode,Qo(Wo.current);var s,o=null;switch(n){case"input":i=Qe(e,i),r=Qe(e,r),o=[];break;case"select":i=Fe({},i,{value:void 0}),r=Fe({},r,{value:void 0}),o=[];break;case"textarea":i=tt(e,i),r=tt(e,r),o=[];break;default:"function"!=typeof i.onClick&&"function"==typeof r.onClick&&(e.onclick=Gi)}for(u in bt(n,r),n=null,i)if(!r.hasOwnProperty(u)&&i.hasOwnProperty(u)&&null!=i[u])if("style"===u){var a=i[u];for(s in a)a.hasOwnProperty(s)&&(n||(n={}),n[s]="")}else"dangerouslySetInnerHTML"!==u&&"children"!==u&&"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&"autoFocus"!==u&&(se.hasOwnProperty(u)?o||(o=[]):(o=o||[]).push(u,null));for(u in r){var l=r[u];if(a=null!=i?i[u]:void 0,r.hasOwnProperty(u)&&l!==a&&(null!=l||null!=a))if("style"===u)if(a){for(s in a)!a.hasOwnProperty(s)||l&&l.hasOwnProperty(s)||(n||(n={}),n[s]="");for(s in l)l.hasOwnProperty(s)&&a[s]!==l[s]&&(n||(n={}),n[s]=l[s])}else n||(o||(o=[]),o.push(u,n)),n=l;else"dangerouslySetInnerHTML"===u?(l=l?l.__html:void 0,a=a?a.__html:void 0,null!=l&&a!==l&&(o=o||[]).push(u,l)):"children"===u?"string"!=typeof l&&"number"!=typeof l||(o=o||[]).push(u,""+l):"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&(se.hasOwnProperty(u)?(null!=l&&"onScroll"===u&&Ui("scroll",e),o||a===l||(o=[])):(o=o||[]).push(u,l))}n&&(o=o||[]).push("style",n);var u=o;(t.updateQueue=u)&&(t.flags|=4)}},Nl=function(e,t,n,r){n!==r&&(t.flags|=4)};var Ql=!1,Kl=!1,ql="function"==typeof WeakSet?WeakSet:Set,Jl=null;function Gl(e,t){var n=e.ref;if(null!==n)if("function"==typeof n)try{n(null)}catch(r){Sc(e,t,r)}else n.current=null}function Xl(e,t,n){try{n()}catch(r){Sc(e,t,r)}}var Zl=!1;function eu(e,t,n){var r=t.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var i=r=r.next;do{if((i.tag&e)===e){var s=i.destroy;i.destroy=void 0,void 0!==s&&Xl(t,n,s)}i=i.next}while(i!==r)}}function tu(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function nu(e){var t=e.ref;if(null!==t){var n=e.stateNode;e.tag,e=n,"function"==typeof t?t(e):t.current=e}}function ru(e){var t=e.alternate;null!==t&&(e.alternate=null,ru(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&(delete t[cs],delete t[ds],delete t[hs],delete t[ps],delete t[ys])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function iu(e){return 5===e.tag||3===e.tag||4===e.tag}function su(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||iu(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function ou(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!=(n=n._reactRootContainer)||null!==t.onclick||(t.onclick=Gi));else if(4!==r&&null!==(e=e.child))for(ou(e,t,n),e=e.sibling;null!==e;)ou(e,t,n),e=e.sibling}function au(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(au(e,t,n),e=e.sibling;null!==e;)au(e,t,n),e=e.sibling}var lu=null,uu=!1;function cu(e,t,n){for(n=n.child;null!==n;)du(e,t,n),n=n.sibling}function du(e,t,n){if(rn&&"function"==typeof rn.onCommitFiberUnmount)try{rn.onCommitFiberUnmount(nn,n)}catch(a){}switch(n.tag){case 5:Kl||Gl(n,t);case 6:var r=lu,i=uu;lu=null,cu(e,t,n),uu=i,null!==(lu=r)&&(uu?(e=lu,n=n.stateNode,8===e.nodeType?e.parentNode.removeChild(n):e.removeChild(n)):lu.removeChild(n.stateNode));break;case 18:null!==lu&&(uu?(e=lu,n=n.stateNode,8===e.nodeType?os(e.parentNode,n):1===e.nodeType&&os(e,n),Vn(e)):os(lu,n.stateNode));break;case 4:r=lu,i=uu,lu=n.stateNode.containerInfo,uu=!0,cu(e,t,n),lu=r,uu=i;break;case 0:case 11:case 14:case 15:if(!Kl&&(null!==(r=n.updateQueue)&&null!==(r=r.lastEffect))){i=r=r.next;do{var s=i,o=s.destroy;s=s.tag,void 0!==o&&(2&s||4&s)&&Xl(n,t,o),i=i.next}while(i!==r)}cu(e,t,n);break;case 1:if(!Kl&&(Gl(n,t),"function"==typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(a){Sc(n,t,a)}cu(e,t,n);break;case 21:cu(e,t,n);break;case 22:1&n.mode?(Kl=(r=Kl)||null!==n.memoizedState,cu(e,t,n),Kl=r):cu(e,t,n);break;default:cu(e,t,n)}}function fu(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new ql),t.forEach((function(t){var r=Tc.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}}function hu(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var i=n[r];try{var s=e,o=t,a=o;e:for(;null!==a;){switch(a.tag){case 5:lu=a.stateNode,uu=!1;break e;case 3:case 4:lu=a.stateNode.containerInfo,uu=!0;break e}a=a.return}if(null===lu)throw Error(re(160));du(s,o,i),lu=null,uu=!1;var l=i.alternate;null!==l&&(l.return=null),i.return=null}catch(u){Sc(i,t,u)}}if(12854&t.subtreeFlags)for(t=t.child;null!==t;)pu(t,e),t=t.sibling}function pu(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(hu(t,e),yu(e),4&r){try{eu(3,e,e.return),tu(3,e)}catch(y){Sc(e,e.return,y)}try{eu(5,e,e.return)}catch(y){Sc(e,e.return,y)}}break;case 1:hu(t,e),yu(e),512&r&&null!==n&&Gl(n,n.return);break;case 5:if(hu(t,e),yu(e),512&r&&null!==n&&Gl(n,n.return),32&e.flags){var i=e.stateNode;try{ct(i,"")}catch(y){Sc(e,e.return,y)}}if(4&r&&null!=(i=e.stateNode)){var s=e.memoizedProps,o=null!==n?n.memoizedProps:s,a=e.type,l=e.updateQueue;if(e.updateQueue=null,null!==l)try{"input"===a&&"radio"===s.type&&null!=s.name&&qe(i,s),mt(a,o);var u=mt(a,s);for(o=0;o<l.length;o+=2){var c=l[o],d=l[o+1];"style"===c?pt(i,d):"dangerouslySetInnerHTML"===c?ut(i,d):"children"===c?ct(i,d):me(i,c,d,u)}switch(a){case"input":Je(i,s);break;case"textarea":rt(i,s);break;case"select":var f=i._wrapperState.wasMultiple;i._wrapperState.wasMultiple=!!s.multiple;var h=s.value;null!=h?et(i,!!s.multiple,h,!1):f!==!!s.multiple&&(null!=s.defaultValue?et(i,!!s.multiple,s.defaultValue,!0):et(i,!!s.multiple,s.multiple?[]:"",!1))}i[ds]=s}catch(y){Sc(e,e.return,y)}}break;case 6:if(hu(t,e),yu(e),4&r){if(null===e.stateNode)throw Error(re(162));i=e.stateNode,s=e.memoizedProps;try{i.nodeValue=s}catch(y){Sc(e,e.return,y)}}break;case 3:if(hu(t,e),yu(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Vn(t.containerInfo)}catch(y){Sc(e,e.return,y)}break;case 4:default:hu(t,e),yu(e);break;case 13:hu(t,e),yu(e),8192&(i=e.child).flags&&(s=null!==i.memoizedState,i.stateNode.isHidden=s,!s||null!==i.alternate&&null!==i.alternate.memoizedState||(zu=qt())),4&r&&fu(e);break;case 22:if(c=null!==n&&null!==n.memoizedState,1&e.mode?(Kl=(u=Kl)||c,hu(t,e),Kl=u):hu(t,e),yu(e),8192&r){if(u=null!==e.memoizedState,(e.stateNode.isHidden=u)&&!c&&1&e.mode)for(Jl=e,c=e.child;null!==c;){for(d=Jl=c;null!==Jl;){switch(h=(f=Jl).child,f.tag){case 0:case 11:case 14:case 15:eu(4,f,f.return);break;case 1:Gl(f,f.return);var p=f.stateNode;if("function"==typeof p.componentWillUnmount){r=f,n=f.return;try{t=r,p.props=t.memoizedProps,p.state=t.memoizedState,p.componentWillUnmount()}catch(y){Sc(r,n,y)}}break;case 5:Gl(f,f.return);break;case 22:if(null!==f.memoizedState){vu(d);continue}}null!==h?(h.return=f,Jl=h):vu(d)}c=c.sibling}e:for(c=null,d=e;;){if(5===d.tag){if(null===c){c=d;try{i=d.stateNode,u?"function"==typeof(s=i.style).setProperty?s.setProperty("display","none","important"):s.display="none":(a=d.stateNode,o=null!=(l=d.memoizedProps.style)&&l.hasOwnProperty("display")?l.display:null,a.style.display=ht("display",o))}catch(y){Sc(e,e.return,y)}}}else if(6===d.tag){if(null===c)try{d.stateNode.nodeValue=u?"":d.memoizedProps}catch(y){Sc(e,e.return,y)}}else if((22!==d.tag&&23!==d.tag||null===d.memoizedState||d===e)&&null!==d.child){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;null===d.sibling;){if(null===d.return||d.return===e)break e;c===d&&(c=null),d=d.return}c===d&&(c=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:hu(t,e),yu(e),4&r&&fu(e);case 21:}}function yu(e){var t=e.flags;if(2&t){try{e:{for(var n=e.return;null!==n;){if(iu(n)){var r=n;break e}n=n.return}throw Error(re(160))}switch(r.tag){case 5:var i=r.stateNode;32&r.flags&&(ct(i,""),r.flags&=-33),au(e,su(e),i);break;case 3:case 4:var s=r.stateNode.containerInfo;ou(e,su(e),s);break;default:throw Error(re(161))}}catch(o){Sc(e,e.return,o)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function bu(e,t,n){Jl=e,mu(e)}function mu(e,t,n){for(var r=!!(1&e.mode);null!==Jl;){var i=Jl,s=i.child;if(22===i.tag&&r){var o=null!==i.memoizedState||Ql;if(!o){var a=i.alternate,l=null!==a&&null!==a.memoizedState||Kl;a=Ql;var u=Kl;if(Ql=o,(Kl=l)&&!u)for(Jl=i;null!==Jl;)l=(o=Jl).child,22===o.tag&&null!==o.memoizedState?wu(i):null!==l?(l.return=o,Jl=l):wu(i);for(;null!==s;)Jl=s,mu(s),s=s.sibling;Jl=i,Ql=a,Kl=u}gu(e)}else 8772&i.subtreeFlags&&null!==s?(s.return=i,Jl=s):gu(e)}}function gu(e){for(;null!==Jl;){var t=Jl;if(8772&t.flags){var n=t.alternate;try{if(8772&t.flags)switch(t.tag){case 0:case 11:case 15:Kl||tu(5,t);break;case 1:var r=t.stateNode;if(4&t.flags&&!Kl)if(null===n)r.componentDidMount();else{var i=t.elementType===t.type?n.memoizedProps:el(t.type,n.memoizedProps);r.componentDidUpdate(i,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var s=t.updateQueue;null!==s&&jo(t,s,r);break;case 3:var o=t.updateQueue;if(null!==o){if(n=null,null!==t.child)switch(t.child.tag){case 5:case 1:n=t.child.stateNode}jo(t,o,n)}break;case 5:var a=t.stateNode;if(null===n&&4&t.flags){n=a;var l=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":l.autoFocus&&n.focus();break;case"img":l.src&&(n.src=l.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===t.memoizedState){var u=t.alternate;if(null!==u){var c=u.memoizedState;if(null!==c){var d=c.dehydrated;null!==d&&Vn(d)}}}break;default:throw Error(re(163))}Kl||512&t.flags&&nu(t)}catch(f){Sc(t,t.return,f)}}if(t===e){Jl=null;break}if(null!==(n=t.sibling)){n.return=t.return,Jl=n;break}Jl=t.return}}function vu(e){for(;null!==Jl;){var t=Jl;if(t===e){Jl=null;break}var n=t.sibling;if(null!==n){n.return=t.return,Jl=n;break}Jl=t.return}}function wu(e){for(;null!==Jl;){var t=Jl;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{tu(4,t)}catch(l){Sc(t,n,l)}break;case 1:var r=t.stateNode;if("function"==typeof r.componentDidMount){var i=t.return;try{r.componentDidMount()}catch(l){Sc(t,i,l)}}var s=t.return;try{nu(t)}catch(l){Sc(t,s,l)}break;case 5:var o=t.return;try{nu(t)}catch(l){Sc(t,o,l)}}}catch(l){Sc(t,t.return,l)}if(t===e){Jl=null;break}var a=t.sibling;if(null!==a){a.return=t.return,Jl=a;break}Jl=t.return}}var _u,Su=Math.ceil,Iu=ge.ReactCurrentDispatcher,xu=ge.ReactCurrentOwner,ku=ge.ReactCurrentBatchConfig,Tu=0,Cu=null,Eu=null,Ou=0,Bu=0,Du=Ss(0),Nu=0,Mu=null,Au=0,Fu=0,Lu=0,Uu=null,Pu=null,zu=0,Ru=1/0,Vu=null,ju=!1,$u=null,Wu=null,Hu=!1,Yu=null,Qu=0,Ku=0,qu=null,Ju=-1,Gu=0;function Xu(){return 6&Tu?qt():-1!==Ju?Ju:Ju=qt()}function Zu(e){return 1&e.mode?2&Tu&&0!==Ou?Ou&-Ou:null!==po.transition?(0===Gu&&(Gu=pn()),Gu):0!==(e=gn)?e:e=void 0===(e=window.event)?16:qn(e.type):1}function ec(e,t,n,r){if(50<Ku)throw Ku=0,qu=null,Error(re(185));bn(e,n,r),2&Tu&&e===Cu||(e===Cu&&(!(2&Tu)&&(Fu|=n),4===Nu&&sc(e,Ou)),tc(e,r),1===n&&0===Tu&&!(1&t.mode)&&(Ru=qt()+500,Us&&Rs()))}function tc(e,t){var n=e.callbackNode;!function(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,i=e.expirationTimes,s=e.pendingLanes;0<s;){var o=31-sn(s),a=1<<o,l=i[o];-1===l?0!==(a&n)&&0===(a&r)||(i[o]=fn(a,t)):l<=t&&(e.expiredLanes|=a),s&=~a}}(e,t);var r=dn(e,e===Cu?Ou:0);if(0===r)null!==n&&Yt(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(null!=n&&Yt(n),1===t)0===e.tag?function(e){Us=!0,zs(e)}(oc.bind(null,e)):zs(oc.bind(null,e)),is((function(){!(6&Tu)&&Rs()})),n=null;else{switch(vn(r)){case 1:n=Gt;break;case 4:n=Xt;break;case 16:default:n=Zt;break;case 536870912:n=tn}n=Cc(n,nc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function nc(e,t){if(Ju=-1,Gu=0,6&Tu)throw Error(re(327));var n=e.callbackNode;if(wc()&&e.callbackNode!==n)return null;var r=dn(e,e===Cu?Ou:0);if(0===r)return null;if(30&r||0!==(r&e.expiredLanes)||t)t=pc(e,r);else{t=r;var i=Tu;Tu|=2;var s=fc();for(Cu===e&&Ou===t||(Vu=null,Ru=qt()+500,cc(e,t));;)try{bc();break}catch(a){dc(e,a)}ko(),Iu.current=s,Tu=i,null!==Eu?t=0:(Cu=null,Ou=0,t=Nu)}if(0!==t){if(2===t&&(0!==(i=hn(e))&&(r=i,t=rc(e,i))),1===t)throw n=Mu,cc(e,0),sc(e,r),tc(e,qt()),n;if(6===t)sc(e,r);else{if(i=e.current.alternate,!(30&r||function(e){for(var t=e;;){if(16384&t.flags){var n=t.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var i=n[r],s=i.getSnapshot;i=i.value;try{if(!si(s(),i))return!1}catch(o){return!1}}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}(i)||(t=pc(e,r),2===t&&(s=hn(e),0!==s&&(r=s,t=rc(e,s))),1!==t)))throw n=Mu,cc(e,0),sc(e,r),tc(e,qt()),n;switch(e.finishedWork=i,e.finishedLanes=r,t){case 0:case 1:throw Error(re(345));case 2:case 5:vc(e,Pu,Vu);break;case 3:if(sc(e,r),(130023424&r)===r&&10<(t=zu+500-qt())){if(0!==dn(e,0))break;if(((i=e.suspendedLanes)&r)!==r){Xu(),e.pingedLanes|=e.suspendedLanes&i;break}e.timeoutHandle=ts(vc.bind(null,e,Pu,Vu),t);break}vc(e,Pu,Vu);break;case 4:if(sc(e,r),(4194240&r)===r)break;for(t=e.eventTimes,i=-1;0<r;){var o=31-sn(r);s=1<<o,(o=t[o])>i&&(i=o),r&=~s}if(r=i,10<(r=(120>(r=qt()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Su(r/1960))-r)){e.timeoutHandle=ts(vc.bind(null,e,Pu,Vu),r);break}vc(e,Pu,Vu);break;default:throw Error(re(329))}}}return tc(e,qt()),e.callbackNode===n?nc.bind(null,e):null}function rc(e,t){var n=Uu;return e.current.memoizedState.isDehydrated&&(cc(e,t).flags|=256),2!==(e=pc(e,t))&&(t=Pu,Pu=n,null!==t&&ic(t)),e}function ic(e){null===Pu?Pu=e:Pu.push.apply(Pu,e)}function sc(e,t){for(t&=~Lu,t&=~Fu,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-sn(t),r=1<<n;e[n]=-1,t&=~r}}function oc(e){if(6&Tu)throw Error(re(327));wc();var t=dn(e,0);if(!(1&t))return tc(e,qt()),null;var n=pc(e,t);if(0!==e.tag&&2===n){var r=hn(e);0!==r&&(t=r,n=rc(e,r))}if(1===n)throw n=Mu,cc(e,0),sc(e,t),tc(e,qt()),n;if(6===n)throw Error(re(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,vc(e,Pu,Vu),tc(e,qt()),null}function ac(e,t){var n=Tu;Tu|=1;try{return e(t)}finally{0===(Tu=n)&&(Ru=qt()+500,Us&&Rs())}}function lc(e){null!==Yu&&0===Yu.tag&&!(6&Tu)&&wc();var t=Tu;Tu|=1;var n=ku.transition,r=gn;try{if(ku.transition=null,gn=1,e)return e()}finally{gn=r,ku.transition=n,!(6&(Tu=t))&&Rs()}}function uc(){Bu=Du.current,Is(Du)}function cc(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,ns(n)),null!==Eu)for(n=Eu.return;null!==n;){var r=n;switch(Zs(r),r.tag){case 1:null!=(r=r.type.childContextTypes)&&Ds();break;case 3:qo(),Is(Cs),Is(Ts),ta();break;case 5:Go(r);break;case 4:qo();break;case 13:case 19:Is(Xo);break;case 10:To(r.type._context);break;case 22:case 23:uc()}n=n.return}if(Cu=e,Eu=e=Dc(e.current,null),Ou=Bu=t,Nu=0,Mu=null,Lu=Fu=Au=0,Pu=Uu=null,null!==Bo){for(t=0;t<Bo.length;t++)if(null!==(r=(n=Bo[t]).interleaved)){n.interleaved=null;var i=r.next,s=n.pending;if(null!==s){var o=s.next;s.next=i,r.next=o}n.pending=r}Bo=null}return e}function dc(e,t){for(;;){var n=Eu;try{if(ko(),na.current=Ja,la){for(var r=sa.memoizedState;null!==r;){var i=r.queue;null!==i&&(i.pending=null),r=r.next}la=!1}if(ia=0,aa=oa=sa=null,ua=!1,ca=0,xu.current=null,null===n||null===n.return){Nu=1,Mu=t,Eu=null;break}e:{var s=e,o=n.return,a=n,l=t;if(t=Ou,a.flags|=32768,null!==l&&"object"==typeof l&&"function"==typeof l.then){var u=l,c=a,d=c.tag;if(!(1&c.mode||0!==d&&11!==d&&15!==d)){var f=c.alternate;f?(c.updateQueue=f.updateQueue,c.memoizedState=f.memoizedState,c.lanes=f.lanes):(c.updateQueue=null,c.memoizedState=null)}var h=pl(o);if(null!==h){h.flags&=-257,yl(h,o,a,0,t),1&h.mode&&hl(s,u,t),l=u;var p=(t=h).updateQueue;if(null===p){var y=new Set;y.add(l),t.updateQueue=y}else p.add(l);break e}if(!(1&t)){hl(s,u,t),hc();break e}l=Error(re(426))}else if(no&&1&a.mode){var b=pl(o);if(null!==b){!(65536&b.flags)&&(b.flags|=256),yl(b,o,a,0,t),ho(al(l,a));break e}}s=l=al(l,a),4!==Nu&&(Nu=2),null===Uu?Uu=[s]:Uu.push(s),s=o;do{switch(s.tag){case 3:s.flags|=65536,t&=-t,s.lanes|=t,Ro(s,dl(0,l,t));break e;case 1:a=l;var m=s.type,g=s.stateNode;if(!(128&s.flags||"function"!=typeof m.getDerivedStateFromError&&(null===g||"function"!=typeof g.componentDidCatch||null!==Wu&&Wu.has(g)))){s.flags|=65536,t&=-t,s.lanes|=t,Ro(s,fl(s,a,t));break e}}s=s.return}while(null!==s)}gc(n)}catch(v){t=v,Eu===n&&null!==n&&(Eu=n=n.return);continue}break}}function fc(){var e=Iu.current;return Iu.current=Ja,null===e?Ja:e}function hc(){0!==Nu&&3!==Nu&&2!==Nu||(Nu=4),null===Cu||!(268435455&Au)&&!(268435455&Fu)||sc(Cu,Ou)}function pc(e,t){var n=Tu;Tu|=2;var r=fc();for(Cu===e&&Ou===t||(Vu=null,cc(e,t));;)try{yc();break}catch(i){dc(e,i)}if(ko(),Tu=n,Iu.current=r,null!==Eu)throw Error(re(261));return Cu=null,Ou=0,Nu}function yc(){for(;null!==Eu;)mc(Eu)}function bc(){for(;null!==Eu&&!Qt();)mc(Eu)}function mc(e){var t=_u(e.alternate,e,Bu);e.memoizedProps=e.pendingProps,null===t?gc(e):Eu=t,xu.current=null}function gc(e){var t=e;do{var n=t.alternate;if(e=t.return,32768&t.flags){if(null!==(n=Yl(n,t)))return n.flags&=32767,void(Eu=n);if(null===e)return Nu=6,void(Eu=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}else if(null!==(n=Hl(n,t,Bu)))return void(Eu=n);if(null!==(t=t.sibling))return void(Eu=t);Eu=t=e}while(null!==t);0===Nu&&(Nu=5)}function vc(e,t,n){var r=gn,i=ku.transition;try{ku.transition=null,gn=1,function(e,t,n,r){do{wc()}while(null!==Yu);if(6&Tu)throw Error(re(327));n=e.finishedWork;var i=e.finishedLanes;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(re(177));e.callbackNode=null,e.callbackPriority=0;var s=n.lanes|n.childLanes;if(function(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var i=31-sn(n),s=1<<i;t[i]=0,r[i]=-1,e[i]=-1,n&=~s}}(e,s),e===Cu&&(Eu=Cu=null,Ou=0),!(2064&n.subtreeFlags)&&!(2064&n.flags)||Hu||(Hu=!0,Cc(Zt,(function(){return wc(),null}))),s=!!(15990&n.flags),!!(15990&n.subtreeFlags)||s){s=ku.transition,ku.transition=null;var o=gn;gn=1;var a=Tu;Tu|=4,xu.current=null,function(e,t){if(Xi=$n,di(e=ci())){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var i=r.anchorOffset,s=r.focusNode;r=r.focusOffset;try{n.nodeType,s.nodeType}catch(w){n=null;break e}var o=0,a=-1,l=-1,u=0,c=0,d=e,f=null;t:for(;;){for(var h;d!==n||0!==i&&3!==d.nodeType||(a=o+i),d!==s||0!==r&&3!==d.nodeType||(l=o+r),3===d.nodeType&&(o+=d.nodeValue.length),null!==(h=d.firstChild);)f=d,d=h;for(;;){if(d===e)break t;if(f===n&&++u===i&&(a=o),f===s&&++c===r&&(l=o),null!==(h=d.nextSibling))break;f=(d=f).parentNode}d=h}n=-1===a||-1===l?null:{start:a,end:l}}else n=null}n=n||{start:0,end:0}}else n=null;for(Zi={focusedElem:e,selectionRange:n},$n=!1,Jl=t;null!==Jl;)if(e=(t=Jl).child,1028&t.subtreeFlags&&null!==e)e.return=t,Jl=e;else for(;null!==Jl;){t=Jl;try{var p=t.alternate;if(1024&t.flags)switch(t.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==p){var y=p.memoizedProps,b=p.memoizedState,m=t.stateNode,g=m.getSnapshotBeforeUpdate(t.elementType===t.type?y:el(t.type,y),b);m.__reactInternalSnapshotBeforeUpdate=g}break;case 3:var v=t.stateNode.containerInfo;1===v.nodeType?v.textContent="":9===v.nodeType&&v.documentElement&&v.removeChild(v.documentElement);break;default:throw Error(re(163))}}catch(w){Sc(t,t.return,w)}if(null!==(e=t.sibling)){e.return=t.return,Jl=e;break}Jl=t.return}p=Zl,Zl=!1}(e,n),pu(n,e),fi(Zi),$n=!!Xi,Zi=Xi=null,e.current=n,bu(n),Kt(),Tu=a,gn=o,ku.transition=s}else e.current=n;if(Hu&&(Hu=!1,Yu=e,Qu=i),s=e.pendingLanes,0===s&&(Wu=null),function(e){if(rn&&"function"==typeof rn.onCommitFiberRoot)try{rn.onCommitFiberRoot(nn,e,void 0,!(128&~e.current.flags))}catch(t){}}(n.stateNode),tc(e,qt()),null!==t)for(r=e.onRecoverableError,n=0;n<t.length;n++)i=t[n],r(i.value,{componentStack:i.stack,digest:i.digest});if(ju)throw ju=!1,e=$u,$u=null,e;!!(1&Qu)&&0!==e.tag&&wc(),s=e.pendingLanes,1&s?e===qu?Ku++:(Ku=0,qu=e):Ku=0,Rs()}(e,t,n,r)}finally{ku.transition=i,gn=r}return null}function wc(){if(null!==Yu){var e=vn(Qu),t=ku.transition,n=gn;try{if(ku.transition=null,gn=16>e?16:e,null===Yu)var r=!1;else{if(e=Yu,Yu=null,Qu=0,6&Tu)throw Error(re(331));var i=Tu;for(Tu|=4,Jl=e.current;null!==Jl;){var s=Jl,o=s.child;if(16&Jl.flags){var a=s.deletions;if(null!==a){for(var l=0;l<a.length;l++){var u=a[l];for(Jl=u;null!==Jl;){var c=Jl;switch(c.tag){case 0:case 11:case 15:eu(8,c,s)}var d=c.child;if(null!==d)d.return=c,Jl=d;else for(;null!==Jl;){var f=(c=Jl).sibling,h=c.return;if(ru(c),c===u){Jl=null;break}if(null!==f){f.return=h,Jl=f;break}Jl=h}}}var p=s.alternate;if(null!==p){var y=p.child;if(null!==y){p.child=null;do{var b=y.sibling;y.sibling=null,y=b}while(null!==y)}}Jl=s}}if(2064&s.subtreeFlags&&null!==o)o.return=s,Jl=o;else e:for(;null!==Jl;){if(2048&(s=Jl).flags)switch(s.tag){case 0:case 11:case 15:eu(9,s,s.return)}var m=s.sibling;if(null!==m){m.return=s.return,Jl=m;break e}Jl=s.return}}var g=e.current;for(Jl=g;null!==Jl;){var v=(o=Jl).child;if(2064&o.subtreeFlags&&null!==v)v.return=o,Jl=v;else e:for(o=g;null!==Jl;){if(2048&(a=Jl).flags)try{switch(a.tag){case 0:case 11:case 15:tu(9,a)}}catch(_){Sc(a,a.return,_)}if(a===o){Jl=null;break e}var w=a.sibling;if(null!==w){w.return=a.return,Jl=w;break e}Jl=a.return}}if(Tu=i,Rs(),rn&&"function"==typeof rn.onPostCommitFiberRoot)try{rn.onPostCommitFiberRoot(nn,e)}catch(_){}r=!0}return r}finally{gn=n,ku.transition=t}}return!1}function _c(e,t,n){e=Po(e,t=dl(0,t=al(n,t),1),1),t=Xu(),null!==e&&(bn(e,1,t),tc(e,t))}function Sc(e,t,n){if(3===e.tag)_c(e,e,n);else for(;null!==t;){if(3===t.tag){_c(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"==typeof t.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Wu||!Wu.has(r))){t=Po(t,e=fl(t,e=al(n,e),1),1),e=Xu(),null!==t&&(bn(t,1,e),tc(t,e));break}}t=t.return}}function Ic(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=Xu(),e.pingedLanes|=e.suspendedLanes&n,Cu===e&&(Ou&n)===n&&(4===Nu||3===Nu&&(130023424&Ou)===Ou&&500>qt()-zu?cc(e,0):Lu|=n),tc(e,t)}function xc(e,t){0===t&&(1&e.mode?(t=un,!(130023424&(un<<=1))&&(un=4194304)):t=1);var n=Xu();null!==(e=Mo(e,t))&&(bn(e,t,n),tc(e,n))}function kc(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),xc(e,n)}function Tc(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,i=e.memoizedState;null!==i&&(n=i.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(re(314))}null!==r&&r.delete(t),xc(e,n)}function Cc(e,t){return Ht(e,t)}function Ec(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Oc(e,t,n,r){return new Ec(e,t,n,r)}function Bc(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Dc(e,t){var n=e.alternate;return null===n?((n=Oc(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Nc(e,t,n,r,i,s){var o=2;if(r=e,"function"==typeof e)Bc(e)&&(o=1);else if("string"==typeof e)o=5;else e:switch(e){case _e:return Mc(n.children,i,s,t);case Se:o=8,i|=8;break;case Ie:return(e=Oc(12,n,t,2|i)).elementType=Ie,e.lanes=s,e;case Ce:return(e=Oc(13,n,t,i)).elementType=Ce,e.lanes=s,e;case Ee:return(e=Oc(19,n,t,i)).elementType=Ee,e.lanes=s,e;case De:return Ac(n,i,s,t);default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case xe:o=10;break e;case ke:o=9;break e;case Te:o=11;break e;case Oe:o=14;break e;case Be:o=16,r=null;break e}throw Error(re(130,null==e?e:typeof e,""))}return(t=Oc(o,n,t,i)).elementType=e,t.type=r,t.lanes=s,t}function Mc(e,t,n,r){return(e=Oc(7,e,r,t)).lanes=n,e}function Ac(e,t,n,r){return(e=Oc(22,e,r,t)).elementType=De,e.lanes=n,e.stateNode={isHidden:!1},e}function Fc(e,t,n){return(e=Oc(6,e,null,t)).lanes=n,e}function Lc(e,t,n){return(t=Oc(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Uc(e,t,n,r,i){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=yn(0),this.expirationTimes=yn(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=yn(0),this.identifierPrefix=r,this.onRecoverableError=i,this.mutableSourceEagerHydrationData=null}function Pc(e,t,n,r,i,s,o,a,l){return e=new Uc(e,t,n,a,l),1===t?(t=1,!0===s&&(t|=8)):t=0,s=Oc(3,null,null,t),e.current=s,s.stateNode=e,s.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Fo(s),e}function zc(e){if(!e)return ks;e:{if(Rt(e=e._reactInternals)!==e||1!==e.tag)throw Error(re(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Bs(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(null!==t);throw Error(re(171))}if(1===e.tag){var n=e.type;if(Bs(n))return Ms(e,n,t)}return t}function Rc(e,t,n,r,i,s,o,a,l){return(e=Pc(n,r,!0,e,0,s,0,a,l)).context=zc(null),n=e.current,(s=Uo(r=Xu(),i=Zu(n))).callback=null!=t?t:null,Po(n,s,i),e.current.lanes=i,bn(e,i,r),tc(e,r),e}function Vc(e,t,n,r){var i=t.current,s=Xu(),o=Zu(i);return n=zc(n),null===t.context?t.context=n:t.pendingContext=n,(t=Uo(s,o)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),null!==(e=Po(i,t,o))&&(ec(e,i,o,s),zo(e,i,o)),o}function jc(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function $c(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Wc(e,t){$c(e,t),(e=e.alternate)&&$c(e,t)}_u=function(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps||Cs.current)ml=!0;else{if(0===(e.lanes&n)&&!(128&t.flags))return ml=!1,function(e,t,n){switch(t.tag){case 3:Cl(t),fo();break;case 5:Jo(t);break;case 1:Bs(t.type)&&As(t);break;case 4:Ko(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,i=t.memoizedProps.value;xs(_o,r._currentValue),r._currentValue=i;break;case 13:if(null!==(r=t.memoizedState))return null!==r.dehydrated?(xs(Xo,1&Xo.current),t.flags|=128,null):0!==(n&t.child.childLanes)?Fl(e,t,n):(xs(Xo,1&Xo.current),null!==(e=jl(e,t,n))?e.sibling:null);xs(Xo,1&Xo.current);break;case 19:if(r=0!==(n&t.childLanes),128&e.flags){if(r)return Rl(e,t,n);t.flags|=128}if(null!==(i=t.memoizedState)&&(i.rendering=null,i.tail=null,i.lastEffect=null),xs(Xo,Xo.current),r)break;return null;case 22:case 23:return t.lanes=0,Sl(e,t,n)}return jl(e,t,n)}(e,t,n);ml=!!(131072&e.flags)}else ml=!1,no&&1048576&t.flags&&Gs(t,Ws,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Vl(e,t),e=t.pendingProps;var i=Os(t,Ts.current);Eo(t,n),i=pa(null,t,r,e,i,n);var s=ya();return t.flags|=1,"object"==typeof i&&null!==i&&"function"==typeof i.render&&void 0===i.$$typeof?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Bs(r)?(s=!0,As(t)):s=!1,t.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,Fo(t),i.updater=nl,t.stateNode=i,i._reactInternals=t,ol(t,r,e,n),t=Tl(null,t,r,!0,s,n)):(t.tag=0,no&&s&&Xs(t),gl(null,t,i,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Vl(e,t),e=t.pendingProps,r=(i=r._init)(r._payload),t.type=r,i=t.tag=function(e){if("function"==typeof e)return Bc(e)?1:0;if(null!=e){if((e=e.$$typeof)===Te)return 11;if(e===Oe)return 14}return 2}(r),e=el(r,e),i){case 0:t=xl(null,t,r,e,n);break e;case 1:t=kl(null,t,r,e,n);break e;case 11:t=vl(null,t,r,e,n);break e;case 14:t=wl(null,t,r,el(r.type,e),n);break e}throw Error(re(306,r,""))}return t;case 0:return r=t.type,i=t.pendingProps,xl(e,t,r,i=t.elementType===r?i:el(r,i),n);case 1:return r=t.type,i=t.pendingProps,kl(e,t,r,i=t.elementType===r?i:el(r,i),n);case 3:e:{if(Cl(t),null===e)throw Error(re(387));r=t.pendingProps,i=(s=t.memoizedState).element,Lo(e,t),Vo(t,r,null,n);var o=t.memoizedState;if(r=o.element,s.isDehydrated){if(s={element:r,isDehydrated:!1,cache:o.cache,pendingSuspenseBoundaries:o.pendingSuspenseBoundaries,transitions:o.transitions},t.updateQueue.baseState=s,t.memoizedState=s,256&t.flags){t=El(e,t,r,n,i=al(Error(re(423)),t));break e}if(r!==i){t=El(e,t,r,n,i=al(Error(re(424)),t));break e}for(to=as(t.stateNode.containerInfo.firstChild),eo=t,no=!0,ro=null,n=wo(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(fo(),r===i){t=jl(e,t,n);break e}gl(e,t,r,n)}t=t.child}return t;case 5:return Jo(t),null===e&&ao(t),r=t.type,i=t.pendingProps,s=null!==e?e.memoizedProps:null,o=i.children,es(r,i)?o=null:null!==s&&es(r,s)&&(t.flags|=32),Il(e,t),gl(e,t,o,n),t.child;case 6:return null===e&&ao(t),null;case 13:return Fl(e,t,n);case 4:return Ko(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=vo(t,null,r,n):gl(e,t,r,n),t.child;case 11:return r=t.type,i=t.pendingProps,vl(e,t,r,i=t.elementType===r?i:el(r,i),n);case 7:return gl(e,t,t.pendingProps,n),t.child;case 8:case 12:return gl(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,i=t.pendingProps,s=t.memoizedProps,o=i.value,xs(_o,r._currentValue),r._currentValue=o,null!==s)if(si(s.value,o)){if(s.children===i.children&&!Cs.current){t=jl(e,t,n);break e}}else for(null!==(s=t.child)&&(s.return=t);null!==s;){var a=s.dependencies;if(null!==a){o=s.child;for(var l=a.firstContext;null!==l;){if(l.context===r){if(1===s.tag){(l=Uo(-1,n&-n)).tag=2;var u=s.updateQueue;if(null!==u){var c=(u=u.shared).pending;null===c?l.next=l:(l.next=c.next,c.next=l),u.pending=l}}s.lanes|=n,null!==(l=s.alternate)&&(l.lanes|=n),Co(s.return,n,t),a.lanes|=n;break}l=l.next}}else if(10===s.tag)o=s.type===t.type?null:s.child;else if(18===s.tag){if(null===(o=s.return))throw Error(re(341));o.lanes|=n,null!==(a=o.alternate)&&(a.lanes|=n),Co(o,n,t),o=s.sibling}else o=s.child;if(null!==o)o.return=s;else for(o=s;null!==o;){if(o===t){o=null;break}if(null!==(s=o.sibling)){s.return=o.return,o=s;break}o=o.return}s=o}gl(e,t,i.children,n),t=t.child}return t;case 9:return i=t.type,r=t.pendingProps.children,Eo(t,n),r=r(i=Oo(i)),t.flags|=1,gl(e,t,r,n),t.child;case 14:return i=el(r=t.type,t.pendingProps),wl(e,t,r,i=el(r.type,i),n);case 15:return _l(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:el(r,i),Vl(e,t),t.tag=1,Bs(r)?(e=!0,As(t)):e=!1,Eo(t,n),il(t,r,i),ol(t,r,i,n),Tl(null,t,r,!0,e,n);case 19:return Rl(e,t,n);case 22:return Sl(e,t,n)}throw Error(re(156,t.tag))};var Hc="function"==typeof reportError?reportError:function(e){console.error(e)};function Yc(e){this._internalRoot=e}function Qc(e){this._internalRoot=e}function Kc(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function qc(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Jc(){}function Gc(e,t,n,r,i){var s=n._reactRootContainer;if(s){var o=s;if("function"==typeof i){var a=i;i=function(){var e=jc(o);a.call(e)}}Vc(t,o,e,i)}else o=function(e,t,n,r,i){if(i){if("function"==typeof r){var s=r;r=function(){var e=jc(o);s.call(e)}}var o=Rc(t,r,e,0,null,!1,0,"",Jc);return e._reactRootContainer=o,e[fs]=o.current,Ri(8===e.nodeType?e.parentNode:e),lc(),o}for(;i=e.lastChild;)e.removeChild(i);if("function"==typeof r){var a=r;r=function(){var e=jc(l);a.call(e)}}var l=Pc(e,0,!1,null,0,!1,0,"",Jc);return e._reactRootContainer=l,e[fs]=l.current,Ri(8===e.nodeType?e.parentNode:e),lc((function(){Vc(t,l,n,r)})),l}(n,t,e,i,r);return jc(o)}Qc.prototype.render=Yc.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(re(409));Vc(e,t,null,null)},Qc.prototype.unmount=Yc.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;lc((function(){Vc(null,e,null,null)})),t[fs]=null}},Qc.prototype.unstable_scheduleHydration=function(e){if(e){var t=In();e={blockedOn:null,target:e,priority:t};for(var n=0;n<Nn.length&&0!==t&&t<Nn[n].priority;n++);Nn.splice(n,0,e),0===n&&Ln(e)}},wn=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=cn(t.pendingLanes);0!==n&&(mn(t,1|n),tc(t,qt()),!(6&Tu)&&(Ru=qt()+500,Rs()))}break;case 13:lc((function(){var t=Mo(e,1);if(null!==t){var n=Xu();ec(t,e,1,n)}})),Wc(e,1)}},_n=function(e){if(13===e.tag){var t=Mo(e,134217728);if(null!==t)ec(t,e,134217728,Xu());Wc(e,134217728)}},Sn=function(e){if(13===e.tag){var t=Zu(e),n=Mo(e,t);if(null!==n)ec(n,e,t,Xu());Wc(e,t)}},In=function(){return gn},xn=function(e,t){var n=gn;try{return gn=e,t()}finally{gn=n}},wt=function(e,t,n){switch(t){case"input":if(Je(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=vs(r);if(!i)throw Error(re(90));He(r),Je(r,i)}}}break;case"textarea":rt(e,n);break;case"select":null!=(t=n.value)&&et(e,!!n.multiple,t,!1)}},Tt=ac,Ct=lc;var Xc={usingClientEntryPoint:!1,Events:[ms,gs,vs,xt,kt,ac]},Zc={findFiberByHostInstance:bs,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},ed={bundleType:Zc.bundleType,version:Zc.version,rendererPackageName:Zc.rendererPackageName,rendererConfig:Zc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:ge.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=$t(e))?null:e.stateNode},findFiberByHostInstance:Zc.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var td=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!td.isDisabled&&td.supportsFiber)try{nn=td.inject(ed),rn=td}catch(lt){}}X.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Xc,X.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Kc(t))throw Error(re(200));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:we,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},X.createRoot=function(e,t){if(!Kc(e))throw Error(re(299));var n=!1,r="",i=Hc;return null!=t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onRecoverableError&&(i=t.onRecoverableError)),t=Pc(e,1,!1,null,0,n,0,r,i),e[fs]=t.current,Ri(8===e.nodeType?e.parentNode:e),new Yc(t)},X.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"==typeof e.render)throw Error(re(188));throw e=Object.keys(e).join(","),Error(re(268,e))}return e=null===(e=$t(t))?null:e.stateNode},X.flushSync=function(e){return lc(e)},X.hydrate=function(e,t,n){if(!qc(t))throw Error(re(200));return Gc(null,e,t,!0,n)},X.hydrateRoot=function(e,t,n){if(!Kc(e))throw Error(re(405));var r=null!=n&&n.hydratedSources||null,i=!1,s="",o=Hc;if(null!=n&&(!0===n.unstable_strictMode&&(i=!0),void 0!==n.identifierPrefix&&(s=n.identifierPrefix),void 0!==n.onRecoverableError&&(o=n.onRecoverableError)),t=Rc(t,null,e,1,null!=n?n:null,i,0,s,o),e[fs]=t.current,Ri(e),r)for(e=0;e<r.length;e++)i=(i=(n=r[e])._getVersion)(n._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[n,i]:t.mutableSourceEagerHydrationData.push(n,i);return new Qc(t)},X.render=function(e,t,n){if(!qc(t))throw Error(re(200));return Gc(null,e,t,!1,n)},X.unmountComponentAtNode=function(e){if(!qc(e))throw Error(re(40));return!!e._reactRootContainer&&(lc((function(){Gc(null,null,e,!1,(function(){e._reactRootContainer=null,e[fs]=null}))})),!0)},X.unstable_batchedUpdates=ac,X.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!qc(n))throw Error(re(200));if(null==e||void 0===e._reactInternals)throw Error(re(38));return Gc(e,t,n,!1,r)},X.version="18.3.1-next-f1338f8080-20240426",function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),G.exports=X;var nd,rd=G.exports;nd=rd.createRoot,rd.hydrateRoot;var id={exports:{}},sd={},od="function"==typeof Symbol&&Symbol.for,ad=od?Symbol.for("react.element"):60103,ld=od?Symbol.for("react.portal"):60106,ud=od?Symbol.for("react.fragment"):60107,cd=od?Symbol.for("react.strict_mode"):60108,dd=od?Symbol.for("react.profiler"):60114,fd=od?Symbol.for("react.provider"):60109,hd=od?Symbol.for("react.context"):60110,pd=od?Symbol.for("react.async_mode"):60111,yd=od?Symbol.for("react.concurrent_mode"):60111,bd=od?Symbol.for("react.forward_ref"):60112,md=od?Symbol.for("react.suspense"):60113,gd=od?Symbol.for("react.suspense_list"):60120,vd=od?Symbol.for("react.memo"):60115,wd=od?Symbol.for("react.lazy"):60116,_d=od?Symbol.for("react.block"):60121,Sd=od?Symbol.for("react.fundamental"):60117,Id=od?Symbol.for("react.responder"):60118,xd=od?Symbol.for("react.scope"):60119;function kd(e){if("object"==typeof e&&null!==e){var t=e.$$typeof;switch(t){case ad:switch(e=e.type){case pd:case yd:case ud:case dd:case cd:case md:return e;default:switch(e=e&&e.$$typeof){case hd:case bd:case wd:case vd:case fd:return e;default:return t}}case ld:return t}}}function Td(e){return kd(e)===yd}sd.AsyncMode=pd,sd.ConcurrentMode=yd,sd.ContextConsumer=hd,sd.ContextProvider=fd,sd.Element=ad,sd.ForwardRef=bd,sd.Fragment=ud,sd.Lazy=wd,sd.Memo=vd,sd.Portal=ld,sd.Profiler=dd,sd.StrictMode=cd,sd.Suspense=md,sd.isAsyncMode=function(e){return Td(e)||kd(e)===pd},sd.isConcurrentMode=Td,sd.isContextConsumer=function(e){return kd(e)===hd},sd.isContextProvider=function(e){return kd(e)===fd},sd.isElement=function(e){return"object"==typeof e&&null!==e&&e.$$typeof===ad},sd.isForwardRef=function(e){return kd(e)===bd},sd.isFragment=function(e){return kd(e)===ud},sd.isLazy=function(e){return kd(e)===wd},sd.isMemo=function(e){return kd(e)===vd},sd.isPortal=function(e){return kd(e)===ld},sd.isProfiler=function(e){return kd(e)===dd},sd.isStrictMode=function(e){return kd(e)===cd},sd.isSuspense=function(e){return kd(e)===md},sd.isValidElementType=function(e){return"string"==typeof e||"function"==typeof e||e===ud||e===yd||e===dd||e===cd||e===md||e===gd||"object"==typeof e&&null!==e&&(e.$$typeof===wd||e.$$typeof===vd||e.$$typeof===fd||e.$$typeof===hd||e.$$typeof===bd||e.$$typeof===Sd||e.$$typeof===Id||e.$$typeof===xd||e.$$typeof===_d)},sd.typeOf=kd,id.exports=sd;var Cd=id.exports,Ed={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},Od={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},Bd={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},Dd={};function Nd(e){return Cd.isMemo(e)?Bd:Dd[e.$$typeof]||Ed}Dd[Cd.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},Dd[Cd.Memo]=Bd;var Md=Object.defineProperty,Ad=Object.getOwnPropertyNames,Fd=Object.getOwnPropertySymbols,Ld=Object.getOwnPropertyDescriptor,Ud=Object.getPrototypeOf,Pd=Object.prototype;var zd=function e(t,n,r){if("string"!=typeof n){if(Pd){var i=Ud(n);i&&i!==Pd&&e(t,i,r)}var s=Ad(n);Fd&&(s=s.concat(Fd(n)));for(var o=Nd(t),a=Nd(n),l=0;l<s.length;++l){var u=s[l];if(!(Od[u]||r&&r[u]||a&&a[u]||o&&o[u])){var c=Ld(n,u);try{Md(t,u,c)}catch(d){}}}}return t};const Rd=n(zd);function Vd(e,t,n,r){return new(n||(n=Promise))((function(i,s){function o(e){try{l(r.next(e))}catch(t){s(t)}}function a(e){try{l(r.throw(e))}catch(t){s(t)}}function l(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(o,a)}l((r=r.apply(e,t||[])).next())}))}function jd(e){var t="function"==typeof Symbol&&Symbol.iterator,n=t&&e[t],r=0;if(n)return n.call(e);if(e&&"number"==typeof e.length)return{next:function(){return e&&r>=e.length&&(e=void 0),{value:e&&e[r++],done:!e}}};throw new TypeError(t?"Object is not iterable.":"Symbol.iterator is not defined.")}function $d(e){return this instanceof $d?(this.v=e,this):new $d(e)}function Wd(e,t,n){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var r,i=n.apply(e,t||[]),s=[];return r=Object.create(("function"==typeof AsyncIterator?AsyncIterator:Object).prototype),o("next"),o("throw"),o("return",(function(e){return function(t){return Promise.resolve(t).then(e,u)}})),r[Symbol.asyncIterator]=function(){return this},r;function o(e,t){i[e]&&(r[e]=function(t){return new Promise((function(n,r){s.push([e,t,n,r])>1||a(e,t)}))},t&&(r[e]=t(r[e])))}function a(e,t){try{(n=i[e](t)).value instanceof $d?Promise.resolve(n.value.v).then(l,u):c(s[0][2],n)}catch(r){c(s[0][3],r)}var n}function l(e){a("next",e)}function u(e){a("throw",e)}function c(e,t){e(t),s.shift(),s.length&&a(s[0][0],s[0][1])}}function Hd(e){var t,n;return t={},r("next"),r("throw",(function(e){throw e})),r("return"),t[Symbol.iterator]=function(){return this},t;function r(r,i){t[r]=e[r]?function(t){return(n=!n)?{value:$d(e[r](t)),done:!1}:i?i(t):t}:i}}function Yd(e){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var t,n=e[Symbol.asyncIterator];return n?n.call(e):(e=jd(e),t={},r("next"),r("throw"),r("return"),t[Symbol.asyncIterator]=function(){return this},t);function r(n){t[n]=e[n]&&function(t){return new Promise((function(r,i){(function(e,t,n,r){Promise.resolve(r).then((function(t){e({value:t,done:n})}),t)})(r,i,(t=e[n](t)).done,t.value)}))}}}"function"==typeof SuppressedError&&SuppressedError;const Qd=new TextDecoder("utf-8"),Kd=e=>Qd.decode(e),qd=new TextEncoder,Jd=e=>qd.encode(e),[Gd,Xd]=(()=>{const e=()=>{throw new Error("BigInt is not available in this environment")};function t(){throw e()}return t.asIntN=()=>{throw e()},t.asUintN=()=>{throw e()},"undefined"!=typeof BigInt?[BigInt,!0]:[t,!1]})(),[Zd,ef]=(()=>{const e=()=>{throw new Error("BigInt64Array is not available in this environment")};return"undefined"!=typeof BigInt64Array?[BigInt64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),[tf,nf]=(()=>{const e=()=>{throw new Error("BigUint64Array is not available in this environment")};return"undefined"!=typeof BigUint64Array?[BigUint64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),rf=e=>"boolean"==typeof e,sf=e=>"function"==typeof e,of=e=>null!=e&&Object(e)===e,af=e=>of(e)&&sf(e.then),lf=e=>of(e)&&sf(e[Symbol.iterator]),uf=e=>of(e)&&sf(e[Symbol.asyncIterator]),cf=e=>of(e)&&of(e.schema),df=e=>of(e)&&"done"in e&&"value"in e,ff=e=>of(e)&&sf(e.stat)&&(e=>"number"==typeof e)(e.fd),hf=e=>of(e)&&yf(e.body),pf=e=>"_getDOMStream"in e&&"_getNodeStream"in e,yf=e=>of(e)&&sf(e.cancel)&&sf(e.getReader)&&!pf(e),bf=e=>of(e)&&sf(e.read)&&sf(e.pipe)&&rf(e.readable)&&!pf(e),mf="undefined"!=typeof SharedArrayBuffer?SharedArrayBuffer:ArrayBuffer;function gf(e,t,n=0,r=t.byteLength){const i=e.byteLength,s=new Uint8Array(e.buffer,e.byteOffset,i),o=new Uint8Array(t.buffer,t.byteOffset,Math.min(r,i));return s.set(o,n),e}function vf(e,t){const n=function(e){const t=e[0]?[e[0]]:[];let n,r,i,s;for(let o,a,l=0,u=0,c=e.length;++l<c;)o=t[u],a=e[l],!o||!a||o.buffer!==a.buffer||a.byteOffset<o.byteOffset?a&&(t[++u]=a):(({byteOffset:n,byteLength:i}=o),({byteOffset:r,byteLength:s}=a),n+i<r||r+s<n?a&&(t[++u]=a):t[u]=new Uint8Array(o.buffer,n,r-n+s));return t}(e),r=n.reduce(((e,t)=>e+t.byteLength),0);let i,s,o,a=0,l=-1;const u=Math.min(t||Number.POSITIVE_INFINITY,r);for(const c=n.length;++l<c;){if(i=n[l],s=i.subarray(0,Math.min(i.length,u-a)),u<=a+s.length){s.length<i.length?n[l]=i.subarray(s.length):s.length===i.length&&l++,o?gf(o,s,a):o=s;break}gf(o||(o=new Uint8Array(u)),s,a),a+=s.length}return[o||new Uint8Array(0),n.slice(l),r-(o?o.byteLength:0)]}function wf(e,t){let n=df(t)?t.value:t;return n instanceof e?e===Uint8Array?new e(n.buffer,n.byteOffset,n.byteLength):n:n?("string"==typeof n&&(n=Jd(n)),n instanceof ArrayBuffer||n instanceof mf?new e(n):of(r=n)&&sf(r.clear)&&sf(r.bytes)&&sf(r.position)&&sf(r.setPosition)&&sf(r.capacity)&&sf(r.getBufferIdentifier)&&sf(r.createLong)?wf(e,n.bytes()):ArrayBuffer.isView(n)?n.byteLength<=0?new e(0):new e(n.buffer,n.byteOffset,n.byteLength/e.BYTES_PER_ELEMENT):e.from(n)):new e(0);var r}const _f=e=>wf(Int32Array,e),Sf=e=>wf(Uint8Array,e),If=e=>(e.next(),e);const xf=e=>function*(e,t){const n=function*(e){yield e},r="string"==typeof t||ArrayBuffer.isView(t)||t instanceof ArrayBuffer||t instanceof mf?n(t):lf(t)?t:n(t);return yield*If(function*(t){let n=null;do{n=t.next(yield wf(e,n))}while(!n.done)}(r[Symbol.iterator]())),new e}(Uint8Array,e);function kf(e,t){return Wd(this,arguments,(function*(){if(af(t))return yield $d(yield $d(yield*Hd(Yd(kf(e,yield $d(t))))));const n=function(e){return Wd(this,arguments,(function*(){yield yield $d(yield $d(e))}))},r="string"==typeof t||ArrayBuffer.isView(t)||t instanceof ArrayBuffer||t instanceof mf?n(t):lf(t)?function(e){return Wd(this,arguments,(function*(){yield $d(yield*Hd(Yd(If(function*(e){let t=null;do{t=e.next(yield null==t?void 0:t.value)}while(!t.done)}(e[Symbol.iterator]())))))}))}(t):uf(t)?t:n(t);return yield $d(yield*Hd(Yd(If(function(t){return Wd(this,arguments,(function*(){let n=null;do{n=yield $d(t.next(yield yield $d(wf(e,n))))}while(!n.done)}))}(r[Symbol.asyncIterator]()))))),yield $d(new e)}))}const Tf=e=>kf(Uint8Array,e);function Cf(e,t,n){if(0!==e){n=n.slice(0,t+1);for(let r=-1;++r<=t;)n[r]+=e}return n}const Ef={fromIterable:e=>Of(function*(e){let t,n,r,i,s=!1,o=[],a=0;function l(){return"peek"===r?vf(o,i)[0]:([n,o,a]=vf(o,i),n)}({cmd:r,size:i}=yield null);const u=xf(e)[Symbol.iterator]();try{do{if(({done:t,value:n}=Number.isNaN(i-a)?u.next():u.next(i-a)),!t&&n.byteLength>0&&(o.push(n),a+=n.byteLength),t||i<=a)do{({cmd:r,size:i}=yield l())}while(i<a)}while(!t)}catch(c){(s=!0)&&"function"==typeof u.throw&&u.throw(c)}finally{!1===s&&"function"==typeof u.return&&u.return(null)}return null}(e)),fromAsyncIterable:e=>Of(function(e){return Wd(this,arguments,(function*(){let t,n,r,i,s=!1,o=[],a=0;function l(){return"peek"===r?vf(o,i)[0]:([n,o,a]=vf(o,i),n)}({cmd:r,size:i}=yield yield $d(null));const u=Tf(e)[Symbol.asyncIterator]();try{do{if(({done:t,value:n}=Number.isNaN(i-a)?yield $d(u.next()):yield $d(u.next(i-a))),!t&&n.byteLength>0&&(o.push(n),a+=n.byteLength),t||i<=a)do{({cmd:r,size:i}=yield yield $d(l()))}while(i<a)}while(!t)}catch(c){(s=!0)&&"function"==typeof u.throw&&(yield $d(u.throw(c)))}finally{!1===s&&"function"==typeof u.return&&(yield $d(u.return(new Uint8Array(0))))}return yield $d(null)}))}(e)),fromDOMStream:e=>Of(function(e){return Wd(this,arguments,(function*(){let t,n,r,i=!1,s=!1,o=[],a=0;function l(){return"peek"===n?vf(o,r)[0]:([t,o,a]=vf(o,r),t)}({cmd:n,size:r}=yield yield $d(null));const u=new Bf(e);try{do{if(({done:i,value:t}=Number.isNaN(r-a)?yield $d(u.read()):yield $d(u.read(r-a))),!i&&t.byteLength>0&&(o.push(Sf(t)),a+=t.byteLength),i||r<=a)do{({cmd:n,size:r}=yield yield $d(l()))}while(r<a)}while(!i)}catch(c){(s=!0)&&(yield $d(u.cancel(c)))}finally{!1===s?yield $d(u.cancel()):e.locked&&u.releaseLock()}return yield $d(null)}))}(e)),fromNodeStream:e=>Of(function(e){return Wd(this,arguments,(function*(){const t=[];let n,r,i,s="error",o=!1,a=null,l=0,u=[];function c(){return"peek"===n?vf(u,r)[0]:([i,u,l]=vf(u,r),i)}if(({cmd:n,size:r}=yield yield $d(null)),e.isTTY)return yield yield $d(new Uint8Array(0)),yield $d(null);try{t[0]=Df(e,"end"),t[1]=Df(e,"error");do{if(t[2]=Df(e,"readable"),[s,a]=yield $d(Promise.race(t.map((e=>e[2])))),"error"===s)break;if((o="end"===s)||(Number.isFinite(r-l)?(i=Sf(e.read(r-l)),i.byteLength<r-l&&(i=Sf(e.read()))):i=Sf(e.read()),i.byteLength>0&&(u.push(i),l+=i.byteLength)),o||r<=l)do{({cmd:n,size:r}=yield yield $d(c()))}while(r<l)}while(!o)}finally{yield $d(d(t,"error"===s?a:null))}return yield $d(null);function d(t,n){return i=u=null,new Promise(((r,i)=>{for(const[n,o]of t)e.off(n,o);try{const t=e.destroy;t&&t.call(e,n),n=void 0}catch(s){n=s||n}finally{null!=n?i(n):r()}}))}}))}(e)),toDOMStream(e,t){throw new Error('"toDOMStream" not available in this environment')},toNodeStream(e,t){throw new Error('"toNodeStream" not available in this environment')}},Of=e=>(e.next(),e);class Bf{constructor(e){this.source=e,this.reader=null,this.reader=this.source.getReader(),this.reader.closed.catch((()=>{}))}get closed(){return this.reader?this.reader.closed.catch((()=>{})):Promise.resolve()}releaseLock(){this.reader&&this.reader.releaseLock(),this.reader=null}cancel(e){return Vd(this,void 0,void 0,(function*(){const{reader:t,source:n}=this;t&&(yield t.cancel(e).catch((()=>{}))),n&&n.locked&&this.releaseLock()}))}read(e){return Vd(this,void 0,void 0,(function*(){if(0===e)return{done:null==this.reader,value:new Uint8Array(0)};const t=yield this.reader.read();return!t.done&&(t.value=Sf(t)),t}))}}const Df=(e,t)=>{const n=e=>r([t,e]);let r;return[t,n,new Promise((i=>(r=i)&&e.once(t,n)))]};var Nf,Mf,Af,Ff,Lf,Uf,Pf,zf,Rf,Vf,jf,$f,Wf,Hf,Yf,Qf,Kf,qf;(Mf=Nf||(Nf={}))[Mf.V1=0]="V1",Mf[Mf.V2=1]="V2",Mf[Mf.V3=2]="V3",Mf[Mf.V4=3]="V4",Mf[Mf.V5=4]="V5",(Ff=Af||(Af={}))[Ff.Sparse=0]="Sparse",Ff[Ff.Dense=1]="Dense",(Uf=Lf||(Lf={}))[Uf.HALF=0]="HALF",Uf[Uf.SINGLE=1]="SINGLE",Uf[Uf.DOUBLE=2]="DOUBLE",(zf=Pf||(Pf={}))[zf.DAY=0]="DAY",zf[zf.MILLISECOND=1]="MILLISECOND",(Vf=Rf||(Rf={}))[Vf.SECOND=0]="SECOND",Vf[Vf.MILLISECOND=1]="MILLISECOND",Vf[Vf.MICROSECOND=2]="MICROSECOND",Vf[Vf.NANOSECOND=3]="NANOSECOND",($f=jf||(jf={}))[$f.YEAR_MONTH=0]="YEAR_MONTH",$f[$f.DAY_TIME=1]="DAY_TIME",$f[$f.MONTH_DAY_NANO=2]="MONTH_DAY_NANO",(Hf=Wf||(Wf={}))[Hf.NONE=0]="NONE",Hf[Hf.Schema=1]="Schema",Hf[Hf.DictionaryBatch=2]="DictionaryBatch",Hf[Hf.RecordBatch=3]="RecordBatch",Hf[Hf.Tensor=4]="Tensor",Hf[Hf.SparseTensor=5]="SparseTensor",(Qf=Yf||(Yf={}))[Qf.NONE=0]="NONE",Qf[Qf.Null=1]="Null",Qf[Qf.Int=2]="Int",Qf[Qf.Float=3]="Float",Qf[Qf.Binary=4]="Binary",Qf[Qf.Utf8=5]="Utf8",Qf[Qf.Bool=6]="Bool",Qf[Qf.Decimal=7]="Decimal",Qf[Qf.Date=8]="Date",Qf[Qf.Time=9]="Time",Qf[Qf.Timestamp=10]="Timestamp",Qf[Qf.Interval=11]="Interval",Qf[Qf.List=12]="List",Qf[Qf.Struct=13]="Struct",Qf[Qf.Union=14]="Union",Qf[Qf.FixedSizeBinary=15]="FixedSizeBinary",Qf[Qf.FixedSizeList=16]="FixedSizeList",Qf[Qf.Map=17]="Map",Qf[Qf.Dictionary=-1]="Dictionary",Qf[Qf.Int8=-2]="Int8",Qf[Qf.Int16=-3]="Int16",Qf[Qf.Int32=-4]="Int32",Qf[Qf.Int64=-5]="Int64",Qf[Qf.Uint8=-6]="Uint8",Qf[Qf.Uint16=-7]="Uint16",Qf[Qf.Uint32=-8]="Uint32",Qf[Qf.Uint64=-9]="Uint64",Qf[Qf.Float16=-10]="Float16",Qf[Qf.Float32=-11]="Float32",Qf[Qf.Float64=-12]="Float64",Qf[Qf.DateDay=-13]="DateDay",Qf[Qf.DateMillisecond=-14]="DateMillisecond",Qf[Qf.TimestampSecond=-15]="TimestampSecond",Qf[Qf.TimestampMillisecond=-16]="TimestampMillisecond",Qf[Qf.TimestampMicrosecond=-17]="TimestampMicrosecond",Qf[Qf.TimestampNanosecond=-18]="TimestampNanosecond",Qf[Qf.TimeSecond=-19]="TimeSecond",Qf[Qf.TimeMillisecond=-20]="TimeMillisecond",Qf[Qf.TimeMicrosecond=-21]="TimeMicrosecond",Qf[Qf.TimeNanosecond=-22]="TimeNanosecond",Qf[Qf.DenseUnion=-23]="DenseUnion",Qf[Qf.SparseUnion=-24]="SparseUnion",Qf[Qf.IntervalDayTime=-25]="IntervalDayTime",Qf[Qf.IntervalYearMonth=-26]="IntervalYearMonth",(qf=Kf||(Kf={}))[qf.OFFSET=0]="OFFSET",qf[qf.DATA=1]="DATA",qf[qf.VALIDITY=2]="VALIDITY",qf[qf.TYPE=3]="TYPE";function Jf(e){if(null===e)return"null";if(undefined===e)return"undefined";switch(typeof e){case"number":case"bigint":return`${e}`;case"string":return`"${e}"`}return"function"==typeof e[Symbol.toPrimitive]?e[Symbol.toPrimitive]("string"):ArrayBuffer.isView(e)?e instanceof Zd||e instanceof tf?`[${[...e].map((e=>Jf(e)))}]`:`[${e}]`:ArrayBuffer.isView(e)?`[${e}]`:JSON.stringify(e,((e,t)=>"bigint"==typeof t?`${t}`:t))}const Gf=Symbol.for("isArrowBigNum");function Xf(e,...t){return 0===t.length?Object.setPrototypeOf(wf(this.TypedArray,e),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(e,...t),this.constructor.prototype)}function Zf(...e){return Xf.apply(this,e)}function eh(...e){return Xf.apply(this,e)}function th(...e){return Xf.apply(this,e)}function nh(e){const{buffer:t,byteOffset:n,length:r,signed:i}=e,s=new tf(t,n,r),o=i&&s[s.length-1]&BigInt(1)<<BigInt(63);let a=o?BigInt(1):BigInt(0),l=BigInt(0);if(o){for(const e of s)a+=~e*(BigInt(1)<<BigInt(32)*l++);a*=BigInt(-1)}else for(const u of s)a+=u*(BigInt(1)<<BigInt(32)*l++);return a}let rh,ih;function sh(e){let t="";const n=new Uint32Array(2);let r=new Uint16Array(e.buffer,e.byteOffset,e.byteLength/2);const i=new Uint32Array((r=new Uint16Array(r).reverse()).buffer);let s=-1;const o=r.length-1;do{for(n[0]=r[s=0];s<o;)r[s++]=n[1]=n[0]/10,n[0]=(n[0]-10*n[1]<<16)+r[s];r[s]=n[1]=n[0]/10,n[0]=n[0]-10*n[1],t=`${n[0]}${t}`}while(i[0]||i[1]||i[2]||i[3]);return null!=t?t:"0"}Xf.prototype[Gf]=!0,Xf.prototype.toJSON=function(){return`"${rh(this)}"`},Xf.prototype.valueOf=function(){return nh(this)},Xf.prototype.toString=function(){return rh(this)},Xf.prototype[Symbol.toPrimitive]=function(e="default"){switch(e){case"number":return nh(this);case"string":return rh(this);case"default":return ih(this)}return rh(this)},Object.setPrototypeOf(Zf.prototype,Object.create(Int32Array.prototype)),Object.setPrototypeOf(eh.prototype,Object.create(Uint32Array.prototype)),Object.setPrototypeOf(th.prototype,Object.create(Uint32Array.prototype)),Object.assign(Zf.prototype,Xf.prototype,{constructor:Zf,signed:!0,TypedArray:Int32Array,BigIntArray:Zd}),Object.assign(eh.prototype,Xf.prototype,{constructor:eh,signed:!1,TypedArray:Uint32Array,BigIntArray:tf}),Object.assign(th.prototype,Xf.prototype,{constructor:th,signed:!0,TypedArray:Uint32Array,BigIntArray:tf}),Xd?(ih=e=>8===e.byteLength?new e.BigIntArray(e.buffer,e.byteOffset,1)[0]:sh(e),rh=e=>8===e.byteLength?`${new e.BigIntArray(e.buffer,e.byteOffset,1)[0]}`:sh(e)):(rh=sh,ih=rh);class oh{static new(e,t){switch(t){case!0:return new Zf(e);case!1:return new eh(e)}switch(e.constructor){case Int8Array:case Int16Array:case Int32Array:case Zd:return new Zf(e)}return 16===e.byteLength?new th(e):new eh(e)}static signed(e){return new Zf(e)}static unsigned(e){return new eh(e)}static decimal(e){return new th(e)}constructor(e,t){return oh.new(e,t)}}var ah,lh,uh,ch,dh,fh,hh,ph,yh,bh,mh,gh,vh,wh,_h,Sh,Ih,xh,kh,Th;class Ch{static isNull(e){return(null==e?void 0:e.typeId)===Yf.Null}static isInt(e){return(null==e?void 0:e.typeId)===Yf.Int}static isFloat(e){return(null==e?void 0:e.typeId)===Yf.Float}static isBinary(e){return(null==e?void 0:e.typeId)===Yf.Binary}static isUtf8(e){return(null==e?void 0:e.typeId)===Yf.Utf8}static isBool(e){return(null==e?void 0:e.typeId)===Yf.Bool}static isDecimal(e){return(null==e?void 0:e.typeId)===Yf.Decimal}static isDate(e){return(null==e?void 0:e.typeId)===Yf.Date}static isTime(e){return(null==e?void 0:e.typeId)===Yf.Time}static isTimestamp(e){return(null==e?void 0:e.typeId)===Yf.Timestamp}static isInterval(e){return(null==e?void 0:e.typeId)===Yf.Interval}static isList(e){return(null==e?void 0:e.typeId)===Yf.List}static isStruct(e){return(null==e?void 0:e.typeId)===Yf.Struct}static isUnion(e){return(null==e?void 0:e.typeId)===Yf.Union}static isFixedSizeBinary(e){return(null==e?void 0:e.typeId)===Yf.FixedSizeBinary}static isFixedSizeList(e){return(null==e?void 0:e.typeId)===Yf.FixedSizeList}static isMap(e){return(null==e?void 0:e.typeId)===Yf.Map}static isDictionary(e){return(null==e?void 0:e.typeId)===Yf.Dictionary}static isDenseUnion(e){return Ch.isUnion(e)&&e.mode===Af.Dense}static isSparseUnion(e){return Ch.isUnion(e)&&e.mode===Af.Sparse}get typeId(){return Yf.NONE}}ah=Symbol.toStringTag,Ch[ah]=((Th=Ch.prototype).children=null,Th.ArrayType=Array,Th[Symbol.toStringTag]="DataType");let Eh=class extends Ch{toString(){return"Null"}get typeId(){return Yf.Null}};lh=Symbol.toStringTag,Eh[lh]=Eh.prototype[Symbol.toStringTag]="Null";class Oh extends Ch{constructor(e,t){super(),this.isSigned=e,this.bitWidth=t}get typeId(){return Yf.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?Zd:tf}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}}uh=Symbol.toStringTag,Oh[uh]=(e=>(e.isSigned=null,e.bitWidth=null,e[Symbol.toStringTag]="Int"))(Oh.prototype);class Bh extends Oh{constructor(){super(!0,32)}get ArrayType(){return Int32Array}}Object.defineProperty(Bh.prototype,"ArrayType",{value:Int32Array});class Dh extends Ch{constructor(e){super(),this.precision=e}get typeId(){return Yf.Float}get ArrayType(){switch(this.precision){case Lf.HALF:return Uint16Array;case Lf.SINGLE:return Float32Array;case Lf.DOUBLE:return Float64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}}ch=Symbol.toStringTag,Dh[ch]=(e=>(e.precision=null,e[Symbol.toStringTag]="Float"))(Dh.prototype);let Nh=class extends Ch{constructor(){super()}get typeId(){return Yf.Binary}toString(){return"Binary"}};dh=Symbol.toStringTag,Nh[dh]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Binary"))(Nh.prototype);let Mh=class extends Ch{constructor(){super()}get typeId(){return Yf.Utf8}toString(){return"Utf8"}};fh=Symbol.toStringTag,Mh[fh]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Utf8"))(Mh.prototype);let Ah=class extends Ch{constructor(){super()}get typeId(){return Yf.Bool}toString(){return"Bool"}};hh=Symbol.toStringTag,Ah[hh]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Bool"))(Ah.prototype);let Fh=class extends Ch{constructor(e,t,n=128){super(),this.scale=e,this.precision=t,this.bitWidth=n}get typeId(){return Yf.Decimal}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}};ph=Symbol.toStringTag,Fh[ph]=(e=>(e.scale=null,e.precision=null,e.ArrayType=Uint32Array,e[Symbol.toStringTag]="Decimal"))(Fh.prototype);class Lh extends Ch{constructor(e){super(),this.unit=e}get typeId(){return Yf.Date}toString(){return`Date${32*(this.unit+1)}<${Pf[this.unit]}>`}}yh=Symbol.toStringTag,Lh[yh]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Date"))(Lh.prototype);class Uh extends Ch{constructor(e,t){super(),this.unit=e,this.bitWidth=t}get typeId(){return Yf.Time}toString(){return`Time${this.bitWidth}<${Rf[this.unit]}>`}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return Zd}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}}bh=Symbol.toStringTag,Uh[bh]=(e=>(e.unit=null,e.bitWidth=null,e[Symbol.toStringTag]="Time"))(Uh.prototype);class Ph extends Ch{constructor(e,t){super(),this.unit=e,this.timezone=t}get typeId(){return Yf.Timestamp}toString(){return`Timestamp<${Rf[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}}mh=Symbol.toStringTag,Ph[mh]=(e=>(e.unit=null,e.timezone=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Timestamp"))(Ph.prototype);class zh extends Ch{constructor(e){super(),this.unit=e}get typeId(){return Yf.Interval}toString(){return`Interval<${jf[this.unit]}>`}}gh=Symbol.toStringTag,zh[gh]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Interval"))(zh.prototype);let Rh=class extends Ch{constructor(e){super(),this.children=[e]}get typeId(){return Yf.List}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}};vh=Symbol.toStringTag,Rh[vh]=(e=>(e.children=null,e[Symbol.toStringTag]="List"))(Rh.prototype);class Vh extends Ch{constructor(e){super(),this.children=e}get typeId(){return Yf.Struct}toString(){return`Struct<{${this.children.map((e=>`${e.name}:${e.type}`)).join(", ")}}>`}}wh=Symbol.toStringTag,Vh[wh]=(e=>(e.children=null,e[Symbol.toStringTag]="Struct"))(Vh.prototype);class jh extends Ch{constructor(e,t,n){super(),this.mode=e,this.children=n,this.typeIds=t=Int32Array.from(t),this.typeIdToChildIndex=t.reduce(((e,t,n)=>(e[t]=n)&&e||e),Object.create(null))}get typeId(){return Yf.Union}toString(){return`${this[Symbol.toStringTag]}<${this.children.map((e=>`${e.type}`)).join(" | ")}>`}}_h=Symbol.toStringTag,jh[_h]=(e=>(e.mode=null,e.typeIds=null,e.children=null,e.typeIdToChildIndex=null,e.ArrayType=Int8Array,e[Symbol.toStringTag]="Union"))(jh.prototype);let $h=class extends Ch{constructor(e){super(),this.byteWidth=e}get typeId(){return Yf.FixedSizeBinary}toString(){return`FixedSizeBinary[${this.byteWidth}]`}};Sh=Symbol.toStringTag,$h[Sh]=(e=>(e.byteWidth=null,e.ArrayType=Uint8Array,e[Symbol.toStringTag]="FixedSizeBinary"))($h.prototype);let Wh=class extends Ch{constructor(e,t){super(),this.listSize=e,this.children=[t]}get typeId(){return Yf.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}};Ih=Symbol.toStringTag,Wh[Ih]=(e=>(e.children=null,e.listSize=null,e[Symbol.toStringTag]="FixedSizeList"))(Wh.prototype);class Hh extends Ch{constructor(e,t=!1){super(),this.children=[e],this.keysSorted=t}get typeId(){return Yf.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return`Map<{${this.children[0].type.children.map((e=>`${e.name}:${e.type}`)).join(", ")}}>`}}xh=Symbol.toStringTag,Hh[xh]=(e=>(e.children=null,e.keysSorted=null,e[Symbol.toStringTag]="Map_"))(Hh.prototype);const Yh=(e=>()=>++e)(-1);class Qh extends Ch{constructor(e,t,n,r){super(),this.indices=t,this.dictionary=e,this.isOrdered=r||!1,this.id=null==n?Yh():"number"==typeof n?n:n.low}get typeId(){return Yf.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}}function Kh(e){const t=e;switch(e.typeId){case Yf.Decimal:return e.bitWidth/32;case Yf.Timestamp:return 2;case Yf.Date:case Yf.Interval:return 1+t.unit;case Yf.FixedSizeList:return t.listSize;case Yf.FixedSizeBinary:return t.byteWidth;default:return 1}}kh=Symbol.toStringTag,Qh[kh]=(e=>(e.id=null,e.indices=null,e.isOrdered=null,e.dictionary=null,e[Symbol.toStringTag]="Dictionary"))(Qh.prototype);class qh{visitMany(e,...t){return e.map(((e,n)=>this.visit(e,...t.map((e=>e[n])))))}visit(...e){return this.getVisitFn(e[0],!1).apply(this,e)}getVisitFn(e,t=!0){return function(e,t,n=!0){if("number"==typeof t)return Jh(e,t,n);if("string"==typeof t&&t in Yf)return Jh(e,Yf[t],n);if(t&&t instanceof Ch)return Jh(e,Gh(t),n);if((null==t?void 0:t.type)&&t.type instanceof Ch)return Jh(e,Gh(t.type),n);return Jh(e,Yf.NONE,n)}(this,e,t)}getVisitFnByTypeId(e,t=!0){return Jh(this,e,t)}visitNull(e,...t){return null}visitBool(e,...t){return null}visitInt(e,...t){return null}visitFloat(e,...t){return null}visitUtf8(e,...t){return null}visitBinary(e,...t){return null}visitFixedSizeBinary(e,...t){return null}visitDate(e,...t){return null}visitTimestamp(e,...t){return null}visitTime(e,...t){return null}visitDecimal(e,...t){return null}visitList(e,...t){return null}visitStruct(e,...t){return null}visitUnion(e,...t){return null}visitDictionary(e,...t){return null}visitInterval(e,...t){return null}visitFixedSizeList(e,...t){return null}visitMap(e,...t){return null}}function Jh(e,t,n=!0){let r=null;switch(t){case Yf.Null:r=e.visitNull;break;case Yf.Bool:r=e.visitBool;break;case Yf.Int:r=e.visitInt;break;case Yf.Int8:r=e.visitInt8||e.visitInt;break;case Yf.Int16:r=e.visitInt16||e.visitInt;break;case Yf.Int32:r=e.visitInt32||e.visitInt;break;case Yf.Int64:r=e.visitInt64||e.visitInt;break;case Yf.Uint8:r=e.visitUint8||e.visitInt;break;case Yf.Uint16:r=e.visitUint16||e.visitInt;break;case Yf.Uint32:r=e.visitUint32||e.visitInt;break;case Yf.Uint64:r=e.visitUint64||e.visitInt;break;case Yf.Float:r=e.visitFloat;break;case Yf.Float16:r=e.visitFloat16||e.visitFloat;break;case Yf.Float32:r=e.visitFloat32||e.visitFloat;break;case Yf.Float64:r=e.visitFloat64||e.visitFloat;break;case Yf.Utf8:r=e.visitUtf8;break;case Yf.Binary:r=e.visitBinary;break;case Yf.FixedSizeBinary:r=e.visitFixedSizeBinary;break;case Yf.Date:r=e.visitDate;break;case Yf.DateDay:r=e.visitDateDay||e.visitDate;break;case Yf.DateMillisecond:r=e.visitDateMillisecond||e.visitDate;break;case Yf.Timestamp:r=e.visitTimestamp;break;case Yf.TimestampSecond:r=e.visitTimestampSecond||e.visitTimestamp;break;case Yf.TimestampMillisecond:r=e.visitTimestampMillisecond||e.visitTimestamp;break;case Yf.TimestampMicrosecond:r=e.visitTimestampMicrosecond||e.visitTimestamp;break;case Yf.TimestampNanosecond:r=e.visitTimestampNanosecond||e.visitTimestamp;break;case Yf.Time:r=e.visitTime;break;case Yf.TimeSecond:r=e.visitTimeSecond||e.visitTime;break;case Yf.TimeMillisecond:r=e.visitTimeMillisecond||e.visitTime;break;case Yf.TimeMicrosecond:r=e.visitTimeMicrosecond||e.visitTime;break;case Yf.TimeNanosecond:r=e.visitTimeNanosecond||e.visitTime;break;case Yf.Decimal:r=e.visitDecimal;break;case Yf.List:r=e.visitList;break;case Yf.Struct:r=e.visitStruct;break;case Yf.Union:r=e.visitUnion;break;case Yf.DenseUnion:r=e.visitDenseUnion||e.visitUnion;break;case Yf.SparseUnion:r=e.visitSparseUnion||e.visitUnion;break;case Yf.Dictionary:r=e.visitDictionary;break;case Yf.Interval:r=e.visitInterval;break;case Yf.IntervalDayTime:r=e.visitIntervalDayTime||e.visitInterval;break;case Yf.IntervalYearMonth:r=e.visitIntervalYearMonth||e.visitInterval;break;case Yf.FixedSizeList:r=e.visitFixedSizeList;break;case Yf.Map:r=e.visitMap}if("function"==typeof r)return r;if(!n)return()=>null;throw new Error(`Unrecognized type '${Yf[t]}'`)}function Gh(e){switch(e.typeId){case Yf.Null:return Yf.Null;case Yf.Int:{const{bitWidth:t,isSigned:n}=e;switch(t){case 8:return n?Yf.Int8:Yf.Uint8;case 16:return n?Yf.Int16:Yf.Uint16;case 32:return n?Yf.Int32:Yf.Uint32;case 64:return n?Yf.Int64:Yf.Uint64}return Yf.Int}case Yf.Float:switch(e.precision){case Lf.HALF:return Yf.Float16;case Lf.SINGLE:return Yf.Float32;case Lf.DOUBLE:return Yf.Float64}return Yf.Float;case Yf.Binary:return Yf.Binary;case Yf.Utf8:return Yf.Utf8;case Yf.Bool:return Yf.Bool;case Yf.Decimal:return Yf.Decimal;case Yf.Time:switch(e.unit){case Rf.SECOND:return Yf.TimeSecond;case Rf.MILLISECOND:return Yf.TimeMillisecond;case Rf.MICROSECOND:return Yf.TimeMicrosecond;case Rf.NANOSECOND:return Yf.TimeNanosecond}return Yf.Time;case Yf.Timestamp:switch(e.unit){case Rf.SECOND:return Yf.TimestampSecond;case Rf.MILLISECOND:return Yf.TimestampMillisecond;case Rf.MICROSECOND:return Yf.TimestampMicrosecond;case Rf.NANOSECOND:return Yf.TimestampNanosecond}return Yf.Timestamp;case Yf.Date:switch(e.unit){case Pf.DAY:return Yf.DateDay;case Pf.MILLISECOND:return Yf.DateMillisecond}return Yf.Date;case Yf.Interval:switch(e.unit){case jf.DAY_TIME:return Yf.IntervalDayTime;case jf.YEAR_MONTH:return Yf.IntervalYearMonth}return Yf.Interval;case Yf.Map:return Yf.Map;case Yf.List:return Yf.List;case Yf.Struct:return Yf.Struct;case Yf.Union:switch(e.mode){case Af.Dense:return Yf.DenseUnion;case Af.Sparse:return Yf.SparseUnion}return Yf.Union;case Yf.FixedSizeBinary:return Yf.FixedSizeBinary;case Yf.FixedSizeList:return Yf.FixedSizeList;case Yf.Dictionary:return Yf.Dictionary}throw new Error(`Unrecognized type '${Yf[e.typeId]}'`)}qh.prototype.visitInt8=null,qh.prototype.visitInt16=null,qh.prototype.visitInt32=null,qh.prototype.visitInt64=null,qh.prototype.visitUint8=null,qh.prototype.visitUint16=null,qh.prototype.visitUint32=null,qh.prototype.visitUint64=null,qh.prototype.visitFloat16=null,qh.prototype.visitFloat32=null,qh.prototype.visitFloat64=null,qh.prototype.visitDateDay=null,qh.prototype.visitDateMillisecond=null,qh.prototype.visitTimestampSecond=null,qh.prototype.visitTimestampMillisecond=null,qh.prototype.visitTimestampMicrosecond=null,qh.prototype.visitTimestampNanosecond=null,qh.prototype.visitTimeSecond=null,qh.prototype.visitTimeMillisecond=null,qh.prototype.visitTimeMicrosecond=null,qh.prototype.visitTimeNanosecond=null,qh.prototype.visitDenseUnion=null,qh.prototype.visitSparseUnion=null,qh.prototype.visitIntervalDayTime=null,qh.prototype.visitIntervalYearMonth=null;const Xh=new Float64Array(1),Zh=new Uint32Array(Xh.buffer);function ep(e){const t=(31744&e)>>10,n=(1023&e)/1024,r=Math.pow(-1,(32768&e)>>15);switch(t){case 31:return r*(n?Number.NaN:1/0);case 0:return r*(n?6103515625e-14*n:0)}return r*Math.pow(2,t-15)*(1+n)}class tp extends qh{}function np(e){return(t,n,r)=>{if(t.setValid(n,null!=r))return e(t,n,r)}}const rp=(e,t,n)=>{e[t]=Math.trunc(n%4294967296),e[t+1]=Math.trunc(n/4294967296)},ip=(e,t,n,r)=>{if(n+1<t.length){const{[n]:i,[n+1]:s}=t;e.set(r.subarray(0,s-i),i)}},sp=({values:e},t,n)=>{e[t]=n},op=({values:e},t,n)=>{e[t]=n},ap=({values:e},t,n)=>{e[t]=function(e){if(e!=e)return 32256;Xh[0]=e;const t=(2147483648&Zh[1])>>16&65535;let n=2146435072&Zh[1],r=0;return n>=1089470464?Zh[0]>0?n=31744:(n=(2080374784&n)>>16,r=(1048575&Zh[1])>>10):n<=1056964608?(r=1048576+(1048575&Zh[1]),r=1048576+(r<<(n>>20)-998)>>21,n=0):(n=n-1056964608>>10,r=512+(1048575&Zh[1])>>10),t|n|65535&r}(n)},lp=({values:e},t,n)=>{((e,t,n)=>{e[t]=Math.trunc(n/864e5)})(e,t,n.valueOf())},up=({values:e},t,n)=>{rp(e,2*t,n.valueOf())},cp=({values:e},t,n)=>rp(e,2*t,n/1e3),dp=({values:e},t,n)=>rp(e,2*t,n),fp=({values:e},t,n)=>((e,t,n)=>{e[t]=Math.trunc(1e3*n%4294967296),e[t+1]=Math.trunc(1e3*n/4294967296)})(e,2*t,n),hp=({values:e},t,n)=>((e,t,n)=>{e[t]=Math.trunc(1e6*n%4294967296),e[t+1]=Math.trunc(1e6*n/4294967296)})(e,2*t,n),pp=({values:e},t,n)=>{e[t]=n},yp=({values:e},t,n)=>{e[t]=n},bp=({values:e},t,n)=>{e[t]=n},mp=({values:e},t,n)=>{e[t]=n},gp=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];Sp.visit(i,e.valueOffsets[t],n)},vp=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];Sp.visit(i,t,n)},wp=({values:e},t,n)=>{e.set(n.subarray(0,2),2*t)},_p=({values:e},t,n)=>{e[t]=12*n[0]+n[1]%12};tp.prototype.visitBool=np((({offset:e,values:t},n,r)=>{const i=e+n;r?t[i>>3]|=1<<i%8:t[i>>3]&=~(1<<i%8)})),tp.prototype.visitInt=np(sp),tp.prototype.visitInt8=np(sp),tp.prototype.visitInt16=np(sp),tp.prototype.visitInt32=np(sp),tp.prototype.visitInt64=np(sp),tp.prototype.visitUint8=np(sp),tp.prototype.visitUint16=np(sp),tp.prototype.visitUint32=np(sp),tp.prototype.visitUint64=np(sp),tp.prototype.visitFloat=np(((e,t,n)=>{switch(e.type.precision){case Lf.HALF:return ap(e,t,n);case Lf.SINGLE:case Lf.DOUBLE:return op(e,t,n)}})),tp.prototype.visitFloat16=np(ap),tp.prototype.visitFloat32=np(op),tp.prototype.visitFloat64=np(op),tp.prototype.visitUtf8=np((({values:e,valueOffsets:t},n,r)=>{ip(e,t,n,Jd(r))})),tp.prototype.visitBinary=np((({values:e,valueOffsets:t},n,r)=>ip(e,t,n,r))),tp.prototype.visitFixedSizeBinary=np((({stride:e,values:t},n,r)=>{t.set(r.subarray(0,e),e*n)})),tp.prototype.visitDate=np(((e,t,n)=>{e.type.unit===Pf.DAY?lp(e,t,n):up(e,t,n)})),tp.prototype.visitDateDay=np(lp),tp.prototype.visitDateMillisecond=np(up),tp.prototype.visitTimestamp=np(((e,t,n)=>{switch(e.type.unit){case Rf.SECOND:return cp(e,t,n);case Rf.MILLISECOND:return dp(e,t,n);case Rf.MICROSECOND:return fp(e,t,n);case Rf.NANOSECOND:return hp(e,t,n)}})),tp.prototype.visitTimestampSecond=np(cp),tp.prototype.visitTimestampMillisecond=np(dp),tp.prototype.visitTimestampMicrosecond=np(fp),tp.prototype.visitTimestampNanosecond=np(hp),tp.prototype.visitTime=np(((e,t,n)=>{switch(e.type.unit){case Rf.SECOND:return pp(e,t,n);case Rf.MILLISECOND:return yp(e,t,n);case Rf.MICROSECOND:return bp(e,t,n);case Rf.NANOSECOND:return mp(e,t,n)}})),tp.prototype.visitTimeSecond=np(pp),tp.prototype.visitTimeMillisecond=np(yp),tp.prototype.visitTimeMicrosecond=np(bp),tp.prototype.visitTimeNanosecond=np(mp),tp.prototype.visitDecimal=np((({values:e,stride:t},n,r)=>{e.set(r.subarray(0,t),t*n)})),tp.prototype.visitList=np(((e,t,n)=>{const r=e.children[0],i=e.valueOffsets,s=Sp.getVisitFn(r);if(Array.isArray(n))for(let o=-1,a=i[t],l=i[t+1];a<l;)s(r,a++,n[++o]);else for(let o=-1,a=i[t],l=i[t+1];a<l;)s(r,a++,n.get(++o))})),tp.prototype.visitStruct=np(((e,t,n)=>{const r=e.type.children.map((e=>Sp.getVisitFn(e.type))),i=n instanceof Map?(s=t,o=n,(e,t,n,r)=>t&&e(t,s,o.get(n.name))):n instanceof jy?((e,t)=>(n,r,i,s)=>r&&n(r,e,t.get(s)))(t,n):Array.isArray(n)?((e,t)=>(n,r,i,s)=>r&&n(r,e,t[s]))(t,n):((e,t)=>(n,r,i,s)=>r&&n(r,e,t[i.name]))(t,n);var s,o;e.type.children.forEach(((t,n)=>i(r[n],e.children[n],t,n)))})),tp.prototype.visitUnion=np(((e,t,n)=>{e.type.mode===Af.Dense?gp(e,t,n):vp(e,t,n)})),tp.prototype.visitDenseUnion=np(gp),tp.prototype.visitSparseUnion=np(vp),tp.prototype.visitDictionary=np(((e,t,n)=>{var r;null===(r=e.dictionary)||void 0===r||r.set(e.values[t],n)})),tp.prototype.visitInterval=np(((e,t,n)=>{e.type.unit===jf.DAY_TIME?wp(e,t,n):_p(e,t,n)})),tp.prototype.visitIntervalDayTime=np(wp),tp.prototype.visitIntervalYearMonth=np(_p),tp.prototype.visitFixedSizeList=np(((e,t,n)=>{const{stride:r}=e,i=e.children[0],s=Sp.getVisitFn(i);if(Array.isArray(n))for(let o=-1,a=t*r;++o<r;)s(i,a+o,n[o]);else for(let o=-1,a=t*r;++o<r;)s(i,a+o,n.get(o))})),tp.prototype.visitMap=np(((e,t,n)=>{const r=e.children[0],{valueOffsets:i}=e,s=Sp.getVisitFn(r);let{[t]:o,[t+1]:a}=i;const l=n instanceof Map?n.entries():Object.entries(n);for(const u of l)if(s(r,o,u),++o>=a)break}));const Sp=new tp,Ip=Symbol.for("parent"),xp=Symbol.for("rowIndex");class kp{constructor(e,t){return this[Ip]=e,this[xp]=t,new Proxy(this,new Cp)}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[xp],t=this[Ip],n=t.type.children,r={};for(let i=-1,s=n.length;++i<s;)r[n[i].name]=qp.visit(t.children[i],e);return r}toString(){return`{${[...this].map((([e,t])=>`${Jf(e)}: ${Jf(t)}`)).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new Tp(this[Ip],this[xp])}}class Tp{constructor(e,t){this.childIndex=0,this.children=e.children,this.rowIndex=t,this.childFields=e.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){const e=this.childIndex;return e<this.numChildren?(this.childIndex=e+1,{done:!1,value:[this.childFields[e].name,qp.visit(this.children[e],this.rowIndex)]}):{done:!0,value:null}}}Object.defineProperties(kp.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Ip]:{writable:!0,enumerable:!1,configurable:!1,value:null},[xp]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});class Cp{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[Ip].type.children.map((e=>e.name))}has(e,t){return-1!==e[Ip].type.children.findIndex((e=>e.name===t))}getOwnPropertyDescriptor(e,t){if(-1!==e[Ip].type.children.findIndex((e=>e.name===t)))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[Ip].type.children.findIndex((e=>e.name===t));if(-1!==n){const r=qp.visit(e[Ip].children[n],e[xp]);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[Ip].type.children.findIndex((e=>e.name===t));return-1!==r?(Sp.visit(e[Ip].children[r],e[xp],n),Reflect.set(e,t,n)):!(!Reflect.has(e,t)&&"symbol"!=typeof t)&&Reflect.set(e,t,n)}}class Ep extends qh{}function Op(e){return(t,n)=>t.getValid(n)?e(t,n):null}const Bp=(e,t)=>4294967296*e[t+1]+(e[t]>>>0),Dp=e=>new Date(e),Np=(e,t,n)=>{if(n+1>=t.length)return null;const r=t[n],i=t[n+1];return e.subarray(r,i)},Mp=({values:e},t)=>((e,t)=>Dp(((e,t)=>864e5*e[t])(e,t)))(e,t),Ap=({values:e},t)=>((e,t)=>Dp(Bp(e,t)))(e,2*t),Fp=({stride:e,values:t},n)=>t[e*n],Lp=({values:e},t)=>e[t],Up=({values:e},t)=>1e3*Bp(e,2*t),Pp=({values:e},t)=>Bp(e,2*t),zp=({values:e},t)=>((e,t)=>e[t+1]/1e3*4294967296+(e[t]>>>0)/1e3)(e,2*t),Rp=({values:e},t)=>((e,t)=>e[t+1]/1e6*4294967296+(e[t]>>>0)/1e6)(e,2*t),Vp=({values:e},t)=>e[t],jp=({values:e},t)=>e[t],$p=({values:e},t)=>e[t],Wp=({values:e},t)=>e[t],Hp=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return qp.visit(r,e.valueOffsets[t])},Yp=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return qp.visit(r,t)},Qp=({values:e},t)=>e.subarray(2*t,2*(t+1)),Kp=({values:e},t)=>{const n=e[t],r=new Int32Array(2);return r[0]=Math.trunc(n/12),r[1]=Math.trunc(n%12),r};Ep.prototype.visitNull=Op(((e,t)=>null)),Ep.prototype.visitBool=Op((({offset:e,values:t},n)=>{const r=e+n;return!!(t[r>>3]&1<<r%8)})),Ep.prototype.visitInt=Op((({values:e},t)=>e[t])),Ep.prototype.visitInt8=Op(Fp),Ep.prototype.visitInt16=Op(Fp),Ep.prototype.visitInt32=Op(Fp),Ep.prototype.visitInt64=Op(Lp),Ep.prototype.visitUint8=Op(Fp),Ep.prototype.visitUint16=Op(Fp),Ep.prototype.visitUint32=Op(Fp),Ep.prototype.visitUint64=Op(Lp),Ep.prototype.visitFloat=Op((({type:e,values:t},n)=>e.precision!==Lf.HALF?t[n]:ep(t[n]))),Ep.prototype.visitFloat16=Op((({stride:e,values:t},n)=>ep(t[e*n]))),Ep.prototype.visitFloat32=Op(Fp),Ep.prototype.visitFloat64=Op(Fp),Ep.prototype.visitUtf8=Op((({values:e,valueOffsets:t},n)=>{const r=Np(e,t,n);return null!==r?Kd(r):null})),Ep.prototype.visitBinary=Op((({values:e,valueOffsets:t},n)=>Np(e,t,n))),Ep.prototype.visitFixedSizeBinary=Op((({stride:e,values:t},n)=>t.subarray(e*n,e*(n+1)))),Ep.prototype.visitDate=Op(((e,t)=>e.type.unit===Pf.DAY?Mp(e,t):Ap(e,t))),Ep.prototype.visitDateDay=Op(Mp),Ep.prototype.visitDateMillisecond=Op(Ap),Ep.prototype.visitTimestamp=Op(((e,t)=>{switch(e.type.unit){case Rf.SECOND:return Up(e,t);case Rf.MILLISECOND:return Pp(e,t);case Rf.MICROSECOND:return zp(e,t);case Rf.NANOSECOND:return Rp(e,t)}})),Ep.prototype.visitTimestampSecond=Op(Up),Ep.prototype.visitTimestampMillisecond=Op(Pp),Ep.prototype.visitTimestampMicrosecond=Op(zp),Ep.prototype.visitTimestampNanosecond=Op(Rp),Ep.prototype.visitTime=Op(((e,t)=>{switch(e.type.unit){case Rf.SECOND:return Vp(e,t);case Rf.MILLISECOND:return jp(e,t);case Rf.MICROSECOND:return $p(e,t);case Rf.NANOSECOND:return Wp(e,t)}})),Ep.prototype.visitTimeSecond=Op(Vp),Ep.prototype.visitTimeMillisecond=Op(jp),Ep.prototype.visitTimeMicrosecond=Op($p),Ep.prototype.visitTimeNanosecond=Op(Wp),Ep.prototype.visitDecimal=Op((({values:e,stride:t},n)=>oh.decimal(e.subarray(t*n,t*(n+1))))),Ep.prototype.visitList=Op(((e,t)=>{const{valueOffsets:n,stride:r,children:i}=e,{[t*r]:s,[t*r+1]:o}=n,a=i[0].slice(s,o-s);return new jy([a])})),Ep.prototype.visitStruct=Op(((e,t)=>new kp(e,t))),Ep.prototype.visitUnion=Op(((e,t)=>e.type.mode===Af.Dense?Hp(e,t):Yp(e,t))),Ep.prototype.visitDenseUnion=Op(Hp),Ep.prototype.visitSparseUnion=Op(Yp),Ep.prototype.visitDictionary=Op(((e,t)=>{var n;return null===(n=e.dictionary)||void 0===n?void 0:n.get(e.values[t])})),Ep.prototype.visitInterval=Op(((e,t)=>e.type.unit===jf.DAY_TIME?Qp(e,t):Kp(e,t))),Ep.prototype.visitIntervalDayTime=Op(Qp),Ep.prototype.visitIntervalYearMonth=Op(Kp),Ep.prototype.visitFixedSizeList=Op(((e,t)=>{const{stride:n,children:r}=e,i=r[0].slice(t*n,n);return new jy([i])})),Ep.prototype.visitMap=Op(((e,t)=>{const{valueOffsets:n,children:r}=e,{[t]:i,[t+1]:s}=n,o=r[0];return new Xp(o.slice(i,s-i))}));const qp=new Ep,Jp=Symbol.for("keys"),Gp=Symbol.for("vals");class Xp{constructor(e){return this[Jp]=new jy([e.children[0]]).memoize(),this[Gp]=e.children[1],new Proxy(this,new ey)}[Symbol.iterator](){return new Zp(this[Jp],this[Gp])}get size(){return this[Jp].length}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[Jp],t=this[Gp],n={};for(let r=-1,i=e.length;++r<i;)n[e.get(r)]=qp.visit(t,r);return n}toString(){return`{${[...this].map((([e,t])=>`${Jf(e)}: ${Jf(t)}`)).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}}class Zp{constructor(e,t){this.keys=e,this.vals=t,this.keyIndex=0,this.numKeys=e.length}[Symbol.iterator](){return this}next(){const e=this.keyIndex;return e===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(e),qp.visit(this.vals,e)]})}}class ey{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[Jp].toArray().map(String)}has(e,t){return e[Jp].includes(t)}getOwnPropertyDescriptor(e,t){if(-1!==e[Jp].indexOf(t))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[Jp].indexOf(t);if(-1!==n){const r=qp.visit(Reflect.get(e,Gp),n);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[Jp].indexOf(t);return-1!==r?(Sp.visit(Reflect.get(e,Gp),r,n),Reflect.set(e,t,n)):!!Reflect.has(e,t)&&Reflect.set(e,t,n)}}let ty;function ny(e,t,n,r){const{length:i=0}=e;let s="number"!=typeof t?0:t,o="number"!=typeof n?i:n;return s<0&&(s=(s%i+i)%i),o<0&&(o=(o%i+i)%i),o<s&&(ty=s,s=o,o=ty),o>i&&(o=i),r?r(e,s,o):[s,o]}Object.defineProperties(Xp.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Jp]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Gp]:{writable:!0,enumerable:!1,configurable:!1,value:null}});const ry=e=>e!=e;function iy(e){if("object"!==typeof e||null===e)return ry(e)?ry:t=>t===e;if(e instanceof Date){const t=e.valueOf();return e=>e instanceof Date&&e.valueOf()===t}return ArrayBuffer.isView(e)?t=>!!t&&function(e,t){let n=0;const r=e.length;if(r!==t.length)return!1;if(r>0)do{if(e[n]!==t[n])return!1}while(++n<r);return!0}(e,t):e instanceof Map?function(e){let t=-1;const n=[];for(const r of e.values())n[++t]=iy(r);return sy(n)}(e):Array.isArray(e)?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=iy(e[n]);return sy(t)}(e):e instanceof jy?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=iy(e.get(n));return sy(t)}(e):function(e,t=!1){const n=Object.keys(e);if(!t&&0===n.length)return()=>!1;const r=[];for(let i=-1,s=n.length;++i<s;)r[i]=iy(e[n[i]]);return sy(r,n)}(e,!0)}function sy(e,t){return n=>{if(!n||"object"!=typeof n)return!1;switch(n.constructor){case Array:return function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t[r]))return!1;return!0}(e,n);case Map:return oy(e,n,n.keys());case Xp:case kp:case Object:case void 0:return oy(e,n,t||Object.keys(n))}return n instanceof jy&&function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t.get(r)))return!1;return!0}(e,n)}}function oy(e,t,n){const r=n[Symbol.iterator](),i=t instanceof Map?t.keys():Object.keys(t)[Symbol.iterator](),s=t instanceof Map?t.values():Object.values(t)[Symbol.iterator]();let o=0;const a=e.length;let l=s.next(),u=r.next(),c=i.next();for(;o<a&&!u.done&&!c.done&&!l.done&&(u.value===c.value&&e[o](l.value));++o,u=r.next(),c=i.next(),l=s.next());return!!(o===a&&u.done&&c.done&&l.done)||(r.return&&r.return(),i.return&&i.return(),s.return&&s.return(),!1)}function ay(e,t,n,r){return!!(n&1<<r)}function ly(e,t,n,r){return(n&1<<r)>>r}function uy(e,t,n){const r=n.byteLength+7&-8;if(e>0||n.byteLength<r){const i=new Uint8Array(r);return i.set(e%8==0?n.subarray(e>>3):cy(new dy(n,e,t,null,ay)).subarray(0,r)),i}return n}function cy(e){const t=[];let n=0,r=0,i=0;for(const o of e)o&&(i|=1<<r),8===++r&&(t[n++]=i,i=r=0);(0===n||r>0)&&(t[n++]=i);const s=new Uint8Array(t.length+7&-8);return s.set(t),s}class dy{constructor(e,t,n,r,i){this.bytes=e,this.length=n,this.context=r,this.get=i,this.bit=t%8,this.byteIndex=t>>3,this.byte=e[this.byteIndex++],this.index=0}next(){return this.index<this.length?(8===this.bit&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}}function fy(e,t,n){if(n-t<=0)return 0;if(n-t<8){let r=0;for(const i of new dy(e,t,n-t,e,ly))r+=i;return r}const r=n>>3<<3,i=t+(t%8==0?0:8-t%8);return fy(e,t,i)+fy(e,r,n)+function(e,t,n){let r=0,i=Math.trunc(t);const s=new DataView(e.buffer,e.byteOffset,e.byteLength),o=void 0===n?e.byteLength:i+n;for(;o-i>=4;)r+=hy(s.getUint32(i)),i+=4;for(;o-i>=2;)r+=hy(s.getUint16(i)),i+=2;for(;o-i>=1;)r+=hy(s.getUint8(i)),i+=1;return r}(e,i>>3,r-i>>3)}function hy(e){let t=Math.trunc(e);return t-=t>>>1&1431655765,t=(858993459&t)+(t>>>2&858993459),16843009*(t+(t>>>4)&252645135)>>>24}class py{constructor(e,t,n,r,i,s=[],o){let a;this.type=e,this.children=s,this.dictionary=o,this.offset=Math.floor(Math.max(t||0,0)),this.length=Math.floor(Math.max(n||0,0)),this._nullCount=Math.floor(Math.max(r||0,-1)),i instanceof py?(this.stride=i.stride,this.values=i.values,this.typeIds=i.typeIds,this.nullBitmap=i.nullBitmap,this.valueOffsets=i.valueOffsets):(this.stride=Kh(e),i&&((a=i[0])&&(this.valueOffsets=a),(a=i[1])&&(this.values=a),(a=i[2])&&(this.nullBitmap=a),(a=i[3])&&(this.typeIds=a))),this.nullable=0!==this._nullCount&&this.nullBitmap&&this.nullBitmap.byteLength>0}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let e=0;const{valueOffsets:t,values:n,nullBitmap:r,typeIds:i}=this;return t&&(e+=t.byteLength),n&&(e+=n.byteLength),r&&(e+=r.byteLength),i&&(e+=i.byteLength),this.children.reduce(((e,t)=>e+t.byteLength),e)}get nullCount(){let e,t=this._nullCount;return t<=-1&&(e=this.nullBitmap)&&(this._nullCount=t=this.length-fy(e,this.offset,this.offset+this.length)),t}getValid(e){if(this.nullable&&this.nullCount>0){const t=this.offset+e;return!!(this.nullBitmap[t>>3]&1<<t%8)}return!0}setValid(e,t){if(!this.nullable)return t;if(!this.nullBitmap||this.nullBitmap.byteLength<=e>>3){const{nullBitmap:e}=this._changeLengthAndBackfillNullBitmap(this.length);Object.assign(this,{nullBitmap:e,_nullCount:0})}const{nullBitmap:n,offset:r}=this,i=r+e>>3,s=(r+e)%8,o=n[i]>>s&1;return t?0===o&&(n[i]|=1<<s,this._nullCount=this.nullCount+1):1===o&&(n[i]&=~(1<<s),this._nullCount=this.nullCount-1),t}clone(e=this.type,t=this.offset,n=this.length,r=this._nullCount,i=this,s=this.children){return new py(e,t,n,r,i,s,this.dictionary)}slice(e,t){const{stride:n,typeId:r,children:i}=this,s=+(0===this._nullCount)-1,o=16===r?n:1,a=this._sliceBuffers(e,t,n,r);return this.clone(this.type,this.offset+e,t,s,a,0===i.length||this.valueOffsets?i:this._sliceChildren(i,o*e,o*t))}_changeLengthAndBackfillNullBitmap(e){if(this.typeId===Yf.Null)return this.clone(this.type,0,e,0);const{length:t,nullCount:n}=this,r=new Uint8Array((e+63&-64)>>3).fill(255,0,t>>3);r[t>>3]=(1<<t-(-8&t))-1,n>0&&r.set(uy(this.offset,t,this.nullBitmap),0);const i=this.buffers;return i[Kf.VALIDITY]=r,this.clone(this.type,0,e,n+(e-t),i)}_sliceBuffers(e,t,n,r){let i;const{buffers:s}=this;return(i=s[Kf.TYPE])&&(s[Kf.TYPE]=i.subarray(e,e+t)),(i=s[Kf.OFFSET])&&(s[Kf.OFFSET]=i.subarray(e,e+t+1))||(i=s[Kf.DATA])&&(s[Kf.DATA]=6===r?i:i.subarray(n*e,n*(e+t))),s}_sliceChildren(e,t,n){return e.map((e=>e.slice(t,n)))}}py.prototype.children=Object.freeze([]);class yy extends qh{visit(e){return this.getVisitFn(e.type).call(this,e)}visitNull(e){const{type:t,offset:n=0,length:r=0}=e;return new py(t,n,r,0)}visitBool(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.ArrayType,e.data),{length:s=i.length>>3,nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,i,r])}visitInt(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.ArrayType,e.data),{length:s=i.length,nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,i,r])}visitFloat(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.ArrayType,e.data),{length:s=i.length,nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,i,r])}visitUtf8(e){const{type:t,offset:n=0}=e,r=Sf(e.data),i=Sf(e.nullBitmap),s=_f(e.valueOffsets),{length:o=s.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new py(t,n,o,a,[s,r,i])}visitBinary(e){const{type:t,offset:n=0}=e,r=Sf(e.data),i=Sf(e.nullBitmap),s=_f(e.valueOffsets),{length:o=s.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new py(t,n,o,a,[s,r,i])}visitFixedSizeBinary(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.ArrayType,e.data),{length:s=i.length/Kh(t),nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,i,r])}visitDate(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.ArrayType,e.data),{length:s=i.length/Kh(t),nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,i,r])}visitTimestamp(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.ArrayType,e.data),{length:s=i.length/Kh(t),nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,i,r])}visitTime(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.ArrayType,e.data),{length:s=i.length/Kh(t),nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,i,r])}visitDecimal(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.ArrayType,e.data),{length:s=i.length/Kh(t),nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,i,r])}visitList(e){const{type:t,offset:n=0,child:r}=e,i=Sf(e.nullBitmap),s=_f(e.valueOffsets),{length:o=s.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new py(t,n,o,a,[s,void 0,i],[r])}visitStruct(e){const{type:t,offset:n=0,children:r=[]}=e,i=Sf(e.nullBitmap),{length:s=r.reduce(((e,{length:t})=>Math.max(e,t)),0),nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,void 0,i],r)}visitUnion(e){const{type:t,offset:n=0,children:r=[]}=e,i=Sf(e.nullBitmap),s=wf(t.ArrayType,e.typeIds),{length:o=s.length,nullCount:a=(e.nullBitmap?-1:0)}=e;if(Ch.isSparseUnion(t))return new py(t,n,o,a,[void 0,void 0,i,s],r);const l=_f(e.valueOffsets);return new py(t,n,o,a,[l,void 0,i,s],r)}visitDictionary(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.indices.ArrayType,e.data),{dictionary:s=new jy([(new yy).visit({type:t.dictionary})])}=e,{length:o=i.length,nullCount:a=(e.nullBitmap?-1:0)}=e;return new py(t,n,o,a,[void 0,i,r],[],s)}visitInterval(e){const{type:t,offset:n=0}=e,r=Sf(e.nullBitmap),i=wf(t.ArrayType,e.data),{length:s=i.length/Kh(t),nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,i,r])}visitFixedSizeList(e){const{type:t,offset:n=0,child:r=(new yy).visit({type:t.valueType})}=e,i=Sf(e.nullBitmap),{length:s=r.length/Kh(t),nullCount:o=(e.nullBitmap?-1:0)}=e;return new py(t,n,s,o,[void 0,void 0,i],[r])}visitMap(e){const{type:t,offset:n=0,child:r=(new yy).visit({type:t.childType})}=e,i=Sf(e.nullBitmap),s=_f(e.valueOffsets),{length:o=s.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new py(t,n,o,a,[s,void 0,i],[r])}}function by(e){return(new yy).visit(e)}class my{constructor(e=0,t){this.numChunks=e,this.getChunkIterator=t,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){const e=this.chunkIterator.next();if(!e.done)return e;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}}function gy(e){return e.reduce(((e,t)=>e+t.nullCount),0)}function vy(e){return e.reduce(((e,t,n)=>(e[n+1]=e[n]+t.length,e)),new Uint32Array(e.length+1))}function wy(e,t,n,r){const i=[];for(let s=-1,o=e.length;++s<o;){const o=e[s],a=t[s],{length:l}=o;if(a>=r)break;if(n>=a+l)continue;if(a>=n&&a+l<=r){i.push(o);continue}const u=Math.max(0,n-a),c=Math.min(r-a,l);i.push(o.slice(u,c-u))}return 0===i.length&&i.push(e[0].slice(0,0)),i}function _y(e,t,n,r){let i=0,s=0,o=t.length-1;do{if(i>=o-1)return n<t[o]?r(e,i,n-t[i]):null;s=i+Math.trunc(.5*(o-i)),n<t[s]?o=s:i=s}while(i<o)}function Sy(e,t){return e.getValid(t)}function Iy(e){function t(t,n,r){return e(t[n],r)}return function(e){return _y(this.data,this._offsets,e,t)}}function xy(e){let t;function n(n,r,i){return e(n[r],i,t)}return function(e,r){const i=this.data;t=r;const s=_y(i,this._offsets,e,n);return t=void 0,s}}function ky(e){let t;function n(n,r,i){let s=i,o=0,a=0;for(let l=r-1,u=n.length;++l<u;){const r=n[l];if(~(o=e(r,t,s)))return a+o;s=0,a+=r.length}return-1}return function(e,r){t=e;const i=this.data,s="number"!=typeof r?n(i,0,0):_y(i,this._offsets,r,n);return t=void 0,s}}class Ty extends qh{}function Cy(e,t,n){if(void 0===t)return-1;if(null===t)return function(e,t){const{nullBitmap:n}=e;if(!n||e.nullCount<=0)return-1;let r=0;for(const i of new dy(n,e.offset+(t||0),e.length,n,ay)){if(!i)return r;++r}return-1}(e,n);const r=qp.getVisitFn(e),i=iy(t);for(let s=(n||0)-1,o=e.length;++s<o;)if(i(r(e,s)))return s;return-1}function Ey(e,t,n){const r=qp.getVisitFn(e),i=iy(t);for(let s=(n||0)-1,o=e.length;++s<o;)if(i(r(e,s)))return s;return-1}Ty.prototype.visitNull=function(e,t){return null===t&&e.length>0?0:-1},Ty.prototype.visitBool=Cy,Ty.prototype.visitInt=Cy,Ty.prototype.visitInt8=Cy,Ty.prototype.visitInt16=Cy,Ty.prototype.visitInt32=Cy,Ty.prototype.visitInt64=Cy,Ty.prototype.visitUint8=Cy,Ty.prototype.visitUint16=Cy,Ty.prototype.visitUint32=Cy,Ty.prototype.visitUint64=Cy,Ty.prototype.visitFloat=Cy,Ty.prototype.visitFloat16=Cy,Ty.prototype.visitFloat32=Cy,Ty.prototype.visitFloat64=Cy,Ty.prototype.visitUtf8=Cy,Ty.prototype.visitBinary=Cy,Ty.prototype.visitFixedSizeBinary=Cy,Ty.prototype.visitDate=Cy,Ty.prototype.visitDateDay=Cy,Ty.prototype.visitDateMillisecond=Cy,Ty.prototype.visitTimestamp=Cy,Ty.prototype.visitTimestampSecond=Cy,Ty.prototype.visitTimestampMillisecond=Cy,Ty.prototype.visitTimestampMicrosecond=Cy,Ty.prototype.visitTimestampNanosecond=Cy,Ty.prototype.visitTime=Cy,Ty.prototype.visitTimeSecond=Cy,Ty.prototype.visitTimeMillisecond=Cy,Ty.prototype.visitTimeMicrosecond=Cy,Ty.prototype.visitTimeNanosecond=Cy,Ty.prototype.visitDecimal=Cy,Ty.prototype.visitList=Cy,Ty.prototype.visitStruct=Cy,Ty.prototype.visitUnion=Cy,Ty.prototype.visitDenseUnion=Ey,Ty.prototype.visitSparseUnion=Ey,Ty.prototype.visitDictionary=Cy,Ty.prototype.visitInterval=Cy,Ty.prototype.visitIntervalDayTime=Cy,Ty.prototype.visitIntervalYearMonth=Cy,Ty.prototype.visitFixedSizeList=Cy,Ty.prototype.visitMap=Cy;const Oy=new Ty;class By extends qh{}function Dy(e){const{type:t}=e;if(0===e.nullCount&&1===e.stride&&(t.typeId===Yf.Timestamp||t instanceof Oh&&64!==t.bitWidth||t instanceof Uh&&64!==t.bitWidth||t instanceof Dh&&t.precision!==Lf.HALF))return new my(e.data.length,(t=>{const n=e.data[t];return n.values.subarray(0,n.length)[Symbol.iterator]()}));let n=0;return new my(e.data.length,(t=>{const r=e.data[t].length,i=e.slice(n,n+r);return n+=r,new Ny(i)}))}class Ny{constructor(e){this.vector=e,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}}By.prototype.visitNull=Dy,By.prototype.visitBool=Dy,By.prototype.visitInt=Dy,By.prototype.visitInt8=Dy,By.prototype.visitInt16=Dy,By.prototype.visitInt32=Dy,By.prototype.visitInt64=Dy,By.prototype.visitUint8=Dy,By.prototype.visitUint16=Dy,By.prototype.visitUint32=Dy,By.prototype.visitUint64=Dy,By.prototype.visitFloat=Dy,By.prototype.visitFloat16=Dy,By.prototype.visitFloat32=Dy,By.prototype.visitFloat64=Dy,By.prototype.visitUtf8=Dy,By.prototype.visitBinary=Dy,By.prototype.visitFixedSizeBinary=Dy,By.prototype.visitDate=Dy,By.prototype.visitDateDay=Dy,By.prototype.visitDateMillisecond=Dy,By.prototype.visitTimestamp=Dy,By.prototype.visitTimestampSecond=Dy,By.prototype.visitTimestampMillisecond=Dy,By.prototype.visitTimestampMicrosecond=Dy,By.prototype.visitTimestampNanosecond=Dy,By.prototype.visitTime=Dy,By.prototype.visitTimeSecond=Dy,By.prototype.visitTimeMillisecond=Dy,By.prototype.visitTimeMicrosecond=Dy,By.prototype.visitTimeNanosecond=Dy,By.prototype.visitDecimal=Dy,By.prototype.visitList=Dy,By.prototype.visitStruct=Dy,By.prototype.visitUnion=Dy,By.prototype.visitDenseUnion=Dy,By.prototype.visitSparseUnion=Dy,By.prototype.visitDictionary=Dy,By.prototype.visitInterval=Dy,By.prototype.visitIntervalDayTime=Dy,By.prototype.visitIntervalYearMonth=Dy,By.prototype.visitFixedSizeList=Dy,By.prototype.visitMap=Dy;const My=new By,Ay=(e,t)=>e+t;class Fy extends qh{visitNull(e,t){return 0}visitInt(e,t){return e.type.bitWidth/8}visitFloat(e,t){return e.type.ArrayType.BYTES_PER_ELEMENT}visitBool(e,t){return 1/8}visitDecimal(e,t){return e.type.bitWidth/8}visitDate(e,t){return 4*(e.type.unit+1)}visitTime(e,t){return e.type.bitWidth/8}visitTimestamp(e,t){return e.type.unit===Rf.SECOND?4:8}visitInterval(e,t){return 4*(e.type.unit+1)}visitStruct(e,t){return e.children.reduce(((e,n)=>e+Py.visit(n,t)),0)}visitFixedSizeBinary(e,t){return e.type.byteWidth}visitMap(e,t){return 8+e.children.reduce(((e,n)=>e+Py.visit(n,t)),0)}visitDictionary(e,t){var n;return e.type.indices.bitWidth/8+((null===(n=e.dictionary)||void 0===n?void 0:n.getByteLength(e.values[t]))||0)}}const Ly=({type:e,children:t,typeIds:n,valueOffsets:r},i)=>{const s=e.typeIdToChildIndex[n[i]];return 8+Py.visit(t[s],r[i])},Uy=({children:e},t)=>4+Py.visitMany(e,e.map((()=>t))).reduce(Ay,0);Fy.prototype.visitUtf8=({valueOffsets:e},t)=>e[t+1]-e[t]+8,Fy.prototype.visitBinary=({valueOffsets:e},t)=>e[t+1]-e[t]+8,Fy.prototype.visitList=({valueOffsets:e,stride:t,children:n},r)=>{const i=n[0],{[r*t]:s}=e,{[r*t+1]:o}=e,a=Py.getVisitFn(i.type),l=i.slice(s,o-s);let u=8;for(let c=-1,d=o-s;++c<d;)u+=a(l,c);return u},Fy.prototype.visitFixedSizeList=({stride:e,children:t},n)=>{const r=t[0],i=r.slice(n*e,e),s=Py.getVisitFn(r.type);let o=0;for(let a=-1,l=i.length;++a<l;)o+=s(i,a);return o},Fy.prototype.visitUnion=(e,t)=>e.type.mode===Af.Dense?Ly(e,t):Uy(e,t),Fy.prototype.visitDenseUnion=Ly,Fy.prototype.visitSparseUnion=Uy;const Py=new Fy;var zy;const Ry={},Vy={};class jy{constructor(e){var t,n,r;const i=e[0]instanceof jy?e.flatMap((e=>e.data)):e;if(0===i.length||i.some((e=>!(e instanceof py))))throw new TypeError("Vector constructor expects an Array of Data instances.");const s=null===(t=i[0])||void 0===t?void 0:t.type;switch(i.length){case 0:this._offsets=[0];break;case 1:{const{get:e,set:t,indexOf:n,byteLength:r}=Ry[s.typeId],o=i[0];this.isValid=e=>Sy(o,e),this.get=t=>e(o,t),this.set=(e,n)=>t(o,e,n),this.indexOf=e=>n(o,e),this.getByteLength=e=>r(o,e),this._offsets=[0,o.length];break}default:Object.setPrototypeOf(this,Vy[s.typeId]),this._offsets=vy(i)}this.data=i,this.type=s,this.stride=Kh(s),this.numChildren=null!==(r=null===(n=s.children)||void 0===n?void 0:n.length)&&void 0!==r?r:0,this.length=this._offsets[this._offsets.length-1]}get byteLength(){return-1===this._byteLength&&(this._byteLength=this.data.reduce(((e,t)=>e+t.byteLength),0)),this._byteLength}get nullCount(){return-1===this._nullCount&&(this._nullCount=gy(this.data)),this._nullCount}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}get VectorName(){return`${Yf[this.type.typeId]}Vector`}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}includes(e,t){return this.indexOf(e,t)>0}getByteLength(e){return 0}[Symbol.iterator](){return My.visit(this)}concat(...e){return new jy(this.data.concat(e.flatMap((e=>e.data)).flat(Number.POSITIVE_INFINITY)))}slice(e,t){return new jy(ny(this,e,t,(({data:e,_offsets:t},n,r)=>wy(e,t,n,r))))}toJSON(){return[...this]}toArray(){const{type:e,data:t,length:n,stride:r,ArrayType:i}=this;switch(e.typeId){case Yf.Int:case Yf.Float:case Yf.Decimal:case Yf.Time:case Yf.Timestamp:switch(t.length){case 0:return new i;case 1:return t[0].values.subarray(0,n*r);default:return t.reduce(((e,{values:t,length:n})=>(e.array.set(t.subarray(0,n*r),e.offset),e.offset+=n*r,e)),{array:new i(n*r),offset:0}).array}}return[...this]}toString(){return`[${[...this].join(",")}]`}getChild(e){var t;return this.getChildAt(null===(t=this.type.children)||void 0===t?void 0:t.findIndex((t=>t.name===e)))}getChildAt(e){return e>-1&&e<this.numChildren?new jy(this.data.map((({children:t})=>t[e]))):null}get isMemoized(){return!!Ch.isDictionary(this.type)&&this.data[0].dictionary.isMemoized}memoize(){if(Ch.isDictionary(this.type)){const e=new $y(this.data[0].dictionary),t=this.data.map((t=>{const n=t.clone();return n.dictionary=e,n}));return new jy(t)}return new $y(this)}unmemoize(){if(Ch.isDictionary(this.type)&&this.isMemoized){const e=this.data[0].dictionary.unmemoize(),t=this.data.map((t=>{const n=t.clone();return n.dictionary=e,n}));return new jy(t)}return this}}zy=Symbol.toStringTag,jy[zy]=(e=>{e.type=Ch.prototype,e.data=[],e.length=0,e.stride=1,e.numChildren=0,e._nullCount=-1,e._byteLength=-1,e._offsets=new Uint32Array([0]),e[Symbol.isConcatSpreadable]=!0;const t=Object.keys(Yf).map((e=>Yf[e])).filter((e=>"number"==typeof e&&e!==Yf.NONE));for(const n of t){const t=qp.getVisitFnByTypeId(n),r=Sp.getVisitFnByTypeId(n),i=Oy.getVisitFnByTypeId(n),s=Py.getVisitFnByTypeId(n);Ry[n]={get:t,set:r,indexOf:i,byteLength:s},Vy[n]=Object.create(e,{isValid:{value:Iy(Sy)},get:{value:Iy(qp.getVisitFnByTypeId(n))},set:{value:xy(Sp.getVisitFnByTypeId(n))},indexOf:{value:ky(Oy.getVisitFnByTypeId(n))},getByteLength:{value:Iy(Py.getVisitFnByTypeId(n))}})}return"Vector"})(jy.prototype);class $y extends jy{constructor(e){super(e.data);const t=this.get,n=this.set,r=this.slice,i=new Array(this.length);Object.defineProperty(this,"get",{value(e){const n=i[e];if(void 0!==n)return n;const r=t.call(this,e);return i[e]=r,r}}),Object.defineProperty(this,"set",{value(e,t){n.call(this,e,t),i[e]=t}}),Object.defineProperty(this,"slice",{value:(e,t)=>new $y(r.call(this,e,t))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new jy(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}}class Wy{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static sizeOf(){return 24}static createBlock(e,t,n,r){return e.prep(8,24),e.writeInt64(r),e.pad(4),e.writeInt32(n),e.writeInt64(t),e.offset()}}const Hy=new Int32Array(2),Yy=new Float32Array(Hy.buffer),Qy=new Float64Array(Hy.buffer),Ky=1===new Uint16Array(new Uint8Array([1,0]).buffer)[0];let qy=class e{constructor(e,t){this.low=0|e,this.high=0|t}static create(t,n){return 0==t&&0==n?e.ZERO:new e(t,n)}toFloat64(){return(this.low>>>0)+4294967296*this.high}equals(e){return this.low==e.low&&this.high==e.high}};var Jy,Gy;qy.ZERO=new qy(0,0),(Gy=Jy||(Jy={}))[Gy.UTF8_BYTES=1]="UTF8_BYTES",Gy[Gy.UTF16_STRING=2]="UTF16_STRING";let Xy=class e{constructor(e){this.bytes_=e,this.position_=0}static allocate(t){return new e(new Uint8Array(t))}clear(){this.position_=0}bytes(){return this.bytes_}position(){return this.position_}setPosition(e){this.position_=e}capacity(){return this.bytes_.length}readInt8(e){return this.readUint8(e)<<24>>24}readUint8(e){return this.bytes_[e]}readInt16(e){return this.readUint16(e)<<16>>16}readUint16(e){return this.bytes_[e]|this.bytes_[e+1]<<8}readInt32(e){return this.bytes_[e]|this.bytes_[e+1]<<8|this.bytes_[e+2]<<16|this.bytes_[e+3]<<24}readUint32(e){return this.readInt32(e)>>>0}readInt64(e){return new qy(this.readInt32(e),this.readInt32(e+4))}readUint64(e){return new qy(this.readUint32(e),this.readUint32(e+4))}readFloat32(e){return Hy[0]=this.readInt32(e),Yy[0]}readFloat64(e){return Hy[Ky?0:1]=this.readInt32(e),Hy[Ky?1:0]=this.readInt32(e+4),Qy[0]}writeInt8(e,t){this.bytes_[e]=t}writeUint8(e,t){this.bytes_[e]=t}writeInt16(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8}writeUint16(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8}writeInt32(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24}writeUint32(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24}writeInt64(e,t){this.writeInt32(e,t.low),this.writeInt32(e+4,t.high)}writeUint64(e,t){this.writeUint32(e,t.low),this.writeUint32(e+4,t.high)}writeFloat32(e,t){Yy[0]=t,this.writeInt32(e,Hy[0])}writeFloat64(e,t){Qy[0]=t,this.writeInt32(e,Hy[Ky?0:1]),this.writeInt32(e+4,Hy[Ky?1:0])}getBufferIdentifier(){if(this.bytes_.length<this.position_+4+4)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");let e="";for(let t=0;t<4;t++)e+=String.fromCharCode(this.readInt8(this.position_+4+t));return e}__offset(e,t){const n=e-this.readInt32(e);return t<this.readInt16(n)?this.readInt16(n+t):0}__union(e,t){return e.bb_pos=t+this.readInt32(t),e.bb=this,e}__string(e,t){e+=this.readInt32(e);const n=this.readInt32(e);let r="",i=0;if(e+=4,t===Jy.UTF8_BYTES)return this.bytes_.subarray(e,e+n);for(;i<n;){let t;const n=this.readUint8(e+i++);if(n<192)t=n;else{const r=this.readUint8(e+i++);if(n<224)t=(31&n)<<6|63&r;else{const s=this.readUint8(e+i++);if(n<240)t=(15&n)<<12|(63&r)<<6|63&s;else{t=(7&n)<<18|(63&r)<<12|(63&s)<<6|63&this.readUint8(e+i++)}}}t<65536?r+=String.fromCharCode(t):(t-=65536,r+=String.fromCharCode(55296+(t>>10),56320+(1023&t)))}return r}__union_with_string(e,t){return"string"==typeof e?this.__string(t):this.__union(e,t)}__indirect(e){return e+this.readInt32(e)}__vector(e){return e+this.readInt32(e)+4}__vector_len(e){return this.readInt32(e+this.readInt32(e))}__has_identifier(e){if(4!=e.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let t=0;t<4;t++)if(e.charCodeAt(t)!=this.readInt8(this.position()+4+t))return!1;return!0}createLong(e,t){return qy.create(e,t)}createScalarList(e,t){const n=[];for(let r=0;r<t;++r)null!==e(r)&&n.push(e(r));return n}createObjList(e,t){const n=[];for(let r=0;r<t;++r){const t=e(r);null!==t&&n.push(t.unpack())}return n}},Zy=class e{constructor(e){let t;this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null,t=e||1024,this.bb=Xy.allocate(t),this.space=t}clear(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null}forceDefaults(e){this.force_defaults=e}dataBuffer(){return this.bb}asUint8Array(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())}prep(t,n){t>this.minalign&&(this.minalign=t);const r=1+~(this.bb.capacity()-this.space+n)&t-1;for(;this.space<r+t+n;){const t=this.bb.capacity();this.bb=e.growByteBuffer(this.bb),this.space+=this.bb.capacity()-t}this.pad(r)}pad(e){for(let t=0;t<e;t++)this.bb.writeInt8(--this.space,0)}writeInt8(e){this.bb.writeInt8(this.space-=1,e)}writeInt16(e){this.bb.writeInt16(this.space-=2,e)}writeInt32(e){this.bb.writeInt32(this.space-=4,e)}writeInt64(e){this.bb.writeInt64(this.space-=8,e)}writeFloat32(e){this.bb.writeFloat32(this.space-=4,e)}writeFloat64(e){this.bb.writeFloat64(this.space-=8,e)}addInt8(e){this.prep(1,0),this.writeInt8(e)}addInt16(e){this.prep(2,0),this.writeInt16(e)}addInt32(e){this.prep(4,0),this.writeInt32(e)}addInt64(e){this.prep(8,0),this.writeInt64(e)}addFloat32(e){this.prep(4,0),this.writeFloat32(e)}addFloat64(e){this.prep(8,0),this.writeFloat64(e)}addFieldInt8(e,t,n){(this.force_defaults||t!=n)&&(this.addInt8(t),this.slot(e))}addFieldInt16(e,t,n){(this.force_defaults||t!=n)&&(this.addInt16(t),this.slot(e))}addFieldInt32(e,t,n){(this.force_defaults||t!=n)&&(this.addInt32(t),this.slot(e))}addFieldInt64(e,t,n){!this.force_defaults&&t.equals(n)||(this.addInt64(t),this.slot(e))}addFieldFloat32(e,t,n){(this.force_defaults||t!=n)&&(this.addFloat32(t),this.slot(e))}addFieldFloat64(e,t,n){(this.force_defaults||t!=n)&&(this.addFloat64(t),this.slot(e))}addFieldOffset(e,t,n){(this.force_defaults||t!=n)&&(this.addOffset(t),this.slot(e))}addFieldStruct(e,t,n){t!=n&&(this.nested(t),this.slot(e))}nested(e){if(e!=this.offset())throw new Error("FlatBuffers: struct must be serialized inline.")}notNested(){if(this.isNested)throw new Error("FlatBuffers: object serialization must not be nested.")}slot(e){null!==this.vtable&&(this.vtable[e]=this.offset())}offset(){return this.bb.capacity()-this.space}static growByteBuffer(e){const t=e.capacity();if(3221225472&t)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");const n=t<<1,r=Xy.allocate(n);return r.setPosition(n-t),r.bytes().set(e.bytes(),n-t),r}addOffset(e){this.prep(4,0),this.writeInt32(this.offset()-e+4)}startObject(e){this.notNested(),null==this.vtable&&(this.vtable=[]),this.vtable_in_use=e;for(let t=0;t<e;t++)this.vtable[t]=0;this.isNested=!0,this.object_start=this.offset()}endObject(){if(null==this.vtable||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);const e=this.offset();let t=this.vtable_in_use-1;for(;t>=0&&0==this.vtable[t];t--);const n=t+1;for(;t>=0;t--)this.addInt16(0!=this.vtable[t]?e-this.vtable[t]:0);this.addInt16(e-this.object_start);const r=2*(n+2);this.addInt16(r);let i=0;const s=this.space;e:for(t=0;t<this.vtables.length;t++){const e=this.bb.capacity()-this.vtables[t];if(r==this.bb.readInt16(e)){for(let t=2;t<r;t+=2)if(this.bb.readInt16(s+t)!=this.bb.readInt16(e+t))continue e;i=this.vtables[t];break}}return i?(this.space=this.bb.capacity()-e,this.bb.writeInt32(this.space,i-e)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-e,this.offset()-e)),this.isNested=!1,e}finish(e,t,n){const r=n?4:0;if(t){const e=t;if(this.prep(this.minalign,8+r),4!=e.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let t=3;t>=0;t--)this.writeInt8(e.charCodeAt(t))}this.prep(this.minalign,4+r),this.addOffset(e),r&&this.addInt32(this.bb.capacity()-this.space),this.bb.setPosition(this.space)}finishSizePrefixed(e,t){this.finish(e,t,!0)}requiredField(e,t){const n=this.bb.capacity()-e,r=n-this.bb.readInt32(n);if(!(0!=this.bb.readInt16(r+t)))throw new Error("FlatBuffers: field "+t+" must be set")}startVector(e,t,n){this.notNested(),this.vector_num_elems=t,this.prep(4,e*t),this.prep(n,e*t)}endVector(){return this.writeInt32(this.vector_num_elems),this.offset()}createSharedString(e){if(!e)return 0;if(this.string_maps||(this.string_maps=new Map),this.string_maps.has(e))return this.string_maps.get(e);const t=this.createString(e);return this.string_maps.set(e,t),t}createString(e){if(!e)return 0;let t;if(e instanceof Uint8Array)t=e;else{t=[];let n=0;for(;n<e.length;){let r;const i=e.charCodeAt(n++);if(i<55296||i>=56320)r=i;else{r=(i<<10)+e.charCodeAt(n++)+-56613888}r<128?t.push(r):(r<2048?t.push(r>>6&31|192):(r<65536?t.push(r>>12&15|224):t.push(r>>18&7|240,r>>12&63|128),t.push(r>>6&63|128)),t.push(63&r|128))}}this.addInt8(0),this.startVector(1,t.length,1),this.bb.setPosition(this.space-=t.length);for(let n=0,r=this.space,i=this.bb.bytes();n<t.length;n++)i[r++]=t[n];return this.endVector()}createLong(e,t){return qy.create(e,t)}createObjectOffset(e){return null===e?0:"string"==typeof e?this.createString(e):e.pack(this)}createObjectOffsetList(e){const t=[];for(let n=0;n<e.length;++n){const r=e[n];if(null===r)throw new Error("FlatBuffers: Argument for createObjectOffsetList cannot contain null.");t.push(this.createObjectOffset(r))}return t}createStructOffsetList(e,t){return t(this,e.length),this.createObjectOffsetList(e),this.endVector()}};class eb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsKeyValue(e,t){return(t||new eb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsKeyValue(e,t){return e.setPosition(e.position()+4),(t||new eb).__init(e.readInt32(e.position())+e.position(),e)}key(e){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}value(e){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}static startKeyValue(e){e.startObject(2)}static addKey(e,t){e.addFieldOffset(0,t,0)}static addValue(e,t){e.addFieldOffset(1,t,0)}static endKeyValue(e){return e.endObject()}static createKeyValue(e,t,n){return eb.startKeyValue(e),eb.addKey(e,t),eb.addValue(e,n),eb.endKeyValue(e)}}var tb,nb,rb,ib,sb,ob;!function(e){e[e.V1=0]="V1",e[e.V2=1]="V2",e[e.V3=2]="V3",e[e.V4=3]="V4",e[e.V5=4]="V5"}(tb||(tb={})),(rb=nb||(nb={}))[rb.Little=0]="Little",rb[rb.Big=1]="Big",(sb=ib||(ib={}))[sb.DenseArray=0]="DenseArray";class ab{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsInt(e,t){return(t||new ab).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsInt(e,t){return e.setPosition(e.position()+4),(t||new ab).__init(e.readInt32(e.position())+e.position(),e)}bitWidth(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}isSigned(){const e=this.bb.__offset(this.bb_pos,6);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}static startInt(e){e.startObject(2)}static addBitWidth(e,t){e.addFieldInt32(0,t,0)}static addIsSigned(e,t){e.addFieldInt8(1,+t,0)}static endInt(e){return e.endObject()}static createInt(e,t,n){return ab.startInt(e),ab.addBitWidth(e,t),ab.addIsSigned(e,n),ab.endInt(e)}}class lb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDictionaryEncoding(e,t){return(t||new lb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDictionaryEncoding(e,t){return e.setPosition(e.position()+4),(t||new lb).__init(e.readInt32(e.position())+e.position(),e)}id(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}indexType(e){const t=this.bb.__offset(this.bb_pos,6);return t?(e||new ab).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}isOrdered(){const e=this.bb.__offset(this.bb_pos,8);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}dictionaryKind(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt16(this.bb_pos+e):ib.DenseArray}static startDictionaryEncoding(e){e.startObject(4)}static addId(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}static addIndexType(e,t){e.addFieldOffset(1,t,0)}static addIsOrdered(e,t){e.addFieldInt8(2,+t,0)}static addDictionaryKind(e,t){e.addFieldInt16(3,t,ib.DenseArray)}static endDictionaryEncoding(e){return e.endObject()}}class ub{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBinary(e,t){return(t||new ub).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBinary(e,t){return e.setPosition(e.position()+4),(t||new ub).__init(e.readInt32(e.position())+e.position(),e)}static startBinary(e){e.startObject(0)}static endBinary(e){return e.endObject()}static createBinary(e){return ub.startBinary(e),ub.endBinary(e)}}class cb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBool(e,t){return(t||new cb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBool(e,t){return e.setPosition(e.position()+4),(t||new cb).__init(e.readInt32(e.position())+e.position(),e)}static startBool(e){e.startObject(0)}static endBool(e){return e.endObject()}static createBool(e){return cb.startBool(e),cb.endBool(e)}}!function(e){e[e.DAY=0]="DAY",e[e.MILLISECOND=1]="MILLISECOND"}(ob||(ob={}));let db=class e{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDate(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDate(t,n){return t.setPosition(t.position()+4),(n||new e).__init(t.readInt32(t.position())+t.position(),t)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):ob.MILLISECOND}static startDate(e){e.startObject(1)}static addUnit(e,t){e.addFieldInt16(0,t,ob.MILLISECOND)}static endDate(e){return e.endObject()}static createDate(t,n){return e.startDate(t),e.addUnit(t,n),e.endDate(t)}};class fb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDecimal(e,t){return(t||new fb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDecimal(e,t){return e.setPosition(e.position()+4),(t||new fb).__init(e.readInt32(e.position())+e.position(),e)}precision(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}scale(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):0}bitWidth(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.readInt32(this.bb_pos+e):128}static startDecimal(e){e.startObject(3)}static addPrecision(e,t){e.addFieldInt32(0,t,0)}static addScale(e,t){e.addFieldInt32(1,t,0)}static addBitWidth(e,t){e.addFieldInt32(2,t,128)}static endDecimal(e){return e.endObject()}static createDecimal(e,t,n,r){return fb.startDecimal(e),fb.addPrecision(e,t),fb.addScale(e,n),fb.addBitWidth(e,r),fb.endDecimal(e)}}var hb,pb,yb;!function(e){e[e.SECOND=0]="SECOND",e[e.MILLISECOND=1]="MILLISECOND",e[e.MICROSECOND=2]="MICROSECOND",e[e.NANOSECOND=3]="NANOSECOND"}(hb||(hb={}));class bb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFixedSizeBinary(e,t){return(t||new bb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFixedSizeBinary(e,t){return e.setPosition(e.position()+4),(t||new bb).__init(e.readInt32(e.position())+e.position(),e)}byteWidth(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}static startFixedSizeBinary(e){e.startObject(1)}static addByteWidth(e,t){e.addFieldInt32(0,t,0)}static endFixedSizeBinary(e){return e.endObject()}static createFixedSizeBinary(e,t){return bb.startFixedSizeBinary(e),bb.addByteWidth(e,t),bb.endFixedSizeBinary(e)}}class mb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFixedSizeList(e,t){return(t||new mb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFixedSizeList(e,t){return e.setPosition(e.position()+4),(t||new mb).__init(e.readInt32(e.position())+e.position(),e)}listSize(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}static startFixedSizeList(e){e.startObject(1)}static addListSize(e,t){e.addFieldInt32(0,t,0)}static endFixedSizeList(e){return e.endObject()}static createFixedSizeList(e,t){return mb.startFixedSizeList(e),mb.addListSize(e,t),mb.endFixedSizeList(e)}}!function(e){e[e.HALF=0]="HALF",e[e.SINGLE=1]="SINGLE",e[e.DOUBLE=2]="DOUBLE"}(pb||(pb={}));class gb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFloatingPoint(e,t){return(t||new gb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFloatingPoint(e,t){return e.setPosition(e.position()+4),(t||new gb).__init(e.readInt32(e.position())+e.position(),e)}precision(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):pb.HALF}static startFloatingPoint(e){e.startObject(1)}static addPrecision(e,t){e.addFieldInt16(0,t,pb.HALF)}static endFloatingPoint(e){return e.endObject()}static createFloatingPoint(e,t){return gb.startFloatingPoint(e),gb.addPrecision(e,t),gb.endFloatingPoint(e)}}!function(e){e[e.YEAR_MONTH=0]="YEAR_MONTH",e[e.DAY_TIME=1]="DAY_TIME",e[e.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(yb||(yb={}));class vb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsInterval(e,t){return(t||new vb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsInterval(e,t){return e.setPosition(e.position()+4),(t||new vb).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):yb.YEAR_MONTH}static startInterval(e){e.startObject(1)}static addUnit(e,t){e.addFieldInt16(0,t,yb.YEAR_MONTH)}static endInterval(e){return e.endObject()}static createInterval(e,t){return vb.startInterval(e),vb.addUnit(e,t),vb.endInterval(e)}}class wb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsList(e,t){return(t||new wb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsList(e,t){return e.setPosition(e.position()+4),(t||new wb).__init(e.readInt32(e.position())+e.position(),e)}static startList(e){e.startObject(0)}static endList(e){return e.endObject()}static createList(e){return wb.startList(e),wb.endList(e)}}let _b=class e{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsMap(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMap(t,n){return t.setPosition(t.position()+4),(n||new e).__init(t.readInt32(t.position())+t.position(),t)}keysSorted(){const e=this.bb.__offset(this.bb_pos,4);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}static startMap(e){e.startObject(1)}static addKeysSorted(e,t){e.addFieldInt8(0,+t,0)}static endMap(e){return e.endObject()}static createMap(t,n){return e.startMap(t),e.addKeysSorted(t,n),e.endMap(t)}};class Sb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsNull(e,t){return(t||new Sb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsNull(e,t){return e.setPosition(e.position()+4),(t||new Sb).__init(e.readInt32(e.position())+e.position(),e)}static startNull(e){e.startObject(0)}static endNull(e){return e.endObject()}static createNull(e){return Sb.startNull(e),Sb.endNull(e)}}class Ib{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsStruct_(e,t){return(t||new Ib).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsStruct_(e,t){return e.setPosition(e.position()+4),(t||new Ib).__init(e.readInt32(e.position())+e.position(),e)}static startStruct_(e){e.startObject(0)}static endStruct_(e){return e.endObject()}static createStruct_(e){return Ib.startStruct_(e),Ib.endStruct_(e)}}class xb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsTime(e,t){return(t||new xb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsTime(e,t){return e.setPosition(e.position()+4),(t||new xb).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):hb.MILLISECOND}bitWidth(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):32}static startTime(e){e.startObject(2)}static addUnit(e,t){e.addFieldInt16(0,t,hb.MILLISECOND)}static addBitWidth(e,t){e.addFieldInt32(1,t,32)}static endTime(e){return e.endObject()}static createTime(e,t,n){return xb.startTime(e),xb.addUnit(e,t),xb.addBitWidth(e,n),xb.endTime(e)}}class kb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsTimestamp(e,t){return(t||new kb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsTimestamp(e,t){return e.setPosition(e.position()+4),(t||new kb).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):hb.SECOND}timezone(e){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}static startTimestamp(e){e.startObject(2)}static addUnit(e,t){e.addFieldInt16(0,t,hb.SECOND)}static addTimezone(e,t){e.addFieldOffset(1,t,0)}static endTimestamp(e){return e.endObject()}static createTimestamp(e,t,n){return kb.startTimestamp(e),kb.addUnit(e,t),kb.addTimezone(e,n),kb.endTimestamp(e)}}var Tb,Cb;!function(e){e[e.Sparse=0]="Sparse",e[e.Dense=1]="Dense"}(Tb||(Tb={}));class Eb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsUnion(e,t){return(t||new Eb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsUnion(e,t){return e.setPosition(e.position()+4),(t||new Eb).__init(e.readInt32(e.position())+e.position(),e)}mode(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Tb.Sparse}typeIds(e){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb.__vector(this.bb_pos+t)+4*e):0}typeIdsLength(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}typeIdsArray(){const e=this.bb.__offset(this.bb_pos,6);return e?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+e),this.bb.__vector_len(this.bb_pos+e)):null}static startUnion(e){e.startObject(2)}static addMode(e,t){e.addFieldInt16(0,t,Tb.Sparse)}static addTypeIds(e,t){e.addFieldOffset(1,t,0)}static createTypeIdsVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addInt32(t[n]);return e.endVector()}static startTypeIdsVector(e,t){e.startVector(4,t,4)}static endUnion(e){return e.endObject()}static createUnion(e,t,n){return Eb.startUnion(e),Eb.addMode(e,t),Eb.addTypeIds(e,n),Eb.endUnion(e)}}class Ob{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsUtf8(e,t){return(t||new Ob).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsUtf8(e,t){return e.setPosition(e.position()+4),(t||new Ob).__init(e.readInt32(e.position())+e.position(),e)}static startUtf8(e){e.startObject(0)}static endUtf8(e){return e.endObject()}static createUtf8(e){return Ob.startUtf8(e),Ob.endUtf8(e)}}!function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.FloatingPoint=3]="FloatingPoint",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct_=13]="Struct_",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Duration=18]="Duration",e[e.LargeBinary=19]="LargeBinary",e[e.LargeUtf8=20]="LargeUtf8",e[e.LargeList=21]="LargeList"}(Cb||(Cb={}));let Bb=class e{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsField(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsField(t,n){return t.setPosition(t.position()+4),(n||new e).__init(t.readInt32(t.position())+t.position(),t)}name(e){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}nullable(){const e=this.bb.__offset(this.bb_pos,6);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}typeType(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.readUint8(this.bb_pos+e):Cb.NONE}type(e){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__union(e,this.bb_pos+t):null}dictionary(e){const t=this.bb.__offset(this.bb_pos,12);return t?(e||new lb).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}children(t,n){const r=this.bb.__offset(this.bb_pos,14);return r?(n||new e).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+4*t),this.bb):null}childrenLength(){const e=this.bb.__offset(this.bb_pos,14);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,16);return n?(t||new eb).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,16);return e?this.bb.__vector_len(this.bb_pos+e):0}static startField(e){e.startObject(7)}static addName(e,t){e.addFieldOffset(0,t,0)}static addNullable(e,t){e.addFieldInt8(1,+t,0)}static addTypeType(e,t){e.addFieldInt8(2,t,Cb.NONE)}static addType(e,t){e.addFieldOffset(3,t,0)}static addDictionary(e,t){e.addFieldOffset(4,t,0)}static addChildren(e,t){e.addFieldOffset(5,t,0)}static createChildrenVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startChildrenVector(e,t){e.startVector(4,t,4)}static addCustomMetadata(e,t){e.addFieldOffset(6,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endField(e){return e.endObject()}},Db=class e{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsSchema(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsSchema(t,n){return t.setPosition(t.position()+4),(n||new e).__init(t.readInt32(t.position())+t.position(),t)}endianness(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):nb.Little}fields(e,t){const n=this.bb.__offset(this.bb_pos,6);return n?(t||new Bb).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}fieldsLength(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,8);return n?(t||new eb).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}features(e){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt64(this.bb.__vector(this.bb_pos+t)+8*e):this.bb.createLong(0,0)}featuresLength(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__vector_len(this.bb_pos+e):0}static startSchema(e){e.startObject(4)}static addEndianness(e,t){e.addFieldInt16(0,t,nb.Little)}static addFields(e,t){e.addFieldOffset(1,t,0)}static createFieldsVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startFieldsVector(e,t){e.startVector(4,t,4)}static addCustomMetadata(e,t){e.addFieldOffset(2,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static addFeatures(e,t){e.addFieldOffset(3,t,0)}static createFeaturesVector(e,t){e.startVector(8,t.length,8);for(let n=t.length-1;n>=0;n--)e.addInt64(t[n]);return e.endVector()}static startFeaturesVector(e,t){e.startVector(8,t,8)}static endSchema(e){return e.endObject()}static finishSchemaBuffer(e,t){e.finish(t)}static finishSizePrefixedSchemaBuffer(e,t){e.finish(t,void 0,!0)}static createSchema(t,n,r,i,s){return e.startSchema(t),e.addEndianness(t,n),e.addFields(t,r),e.addCustomMetadata(t,i),e.addFeatures(t,s),e.endSchema(t)}};class Nb{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFooter(e,t){return(t||new Nb).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFooter(e,t){return e.setPosition(e.position()+4),(t||new Nb).__init(e.readInt32(e.position())+e.position(),e)}version(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):tb.V1}schema(e){const t=this.bb.__offset(this.bb_pos,6);return t?(e||new Db).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}dictionaries(e,t){const n=this.bb.__offset(this.bb_pos,8);return n?(t||new Wy).__init(this.bb.__vector(this.bb_pos+n)+24*e,this.bb):null}dictionariesLength(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}recordBatches(e,t){const n=this.bb.__offset(this.bb_pos,10);return n?(t||new Wy).__init(this.bb.__vector(this.bb_pos+n)+24*e,this.bb):null}recordBatchesLength(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,12);return n?(t||new eb).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,12);return e?this.bb.__vector_len(this.bb_pos+e):0}static startFooter(e){e.startObject(5)}static addVersion(e,t){e.addFieldInt16(0,t,tb.V1)}static addSchema(e,t){e.addFieldOffset(1,t,0)}static addDictionaries(e,t){e.addFieldOffset(2,t,0)}static startDictionariesVector(e,t){e.startVector(24,t,8)}static addRecordBatches(e,t){e.addFieldOffset(3,t,0)}static startRecordBatchesVector(e,t){e.startVector(24,t,8)}static addCustomMetadata(e,t){e.addFieldOffset(4,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endFooter(e){return e.endObject()}static finishFooterBuffer(e,t){e.finish(t)}static finishSizePrefixedFooterBuffer(e,t){e.finish(t,void 0,!0)}}class Mb{constructor(e=[],t,n){this.fields=e||[],this.metadata=t||new Map,n||(n=Lb(e)),this.dictionaries=n}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map((e=>e.name))}toString(){return`Schema<{ ${this.fields.map(((e,t)=>`${t}: ${e}`)).join(", ")} }>`}select(e){const t=new Set(e),n=this.fields.filter((e=>t.has(e.name)));return new Mb(n,this.metadata)}selectAt(e){const t=e.map((e=>this.fields[e])).filter(Boolean);return new Mb(t,this.metadata)}assign(...e){const t=e[0]instanceof Mb?e[0]:Array.isArray(e[0])?new Mb(e[0]):new Mb(e),n=[...this.fields],r=Fb(Fb(new Map,this.metadata),t.metadata),i=t.fields.filter((e=>{const t=n.findIndex((t=>t.name===e.name));return!~t||(n[t]=e.clone({metadata:Fb(Fb(new Map,n[t].metadata),e.metadata)}))&&!1})),s=Lb(i,new Map);return new Mb([...n,...i],r,new Map([...this.dictionaries,...s]))}}Mb.prototype.fields=null,Mb.prototype.metadata=null,Mb.prototype.dictionaries=null;class Ab{constructor(e,t,n=!1,r){this.name=e,this.type=t,this.nullable=n,this.metadata=r||new Map}static new(...e){let[t,n,r,i]=e;return e[0]&&"object"==typeof e[0]&&(({name:t}=e[0]),void 0===n&&(n=e[0].type),void 0===r&&(r=e[0].nullable),void 0===i&&(i=e[0].metadata)),new Ab(`${t}`,n,r,i)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}clone(...e){let[t,n,r,i]=e;return e[0]&&"object"==typeof e[0]?({name:t=this.name,type:n=this.type,nullable:r=this.nullable,metadata:i=this.metadata}=e[0]):[t=this.name,n=this.type,r=this.nullable,i=this.metadata]=e,Ab.new(t,n,r,i)}}function Fb(e,t){return new Map([...e||new Map,...t||new Map])}function Lb(e,t=new Map){for(let n=-1,r=e.length;++n<r;){const r=e[n].type;if(Ch.isDictionary(r))if(t.has(r.id)){if(t.get(r.id)!==r.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else t.set(r.id,r.dictionary);r.children&&r.children.length>0&&Lb(r.children,t)}return t}Ab.prototype.type=null,Ab.prototype.name=null,Ab.prototype.nullable=null,Ab.prototype.metadata=null;var Ub=qy,Pb=Zy,zb=Xy;class Rb{constructor(e,t=Nf.V4,n,r){this.schema=e,this.version=t,n&&(this._recordBatches=n),r&&(this._dictionaryBatches=r)}static decode(e){e=new zb(Sf(e));const t=Nb.getRootAsFooter(e),n=Mb.decode(t.schema());return new Vb(n,t)}static encode(e){const t=new Pb,n=Mb.encode(t,e.schema);Nb.startRecordBatchesVector(t,e.numRecordBatches);for(const s of[...e.recordBatches()].slice().reverse())jb.encode(t,s);const r=t.endVector();Nb.startDictionariesVector(t,e.numDictionaries);for(const s of[...e.dictionaryBatches()].slice().reverse())jb.encode(t,s);const i=t.endVector();return Nb.startFooter(t),Nb.addSchema(t,n),Nb.addVersion(t,Nf.V4),Nb.addRecordBatches(t,r),Nb.addDictionaries(t,i),Nb.finishFooterBuffer(t,Nb.endFooter(t)),t.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}*recordBatches(){for(let e,t=-1,n=this.numRecordBatches;++t<n;)(e=this.getRecordBatch(t))&&(yield e)}*dictionaryBatches(){for(let e,t=-1,n=this.numDictionaries;++t<n;)(e=this.getDictionaryBatch(t))&&(yield e)}getRecordBatch(e){return e>=0&&e<this.numRecordBatches&&this._recordBatches[e]||null}getDictionaryBatch(e){return e>=0&&e<this.numDictionaries&&this._dictionaryBatches[e]||null}}class Vb extends Rb{constructor(e,t){super(e,t.version()),this._footer=t}get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}getRecordBatch(e){if(e>=0&&e<this.numRecordBatches){const t=this._footer.recordBatches(e);if(t)return jb.decode(t)}return null}getDictionaryBatch(e){if(e>=0&&e<this.numDictionaries){const t=this._footer.dictionaries(e);if(t)return jb.decode(t)}return null}}class jb{constructor(e,t,n){this.metaDataLength=e,this.offset="number"==typeof n?n:n.low,this.bodyLength="number"==typeof t?t:t.low}static decode(e){return new jb(e.metaDataLength(),e.bodyLength(),e.offset())}static encode(e,t){const{metaDataLength:n}=t,r=new Ub(t.offset,0),i=new Ub(t.bodyLength,0);return Wy.createBlock(e,r,n,i)}}const $b=Object.freeze({done:!0,value:void 0});class Wb{constructor(e){this._json=e}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}}class Hb{tee(){return this._getDOMStream().tee()}pipe(e,t){return this._getNodeStream().pipe(e,t)}pipeTo(e,t){return this._getDOMStream().pipeTo(e,t)}pipeThrough(e,t){return this._getDOMStream().pipeThrough(e,t)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}}class Yb extends Hb{constructor(){super(),this._values=[],this.resolvers=[],this._closedPromise=new Promise((e=>this._closedPromiseResolve=e))}get closed(){return this._closedPromise}cancel(e){return Vd(this,void 0,void 0,(function*(){yield this.return(e)}))}write(e){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(e):this.resolvers.shift().resolve({done:!1,value:e}))}abort(e){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:e}:this.resolvers.shift().reject({done:!0,value:e}))}close(){if(this._closedPromiseResolve){const{resolvers:e}=this;for(;e.length>0;)e.shift().resolve($b);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(e){return Ef.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,e)}toNodeStream(e){return Ef.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,e)}throw(e){return Vd(this,void 0,void 0,(function*(){return yield this.abort(e),$b}))}return(e){return Vd(this,void 0,void 0,(function*(){return yield this.close(),$b}))}read(e){return Vd(this,void 0,void 0,(function*(){return(yield this.next(e,"read")).value}))}peek(e){return Vd(this,void 0,void 0,(function*(){return(yield this.next(e,"peek")).value}))}next(...e){return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise(((e,t)=>{this.resolvers.push({resolve:e,reject:t})})):Promise.resolve($b)}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw new Error("AsyncQueue is closed")}}class Qb extends Yb{write(e){if((e=Sf(e)).byteLength>0)return super.write(e)}toString(e=!1){return e?Kd(this.toUint8Array(!0)):this.toUint8Array(!1).then(Kd)}toUint8Array(e=!1){return e?vf(this._values)[0]:(()=>Vd(this,void 0,void 0,(function*(){var e,t;const n=[];let r=0;try{for(var i,s=Yd(this);!(i=yield s.next()).done;){const e=i.value;n.push(e),r+=e.byteLength}}catch(o){e={error:o}}finally{try{i&&!i.done&&(t=s.return)&&(yield t.call(s))}finally{if(e)throw e.error}}return vf(n,r)[0]})))()}}class Kb{constructor(e){e&&(this.source=new Jb(Ef.fromIterable(e)))}[Symbol.iterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}}class qb{constructor(e){e instanceof qb?this.source=e.source:e instanceof Qb?this.source=new Gb(Ef.fromAsyncIterable(e)):bf(e)?this.source=new Gb(Ef.fromNodeStream(e)):yf(e)?this.source=new Gb(Ef.fromDOMStream(e)):hf(e)?this.source=new Gb(Ef.fromDOMStream(e.body)):lf(e)?this.source=new Gb(Ef.fromIterable(e)):(af(e)||uf(e))&&(this.source=new Gb(Ef.fromAsyncIterable(e)))}[Symbol.asyncIterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}get closed(){return this.source.closed}cancel(e){return this.source.cancel(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}}class Jb{constructor(e){this.source=e}cancel(e){this.return(e)}peek(e){return this.next(e,"peek").value}read(e){return this.next(e,"read").value}next(e,t="read"){return this.source.next({cmd:t,size:e})}throw(e){return Object.create(this.source.throw&&this.source.throw(e)||$b)}return(e){return Object.create(this.source.return&&this.source.return(e)||$b)}}class Gb{constructor(e){this.source=e,this._closedPromise=new Promise((e=>this._closedPromiseResolve=e))}cancel(e){return Vd(this,void 0,void 0,(function*(){yield this.return(e)}))}get closed(){return this._closedPromise}read(e){return Vd(this,void 0,void 0,(function*(){return(yield this.next(e,"read")).value}))}peek(e){return Vd(this,void 0,void 0,(function*(){return(yield this.next(e,"peek")).value}))}next(e,t="read"){return Vd(this,void 0,void 0,(function*(){return yield this.source.next({cmd:t,size:e})}))}throw(e){return Vd(this,void 0,void 0,(function*(){const t=this.source.throw&&(yield this.source.throw(e))||$b;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)}))}return(e){return Vd(this,void 0,void 0,(function*(){const t=this.source.return&&(yield this.source.return(e))||$b;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)}))}}class Xb extends Kb{constructor(e,t){super(),this.position=0,this.buffer=Sf(e),this.size=void 0===t?this.buffer.byteLength:t}readInt32(e){const{buffer:t,byteOffset:n}=this.readAt(e,4);return new DataView(t,n).getInt32(0,!0)}seek(e){return this.position=Math.min(e,this.size),e<this.size}read(e){const{buffer:t,size:n,position:r}=this;return t&&r<n?("number"!=typeof e&&(e=Number.POSITIVE_INFINITY),this.position=Math.min(n,r+Math.min(n-r,e)),t.subarray(r,this.position)):null}readAt(e,t){const n=this.buffer,r=Math.min(this.size,e+t);return n?n.subarray(e,r):new Uint8Array(t)}close(){this.buffer&&(this.buffer=null)}throw(e){return this.close(),{done:!0,value:e}}return(e){return this.close(),{done:!0,value:e}}}class Zb extends qb{constructor(e,t){super(),this.position=0,this._handle=e,"number"==typeof t?this.size=t:this._pending=(()=>Vd(this,void 0,void 0,(function*(){this.size=(yield e.stat()).size,delete this._pending})))()}readInt32(e){return Vd(this,void 0,void 0,(function*(){const{buffer:t,byteOffset:n}=yield this.readAt(e,4);return new DataView(t,n).getInt32(0,!0)}))}seek(e){return Vd(this,void 0,void 0,(function*(){return this._pending&&(yield this._pending),this.position=Math.min(e,this.size),e<this.size}))}read(e){return Vd(this,void 0,void 0,(function*(){this._pending&&(yield this._pending);const{_handle:t,size:n,position:r}=this;if(t&&r<n){"number"!=typeof e&&(e=Number.POSITIVE_INFINITY);let i=r,s=0,o=0;const a=Math.min(n,i+Math.min(n-i,e)),l=new Uint8Array(Math.max(0,(this.position=a)-i));for(;(i+=o)<a&&(s+=o)<l.byteLength;)({bytesRead:o}=yield t.read(l,s,l.byteLength-s,i));return l}return null}))}readAt(e,t){return Vd(this,void 0,void 0,(function*(){this._pending&&(yield this._pending);const{_handle:n,size:r}=this;if(n&&e+t<r){const i=Math.min(r,e+t),s=new Uint8Array(i-e);return(yield n.read(s,0,t,e)).buffer}return new Uint8Array(t)}))}close(){return Vd(this,void 0,void 0,(function*(){const e=this._handle;this._handle=null,e&&(yield e.close())}))}throw(e){return Vd(this,void 0,void 0,(function*(){return yield this.close(),{done:!0,value:e}}))}return(e){return Vd(this,void 0,void 0,(function*(){return yield this.close(),{done:!0,value:e}}))}}function em(e){return e<0&&(e=4294967295+e+1),`0x${e.toString(16)}`}const tm=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8];class nm{constructor(e){this.buffer=e}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(e){const t=new Uint32Array([this.buffer[1]>>>16,65535&this.buffer[1],this.buffer[0]>>>16,65535&this.buffer[0]]),n=new Uint32Array([e.buffer[1]>>>16,65535&e.buffer[1],e.buffer[0]>>>16,65535&e.buffer[0]]);let r=t[3]*n[3];this.buffer[0]=65535&r;let i=r>>>16;return r=t[2]*n[3],i+=r,r=t[3]*n[2]>>>0,i+=r,this.buffer[0]+=i<<16,this.buffer[1]=i>>>0<r?65536:0,this.buffer[1]+=i>>>16,this.buffer[1]+=t[1]*n[3]+t[2]*n[2]+t[3]*n[1],this.buffer[1]+=t[0]*n[3]+t[1]*n[2]+t[2]*n[1]+t[3]*n[0]<<16,this}_plus(e){const t=this.buffer[0]+e.buffer[0]>>>0;this.buffer[1]+=e.buffer[1],t<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=t}lessThan(e){return this.buffer[1]<e.buffer[1]||this.buffer[1]===e.buffer[1]&&this.buffer[0]<e.buffer[0]}equals(e){return this.buffer[1]===e.buffer[1]&&this.buffer[0]==e.buffer[0]}greaterThan(e){return e.lessThan(this)}hex(){return`${em(this.buffer[1])} ${em(this.buffer[0])}`}}class rm extends nm{times(e){return this._times(e),this}plus(e){return this._plus(e),this}static from(e,t=new Uint32Array(2)){return rm.fromString("string"==typeof e?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(2)){return rm.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(2)){const n=e.length,r=new rm(t);for(let i=0;i<n;){const t=8<n-i?8:n-i,s=new rm(new Uint32Array([Number.parseInt(e.slice(i,i+t),10),0])),o=new rm(new Uint32Array([tm[t],0]));r.times(o),r.plus(s),i+=t}return r}static convertArray(e){const t=new Uint32Array(2*e.length);for(let n=-1,r=e.length;++n<r;)rm.from(e[n],new Uint32Array(t.buffer,t.byteOffset+2*n*4,2));return t}static multiply(e,t){return new rm(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new rm(new Uint32Array(e.buffer)).plus(t)}}class im extends nm{negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],0==this.buffer[0]&&++this.buffer[1],this}times(e){return this._times(e),this}plus(e){return this._plus(e),this}lessThan(e){const t=this.buffer[1]|0,n=e.buffer[1]|0;return t<n||t===n&&this.buffer[0]<e.buffer[0]}static from(e,t=new Uint32Array(2)){return im.fromString("string"==typeof e?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(2)){return im.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(2)){const n=e.startsWith("-"),r=e.length,i=new im(t);for(let s=n?1:0;s<r;){const t=8<r-s?8:r-s,n=new im(new Uint32Array([Number.parseInt(e.slice(s,s+t),10),0])),o=new im(new Uint32Array([tm[t],0]));i.times(o),i.plus(n),s+=t}return n?i.negate():i}static convertArray(e){const t=new Uint32Array(2*e.length);for(let n=-1,r=e.length;++n<r;)im.from(e[n],new Uint32Array(t.buffer,t.byteOffset+2*n*4,2));return t}static multiply(e,t){return new im(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new im(new Uint32Array(e.buffer)).plus(t)}}class sm{constructor(e){this.buffer=e}high(){return new im(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new im(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],0==this.buffer[0]&&++this.buffer[1],0==this.buffer[1]&&++this.buffer[2],0==this.buffer[2]&&++this.buffer[3],this}times(e){const t=new rm(new Uint32Array([this.buffer[3],0])),n=new rm(new Uint32Array([this.buffer[2],0])),r=new rm(new Uint32Array([this.buffer[1],0])),i=new rm(new Uint32Array([this.buffer[0],0])),s=new rm(new Uint32Array([e.buffer[3],0])),o=new rm(new Uint32Array([e.buffer[2],0])),a=new rm(new Uint32Array([e.buffer[1],0])),l=new rm(new Uint32Array([e.buffer[0],0]));let u=rm.multiply(i,l);this.buffer[0]=u.low();const c=new rm(new Uint32Array([u.high(),0]));u=rm.multiply(r,l),c.plus(u),u=rm.multiply(i,a),c.plus(u),this.buffer[1]=c.low(),this.buffer[3]=c.lessThan(u)?1:0,this.buffer[2]=c.high();return new rm(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(rm.multiply(n,l)).plus(rm.multiply(r,a)).plus(rm.multiply(i,o)),this.buffer[3]+=rm.multiply(t,l).plus(rm.multiply(n,a)).plus(rm.multiply(r,o)).plus(rm.multiply(i,s)).low(),this}plus(e){const t=new Uint32Array(4);return t[3]=this.buffer[3]+e.buffer[3]>>>0,t[2]=this.buffer[2]+e.buffer[2]>>>0,t[1]=this.buffer[1]+e.buffer[1]>>>0,t[0]=this.buffer[0]+e.buffer[0]>>>0,t[0]<this.buffer[0]>>>0&&++t[1],t[1]<this.buffer[1]>>>0&&++t[2],t[2]<this.buffer[2]>>>0&&++t[3],this.buffer[3]=t[3],this.buffer[2]=t[2],this.buffer[1]=t[1],this.buffer[0]=t[0],this}hex(){return`${em(this.buffer[3])} ${em(this.buffer[2])} ${em(this.buffer[1])} ${em(this.buffer[0])}`}static multiply(e,t){return new sm(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new sm(new Uint32Array(e.buffer)).plus(t)}static from(e,t=new Uint32Array(4)){return sm.fromString("string"==typeof e?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(4)){return sm.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(4)){const n=e.startsWith("-"),r=e.length,i=new sm(t);for(let s=n?1:0;s<r;){const t=8<r-s?8:r-s,n=new sm(new Uint32Array([Number.parseInt(e.slice(s,s+t),10),0,0,0])),o=new sm(new Uint32Array([tm[t],0,0,0]));i.times(o),i.plus(n),s+=t}return n?i.negate():i}static convertArray(e){const t=new Uint32Array(4*e.length);for(let n=-1,r=e.length;++n<r;)sm.from(e[n],new Uint32Array(t.buffer,t.byteOffset+16*n,4));return t}}class om extends qh{constructor(e,t,n,r){super(),this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=e,this.nodes=t,this.buffers=n,this.dictionaries=r}visit(e){return super.visit(e instanceof Ab?e.type:e)}visitNull(e,{length:t}=this.nextFieldNode()){return by({type:e,length:t})}visitBool(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitInt(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitFloat(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitUtf8(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitBinary(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitFixedSizeBinary(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitDate(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitTimestamp(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitTime(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitDecimal(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitList(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),child:this.visit(e.children[0])})}visitStruct(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),children:this.visitMany(e.children)})}visitUnion(e){return e.mode===Af.Sparse?this.visitSparseUnion(e):this.visitDenseUnion(e)}visitDenseUnion(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),typeIds:this.readTypeIds(e),valueOffsets:this.readOffsets(e),children:this.visitMany(e.children)})}visitSparseUnion(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),typeIds:this.readTypeIds(e),children:this.visitMany(e.children)})}visitDictionary(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e.indices),dictionary:this.readDictionary(e)})}visitInterval(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitFixedSizeList(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),child:this.visit(e.children[0])})}visitMap(e,{length:t,nullCount:n}=this.nextFieldNode()){return by({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),child:this.visit(e.children[0])})}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(e,t,n=this.nextBufferRange()){return t>0&&this.readData(e,n)||new Uint8Array(0)}readOffsets(e,t){return this.readData(e,t)}readTypeIds(e,t){return this.readData(e,t)}readData(e,{length:t,offset:n}=this.nextBufferRange()){return this.bytes.subarray(n,n+t)}readDictionary(e){return this.dictionaries.get(e.id)}}class am extends om{constructor(e,t,n,r){super(new Uint8Array(0),t,n,r),this.sources=e}readNullBitmap(e,t,{offset:n}=this.nextBufferRange()){return t<=0?new Uint8Array(0):cy(this.sources[n])}readOffsets(e,{offset:t}=this.nextBufferRange()){return wf(Uint8Array,wf(Int32Array,this.sources[t]))}readTypeIds(e,{offset:t}=this.nextBufferRange()){return wf(Uint8Array,wf(e.ArrayType,this.sources[t]))}readData(e,{offset:t}=this.nextBufferRange()){const{sources:n}=this;return Ch.isTimestamp(e)||(Ch.isInt(e)||Ch.isTime(e))&&64===e.bitWidth||Ch.isDate(e)&&e.unit===Pf.MILLISECOND?wf(Uint8Array,im.convertArray(n[t])):Ch.isDecimal(e)?wf(Uint8Array,sm.convertArray(n[t])):Ch.isBinary(e)||Ch.isFixedSizeBinary(e)?function(e){const t=e.join(""),n=new Uint8Array(t.length/2);for(let r=0;r<t.length;r+=2)n[r>>1]=Number.parseInt(t.slice(r,r+2),16);return n}(n[t]):Ch.isBool(e)?cy(n[t]):Ch.isUtf8(e)?Jd(n[t].join("")):wf(Uint8Array,wf(e.ArrayType,n[t].map((e=>+e))))}}class lm extends qh{compareSchemas(e,t){return e===t||t instanceof e.constructor&&this.compareManyFields(e.fields,t.fields)}compareManyFields(e,t){return e===t||Array.isArray(e)&&Array.isArray(t)&&e.length===t.length&&e.every(((e,n)=>this.compareFields(e,t[n])))}compareFields(e,t){return e===t||t instanceof e.constructor&&e.name===t.name&&e.nullable===t.nullable&&this.visit(e.type,t.type)}}function um(e,t){return t instanceof e.constructor}function cm(e,t){return e===t||um(e,t)}function dm(e,t){return e===t||um(e,t)&&e.bitWidth===t.bitWidth&&e.isSigned===t.isSigned}function fm(e,t){return e===t||um(e,t)&&e.precision===t.precision}function hm(e,t){return e===t||um(e,t)&&e.unit===t.unit}function pm(e,t){return e===t||um(e,t)&&e.unit===t.unit&&e.timezone===t.timezone}function ym(e,t){return e===t||um(e,t)&&e.unit===t.unit&&e.bitWidth===t.bitWidth}function bm(e,t){return e===t||um(e,t)&&e.mode===t.mode&&e.typeIds.every(((e,n)=>e===t.typeIds[n]))&&gm.compareManyFields(e.children,t.children)}function mm(e,t){return e===t||um(e,t)&&e.unit===t.unit}lm.prototype.visitNull=cm,lm.prototype.visitBool=cm,lm.prototype.visitInt=dm,lm.prototype.visitInt8=dm,lm.prototype.visitInt16=dm,lm.prototype.visitInt32=dm,lm.prototype.visitInt64=dm,lm.prototype.visitUint8=dm,lm.prototype.visitUint16=dm,lm.prototype.visitUint32=dm,lm.prototype.visitUint64=dm,lm.prototype.visitFloat=fm,lm.prototype.visitFloat16=fm,lm.prototype.visitFloat32=fm,lm.prototype.visitFloat64=fm,lm.prototype.visitUtf8=cm,lm.prototype.visitBinary=cm,lm.prototype.visitFixedSizeBinary=function(e,t){return e===t||um(e,t)&&e.byteWidth===t.byteWidth},lm.prototype.visitDate=hm,lm.prototype.visitDateDay=hm,lm.prototype.visitDateMillisecond=hm,lm.prototype.visitTimestamp=pm,lm.prototype.visitTimestampSecond=pm,lm.prototype.visitTimestampMillisecond=pm,lm.prototype.visitTimestampMicrosecond=pm,lm.prototype.visitTimestampNanosecond=pm,lm.prototype.visitTime=ym,lm.prototype.visitTimeSecond=ym,lm.prototype.visitTimeMillisecond=ym,lm.prototype.visitTimeMicrosecond=ym,lm.prototype.visitTimeNanosecond=ym,lm.prototype.visitDecimal=cm,lm.prototype.visitList=function(e,t){return e===t||um(e,t)&&e.children.length===t.children.length&&gm.compareManyFields(e.children,t.children)},lm.prototype.visitStruct=function(e,t){return e===t||um(e,t)&&e.children.length===t.children.length&&gm.compareManyFields(e.children,t.children)},lm.prototype.visitUnion=bm,lm.prototype.visitDenseUnion=bm,lm.prototype.visitSparseUnion=bm,lm.prototype.visitDictionary=function(e,t){return e===t||um(e,t)&&e.id===t.id&&e.isOrdered===t.isOrdered&&gm.visit(e.indices,t.indices)&&gm.visit(e.dictionary,t.dictionary)},lm.prototype.visitInterval=mm,lm.prototype.visitIntervalDayTime=mm,lm.prototype.visitIntervalYearMonth=mm,lm.prototype.visitFixedSizeList=function(e,t){return e===t||um(e,t)&&e.listSize===t.listSize&&e.children.length===t.children.length&&gm.compareManyFields(e.children,t.children)},lm.prototype.visitMap=function(e,t){return e===t||um(e,t)&&e.keysSorted===t.keysSorted&&e.children.length===t.children.length&&gm.compareManyFields(e.children,t.children)};const gm=new lm;function vm(e,t){return gm.compareSchemas(e,t)}function wm(e,t){return function(e,t){const n=[...e.fields],r=[],i={numBatches:t.reduce(((e,t)=>Math.max(e,t.length)),0)};let s=0,o=0,a=-1;const l=t.length;let u,c=[];for(;i.numBatches-- >0;){for(o=Number.POSITIVE_INFINITY,a=-1;++a<l;)c[a]=u=t[a].shift(),o=Math.min(o,u?u.length:o);Number.isFinite(o)&&(c=_m(n,o,c,t,i),o>0&&(r[s++]=by({type:new Vh(n),length:o,nullCount:0,children:c.slice()})))}return[e=e.assign(n),r.map((t=>new km(e,t)))]}(e,t.map((e=>e.data.concat())))}function _m(e,t,n,r,i){var s;const o=(t+63&-64)>>3;for(let a=-1,l=r.length;++a<l;){const l=n[a],u=null==l?void 0:l.length;if(u>=t)u===t?n[a]=l:(n[a]=l.slice(0,t),i.numBatches=Math.max(i.numBatches,r[a].unshift(l.slice(t,u-t))));else{const r=e[a];e[a]=r.clone({nullable:!0}),n[a]=null!==(s=null==l?void 0:l._changeLengthAndBackfillNullBitmap(t))&&void 0!==s?s:by({type:r.type,length:t,nullCount:t,nullBitmap:new Uint8Array(o)})}}return n}var Sm,Im;class xm{constructor(...e){var t,n;if(0===e.length)return this.batches=[],this.schema=new Mb([]),this._offsets=[0],this;let r,i;e[0]instanceof Mb&&(r=e.shift()),e[e.length-1]instanceof Uint32Array&&(i=e.pop());const s=e=>{if(e){if(e instanceof km)return[e];if(e instanceof xm)return e.batches;if(e instanceof py){if(e.type instanceof Vh)return[new km(new Mb(e.type.children),e)]}else{if(Array.isArray(e))return e.flatMap((e=>s(e)));if("function"==typeof e[Symbol.iterator])return[...e].flatMap((e=>s(e)));if("object"==typeof e){const t=Object.keys(e),n=t.map((t=>new jy([e[t]]))),r=new Mb(t.map(((e,t)=>new Ab(String(e),n[t].type)))),[,i]=wm(r,n);return 0===i.length?[new km(e)]:i}}}return[]},o=e.flatMap((e=>s(e)));if(r=null!==(n=null!=r?r:null===(t=o[0])||void 0===t?void 0:t.schema)&&void 0!==n?n:new Mb([]),!(r instanceof Mb))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(const a of o){if(!(a instanceof km))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!vm(r,a.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=r,this.batches=o,this._offsets=null!=i?i:vy(this.data)}get data(){return this.batches.map((({data:e})=>e))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce(((e,t)=>e+t.length),0)}get nullCount(){return-1===this._nullCount&&(this._nullCount=gy(this.data)),this._nullCount}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}getByteLength(e){return 0}[Symbol.iterator](){return this.batches.length>0?My.visit(new jy(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return`[\n  ${this.toArray().join(",\n  ")}\n]`}concat(...e){const t=this.schema,n=this.data.concat(e.flatMap((({data:e})=>e)));return new xm(t,n.map((e=>new km(t,e))))}slice(e,t){const n=this.schema;[e,t]=ny({length:this.numRows},e,t);const r=wy(this.data,this._offsets,e,t);return new xm(n,r.map((e=>new km(n,e))))}getChild(e){return this.getChildAt(this.schema.fields.findIndex((t=>t.name===e)))}getChildAt(e){if(e>-1&&e<this.schema.fields.length){const t=this.data.map((t=>t.children[e]));if(0===t.length){const{type:n}=this.schema.fields[e],r=by({type:n,length:0,nullCount:0});t.push(r._changeLengthAndBackfillNullBitmap(this.numRows))}return new jy(t)}return null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex((t=>t.name===e)),t)}setChildAt(e,t){let n=this.schema,r=[...this.batches];if(e>-1&&e<this.numCols){t||(t=new jy([by({type:new Eh,length:this.numRows})]));const i=n.fields.slice(),s=i[e].clone({type:t.type}),o=this.schema.fields.map(((e,t)=>this.getChildAt(t)));[i[e],o[e]]=[s,t],[n,r]=wm(n,o)}return new xm(n,r)}select(e){const t=this.schema.fields.reduce(((e,t,n)=>e.set(t.name,n)),new Map);return this.selectAt(e.map((e=>t.get(e))).filter((e=>e>-1)))}selectAt(e){const t=this.schema.selectAt(e),n=this.batches.map((t=>t.selectAt(e)));return new xm(t,n)}assign(e){const t=this.schema.fields,[n,r]=e.schema.fields.reduce(((e,n,r)=>{const[i,s]=e,o=t.findIndex((e=>e.name===n.name));return~o?s[o]=r:i.push(r),e}),[[],[]]),i=this.schema.assign(e.schema),s=[...t.map(((e,t)=>[t,r[t]])).map((([t,n])=>void 0===n?this.getChildAt(t):e.getChildAt(n))),...n.map((t=>e.getChildAt(t)))].filter(Boolean);return new xm(...wm(i,s))}}Sm=Symbol.toStringTag,xm[Sm]=(e=>(e.schema=null,e.batches=[],e._offsets=new Uint32Array([0]),e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,e.isValid=Iy(Sy),e.get=Iy(qp.getVisitFn(Yf.Struct)),e.set=xy(Sp.getVisitFn(Yf.Struct)),e.indexOf=ky(Oy.getVisitFn(Yf.Struct)),e.getByteLength=Iy(Py.getVisitFn(Yf.Struct)),"Table"))(xm.prototype);let km=class e{constructor(...e){switch(e.length){case 2:if([this.schema]=e,!(this.schema instanceof Mb))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=by({nullCount:0,type:new Vh(this.schema.fields),children:this.schema.fields.map((e=>by({type:e.type,nullCount:0})))})]=e,!(this.data instanceof py))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=Tm(this.schema,this.data.children);break;case 1:{const[t]=e,{fields:n,children:r,length:i}=Object.keys(t).reduce(((e,n,r)=>(e.children[r]=t[n],e.length=Math.max(e.length,t[n].length),e.fields[r]=Ab.new({name:n,type:t[n].type,nullable:!0}),e)),{length:0,fields:new Array,children:new Array}),s=new Mb(n),o=by({type:new Vh(n),length:i,children:r,nullCount:0});[this.schema,this.data]=Tm(s,o.children,i);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=Cm(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(e){return this.data.getValid(e)}get(e){return qp.visit(this.data,e)}set(e,t){return Sp.visit(this.data,e,t)}indexOf(e,t){return Oy.visit(this.data,e,t)}getByteLength(e){return Py.visit(this.data,e)}[Symbol.iterator](){return My.visit(new jy([this.data]))}toArray(){return[...this]}concat(...e){return new xm(this.schema,[this,...e])}slice(t,n){const[r]=new jy([this.data]).slice(t,n).data;return new e(this.schema,r)}getChild(e){var t;return this.getChildAt(null===(t=this.schema.fields)||void 0===t?void 0:t.findIndex((t=>t.name===e)))}getChildAt(e){return e>-1&&e<this.schema.fields.length?new jy([this.data.children[e]]):null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex((t=>t.name===e)),t)}setChildAt(t,n){let r=this.schema,i=this.data;if(t>-1&&t<this.numCols){n||(n=new jy([by({type:new Eh,length:this.numRows})]));const e=r.fields.slice(),s=i.children.slice(),o=e[t].clone({type:n.type});[e[t],s[t]]=[o,n.data[0]],r=new Mb(e,new Map(this.schema.metadata)),i=by({type:new Vh(e),children:s})}return new e(r,i)}select(t){const n=this.schema.select(t),r=new Vh(n.fields),i=[];for(const e of t){const t=this.schema.fields.findIndex((t=>t.name===e));~t&&(i[t]=this.data.children[t])}return new e(n,by({type:r,length:this.numRows,children:i}))}selectAt(t){const n=this.schema.selectAt(t),r=t.map((e=>this.data.children[e])).filter(Boolean),i=by({type:new Vh(n.fields),length:this.numRows,children:r});return new e(n,i)}};function Tm(e,t,n=t.reduce(((e,t)=>Math.max(e,t.length)),0)){var r;const i=[...e.fields],s=[...t],o=(n+63&-64)>>3;for(const[a,l]of e.fields.entries()){const e=t[a];e&&e.length===n||(i[a]=l.clone({nullable:!0}),s[a]=null!==(r=null==e?void 0:e._changeLengthAndBackfillNullBitmap(n))&&void 0!==r?r:by({type:l.type,length:n,nullCount:n,nullBitmap:new Uint8Array(o)}))}return[e.assign(i),by({type:new Vh(i),length:n,children:s})]}function Cm(e,t,n=new Map){for(let r=-1,i=e.length;++r<i;){const i=e[r].type,s=t[r];if(Ch.isDictionary(i))if(n.has(i.id)){if(n.get(i.id)!==s.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else s.dictionary&&n.set(i.id,s.dictionary);i.children&&i.children.length>0&&Cm(i.children,s.children,n)}return n}Im=Symbol.toStringTag,km[Im]=(e=>(e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(km.prototype);class Em extends km{constructor(e){const t=e.fields.map((e=>by({type:e.type})));super(e,by({type:new Vh(e.fields),nullCount:0,children:t}))}}var Om,Bm,Dm,Nm;(Bm=Om||(Om={}))[Bm.BUFFER=0]="BUFFER",(Nm=Dm||(Dm={}))[Nm.LZ4_FRAME=0]="LZ4_FRAME",Nm[Nm.ZSTD=1]="ZSTD";class Mm{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBodyCompression(e,t){return(t||new Mm).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBodyCompression(e,t){return e.setPosition(e.position()+4),(t||new Mm).__init(e.readInt32(e.position())+e.position(),e)}codec(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt8(this.bb_pos+e):Dm.LZ4_FRAME}method(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt8(this.bb_pos+e):Om.BUFFER}static startBodyCompression(e){e.startObject(2)}static addCodec(e,t){e.addFieldInt8(0,t,Dm.LZ4_FRAME)}static addMethod(e,t){e.addFieldInt8(1,t,Om.BUFFER)}static endBodyCompression(e){return e.endObject()}static createBodyCompression(e,t,n){return Mm.startBodyCompression(e),Mm.addCodec(e,t),Mm.addMethod(e,n),Mm.endBodyCompression(e)}}class Am{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createBuffer(e,t,n){return e.prep(8,16),e.writeInt64(n),e.writeInt64(t),e.offset()}}let Fm=class{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createFieldNode(e,t,n){return e.prep(8,16),e.writeInt64(n),e.writeInt64(t),e.offset()}},Lm=class e{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsRecordBatch(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsRecordBatch(t,n){return t.setPosition(t.position()+4),(n||new e).__init(t.readInt32(t.position())+t.position(),t)}length(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}nodes(e,t){const n=this.bb.__offset(this.bb_pos,6);return n?(t||new Fm).__init(this.bb.__vector(this.bb_pos+n)+16*e,this.bb):null}nodesLength(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}buffers(e,t){const n=this.bb.__offset(this.bb_pos,8);return n?(t||new Am).__init(this.bb.__vector(this.bb_pos+n)+16*e,this.bb):null}buffersLength(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}compression(e){const t=this.bb.__offset(this.bb_pos,10);return t?(e||new Mm).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}static startRecordBatch(e){e.startObject(4)}static addLength(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}static addNodes(e,t){e.addFieldOffset(1,t,0)}static startNodesVector(e,t){e.startVector(16,t,8)}static addBuffers(e,t){e.addFieldOffset(2,t,0)}static startBuffersVector(e,t){e.startVector(16,t,8)}static addCompression(e,t){e.addFieldOffset(3,t,0)}static endRecordBatch(e){return e.endObject()}},Um=class e{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDictionaryBatch(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDictionaryBatch(t,n){return t.setPosition(t.position()+4),(n||new e).__init(t.readInt32(t.position())+t.position(),t)}id(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}data(e){const t=this.bb.__offset(this.bb_pos,6);return t?(e||new Lm).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}isDelta(){const e=this.bb.__offset(this.bb_pos,8);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}static startDictionaryBatch(e){e.startObject(3)}static addId(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}static addData(e,t){e.addFieldOffset(1,t,0)}static addIsDelta(e,t){e.addFieldInt8(2,+t,0)}static endDictionaryBatch(e){return e.endObject()}};var Pm;!function(e){e[e.NONE=0]="NONE",e[e.Schema=1]="Schema",e[e.DictionaryBatch=2]="DictionaryBatch",e[e.RecordBatch=3]="RecordBatch",e[e.Tensor=4]="Tensor",e[e.SparseTensor=5]="SparseTensor"}(Pm||(Pm={}));let zm=class e{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsMessage(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMessage(t,n){return t.setPosition(t.position()+4),(n||new e).__init(t.readInt32(t.position())+t.position(),t)}version(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):tb.V1}headerType(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readUint8(this.bb_pos+e):Pm.NONE}header(e){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__union(e,this.bb_pos+t):null}bodyLength(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,12);return n?(t||new eb).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,12);return e?this.bb.__vector_len(this.bb_pos+e):0}static startMessage(e){e.startObject(5)}static addVersion(e,t){e.addFieldInt16(0,t,tb.V1)}static addHeaderType(e,t){e.addFieldInt8(1,t,Pm.NONE)}static addHeader(e,t){e.addFieldOffset(2,t,0)}static addBodyLength(e,t){e.addFieldInt64(3,t,e.createLong(0,0))}static addCustomMetadata(e,t){e.addFieldOffset(4,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endMessage(e){return e.endObject()}static finishMessageBuffer(e,t){e.finish(t)}static finishSizePrefixedMessageBuffer(e,t){e.finish(t,void 0,!0)}static createMessage(t,n,r,i,s,o){return e.startMessage(t),e.addVersion(t,n),e.addHeaderType(t,r),e.addHeader(t,i),e.addBodyLength(t,s),e.addCustomMetadata(t,o),e.endMessage(t)}};var Rm=qy;const Vm=new class extends qh{visit(e,t){return null==e||null==t?void 0:super.visit(e,t)}visitNull(e,t){return Sb.startNull(t),Sb.endNull(t)}visitInt(e,t){return ab.startInt(t),ab.addBitWidth(t,e.bitWidth),ab.addIsSigned(t,e.isSigned),ab.endInt(t)}visitFloat(e,t){return gb.startFloatingPoint(t),gb.addPrecision(t,e.precision),gb.endFloatingPoint(t)}visitBinary(e,t){return ub.startBinary(t),ub.endBinary(t)}visitBool(e,t){return cb.startBool(t),cb.endBool(t)}visitUtf8(e,t){return Ob.startUtf8(t),Ob.endUtf8(t)}visitDecimal(e,t){return fb.startDecimal(t),fb.addScale(t,e.scale),fb.addPrecision(t,e.precision),fb.addBitWidth(t,e.bitWidth),fb.endDecimal(t)}visitDate(e,t){return db.startDate(t),db.addUnit(t,e.unit),db.endDate(t)}visitTime(e,t){return xb.startTime(t),xb.addUnit(t,e.unit),xb.addBitWidth(t,e.bitWidth),xb.endTime(t)}visitTimestamp(e,t){const n=e.timezone&&t.createString(e.timezone)||void 0;return kb.startTimestamp(t),kb.addUnit(t,e.unit),void 0!==n&&kb.addTimezone(t,n),kb.endTimestamp(t)}visitInterval(e,t){return vb.startInterval(t),vb.addUnit(t,e.unit),vb.endInterval(t)}visitList(e,t){return wb.startList(t),wb.endList(t)}visitStruct(e,t){return Ib.startStruct_(t),Ib.endStruct_(t)}visitUnion(e,t){Eb.startTypeIdsVector(t,e.typeIds.length);const n=Eb.createTypeIdsVector(t,e.typeIds);return Eb.startUnion(t),Eb.addMode(t,e.mode),Eb.addTypeIds(t,n),Eb.endUnion(t)}visitDictionary(e,t){const n=this.visit(e.indices,t);return lb.startDictionaryEncoding(t),lb.addId(t,new Rm(e.id,0)),lb.addIsOrdered(t,e.isOrdered),void 0!==n&&lb.addIndexType(t,n),lb.endDictionaryEncoding(t)}visitFixedSizeBinary(e,t){return bb.startFixedSizeBinary(t),bb.addByteWidth(t,e.byteWidth),bb.endFixedSizeBinary(t)}visitFixedSizeList(e,t){return mb.startFixedSizeList(t),mb.addListSize(t,e.listSize),mb.endFixedSizeList(t)}visitMap(e,t){return _b.startMap(t),_b.addKeysSorted(t,e.keysSorted),_b.endMap(t)}};function jm(e){return new Zm(e.count,Wm(e.columns),Hm(e.columns))}function $m(e,t){return(e.children||[]).filter(Boolean).map((e=>Ab.fromJSON(e,t)))}function Wm(e){return(e||[]).reduce(((e,t)=>{return[...e,new ng(t.count,(n=t.VALIDITY,(n||[]).reduce(((e,t)=>e+ +(0===t)),0))),...Wm(t.children)];var n}),[])}function Hm(e,t=[]){for(let n=-1,r=(e||[]).length;++n<r;){const r=e[n];r.VALIDITY&&t.push(new tg(t.length,r.VALIDITY.length)),r.TYPE&&t.push(new tg(t.length,r.TYPE.length)),r.OFFSET&&t.push(new tg(t.length,r.OFFSET.length)),r.DATA&&t.push(new tg(t.length,r.DATA.length)),t=Hm(r.children,t)}return t}function Ym(e){return new Map(Object.entries(e||{}))}function Qm(e){return new Oh(e.isSigned,e.bitWidth)}function Km(e,t){const n=e.type.name;switch(n){case"NONE":case"null":return new Eh;case"binary":return new Nh;case"utf8":return new Mh;case"bool":return new Ah;case"list":return new Rh((t||[])[0]);case"struct":case"struct_":return new Vh(t||[])}switch(n){case"int":{const t=e.type;return new Oh(t.isSigned,t.bitWidth)}case"floatingpoint":{const t=e.type;return new Dh(Lf[t.precision])}case"decimal":{const t=e.type;return new Fh(t.scale,t.precision,t.bitWidth)}case"date":{const t=e.type;return new Lh(Pf[t.unit])}case"time":{const t=e.type;return new Uh(Rf[t.unit],t.bitWidth)}case"timestamp":{const t=e.type;return new Ph(Rf[t.unit],t.timezone)}case"interval":{const t=e.type;return new zh(jf[t.unit])}case"union":{const n=e.type;return new jh(Af[n.mode],n.typeIds||[],t||[])}case"fixedsizebinary":{const t=e.type;return new $h(t.byteWidth)}case"fixedsizelist":{const n=e.type;return new Wh(n.listSize,(t||[])[0])}case"map":{const n=e.type;return new Hh((t||[])[0],n.keysSorted)}}throw new Error(`Unrecognized type: "${n}"`)}var qm=qy,Jm=Zy,Gm=Xy;class Xm{constructor(e,t,n,r){this._version=t,this._headerType=n,this.body=new Uint8Array(0),r&&(this._createHeader=()=>r),this._bodyLength="number"==typeof e?e:e.low}static fromJSON(e,t){const n=new Xm(0,Nf.V4,t);return n._createHeader=function(e,t){return()=>{switch(t){case Wf.Schema:return Mb.fromJSON(e);case Wf.RecordBatch:return Zm.fromJSON(e);case Wf.DictionaryBatch:return eg.fromJSON(e)}throw new Error(`Unrecognized Message type: { name: ${Wf[t]}, type: ${t} }`)}}(e,t),n}static decode(e){e=new Gm(Sf(e));const t=zm.getRootAsMessage(e),n=t.bodyLength(),r=t.version(),i=t.headerType(),s=new Xm(n,r,i);return s._createHeader=function(e,t){return()=>{switch(t){case Wf.Schema:return Mb.decode(e.header(new Db));case Wf.RecordBatch:return Zm.decode(e.header(new Lm),e.version());case Wf.DictionaryBatch:return eg.decode(e.header(new Um),e.version())}throw new Error(`Unrecognized Message type: { name: ${Wf[t]}, type: ${t} }`)}}(t,i),s}static encode(e){const t=new Jm;let n=-1;return e.isSchema()?n=Mb.encode(t,e.header()):e.isRecordBatch()?n=Zm.encode(t,e.header()):e.isDictionaryBatch()&&(n=eg.encode(t,e.header())),zm.startMessage(t),zm.addVersion(t,Nf.V4),zm.addHeader(t,n),zm.addHeaderType(t,e.headerType),zm.addBodyLength(t,new qm(e.bodyLength,0)),zm.finishMessageBuffer(t,zm.endMessage(t)),t.asUint8Array()}static from(e,t=0){if(e instanceof Mb)return new Xm(0,Nf.V4,Wf.Schema,e);if(e instanceof Zm)return new Xm(t,Nf.V4,Wf.RecordBatch,e);if(e instanceof eg)return new Xm(t,Nf.V4,Wf.DictionaryBatch,e);throw new Error(`Unrecognized Message header: ${e}`)}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===Wf.Schema}isRecordBatch(){return this.headerType===Wf.RecordBatch}isDictionaryBatch(){return this.headerType===Wf.DictionaryBatch}}class Zm{constructor(e,t,n){this._nodes=t,this._buffers=n,this._length="number"==typeof e?e:e.low}get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}}class eg{constructor(e,t,n=!1){this._data=e,this._isDelta=n,this._id="number"==typeof t?t:t.low}get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}}class tg{constructor(e,t){this.offset="number"==typeof e?e:e.low,this.length="number"==typeof t?t:t.low}}class ng{constructor(e,t){this.length="number"==typeof e?e:e.low,this.nullCount="number"==typeof t?t:t.low}}function rg(e,t){const n=[];for(let r,i=-1,s=-1,o=e.childrenLength();++i<o;)(r=e.children(i))&&(n[++s]=Ab.decode(r,t));return n}function ig(e){const t=new Map;if(e)for(let n,r,i=-1,s=Math.trunc(e.customMetadataLength());++i<s;)(n=e.customMetadata(i))&&null!=(r=n.key())&&t.set(r,n.value());return t}function sg(e){return new Oh(e.isSigned(),e.bitWidth())}function og(e,t){const n=e.typeType();switch(n){case Cb.NONE:case Cb.Null:return new Eh;case Cb.Binary:return new Nh;case Cb.Utf8:return new Mh;case Cb.Bool:return new Ah;case Cb.List:return new Rh((t||[])[0]);case Cb.Struct_:return new Vh(t||[])}switch(n){case Cb.Int:{const t=e.type(new ab);return new Oh(t.isSigned(),t.bitWidth())}case Cb.FloatingPoint:{const t=e.type(new gb);return new Dh(t.precision())}case Cb.Decimal:{const t=e.type(new fb);return new Fh(t.scale(),t.precision(),t.bitWidth())}case Cb.Date:{const t=e.type(new db);return new Lh(t.unit())}case Cb.Time:{const t=e.type(new xb);return new Uh(t.unit(),t.bitWidth())}case Cb.Timestamp:{const t=e.type(new kb);return new Ph(t.unit(),t.timezone())}case Cb.Interval:{const t=e.type(new vb);return new zh(t.unit())}case Cb.Union:{const n=e.type(new Eb);return new jh(n.mode(),n.typeIdsArray()||[],t||[])}case Cb.FixedSizeBinary:{const t=e.type(new bb);return new $h(t.byteWidth())}case Cb.FixedSizeList:{const n=e.type(new mb);return new Wh(n.listSize(),(t||[])[0])}case Cb.Map:{const n=e.type(new _b);return new Hh((t||[])[0],n.keysSorted())}}throw new Error(`Unrecognized type: "${Cb[n]}" (${n})`)}Ab.encode=function(e,t){let n=-1,r=-1,i=-1;const s=t.type;let o=t.typeId;Ch.isDictionary(s)?(o=s.dictionary.typeId,i=Vm.visit(s,e),r=Vm.visit(s.dictionary,e)):r=Vm.visit(s,e);const a=(s.children||[]).map((t=>Ab.encode(e,t))),l=Bb.createChildrenVector(e,a),u=t.metadata&&t.metadata.size>0?Bb.createCustomMetadataVector(e,[...t.metadata].map((([t,n])=>{const r=e.createString(`${t}`),i=e.createString(`${n}`);return eb.startKeyValue(e),eb.addKey(e,r),eb.addValue(e,i),eb.endKeyValue(e)}))):-1;t.name&&(n=e.createString(t.name));Bb.startField(e),Bb.addType(e,r),Bb.addTypeType(e,o),Bb.addChildren(e,l),Bb.addNullable(e,!!t.nullable),-1!==n&&Bb.addName(e,n);-1!==i&&Bb.addDictionary(e,i);-1!==u&&Bb.addCustomMetadata(e,u);return Bb.endField(e)},Ab.decode=function(e,t){let n,r,i,s,o,a;t&&(a=e.dictionary())?t.has(n=a.id().low)?(s=(s=a.indexType())?sg(s):new Bh,o=new Qh(t.get(n),s,n,a.isOrdered()),r=new Ab(e.name(),o,e.nullable(),ig(e))):(s=(s=a.indexType())?sg(s):new Bh,t.set(n,i=og(e,rg(e,t))),o=new Qh(i,s,n,a.isOrdered()),r=new Ab(e.name(),o,e.nullable(),ig(e))):(i=og(e,rg(e,t)),r=new Ab(e.name(),i,e.nullable(),ig(e)));return r||null},Ab.fromJSON=function(e,t){let n,r,i,s,o,a;return t&&(s=e.dictionary)?t.has(n=s.id)?(r=(r=s.indexType)?Qm(r):new Bh,a=new Qh(t.get(n),r,n,s.isOrdered),i=new Ab(e.name,a,e.nullable,Ym(e.customMetadata))):(r=(r=s.indexType)?Qm(r):new Bh,t.set(n,o=Km(e,$m(e,t))),a=new Qh(o,r,n,s.isOrdered),i=new Ab(e.name,a,e.nullable,Ym(e.customMetadata))):(o=Km(e,$m(e,t)),i=new Ab(e.name,o,e.nullable,Ym(e.customMetadata))),i||null},Mb.encode=function(e,t){const n=t.fields.map((t=>Ab.encode(e,t)));Db.startFieldsVector(e,n.length);const r=Db.createFieldsVector(e,n),i=t.metadata&&t.metadata.size>0?Db.createCustomMetadataVector(e,[...t.metadata].map((([t,n])=>{const r=e.createString(`${t}`),i=e.createString(`${n}`);return eb.startKeyValue(e),eb.addKey(e,r),eb.addValue(e,i),eb.endKeyValue(e)}))):-1;Db.startSchema(e),Db.addFields(e,r),Db.addEndianness(e,ag?nb.Little:nb.Big),-1!==i&&Db.addCustomMetadata(e,i);return Db.endSchema(e)},Mb.decode=function(e,t=new Map){const n=function(e,t){const n=[];for(let r,i=-1,s=-1,o=e.fieldsLength();++i<o;)(r=e.fields(i))&&(n[++s]=Ab.decode(r,t));return n}(e,t);return new Mb(n,ig(e),t)},Mb.fromJSON=function(e,t=new Map){return new Mb(function(e,t){return(e.fields||[]).filter(Boolean).map((e=>Ab.fromJSON(e,t)))}(e,t),Ym(e.customMetadata),t)},Zm.encode=function(e,t){const n=t.nodes||[],r=t.buffers||[];Lm.startNodesVector(e,n.length);for(const o of n.slice().reverse())ng.encode(e,o);const i=e.endVector();Lm.startBuffersVector(e,r.length);for(const o of r.slice().reverse())tg.encode(e,o);const s=e.endVector();return Lm.startRecordBatch(e),Lm.addLength(e,new qm(t.length,0)),Lm.addNodes(e,i),Lm.addBuffers(e,s),Lm.endRecordBatch(e)},Zm.decode=function(e,t=Nf.V4){if(null!==e.compression())throw new Error("Record batch compression not implemented");return new Zm(e.length(),function(e){const t=[];for(let n,r=-1,i=-1,s=e.nodesLength();++r<s;)(n=e.nodes(r))&&(t[++i]=ng.decode(n));return t}(e),function(e,t){const n=[];for(let r,i=-1,s=-1,o=e.buffersLength();++i<o;)(r=e.buffers(i))&&(t<Nf.V4&&(r.bb_pos+=8*(i+1)),n[++s]=tg.decode(r));return n}(e,t))},Zm.fromJSON=jm,eg.encode=function(e,t){const n=Zm.encode(e,t.data);return Um.startDictionaryBatch(e),Um.addId(e,new qm(t.id,0)),Um.addIsDelta(e,t.isDelta),Um.addData(e,n),Um.endDictionaryBatch(e)},eg.decode=function(e,t=Nf.V4){return new eg(Zm.decode(e.data(),t),e.id(),e.isDelta())},eg.fromJSON=function(e){return new eg(jm(e.data),e.id,e.isDelta)},ng.encode=function(e,t){return Fm.createFieldNode(e,new qm(t.length,0),new qm(t.nullCount,0))},ng.decode=function(e){return new ng(e.length(),e.nullCount())},tg.encode=function(e,t){return Am.createBuffer(e,new qm(t.offset,0),new qm(t.length,0))},tg.decode=function(e){return new tg(e.offset(),e.length())};const ag=(()=>{const e=new ArrayBuffer(2);return new DataView(e).setInt16(0,256,!0),256===new Int16Array(e)[0]})(),lg=e=>`Expected ${Wf[e]} Message in stream, but was null or length 0.`,ug=e=>`Header pointer of flatbuffer-encoded ${Wf[e]} Message is null or length 0.`,cg=(e,t)=>`Expected to read ${e} metadata bytes, but only read ${t}.`,dg=(e,t)=>`Expected to read ${e} bytes for message body, but only read ${t}.`;class fg{constructor(e){this.source=e instanceof Kb?e:new Kb(e)}[Symbol.iterator](){return this}next(){let e;return(e=this.readMetadataLength()).done||-1===e.value&&(e=this.readMetadataLength()).done||(e=this.readMetadata(e.value)).done?$b:e}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}readMessage(e){let t;if((t=this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(lg(e));return t.value}readMessageBody(e){if(e<=0)return new Uint8Array(0);const t=Sf(this.source.read(e));if(t.byteLength<e)throw new Error(dg(e,t.byteLength));return t.byteOffset%8==0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()}readSchema(e=!1){const t=Wf.Schema,n=this.readMessage(t),r=null==n?void 0:n.header();if(e&&!r)throw new Error(ug(t));return r}readMetadataLength(){const e=this.source.read(yg),t=e&&new Xy(e),n=(null==t?void 0:t.readInt32(0))||0;return{done:0===n,value:n}}readMetadata(e){const t=this.source.read(e);if(!t)return $b;if(t.byteLength<e)throw new Error(cg(e,t.byteLength));return{done:!1,value:Xm.decode(t)}}}class hg{constructor(e,t){this.source=e instanceof qb?e:ff(e)?new Zb(e,t):new qb(e)}[Symbol.asyncIterator](){return this}next(){return Vd(this,void 0,void 0,(function*(){let e;return(e=yield this.readMetadataLength()).done||-1===e.value&&(e=yield this.readMetadataLength()).done||(e=yield this.readMetadata(e.value)).done?$b:e}))}throw(e){return Vd(this,void 0,void 0,(function*(){return yield this.source.throw(e)}))}return(e){return Vd(this,void 0,void 0,(function*(){return yield this.source.return(e)}))}readMessage(e){return Vd(this,void 0,void 0,(function*(){let t;if((t=yield this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(lg(e));return t.value}))}readMessageBody(e){return Vd(this,void 0,void 0,(function*(){if(e<=0)return new Uint8Array(0);const t=Sf(yield this.source.read(e));if(t.byteLength<e)throw new Error(dg(e,t.byteLength));return t.byteOffset%8==0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()}))}readSchema(e=!1){return Vd(this,void 0,void 0,(function*(){const t=Wf.Schema,n=yield this.readMessage(t),r=null==n?void 0:n.header();if(e&&!r)throw new Error(ug(t));return r}))}readMetadataLength(){return Vd(this,void 0,void 0,(function*(){const e=yield this.source.read(yg),t=e&&new Xy(e),n=(null==t?void 0:t.readInt32(0))||0;return{done:0===n,value:n}}))}readMetadata(e){return Vd(this,void 0,void 0,(function*(){const t=yield this.source.read(e);if(!t)return $b;if(t.byteLength<e)throw new Error(cg(e,t.byteLength));return{done:!1,value:Xm.decode(t)}}))}}class pg extends fg{constructor(e){super(new Uint8Array(0)),this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=e instanceof Wb?e:new Wb(e)}next(){const{_json:e}=this;if(!this._schema){this._schema=!0;return{done:!1,value:Xm.fromJSON(e.schema,Wf.Schema)}}if(this._dictionaryIndex<e.dictionaries.length){const t=e.dictionaries[this._dictionaryIndex++];this._body=t.data.columns;return{done:!1,value:Xm.fromJSON(t,Wf.DictionaryBatch)}}if(this._batchIndex<e.batches.length){const t=e.batches[this._batchIndex++];this._body=t.columns;return{done:!1,value:Xm.fromJSON(t,Wf.RecordBatch)}}return this._body=[],$b}readMessageBody(e){return function e(t){return(t||[]).reduce(((t,n)=>[...t,...n.VALIDITY&&[n.VALIDITY]||[],...n.TYPE&&[n.TYPE]||[],...n.OFFSET&&[n.OFFSET]||[],...n.DATA&&[n.DATA]||[],...e(n.children)]),[])}(this._body)}readMessage(e){let t;if((t=this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(lg(e));return t.value}readSchema(){const e=Wf.Schema,t=this.readMessage(e),n=null==t?void 0:t.header();if(!t||!n)throw new Error(ug(e));return n}}const yg=4,bg="ARROW1",mg=new Uint8Array(6);for(let av=0;av<6;av+=1)mg[av]=bg.codePointAt(av);function gg(e,t=0){for(let n=-1,r=mg.length;++n<r;)if(mg[n]!==e[t+n])return!1;return!0}const vg=mg.length,wg=vg+yg,_g=2*vg+yg;class Sg extends Hb{constructor(e){super(),this._impl=e}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(e){return this._impl.throw(e)}return(e){return this._impl.return(e)}cancel(){return this._impl.cancel()}reset(e){return this._impl.reset(e),this._DOMStream=void 0,this._nodeStream=void 0,this}open(e){const t=this._impl.open(e);return af(t)?t.then((()=>this)):this}readRecordBatch(e){return this._impl.isFile()?this._impl.readRecordBatch(e):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return Ef.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return Ef.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw new Error('"throughDOM" not available in this environment')}static from(e){return e instanceof Sg?e:cf(e)?function(e){return new Ig(new Ng(e))}(e):ff(e)?function(e){return Vd(this,void 0,void 0,(function*(){const{size:t}=yield e.stat(),n=new Zb(e,t);return t>=_g&&gg(yield n.readAt(0,vg+7&-8))?new Tg(new Dg(n)):new xg(new Og(n))}))}(e):af(e)?(()=>Vd(this,void 0,void 0,(function*(){return yield Sg.from(yield e)})))():hf(e)||yf(e)||bf(e)||uf(e)?function(e){return Vd(this,void 0,void 0,(function*(){const t=yield e.peek(vg+7&-8);return t&&t.byteLength>=4?gg(t)?new kg(new Bg(yield e.read())):new xg(new Og(e)):new xg(new Og(function(){return Wd(this,arguments,(function*(){}))}()))}))}(new qb(e)):function(e){const t=e.peek(vg+7&-8);return t&&t.byteLength>=4?gg(t)?new kg(new Bg(e.read())):new Ig(new Eg(e)):new Ig(new Eg(function*(){}()))}(new Kb(e))}static readAll(e){return e instanceof Sg?e.isSync()?Ag(e):Fg(e):cf(e)||ArrayBuffer.isView(e)||lf(e)||df(e)?Ag(e):Fg(e)}}class Ig extends Sg{constructor(e){super(e),this._impl=e}readAll(){return[...this]}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return Wd(this,arguments,(function*(){yield $d(yield*Hd(Yd(this[Symbol.iterator]())))}))}}class xg extends Sg{constructor(e){super(e),this._impl=e}readAll(){var e,t;return Vd(this,void 0,void 0,(function*(){const n=new Array;try{for(var r,i=Yd(this);!(r=yield i.next()).done;){const e=r.value;n.push(e)}}catch(s){e={error:s}}finally{try{r&&!r.done&&(t=i.return)&&(yield t.call(i))}finally{if(e)throw e.error}}return n}))}[Symbol.iterator](){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}}class kg extends Ig{constructor(e){super(e),this._impl=e}}class Tg extends xg{constructor(e){super(e),this._impl=e}}class Cg{constructor(e=new Map){this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=e}get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(e){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=e,this.dictionaries=new Map,this}_loadRecordBatch(e,t){const n=this._loadVectors(e,t,this.schema.fields),r=by({type:new Vh(this.schema.fields),length:e.length,children:n});return new km(this.schema,r)}_loadDictionaryBatch(e,t){const{id:n,isDelta:r}=e,{dictionaries:i,schema:s}=this,o=i.get(n);if(r||!o){const i=s.dictionaries.get(n),a=this._loadVectors(e.data,t,[i]);return(o&&r?o.concat(new jy(a)):new jy(a)).memoize()}return o.memoize()}_loadVectors(e,t,n){return new om(t,e.nodes,e.buffers,this.dictionaries).visitMany(n)}}class Eg extends Cg{constructor(e,t){super(t),this._reader=cf(e)?new pg(this._handle=e):new fg(this._handle=e)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}open(e){return this.closed||(this.autoDestroy=Mg(this,e),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}throw(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(e):$b}return(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(e):$b}next(){if(this.closed)return $b;let e;const{_reader:t}=this;for(;e=this._readNextMessageAndValidate();)if(e.isSchema())this.reset(e.header());else{if(e.isRecordBatch()){this._recordBatchIndex++;const n=e.header(),r=t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(e.isDictionaryBatch()){this._dictionaryIndex++;const n=e.header(),r=t.readMessageBody(e.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new Em(this.schema)}):this.return()}_readNextMessageAndValidate(e){return this._reader.readMessage(e)}}class Og extends Cg{constructor(e,t){super(t),this._reader=new hg(this._handle=e)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}cancel(){return Vd(this,void 0,void 0,(function*(){!this.closed&&(this.closed=!0)&&(yield this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}))}open(e){return Vd(this,void 0,void 0,(function*(){return this.closed||(this.autoDestroy=Mg(this,e),this.schema||(this.schema=yield this._reader.readSchema())||(yield this.cancel())),this}))}throw(e){return Vd(this,void 0,void 0,(function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.throw(e):$b}))}return(e){return Vd(this,void 0,void 0,(function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.return(e):$b}))}next(){return Vd(this,void 0,void 0,(function*(){if(this.closed)return $b;let e;const{_reader:t}=this;for(;e=yield this._readNextMessageAndValidate();)if(e.isSchema())yield this.reset(e.header());else{if(e.isRecordBatch()){this._recordBatchIndex++;const n=e.header(),r=yield t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(e.isDictionaryBatch()){this._dictionaryIndex++;const n=e.header(),r=yield t.readMessageBody(e.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new Em(this.schema)}):yield this.return()}))}_readNextMessageAndValidate(e){return Vd(this,void 0,void 0,(function*(){return yield this._reader.readMessage(e)}))}}class Bg extends Eg{constructor(e,t){super(e instanceof Xb?e:new Xb(e),t)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isSync(){return!0}isFile(){return!0}open(e){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(const e of this._footer.dictionaryBatches())e&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(e)}readRecordBatch(e){var t;if(this.closed)return null;this._footer||this.open();const n=null===(t=this._footer)||void 0===t?void 0:t.getRecordBatch(e);if(n&&this._handle.seek(n.offset)){const e=this._reader.readMessage(Wf.RecordBatch);if(null==e?void 0:e.isRecordBatch()){const t=e.header(),n=this._reader.readMessageBody(e.bodyLength);return this._loadRecordBatch(t,n)}}return null}_readDictionaryBatch(e){var t;const n=null===(t=this._footer)||void 0===t?void 0:t.getDictionaryBatch(e);if(n&&this._handle.seek(n.offset)){const e=this._reader.readMessage(Wf.DictionaryBatch);if(null==e?void 0:e.isDictionaryBatch()){const t=e.header(),n=this._reader.readMessageBody(e.bodyLength),r=this._loadDictionaryBatch(t,n);this.dictionaries.set(t.id,r)}}}_readFooter(){const{_handle:e}=this,t=e.size-wg,n=e.readInt32(t),r=e.readAt(t-n,n);return Rb.decode(r)}_readNextMessageAndValidate(e){var t;if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){const n=null===(t=this._footer)||void 0===t?void 0:t.getRecordBatch(this._recordBatchIndex);if(n&&this._handle.seek(n.offset))return this._reader.readMessage(e)}return null}}class Dg extends Og{constructor(e,...t){const n="number"!=typeof t[0]?t.shift():void 0,r=t[0]instanceof Map?t.shift():void 0;super(e instanceof Zb?e:new Zb(e,n),r)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isFile(){return!0}isAsync(){return!0}open(e){const t=Object.create(null,{open:{get:()=>super.open}});return Vd(this,void 0,void 0,(function*(){if(!this.closed&&!this._footer){this.schema=(this._footer=yield this._readFooter()).schema;for(const e of this._footer.dictionaryBatches())e&&(yield this._readDictionaryBatch(this._dictionaryIndex++))}return yield t.open.call(this,e)}))}readRecordBatch(e){var t;return Vd(this,void 0,void 0,(function*(){if(this.closed)return null;this._footer||(yield this.open());const n=null===(t=this._footer)||void 0===t?void 0:t.getRecordBatch(e);if(n&&(yield this._handle.seek(n.offset))){const e=yield this._reader.readMessage(Wf.RecordBatch);if(null==e?void 0:e.isRecordBatch()){const t=e.header(),n=yield this._reader.readMessageBody(e.bodyLength);return this._loadRecordBatch(t,n)}}return null}))}_readDictionaryBatch(e){var t;return Vd(this,void 0,void 0,(function*(){const n=null===(t=this._footer)||void 0===t?void 0:t.getDictionaryBatch(e);if(n&&(yield this._handle.seek(n.offset))){const e=yield this._reader.readMessage(Wf.DictionaryBatch);if(null==e?void 0:e.isDictionaryBatch()){const t=e.header(),n=yield this._reader.readMessageBody(e.bodyLength),r=this._loadDictionaryBatch(t,n);this.dictionaries.set(t.id,r)}}}))}_readFooter(){return Vd(this,void 0,void 0,(function*(){const{_handle:e}=this;e._pending&&(yield e._pending);const t=e.size-wg,n=yield e.readInt32(t),r=yield e.readAt(t-n,n);return Rb.decode(r)}))}_readNextMessageAndValidate(e){return Vd(this,void 0,void 0,(function*(){if(this._footer||(yield this.open()),this._footer&&this._recordBatchIndex<this.numRecordBatches){const t=this._footer.getRecordBatch(this._recordBatchIndex);if(t&&(yield this._handle.seek(t.offset)))return yield this._reader.readMessage(e)}return null}))}}class Ng extends Eg{constructor(e,t){super(e,t)}_loadVectors(e,t,n){return new am(t,e.nodes,e.buffers,this.dictionaries).visitMany(n)}}function Mg(e,t){return t&&"boolean"==typeof t.autoDestroy?t.autoDestroy:e.autoDestroy}function*Ag(e){const t=Sg.from(e);try{if(!t.open({autoDestroy:!1}).closed)do{yield t}while(!t.reset().open().closed)}finally{t.cancel()}}function Fg(e){return Wd(this,arguments,(function*(){const t=yield $d(Sg.from(e));try{if(!(yield $d(t.open({autoDestroy:!1}))).closed)do{yield yield $d(t)}while(!(yield $d(t.reset().open())).closed)}finally{yield $d(t.cancel())}}))}class Lg extends qh{constructor(){super(),this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}static assemble(...e){const t=e=>e.flatMap((e=>Array.isArray(e)?t(e):e instanceof km?e.data.children:e.data)),n=new Lg;return n.visitMany(t(e)),n}visit(e){if(e instanceof jy)return this.visitMany(e.data),this;const{type:t}=e;if(!Ch.isDictionary(t)){const{length:n,nullCount:r}=e;if(n>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");Ch.isNull(t)||Ug.call(this,r<=0?new Uint8Array(0):uy(e.offset,n,e.nullBitmap)),this.nodes.push(new ng(n,r))}return super.visit(e)}visitNull(e){return this}visitDictionary(e){return this.visit(e.clone(e.type.indices))}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}}function Ug(e){const t=e.byteLength+7&-8;return this.buffers.push(e),this.bufferRegions.push(new tg(this._byteLength,t)),this._byteLength+=t,this}function Pg(e){return Ug.call(this,e.values.subarray(0,e.length*e.stride))}function zg(e){const{length:t,values:n,valueOffsets:r}=e,i=r[0],s=r[t],o=Math.min(s-i,n.byteLength-i);return Ug.call(this,Cf(-r[0],t,r)),Ug.call(this,n.subarray(i,i+o)),this}function Rg(e){const{length:t,valueOffsets:n}=e;return n&&Ug.call(this,Cf(n[0],t,n)),this.visit(e.children[0])}function Vg(e){return this.visitMany(e.type.children.map(((t,n)=>e.children[n])).filter(Boolean))[0]}Lg.prototype.visitBool=function(e){let t;return e.nullCount>=e.length?Ug.call(this,new Uint8Array(0)):(t=e.values)instanceof Uint8Array?Ug.call(this,uy(e.offset,e.length,t)):Ug.call(this,cy(e.values))},Lg.prototype.visitInt=Pg,Lg.prototype.visitFloat=Pg,Lg.prototype.visitUtf8=zg,Lg.prototype.visitBinary=zg,Lg.prototype.visitFixedSizeBinary=Pg,Lg.prototype.visitDate=Pg,Lg.prototype.visitTimestamp=Pg,Lg.prototype.visitTime=Pg,Lg.prototype.visitDecimal=Pg,Lg.prototype.visitList=Rg,Lg.prototype.visitStruct=Vg,Lg.prototype.visitUnion=function(e){const{type:t,length:n,typeIds:r,valueOffsets:i}=e;if(Ug.call(this,r),t.mode===Af.Sparse)return Vg.call(this,e);if(t.mode===Af.Dense){if(e.offset<=0)return Ug.call(this,i),Vg.call(this,e);{const s=r.reduce(((e,t)=>Math.max(e,t)),r[0]),o=new Int32Array(s+1),a=new Int32Array(s+1).fill(-1),l=new Int32Array(n),u=Cf(-i[0],n,i);for(let e,t,i=-1;++i<n;)-1===(t=a[e=r[i]])&&(t=a[e]=u[e]),l[i]=u[i]-t,++o[e];Ug.call(this,l);for(let r,i=-1,c=t.children.length;++i<c;)if(r=e.children[i]){const e=t.typeIds[i],s=Math.min(n,o[e]);this.visit(r.slice(a[e],s))}}}return this},Lg.prototype.visitInterval=Pg,Lg.prototype.visitFixedSizeList=Rg,Lg.prototype.visitMap=Rg;class jg extends Hb{constructor(e){super(),this._position=0,this._started=!1,this._sink=new Qb,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,of(e)||(e={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy="boolean"!=typeof e.autoDestroy||e.autoDestroy,this._writeLegacyIpcFormat="boolean"==typeof e.writeLegacyIpcFormat&&e.writeLegacyIpcFormat}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw new Error('"throughDOM" not available in this environment')}toString(e=!1){return this._sink.toString(e)}toUint8Array(e=!1){return this._sink.toUint8Array(e)}writeAll(e){return af(e)?e.then((e=>this.writeAll(e))):uf(e)?Yg(this,e):Hg(this,e)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(e){return this._sink.toDOMStream(e)}toNodeStream(e){return this._sink.toNodeStream(e)}close(){return this.reset()._sink.close()}abort(e){return this.reset()._sink.abort(e)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(e=this._sink,t=null){var n;return e===this._sink||e instanceof Qb?this._sink=e:(this._sink=new Qb,e&&(of(n=e)&&sf(n.abort)&&sf(n.getWriter)&&!pf(n))?this.toDOMStream({type:"bytes"}).pipeTo(e):e&&(e=>of(e)&&sf(e.end)&&sf(e.write)&&rf(e.writable)&&!pf(e))(e)&&this.toNodeStream({objectMode:!1}).pipe(e)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,t&&vm(t,this._schema)||(null==t?(this._position=0,this._schema=null):(this._started=!0,this._schema=t,this._writeSchema(t))),this}write(e){let t=null;if(!this._sink)throw new Error("RecordBatchWriter is closed");if(null==e)return this.finish()&&void 0;if(e instanceof xm&&!(t=e.schema))return this.finish()&&void 0;if(e instanceof km&&!(t=e.schema))return this.finish()&&void 0;if(t&&!vm(t,this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,t)}e instanceof km?e instanceof Em||this._writeRecordBatch(e):e instanceof xm?this.writeAll(e.batches):lf(e)&&this.writeAll(e)}_writeMessage(e,t=8){const n=t-1,r=Xm.encode(e),i=r.byteLength,s=this._writeLegacyIpcFormat?4:8,o=i+s+n&~n,a=o-i-s;return e.headerType===Wf.RecordBatch?this._recordBatchBlocks.push(new jb(o,e.bodyLength,this._position)):e.headerType===Wf.DictionaryBatch&&this._dictionaryBlocks.push(new jb(o,e.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(o-s)),i>0&&this._write(r),this._writePadding(a)}_write(e){if(this._started){const t=Sf(e);t&&t.byteLength>0&&(this._sink.write(t),this._position+=t.byteLength)}return this}_writeSchema(e){return this._writeMessage(Xm.from(e))}_writeFooter(e){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(mg)}_writePadding(e){return e>0?this._write(new Uint8Array(e)):this}_writeRecordBatch(e){const{byteLength:t,nodes:n,bufferRegions:r,buffers:i}=Lg.assemble(e),s=new Zm(e.numRows,n,r),o=Xm.from(s,t);return this._writeDictionaries(e)._writeMessage(o)._writeBodyBuffers(i)}_writeDictionaryBatch(e,t,n=!1){this._dictionaryDeltaOffsets.set(t,e.length+(this._dictionaryDeltaOffsets.get(t)||0));const{byteLength:r,nodes:i,bufferRegions:s,buffers:o}=Lg.assemble(new jy([e])),a=new Zm(e.length,i,s),l=new eg(a,t,n),u=Xm.from(l,r);return this._writeMessage(u)._writeBodyBuffers(o)}_writeBodyBuffers(e){let t,n,r;for(let i=-1,s=e.length;++i<s;)(t=e[i])&&(n=t.byteLength)>0&&(this._write(t),(r=(n+7&-8)-n)>0&&this._writePadding(r));return this}_writeDictionaries(e){for(let[t,n]of e.dictionaries){let e=this._dictionaryDeltaOffsets.get(t)||0;if(0===e||(n=null==n?void 0:n.slice(e)).length>0)for(const r of n.data)this._writeDictionaryBatch(r,t,e>0),e+=r.length}return this}}class $g extends jg{static writeAll(e,t){const n=new $g(t);return af(e)?e.then((e=>n.writeAll(e))):uf(e)?Yg(n,e):Hg(n,e)}}class Wg extends jg{static writeAll(e){const t=new Wg;return af(e)?e.then((e=>t.writeAll(e))):uf(e)?Yg(t,e):Hg(t,e)}constructor(){super(),this._autoDestroy=!0}_writeSchema(e){return this._writeMagic()._writePadding(2)}_writeFooter(e){const t=Rb.encode(new Rb(e,Nf.V4,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(e)._write(t)._write(Int32Array.of(t.byteLength))._writeMagic()}}function Hg(e,t){let n=t;t instanceof xm&&(n=t.batches,e.reset(void 0,t.schema));for(const r of n)e.write(r);return e.finish()}function Yg(e,t){var n,r,i,s;return Vd(this,void 0,void 0,(function*(){try{for(n=Yd(t);!(r=yield n.next()).done;){const t=r.value;e.write(t)}}catch(o){i={error:o}}finally{try{r&&!r.done&&(s=n.return)&&(yield s.call(n))}finally{if(i)throw i.error}}return e.finish()}))}function Qg(e){const t=Sg.from(e);return af(t)?t.then((e=>Qg(e))):t.isAsync()?t.readAll().then((e=>new xm(e))):new xm(t.readAll())}function Kg(e,t="stream"){return("stream"===t?$g:Wg).writeAll(e).toUint8Array(!0)}var qg,Jg,Gg=function(){function e(e,t,n,r){var i=this;this.getCell=function(e,t){var n=e<i.headerRows&&t<i.headerColumns,r=e>=i.headerRows&&t<i.headerColumns,s=e<i.headerRows&&t>=i.headerColumns;if(n){var o=["blank"];return t>0&&o.push("level"+e),{type:"blank",classNames:o.join(" "),content:""}}if(s)return{type:"columns",classNames:(o=["col_heading","level"+e,"col"+(l=t-i.headerColumns)]).join(" "),content:i.getContent(i.columnsTable,l,e)};if(r){o=["row_heading","level"+t,"row"+(a=e-i.headerRows)];return{type:"index",id:"T_".concat(i.uuid,"level").concat(t,"_row").concat(a),classNames:o.join(" "),content:i.getContent(i.indexTable,a,t)}}o=["data","row"+(a=e-i.headerRows),"col"+(l=t-i.headerColumns)];var a,l,u=i.styler?i.getContent(i.styler.displayValuesTable,a,l):i.getContent(i.dataTable,a,l);return{type:"data",id:"T_".concat(i.uuid,"row").concat(a,"_col").concat(l),classNames:o.join(" "),content:u}},this.getContent=function(e,t,n){var r=e.getChildAt(n);return null===r?"":i.getColumnTypeId(e,n)===Yf.Timestamp?i.nanosToDate(r.get(t)):r.get(t)},this.dataTable=Qg(e),this.indexTable=Qg(t),this.columnsTable=Qg(n),this.styler=r?{caption:r.caption,displayValuesTable:Qg(r.displayValues),styles:r.styles,uuid:r.uuid}:void 0}return Object.defineProperty(e.prototype,"rows",{get:function(){return this.indexTable.numRows+this.columnsTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"dataRows",{get:function(){return this.dataTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"table",{get:function(){return this.dataTable},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"index",{get:function(){return this.indexTable},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!1,configurable:!0}),e.prototype.serialize=function(){return{data:Kg(this.dataTable),index:Kg(this.indexTable),columns:Kg(this.columnsTable)}},e.prototype.getColumnTypeId=function(e,t){return e.schema.fields[t].type.typeId},e.prototype.nanosToDate=function(e){return new Date(e/1e6)},e}(),Xg=function(){return Xg=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var i in t=arguments[n])Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i]);return e},Xg.apply(this,arguments)};(Jg=qg||(qg={})).COMPONENT_READY="streamlit:componentReady",Jg.SET_COMPONENT_VALUE="streamlit:setComponentValue",Jg.SET_FRAME_HEIGHT="streamlit:setFrameHeight";var Zg=function(){function e(){}return e.API_VERSION=1,e.RENDER_EVENT="streamlit:render",e.events=new EventTarget,e.registeredMessageListener=!1,e.setComponentReady=function(){e.registeredMessageListener||(window.addEventListener("message",e.onMessageEvent),e.registeredMessageListener=!0),e.sendBackMsg(qg.COMPONENT_READY,{apiVersion:e.API_VERSION})},e.setFrameHeight=function(t){void 0===t&&(t=document.body.scrollHeight),t!==e.lastFrameHeight&&(e.lastFrameHeight=t,e.sendBackMsg(qg.SET_FRAME_HEIGHT,{height:t}))},e.setComponentValue=function(t){var n;t instanceof Gg?(n="dataframe",t=t.serialize()):!function(e){var t=!1;try{t=e instanceof BigInt64Array||e instanceof BigUint64Array}catch(n){}return e instanceof Int8Array||e instanceof Uint8Array||e instanceof Uint8ClampedArray||e instanceof Int16Array||e instanceof Uint16Array||e instanceof Int32Array||e instanceof Uint32Array||e instanceof Float32Array||e instanceof Float64Array||t}(t)?t instanceof ArrayBuffer?(n="bytes",t=new Uint8Array(t)):n="json":(n="bytes",t=new Uint8Array(t.buffer)),e.sendBackMsg(qg.SET_COMPONENT_VALUE,{value:t,dataType:n})},e.onMessageEvent=function(t){if(t.data.type===e.RENDER_EVENT)e.onRenderMessage(t.data)},e.onRenderMessage=function(t){var n=t.args;null==n&&(console.error("Got null args in onRenderMessage. This should never happen"),n={});var r=t.dfs&&t.dfs.length>0?e.argsDataframeToObject(t.dfs):{};n=Xg(Xg({},n),r);var i=Boolean(t.disabled),s=t.theme;s&&ev(s);var o={disabled:i,args:n,theme:s},a=new CustomEvent(e.RENDER_EVENT,{detail:o});e.events.dispatchEvent(a)},e.argsDataframeToObject=function(t){var n=t.map((function(t){var n=t.key,r=t.value;return[n,e.toArrowTable(r)]}));return Object.fromEntries(n)},e.toArrowTable=function(e){var t,n=(t=e.data).data,r=t.index,i=t.columns,s=t.styler;return new Gg(n,r,i,s)},e.sendBackMsg=function(e,t){window.parent.postMessage(Xg({isStreamlitMessage:!0,type:e},t),"*")},e}(),ev=function(e){var t=document.createElement("style");document.head.appendChild(t),t.innerHTML="\n    :root {\n      --primary-color: ".concat(e.primaryColor,";\n      --background-color: ").concat(e.backgroundColor,";\n      --secondary-background-color: ").concat(e.secondaryBackgroundColor,";\n      --text-color: ").concat(e.textColor,";\n      --font: ").concat(e.font,";\n    }\n\n    body {\n      background-color: var(--background-color);\n      color: var(--text-color);\n    }\n  ")};var tv=function(){var e=function(t,n){return(e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,t){e.__proto__=t}||function(e,t){for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&(e[n]=t[n])})(t,n)};return function(t,n){if("function"!=typeof n&&null!==n)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");function r(){this.constructor=t}e(t,n),t.prototype=null===n?Object.create(n):(r.prototype=n.prototype,new r)}}(),nv=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return tv(t,e),t.prototype.componentDidMount=function(){Zg.setFrameHeight()},t.prototype.componentDidUpdate=function(){Zg.setFrameHeight()},t}(j.PureComponent);const rv=(iv=class extends nv{constructor(){super(...arguments),t(this,"state",{numClicks:0,isDarkMode:!1}),t(this,"render",(()=>{if(!this.props.args)return J.jsx("div",{style:{padding:"10px",border:"1px solid #ccc"},children:"Loading Carbon Button..."});const{label:e,icon:t,buttonType:n,disabled:r,useContainerWidth:i,colors:s,isDefault:o,ariaLabel:a}=this.props.args;console.log("Carbon Button Debug:",{label:e,hasIcon:!!t,iconLength:null==t?void 0:t.length,iconPreview:null==t?void 0:t.substring(0,100),buttonType:n,allArgs:this.props.args}),t&&(console.log("Icon contains <svg>:",t.includes("<svg")),console.log("Icon contains viewBox:",t.includes("viewBox")));const l=t&&""!==t.trim(),u=e&&""!==e.trim(),c=l&&!u;let d="0.75rem 1rem";c?d="0.75rem":l&&u&&(d="0.75rem 1.25rem 0.75rem 0.875rem");let f="secondary"===n?"0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.05)":"none",h="translateY(0)";o&&!r&&(f="0 4px 12px rgba(80, 228, 224, 0.4)",h="translateY(-2px)");const p={backgroundColor:this.getBackgroundColor(n),color:this.getTextColor(n),border:"ghost"===n||"secondary"===n?`1px solid ${this.getBorderColor(n)}`:"none",padding:d,fontSize:"14px",fontWeight:400,borderRadius:0,cursor:r?"not-allowed":"pointer",display:"inline-flex",alignItems:"center",justifyContent:"center",width:i?"100%":"auto",transition:"all 70ms cubic-bezier(0.2, 0, 0.38, 0.9)",fontFamily:'"IBM Plex Sans", system-ui, -apple-system, sans-serif',lineHeight:1,opacity:r?.5:1,boxShadow:f,transform:h,outline:"none"},y=a||(c?e||"Icon button":void 0);return J.jsx("button",{style:p,className:c?"carbon-button-icon-only":"",onClick:this.onClicked,disabled:r,onMouseEnter:e=>this.handleHover(e,!0),onMouseLeave:e=>this.handleHover(e,!1),onMouseDown:this.handleMouseDown,onMouseUp:this.handleMouseUp,"aria-label":y,children:J.jsxs("div",{className:"carbon-button-content",children:[l&&J.jsx("span",{className:"carbon-button-icon",dangerouslySetInnerHTML:{__html:t}}),u&&J.jsx("span",{children:e})]})})})),t(this,"getBackgroundColor",(e=>{var t;if((null==(t=this.props.args.colors)?void 0:t.rest_bg)&&"secondary"===e)return this.props.args.colors.rest_bg;const n=this.state.isDarkMode?{primary:"#ecdcdc",secondary:"#ecdcdc",danger:"#f0d0d0",ghost:"transparent"}:{primary:"#e6e2e2",secondary:"#e6e2e2",danger:"#f4e3e3",ghost:"transparent"};return n[e]||n.primary})),t(this,"getTextColor",(e=>{var t;if((null==(t=this.props.args.colors)?void 0:t.rest_text)&&"secondary"===e)return this.props.args.colors.rest_text;if(this.state.isDarkMode){const t={primary:"#1a1a1a",secondary:"#1a1a1a",danger:"#4a1414",ghost:"#262626"};return t[e]||t.primary}const n={primary:"#1a1a1a",secondary:"#1a1a1a",danger:"#4a1414",ghost:"#262626"};return n[e]||n.primary})),t(this,"getBorderColor",(e=>{var t;if((null==(t=this.props.args.colors)?void 0:t.rest_border)&&"secondary"===e)return this.props.args.colors.rest_border;const n=this.state.isDarkMode?{primary:"#404040",secondary:"#404040",danger:"#5a4040",ghost:"#404040"}:{primary:"#cccccc",secondary:"#cccccc",danger:"#e0c0c0",ghost:"#e0e0e0"};return n[e]||n.primary})),t(this,"getHoverBackgroundColor",(e=>{var t;if((null==(t=this.props.args.colors)?void 0:t.hover_bg)&&"secondary"===e)return this.props.args.colors.hover_bg;const n=this.state.isDarkMode?{primary:"#4a4a4a",secondary:"#f6f4f4",danger:"#5a4343",ghost:"#2a2a2a"}:{primary:"#f5f5f5",secondary:"#f5f5f5",danger:"#faf0f0",ghost:"#fafafa"};return n[e]||n.primary})),t(this,"getHoverTextColor",(e=>{var t;return(null==(t=this.props.args.colors)?void 0:t.hover_text)&&"secondary"===e?this.props.args.colors.hover_text:this.getTextColor(e)})),t(this,"getHoverBorderColor",(e=>{var t;return(null==(t=this.props.args.colors)?void 0:t.hover_border)&&"secondary"===e?this.props.args.colors.hover_border:this.getBorderColor(e)})),t(this,"getActiveBackgroundColor",(e=>{var t;if((null==(t=this.props.args.colors)?void 0:t.active_bg)&&"secondary"===e)return this.props.args.colors.active_bg;const n=this.state.isDarkMode?{primary:"#67cccc",secondary:"#67cccc",danger:"#cc6666",ghost:"#67cccc"}:{primary:"#50e4e0",secondary:"#50e4e0",danger:"#e4807a",ghost:"#50e4e0"};return n[e]||n.primary})),t(this,"getActiveTextColor",(e=>{var t;return(null==(t=this.props.args.colors)?void 0:t.active_text)&&"secondary"===e?this.props.args.colors.active_text:this.state.isDarkMode?"#000000":"#ffffff"})),t(this,"getActiveBorderColor",(e=>{var t;return(null==(t=this.props.args.colors)?void 0:t.active_border)&&"secondary"===e?this.props.args.colors.active_border:this.getBorderColor(e)})),t(this,"handleHover",((e,t)=>{const n=e.currentTarget,r=this.props.args.buttonType||"primary",i=this.props.args.isDefault;t?(n.style.backgroundColor=this.getHoverBackgroundColor(r),n.style.color=this.getHoverTextColor(r),n.style.borderColor=this.getHoverBorderColor(r),i?(n.style.transform="translateY(-3px)",n.style.boxShadow="0 6px 16px rgba(80, 228, 224, 0.5)"):(n.style.transform="translateY(-1px)",n.style.boxShadow="0 2px 6px rgba(0, 0, 0, 0.15)")):(n.style.backgroundColor=this.getBackgroundColor(r),n.style.color=this.getTextColor(r),n.style.borderColor=this.getBorderColor(r),i?(n.style.transform="translateY(-2px)",n.style.boxShadow="0 4px 12px rgba(80, 228, 224, 0.4)"):(n.style.transform="translateY(0)",n.style.boxShadow="secondary"===r?"0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.05)":"none"))})),t(this,"handleMouseDown",(e=>{const t=e.currentTarget,n=this.props.args.buttonType||"primary";t.style.backgroundColor=this.getActiveBackgroundColor(n),t.style.color=this.getActiveTextColor(n),t.style.borderColor=this.getActiveBorderColor(n),t.style.transform="translateY(0)",t.style.boxShadow="inset 0 1px 2px rgba(0, 0, 0, 0.2)"})),t(this,"handleMouseUp",(e=>{this.handleHover(e,!0)})),t(this,"onClicked",(()=>{this.setState((e=>({numClicks:e.numClicks+1})),(()=>Zg.setComponentValue(this.state.numClicks)))}))}componentDidMount(){var e;console.log("CarbonButton mounted with props:",this.props),console.log("Args from Streamlit:",this.props.args);const t=(null==(e=this.props.args)?void 0:e.default)||0;this.setState({numClicks:t},(()=>{Zg.setComponentValue(this.state.numClicks),Zg.setFrameHeight()}));const n=document.createElement("style");n.textContent="\n      .carbon-button-icon {\n        display: inline-flex;\n        align-items: center;\n        justify-content: center;\n        width: 20px;\n        height: 20px;\n        flex-shrink: 0;\n      }\n      .carbon-button-icon svg {\n        width: 100%;\n        height: 100%;\n        fill: currentColor;\n      }\n      .carbon-button-content {\n        display: inline-flex;\n        align-items: center;\n        justify-content: center;\n        gap: 0.5rem;\n        width: 100%;\n      }\n      .carbon-button-icon-only {\n        padding: 0.75rem !important;\n      }\n    ",document.head.appendChild(n);const r=()=>{const e=window.matchMedia&&window.matchMedia("(prefers-color-scheme: dark)").matches;this.setState({isDarkMode:e})};r(),window.matchMedia&&window.matchMedia("(prefers-color-scheme: dark)").addEventListener("change",r)}componentWillUnmount(){if(window.matchMedia){const e=()=>{const e=window.matchMedia&&window.matchMedia("(prefers-color-scheme: dark)").matches;this.setState({isDarkMode:e})};window.matchMedia("(prefers-color-scheme: dark)").removeEventListener("change",e)}}componentDidUpdate(){Zg.setFrameHeight()}},sv=function(e){function t(t){var n=e.call(this,t)||this;return n.componentDidMount=function(){Zg.events.addEventListener(Zg.RENDER_EVENT,n.onRenderEvent),Zg.setComponentReady()},n.componentDidUpdate=function(){null!=n.state.componentError&&Zg.setFrameHeight()},n.componentWillUnmount=function(){Zg.events.removeEventListener(Zg.RENDER_EVENT,n.onRenderEvent)},n.onRenderEvent=function(e){n.setState({renderData:e.detail})},n.state={renderData:void 0,componentError:void 0},n}return tv(t,e),t.prototype.render=function(){return null!=this.state.componentError?j.createElement("div",null,j.createElement("h1",null,"Component Error"),j.createElement("span",null,this.state.componentError.message)):null==this.state.renderData?null:j.createElement(iv,{width:window.innerWidth,disabled:this.state.renderData.disabled,args:this.state.renderData.args,theme:this.state.renderData.theme})},t.getDerivedStateFromError=function(e){return{componentError:e}},t}(j.PureComponent),Rd(sv,iv));var iv,sv;console.log("Carbon Button Component: Script loaded!"),console.log("Carbon Button Component: Initializing..."),window.addEventListener("DOMContentLoaded",(()=>{console.log("DOM Content Loaded")}));const ov=document.getElementById("root");if(console.log("Root element:",ov),ov){nd(ov).render(J.jsx(j.StrictMode,{children:J.jsx(rv,{})})),console.log("Carbon Button Component: Rendered")}else{console.error("Carbon Button Component: Root element not found!");const e=document.createElement("div");e.textContent="ERROR: No root element found!",e.style.color="red",document.body.appendChild(e)}
-//# sourceMappingURL=main.DSD8LoQW.js.map
@@ -5,27 +5,37 @@ Tests for streamlit-carbon-button component
 import pytest
 from unittest.mock import patch
 import streamlit as st
-from streamlit_carbon_button import carbon_button, CarbonIcons
+from streamlit_carbon_button import (
+    args_cache_stats,
+    ButtonSpec,
+    carbon_button,
+    carbon_button_group,
+    carbon_icon_grid,
+    CarbonIcons,
+    render_buttons,
+)
+
+
+@pytest.fixture(autouse=True)
+def setup_session_state():
+    """Setup mock session state before each test"""
+    # Clear any existing session state
+    if hasattr(st, "session_state"):
+        for key in list(st.session_state.keys()):
+            del st.session_state[key]
+
+
+@pytest.fixture
+def mock_component_func():
+    """Mock the component function"""
+    with patch("streamlit_carbon_button._component_func") as mock_func:
+        mock_func.return_value = 0
+        yield mock_func
 
 
 class TestCarbonButton:
     """Test the carbon_button function"""
 
-    @pytest.fixture(autouse=True)
-    def setup_session_state(self):
-        """Setup mock session state before each test"""
-        # Clear any existing session state
-        if hasattr(st, "session_state"):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
-
-    @pytest.fixture
-    def mock_component_func(self):
-        """Mock the component function"""
-        with patch("streamlit_carbon_button._component_func") as mock_func:
-            mock_func.return_value = 0
-            yield mock_func
-
     def test_basic_button_creation(self, mock_component_func):
         """Test creating a basic button"""
         result = carbon_button("Click Me")
@@ -48,6 +58,34 @@ class TestCarbonButton:
         call_args = mock_component_func.call_args[1]
         assert call_args["icon"] == CarbonIcons.SAVE
         assert "<svg" in call_args["icon"]
+        assert call_args["iconName"] is None
+
+    def test_button_with_icon_name(self, mock_component_func):
+        """Test that named icons send only the name to the frontend"""
+        carbon_button("Save", icon="save")
+
+        call_args = mock_component_func.call_args[1]
+        assert call_args["iconName"] == "save"
+        assert call_args["icon"] == ""
+
+    def test_button_with_no_icon(self, mock_component_func):
+        """Test that icon=None is sent as an empty icon"""
+        carbon_button("Save", icon=None)
+
+        call_args = mock_component_func.call_args[1]
+        assert call_args["icon"] == ""
+        assert call_args["iconName"] is None
+
+    def test_icon_name_is_case_insensitive(self, mock_component_func):
+        """Test that icon names match the CarbonIcons attribute names"""
+        carbon_button("Chart", icon="CHART_BAR")
+
+        assert mock_component_func.call_args[1]["iconName"] == "chart_bar"
+
+    def test_unknown_icon_name(self, mock_component_func):
+        """Test that unknown icon names are rejected"""
+        with pytest.raises(ValueError):
+            carbon_button("Oops", icon="not_a_real_icon")
 
     def test_button_types(self, mock_component_func):
         """Test different button types"""
@@ -81,6 +119,34 @@ class TestCarbonButton:
         call_args = mock_component_func.call_args[1]
         assert call_args["key"].startswith("carbon_button_")
 
+    def test_auto_generated_key_is_stable(self, mock_component_func):
+        """Test that the generated key is the same on every rerun"""
+
+        def script():
+            carbon_button("Test", is_default=len(mock_component_func.mock_calls) > 0)
+            return mock_component_func.call_args[1]["key"]
+
+        # State-like arguments such as is_default don't change the key
+        assert script() == script()
+
+    def test_auto_generated_key_per_call_site(self, mock_component_func):
+        """Test that identical labels on different lines get different keys"""
+        carbon_button("Same")
+        first_key = mock_component_func.call_args[1]["key"]
+        carbon_button("Same")
+        second_key = mock_component_func.call_args[1]["key"]
+
+        assert first_key != second_key
+
+    def test_auto_generated_key_in_loop(self, mock_component_func):
+        """Test that buttons created on one line are told apart by label"""
+        keys = []
+        for label in ["Edit", "Copy", "Delete"]:
+            carbon_button(label)
+            keys.append(mock_component_func.call_args[1]["key"])
+
+        assert len(set(keys)) == 3
+
     def test_click_detection(self, mock_component_func):
         """Test click detection logic"""
         # First render - no click
@@ -98,6 +164,114 @@ class TestCarbonButton:
         result3 = carbon_button("Test", key="test_btn")
         assert result3 is False
 
+    def test_click_rerun_changes_args(self, mock_component_func):
+        """Test that the rerun a click starts sends the new count as default"""
+        carbon_button("Save", key="save")
+        assert mock_component_func.call_args[1]["default"] == 0
+
+        # The click stores the widget value before the rerun reaches the button
+        st.session_state["save"] = 1
+        mock_component_func.return_value = 1
+        assert carbon_button("Save", key="save") is True
+        clicked_args = mock_component_func.call_args[1]
+        assert clicked_args["default"] == 1
+
+        # Later runs repeat the same args, so Streamlit sends no update
+        assert carbon_button("Save", key="save") is False
+        assert mock_component_func.call_args[1] == clicked_args
+
+    def test_disable_on_click_unlock_args(self, mock_component_func):
+        """Test that each click's rerun changes the args a locked button waits for"""
+        for clicks in (1, 2):
+            carbon_button("Load", key="load", disable_on_click=True)
+            before = mock_component_func.call_args[1]
+
+            st.session_state["load"] = clicks
+            mock_component_func.return_value = clicks
+            carbon_button("Load", key="load", disable_on_click=True)
+            after = mock_component_func.call_args[1]
+            assert after != before
+            assert after["default"] == clicks
+
+    def test_count_clicks(self, mock_component_func):
+        """Test that count_clicks returns the clicks since the last run"""
+        mock_component_func.return_value = 0
+        assert carbon_button("Add", key="add", count_clicks=True) == 0
+
+        # Three clicks coalesced into one rerun
+        mock_component_func.return_value = 3
+        assert carbon_button("Add", key="add", count_clicks=True) == 3
+
+        # Nothing new on the next run
+        assert carbon_button("Add", key="add", count_clicks=True) == 0
+
+    def test_coalesced_clicks_return_true(self, mock_component_func):
+        """Test that several clicks in one run still return a plain bool"""
+        mock_component_func.return_value = 3
+        assert carbon_button("Add", key="add") is True
+
+    def test_on_click_callback(self, mock_component_func):
+        """Test that on_click runs with its args when a click arrives"""
+        calls = []
+        carbon_button(
+            "Next",
+            key="next",
+            on_click=lambda *args, **kwargs: calls.append((args, kwargs)),
+            args=(1,),
+            kwargs={"step": 2},
+        )
+        on_change = mock_component_func.call_args[1]["on_change"]
+
+        # Streamlit runs the handler before the script, once the count is new
+        st.session_state["next"] = 1
+        on_change()
+        assert calls == [((1,), {"step": 2})]
+
+    def test_on_click_ignores_seen_clicks(self, mock_component_func):
+        """Test that on_click does not fire for a count already handled"""
+        calls = []
+        mock_component_func.return_value = 1
+        carbon_button("Next", key="next", on_click=lambda: calls.append(1))
+        on_change = mock_component_func.call_args[1]["on_change"]
+
+        st.session_state["next"] = 1
+        on_change()
+        assert calls == []
+
+    def test_no_callback_by_default(self, mock_component_func):
+        """Test that on_change is only passed when there is a callback"""
+        carbon_button("Next")
+
+        assert "on_change" not in mock_component_func.call_args[1]
+
+    def test_on_click_needs_component_callbacks(self, mock_component_func):
+        """Test that on_click names the Streamlit version it needs"""
+        with patch.object(st, "__version__", "1.35.1"):
+            with pytest.raises(RuntimeError, match="Streamlit 1.36 or later"):
+                carbon_button("Next", on_click=lambda: None)
+        mock_component_func.assert_not_called()
+
+    def test_click_guards(self, mock_component_func):
+        """Test that debounce and disable-on-click options reach the frontend"""
+        carbon_button("Load", debounce_ms=500, disable_on_click=True)
+
+        call_args = mock_component_func.call_args[1]
+        assert call_args["debounceMs"] == 500
+        assert call_args["disableOnClick"] is True
+
+    def test_click_guards_default_off(self, mock_component_func):
+        """Test that buttons accept every click by default"""
+        carbon_button("Load")
+
+        call_args = mock_component_func.call_args[1]
+        assert call_args["debounceMs"] == 0
+        assert call_args["disableOnClick"] is False
+
+    def test_invalid_debounce(self, mock_component_func):
+        """Test that a negative debounce is rejected"""
+        with pytest.raises(ValueError):
+            carbon_button("Load", debounce_ms=-1)
+
     def test_container_width(self, mock_component_func):
         """Test use_container_width parameter"""
         carbon_button("Full Width", use_container_width=True)
@@ -151,16 +325,437 @@ class TestCarbonButton:
         assert result is False
 
 
+class TestCarbonButtonGroup:
+    """Test the carbon_button_group function"""
+
+    def test_single_component_instance(self, mock_component_func):
+        """Test that a group renders all buttons through one component call"""
+        buttons = [{"label": f"Button {i}"} for i in range(20)]
+
+        result = carbon_button_group(buttons, key="toolbar")
+
+        assert result is None
+        mock_component_func.assert_called_once()
+        call_args = mock_component_func.call_args[1]
+        assert call_args["key"] == "toolbar"
+        assert len(call_args["buttons"]) == 20
+
+    def test_button_args_encoding(self, mock_component_func):
+        """Test that each button is encoded like a single carbon_button"""
+        carbon_button_group(
+            [
+                {"label": "Save", "icon": CarbonIcons.SAVE, "is_default": True},
+                {"label": "Delete", "button_type": "danger", "disabled": True},
+            ],
+            key="toolbar",
+        )
+
+        save, delete = mock_component_func.call_args[1]["buttons"]
+        assert save["label"] == "Save"
+        assert save["icon"] == CarbonIcons.SAVE
+        assert save["isDefault"] is True
+        assert save["buttonType"] == "primary"
+        assert delete["buttonType"] == "danger"
+        assert delete["disabled"] is True
+
+    def test_click_returns_button_key(self, mock_component_func):
+        """Test that the clicked button's key is returned once per click"""
+        buttons = [
+            {"label": "Save", "key": "save"},
+            {"label": "Load", "key": "load"},
+        ]
+
+        mock_component_func.return_value = {"clicks": 1, "index": 1}
+        assert carbon_button_group(buttons, key="toolbar") == "load"
+
+        # Same value on the next rerun is not a new click
+        assert carbon_button_group(buttons, key="toolbar") is None
+
+        mock_component_func.return_value = {"clicks": 2, "index": 0}
+        assert carbon_button_group(buttons, key="toolbar") == "save"
+
+    def test_click_returns_index_without_key(self, mock_component_func):
+        """Test that buttons without a key are identified by index"""
+        mock_component_func.return_value = {"clicks": 1, "index": 0}
+        result = carbon_button_group([{"label": "A"}, {"label": "B"}], key="ab")
+        assert result == 0
+
+    def test_coalesced_clicks(self, mock_component_func):
+        """Test that clicks on several buttons in one rerun are all counted"""
+        buttons = [{"label": "A", "key": "a"}, {"label": "B", "key": "b"}]
+        mock_component_func.return_value = {
+            "clicks": 3,
+            "index": 1,
+            "batch": [0, 1, 1],
+        }
+        assert carbon_button_group(buttons, key="ab", count_clicks=True) == {
+            "a": 1,
+            "b": 2,
+        }
+
+        # The default return value is the last button clicked
+        st.session_state.clear()
+        assert carbon_button_group(buttons, key="ab") == "b"
+
+    def test_count_clicks_without_clicks(self, mock_component_func):
+        """Test that count_clicks returns an empty dict when nothing was clicked"""
+        mock_component_func.return_value = 0
+        assert carbon_button_group([{"label": "A"}], key="a", count_clicks=True) == {}
+
+    def test_auto_generated_key(self, mock_component_func):
+        """Test that groups without a key get a stable generated key"""
+
+        def script():
+            carbon_button_group([{"label": "A"}, {"label": "B"}])
+            return mock_component_func.call_args[1]["key"]
+
+        first_key = script()
+        assert first_key.startswith("carbon_button_group_")
+        assert script() == first_key
+
+    def test_unknown_button_option(self, mock_component_func):
+        """Test that unknown button options are rejected"""
+        with pytest.raises(TypeError):
+            carbon_button_group([{"label": "A", "colour": "red"}], key="bad")
+
+
+class TestCarbonIconGrid:
+    """Test the carbon_icon_grid function"""
+
+    def test_all_icons_in_one_component(self, mock_component_func):
+        """Test that the whole catalog is sent to a single component"""
+        from streamlit_carbon_button.carbon_icons import _available_icons
+
+        assert carbon_icon_grid(key="grid") is None
+
+        mock_component_func.assert_called_once()
+        grid = mock_component_func.call_args[1]["iconGrid"]
+        assert len(grid["icons"]) == len(_available_icons())
+        assert grid["icons"] == sorted(grid["icons"])
+        assert "save" in grid["icons"]
+
+    def test_click_returns_icon_name(self, mock_component_func):
+        """Test that the clicked icon's name is returned once per click"""
+        icons = ["SAVE", "chart_bar"]
+
+        mock_component_func.return_value = {"clicks": 1, "index": 1}
+        assert carbon_icon_grid(icons, key="grid") == "chart_bar"
+        assert carbon_icon_grid(icons, key="grid") is None
+
+    def test_unknown_icon(self, mock_component_func):
+        """Test that unknown icon names are rejected"""
+        with pytest.raises(ValueError):
+            carbon_icon_grid(["save", "not_a_real_icon"], key="grid")
+
+
+class TestButtonSpec:
+    """Test precomputed button specs and render_buttons"""
+
+    def test_spec_is_immutable(self):
+        """Test that specs cannot be changed after construction"""
+        spec = ButtonSpec("Save", icon="save")
+
+        with pytest.raises(AttributeError):
+            spec.label = "Load"
+        with pytest.raises(AttributeError):
+            spec.extra = True
+        assert not hasattr(spec, "__dict__")
+
+    def test_spec_equality_and_hash(self):
+        """Test that equal options give equal, hashable specs"""
+        first = ButtonSpec("Go", colors={"rest_bg": "#000", "hover_bg": "#111"})
+        second = ButtonSpec("Go", colors={"hover_bg": "#111", "rest_bg": "#000"})
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first.colors == (("hover_bg", "#111"), ("rest_bg", "#000"))
+        assert first != first.replace(disabled=True)
+
+    def test_spec_pickles(self):
+        """Test that specs survive pickling, e.g. by st.cache_data"""
+        import pickle
+
+        spec = ButtonSpec("Save", button_type="secondary", colors={"rest_bg": "#000"})
+        assert pickle.loads(pickle.dumps(spec)) == spec
+
+    def test_render_buttons(self, mock_component_func):
+        """Test that each spec renders as its own button"""
+        specs = [ButtonSpec("Edit", icon="edit"), ButtonSpec("Delete")]
+        mock_component_func.side_effect = [1, 0]
+
+        result = render_buttons(specs, keys=["edit", "delete"])
+
+        assert result == [True, False]
+        calls = [call[1] for call in mock_component_func.call_args_list]
+        assert [call["key"] for call in calls] == ["edit", "delete"]
+        assert calls[0]["iconName"] == "edit"
+        assert calls[1]["label"] == "Delete"
+
+    def test_render_buttons_default_keys(self, mock_component_func):
+        """Test that generated keys are unique and stable across reruns"""
+
+        def script():
+            render_buttons([ButtonSpec("Delete")] * 3)
+            return [call[1]["key"] for call in mock_component_func.call_args_list]
+
+        keys = script()
+        assert len(set(keys)) == 3
+        mock_component_func.reset_mock()
+        assert script() == keys
+
+    def test_render_buttons_validates_first(self, mock_component_func):
+        """Test that an invalid spec stops rendering before any button"""
+        specs = [ButtonSpec("Good"), ButtonSpec("Bad", icon="not_a_real_icon")]
+
+        with pytest.raises(ValueError):
+            render_buttons(specs)
+        with pytest.raises(TypeError):
+            render_buttons([{"label": "Not a spec"}])
+        mock_component_func.assert_not_called()
+
+    def test_group_accepts_specs(self, mock_component_func):
+        """Test that groups can mix specs and dicts"""
+        mock_component_func.return_value = {"clicks": 1, "index": 0}
+
+        result = carbon_button_group(
+            [ButtonSpec("Save", icon="save"), {"label": "Load", "key": "load"}],
+            key="toolbar",
+            use_container_width=True,
+        )
+
+        assert result == 0
+        save, load = mock_component_func.call_args[1]["buttons"]
+        assert save["iconName"] == "save"
+        assert save["useContainerWidth"] is True
+        assert load["label"] == "Load"
+
+
+class TestArgsCache:
+    """Test caching of the args sent to the frontend"""
+
+    @pytest.fixture(autouse=True)
+    def clear_args_cache(self):
+        """Start each test with an empty args cache"""
+        from streamlit_carbon_button import _encode_spec
+
+        _encode_spec.cache_clear()
+
+    def test_reruns_hit_the_cache(self, mock_component_func):
+        """Test that an unchanged button is encoded only once"""
+        colors = {"rest_bg": "#000000", "hover_bg": "#333333"}
+        for _ in range(3):
+            carbon_button("Save", icon="save", key="save", colors=dict(colors))
+
+        stats = args_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["size"] == 1
+        assert mock_component_func.call_args[1]["colors"] == colors
+
+    def test_changed_config_misses(self, mock_component_func):
+        """Test that any change to the configuration is encoded afresh"""
+        carbon_button("Save", key="save")
+        carbon_button("Save", key="save", disabled=True)
+        carbon_button("Save", key="save", colors={"rest_bg": "#000000"})
+
+        assert args_cache_stats()["misses"] == 3
+        assert mock_component_func.call_args[1]["colors"] == {"rest_bg": "#000000"}
+
+    def test_groups_share_the_cache(self, mock_component_func):
+        """Test that group buttons reuse the args of identical buttons"""
+        carbon_button("Save", key="save")
+        carbon_button_group([{"label": "Save"}, {"label": "Load"}], key="toolbar")
+
+        assert args_cache_stats()["hits"] == 1
+
+    def test_cache_is_bounded(self, mock_component_func):
+        """Test that the cache never holds more than maxsize configurations"""
+        maxsize = args_cache_stats()["maxsize"]
+        for i in range(maxsize + 10):
+            carbon_button(f"Row {i}", key=f"row_{i}")
+
+        assert args_cache_stats()["size"] == maxsize
+
+    def test_invalid_config_is_not_cached(self, mock_component_func):
+        """Test that validation errors are raised on every call"""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                carbon_button("Oops", icon="not_a_real_icon")
+
+        assert args_cache_stats()["size"] == 0
+
+
+class TestSessionStateCleanup:
+    """Test eviction of click counts for buttons that went away"""
+
+    @staticmethod
+    def rows_app():
+        import streamlit as st
+
+        from streamlit_carbon_button import carbon_button, session_state_stats
+
+        for row in st.session_state.get("rows", range(5)):
+            carbon_button("Delete", key=f"row_{row}")
+        st.json(session_state_stats())
+
+    def test_stale_rows_are_evicted(self):
+        """Test that dynamic keys don't grow session state without bound"""
+        import json
+
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_function(self.rows_app)
+        at.run()
+        assert "__carbon_button_prev_row_0" in at.session_state
+
+        # Rows 0-4 disappear; Streamlit drops their widgets after this run
+        at.session_state["rows"] = range(5, 10)
+        at.run()
+
+        # New keys trigger collection of the rows that went away
+        at.session_state["rows"] = range(10, 15)
+        at.run()
+
+        assert not at.exception
+        assert "__carbon_button_prev_row_0" not in at.session_state
+        assert "__carbon_button_prev_row_10" in at.session_state
+        stats = json.loads(at.json[0].value)
+        assert stats == {"tracked": 10, "evicted": 5}
+
+    def test_eviction_runs_once_per_run(self):
+        """Test that a run rendering many new buttons scans for stale ones once"""
+        from streamlit.testing.v1 import AppTest
+
+        class CountingSet(set):
+            scans = 0
+
+            def __iter__(self):
+                CountingSet.scans += 1
+                return super().__iter__()
+
+        at = AppTest.from_function(self.rows_app)
+        at.session_state["__carbon_button_tracked_keys"] = CountingSet({"gone"})
+        at.session_state["rows"] = range(50)
+        at.run()
+        assert CountingSet.scans == 1
+
+        at.session_state["rows"] = range(50, 100)
+        at.run()
+        assert not at.exception
+        assert CountingSet.scans == 2
+        assert "__carbon_button_prev_row_0" in at.session_state
+        assert "gone" not in at.session_state["__carbon_button_tracked_keys"]
+
+    def test_no_eviction_outside_streamlit_run(self):
+        """Test that bare-mode calls keep every entry"""
+        with patch("streamlit_carbon_button._component_func") as mock_func:
+            mock_func.return_value = 0
+            carbon_button("A", key="bare_a")
+            carbon_button("B", key="bare_b")
+
+        assert "__carbon_button_prev_bare_a" in st.session_state
+        assert "__carbon_button_prev_bare_b" in st.session_state
+
+
+class TestFragmentScope:
+    """Test buttons placed inside st.fragment and the scope option"""
+
+    @staticmethod
+    def fragment_app():
+        import streamlit as st
+
+        from streamlit_carbon_button import (
+            carbon_button,
+            carbon_button_group,
+            carbon_icon_grid,
+            ButtonSpec,
+            render_buttons,
+        )
+
+        @st.fragment
+        def panel():
+            carbon_button("Refresh", key="refresh", scope="fragment")
+            carbon_button_group([{"label": "A"}], key="group", scope="fragment")
+            carbon_icon_grid(["save"], key="grid", scope="fragment")
+            render_buttons([ButtonSpec("B")], keys=["spec"], scope="fragment")
+            carbon_button("Reload page", key="reload", scope="app")
+
+        panel()
+        st.write("done")
+
+    @staticmethod
+    def outside_app():
+        from streamlit_carbon_button import carbon_button
+
+        carbon_button("Refresh", key="refresh", scope="fragment")
+
+    def test_fragment_scope_inside_fragment(self):
+        """Test that every button variant accepts scope="fragment" in a fragment"""
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_function(self.fragment_app).run()
+
+        assert not at.exception
+        assert at.markdown[0].value == "done"
+
+    def test_fragment_scope_outside_fragment(self):
+        """Test that scope="fragment" outside a fragment is an error"""
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_function(self.outside_app).run()
+
+        assert "st.fragment" in at.exception[0].message
+
+    def test_unknown_scope(self, mock_component_func):
+        """Test that an unknown scope is rejected"""
+        with pytest.raises(ValueError):
+            carbon_button("Refresh", scope="page")
+
+    def test_scope_needs_fragments(self, mock_component_func):
+        """Test that explicit scopes name the Streamlit version they need"""
+        with patch.object(st, "__version__", "1.36.0"):
+            for scope in ("fragment", "app"):
+                with pytest.raises(RuntimeError, match="Streamlit 1.37 or later"):
+                    carbon_button("Refresh", scope=scope)
+            # The default scope works on any version
+            carbon_button("Refresh", scope="auto")
+
+    def test_app_scope_escalates_fragment_rerun(self, mock_component_func):
+        """Test that scope="app" turns a fragment rerun into a full rerun"""
+        mock_component_func.return_value = 1
+        with patch(
+            "streamlit_carbon_button._current_fragment_id", return_value="frag"
+        ), patch(
+            "streamlit_carbon_button._fragment_ids_this_run", return_value=["frag"]
+        ), patch(
+            "streamlit_carbon_button._rerun_app"
+        ) as rerun_app:
+            carbon_button("Reload page", key="reload", scope="app")
+
+        rerun_app.assert_called_once()
+
+    def test_app_scope_in_full_run(self, mock_component_func):
+        """Test that scope="app" clicks seen in a full run need no extra rerun"""
+        mock_component_func.return_value = 1
+        with patch(
+            "streamlit_carbon_button._current_fragment_id", return_value="frag"
+        ), patch(
+            "streamlit_carbon_button._fragment_ids_this_run", return_value=[]
+        ), patch(
+            "streamlit_carbon_button._rerun_app"
+        ) as rerun_app:
+            clicked = carbon_button("Reload page", key="reload", scope="app")
+
+        assert clicked is True
+        rerun_app.assert_not_called()
+
+
 class TestCarbonIcons:
     """Test the CarbonIcons class"""
 
     def test_icons_are_svg_strings(self):
         """Test that all icons are valid SVG strings"""
-        icon_attrs = [
-            attr
-            for attr in dir(CarbonIcons)
-            if not attr.startswith("_") and attr.isupper()
-        ]
+        icon_attrs = CarbonIcons.names()
 
         assert len(icon_attrs) > 0, "No icons found"
 
@@ -210,13 +805,26 @@ class TestCarbonIcons:
                 'viewBox="0 0 32 32"' in icon_svg
             ), f"{icon_name} doesn't have correct viewBox"
 
+    def test_icons_load_lazily(self):
+        """Test that icons are read on first access and cached on the class"""
+        # Other tests may already have loaded the icon
+        if "ZOOM_IN" in vars(CarbonIcons):
+            delattr(CarbonIcons, "ZOOM_IN")
+
+        svg = CarbonIcons.ZOOM_IN
+        assert svg.startswith("<svg")
+        assert vars(CarbonIcons)["ZOOM_IN"] is svg
+        assert CarbonIcons.ZOOM_IN is svg
+
+    def test_unknown_icon(self):
+        """Test that unknown icon names raise AttributeError"""
+        with pytest.raises(AttributeError):
+            CarbonIcons.NOT_A_REAL_ICON
+        assert not hasattr(CarbonIcons, "__wrapped__")
+
     def test_no_duplicate_icons(self):
         """Test that there are no duplicate icon definitions"""
-        icon_attrs = [
-            attr
-            for attr in dir(CarbonIcons)
-            if not attr.startswith("_") and attr.isupper()
-        ]
+        icon_attrs = CarbonIcons.names()
 
         icon_values = {}
         for attr_name in icon_attrs:
@@ -227,6 +835,89 @@ class TestCarbonIcons:
                 ), f"Duplicate icon: {attr_name} has same SVG as {icon_values[icon_value]}"
             icon_values[icon_value] = attr_name
 
+    def test_names(self):
+        """Test that names() lists every icon file, sorted, without loading SVGs"""
+        from streamlit_carbon_button.carbon_icons import _available_icons
+
+        with patch("streamlit_carbon_button.carbon_icons._read_icon") as read_icon:
+            names = CarbonIcons.names()
+        read_icon.assert_not_called()
+
+        assert names == tuple(sorted(_available_icons()))
+        assert CarbonIcons.names() is names
+
+    def test_all_is_a_read_only_registry(self):
+        """Test that all() maps every name to its SVG and cannot be changed"""
+        icons = CarbonIcons.all()
+
+        assert CarbonIcons.all() is icons
+        assert list(icons) == list(CarbonIcons.names())
+        assert icons["SAVE"] == CarbonIcons.SAVE
+        assert "SAVE" in icons and "search" not in icons
+        with pytest.raises(KeyError):
+            icons["NOT_A_REAL_ICON"]
+        with pytest.raises(TypeError):
+            icons["SAVE"] = "<svg></svg>"
+
+    def test_every_icon_is_indexed(self):
+        """Test that the search index has an entry for every icon file"""
+        import json
+
+        from streamlit_carbon_button.carbon_icons import _INDEX_FILE, _available_icons
+
+        with open(_INDEX_FILE, encoding="utf-8") as f:
+            index = json.load(f)
+
+        assert {name.upper() for name in index} == set(_available_icons())
+        for name, entry in index.items():
+            assert entry.get("category"), f"{name} has no category"
+
+    def test_search_by_name(self):
+        """Test that search matches whole words and word prefixes of names"""
+        assert CarbonIcons.search("save")[0] == "SAVE"
+        assert CarbonIcons.search("arrow left")[0] == "ARROW_LEFT"
+        assert set(CarbonIcons.search("zoom", limit=None)) == {
+            "ZOOM_IN",
+            "ZOOM_OUT",
+            "ZOOM_FIT",
+            "ZOOM_RESET",
+        }
+
+    def test_search_by_alias_and_category(self):
+        """Test that aliases and categories are searchable"""
+        assert CarbonIcons.search("trash") == ["DELETE"]
+        assert "CHART_LINE" in CarbonIcons.search("analytics", limit=None)
+
+    def test_search_tolerates_typos(self):
+        """Test that words without a prefix match are looked up fuzzily"""
+        assert "CHEVRON_DOWN" in CarbonIcons.search("chevorn")
+        assert CarbonIcons.search("xyzzy") == []
+
+    def test_fuzzy_search_compares_few_terms(self):
+        """Test that a misspelled word is compared with a bounded set of terms"""
+        import streamlit_carbon_button.carbon_icons as carbon_icons
+
+        real = carbon_icons.difflib.get_close_matches
+        with patch.object(carbon_icons.difflib, "get_close_matches") as close:
+            close.side_effect = real
+            assert CarbonIcons.search("svae")[0] == "SAVE"
+        assert len(close.call_args[0][1]) <= carbon_icons._FUZZY_CANDIDATES
+
+    def test_search_limit(self):
+        """Test that results are capped at limit"""
+        assert len(CarbonIcons.search("chart", limit=3)) == 3
+        assert len(CarbonIcons.search("chart", limit=None)) > 3
+        assert CarbonIcons.search("  ") == []
+        assert CarbonIcons.search(None) == []
+        with pytest.raises(TypeError, match="query"):
+            CarbonIcons.search(42)
+
+    def test_search_loads_no_svg(self):
+        """Test that searching never reads icon files"""
+        with patch("streamlit_carbon_button.carbon_icons._read_icon") as read_icon:
+            CarbonIcons.search("document")
+        read_icon.assert_not_called()
+
 
 class TestComponentDeclaration:
     """Test component declaration logic"""